@@ -33,7 +33,61 @@ _APP_SPEC_JSON = r"""{
                 "no_op": "CALL"
             }
         },
-        "set_poll(byte[],byte[],byte[],byte[],uint64,uint64)void": {
+        "get_poll()(byte[],byte[],uint64,uint64,uint64,uint64)": {
+            "read_only": true,
+            "structs": {
+                "output": {
+                    "name": "PollInfo",
+                    "elements": [
+                        [
+                            "title",
+                            "byte[]"
+                        ],
+                        [
+                            "eligibility_root",
+                            "byte[]"
+                        ],
+                        [
+                            "start_date_unix",
+                            "uint64"
+                        ],
+                        [
+                            "end_date_unix",
+                            "uint64"
+                        ],
+                        [
+                            "finalized",
+                            "uint64"
+                        ],
+                        [
+                            "num_choices",
+                            "uint64"
+                        ]
+                    ]
+                }
+            },
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "get_results()((byte[],byte[],uint64,uint64,uint64,uint64),uint64[])": {
+            "read_only": true,
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "get_voters_data(address[])(uint8,(uint8))[]": {
+            "read_only": true,
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "set_poll(byte[],uint64,byte[],uint64,uint64)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "add_poll_choices(byte[][],pay)void": {
             "call_config": {
                 "no_op": "CALL"
             }
@@ -48,17 +102,57 @@ _APP_SPEC_JSON = r"""{
                 "no_op": "CALL"
             }
         },
+        "register_voters(address[],pay)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
         "submit_vote(uint8)void": {
             "call_config": {
                 "no_op": "CALL"
             }
         },
+        "register_and_vote(pay,uint8)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "register_paged_voters(address[],pay)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "submit_paged_vote(uint8,uint64)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "purge_voter_pages(uint64)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "allocate_nullifier_pages(uint64,pay)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "submit_vote_with_proof(uint8,uint64,byte[32][])void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
         "delete_box_storage()void": {
             "call_config": {
                 "no_op": "CALL"
             }
         },
-        "purge_box_storage(address[])void": {
+        "purge_box_storage(address[])uint64": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "try_purge_box_storage(address[])uint64": {
             "call_config": {
                 "no_op": "CALL"
             }
@@ -70,13 +164,13 @@ _APP_SPEC_JSON = r"""{
         }
     },
     "source": {
-        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29udHJhY3QuT3BlbkJhbGxvdC5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgMTY5MDAgMTAwMCBUTVBMX1ZFUlNJT05fVU5JWCBUTVBMX0RFTEVUQUJMRQogICAgYnl0ZWNibG9jayAweDYxNWYgInRvdGFsX3B1cmdlZF9ib3hfYV8iICJwb2xsX2ZpbmFsaXplZCIgInRvdGFsX2Nob2ljZTEiICJ0b3RhbF9jaG9pY2UyIiAidG90YWxfY2hvaWNlMyIgInBvbGxfZW5kX2RhdGVfdW5peCIgMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjUKICAgIC8vIGNsYXNzIE9wZW5CYWxsb3QoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2FmdGVyX2lmX2Vsc2VAMTQKICAgIHB1c2hieXRlc3MgMHg1YmUyMTlmMCAweDgxZTE2NThmIDB4ZTZiZjRmMjMgMHhmZTdiNmUzOSAweDhjMmVjZjIyIDB4NzYxZGQwZmEgMHg2ZTBiODNiOSAweGJkZWZkZjQ1IDB4NWZmMTZkYTQgLy8gbWV0aG9kICJnZW5lcmF0ZSgpdm9pZCIsIG1ldGhvZCAiZ2V0X3ZlcnNpb25fdW5peCgpdWludDY0IiwgbWV0aG9kICJzZXRfcG9sbChieXRlW10sYnl0ZVtdLGJ5dGVbXSxieXRlW10sdWludDY0LHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJmdW5kX2FwcF9tYnIocGF5KXZvaWQiLCBtZXRob2QgInJlcXVlc3RfYm94X3N0b3JhZ2UocGF5KXZvaWQiLCBtZXRob2QgInN1Ym1pdF92b3RlKHVpbnQ4KXZvaWQiLCBtZXRob2QgImRlbGV0ZV9ib3hfc3RvcmFnZSgpdm9pZCIsIG1ldGhvZCAicHVyZ2VfYm94X3N0b3JhZ2UoYWRkcmVzc1tdKXZvaWQiLCBtZXRob2QgInRlcm1pbmF0ZSgpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fZ2VuZXJhdGVfcm91dGVANSBtYWluX2dldF92ZXJzaW9uX3VuaXhfcm91dGVANiBtYWluX3NldF9wb2xsX3JvdXRlQDcgbWFpbl9mdW5kX2FwcF9tYnJfcm91dGVAOCBtYWluX3JlcXVlc3RfYm94X3N0b3JhZ2Vfcm91dGVAOSBtYWluX3N1Ym1pdF92b3RlX3JvdXRlQDEwIG1haW5fZGVsZXRlX2JveF9zdG9yYWdlX3JvdXRlQDExIG1haW5fcHVyZ2VfYm94X3N0b3JhZ2Vfcm91dGVAMTIgbWFpbl90ZXJtaW5hdGVfcm91dGVAMTMKCm1haW5fYWZ0ZXJfaWZfZWxzZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNQogICAgLy8gY2xhc3MgT3BlbkJhbGxvdChBUkM0Q29udHJhY3QpOgogICAgaW50Y18xIC8vIDAKICAgIHJldHVybgoKbWFpbl90ZXJtaW5hdGVfcm91dGVAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mzg5LTM5MAogICAgLy8gIyBBbGxvdyBhcHBsaWNhdGlvbiBjcmVhdG9yIHRvIGRlbGV0ZSB0aGUgc21hcnQgY29udHJhY3QgY2xpZW50LCBkZWNyZWFzZSB0aGVpciBNQlIgYmFsYW5jZSArIGFueSByZW1haW5pbmcgYm94IE1CUgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0iZGlzYWxsb3ciLCBhbGxvd19hY3Rpb25zPVsiRGVsZXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IERlbGV0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgdGVybWluYXRlCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3B1cmdlX2JveF9zdG9yYWdlX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM1NC0zNTUKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gZXhlY3V0ZSBib3ggc3RvcmFnZSBwdXJnZSwgdGhpcyBkZWxldGVzIGFueSBib3hlcyBub3QgZGVsZXRlZCBieSBvdGhlciBhY2NvdW50cwogICAgLy8gQGFyYzQuYWJpbWV0aG9kICAjIE5PVEU6IENhbiBhbHNvIHVzZSBhcmM0LlN0YXRpY0FycmF5W2FyYzQuQWRkcmVzcywgdC5MaXRlcmFsWzhdXSB0byBlbmZvcmNlIHN0cmljdCBzaXplIG9mIDgKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI1CiAgICAvLyBjbGFzcyBPcGVuQmFsbG90KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzU0LTM1NQogICAgLy8gIyBFbmFibGUgYXBwbGljYXRpb24gY3JlYXRvciB0byBleGVjdXRlIGJveCBzdG9yYWdlIHB1cmdlLCB0aGlzIGRlbGV0ZXMgYW55IGJveGVzIG5vdCBkZWxldGVkIGJ5IG90aGVyIGFjY291bnRzCiAgICAvLyBAYXJjNC5hYmltZXRob2QgICMgTk9URTogQ2FuIGFsc28gdXNlIGFyYzQuU3RhdGljQXJyYXlbYXJjNC5BZGRyZXNzLCB0LkxpdGVyYWxbOF1dIHRvIGVuZm9yY2Ugc3RyaWN0IHNpemUgb2YgOAogICAgY2FsbHN1YiBwdXJnZV9ib3hfc3RvcmFnZQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9kZWxldGVfYm94X3N0b3JhZ2Vfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzE2LTMxNwogICAgLy8gIyBFbmFibGUgYW55IGVsaWdibGUgYWNjb3VudCB0byBkZWxldGUgdGhlaXIgYm94IHN0b3JhZ2UgYW5kIGdldCB0aGVpciBNQlIgcGF5bWVudCByZWZ1bmRlZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZGVsZXRlX2JveF9zdG9yYWdlCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3N1Ym1pdF92b3RlX3JvdXRlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI3NC0yNzUKICAgIC8vICMgRW5hYmxlIGFueSBlbGlnaWJsZSBhY2NvdW50IHRvIHN1Ym1pdCBhIHZvdGUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjUKICAgIC8vIGNsYXNzIE9wZW5CYWxsb3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNzQtMjc1CiAgICAvLyAjIEVuYWJsZSBhbnkgZWxpZ2libGUgYWNjb3VudCB0byBzdWJtaXQgYSB2b3RlCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc3VibWl0X3ZvdGUKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fcmVxdWVzdF9ib3hfc3RvcmFnZV9yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI0MC0yNDEKICAgIC8vICMgRW5hYmxlIGFueSBlbGlnaWJsZSBhY2NvdW50IHRvIHJlcXVlc3QgYm94IHN0b3JhZ2UgYnkgcGF5aW5nIGEgTUJSIGNvc3QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjUKICAgIC8vIGNsYXNzIE9wZW5CYWxsb3QoQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI0MC0yNDEKICAgIC8vICMgRW5hYmxlIGFueSBlbGlnaWJsZSBhY2NvdW50IHRvIHJlcXVlc3QgYm94IHN0b3JhZ2UgYnkgcGF5aW5nIGEgTUJSIGNvc3QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiByZXF1ZXN0X2JveF9zdG9yYWdlCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2Z1bmRfYXBwX21icl9yb3V0ZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE5OS0yMDAKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gZnVuZCBBcHAgYWRkcmVzcyBhbmQgY292ZXJzIGl0cyBHbG9iYWwgbWluaW11bSBiYWxhbmNlIGFuZCBCb3ggc3RvcmFnZSBNQlIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjUKICAgIC8vIGNsYXNzIE9wZW5CYWxsb3QoQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE5OS0yMDAKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gZnVuZCBBcHAgYWRkcmVzcyBhbmQgY292ZXJzIGl0cyBHbG9iYWwgbWluaW11bSBiYWxhbmNlIGFuZCBCb3ggc3RvcmFnZSBNQlIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBmdW5kX2FwcF9tYnIKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fc2V0X3BvbGxfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMzktMTQwCiAgICAvLyAjIEVuYWJsZSBhcHBsaWNhdGlvbiBjcmVhdG9yIHRvIHNldCB1cCBwb2xsIGRhdGEgdmFsdWVzIGluY2x1ZGluZyB0aXRsZSwgY2hvaWNlcywgYW5kIGRhdGVzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI1CiAgICAvLyBjbGFzcyBPcGVuQmFsbG90KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEzOS0xNDAKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gc2V0IHVwIHBvbGwgZGF0YSB2YWx1ZXMgaW5jbHVkaW5nIHRpdGxlLCBjaG9pY2VzLCBhbmQgZGF0ZXMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBzZXRfcG9sbAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfdmVyc2lvbl91bml4X3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTMzLTEzNAogICAgLy8gIyBSZXRyaWV2ZSB0aGUgdmVyc2lvbiBvZiB0aGUgc21hcnQgY29udHJhY3QgaW4gYW4gVW5peCBmb3JtYXQgdGltZXN0YW1wCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEzNgogICAgLy8gcmV0dXJuIFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlZFUlNJT05fVU5JWCIpCiAgICBpbnRjIDQgLy8gVE1QTF9WRVJTSU9OX1VOSVgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMzMtMTM0CiAgICAvLyAjIFJldHJpZXZlIHRoZSB2ZXJzaW9uIG9mIHRoZSBzbWFydCBjb250cmFjdCBpbiBhbiBVbml4IGZvcm1hdCB0aW1lc3RhbXAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaXRvYgogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dlbmVyYXRlX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA4LTEwOQogICAgLy8gIyBDYWxsIHRoZSAnQ3JlYXRlJyBhYmltZXRob2QgdGhhdCBnZW5lcmF0ZXMgdGhlIHNtYXJ0IGNvbnRyYWN0IGNsaWVudCBhbmQgaW5pdGlhbGl6ZXMgZ2xvYmFsIHN0b3JhZ2UgaW50IHZhcmlhYmxlcwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgY2FsbHN1YiBnZW5lcmF0ZQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90LmdlbmVyYXRlKCkgLT4gdm9pZDoKZ2VuZXJhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA4LTExMAogICAgLy8gIyBDYWxsIHRoZSAnQ3JlYXRlJyBhYmltZXRob2QgdGhhdCBnZW5lcmF0ZXMgdGhlIHNtYXJ0IGNvbnRyYWN0IGNsaWVudCBhbmQgaW5pdGlhbGl6ZXMgZ2xvYmFsIHN0b3JhZ2UgaW50IHZhcmlhYmxlcwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICAvLyBkZWYgZ2VuZXJhdGUoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExMwogICAgLy8gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTExLTExNAogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIFRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExNgogICAgLy8gYXNzZXJ0IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MuYmFsYW5jZSA+PSAoCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0QmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTE3CiAgICAvLyBHbG9iYWwubWluX2JhbGFuY2UKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NzUtNzYKICAgIC8vICMgUmV0dXJuIHRoZSBtaW5pbXVtIGJhbGFuY2UgcmVxdWlyZW1lbnQgdG90YWwgY29zdAogICAgLy8gcmV0dXJuIGJhc2VfZmVlICsgdG90YWxfYnl0ZV9mZWUgKyB0b3RhbF91aW50X2ZlZQogICAgcHVzaGludCA0OTk1MDAgLy8gNDk5NTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTE3LTEyMAogICAgLy8gR2xvYmFsLm1pbl9iYWxhbmNlCiAgICAvLyArIHNlbGYuY2FsY19zY2hlbWFfbWJyKAogICAgLy8gICAgIG51bV9ieXRlcz1VSW50NjQoNCksIG51bV91aW50PVVJbnQ2NCg3KQogICAgLy8gKSAgIyBHbG9iYWwgc2NoZW1hIE1CUjogMC4xIChHbG9iYWwubWluX2JhbGFuY2UpICsgMC4zOTk1IEFMR08gKEdsb2JhbCBzY2hlbWEpCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTE2LTEyMAogICAgLy8gYXNzZXJ0IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MuYmFsYW5jZSA+PSAoCiAgICAvLyAgICAgR2xvYmFsLm1pbl9iYWxhbmNlCiAgICAvLyAgICAgKyBzZWxmLmNhbGNfc2NoZW1hX21icigKICAgIC8vICAgICAgICAgbnVtX2J5dGVzPVVJbnQ2NCg0KSwgbnVtX3VpbnQ9VUludDY0KDcpCiAgICAvLyAgICAgKSAgIyBHbG9iYWwgc2NoZW1hIE1CUjogMC4xIChHbG9iYWwubWluX2JhbGFuY2UpICsgMC4zOTk1IEFMR08gKEdsb2JhbCBzY2hlbWEpCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExNi0xMjEKICAgIC8vIGFzc2VydCBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLmJhbGFuY2UgPj0gKAogICAgLy8gICAgIEdsb2JhbC5taW5fYmFsYW5jZQogICAgLy8gICAgICsgc2VsZi5jYWxjX3NjaGVtYV9tYnIoCiAgICAvLyAgICAgICAgIG51bV9ieXRlcz1VSW50NjQoNCksIG51bV91aW50PVVJbnQ2NCg3KQogICAgLy8gICAgICkgICMgR2xvYmFsIHNjaGVtYSBNQlI6IDAuMSAoR2xvYmFsLm1pbl9iYWxhbmNlKSArIDAuMzk5NSBBTEdPIChHbG9iYWwgc2NoZW1hKQogICAgLy8gKSwgIkFwcGxpY2F0aW9uIGNyZWF0b3IgYWRkcmVzcyBiYWxhbmNlIG11c3QgYmUgZXF1YWwgb3IgZ3JlYXRlciB0aGFuIEdsb2JhbC5taW5fYmFsYW5jZSArIEdsb2JhbCBzY2hlbWEgTUJSLiIKICAgIGFzc2VydCAvLyBBcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MgYmFsYW5jZSBtdXN0IGJlIGVxdWFsIG9yIGdyZWF0ZXIgdGhhbiBHbG9iYWwubWluX2JhbGFuY2UgKyBHbG9iYWwgc2NoZW1hIE1CUi4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMjMtMTI0CiAgICAvLyAjIEluaXRpYWxpemUgR2xvYmFsIHN0b3JhZ2Ugd2l0aCBkZWZhdWx0IHZhbHVlIGFzc2lnbm1lbnRzCiAgICAvLyBzZWxmLnBvbGxfZmluYWxpemVkID0gVUludDY0KDApCiAgICBieXRlY18yIC8vICJwb2xsX2ZpbmFsaXplZCIKICAgIGludGNfMSAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEyNgogICAgLy8gc2VsZi50b3RhbF9jaG9pY2UxID0gVUludDY0KDApCiAgICBieXRlY18zIC8vICJ0b3RhbF9jaG9pY2UxIgogICAgaW50Y18xIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTI3CiAgICAvLyBzZWxmLnRvdGFsX2Nob2ljZTIgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDQgLy8gInRvdGFsX2Nob2ljZTIiCiAgICBpbnRjXzEgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMjgKICAgIC8vIHNlbGYudG90YWxfY2hvaWNlMyA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNSAvLyAidG90YWxfY2hvaWNlMyIKICAgIGludGNfMSAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEzMAogICAgLy8gc2VsZi50b3RhbF9wdXJnZWRfYm94X2FfID0gVUludDY0KDApCiAgICBieXRlY18xIC8vICJ0b3RhbF9wdXJnZWRfYm94X2FfIgogICAgaW50Y18xIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29udHJhY3QuT3BlbkJhbGxvdC5zZXRfcG9sbCh0aXRsZTogYnl0ZXMsIGNob2ljZTE6IGJ5dGVzLCBjaG9pY2UyOiBieXRlcywgY2hvaWNlMzogYnl0ZXMsIHN0YXJ0X2RhdGVfdW5peDogdWludDY0LCBlbmRfZGF0ZV91bml4OiB1aW50NjQpIC0+IHZvaWQ6CnNldF9wb2xsOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEzOS0xNDkKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gc2V0IHVwIHBvbGwgZGF0YSB2YWx1ZXMgaW5jbHVkaW5nIHRpdGxlLCBjaG9pY2VzLCBhbmQgZGF0ZXMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHNldF9wb2xsKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgdGl0bGU6IEJ5dGVzLAogICAgLy8gICAgIGNob2ljZTE6IEJ5dGVzLAogICAgLy8gICAgIGNob2ljZTI6IEJ5dGVzLAogICAgLy8gICAgIGNob2ljZTM6IEJ5dGVzLAogICAgLy8gICAgIHN0YXJ0X2RhdGVfdW5peDogVUludDY0LAogICAgLy8gICAgIGVuZF9kYXRlX3VuaXg6IFVJbnQ2NCwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDYgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE1MgogICAgLy8gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTUwLTE1MwogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiT25seSBhcHBsaWNhdGlvbiBjcmVhdG9yIGNhbiBzZXQgdXAgcG9sbC4iCiAgICBhc3NlcnQgLy8gT25seSBhcHBsaWNhdGlvbiBjcmVhdG9yIGNhbiBzZXQgdXAgcG9sbC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxNTUKICAgIC8vIGFzc2VydCB0aXRsZS5sZW5ndGggPD0gVUludDY0KAogICAgZnJhbWVfZGlnIC02CiAgICBsZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxNTUtMTU3CiAgICAvLyBhc3NlcnQgdGl0bGUubGVuZ3RoIDw9IFVJbnQ2NCgKICAgIC8vICAgICAxMTgKICAgIC8vICksICJQb2xsIHRpdGxlIHNpemUgY2FuIG5vdCBleGNlZWQgMTE4IGJ5dGVzIG9mIGRhdGEgcGVyIGtleS12YWx1ZS4iCiAgICBwdXNoaW50IDExOCAvLyAxMTgKICAgIDw9CiAgICBhc3NlcnQgLy8gUG9sbCB0aXRsZSBzaXplIGNhbiBub3QgZXhjZWVkIDExOCBieXRlcyBvZiBkYXRhIHBlciBrZXktdmFsdWUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTYwCiAgICAvLyBjaG9pY2UxLmxlbmd0aCA8PSBVSW50NjQoMTE2KQogICAgZnJhbWVfZGlnIC01CiAgICBsZW4KICAgIHB1c2hpbnQgMTE2IC8vIDExNgogICAgPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxNjAtMTYyCiAgICAvLyBjaG9pY2UxLmxlbmd0aCA8PSBVSW50NjQoMTE2KQogICAgLy8gYW5kIGNob2ljZTIubGVuZ3RoIDw9IFVJbnQ2NCgxMTYpCiAgICAvLyBhbmQgY2hvaWNlMy5sZW5ndGggPD0gVUludDY0KDExNikKICAgIGJ6IHNldF9wb2xsX2Jvb2xfZmFsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE2MQogICAgLy8gYW5kIGNob2ljZTIubGVuZ3RoIDw9IFVJbnQ2NCgxMTYpCiAgICBmcmFtZV9kaWcgLTQKICAgIGxlbgogICAgcHVzaGludCAxMTYgLy8gMTE2CiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE2MC0xNjIKICAgIC8vIGNob2ljZTEubGVuZ3RoIDw9IFVJbnQ2NCgxMTYpCiAgICAvLyBhbmQgY2hvaWNlMi5sZW5ndGggPD0gVUludDY0KDExNikKICAgIC8vIGFuZCBjaG9pY2UzLmxlbmd0aCA8PSBVSW50NjQoMTE2KQogICAgYnogc2V0X3BvbGxfYm9vbF9mYWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTYyCiAgICAvLyBhbmQgY2hvaWNlMy5sZW5ndGggPD0gVUludDY0KDExNikKICAgIGZyYW1lX2RpZyAtMwogICAgbGVuCiAgICBwdXNoaW50IDExNiAvLyAxMTYKICAgIDw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTYwLTE2MgogICAgLy8gY2hvaWNlMS5sZW5ndGggPD0gVUludDY0KDExNikKICAgIC8vIGFuZCBjaG9pY2UyLmxlbmd0aCA8PSBVSW50NjQoMTE2KQogICAgLy8gYW5kIGNob2ljZTMubGVuZ3RoIDw9IFVJbnQ2NCgxMTYpCiAgICBieiBzZXRfcG9sbF9ib29sX2ZhbHNlQDQKICAgIGludGNfMCAvLyAxCgpzZXRfcG9sbF9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTU5LTE2MwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBjaG9pY2UxLmxlbmd0aCA8PSBVSW50NjQoMTE2KQogICAgLy8gICAgIGFuZCBjaG9pY2UyLmxlbmd0aCA8PSBVSW50NjQoMTE2KQogICAgLy8gICAgIGFuZCBjaG9pY2UzLmxlbmd0aCA8PSBVSW50NjQoMTE2KQogICAgLy8gKSwgIlBvbGwgY2hvaWNlIHNpemUgY2Fubm90IGV4Y2VlZCAxMTYgYnl0ZXMgb2YgZGF0YSBwZXIga2V5LXZhbHVlLiIKICAgIGFzc2VydCAvLyBQb2xsIGNob2ljZSBzaXplIGNhbm5vdCBleGNlZWQgMTE2IGJ5dGVzIG9mIGRhdGEgcGVyIGtleS12YWx1ZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxNzQKICAgIC8vIHN0YXJ0X2RhdGVfdW5peCA8IGVuZF9kYXRlX3VuaXgKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICA8CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTczLTE3NQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzdGFydF9kYXRlX3VuaXggPCBlbmRfZGF0ZV91bml4CiAgICAvLyApLCAiU3RhcnQgZGF0ZSBtdXN0IGJlIGVhcmxpZXIgdGhhbiBlbmQgZGF0ZS4iCiAgICBhc3NlcnQgLy8gU3RhcnQgZGF0ZSBtdXN0IGJlIGVhcmxpZXIgdGhhbiBlbmQgZGF0ZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxNzctMTc5CiAgICAvLyBhc3NlcnQgZW5kX2RhdGVfdW5peCA+PSBzdGFydF9kYXRlX3VuaXggKyBVSW50NjQoCiAgICAvLyAgICAgMyAqIDI0ICogNjAgKiA2MAogICAgLy8gKSwgIkVuZCBkYXRlIG11c3QgYmUgYXQgbGVhc3QgMyBkYXlzIGxhdGVyIHRoYW4gdGhlIHN0YXJ0IGRhdGUuIgogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDI1OTIwMCAvLyAyNTkyMDAKICAgICsKICAgIGZyYW1lX2RpZyAtMQogICAgPD0KICAgIGFzc2VydCAvLyBFbmQgZGF0ZSBtdXN0IGJlIGF0IGxlYXN0IDMgZGF5cyBsYXRlciB0aGFuIHRoZSBzdGFydCBkYXRlLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE4MQogICAgLy8gYXNzZXJ0IGVuZF9kYXRlX3VuaXggLSBzdGFydF9kYXRlX3VuaXggPD0gVUludDY0KAogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgLTIKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxODEtMTgzCiAgICAvLyBhc3NlcnQgZW5kX2RhdGVfdW5peCAtIHN0YXJ0X2RhdGVfdW5peCA8PSBVSW50NjQoCiAgICAvLyAgICAgMTQgKiAyNCAqIDYwICogNjAKICAgIC8vICksICJWb3RpbmcgcGVyaW9kIGNhbiBub3QgZXhjZWVkIDE0IGRheXMuIgogICAgcHVzaGludCAxMjA5NjAwIC8vIDEyMDk2MDAKICAgIDw9CiAgICBhc3NlcnQgLy8gVm90aW5nIHBlcmlvZCBjYW4gbm90IGV4Y2VlZCAxNCBkYXlzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE4NQogICAgLy8gYXNzZXJ0IHNlbGYucG9sbF9maW5hbGl6ZWQgPT0gVUludDY0KDApLCAiUG9sbCBjYW4gb25seSBiZSBzZXR1cCBvbmNlLiIKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18yIC8vICJwb2xsX2ZpbmFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX2ZpbmFsaXplZCBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBQb2xsIGNhbiBvbmx5IGJlIHNldHVwIG9uY2UuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTg3LTE4OAogICAgLy8gIyBVcGRhdGUgZ2xvYmFsIHN0YXRlIGtleXMgd2l0aCBuZXcgdmFsdWVzCiAgICAvLyBzZWxmLnBvbGxfdGl0bGUgPSB0aXRsZQogICAgcHVzaGJ5dGVzICJwb2xsX3RpdGxlIgogICAgZnJhbWVfZGlnIC02CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE4OQogICAgLy8gc2VsZi5wb2xsX2Nob2ljZTEgPSBjaG9pY2UxCiAgICBwdXNoYnl0ZXMgInBvbGxfY2hvaWNlMSIKICAgIGZyYW1lX2RpZyAtNQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxOTAKICAgIC8vIHNlbGYucG9sbF9jaG9pY2UyID0gY2hvaWNlMgogICAgcHVzaGJ5dGVzICJwb2xsX2Nob2ljZTIiCiAgICBmcmFtZV9kaWcgLTQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTkxCiAgICAvLyBzZWxmLnBvbGxfY2hvaWNlMyA9IGNob2ljZTMKICAgIHB1c2hieXRlcyAicG9sbF9jaG9pY2UzIgogICAgZnJhbWVfZGlnIC0zCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE5MgogICAgLy8gc2VsZi5wb2xsX3N0YXJ0X2RhdGVfdW5peCA9IHN0YXJ0X2RhdGVfdW5peAogICAgcHVzaGJ5dGVzICJwb2xsX3N0YXJ0X2RhdGVfdW5peCIKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxOTMKICAgIC8vIHNlbGYucG9sbF9lbmRfZGF0ZV91bml4ID0gZW5kX2RhdGVfdW5peAogICAgYnl0ZWMgNiAvLyAicG9sbF9lbmRfZGF0ZV91bml4IgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE5NS0xOTYKICAgIC8vICMgRmluYWxpemUgcG9sbCAoZW5zdXJlcyBwb2xsIGNhbiBvbmx5IGJlIHNldCBvbmNlKQogICAgLy8gc2VsZi5wb2xsX2ZpbmFsaXplZCA9IFVJbnQ2NCgxKQogICAgYnl0ZWNfMiAvLyAicG9sbF9maW5hbGl6ZWQiCiAgICBpbnRjXzAgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKc2V0X3BvbGxfYm9vbF9mYWxzZUA0OgogICAgaW50Y18xIC8vIDAKICAgIGIgc2V0X3BvbGxfYm9vbF9tZXJnZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbnRyYWN0Lk9wZW5CYWxsb3QuZnVuZF9hcHBfbWJyKG1icl9wYXk6IHVpbnQ2NCkgLT4gdm9pZDoKZnVuZF9hcHBfbWJyOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE5OS0yMDEKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gZnVuZCBBcHAgYWRkcmVzcyBhbmQgY292ZXJzIGl0cyBHbG9iYWwgbWluaW11bSBiYWxhbmNlIGFuZCBCb3ggc3RvcmFnZSBNQlIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGZ1bmRfYXBwX21icihzZWxmLCBtYnJfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbikgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIwNAogICAgLy8gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjAyLTIwNQogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIFRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIwOAogICAgLy8gVHhuLnNlbmRlciBub3QgaW4gc2VsZi5ib3hfYV92b3Rlcl9kYXRhCiAgICBieXRlY18wIC8vIDB4NjE1ZgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMDctMjA5CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgbm90IGluIHNlbGYuYm94X2Ffdm90ZXJfZGF0YQogICAgLy8gKSwgIlRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIGFscmVhZHkgcHJlc2VudCBpbiBib3ggYV8uIgogICAgYXNzZXJ0IC8vIFRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIGFscmVhZHkgcHJlc2VudCBpbiBib3ggYV8uCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjEyCiAgICAvLyBtYnJfcGF5LnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIxMS0yMTMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIk1CUiBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwcGxpY2F0aW9uIGNyZWF0b3IgYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgc2VuZGVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIxNgogICAgLy8gbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMTUtMjE3CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgIk1CUiBwYXltZW50IHJlY2lldmVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBhZGRyZXNzLiIKICAgIGFzc2VydCAvLyBNQlIgcGF5bWVudCByZWNpZXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMjAKICAgIC8vIG1icl9wYXkuYW1vdW50CiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjkxLTkyCiAgICAvLyAjIFJldHVybiBzaW5nbGUgYm94IGZlZQogICAgLy8gcmV0dXJuIGJhc2VfZmVlLm5hdGl2ZSArIHNpemVfZmVlCiAgICBpbnRjXzIgLy8gMTY5MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMjAtMjIxCiAgICAvLyBtYnJfcGF5LmFtb3VudAogICAgLy8gPj0gc2VsZi5jYWxjX2JveF9zdG9yYWdlX21icigpICAjIEJveCBTdG9yYWdlIE1CUjogMC4wMTY5IEFMR08KICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjE5LTIyMgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBtYnJfcGF5LmFtb3VudAogICAgLy8gICAgID49IHNlbGYuY2FsY19ib3hfc3RvcmFnZV9tYnIoKSAgIyBCb3ggU3RvcmFnZSBNQlI6IDAuMDE2OSBBTEdPCiAgICAvLyApLCAiTUJSIHBheW1lbnQgZm9yIGJveCBzdG9yYWdlIG11c3QgbWVldCB0aGUgbWluaW11bSByZXF1aXJlbWVudCBhbW91bnQuIgogICAgYXNzZXJ0IC8vIE1CUiBwYXltZW50IGZvciBib3ggc3RvcmFnZSBtdXN0IG1lZXQgdGhlIG1pbmltdW0gcmVxdWlyZW1lbnQgYW1vdW50LgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIyNAogICAgLy8gYXNzZXJ0IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZSA+PSAoCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMjUKICAgIC8vIEdsb2JhbC5taW5fYmFsYW5jZSArIHNlbGYuY2FsY19ib3hfc3RvcmFnZV9tYnIoKQogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5MS05MgogICAgLy8gIyBSZXR1cm4gc2luZ2xlIGJveCBmZWUKICAgIC8vIHJldHVybiBiYXNlX2ZlZS5uYXRpdmUgKyBzaXplX2ZlZQogICAgaW50Y18yIC8vIDE2OTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjI1CiAgICAvLyBHbG9iYWwubWluX2JhbGFuY2UgKyBzZWxmLmNhbGNfYm94X3N0b3JhZ2VfbWJyKCkKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMjQtMjI1CiAgICAvLyBhc3NlcnQgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5iYWxhbmNlID49ICgKICAgIC8vICAgICBHbG9iYWwubWluX2JhbGFuY2UgKyBzZWxmLmNhbGNfYm94X3N0b3JhZ2VfbWJyKCkKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjI0LTIyNgogICAgLy8gYXNzZXJ0IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZSA+PSAoCiAgICAvLyAgICAgR2xvYmFsLm1pbl9iYWxhbmNlICsgc2VsZi5jYWxjX2JveF9zdG9yYWdlX21icigpCiAgICAvLyApLCAiQXBwbGljYXRpb24gYWRkcmVzcyBiYWxhbmNlIG11c3QgYmUgZXF1YWwgb3IgZ3JlYXRlciB0aGFuIEdsb2JhbC5taW5fYmFsYW5jZSArIEJveCBzdG9yYWdlIGZlZS4iCiAgICBhc3NlcnQgLy8gQXBwbGljYXRpb24gYWRkcmVzcyBiYWxhbmNlIG11c3QgYmUgZXF1YWwgb3IgZ3JlYXRlciB0aGFuIEdsb2JhbC5taW5fYmFsYW5jZSArIEJveCBzdG9yYWdlIGZlZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMjkKICAgIC8vIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wIDw9IHNlbGYucG9sbF9lbmRfZGF0ZV91bml4CiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgNiAvLyAicG9sbF9lbmRfZGF0ZV91bml4IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfZW5kX2RhdGVfdW5peCBleGlzdHMKICAgIDw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjI4LTIzMAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8PSBzZWxmLnBvbGxfZW5kX2RhdGVfdW5peAogICAgLy8gKSwgIlVuYWJsZSB0byBmdW5kIGFwcCBtYnIgaWYgdm90aW5nIHBlcmlvZCBpcyBvdmVyLiIKICAgIGFzc2VydCAvLyBVbmFibGUgdG8gZnVuZCBhcHAgbWJyIGlmIHZvdGluZyBwZXJpb2QgaXMgb3Zlci4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMzItMjM0CiAgICAvLyAjIENoZWNrIGlmIHZvdGVyIGRhdGEgYm94IGRvZXNuJ3QgYWxyZWFkeSBleGlzdCwgaWYgbm90IChGYWxzZSkgdGhlbiBjcmVhdGUgbmV3IG9uZQogICAgLy8gIyBpZiBub3Qgc2VsZi5ib3hfYV92b3Rlcl9kYXRhLm1heWJlKFR4bi5zZW5kZXIpWzFdOiA8LSBUaGlzIHdvcmtzIHRvbyBpZiBjb3B5KCkgdXNlZAogICAgLy8gaWYgR2xvYmFsLmNyZWF0b3JfYWRkcmVzcyBub3QgaW4gc2VsZi5ib3hfYV92b3Rlcl9kYXRhOgogICAgYnl0ZWNfMCAvLyAweDYxNWYKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiBmdW5kX2FwcF9tYnJfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjM1CiAgICAvLyBzZWxmLmJveF9hX3ZvdGVyX2RhdGFbR2xvYmFsLmNyZWF0b3JfYWRkcmVzc10gPSBWb3RlckRhdGEoCiAgICBieXRlY18wIC8vIDB4NjE1ZgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMzUtMjM3CiAgICAvLyBzZWxmLmJveF9hX3ZvdGVyX2RhdGFbR2xvYmFsLmNyZWF0b3JfYWRkcmVzc10gPSBWb3RlckRhdGEoCiAgICAvLyAgICAgYXJjNC5VSW50OCgwKSwgYXJjNC5VSW50OCgwKQogICAgLy8gKQogICAgYnl0ZWMgNyAvLyAweDAwMDAKICAgIGJveF9wdXQKCmZ1bmRfYXBwX21icl9hZnRlcl9pZl9lbHNlQDI6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29udHJhY3QuT3BlbkJhbGxvdC5yZXF1ZXN0X2JveF9zdG9yYWdlKG1icl9wYXk6IHVpbnQ2NCkgLT4gdm9pZDoKcmVxdWVzdF9ib3hfc3RvcmFnZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNDAtMjQyCiAgICAvLyAjIEVuYWJsZSBhbnkgZWxpZ2libGUgYWNjb3VudCB0byByZXF1ZXN0IGJveCBzdG9yYWdlIGJ5IHBheWluZyBhIE1CUiBjb3N0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiByZXF1ZXN0X2JveF9zdG9yYWdlKHNlbGYsIG1icl9wYXk6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjQ1CiAgICAvLyBUeG4uc2VuZGVyICE9IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgIT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNDMtMjQ2CiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyICE9IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJJbnZhbGlkIHNlbmRlciBhZGRyZXNzISBBcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MgY2FuIG5vdCB1c2UgcmVxdWVzdCBib3ggc3RvcmFnZSBtZXRob2QuIgogICAgYXNzZXJ0IC8vIEludmFsaWQgc2VuZGVyIGFkZHJlc3MhIEFwcGxpY2F0aW9uIGNyZWF0b3IgYWRkcmVzcyBjYW4gbm90IHVzZSByZXF1ZXN0IGJveCBzdG9yYWdlIG1ldGhvZC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNDkKICAgIC8vIFR4bi5zZW5kZXIgbm90IGluIHNlbGYuYm94X2Ffdm90ZXJfZGF0YQogICAgYnl0ZWNfMCAvLyAweDYxNWYKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjQ4LTI1MAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyIG5vdCBpbiBzZWxmLmJveF9hX3ZvdGVyX2RhdGEKICAgIC8vICksICJUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBtdXN0IG5vdCBiZSBwcmVzZW50IGluIGJveCBhXy4iCiAgICBhc3NlcnQgLy8gVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBub3QgYmUgcHJlc2VudCBpbiBib3ggYV8uCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjUzCiAgICAvLyBtYnJfcGF5LnNlbmRlciBub3QgaW4gc2VsZi5ib3hfYV92b3Rlcl9kYXRhCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgYnl0ZWNfMCAvLyAweDYxNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjUyLTI1NAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBtYnJfcGF5LnNlbmRlciBub3QgaW4gc2VsZi5ib3hfYV92b3Rlcl9kYXRhCiAgICAvLyApLCAiQm94IHN0b3JhZ2UgTUJSIHBheW1lbnQgc2VuZGVyIGFkZHJlc3MgbXVzdCBub3QgYmUgcHJlc2VudCBpbiBib3ggYV8uIgogICAgYXNzZXJ0IC8vIEJveCBzdG9yYWdlIE1CUiBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3Qgbm90IGJlIHByZXNlbnQgaW4gYm94IGFfLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI1NwogICAgLy8gbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNTYtMjU4CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgIkJveCBzdG9yYWdlIE1CUiBwYXltZW50IHJlY2lldmVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBhZGRyZXNzLiIKICAgIGFzc2VydCAvLyBCb3ggc3RvcmFnZSBNQlIgcGF5bWVudCByZWNpZXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNjEKICAgIC8vIG1icl9wYXkuYW1vdW50ID49IHNlbGYuY2FsY19ib3hfc3RvcmFnZV9tYnIoKSAgIyBCb3ggYV8gZmVlOiAwLjAxNjkgQUxHTwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5MS05MgogICAgLy8gIyBSZXR1cm4gc2luZ2xlIGJveCBmZWUKICAgIC8vIHJldHVybiBiYXNlX2ZlZS5uYXRpdmUgKyBzaXplX2ZlZQogICAgaW50Y18yIC8vIDE2OTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjYxCiAgICAvLyBtYnJfcGF5LmFtb3VudCA+PSBzZWxmLmNhbGNfYm94X3N0b3JhZ2VfbWJyKCkgICMgQm94IGFfIGZlZTogMC4wMTY5IEFMR08KICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjYwLTI2MgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBtYnJfcGF5LmFtb3VudCA+PSBzZWxmLmNhbGNfYm94X3N0b3JhZ2VfbWJyKCkgICMgQm94IGFfIGZlZTogMC4wMTY5IEFMR08KICAgIC8vICksICJCb3ggc3RvcmFnZSBNQlIgcGF5bWVudCBhbW91bnQgbXVzdCBiZSBlcXVhbCBvciBncmVhdGVyIHRoYW4gYm94IF9hIGZlZS4iCiAgICBhc3NlcnQgLy8gQm94IHN0b3JhZ2UgTUJSIHBheW1lbnQgYW1vdW50IG11c3QgYmUgZXF1YWwgb3IgZ3JlYXRlciB0aGFuIGJveCBfYSBmZWUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjY1CiAgICAvLyBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8PSBzZWxmLnBvbGxfZW5kX2RhdGVfdW5peAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjIDYgLy8gInBvbGxfZW5kX2RhdGVfdW5peCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX2VuZF9kYXRlX3VuaXggZXhpc3RzCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI2NC0yNjYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPD0gc2VsZi5wb2xsX2VuZF9kYXRlX3VuaXgKICAgIC8vICksICJVbmFibGUgdG8gcmVxdWVzdCBib3ggc3RvcmFnZSBpZiB2b3RpbmcgcGVyaW9kIGlzIG92ZXIuIgogICAgYXNzZXJ0IC8vIFVuYWJsZSB0byByZXF1ZXN0IGJveCBzdG9yYWdlIGlmIHZvdGluZyBwZXJpb2QgaXMgb3Zlci4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNjgtMjcwCiAgICAvLyAjIENoZWNrIGlmIHZvdGVyIGRhdGEgYm94IGRvZXNuJ3QgYWxyZWFkeSBleGlzdCwgaWYgbm90IChGYWxzZSkgdGhlbiBjcmVhdGUgbmV3IG9uZQogICAgLy8gIyBpZiBub3Qgc2VsZi5ib3hfYV92b3Rlcl9kYXRhLm1heWJlKFR4bi5zZW5kZXIpWzFdOiA8LSBUaGlzIHdvcmtzIHRvbyBpZiBjb3B5KCkgdXNlZAogICAgLy8gaWYgVHhuLnNlbmRlciBub3QgaW4gc2VsZi5ib3hfYV92b3Rlcl9kYXRhOgogICAgYnl0ZWNfMCAvLyAweDYxNWYKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBibnogcmVxdWVzdF9ib3hfc3RvcmFnZV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNzEKICAgIC8vIHNlbGYuYm94X2Ffdm90ZXJfZGF0YVtUeG4uc2VuZGVyXSA9IFZvdGVyRGF0YShhcmM0LlVJbnQ4KDApLCBhcmM0LlVJbnQ4KDApKQogICAgYnl0ZWNfMCAvLyAweDYxNWYKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYnl0ZWMgNyAvLyAweDAwMDAKICAgIGJveF9wdXQKCnJlcXVlc3RfYm94X3N0b3JhZ2VfYWZ0ZXJfaWZfZWxzZUAyOgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbnRyYWN0Lk9wZW5CYWxsb3Quc3VibWl0X3ZvdGUoY2hvaWNlOiBieXRlcykgLT4gdm9pZDoKc3VibWl0X3ZvdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mjc0LTI3NgogICAgLy8gIyBFbmFibGUgYW55IGVsaWdpYmxlIGFjY291bnQgdG8gc3VibWl0IGEgdm90ZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc3VibWl0X3ZvdGUoc2VsZiwgY2hvaWNlOiBhcmM0LlVJbnQ4KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mjc5CiAgICAvLyBUeG4uc2VuZGVyIGluIHNlbGYuYm94X2Ffdm90ZXJfZGF0YQogICAgYnl0ZWNfMCAvLyAweDYxNWYKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mjc3LTI4MAogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciBpbiBzZWxmLmJveF9hX3ZvdGVyX2RhdGEKICAgIC8vICksICJUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBtdXN0IGJlIHByZXNlbnQgaW4gYm94IGFfLiIKICAgIGFzc2VydCAvLyBUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBtdXN0IGJlIHByZXNlbnQgaW4gYm94IGFfLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI4MwogICAgLy8gc2VsZi5ib3hfYV92b3Rlcl9kYXRhW1R4bi5zZW5kZXJdLnZvdGVkLAogICAgYnl0ZWNfMCAvLyAweDYxNWYKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X2Ffdm90ZXJfZGF0YSBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMCAxIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI4NgogICAgLy8gYXJjNC5VSW50OCgwKSwKICAgIHB1c2hieXRlcyAweDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjgyLTI4OAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLmJveF9hX3ZvdGVyX2RhdGFbVHhuLnNlbmRlcl0udm90ZWQsCiAgICAvLyAgICAgc2VsZi5ib3hfYV92b3Rlcl9kYXRhW1R4bi5zZW5kZXJdLmNob2ljZSwKICAgIC8vICkgPT0gKAogICAgLy8gICAgIGFyYzQuVUludDgoMCksCiAgICAvLyAgICAgYXJjNC5VSW50OCgwKSwKICAgIC8vICksICJUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBhbHJlYWR5IHN1Ym1pdHRlZCBhIHZvdGUuIgogICAgYj09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mjg0CiAgICAvLyBzZWxmLmJveF9hX3ZvdGVyX2RhdGFbVHhuLnNlbmRlcl0uY2hvaWNlLAogICAgYnl0ZWNfMCAvLyAweDYxNWYKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm94X2Ffdm90ZXJfZGF0YSBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMSAxIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI4NwogICAgLy8gYXJjNC5VSW50OCgwKSwKICAgIHB1c2hieXRlcyAweDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjgyLTI4OAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLmJveF9hX3ZvdGVyX2RhdGFbVHhuLnNlbmRlcl0udm90ZWQsCiAgICAvLyAgICAgc2VsZi5ib3hfYV92b3Rlcl9kYXRhW1R4bi5zZW5kZXJdLmNob2ljZSwKICAgIC8vICkgPT0gKAogICAgLy8gICAgIGFyYzQuVUludDgoMCksCiAgICAvLyAgICAgYXJjNC5VSW50OCgwKSwKICAgIC8vICksICJUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBhbHJlYWR5IHN1Ym1pdHRlZCBhIHZvdGUuIgogICAgYj09CiAgICAmJgogICAgYXNzZXJ0IC8vIFRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIGFscmVhZHkgc3VibWl0dGVkIGEgdm90ZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyOTEKICAgIC8vIGNob2ljZSA9PSBhcmM0LlVJbnQ4KDEpCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hieXRlcyAweDAxCiAgICBiPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyOTEtMjkzCiAgICAvLyBjaG9pY2UgPT0gYXJjNC5VSW50OCgxKQogICAgLy8gb3IgY2hvaWNlID09IGFyYzQuVUludDgoMikKICAgIC8vIG9yIGNob2ljZSA9PSBhcmM0LlVJbnQ4KDMpCiAgICBibnogc3VibWl0X3ZvdGVfYm9vbF90cnVlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyOTIKICAgIC8vIG9yIGNob2ljZSA9PSBhcmM0LlVJbnQ4KDIpCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hieXRlcyAweDAyCiAgICBiPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyOTEtMjkzCiAgICAvLyBjaG9pY2UgPT0gYXJjNC5VSW50OCgxKQogICAgLy8gb3IgY2hvaWNlID09IGFyYzQuVUludDgoMikKICAgIC8vIG9yIGNob2ljZSA9PSBhcmM0LlVJbnQ4KDMpCiAgICBibnogc3VibWl0X3ZvdGVfYm9vbF90cnVlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyOTMKICAgIC8vIG9yIGNob2ljZSA9PSBhcmM0LlVJbnQ4KDMpCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hieXRlcyAweDAzCiAgICBiPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyOTEtMjkzCiAgICAvLyBjaG9pY2UgPT0gYXJjNC5VSW50OCgxKQogICAgLy8gb3IgY2hvaWNlID09IGFyYzQuVUludDgoMikKICAgIC8vIG9yIGNob2ljZSA9PSBhcmM0LlVJbnQ4KDMpCiAgICBieiBzdWJtaXRfdm90ZV9ib29sX2ZhbHNlQDQKCnN1Ym1pdF92b3RlX2Jvb2xfdHJ1ZUAzOgogICAgaW50Y18wIC8vIDEKCnN1Ym1pdF92b3RlX2Jvb2xfbWVyZ2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyOTAtMjk0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGNob2ljZSA9PSBhcmM0LlVJbnQ4KDEpCiAgICAvLyAgICAgb3IgY2hvaWNlID09IGFyYzQuVUludDgoMikKICAgIC8vICAgICBvciBjaG9pY2UgPT0gYXJjNC5VSW50OCgzKQogICAgLy8gKSwgIkludmFsaWQgY2hvaWNlLiBDYW4gb25seSBzZWxlY3QgY2hvaWNlcyAxLCAyLCAzLiIKICAgIGFzc2VydCAvLyBJbnZhbGlkIGNob2ljZS4gQ2FuIG9ubHkgc2VsZWN0IGNob2ljZXMgMSwgMiwgMy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMDQtMzA1CiAgICAvLyAjIFNldCBhY2NvdW50IHZvdGVyIGRhdGEKICAgIC8vIHNlbGYuYm94X2Ffdm90ZXJfZGF0YVtUeG4uc2VuZGVyXSA9IFZvdGVyRGF0YShhcmM0LlVJbnQ4KDEpLCBjaG9pY2UpCiAgICBwdXNoYnl0ZXMgMHgwMQogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHg2MTVmCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMDctMzA4CiAgICAvLyAjIFVwZGF0ZSB2b3RlIHRhbGx5CiAgICAvLyBpZiBjaG9pY2UgPT0gVUludDY0KDEpOgogICAgaW50Y18wIC8vIDEKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMQogICAgYj09CiAgICBieiBzdWJtaXRfdm90ZV9lbHNlX2JvZHlANwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjMwOQogICAgLy8gc2VsZi50b3RhbF9jaG9pY2UxICs9IFVJbnQ2NCgxKQogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRvdGFsX2Nob2ljZTEiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY2hvaWNlMSBleGlzdHMKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBieXRlY18zIC8vICJ0b3RhbF9jaG9pY2UxIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKc3VibWl0X3ZvdGVfZWxzZV9ib2R5QDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzEwCiAgICAvLyBlbGlmIGNob2ljZSA9PSBVSW50NjQoMik6CiAgICBwdXNoaW50IDIgLy8gMgogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBiPT0KICAgIGJ6IHN1Ym1pdF92b3RlX2Vsc2VfYm9keUA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzExCiAgICAvLyBzZWxmLnRvdGFsX2Nob2ljZTIgKz0gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgNCAvLyAidG90YWxfY2hvaWNlMiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jaG9pY2UyIGV4aXN0cwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGJ5dGVjIDQgLy8gInRvdGFsX2Nob2ljZTIiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgpzdWJtaXRfdm90ZV9lbHNlX2JvZHlAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMTMKICAgIC8vIHNlbGYudG90YWxfY2hvaWNlMyArPSBVSW50NjQoMSkKICAgIGludGNfMSAvLyAwCiAgICBieXRlYyA1IC8vICJ0b3RhbF9jaG9pY2UzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2Nob2ljZTMgZXhpc3RzCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgYnl0ZWMgNSAvLyAidG90YWxfY2hvaWNlMyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCnN1Ym1pdF92b3RlX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMSAvLyAwCiAgICBiIHN1Ym1pdF92b3RlX2Jvb2xfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90LmRlbGV0ZV9ib3hfc3RvcmFnZSgpIC0+IHZvaWQ6CmRlbGV0ZV9ib3hfc3RvcmFnZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMTYtMzE4CiAgICAvLyAjIEVuYWJsZSBhbnkgZWxpZ2JsZSBhY2NvdW50IHRvIGRlbGV0ZSB0aGVpciBib3ggc3RvcmFnZSBhbmQgZ2V0IHRoZWlyIE1CUiBwYXltZW50IHJlZnVuZGVkCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBkZWxldGVfYm94X3N0b3JhZ2Uoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjMyMQogICAgLy8gVHhuLnNlbmRlciAhPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzE5LTMyMgogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciAhPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiSW52YWxpZCBzZW5kZXIgYWRkcmVzcyEgQXBwbGljYXRpb24gY3JlYXRvciBtdXN0IGRlbGV0ZSBzbWFydCBjb250cmFjdCB0byBmcmVlIHVwIHRoZWlyIGJveCBzdG9yYWdlIE1CUi4iCiAgICBhc3NlcnQgLy8gSW52YWxpZCBzZW5kZXIgYWRkcmVzcyEgQXBwbGljYXRpb24gY3JlYXRvciBtdXN0IGRlbGV0ZSBzbWFydCBjb250cmFjdCB0byBmcmVlIHVwIHRoZWlyIGJveCBzdG9yYWdlIE1CUi4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMjUKICAgIC8vIFR4bi5zZW5kZXIgaW4gc2VsZi5ib3hfYV92b3Rlcl9kYXRhCiAgICBieXRlY18wIC8vIDB4NjE1ZgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMjQtMzI2CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgaW4gc2VsZi5ib3hfYV92b3Rlcl9kYXRhCiAgICAvLyApLCAiVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBiZSBwcmVzZW50IGluIGJveCBhXy4iCiAgICBhc3NlcnQgLy8gVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBiZSBwcmVzZW50IGluIGJveCBhXy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMzMtMzM0CiAgICAvLyAjIERlbGV0ZSBib3gga2V5IChhZGRyZXNzKSBmcm9tIGJveCBzdG9yYWdlCiAgICAvLyBkZWwgc2VsZi5ib3hfYV92b3Rlcl9kYXRhW1R4bi5zZW5kZXJdCiAgICBieXRlY18wIC8vIDB4NjE1ZgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMzgtMzQzCiAgICAvLyBib3hfc3RvcmFnZV9kZWxfcmVmdW5kX2l0eG4gPSBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhbW91bnQ9c2VsZi5jYWxjX2JveF9zdG9yYWdlX21icigpIC0gbWluX3R4bl9mZWUsCiAgICAvLyAgICAgZmVlPW1pbl90eG5fZmVlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjMzOQogICAgLy8gc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM0MAogICAgLy8gcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozNDEKICAgIC8vIGFtb3VudD1zZWxmLmNhbGNfYm94X3N0b3JhZ2VfbWJyKCkgLSBtaW5fdHhuX2ZlZSwKICAgIHB1c2hpbnQgMTU5MDAgLy8gMTU5MDAKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjMzOAogICAgLy8gYm94X3N0b3JhZ2VfZGVsX3JlZnVuZF9pdHhuID0gaXR4bi5QYXltZW50KAogICAgaW50Y18wIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjMzNi0zMzcKICAgIC8vICMgU3VibWl0IGlubmVyIHRyYW5zYWN0aW9uICh0cmFuc2FjdGlvbiBzZW5kZXIgZ2V0cyB0aGVpciBCb3ggc3RvcmFnZSBNQlIgcmVmdW5kZWQpCiAgICAvLyBtaW5fdHhuX2ZlZSA9IGFyYzQuVUludDE2KDEwMDApLm5hdGl2ZQogICAgaW50Y18zIC8vIDEwMDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzM4LTM0MwogICAgLy8gYm94X3N0b3JhZ2VfZGVsX3JlZnVuZF9pdHhuID0gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYW1vdW50PXNlbGYuY2FsY19ib3hfc3RvcmFnZV9tYnIoKSAtIG1pbl90eG5fZmVlLAogICAgLy8gICAgIGZlZT1taW5fdHhuX2ZlZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIFJlY2VpdmVyCiAgICBpdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM0NgogICAgLy8gYm94X3N0b3JhZ2VfZGVsX3JlZnVuZF9pdHhuLnNlbmRlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozNDUtMzQ3CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGJveF9zdG9yYWdlX2RlbF9yZWZ1bmRfaXR4bi5zZW5kZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgImJveF9zdG9yYWdlX2RlbF9yZWZ1bmRfaXR4biBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIGJveF9zdG9yYWdlX2RlbF9yZWZ1bmRfaXR4biBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzUwCiAgICAvLyBib3hfc3RvcmFnZV9kZWxfcmVmdW5kX2l0eG4ucmVjZWl2ZXIgPT0gVHhuLnNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozNDktMzUxCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGJveF9zdG9yYWdlX2RlbF9yZWZ1bmRfaXR4bi5yZWNlaXZlciA9PSBUeG4uc2VuZGVyCiAgICAvLyApLCAiYm94X3N0b3JhZ2VfZGVsX3JlZnVuZF9pdHhuIHJlY2lldmVyIGFkZHJlc3MgbXVzdCBtYXRjaCB0cmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gYm94X3N0b3JhZ2VfZGVsX3JlZnVuZF9pdHhuIHJlY2lldmVyIGFkZHJlc3MgbXVzdCBtYXRjaCB0cmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcy4KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90LnB1cmdlX2JveF9zdG9yYWdlKGJveF9rZXlzOiBieXRlcykgLT4gdm9pZDoKcHVyZ2VfYm94X3N0b3JhZ2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzU0LTM1NgogICAgLy8gIyBFbmFibGUgYXBwbGljYXRpb24gY3JlYXRvciB0byBleGVjdXRlIGJveCBzdG9yYWdlIHB1cmdlLCB0aGlzIGRlbGV0ZXMgYW55IGJveGVzIG5vdCBkZWxldGVkIGJ5IG90aGVyIGFjY291bnRzCiAgICAvLyBAYXJjNC5hYmltZXRob2QgICMgTk9URTogQ2FuIGFsc28gdXNlIGFyYzQuU3RhdGljQXJyYXlbYXJjNC5BZGRyZXNzLCB0LkxpdGVyYWxbOF1dIHRvIGVuZm9yY2Ugc3RyaWN0IHNpemUgb2YgOAogICAgLy8gZGVmIHB1cmdlX2JveF9zdG9yYWdlKHNlbGYsIGJveF9rZXlzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LkFkZHJlc3NdKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozNTkKICAgIC8vIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM1Ny0zNjAKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIlVuYXV0aG9yaXplZCBhZGRyZXNzISBPbmx5IGFwcGxpY2F0aW9uIGNyZWF0b3IgY2FuIHB1cmdlIGJveCBzdG9yYWdlLiIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQgYWRkcmVzcyEgT25seSBhcHBsaWNhdGlvbiBjcmVhdG9yIGNhbiBwdXJnZSBib3ggc3RvcmFnZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozNjcKICAgIC8vIGJveF9rZXlzLmxlbmd0aCA+IDAgYW5kIGJveF9rZXlzLmxlbmd0aCA8IDkKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGJ6IHB1cmdlX2JveF9zdG9yYWdlX2Jvb2xfZmFsc2VAMwogICAgZnJhbWVfZGlnIDEKICAgIHB1c2hpbnQgOSAvLyA5CiAgICA8CiAgICBieiBwdXJnZV9ib3hfc3RvcmFnZV9ib29sX2ZhbHNlQDMKICAgIGludGNfMCAvLyAxCgpwdXJnZV9ib3hfc3RvcmFnZV9ib29sX21lcmdlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzY2LTM2OAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBib3hfa2V5cy5sZW5ndGggPiAwIGFuZCBib3hfa2V5cy5sZW5ndGggPCA5CiAgICAvLyApLCAiVGhlIG51bWJlciBvZiBhZGRyZXNzZXMgcmVwcmVzZW50ZWQgYnkgYm94IGtleXMgYXJyYXkgbXVzdCBiZSBncmVhdGVyIHRoYW4gMCBhbmQgbGVzc2VyIHRoYW4gOS4iCiAgICBhc3NlcnQgLy8gVGhlIG51bWJlciBvZiBhZGRyZXNzZXMgcmVwcmVzZW50ZWQgYnkgYm94IGtleXMgYXJyYXkgbXVzdCBiZSBncmVhdGVyIHRoYW4gMCBhbmQgbGVzc2VyIHRoYW4gOS4KICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDAKCnB1cmdlX2JveF9zdG9yYWdlX2Zvcl9oZWFkZXJANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozNzAtMzcxCiAgICAvLyAjIEl0ZXJhdGUgdGhyb3VnaCB0aGUgZHluYW1pYyBhcnJheSBvZiBhZGRyZXNzZXMgcmVwcmVzZW50aW5nIHRoZSBib3gga2V5CiAgICAvLyBmb3IgYm94X2tleSBpbiBib3hfa2V5czoKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogcHVyZ2VfYm94X3N0b3JhZ2VfYWZ0ZXJfZm9yQDgKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgICoKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM3NAogICAgLy8gYm94X2tleS5uYXRpdmUgaW4gc2VsZi5ib3hfYV92b3Rlcl9kYXRhCiAgICBieXRlY18wIC8vIDB4NjE1ZgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozNzItMzc1CiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBib3hfa2V5Lm5hdGl2ZSBpbiBzZWxmLmJveF9hX3ZvdGVyX2RhdGEKICAgIC8vICksICJBY2NvdW50IGFkZHJlc3MgcmVwcmVzZW50ZWQgaW4gYm94IGtleSBtdXN0IGJlIHByZXNlbnQgaW4gYm94IGFfLiIKICAgIGFzc2VydCAvLyBBY2NvdW50IGFkZHJlc3MgcmVwcmVzZW50ZWQgaW4gYm94IGtleSBtdXN0IGJlIHByZXNlbnQgaW4gYm94IGFfLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM3OAogICAgLy8gYm94X2tleS5uYXRpdmUgIT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICB1bmNvdmVyIDIKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mzc3LTM3OQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBib3hfa2V5Lm5hdGl2ZSAhPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiQWNjb3VudCBhZGRyZXNzIHJlcHJlc2VudGVkIGluIGJveCBrZXkgbXVzdCBub3QgbWF0Y2ggYXBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzLiIKICAgIGFzc2VydCAvLyBBY2NvdW50IGFkZHJlc3MgcmVwcmVzZW50ZWQgaW4gYm94IGtleSBtdXN0IG5vdCBtYXRjaCBhcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzgxLTM4MwogICAgLy8gZGVsIHNlbGYuYm94X2Ffdm90ZXJfZGF0YVsKICAgIC8vICAgICBib3hfa2V5Lm5hdGl2ZQogICAgLy8gXSAgIyBEZWxldGUgYm94IGtleSAoYWRkcmVzcykgZnJvbSBib3ggc3RvcmFnZQogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mzg0CiAgICAvLyBzZWxmLnRvdGFsX3B1cmdlZF9ib3hfYV8gKz0gVUludDY0KAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjXzEgLy8gInRvdGFsX3B1cmdlZF9ib3hfYV8iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfcHVyZ2VkX2JveF9hXyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozODQtMzg2CiAgICAvLyBzZWxmLnRvdGFsX3B1cmdlZF9ib3hfYV8gKz0gVUludDY0KAogICAgLy8gICAgIDEKICAgIC8vICkgICMgSW5jcmVtZW50IGJveCAnYV8nIHB1cmdlZCB0b3RhbCBhbW91bnQKICAgIGludGNfMCAvLyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mzg0CiAgICAvLyBzZWxmLnRvdGFsX3B1cmdlZF9ib3hfYV8gKz0gVUludDY0KAogICAgYnl0ZWNfMSAvLyAidG90YWxfcHVyZ2VkX2JveF9hXyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozODQtMzg2CiAgICAvLyBzZWxmLnRvdGFsX3B1cmdlZF9ib3hfYV8gKz0gVUludDY0KAogICAgLy8gICAgIDEKICAgIC8vICkgICMgSW5jcmVtZW50IGJveCAnYV8nIHB1cmdlZCB0b3RhbCBhbW91bnQKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAwCiAgICBiIHB1cmdlX2JveF9zdG9yYWdlX2Zvcl9oZWFkZXJANQoKcHVyZ2VfYm94X3N0b3JhZ2VfYWZ0ZXJfZm9yQDg6CiAgICByZXRzdWIKCnB1cmdlX2JveF9zdG9yYWdlX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMSAvLyAwCiAgICBiIHB1cmdlX2JveF9zdG9yYWdlX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90LnRlcm1pbmF0ZSgpIC0+IHZvaWQ6CnRlcm1pbmF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozODktMzkxCiAgICAvLyAjIEFsbG93IGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gZGVsZXRlIHRoZSBzbWFydCBjb250cmFjdCBjbGllbnQsIGRlY3JlYXNlIHRoZWlyIE1CUiBiYWxhbmNlICsgYW55IHJlbWFpbmluZyBib3ggTUJSCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJkaXNhbGxvdyIsIGFsbG93X2FjdGlvbnM9WyJEZWxldGVBcHBsaWNhdGlvbiJdKQogICAgLy8gZGVmIHRlcm1pbmF0ZShzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICBpbnRjXzEgLy8gMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzkyLTM5NQogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCBUZW1wbGF0ZVZhcltVSW50NjRdKAogICAgLy8gICAgICJERUxFVEFCTEUiCiAgICAvLyApLCAiVGVtcGxhdGUgdmFyaWFibGUgJ0RFTEVUQUJMRScgbmVlZHMgdG8gYmUgJ1RydWUnIGF0IGRlcGxveS10aW1lLiIKICAgIGludGMgNSAvLyBUTVBMX0RFTEVUQUJMRQogICAgYXNzZXJ0IC8vIFRlbXBsYXRlIHZhcmlhYmxlICdERUxFVEFCTEUnIG5lZWRzIHRvIGJlICdUcnVlJyBhdCBkZXBsb3ktdGltZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozOTgKICAgIC8vIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM5Ny0zOTkKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiVW5hdXRob3JpemVkIGFkZHJlc3MhIE9ubHkgYXBwbGljYXRpb24gY3JlYXRvciBjYW4gZGVsZXRlIHRoZSBzbWFydCBjb250cmFjdC4iCiAgICBhc3NlcnQgLy8gVW5hdXRob3JpemVkIGFkZHJlc3MhIE9ubHkgYXBwbGljYXRpb24gY3JlYXRvciBjYW4gZGVsZXRlIHRoZSBzbWFydCBjb250cmFjdC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MDIKICAgIC8vIEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MgaW4gc2VsZi5ib3hfYV92b3Rlcl9kYXRhCiAgICBieXRlY18wIC8vIDB4NjE1ZgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQwMS00MDMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmNyZWF0b3JfYWRkcmVzcyBpbiBzZWxmLmJveF9hX3ZvdGVyX2RhdGEKICAgIC8vICksICJUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBtdXN0IGJlIHByZXNlbnQgaW4gYm94IGFfLiIKICAgIGFzc2VydCAvLyBUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBtdXN0IGJlIHByZXNlbnQgaW4gYm94IGFfLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQwOS00MTAKICAgIC8vICMgRGVsZXRlIGJveCBrZXkgKGNyZWF0b3IgYWRkcmVzcykgZnJvbSBib3ggc3RvcmFnZQogICAgLy8gZGVsIHNlbGYuYm94X2Ffdm90ZXJfZGF0YVtHbG9iYWwuY3JlYXRvcl9hZGRyZXNzXQogICAgYnl0ZWNfMCAvLyAweDYxNWYKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgY29uY2F0CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MTQKICAgIC8vIGlmIHNlbGYudG90YWxfcHVyZ2VkX2JveF9hXyA+IFVJbnQ2NCgwKToKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18xIC8vICJ0b3RhbF9wdXJnZWRfYm94X2FfIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3B1cmdlZF9ib3hfYV8gZXhpc3RzCiAgICBieiB0ZXJtaW5hdGVfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MTUtNDI0CiAgICAvLyAjIEV4ZWN1dGUgaW5uZXIgdHJhbnNhY3Rpb24gcGF5bWVudCB3aXRoIHB1cmdlIHJlZnVuZCBhbmQgY2xvc2UgcmVtYWluZGVyCiAgICAvLyBkZWxfYXBwX3JlZnVuZF9pdHhuID0gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PSgKICAgIC8vICAgICAgICAgc2VsZi50b3RhbF9wdXJnZWRfYm94X2FfICogc2VsZi5jYWxjX2JveF9zdG9yYWdlX21icigpIC0gbWluX3R4bl9mZWUKICAgIC8vICAgICApLAogICAgLy8gICAgIGZlZT1taW5fdHhuX2ZlZSwKICAgIC8vICAgICBjbG9zZV9yZW1haW5kZXJfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MTcKICAgIC8vIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MTgKICAgIC8vIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MjAKICAgIC8vIHNlbGYudG90YWxfcHVyZ2VkX2JveF9hXyAqIHNlbGYuY2FsY19ib3hfc3RvcmFnZV9tYnIoKSAtIG1pbl90eG5fZmVlCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMSAvLyAidG90YWxfcHVyZ2VkX2JveF9hXyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9wdXJnZWRfYm94X2FfIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjkxLTkyCiAgICAvLyAjIFJldHVybiBzaW5nbGUgYm94IGZlZQogICAgLy8gcmV0dXJuIGJhc2VfZmVlLm5hdGl2ZSArIHNpemVfZmVlCiAgICBpbnRjXzIgLy8gMTY5MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MjAKICAgIC8vIHNlbGYudG90YWxfcHVyZ2VkX2JveF9hXyAqIHNlbGYuY2FsY19ib3hfc3RvcmFnZV9tYnIoKSAtIG1pbl90eG5fZmVlCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDEyLTQxMwogICAgLy8gIyBEZWZpbmUgZmluYWwgZGVsZXRlIGFwcCByZWZ1bmQgdHJhbnNhY3Rpb24KICAgIC8vIG1pbl90eG5fZmVlID0gYXJjNC5VSW50MTYoMTAwMCkubmF0aXZlICAjIE1pbmltdW0gYWNjZXB0YWJsZSBmZWUgZm9yIHRyYW5zYWN0aW9uCiAgICBpbnRjXzMgLy8gMTAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQyMAogICAgLy8gc2VsZi50b3RhbF9wdXJnZWRfYm94X2FfICogc2VsZi5jYWxjX2JveF9zdG9yYWdlX21icigpIC0gbWluX3R4bl9mZWUKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MjMKICAgIC8vIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICBpdHhuX2ZpZWxkIENsb3NlUmVtYWluZGVyVG8KICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQxNS00MTYKICAgIC8vICMgRXhlY3V0ZSBpbm5lciB0cmFuc2FjdGlvbiBwYXltZW50IHdpdGggcHVyZ2UgcmVmdW5kIGFuZCBjbG9zZSByZW1haW5kZXIKICAgIC8vIGRlbF9hcHBfcmVmdW5kX2l0eG4gPSBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzAgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDEyLTQxMwogICAgLy8gIyBEZWZpbmUgZmluYWwgZGVsZXRlIGFwcCByZWZ1bmQgdHJhbnNhY3Rpb24KICAgIC8vIG1pbl90eG5fZmVlID0gYXJjNC5VSW50MTYoMTAwMCkubmF0aXZlICAjIE1pbmltdW0gYWNjZXB0YWJsZSBmZWUgZm9yIHRyYW5zYWN0aW9uCiAgICBpbnRjXzMgLy8gMTAwMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MTUtNDI0CiAgICAvLyAjIEV4ZWN1dGUgaW5uZXIgdHJhbnNhY3Rpb24gcGF5bWVudCB3aXRoIHB1cmdlIHJlZnVuZCBhbmQgY2xvc2UgcmVtYWluZGVyCiAgICAvLyBkZWxfYXBwX3JlZnVuZF9pdHhuID0gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PSgKICAgIC8vICAgICAgICAgc2VsZi50b3RhbF9wdXJnZWRfYm94X2FfICogc2VsZi5jYWxjX2JveF9zdG9yYWdlX21icigpIC0gbWluX3R4bl9mZWUKICAgIC8vICAgICApLAogICAgLy8gICAgIGZlZT1taW5fdHhuX2ZlZSwKICAgIC8vICAgICBjbG9zZV9yZW1haW5kZXJfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIFNlbmRlcgogICAgaXR4biBSZWNlaXZlcgogICAgZnJhbWVfYnVyeSAxCiAgICBpdHhuIENsb3NlUmVtYWluZGVyVG8KICAgIGZyYW1lX2J1cnkgMAoKdGVybWluYXRlX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MzYKICAgIC8vIGRlbF9hcHBfcmVmdW5kX2l0eG4uc2VuZGVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQzNS00MzcKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZGVsX2FwcF9yZWZ1bmRfaXR4bi5zZW5kZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgImRlbF9hcHBfcmVmdW5kX2l0eG4gJ3NlbmRlcicgYWRkcmVzcyBtdXN0IG1hdGNoIEFwcGxpY2F0aW9uIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIGRlbF9hcHBfcmVmdW5kX2l0eG4gJ3NlbmRlcicgYWRkcmVzcyBtdXN0IG1hdGNoIEFwcGxpY2F0aW9uIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDQwCiAgICAvLyBkZWxfYXBwX3JlZnVuZF9pdHhuLnJlY2VpdmVyCiAgICBmcmFtZV9kaWcgMQogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAhPQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQ0MC00NDEKICAgIC8vIGRlbF9hcHBfcmVmdW5kX2l0eG4ucmVjZWl2ZXIKICAgIC8vIGFuZCBkZWxfYXBwX3JlZnVuZF9pdHhuLmNsb3NlX3JlbWFpbmRlcl90byA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBieiB0ZXJtaW5hdGVfYm9vbF9mYWxzZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDQxCiAgICAvLyBhbmQgZGVsX2FwcF9yZWZ1bmRfaXR4bi5jbG9zZV9yZW1haW5kZXJfdG8gPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgZnJhbWVfZGlnIDAKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0NDAtNDQxCiAgICAvLyBkZWxfYXBwX3JlZnVuZF9pdHhuLnJlY2VpdmVyCiAgICAvLyBhbmQgZGVsX2FwcF9yZWZ1bmRfaXR4bi5jbG9zZV9yZW1haW5kZXJfdG8gPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgYnogdGVybWluYXRlX2Jvb2xfZmFsc2VAOAogICAgaW50Y18wIC8vIDEKCnRlcm1pbmF0ZV9ib29sX21lcmdlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDM5LTQ0MgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBkZWxfYXBwX3JlZnVuZF9pdHhuLnJlY2VpdmVyCiAgICAvLyAgICAgYW5kIGRlbF9hcHBfcmVmdW5kX2l0eG4uY2xvc2VfcmVtYWluZGVyX3RvID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJkZWxfYXBwX3JlZnVuZF9pdHhuICdyZWNpZXZlcicgYW5kICdjbG9zZV9yZW1haW5kZXJfdG8nIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBDcmVhdG9yIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIGRlbF9hcHBfcmVmdW5kX2l0eG4gJ3JlY2lldmVyJyBhbmQgJ2Nsb3NlX3JlbWFpbmRlcl90bycgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIENyZWF0b3IgYWRkcmVzcy4KICAgIHJldHN1YgoKdGVybWluYXRlX2Jvb2xfZmFsc2VAODoKICAgIGludGNfMSAvLyAwCiAgICBiIHRlcm1pbmF0ZV9ib29sX21lcmdlQDkKCnRlcm1pbmF0ZV9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MjYtNDMzCiAgICAvLyAjIEV4ZWN1dGUgaW5uZXIgdHJhbnNhY3Rpb24gdGhhdCBvbmx5IGNsb3NlcyBhcHAgcmVtYWluZGVyIGJhbGFuY2UgdG8gdGhlIGNyZWF0b3IKICAgIC8vIGRlbF9hcHBfcmVmdW5kX2l0eG4gPSBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9VUludDY0KDApLCAgIyBTZW5kIHplcm8gYW1vdW50CiAgICAvLyAgICAgZmVlPW1pbl90eG5fZmVlLAogICAgLy8gICAgIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQyOAogICAgLy8gc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQyOQogICAgLy8gcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQzMgogICAgLy8gY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQ2xvc2VSZW1haW5kZXJUbwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQzMAogICAgLy8gYW1vdW50PVVJbnQ2NCgwKSwgICMgU2VuZCB6ZXJvIGFtb3VudAogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQyNi00MjcKICAgIC8vICMgRXhlY3V0ZSBpbm5lciB0cmFuc2FjdGlvbiB0aGF0IG9ubHkgY2xvc2VzIGFwcCByZW1haW5kZXIgYmFsYW5jZSB0byB0aGUgY3JlYXRvcgogICAgLy8gZGVsX2FwcF9yZWZ1bmRfaXR4biA9IGl0eG4uUGF5bWVudCgKICAgIGludGNfMCAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MTItNDEzCiAgICAvLyAjIERlZmluZSBmaW5hbCBkZWxldGUgYXBwIHJlZnVuZCB0cmFuc2FjdGlvbgogICAgLy8gbWluX3R4bl9mZWUgPSBhcmM0LlVJbnQxNigxMDAwKS5uYXRpdmUgICMgTWluaW11bSBhY2NlcHRhYmxlIGZlZSBmb3IgdHJhbnNhY3Rpb24KICAgIGludGNfMyAvLyAxMDAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQyNi00MzMKICAgIC8vICMgRXhlY3V0ZSBpbm5lciB0cmFuc2FjdGlvbiB0aGF0IG9ubHkgY2xvc2VzIGFwcCByZW1haW5kZXIgYmFsYW5jZSB0byB0aGUgY3JlYXRvcgogICAgLy8gZGVsX2FwcF9yZWZ1bmRfaXR4biA9IGl0eG4uUGF5bWVudCgKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1VSW50NjQoMCksICAjIFNlbmQgemVybyBhbW91bnQKICAgIC8vICAgICBmZWU9bWluX3R4bl9mZWUsCiAgICAvLyAgICAgY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBTZW5kZXIKICAgIGl0eG4gUmVjZWl2ZXIKICAgIGZyYW1lX2J1cnkgMQogICAgaXR4biBDbG9zZVJlbWFpbmRlclRvCiAgICBmcmFtZV9idXJ5IDAKICAgIGIgdGVybWluYXRlX2FmdGVyX2lmX2Vsc2VANQo=",
-        "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"
+        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29udHJhY3QuT3BlbkJhbGxvdC5hcHByb3ZhbF9wcm9ncmFtOgogICAgaW50Y2Jsb2NrIDAgMSAyIDMyIDE2MTAwIDEwMDAgNjU1MzUgVE1QTF9URUxFTUVUUlkgVE1QTF9WRVJTSU9OX1VOSVggVE1QTF9ERUxFVEFCTEUKICAgIGJ5dGVjYmxvY2sgInBvbGxfdm90ZXJfcGFnZXMiIDB4NjEgInBvbGxfbnVsbGlmaWVyX3BhZ2VzIiAicG9sbF9yZWdpc3RyYXRpb25fbW9kZSIgInBvbGxfZWxpZ2liaWxpdHlfcm9vdCIgInBvbGxfbnVtX2Nob2ljZXMiICJ0b3RhbF9wYWdlZF92b3RlcnMiICJ0b3RhbF9wdXJnZWRfYm94X2FfIiAicG9sbF9lbmRfZGF0ZV91bml4IiAweDE1MWY3Yzc1ICJwb2xsX2ZpbmFsaXplZCIgInBvbGxfY2hvaWNlX3BhZ2VzIiAweDc0NWYgInBvbGxfbnVtX2Nob2ljZXNfYWRkZWQiIDB4N2E1NjNjNjIgInBvbGxfbGFzdF9wYWdlZF92b3RlciIgInRvdGFsX2V2ZW50cyIgMHgwMSAicG9sbF90aXRsZSIgInBvbGxfc3RhcnRfZGF0ZV91bml4IiAweDAwMDAgMHg2MzVmIDB4ZDU3NWM3MWIgMHhjMTAyNzIzNSAweDA2ODEwMQogICAgY2FsbHN1YiBfX3B1eWFfYXJjNF9yb3V0ZXJfXwogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbnRyYWN0Lk9wZW5CYWxsb3QuX19wdXlhX2FyYzRfcm91dGVyX18oKSAtPiB1aW50NjQ6Cl9fcHV5YV9hcmM0X3JvdXRlcl9fOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMQogICAgLy8gY2xhc3MgT3BlbkJhbGxvdChBUkM0Q29udHJhY3QpOgogICAgcHJvdG8gMCAxCiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogX19wdXlhX2FyYzRfcm91dGVyX19fYWZ0ZXJfaWZfZWxzZUAyNgogICAgcHVzaGJ5dGVzcyAweDViZTIxOWYwIDB4ODFlMTY1OGYgMHg2Yjc3NDA1MCAweGQxMzNjOWMzIDB4NWExMGU4YjAgMHgxZTdmMmE1NyAweGE5OGU5MjA1IDB4ZmU3YjZlMzkgMHg4YzJlY2YyMiAweDI4NWZlOTk4IDB4NzYxZGQwZmEgMHg2ZDlmOGFjMiAweGRkNGEyMGJlIDB4OGY5M2ViOGUgMHgxMWU0YmNkZCAweDY4Njg0NjMxIDB4M2FmZjcxM2MgMHg2ZTBiODNiOSAweGVlNjc3MmJiIDB4NmE4MTA4MWEgMHg1ZmYxNmRhNCAvLyBtZXRob2QgImdlbmVyYXRlKCl2b2lkIiwgbWV0aG9kICJnZXRfdmVyc2lvbl91bml4KCl1aW50NjQiLCBtZXRob2QgImdldF9wb2xsKCkoYnl0ZVtdLGJ5dGVbXSx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfcmVzdWx0cygpKChieXRlW10sYnl0ZVtdLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCksdWludDY0W10pIiwgbWV0aG9kICJnZXRfdm90ZXJzX2RhdGEoYWRkcmVzc1tdKSh1aW50OCwodWludDgpKVtdIiwgbWV0aG9kICJzZXRfcG9sbChieXRlW10sdWludDY0LGJ5dGVbXSx1aW50NjQsdWludDY0KXZvaWQiLCBtZXRob2QgImFkZF9wb2xsX2Nob2ljZXMoYnl0ZVtdW10scGF5KXZvaWQiLCBtZXRob2QgImZ1bmRfYXBwX21icihwYXkpdm9pZCIsIG1ldGhvZCAicmVxdWVzdF9ib3hfc3RvcmFnZShwYXkpdm9pZCIsIG1ldGhvZCAicmVnaXN0ZXJfdm90ZXJzKGFkZHJlc3NbXSxwYXkpdm9pZCIsIG1ldGhvZCAic3VibWl0X3ZvdGUodWludDgpdm9pZCIsIG1ldGhvZCAicmVnaXN0ZXJfYW5kX3ZvdGUocGF5LHVpbnQ4KXZvaWQiLCBtZXRob2QgInJlZ2lzdGVyX3BhZ2VkX3ZvdGVycyhhZGRyZXNzW10scGF5KXZvaWQiLCBtZXRob2QgInN1Ym1pdF9wYWdlZF92b3RlKHVpbnQ4LHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJwdXJnZV92b3Rlcl9wYWdlcyh1aW50NjQpdm9pZCIsIG1ldGhvZCAiYWxsb2NhdGVfbnVsbGlmaWVyX3BhZ2VzKHVpbnQ2NCxwYXkpdm9pZCIsIG1ldGhvZCAic3VibWl0X3ZvdGVfd2l0aF9wcm9vZih1aW50OCx1aW50NjQsYnl0ZVszMl1bXSl2b2lkIiwgbWV0aG9kICJkZWxldGVfYm94X3N0b3JhZ2UoKXZvaWQiLCBtZXRob2QgInB1cmdlX2JveF9zdG9yYWdlKGFkZHJlc3NbXSl1aW50NjQiLCBtZXRob2QgInRyeV9wdXJnZV9ib3hfc3RvcmFnZShhZGRyZXNzW10pdWludDY0IiwgbWV0aG9kICJ0ZXJtaW5hdGUoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBfX3B1eWFfYXJjNF9yb3V0ZXJfX19nZW5lcmF0ZV9yb3V0ZUAyIF9fcHV5YV9hcmM0X3JvdXRlcl9fX2dldF92ZXJzaW9uX3VuaXhfcm91dGVAMyBfX3B1eWFfYXJjNF9yb3V0ZXJfX19nZXRfcG9sbF9yb3V0ZUA0IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2dldF9yZXN1bHRzX3JvdXRlQDUgX19wdXlhX2FyYzRfcm91dGVyX19fZ2V0X3ZvdGVyc19kYXRhX3JvdXRlQDYgX19wdXlhX2FyYzRfcm91dGVyX19fc2V0X3BvbGxfcm91dGVANyBfX3B1eWFfYXJjNF9yb3V0ZXJfX19hZGRfcG9sbF9jaG9pY2VzX3JvdXRlQDggX19wdXlhX2FyYzRfcm91dGVyX19fZnVuZF9hcHBfbWJyX3JvdXRlQDkgX19wdXlhX2FyYzRfcm91dGVyX19fcmVxdWVzdF9ib3hfc3RvcmFnZV9yb3V0ZUAxMCBfX3B1eWFfYXJjNF9yb3V0ZXJfX19yZWdpc3Rlcl92b3RlcnNfcm91dGVAMTEgX19wdXlhX2FyYzRfcm91dGVyX19fc3VibWl0X3ZvdGVfcm91dGVAMTIgX19wdXlhX2FyYzRfcm91dGVyX19fcmVnaXN0ZXJfYW5kX3ZvdGVfcm91dGVAMTMgX19wdXlhX2FyYzRfcm91dGVyX19fcmVnaXN0ZXJfcGFnZWRfdm90ZXJzX3JvdXRlQDE0IF9fcHV5YV9hcmM0X3JvdXRlcl9fX3N1Ym1pdF9wYWdlZF92b3RlX3JvdXRlQDE1IF9fcHV5YV9hcmM0X3JvdXRlcl9fX3B1cmdlX3ZvdGVyX3BhZ2VzX3JvdXRlQDE2IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2FsbG9jYXRlX251bGxpZmllcl9wYWdlc19yb3V0ZUAxNyBfX3B1eWFfYXJjNF9yb3V0ZXJfX19zdWJtaXRfdm90ZV93aXRoX3Byb29mX3JvdXRlQDE4IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2RlbGV0ZV9ib3hfc3RvcmFnZV9yb3V0ZUAxOSBfX3B1eWFfYXJjNF9yb3V0ZXJfX19wdXJnZV9ib3hfc3RvcmFnZV9yb3V0ZUAyMCBfX3B1eWFfYXJjNF9yb3V0ZXJfX190cnlfcHVyZ2VfYm94X3N0b3JhZ2Vfcm91dGVAMjEgX19wdXlhX2FyYzRfcm91dGVyX19fdGVybWluYXRlX3JvdXRlQDIyCiAgICBpbnRjXzAgLy8gMAogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19nZW5lcmF0ZV9yb3V0ZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIxOC0yMTkKICAgIC8vICMgQ2FsbCB0aGUgJ0NyZWF0ZScgYWJpbWV0aG9kIHRoYXQgZ2VuZXJhdGVzIHRoZSBzbWFydCBjb250cmFjdCBjbGllbnQgYW5kIGluaXRpYWxpemVzIGdsb2JhbCBzdG9yYWdlIGludCB2YXJpYWJsZXMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2VuZXJhdGUKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2dldF92ZXJzaW9uX3VuaXhfcm91dGVAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNTEtMjUyCiAgICAvLyAjIFJldHJpZXZlIHRoZSB2ZXJzaW9uIG9mIHRoZSBzbWFydCBjb250cmFjdCBpbiBhbiBVbml4IGZvcm1hdCB0aW1lc3RhbXAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF92ZXJzaW9uX3VuaXgKICAgIGl0b2IKICAgIGJ5dGVjIDkgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2dldF9wb2xsX3JvdXRlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjU4LTI1OQogICAgLy8gIyBSZXRyaWV2ZSB0aGUgcG9sbCBtZXRhZGF0YSBpbiBhIHNpbmdsZSByZWFkLW9ubHkgY2FsbAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X3BvbGwKICAgIGJ5dGVjIDkgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2dldF9yZXN1bHRzX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjY1LTI2NgogICAgLy8gIyBSZXRyaWV2ZSB0aGUgcG9sbCBtZXRhZGF0YSBhbmQgdGhlIHZvdGUgdGFsbHkgb2YgZXZlcnkgY2hvaWNlIChjaG9pY2UgMSBmaXJzdCkgaW4gYSBzaW5nbGUgcmVhZC1vbmx5IGNhbGwKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9yZXN1bHRzCiAgICBieXRlYyA5IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19nZXRfdm90ZXJzX2RhdGFfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyODMtMjg0CiAgICAvLyAjIFJldHJpZXZlIHRoZSBib3ggYV8gVm90ZXJEYXRhIG9mIGEgYmF0Y2ggb2YgYWRkcmVzc2VzIGluIGEgc2luZ2xlIHJlYWQtb25seSBjYWxsIChhYnNlbnQgYWRkcmVzc2VzIGFyZSBtYXJrZWQpCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkgICMgTk9URTogQWRkcmVzc2VzIGFyZSBib3VuZCBieSB0aGUgYm94IHJlZmVyZW5jZXMgcG9vbGVkIGFjcm9zcyB0aGUgZ3JvdXAKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMQogICAgLy8gY2xhc3MgT3BlbkJhbGxvdChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI4My0yODQKICAgIC8vICMgUmV0cmlldmUgdGhlIGJveCBhXyBWb3RlckRhdGEgb2YgYSBiYXRjaCBvZiBhZGRyZXNzZXMgaW4gYSBzaW5nbGUgcmVhZC1vbmx5IGNhbGwgKGFic2VudCBhZGRyZXNzZXMgYXJlIG1hcmtlZCkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKSAgIyBOT1RFOiBBZGRyZXNzZXMgYXJlIGJvdW5kIGJ5IHRoZSBib3ggcmVmZXJlbmNlcyBwb29sZWQgYWNyb3NzIHRoZSBncm91cAogICAgY2FsbHN1YiBnZXRfdm90ZXJzX2RhdGEKICAgIGJ5dGVjIDkgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX3NldF9wb2xsX3JvdXRlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzEyLTMxMwogICAgLy8gIyBFbmFibGUgYXBwbGljYXRpb24gY3JlYXRvciB0byBzZXQgdXAgcG9sbCBkYXRhIHZhbHVlcyBpbmNsdWRpbmcgdGl0bGUsIG51bWJlciBvZiBjaG9pY2VzLCBlbGlnaWJpbGl0eSBhbmQgZGF0ZXMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTAxCiAgICAvLyBjbGFzcyBPcGVuQmFsbG90KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMTItMzEzCiAgICAvLyAjIEVuYWJsZSBhcHBsaWNhdGlvbiBjcmVhdG9yIHRvIHNldCB1cCBwb2xsIGRhdGEgdmFsdWVzIGluY2x1ZGluZyB0aXRsZSwgbnVtYmVyIG9mIGNob2ljZXMsIGVsaWdpYmlsaXR5IGFuZCBkYXRlcwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldF9wb2xsCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19hZGRfcG9sbF9jaG9pY2VzX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzYyLTM2MwogICAgLy8gIyBFbmFibGUgYXBwbGljYXRpb24gY3JlYXRvciB0byBhZGQgYSBwYWdlIG9mIHBvbGwgY2hvaWNlcywgZWFjaCBwYWdlIGlzIHN0b3JlZCBpbiBpdHMgb3duIGJveAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDEKICAgIC8vIGNsYXNzIE9wZW5CYWxsb3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM2Mi0zNjMKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gYWRkIGEgcGFnZSBvZiBwb2xsIGNob2ljZXMsIGVhY2ggcGFnZSBpcyBzdG9yZWQgaW4gaXRzIG93biBib3gKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBhZGRfcG9sbF9jaG9pY2VzCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19mdW5kX2FwcF9tYnJfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MTAtNDExCiAgICAvLyAjIEVuYWJsZSBhcHBsaWNhdGlvbiBjcmVhdG9yIHRvIGZ1bmQgQXBwIGFkZHJlc3MgYW5kIGNvdmVycyBpdHMgR2xvYmFsIG1pbmltdW0gYmFsYW5jZSBhbmQgQm94IHN0b3JhZ2UgTUJSCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMQogICAgLy8gY2xhc3MgT3BlbkJhbGxvdChBUkM0Q29udHJhY3QpOgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDEwLTQxMQogICAgLy8gIyBFbmFibGUgYXBwbGljYXRpb24gY3JlYXRvciB0byBmdW5kIEFwcCBhZGRyZXNzIGFuZCBjb3ZlcnMgaXRzIEdsb2JhbCBtaW5pbXVtIGJhbGFuY2UgYW5kIEJveCBzdG9yYWdlIE1CUgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGZ1bmRfYXBwX21icgogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fcmVxdWVzdF9ib3hfc3RvcmFnZV9yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0NjAtNDYxCiAgICAvLyAjIEVuYWJsZSBhbnkgZWxpZ2libGUgYWNjb3VudCB0byByZXF1ZXN0IGJveCBzdG9yYWdlIGJ5IHBheWluZyBhIE1CUiBjb3N0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMQogICAgLy8gY2xhc3MgT3BlbkJhbGxvdChBUkM0Q29udHJhY3QpOgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDYwLTQ2MQogICAgLy8gIyBFbmFibGUgYW55IGVsaWdpYmxlIGFjY291bnQgdG8gcmVxdWVzdCBib3ggc3RvcmFnZSBieSBwYXlpbmcgYSBNQlIgY29zdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHJlcXVlc3RfYm94X3N0b3JhZ2UKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX3JlZ2lzdGVyX3ZvdGVyc19yb3V0ZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1MDctNTA4CiAgICAvLyAjIEVuYWJsZSBhcHBsaWNhdGlvbiBjcmVhdG9yIHRvIHJlZ2lzdGVyIGEgYmF0Y2ggb2Ygdm90ZXJzIGJ5IHBheWluZyB0aGVpciBib3ggc3RvcmFnZSBNQlIgaW4gYSBzaW5nbGUgcGF5bWVudAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDEKICAgIC8vIGNsYXNzIE9wZW5CYWxsb3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjUwNy01MDgKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gcmVnaXN0ZXIgYSBiYXRjaCBvZiB2b3RlcnMgYnkgcGF5aW5nIHRoZWlyIGJveCBzdG9yYWdlIE1CUiBpbiBhIHNpbmdsZSBwYXltZW50CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgcmVnaXN0ZXJfdm90ZXJzCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19zdWJtaXRfdm90ZV9yb3V0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1NjktNTcwCiAgICAvLyAjIEVuYWJsZSBhbnkgZWxpZ2libGUgYWNjb3VudCB0byBzdWJtaXQgYSB2b3RlCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMQogICAgLy8gY2xhc3MgT3BlbkJhbGxvdChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjU2OS01NzAKICAgIC8vICMgRW5hYmxlIGFueSBlbGlnaWJsZSBhY2NvdW50IHRvIHN1Ym1pdCBhIHZvdGUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBzdWJtaXRfdm90ZQogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fcmVnaXN0ZXJfYW5kX3ZvdGVfcm91dGVAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NjAyLTYwMwogICAgLy8gIyBFbmFibGUgYW55IGFjY291bnQgdG8gcmVxdWVzdCBib3ggc3RvcmFnZSBhbmQgc3VibWl0IHRoZWlyIHZvdGUgaW4gYSBzaW5nbGUgYXBwbGljYXRpb24gY2FsbAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDEKICAgIC8vIGNsYXNzIE9wZW5CYWxsb3QoQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjYwMi02MDMKICAgIC8vICMgRW5hYmxlIGFueSBhY2NvdW50IHRvIHJlcXVlc3QgYm94IHN0b3JhZ2UgYW5kIHN1Ym1pdCB0aGVpciB2b3RlIGluIGEgc2luZ2xlIGFwcGxpY2F0aW9uIGNhbGwKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiByZWdpc3Rlcl9hbmRfdm90ZQogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fcmVnaXN0ZXJfcGFnZWRfdm90ZXJzX3JvdXRlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjY1NS02NTYKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gcmVnaXN0ZXIgYW4gYWxsb3dsaXN0IG9mIHZvdGVycyBpbnRvIHZvdGVyIHBhZ2VzICgzMSB2b3RlciBzbG90cyBwZXIgcGFnZSBib3gpCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMQogICAgLy8gY2xhc3MgT3BlbkJhbGxvdChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NjU1LTY1NgogICAgLy8gIyBFbmFibGUgYXBwbGljYXRpb24gY3JlYXRvciB0byByZWdpc3RlciBhbiBhbGxvd2xpc3Qgb2Ygdm90ZXJzIGludG8gdm90ZXIgcGFnZXMgKDMxIHZvdGVyIHNsb3RzIHBlciBwYWdlIGJveCkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiByZWdpc3Rlcl9wYWdlZF92b3RlcnMKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX3N1Ym1pdF9wYWdlZF92b3RlX3JvdXRlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojc0MS03NDIKICAgIC8vICMgRW5hYmxlIGFueSByZWdpc3RlcmVkIHBhZ2VkIHZvdGVyIHRvIHN1Ym1pdCBhIHZvdGUgdGhyb3VnaCB0aGVpciBvbmx5IHZvdGVyIHNsb3QgKHNpbmdsZSBwYWdlIGJveCByZWZlcmVuY2UpCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMQogICAgLy8gY2xhc3MgT3BlbkJhbGxvdChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojc0MS03NDIKICAgIC8vICMgRW5hYmxlIGFueSByZWdpc3RlcmVkIHBhZ2VkIHZvdGVyIHRvIHN1Ym1pdCBhIHZvdGUgdGhyb3VnaCB0aGVpciBvbmx5IHZvdGVyIHNsb3QgKHNpbmdsZSBwYWdlIGJveCByZWZlcmVuY2UpCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc3VibWl0X3BhZ2VkX3ZvdGUKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX3B1cmdlX3ZvdGVyX3BhZ2VzX3JvdXRlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojc4MS03ODIKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gcHVyZ2Ugdm90ZXIgcGFnZXMgZnJvbSB0aGUgbGFzdCBwYWdlIGRvd24sIGVhY2ggcGFnZSBmcmVlcyB1cCB0byAzMSB2b3RlciBzbG90cwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDEKICAgIC8vIGNsYXNzIE9wZW5CYWxsb3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo3ODEtNzgyCiAgICAvLyAjIEVuYWJsZSBhcHBsaWNhdGlvbiBjcmVhdG9yIHRvIHB1cmdlIHZvdGVyIHBhZ2VzIGZyb20gdGhlIGxhc3QgcGFnZSBkb3duLCBlYWNoIHBhZ2UgZnJlZXMgdXAgdG8gMzEgdm90ZXIgc2xvdHMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBwdXJnZV92b3Rlcl9wYWdlcwogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fYWxsb2NhdGVfbnVsbGlmaWVyX3BhZ2VzX3JvdXRlQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjgxMC04MTEKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gYWxsb2NhdGUgbnVsbGlmaWVyIGJpdG1hcCBwYWdlcyBmb3IgcHJvb2Ygdm90aW5nIGJ5IHBheWluZyB0aGVpciBib3ggc3RvcmFnZSBNQlIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTAxCiAgICAvLyBjbGFzcyBPcGVuQmFsbG90KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4MTAtODExCiAgICAvLyAjIEVuYWJsZSBhcHBsaWNhdGlvbiBjcmVhdG9yIHRvIGFsbG9jYXRlIG51bGxpZmllciBiaXRtYXAgcGFnZXMgZm9yIHByb29mIHZvdGluZyBieSBwYXlpbmcgdGhlaXIgYm94IHN0b3JhZ2UgTUJSCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgYWxsb2NhdGVfbnVsbGlmaWVyX3BhZ2VzCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19zdWJtaXRfdm90ZV93aXRoX3Byb29mX3JvdXRlQDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojg1MS04NTIKICAgIC8vICMgRW5hYmxlIGFueSBlbGlnaWJsZSBhY2NvdW50IHRvIHN1Ym1pdCBhIHZvdGUgYnkgcHJvdmluZyB0aGVpciBhZGRyZXNzIGlzIGEgbGVhZiBvZiB0aGUgZWxpZ2liaWxpdHkgTWVya2xlIHJvb3QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTAxCiAgICAvLyBjbGFzcyBPcGVuQmFsbG90KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODUxLTg1MgogICAgLy8gIyBFbmFibGUgYW55IGVsaWdpYmxlIGFjY291bnQgdG8gc3VibWl0IGEgdm90ZSBieSBwcm92aW5nIHRoZWlyIGFkZHJlc3MgaXMgYSBsZWFmIG9mIHRoZSBlbGlnaWJpbGl0eSBNZXJrbGUgcm9vdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHN1Ym1pdF92b3RlX3dpdGhfcHJvb2YKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2RlbGV0ZV9ib3hfc3RvcmFnZV9yb3V0ZUAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5MjQtOTI1CiAgICAvLyAjIEVuYWJsZSBhbnkgZWxpZ2JsZSBhY2NvdW50IHRvIGRlbGV0ZSB0aGVpciBib3ggc3RvcmFnZSBhbmQgZ2V0IHRoZWlyIE1CUiBwYXltZW50IHJlZnVuZGVkIHRvIHdob2V2ZXIgcGFpZCBpdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZGVsZXRlX2JveF9zdG9yYWdlCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19wdXJnZV9ib3hfc3RvcmFnZV9yb3V0ZUAyMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5NzUtOTc2CiAgICAvLyAjIEVuYWJsZSBhcHBsaWNhdGlvbiBjcmVhdG9yIHRvIGV4ZWN1dGUgYm94IHN0b3JhZ2UgcHVyZ2UsIHRoaXMgZGVsZXRlcyBhbnkgYm94ZXMgbm90IGRlbGV0ZWQgYnkgb3RoZXIgYWNjb3VudHMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCAgIyBOT1RFOiBCb3gga2V5cyBhcmUgYm91bmQgYnkgdGhlIGJveCByZWZlcmVuY2VzIHBvb2xlZCBhY3Jvc3MgdGhlIGdyb3VwIChncm91cCByZXNvdXJjZSBzaGFyaW5nKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTAxCiAgICAvLyBjbGFzcyBPcGVuQmFsbG90KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6OTc1LTk3NgogICAgLy8gIyBFbmFibGUgYXBwbGljYXRpb24gY3JlYXRvciB0byBleGVjdXRlIGJveCBzdG9yYWdlIHB1cmdlLCB0aGlzIGRlbGV0ZXMgYW55IGJveGVzIG5vdCBkZWxldGVkIGJ5IG90aGVyIGFjY291bnRzCiAgICAvLyBAYXJjNC5hYmltZXRob2QgICMgTk9URTogQm94IGtleXMgYXJlIGJvdW5kIGJ5IHRoZSBib3ggcmVmZXJlbmNlcyBwb29sZWQgYWNyb3NzIHRoZSBncm91cCAoZ3JvdXAgcmVzb3VyY2Ugc2hhcmluZykKICAgIGNhbGxzdWIgcHVyZ2VfYm94X3N0b3JhZ2UKICAgIGJ5dGVjIDkgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX3RyeV9wdXJnZV9ib3hfc3RvcmFnZV9yb3V0ZUAyMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDIxLTEwMjIKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gcHVyZ2UgYm94IHN0b3JhZ2Ugd2l0aG91dCBmYWlsaW5nIG9uIGJveGVzIGFscmVhZHkgZGVsZXRlZCBieSB2b3RlcnMgb3Igb3RoZXIgcHVyZ2VzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMQogICAgLy8gY2xhc3MgT3BlbkJhbGxvdChBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMjEtMTAyMgogICAgLy8gIyBFbmFibGUgYXBwbGljYXRpb24gY3JlYXRvciB0byBwdXJnZSBib3ggc3RvcmFnZSB3aXRob3V0IGZhaWxpbmcgb24gYm94ZXMgYWxyZWFkeSBkZWxldGVkIGJ5IHZvdGVycyBvciBvdGhlciBwdXJnZXMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiB0cnlfcHVyZ2VfYm94X3N0b3JhZ2UKICAgIGJ5dGVjIDkgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX3Rlcm1pbmF0ZV9yb3V0ZUAyMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDU5LTEwNjAKICAgIC8vICMgQWxsb3cgYXBwbGljYXRpb24gY3JlYXRvciB0byBkZWxldGUgdGhlIHNtYXJ0IGNvbnRyYWN0IGNsaWVudCwgZGVjcmVhc2UgdGhlaXIgTUJSIGJhbGFuY2UgKyBhbnkgcmVtYWluaW5nIGJveCBNQlIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9ImRpc2FsbG93IiwgYWxsb3dfYWN0aW9ucz1bIkRlbGV0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBwdXNoaW50IDUgLy8gRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBEZWxldGVBcHBsaWNhdGlvbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHRlcm1pbmF0ZQogICAgaW50Y18xIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fYWZ0ZXJfaWZfZWxzZUAyNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDEKICAgIC8vIGNsYXNzIE9wZW5CYWxsb3QoQVJDNENvbnRyYWN0KToKICAgIGludGNfMCAvLyAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29udHJhY3QuT3BlbkJhbGxvdC5nZW5lcmF0ZSgpIC0+IHZvaWQ6CmdlbmVyYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIxOC0yMjAKICAgIC8vICMgQ2FsbCB0aGUgJ0NyZWF0ZScgYWJpbWV0aG9kIHRoYXQgZ2VuZXJhdGVzIHRoZSBzbWFydCBjb250cmFjdCBjbGllbnQgYW5kIGluaXRpYWxpemVzIGdsb2JhbCBzdG9yYWdlIGludCB2YXJpYWJsZXMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgLy8gZGVmIGdlbmVyYXRlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMjMKICAgIC8vIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIyMS0yMjQKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIlRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzLiIKICAgIGFzc2VydCAvLyBUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGNyZWF0b3IgYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMjYKICAgIC8vIGFzc2VydCBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLmJhbGFuY2UgPj0gKAogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIyNwogICAgLy8gR2xvYmFsLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgTWluQmFsYW5jZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIyOQogICAgLy8gbnVtX2J5dGVzPVVJbnQ2NCgzKSwgbnVtX3VpbnQ9VUludDY0KDEyKQogICAgcHVzaGludHMgMyAxMiAvLyAzLCAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIyOC0yMzAKICAgIC8vICsgY2FsY19zY2hlbWFfbWJyKAogICAgLy8gICAgIG51bV9ieXRlcz1VSW50NjQoMyksIG51bV91aW50PVVJbnQ2NCgxMikKICAgIC8vICkgICMgR2xvYmFsIHNjaGVtYSBNQlI6IDAuMSAoR2xvYmFsLm1pbl9iYWxhbmNlKSArIDAuNTkyIEFMR08gKEdsb2JhbCBzY2hlbWEpCiAgICBjYWxsc3ViIGNhbGNfc2NoZW1hX21icgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIyNy0yMzAKICAgIC8vIEdsb2JhbC5taW5fYmFsYW5jZQogICAgLy8gKyBjYWxjX3NjaGVtYV9tYnIoCiAgICAvLyAgICAgbnVtX2J5dGVzPVVJbnQ2NCgzKSwgbnVtX3VpbnQ9VUludDY0KDEyKQogICAgLy8gKSAgIyBHbG9iYWwgc2NoZW1hIE1CUjogMC4xIChHbG9iYWwubWluX2JhbGFuY2UpICsgMC41OTIgQUxHTyAoR2xvYmFsIHNjaGVtYSkKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMjYtMjMwCiAgICAvLyBhc3NlcnQgR2xvYmFsLmNyZWF0b3JfYWRkcmVzcy5iYWxhbmNlID49ICgKICAgIC8vICAgICBHbG9iYWwubWluX2JhbGFuY2UKICAgIC8vICAgICArIGNhbGNfc2NoZW1hX21icigKICAgIC8vICAgICAgICAgbnVtX2J5dGVzPVVJbnQ2NCgzKSwgbnVtX3VpbnQ9VUludDY0KDEyKQogICAgLy8gICAgICkgICMgR2xvYmFsIHNjaGVtYSBNQlI6IDAuMSAoR2xvYmFsLm1pbl9iYWxhbmNlKSArIDAuNTkyIEFMR08gKEdsb2JhbCBzY2hlbWEpCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIyNi0yMzEKICAgIC8vIGFzc2VydCBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLmJhbGFuY2UgPj0gKAogICAgLy8gICAgIEdsb2JhbC5taW5fYmFsYW5jZQogICAgLy8gICAgICsgY2FsY19zY2hlbWFfbWJyKAogICAgLy8gICAgICAgICBudW1fYnl0ZXM9VUludDY0KDMpLCBudW1fdWludD1VSW50NjQoMTIpCiAgICAvLyAgICAgKSAgIyBHbG9iYWwgc2NoZW1hIE1CUjogMC4xIChHbG9iYWwubWluX2JhbGFuY2UpICsgMC41OTIgQUxHTyAoR2xvYmFsIHNjaGVtYSkKICAgIC8vICksICJBcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MgYmFsYW5jZSBtdXN0IGJlIGVxdWFsIG9yIGdyZWF0ZXIgdGhhbiBHbG9iYWwubWluX2JhbGFuY2UgKyBHbG9iYWwgc2NoZW1hIE1CUi4iCiAgICBhc3NlcnQgLy8gQXBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzIGJhbGFuY2UgbXVzdCBiZSBlcXVhbCBvciBncmVhdGVyIHRoYW4gR2xvYmFsLm1pbl9iYWxhbmNlICsgR2xvYmFsIHNjaGVtYSBNQlIuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjMzLTIzNAogICAgLy8gIyBJbml0aWFsaXplIEdsb2JhbCBzdG9yYWdlIHdpdGggZGVmYXVsdCB2YWx1ZSBhc3NpZ25tZW50cwogICAgLy8gc2VsZi5wb2xsX2ZpbmFsaXplZCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTAgLy8gInBvbGxfZmluYWxpemVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjM1CiAgICAvLyBzZWxmLnBvbGxfbGFzdF9wYWdlZF92b3RlciA9IEJ5dGVzKCkKICAgIGJ5dGVjIDE1IC8vICJwb2xsX2xhc3RfcGFnZWRfdm90ZXIiCiAgICBwdXNoYnl0ZXMgMHgKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjM3CiAgICAvLyBzZWxmLnBvbGxfbnVtX2Nob2ljZXMgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDUgLy8gInBvbGxfbnVtX2Nob2ljZXMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMzgKICAgIC8vIHNlbGYucG9sbF9udW1fY2hvaWNlc19hZGRlZCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTMgLy8gInBvbGxfbnVtX2Nob2ljZXNfYWRkZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMzkKICAgIC8vIHNlbGYucG9sbF9jaG9pY2VfcGFnZXMgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDExIC8vICJwb2xsX2Nob2ljZV9wYWdlcyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI0MAogICAgLy8gc2VsZi5wb2xsX251bGxpZmllcl9wYWdlcyA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMiAvLyAicG9sbF9udWxsaWZpZXJfcGFnZXMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNDEKICAgIC8vIHNlbGYucG9sbF92b3Rlcl9wYWdlcyA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAicG9sbF92b3Rlcl9wYWdlcyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI0MgogICAgLy8gc2VsZi5wb2xsX3JlZ2lzdHJhdGlvbl9tb2RlID0gVUludDY0KDApCiAgICBieXRlY18zIC8vICJwb2xsX3JlZ2lzdHJhdGlvbl9tb2RlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjQ0CiAgICAvLyBzZWxmLnRvdGFsX3B1cmdlZF9ib3hfYV8gPSBVSW50NjQoMCkKICAgIGJ5dGVjIDcgLy8gInRvdGFsX3B1cmdlZF9ib3hfYV8iCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNDUKICAgIC8vIHNlbGYudG90YWxfcGFnZWRfdm90ZXJzID0gVUludDY0KDApCiAgICBieXRlYyA2IC8vICJ0b3RhbF9wYWdlZF92b3RlcnMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNDYKICAgIC8vIHNlbGYudG90YWxfZXZlbnRzID0gVUludDY0KDApCiAgICBieXRlYyAxNiAvLyAidG90YWxfZXZlbnRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjQ4CiAgICAvLyBsb2dfdGVsZW1ldHJ5KFVJbnQ2NCgwKSkKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGxvZ190ZWxlbWV0cnkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb21tb24uY2FsY19zY2hlbWFfbWJyKG51bV9ieXRlczogdWludDY0LCBudW1fdWludDogdWludDY0KSAtPiB1aW50NjQ6CmNhbGNfc2NoZW1hX21icjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6MzMtMzUKICAgIC8vICMgQ2FsY3VsYXRlIHRoZSBHbG9iYWwgYW5kIExvY2FsIHNjaGVtYSBtaW5pbXVtIGJhbGFuY2UgcmVxdWlyZW1lbnQgdG90YWwgY29zdCBmb3IgdGhlIHNtYXJ0IGNvbnRyYWN0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGNhbGNfc2NoZW1hX21icihudW1fYnl0ZXM6IFVJbnQ2NCwgbnVtX3VpbnQ6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5OjM5CiAgICAvLyBieXRlX2ZlZSA9IFVJbnQ2NCg1MF8wMDApICAjIEJ5dGUgc2xpY2UgZmVlIGZvciBrZXktdmFsdWUgcGFpciAoMjVfMDAwICsgMjVfMDAwKQogICAgcHVzaGludCA1MDAwMCAvLyA1MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo0Mi00MwogICAgLy8gIyBNdWx0aXBseSByZXNwZWN0aXZlIGZlZSBjb3N0IHdpdGggdGhlIG51bWJlciBvZiBrZXktdmFsdWUgcGFpcnMgaW4gZWFjaCBzY2hlbWEgdG8gZ2V0IHRvdGFsIGZlZSBhbW91bnQKICAgIC8vIHRvdGFsX2J5dGVfZmVlID0gYnl0ZV9mZWUgKiBudW1fYnl0ZXMKICAgIGZyYW1lX2RpZyAtMgogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo0MAogICAgLy8gdWludF9mZWUgPSBVSW50NjQoMjhfNTAwKSAgIyBVSW50NjQgZmVlIGZvciBrZXktdmFsdWUgcGFpciAoMjVfMDAwICsgM181MDApCiAgICBwdXNoaW50IDI4NTAwIC8vIDI4NTAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5OjQ0CiAgICAvLyB0b3RhbF91aW50X2ZlZSA9IHVpbnRfZmVlICogbnVtX3VpbnQKICAgIGZyYW1lX2RpZyAtMQogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTozNy0zOAogICAgLy8gIyBTY2hlbWEgaW5kaXZpZHVhbCBmZWVzCiAgICAvLyBiYXNlX2ZlZSA9IFVJbnQ2NCgxMDBfMDAwKSAgIyBCYXNlIGZlZSAoMTAwXzAwMCAqICgxICsgRXh0cmFQcm9ncmFtUGFnZXMpKQogICAgcHVzaGludCAxMDAwMDAgLy8gMTAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5OjQ2LTQ3CiAgICAvLyAjIFJldHVybiB0aGUgbWluaW11bSBiYWxhbmNlIHJlcXVpcmVtZW50IHRvdGFsIGNvc3QKICAgIC8vIHJldHVybiBiYXNlX2ZlZSArIHRvdGFsX2J5dGVfZmVlICsgdG90YWxfdWludF9mZWUKICAgIHVuY292ZXIgMgogICAgKwogICAgKwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbW1vbi5sb2dfdGVsZW1ldHJ5KGJveGVzX3RvdWNoZWQ6IHVpbnQ2NCkgLT4gdm9pZDoKbG9nX3RlbGVtZXRyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6ODAtODMKICAgIC8vICMgTG9nIHRoZSByZW1haW5pbmcgb3Bjb2RlIGJ1ZGdldCBhbmQgdGhlIG51bWJlciBvZiBib3hlcyB0b3VjaGVkIGJ5IHRoZSBtZXRob2QgKHRlbGVtZXRyeSBidWlsZHMgb25seSkKICAgIC8vICMgTk9URTogRXZlcnkgbWV0aG9kIGNvdW50cyB0aGUgYm94ZXMgaXQgYWNjZXNzZWQgZnJvbSB0aGUgbG9vcCBib3VuZHMgYW5kIGJyYW5jaGVzIGl0IHRvb2ssIHNlZSBlYWNoIGNhbGwgc2l0ZQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBsb2dfdGVsZW1ldHJ5KGJveGVzX3RvdWNoZWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo4NAogICAgLy8gaWYgVGVtcGxhdGVWYXJbVUludDY0XSgiVEVMRU1FVFJZIik6CiAgICBpbnRjIDcgLy8gVE1QTF9URUxFTUVUUlkKICAgIGJ6IGxvZ190ZWxlbWV0cnlfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5Ojg3CiAgICAvLyBhcmM0LlVJbnQzMi5mcm9tX2J5dGVzKFR4bi5hcHBsaWNhdGlvbl9hcmdzKDApKSwKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6ODgKICAgIC8vIGFyYzQuVUludDY0KEdsb2JhbC5vcGNvZGVfYnVkZ2V0KCkpLAogICAgZ2xvYmFsIE9wY29kZUJ1ZGdldAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo4OQogICAgLy8gYXJjNC5VSW50NjQoYm94ZXNfdG91Y2hlZCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6ODYtOTAKICAgIC8vIE1ldGhvZFRlbGVtZXRyeSgKICAgIC8vICAgICBhcmM0LlVJbnQzMi5mcm9tX2J5dGVzKFR4bi5hcHBsaWNhdGlvbl9hcmdzKDApKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChHbG9iYWwub3Bjb2RlX2J1ZGdldCgpKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChib3hlc190b3VjaGVkKSwKICAgIC8vICkKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5Ojg1LTkxCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgTWV0aG9kVGVsZW1ldHJ5KAogICAgLy8gICAgICAgICBhcmM0LlVJbnQzMi5mcm9tX2J5dGVzKFR4bi5hcHBsaWNhdGlvbl9hcmdzKDApKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoR2xvYmFsLm9wY29kZV9idWRnZXQoKSksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KGJveGVzX3RvdWNoZWQpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGJlYjMyMzA0IC8vIG1ldGhvZCAiTWV0aG9kVGVsZW1ldHJ5KHVpbnQzMix1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCgpsb2dfdGVsZW1ldHJ5X2FmdGVyX2lmX2Vsc2VAMjoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90LmdldF92ZXJzaW9uX3VuaXgoKSAtPiB1aW50NjQ6CmdldF92ZXJzaW9uX3VuaXg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjUxLTI1MwogICAgLy8gIyBSZXRyaWV2ZSB0aGUgdmVyc2lvbiBvZiB0aGUgc21hcnQgY29udHJhY3QgaW4gYW4gVW5peCBmb3JtYXQgdGltZXN0YW1wCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBnZXRfdmVyc2lvbl91bml4KHNlbGYpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI1NAogICAgLy8gbG9nX3RlbGVtZXRyeShVSW50NjQoMCkpCiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBsb2dfdGVsZW1ldHJ5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjU1CiAgICAvLyByZXR1cm4gVGVtcGxhdGVWYXJbVUludDY0XSgiVkVSU0lPTl9VTklYIikKICAgIGludGMgOCAvLyBUTVBMX1ZFUlNJT05fVU5JWAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbnRyYWN0Lk9wZW5CYWxsb3QuZ2V0X3BvbGwoKSAtPiBieXRlczoKZ2V0X3BvbGw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjU4LTI2MAogICAgLy8gIyBSZXRyaWV2ZSB0aGUgcG9sbCBtZXRhZGF0YSBpbiBhIHNpbmdsZSByZWFkLW9ubHkgY2FsbAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3BvbGwoc2VsZikgLT4gUG9sbEluZm86CiAgICBwcm90byAwIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNjEKICAgIC8vIGxvZ190ZWxlbWV0cnkoVUludDY0KDApKQogICAgaW50Y18wIC8vIDAKICAgIGNhbGxzdWIgbG9nX3RlbGVtZXRyeQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI2MgogICAgLy8gcmV0dXJuIHNlbGYucG9sbF9pbmZvKCkKICAgIGNhbGxzdWIgcG9sbF9pbmZvCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29udHJhY3QuT3BlbkJhbGxvdC5wb2xsX2luZm8oKSAtPiBieXRlczoKcG9sbF9pbmZvOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE3NC0xNzYKICAgIC8vICMgUmV0dXJuIHRoZSBwb2xsIG1ldGFkYXRhIHN0b3JlZCBpbiBnbG9iYWwgc3RhdGUgYXMgYSBQb2xsSW5mbyBzdHJ1Y3QKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcG9sbF9pbmZvKHNlbGYpIC0+IFBvbGxJbmZvOgogICAgcHJvdG8gMCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTc4CiAgICAvLyB0aXRsZT1hcmM0LkR5bmFtaWNCeXRlcyhzZWxmLnBvbGxfdGl0bGUpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE4IC8vICJwb2xsX3RpdGxlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfdGl0bGUgZXhpc3RzCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE3OQogICAgLy8gZWxpZ2liaWxpdHlfcm9vdD1hcmM0LkR5bmFtaWNCeXRlcyhzZWxmLnBvbGxfZWxpZ2liaWxpdHlfcm9vdCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAicG9sbF9lbGlnaWJpbGl0eV9yb290IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfZWxpZ2liaWxpdHlfcm9vdCBleGlzdHMKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTgwCiAgICAvLyBzdGFydF9kYXRlX3VuaXg9YXJjNC5VSW50NjQoc2VsZi5wb2xsX3N0YXJ0X2RhdGVfdW5peCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTkgLy8gInBvbGxfc3RhcnRfZGF0ZV91bml4IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfc3RhcnRfZGF0ZV91bml4IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE4MQogICAgLy8gZW5kX2RhdGVfdW5peD1hcmM0LlVJbnQ2NChzZWxmLnBvbGxfZW5kX2RhdGVfdW5peCksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAicG9sbF9lbmRfZGF0ZV91bml4IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfZW5kX2RhdGVfdW5peCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxODIKICAgIC8vIGZpbmFsaXplZD1hcmM0LlVJbnQ2NChzZWxmLnBvbGxfZmluYWxpemVkKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAicG9sbF9maW5hbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9maW5hbGl6ZWQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTgzCiAgICAvLyBudW1fY2hvaWNlcz1hcmM0LlVJbnQ2NChzZWxmLnBvbGxfbnVtX2Nob2ljZXMpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInBvbGxfbnVtX2Nob2ljZXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9udW1fY2hvaWNlcyBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxNzctMTg0CiAgICAvLyByZXR1cm4gUG9sbEluZm8oCiAgICAvLyAgICAgdGl0bGU9YXJjNC5EeW5hbWljQnl0ZXMoc2VsZi5wb2xsX3RpdGxlKSwKICAgIC8vICAgICBlbGlnaWJpbGl0eV9yb290PWFyYzQuRHluYW1pY0J5dGVzKHNlbGYucG9sbF9lbGlnaWJpbGl0eV9yb290KSwKICAgIC8vICAgICBzdGFydF9kYXRlX3VuaXg9YXJjNC5VSW50NjQoc2VsZi5wb2xsX3N0YXJ0X2RhdGVfdW5peCksCiAgICAvLyAgICAgZW5kX2RhdGVfdW5peD1hcmM0LlVJbnQ2NChzZWxmLnBvbGxfZW5kX2RhdGVfdW5peCksCiAgICAvLyAgICAgZmluYWxpemVkPWFyYzQuVUludDY0KHNlbGYucG9sbF9maW5hbGl6ZWQpLAogICAgLy8gICAgIG51bV9jaG9pY2VzPWFyYzQuVUludDY0KHNlbGYucG9sbF9udW1fY2hvaWNlcyksCiAgICAvLyApCiAgICBkaWcgNQogICAgbGVuCiAgICBwdXNoaW50IDM2IC8vIDM2CiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcHVzaGJ5dGVzIDB4MDAyNAogICAgc3dhcAogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90LmdldF9yZXN1bHRzKCkgLT4gYnl0ZXM6CmdldF9yZXN1bHRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI2NS0yNjkKICAgIC8vICMgUmV0cmlldmUgdGhlIHBvbGwgbWV0YWRhdGEgYW5kIHRoZSB2b3RlIHRhbGx5IG9mIGV2ZXJ5IGNob2ljZSAoY2hvaWNlIDEgZmlyc3QpIGluIGEgc2luZ2xlIHJlYWQtb25seSBjYWxsCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfcmVzdWx0cygKICAgIC8vICAgICBzZWxmLAogICAgLy8gKSAtPiBhcmM0LlR1cGxlW1BvbGxJbmZvLCBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF1dOgogICAgcHJvdG8gMCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjcwLTI3MQogICAgLy8gIyBQYWNrZWQgdWludDY0IHRhbGxpZXMgYm94IGlzIGFscmVhZHkgdGhlIGJvZHkgb2YgYW4gQVJDLTQgdWludDY0W10sIG9ubHkgdGhlIGxlbmd0aCBwcmVmaXggaXMgYWRkZWQKICAgIC8vIHBhY2tlZF90YWxsaWVzLCBleGlzdHMgPSBzZWxmLmJveF90X2Nob2ljZV90YWxsaWVzLm1heWJlKCkKICAgIGJ5dGVjIDEyIC8vIDB4NzQ1ZgogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI3MgogICAgLy8gaWYgbm90IGV4aXN0czoKICAgIGJueiBnZXRfcmVzdWx0c19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNzMKICAgIC8vIHBhY2tlZF90YWxsaWVzID0gb3AuYnplcm8oc2VsZi5wb2xsX251bV9jaG9pY2VzICogVUludDY0KDgpKSAgIyBUYWxsaWVzIGJveCBub3QgY3JlYXRlZCB5ZXQsIGFsbCB6ZXJvCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAicG9sbF9udW1fY2hvaWNlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX251bV9jaG9pY2VzIGV4aXN0cwogICAgcHVzaGludCA4IC8vIDgKICAgICoKICAgIGJ6ZXJvCiAgICBmcmFtZV9idXJ5IDAKCmdldF9yZXN1bHRzX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNzYKICAgIC8vIG9wLmV4dHJhY3Qob3AuaXRvYihwYWNrZWRfdGFsbGllcy5sZW5ndGggLy8gVUludDY0KDgpKSwgNiwgMikgKyBwYWNrZWRfdGFsbGllcwogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyNzUtMjc3CiAgICAvLyB0YWxsaWVzID0gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdLmZyb21fYnl0ZXMoCiAgICAvLyAgICAgb3AuZXh0cmFjdChvcC5pdG9iKHBhY2tlZF90YWxsaWVzLmxlbmd0aCAvLyBVSW50NjQoOCkpLCA2LCAyKSArIHBhY2tlZF90YWxsaWVzCiAgICAvLyApCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mjc2CiAgICAvLyBvcC5leHRyYWN0KG9wLml0b2IocGFja2VkX3RhbGxpZXMubGVuZ3RoIC8vIFVJbnQ2NCg4KSksIDYsIDIpICsgcGFja2VkX3RhbGxpZXMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI3OQogICAgLy8gbG9nX3RlbGVtZXRyeShVSW50NjQoMSkpCiAgICBpbnRjXzEgLy8gMQogICAgY2FsbHN1YiBsb2dfdGVsZW1ldHJ5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjgwCiAgICAvLyByZXR1cm4gYXJjNC5UdXBsZSgoc2VsZi5wb2xsX2luZm8oKSwgdGFsbGllcy5jb3B5KCkpKQogICAgY2FsbHN1YiBwb2xsX2luZm8KICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDQgLy8gNAogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHB1c2hieXRlcyAweDAwMDQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90LmdldF92b3RlcnNfZGF0YSh2b3RlcnM6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X3ZvdGVyc19kYXRhOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI4My0yODcKICAgIC8vICMgUmV0cmlldmUgdGhlIGJveCBhXyBWb3RlckRhdGEgb2YgYSBiYXRjaCBvZiBhZGRyZXNzZXMgaW4gYSBzaW5nbGUgcmVhZC1vbmx5IGNhbGwgKGFic2VudCBhZGRyZXNzZXMgYXJlIG1hcmtlZCkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKSAgIyBOT1RFOiBBZGRyZXNzZXMgYXJlIGJvdW5kIGJ5IHRoZSBib3ggcmVmZXJlbmNlcyBwb29sZWQgYWNyb3NzIHRoZSBncm91cAogICAgLy8gZGVmIGdldF92b3RlcnNfZGF0YSgKICAgIC8vICAgICBzZWxmLCB2b3RlcnM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuQWRkcmVzc10KICAgIC8vICkgLT4gYXJjNC5EeW5hbWljQXJyYXlbVm90ZXJTdGF0dXNdOgogICAgcHJvdG8gMSAxCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI5MAogICAgLy8gVUludDY0KDEwMCkgKyB2b3RlcnMubGVuZ3RoICogVUludDY0KDQwKSwgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgcHVzaGludCA0MCAvLyA0MAogICAgKgogICAgcHVzaGludCAxMDAgLy8gMTAwCiAgICArCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI4OC0yOTEKICAgIC8vICMgVG9wIHVwIG9wY29kZSBidWRnZXQgZm9yIHRoZSB3aG9sZSBiYXRjaCAofjQwIHBlciBhZGRyZXNzKSwgc2ltdWxhdGUgJ2V4dHJhX29wY29kZV9idWRnZXQnIG1ha2VzIHRoaXMgZnJlZQogICAgLy8gZW5zdXJlX2J1ZGdldCgKICAgIC8vICAgICBVSW50NjQoMTAwKSArIHZvdGVycy5sZW5ndGggKiBVSW50NjQoNDApLCBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0CiAgICAvLyApCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyOTMtMjk0CiAgICAvLyAjIFJlYWQgZXZlcnkgdm90ZXIgZGF0YSBib3ggb25jZSwgYWJzZW50IGFkZHJlc3NlcyBnZXQgYSB6ZXJvZWQgVm90ZXJEYXRhIHdpdGggJ3ByZXNlbnQnIHNldCB0byAnMCcKICAgIC8vIHZvdGVyc19kYXRhID0gYXJjNC5EeW5hbWljQXJyYXlbVm90ZXJTdGF0dXNdKCkKICAgIGJ5dGVjIDIwIC8vIDB4MDAwMAogICAgaW50Y18wIC8vIDAKCmdldF92b3RlcnNfZGF0YV9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mjk1CiAgICAvLyBmb3Igdm90ZXIgaW4gdm90ZXJzOgogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiBnZXRfdm90ZXJzX2RhdGFfYWZ0ZXJfZm9yQDcKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAzCiAgICBpbnRjXzMgLy8gMzIKICAgICoKICAgIGludGNfMyAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mjk2CiAgICAvLyB2b3Rlcl9kYXRhLCBleGlzdHMgPSBvcC5Cb3guZ2V0KHNlbGYuYm94X2Ffdm90ZXJfZGF0YS5rZXlfcHJlZml4ICsgdm90ZXIuYnl0ZXMpCiAgICBieXRlY18xIC8vIDB4NjEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mjk3CiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBnZXRfdm90ZXJzX2RhdGFfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyOTgtMzAyCiAgICAvLyB2b3RlcnNfZGF0YS5hcHBlbmQoCiAgICAvLyAgICAgVm90ZXJTdGF0dXMoCiAgICAvLyAgICAgICAgIGFyYzQuVUludDgoMSksIFZvdGVyRGF0YS5mcm9tX2J5dGVzKG9wLmV4dHJhY3Qodm90ZXJfZGF0YSwgMCwgMSkpCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgZnJhbWVfZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzAwCiAgICAvLyBhcmM0LlVJbnQ4KDEpLCBWb3RlckRhdGEuZnJvbV9ieXRlcyhvcC5leHRyYWN0KHZvdGVyX2RhdGEsIDAsIDEpKQogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgMCAxCiAgICBieXRlYyAxNyAvLyAweDAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mjk5LTMwMQogICAgLy8gVm90ZXJTdGF0dXMoCiAgICAvLyAgICAgYXJjNC5VSW50OCgxKSwgVm90ZXJEYXRhLmZyb21fYnl0ZXMob3AuZXh0cmFjdCh2b3Rlcl9kYXRhLCAwLCAxKSkKICAgIC8vICkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjI5OC0zMDIKICAgIC8vIHZvdGVyc19kYXRhLmFwcGVuZCgKICAgIC8vICAgICBWb3RlclN0YXR1cygKICAgIC8vICAgICAgICAgYXJjNC5VSW50OCgxKSwgVm90ZXJEYXRhLmZyb21fYnl0ZXMob3AuZXh0cmFjdCh2b3Rlcl9kYXRhLCAwLCAxKSkKICAgIC8vICAgICApCiAgICAvLyApCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMgogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAyCiAgICBiIGdldF92b3RlcnNfZGF0YV9hZnRlcl9pZl9lbHNlQDUKCmdldF92b3RlcnNfZGF0YV9lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMDQtMzA2CiAgICAvLyB2b3RlcnNfZGF0YS5hcHBlbmQoCiAgICAvLyAgICAgVm90ZXJTdGF0dXMoYXJjNC5VSW50OCgwKSwgVm90ZXJEYXRhKGFyYzQuVUludDgoMCkpKQogICAgLy8gKQogICAgZnJhbWVfZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzA1CiAgICAvLyBWb3RlclN0YXR1cyhhcmM0LlVJbnQ4KDApLCBWb3RlckRhdGEoYXJjNC5VSW50OCgwKSkpCiAgICBieXRlYyAyMCAvLyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMDQtMzA2CiAgICAvLyB2b3RlcnNfZGF0YS5hcHBlbmQoCiAgICAvLyAgICAgVm90ZXJTdGF0dXMoYXJjNC5VSW50OCgwKSwgVm90ZXJEYXRhKGFyYzQuVUludDgoMCkpKQogICAgLy8gKQogICAgY29uY2F0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDIKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMgoKZ2V0X3ZvdGVyc19kYXRhX2FmdGVyX2lmX2Vsc2VANToKICAgIGZyYW1lX2RpZyAzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAzCiAgICBiIGdldF92b3RlcnNfZGF0YV9mb3JfaGVhZGVyQDEKCmdldF92b3RlcnNfZGF0YV9hZnRlcl9mb3JANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMDgKICAgIC8vIGxvZ190ZWxlbWV0cnkodm90ZXJzLmxlbmd0aCkKICAgIGZyYW1lX2RpZyAxCiAgICBjYWxsc3ViIGxvZ190ZWxlbWV0cnkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMDkKICAgIC8vIHJldHVybiB2b3RlcnNfZGF0YQogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbnRyYWN0Lk9wZW5CYWxsb3Quc2V0X3BvbGwodGl0bGU6IGJ5dGVzLCBudW1fY2hvaWNlczogdWludDY0LCBlbGlnaWJpbGl0eV9yb290OiBieXRlcywgc3RhcnRfZGF0ZV91bml4OiB1aW50NjQsIGVuZF9kYXRlX3VuaXg6IHVpbnQ2NCkgLT4gdm9pZDoKc2V0X3BvbGw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzEyLTMyMQogICAgLy8gIyBFbmFibGUgYXBwbGljYXRpb24gY3JlYXRvciB0byBzZXQgdXAgcG9sbCBkYXRhIHZhbHVlcyBpbmNsdWRpbmcgdGl0bGUsIG51bWJlciBvZiBjaG9pY2VzLCBlbGlnaWJpbGl0eSBhbmQgZGF0ZXMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHNldF9wb2xsKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgdGl0bGU6IEJ5dGVzLAogICAgLy8gICAgIG51bV9jaG9pY2VzOiBVSW50NjQsCiAgICAvLyAgICAgZWxpZ2liaWxpdHlfcm9vdDogQnl0ZXMsCiAgICAvLyAgICAgc3RhcnRfZGF0ZV91bml4OiBVSW50NjQsCiAgICAvLyAgICAgZW5kX2RhdGVfdW5peDogVUludDY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzI0CiAgICAvLyBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMjItMzI1CiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJPbmx5IGFwcGxpY2F0aW9uIGNyZWF0b3IgY2FuIHNldCB1cCBwb2xsLiIKICAgIGFzc2VydCAvLyBPbmx5IGFwcGxpY2F0aW9uIGNyZWF0b3IgY2FuIHNldCB1cCBwb2xsLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjMyNwogICAgLy8gYXNzZXJ0IHRpdGxlLmxlbmd0aCA8PSBVSW50NjQoCiAgICBmcmFtZV9kaWcgLTUKICAgIGxlbgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjMyNy0zMjkKICAgIC8vIGFzc2VydCB0aXRsZS5sZW5ndGggPD0gVUludDY0KAogICAgLy8gICAgIDExOAogICAgLy8gKSwgIlBvbGwgdGl0bGUgc2l6ZSBjYW4gbm90IGV4Y2VlZCAxMTggYnl0ZXMgb2YgZGF0YSBwZXIga2V5LXZhbHVlLiIKICAgIHB1c2hpbnQgMTE4IC8vIDExOAogICAgPD0KICAgIGFzc2VydCAvLyBQb2xsIHRpdGxlIHNpemUgY2FuIG5vdCBleGNlZWQgMTE4IGJ5dGVzIG9mIGRhdGEgcGVyIGtleS12YWx1ZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMzEKICAgIC8vIGFzc2VydF9udW1fY2hvaWNlcyhudW1fY2hvaWNlcykKICAgIGZyYW1lX2RpZyAtNAogICAgY2FsbHN1YiBhc3NlcnRfbnVtX2Nob2ljZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozMzQKICAgIC8vIGVsaWdpYmlsaXR5X3Jvb3QubGVuZ3RoID09IFVJbnQ2NCgwKSBvciBlbGlnaWJpbGl0eV9yb290Lmxlbmd0aCA9PSBVSW50NjQoMzIpCiAgICBmcmFtZV9kaWcgLTMKICAgIGxlbgogICAgZHVwCiAgICBieiBzZXRfcG9sbF9ib29sX3RydWVAMgogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIGJ6IHNldF9wb2xsX2Jvb2xfZmFsc2VAMwoKc2V0X3BvbGxfYm9vbF90cnVlQDI6CiAgICBpbnRjXzEgLy8gMQogICAgYiBzZXRfcG9sbF9ib29sX21lcmdlQDQKCnNldF9wb2xsX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCgpzZXRfcG9sbF9ib29sX21lcmdlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzMzLTMzNQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBlbGlnaWJpbGl0eV9yb290Lmxlbmd0aCA9PSBVSW50NjQoMCkgb3IgZWxpZ2liaWxpdHlfcm9vdC5sZW5ndGggPT0gVUludDY0KDMyKQogICAgLy8gKSwgIkVsaWdpYmlsaXR5IHJvb3QgbXVzdCBiZSBlbXB0eSAoYm94IHN0b3JhZ2Ugdm90aW5nKSBvciBhIDMyIGJ5dGUgTWVya2xlIHJvb3QgKHByb29mIHZvdGluZykuIgogICAgYXNzZXJ0IC8vIEVsaWdpYmlsaXR5IHJvb3QgbXVzdCBiZSBlbXB0eSAoYm94IHN0b3JhZ2Ugdm90aW5nKSBvciBhIDMyIGJ5dGUgTWVya2xlIHJvb3QgKHByb29mIHZvdGluZykuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzQ1CiAgICAvLyBhc3NlcnRfdm90aW5nX3BlcmlvZChzdGFydF9kYXRlX3VuaXgsIGVuZF9kYXRlX3VuaXgpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBhc3NlcnRfdm90aW5nX3BlcmlvZAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM0NwogICAgLy8gYXNzZXJ0IHNlbGYucG9sbF9maW5hbGl6ZWQgPT0gVUludDY0KDApLCAiUG9sbCBjYW4gb25seSBiZSBzZXR1cCBvbmNlLiIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAicG9sbF9maW5hbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9maW5hbGl6ZWQgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gUG9sbCBjYW4gb25seSBiZSBzZXR1cCBvbmNlLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM0OS0zNTAKICAgIC8vICMgVXBkYXRlIGdsb2JhbCBzdGF0ZSBrZXlzIHdpdGggbmV3IHZhbHVlcwogICAgLy8gc2VsZi5wb2xsX3RpdGxlID0gdGl0bGUKICAgIGJ5dGVjIDE4IC8vICJwb2xsX3RpdGxlIgogICAgZnJhbWVfZGlnIC01CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM1MQogICAgLy8gc2VsZi5wb2xsX251bV9jaG9pY2VzID0gbnVtX2Nob2ljZXMKICAgIGJ5dGVjIDUgLy8gInBvbGxfbnVtX2Nob2ljZXMiCiAgICBmcmFtZV9kaWcgLTQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzUyCiAgICAvLyBzZWxmLnBvbGxfZWxpZ2liaWxpdHlfcm9vdCA9IGVsaWdpYmlsaXR5X3Jvb3QKICAgIGJ5dGVjIDQgLy8gInBvbGxfZWxpZ2liaWxpdHlfcm9vdCIKICAgIGZyYW1lX2RpZyAtMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozNTMKICAgIC8vIHNlbGYucG9sbF9zdGFydF9kYXRlX3VuaXggPSBzdGFydF9kYXRlX3VuaXgKICAgIGJ5dGVjIDE5IC8vICJwb2xsX3N0YXJ0X2RhdGVfdW5peCIKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozNTQKICAgIC8vIHNlbGYucG9sbF9lbmRfZGF0ZV91bml4ID0gZW5kX2RhdGVfdW5peAogICAgYnl0ZWMgOCAvLyAicG9sbF9lbmRfZGF0ZV91bml4IgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM1Ni0zNTcKICAgIC8vICMgRmluYWxpemUgcG9sbCAoZW5zdXJlcyBwb2xsIGNhbiBvbmx5IGJlIHNldCBvbmNlKQogICAgLy8gc2VsZi5wb2xsX2ZpbmFsaXplZCA9IFVJbnQ2NCgxKQogICAgYnl0ZWMgMTAgLy8gInBvbGxfZmluYWxpemVkIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzU5CiAgICAvLyBsb2dfdGVsZW1ldHJ5KFVJbnQ2NCgwKSkKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGxvZ190ZWxlbWV0cnkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb21tb24uYXNzZXJ0X251bV9jaG9pY2VzKG51bV9jaG9pY2VzOiB1aW50NjQpIC0+IHZvaWQ6CmFzc2VydF9udW1fY2hvaWNlczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6NTgtNjAKICAgIC8vICMgVmFsaWRhdGUgdGhlIG51bWJlciBvZiBwb2xsIGNob2ljZXMgb2YgYSBuZXcgcG9sbAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBhc3NlcnRfbnVtX2Nob2ljZXMobnVtX2Nob2ljZXM6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo2MQogICAgLy8gYXNzZXJ0IG51bV9jaG9pY2VzID49IFVJbnQ2NCgyKSBhbmQgbnVtX2Nob2ljZXMgPD0gVUludDY0KAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzIgLy8gMgogICAgPj0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6NjEtNjMKICAgIC8vIGFzc2VydCBudW1fY2hvaWNlcyA+PSBVSW50NjQoMikgYW5kIG51bV9jaG9pY2VzIDw9IFVJbnQ2NCgKICAgIC8vICAgICAyNTUKICAgIC8vICksICJOdW1iZXIgb2YgcG9sbCBjaG9pY2VzIG11c3QgYmUgYmV0d2VlbiAyIGFuZCAyNTUuIgogICAgYnogYXNzZXJ0X251bV9jaG9pY2VzX2Jvb2xfZmFsc2VAMwogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDI1NSAvLyAyNTUKICAgIDw9CiAgICBieiBhc3NlcnRfbnVtX2Nob2ljZXNfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzEgLy8gMQogICAgYiBhc3NlcnRfbnVtX2Nob2ljZXNfYm9vbF9tZXJnZUA0Cgphc3NlcnRfbnVtX2Nob2ljZXNfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKCmFzc2VydF9udW1fY2hvaWNlc19ib29sX21lcmdlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5OjYxLTYzCiAgICAvLyBhc3NlcnQgbnVtX2Nob2ljZXMgPj0gVUludDY0KDIpIGFuZCBudW1fY2hvaWNlcyA8PSBVSW50NjQoCiAgICAvLyAgICAgMjU1CiAgICAvLyApLCAiTnVtYmVyIG9mIHBvbGwgY2hvaWNlcyBtdXN0IGJlIGJldHdlZW4gMiBhbmQgMjU1LiIKICAgIGFzc2VydCAvLyBOdW1iZXIgb2YgcG9sbCBjaG9pY2VzIG11c3QgYmUgYmV0d2VlbiAyIGFuZCAyNTUuCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29tbW9uLmFzc2VydF92b3RpbmdfcGVyaW9kKHN0YXJ0X2RhdGVfdW5peDogdWludDY0LCBlbmRfZGF0ZV91bml4OiB1aW50NjQpIC0+IHZvaWQ6CmFzc2VydF92b3RpbmdfcGVyaW9kOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo2Ni02OAogICAgLy8gIyBWYWxpZGF0ZSB0aGUgdm90aW5nIHBlcmlvZCBvZiBhIG5ldyBwb2xsICgzIHRvIDE0IGRheXMpCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGFzc2VydF92b3RpbmdfcGVyaW9kKHN0YXJ0X2RhdGVfdW5peDogVUludDY0LCBlbmRfZGF0ZV91bml4OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6NjkKICAgIC8vIGFzc2VydCBzdGFydF9kYXRlX3VuaXggPCBlbmRfZGF0ZV91bml4LCAiU3RhcnQgZGF0ZSBtdXN0IGJlIGVhcmxpZXIgdGhhbiBlbmQgZGF0ZS4iCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgPAogICAgYXNzZXJ0IC8vIFN0YXJ0IGRhdGUgbXVzdCBiZSBlYXJsaWVyIHRoYW4gZW5kIGRhdGUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5OjcxLTczCiAgICAvLyBhc3NlcnQgZW5kX2RhdGVfdW5peCA+PSBzdGFydF9kYXRlX3VuaXggKyBVSW50NjQoCiAgICAvLyAgICAgMyAqIDI0ICogNjAgKiA2MAogICAgLy8gKSwgIkVuZCBkYXRlIG11c3QgYmUgYXQgbGVhc3QgMyBkYXlzIGxhdGVyIHRoYW4gdGhlIHN0YXJ0IGRhdGUuIgogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDI1OTIwMCAvLyAyNTkyMDAKICAgICsKICAgIGZyYW1lX2RpZyAtMQogICAgPD0KICAgIGFzc2VydCAvLyBFbmQgZGF0ZSBtdXN0IGJlIGF0IGxlYXN0IDMgZGF5cyBsYXRlciB0aGFuIHRoZSBzdGFydCBkYXRlLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo3NQogICAgLy8gYXNzZXJ0IGVuZF9kYXRlX3VuaXggLSBzdGFydF9kYXRlX3VuaXggPD0gVUludDY0KAogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgLTIKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6NzUtNzcKICAgIC8vIGFzc2VydCBlbmRfZGF0ZV91bml4IC0gc3RhcnRfZGF0ZV91bml4IDw9IFVJbnQ2NCgKICAgIC8vICAgICAxNCAqIDI0ICogNjAgKiA2MAogICAgLy8gKSwgIlZvdGluZyBwZXJpb2QgY2FuIG5vdCBleGNlZWQgMTQgZGF5cy4iCiAgICBwdXNoaW50IDEyMDk2MDAgLy8gMTIwOTYwMAogICAgPD0KICAgIGFzc2VydCAvLyBWb3RpbmcgcGVyaW9kIGNhbiBub3QgZXhjZWVkIDE0IGRheXMuCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29udHJhY3QuT3BlbkJhbGxvdC5hZGRfcG9sbF9jaG9pY2VzKGNob2ljZXM6IGJ5dGVzLCBtYnJfcGF5OiB1aW50NjQpIC0+IHZvaWQ6CmFkZF9wb2xsX2Nob2ljZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzYyLTM2OAogICAgLy8gIyBFbmFibGUgYXBwbGljYXRpb24gY3JlYXRvciB0byBhZGQgYSBwYWdlIG9mIHBvbGwgY2hvaWNlcywgZWFjaCBwYWdlIGlzIHN0b3JlZCBpbiBpdHMgb3duIGJveAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgYWRkX3BvbGxfY2hvaWNlcygKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGNob2ljZXM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuRHluYW1pY0J5dGVzXSwKICAgIC8vICAgICBtYnJfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozNzEKICAgIC8vIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM2OS0zNzIKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIk9ubHkgYXBwbGljYXRpb24gY3JlYXRvciBjYW4gYWRkIHBvbGwgY2hvaWNlcy4iCiAgICBhc3NlcnQgLy8gT25seSBhcHBsaWNhdGlvbiBjcmVhdG9yIGNhbiBhZGQgcG9sbCBjaG9pY2VzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM3NQogICAgLy8gc2VsZi5wb2xsX2ZpbmFsaXplZCA9PSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAicG9sbF9maW5hbGl6ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9maW5hbGl6ZWQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozNzQtMzc2CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYucG9sbF9maW5hbGl6ZWQgPT0gVUludDY0KDEpCiAgICAvLyApLCAiUG9sbCBtdXN0IGJlIHNldCB1cCBiZWZvcmUgYWRkaW5nIHBvbGwgY2hvaWNlcy4iCiAgICBhc3NlcnQgLy8gUG9sbCBtdXN0IGJlIHNldCB1cCBiZWZvcmUgYWRkaW5nIHBvbGwgY2hvaWNlcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozNzkKICAgIC8vIGNob2ljZXMubGVuZ3RoID4gMAogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM3OS0zODAKICAgIC8vIGNob2ljZXMubGVuZ3RoID4gMAogICAgLy8gYW5kIHNlbGYucG9sbF9udW1fY2hvaWNlc19hZGRlZCArIGNob2ljZXMubGVuZ3RoIDw9IHNlbGYucG9sbF9udW1fY2hvaWNlcwogICAgYnogYWRkX3BvbGxfY2hvaWNlc19ib29sX2ZhbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozODAKICAgIC8vIGFuZCBzZWxmLnBvbGxfbnVtX2Nob2ljZXNfYWRkZWQgKyBjaG9pY2VzLmxlbmd0aCA8PSBzZWxmLnBvbGxfbnVtX2Nob2ljZXMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAicG9sbF9udW1fY2hvaWNlc19hZGRlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX251bV9jaG9pY2VzX2FkZGVkIGV4aXN0cwogICAgZnJhbWVfZGlnIDIKICAgICsKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJwb2xsX251bV9jaG9pY2VzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfbnVtX2Nob2ljZXMgZXhpc3RzCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM3OS0zODAKICAgIC8vIGNob2ljZXMubGVuZ3RoID4gMAogICAgLy8gYW5kIHNlbGYucG9sbF9udW1fY2hvaWNlc19hZGRlZCArIGNob2ljZXMubGVuZ3RoIDw9IHNlbGYucG9sbF9udW1fY2hvaWNlcwogICAgYnogYWRkX3BvbGxfY2hvaWNlc19ib29sX2ZhbHNlQDMKICAgIGludGNfMSAvLyAxCiAgICBiIGFkZF9wb2xsX2Nob2ljZXNfYm9vbF9tZXJnZUA0CgphZGRfcG9sbF9jaG9pY2VzX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCgphZGRfcG9sbF9jaG9pY2VzX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozNzgtMzgxCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGNob2ljZXMubGVuZ3RoID4gMAogICAgLy8gICAgIGFuZCBzZWxmLnBvbGxfbnVtX2Nob2ljZXNfYWRkZWQgKyBjaG9pY2VzLmxlbmd0aCA8PSBzZWxmLnBvbGxfbnVtX2Nob2ljZXMKICAgIC8vICksICJOdW1iZXIgb2YgcG9sbCBjaG9pY2VzIGFkZGVkIGNhbiBub3QgZXhjZWVkIHRoZSBudW1iZXIgb2YgcG9sbCBjaG9pY2VzIHNldCB1cC4iCiAgICBhc3NlcnQgLy8gTnVtYmVyIG9mIHBvbGwgY2hvaWNlcyBhZGRlZCBjYW4gbm90IGV4Y2VlZCB0aGUgbnVtYmVyIG9mIHBvbGwgY2hvaWNlcyBzZXQgdXAuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzgzCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoY2hvaWNlcy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMQoKYWRkX3BvbGxfY2hvaWNlc19mb3JfaGVhZGVyQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzgzCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoY2hvaWNlcy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAyCiAgICA8CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgYnogYWRkX3BvbGxfY2hvaWNlc19hZnRlcl9mb3JAOAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM4NAogICAgLy8gYXNzZXJ0IGNob2ljZXNbaV0uY29weSgpLmxlbmd0aCA8PSBVSW50NjQoCiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMAogICAgYXNzZXJ0IC8vIEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDEKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGV4dHJhY3QzCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozODQtMzg2CiAgICAvLyBhc3NlcnQgY2hvaWNlc1tpXS5jb3B5KCkubGVuZ3RoIDw9IFVJbnQ2NCgKICAgIC8vICAgICAxMTYKICAgIC8vICksICJQb2xsIGNob2ljZSBzaXplIGNhbm5vdCBleGNlZWQgMTE2IGJ5dGVzIG9mIGRhdGEuIgogICAgcHVzaGludCAxMTYgLy8gMTE2CiAgICA8PQogICAgYXNzZXJ0IC8vIFBvbGwgY2hvaWNlIHNpemUgY2Fubm90IGV4Y2VlZCAxMTYgYnl0ZXMgb2YgZGF0YS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozODMKICAgIC8vIGZvciBpIGluIHVyYW5nZShjaG9pY2VzLmxlbmd0aCk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBiIGFkZF9wb2xsX2Nob2ljZXNfZm9yX2hlYWRlckA1CgphZGRfcG9sbF9jaG9pY2VzX2FmdGVyX2ZvckA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjM4OQogICAgLy8gbWJyX3BheS5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozODgtMzkwCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkuc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJNQlIgcGF5bWVudCBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIE1CUiBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwcGxpY2F0aW9uIGNyZWF0b3IgYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozOTMKICAgIC8vIG1icl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MzkyLTM5NAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBtYnJfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJNQlIgcGF5bWVudCByZWNpZXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgcmVjaWV2ZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mzk2CiAgICAvLyBhc3NlcnQgbWJyX3BheS5hbW91bnQgPj0gY2FsY19zaW5nbGVfYm94X2ZlZSgKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Mzk3CiAgICAvLyBVSW50NjQoMyksIGNob2ljZXMuYnl0ZXMubGVuZ3RoCiAgICBmcmFtZV9kaWcgLTIKICAgIGxlbgogICAgcHVzaGludCAzIC8vIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTozOTYtMzk4CiAgICAvLyBhc3NlcnQgbWJyX3BheS5hbW91bnQgPj0gY2FsY19zaW5nbGVfYm94X2ZlZSgKICAgIC8vICAgICBVSW50NjQoMyksIGNob2ljZXMuYnl0ZXMubGVuZ3RoCiAgICAvLyApLCAiTUJSIHBheW1lbnQgZm9yIHBvbGwgY2hvaWNlcyBib3ggc3RvcmFnZSBtdXN0IG1lZXQgdGhlIG1pbmltdW0gcmVxdWlyZW1lbnQgYW1vdW50LiIKICAgIHN3YXAKICAgIGNhbGxzdWIgY2FsY19zaW5nbGVfYm94X2ZlZQogICAgPj0KICAgIGFzc2VydCAvLyBNQlIgcGF5bWVudCBmb3IgcG9sbCBjaG9pY2VzIGJveCBzdG9yYWdlIG11c3QgbWVldCB0aGUgbWluaW11bSByZXF1aXJlbWVudCBhbW91bnQuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDAwLTQwMQogICAgLy8gIyBTdG9yZSB0aGUgcGFnZSBvZiBwb2xsIGNob2ljZXMgaW4gYm94IHN0b3JhZ2UgdW5kZXIgdGhlIG5leHQgcGFnZSBpbmRleAogICAgLy8gc2VsZi5ib3hfY19wb2xsX2Nob2ljZXNbYXJjNC5VSW50OChzZWxmLnBvbGxfY2hvaWNlX3BhZ2VzKV0gPSBjaG9pY2VzLmNvcHkoKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJwb2xsX2Nob2ljZV9wYWdlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX2Nob2ljZV9wYWdlcyBleGlzdHMKICAgIGl0b2IKICAgIGV4dHJhY3QgNyAxCiAgICBieXRlYyAyMSAvLyAweDYzNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQwMy00MDQKICAgIC8vICMgVXBkYXRlIGdsb2JhbCBzdGF0ZSBrZXlzIHdpdGggbmV3IHZhbHVlcwogICAgLy8gc2VsZi5wb2xsX2Nob2ljZV9wYWdlcyArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAicG9sbF9jaG9pY2VfcGFnZXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9jaG9pY2VfcGFnZXMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgMTEgLy8gInBvbGxfY2hvaWNlX3BhZ2VzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MDUKICAgIC8vIHNlbGYucG9sbF9udW1fY2hvaWNlc19hZGRlZCArPSBjaG9pY2VzLmxlbmd0aAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJwb2xsX251bV9jaG9pY2VzX2FkZGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfbnVtX2Nob2ljZXNfYWRkZWQgZXhpc3RzCiAgICBmcmFtZV9kaWcgMgogICAgKwogICAgYnl0ZWMgMTMgLy8gInBvbGxfbnVtX2Nob2ljZXNfYWRkZWQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQwNwogICAgLy8gbG9nX3RlbGVtZXRyeShVSW50NjQoMSkpCiAgICBpbnRjXzEgLy8gMQogICAgY2FsbHN1YiBsb2dfdGVsZW1ldHJ5CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29tbW9uLmNhbGNfc2luZ2xlX2JveF9mZWUoa2V5X3NpemU6IHVpbnQ2NCwgdmFsdWVfc2l6ZTogdWludDY0KSAtPiB1aW50NjQ6CmNhbGNfc2luZ2xlX2JveF9mZWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5OjUwLTUyCiAgICAvLyAjIENhbGN1bGF0ZSBib3ggZmVlIGZvciBzaW5nbGUgYm94IHVuaXQgKG9ubHkgZm9yIGJveCBzaXplcyBub3Qga25vd24gYXQgY29tcGlsZSB0aW1lKQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjYWxjX3NpbmdsZV9ib3hfZmVlKGtleV9zaXplOiBVSW50NjQsIHZhbHVlX3NpemU6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5OjU0LTU1CiAgICAvLyAjIEZvcm11bGEgZm9yIGNhbGN1bGF0aW5nIHNpbmdsZSBib3ggZmVlOiBiYXNlIGZlZSArIHNpemUgZmVlICg0MDAgcGVyIGJ5dGUgKiAobGVuKGtleSkrbGVuKHZhbHVlKSkpCiAgICAvLyByZXR1cm4gVUludDY0KEJPWF9CQVNFX0ZFRSkgKyBVSW50NjQoQk9YX0JZVEVfRkVFKSAqIChrZXlfc2l6ZSArIHZhbHVlX3NpemUpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgcHVzaGludCA0MDAgLy8gNDAwCiAgICAqCiAgICBwdXNoaW50IDI1MDAgLy8gMjUwMAogICAgKwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbnRyYWN0Lk9wZW5CYWxsb3QuZnVuZF9hcHBfbWJyKG1icl9wYXk6IHVpbnQ2NCkgLT4gdm9pZDoKZnVuZF9hcHBfbWJyOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQxMC00MTIKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gZnVuZCBBcHAgYWRkcmVzcyBhbmQgY292ZXJzIGl0cyBHbG9iYWwgbWluaW11bSBiYWxhbmNlIGFuZCBCb3ggc3RvcmFnZSBNQlIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGZ1bmRfYXBwX21icihzZWxmLCBtYnJfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbikgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQxNQogICAgLy8gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDEzLTQxNgogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIFRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQxOQogICAgLy8gbWJyX3BheS5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MTgtNDIwCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkuc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJNQlIgcGF5bWVudCBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIE1CUiBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwcGxpY2F0aW9uIGNyZWF0b3IgYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MjMKICAgIC8vIG1icl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDIyLTQyNAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBtYnJfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJNQlIgcGF5bWVudCByZWNpZXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgcmVjaWV2ZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDI3CiAgICAvLyBzZWxmLnBvbGxfZmluYWxpemVkID09IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJwb2xsX2ZpbmFsaXplZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX2ZpbmFsaXplZCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQyNi00MjgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc2VsZi5wb2xsX2ZpbmFsaXplZCA9PSBVSW50NjQoMSkKICAgIC8vICksICJQb2xsIG11c3QgYmUgc2V0IHVwIGJlZm9yZSBmdW5kaW5nIGFwcCBtYnIuIgogICAgYXNzZXJ0IC8vIFBvbGwgbXVzdCBiZSBzZXQgdXAgYmVmb3JlIGZ1bmRpbmcgYXBwIG1ici4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MzEKICAgIC8vIHNlbGYucG9sbF9udW1fY2hvaWNlcwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInBvbGxfbnVtX2Nob2ljZXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9udW1fY2hvaWNlcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MzAtNDMyCiAgICAvLyBib3hfc3RvcmFnZV9tYnIgPSBVSW50NjQoQk9YX0FfTUJSKSArIHNlbGYuY2FsY190YWxseV9ib3hfbWJyKAogICAgLy8gICAgIHNlbGYucG9sbF9udW1fY2hvaWNlcwogICAgLy8gKSAgIyBCb3ggYV8gZmVlOiAwLjAxNjEgQUxHTyArIEJveCB0XyBmZWU6IDAuMDAzMyBBTEdPICsgMC4wMDMyIEFMR08gcGVyIGNob2ljZQogICAgY2FsbHN1YiBjYWxjX3RhbGx5X2JveF9tYnIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MzAKICAgIC8vIGJveF9zdG9yYWdlX21iciA9IFVJbnQ2NChCT1hfQV9NQlIpICsgc2VsZi5jYWxjX3RhbGx5X2JveF9tYnIoCiAgICBpbnRjIDQgLy8gMTYxMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0MzAtNDMyCiAgICAvLyBib3hfc3RvcmFnZV9tYnIgPSBVSW50NjQoQk9YX0FfTUJSKSArIHNlbGYuY2FsY190YWxseV9ib3hfbWJyKAogICAgLy8gICAgIHNlbGYucG9sbF9udW1fY2hvaWNlcwogICAgLy8gKSAgIyBCb3ggYV8gZmVlOiAwLjAxNjEgQUxHTyArIEJveCB0XyBmZWU6IDAuMDAzMyBBTEdPICsgMC4wMDMyIEFMR08gcGVyIGNob2ljZQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQzNQogICAgLy8gbWJyX3BheS5hbW91bnQgPj0gYm94X3N0b3JhZ2VfbWJyCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZGlnIDEKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDM0LTQzNgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBtYnJfcGF5LmFtb3VudCA+PSBib3hfc3RvcmFnZV9tYnIKICAgIC8vICksICJNQlIgcGF5bWVudCBmb3IgYm94IHN0b3JhZ2UgbXVzdCBtZWV0IHRoZSBtaW5pbXVtIHJlcXVpcmVtZW50IGFtb3VudC4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgZm9yIGJveCBzdG9yYWdlIG11c3QgbWVldCB0aGUgbWluaW11bSByZXF1aXJlbWVudCBhbW91bnQuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDM4CiAgICAvLyBhc3NlcnQgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5iYWxhbmNlID49ICgKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQzOQogICAgLy8gR2xvYmFsLm1pbl9iYWxhbmNlICsgYm94X3N0b3JhZ2VfbWJyCiAgICBnbG9iYWwgTWluQmFsYW5jZQogICAgdW5jb3ZlciAyCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDM4LTQzOQogICAgLy8gYXNzZXJ0IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZSA+PSAoCiAgICAvLyAgICAgR2xvYmFsLm1pbl9iYWxhbmNlICsgYm94X3N0b3JhZ2VfbWJyCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQzOC00NDAKICAgIC8vIGFzc2VydCBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UgPj0gKAogICAgLy8gICAgIEdsb2JhbC5taW5fYmFsYW5jZSArIGJveF9zdG9yYWdlX21icgogICAgLy8gKSwgIkFwcGxpY2F0aW9uIGFkZHJlc3MgYmFsYW5jZSBtdXN0IGJlIGVxdWFsIG9yIGdyZWF0ZXIgdGhhbiBHbG9iYWwubWluX2JhbGFuY2UgKyBCb3ggc3RvcmFnZSBmZWUuIgogICAgYXNzZXJ0IC8vIEFwcGxpY2F0aW9uIGFkZHJlc3MgYmFsYW5jZSBtdXN0IGJlIGVxdWFsIG9yIGdyZWF0ZXIgdGhhbiBHbG9iYWwubWluX2JhbGFuY2UgKyBCb3ggc3RvcmFnZSBmZWUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDQzCiAgICAvLyBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8PSBzZWxmLnBvbGxfZW5kX2RhdGVfdW5peAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gInBvbGxfZW5kX2RhdGVfdW5peCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX2VuZF9kYXRlX3VuaXggZXhpc3RzCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQ0Mi00NDQKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPD0gc2VsZi5wb2xsX2VuZF9kYXRlX3VuaXgKICAgIC8vICksICJVbmFibGUgdG8gZnVuZCBhcHAgbWJyIGlmIHZvdGluZyBwZXJpb2QgaXMgb3Zlci4iCiAgICBhc3NlcnQgLy8gVW5hYmxlIHRvIGZ1bmQgYXBwIG1iciBpZiB2b3RpbmcgcGVyaW9kIGlzIG92ZXIuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDQ4CiAgICAvLyBzZWxmLmJveF9hX3ZvdGVyX2RhdGEua2V5X3ByZWZpeCArIFR4bi5zZW5kZXIuYnl0ZXMsIFVJbnQ2NCgxKQogICAgYnl0ZWNfMSAvLyAweDYxCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGludGNfMSAvLyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDQ2LTQ0OQogICAgLy8gIyBDcmVhdGUgemVybyBmaWxsZWQgdm90ZXIgZGF0YSBib3ggKFZvdGVyRGF0YSBub3Qgdm90ZWQpLCBmYWlscyBpZiBpdCBhbHJlYWR5IGV4aXN0cwogICAgLy8gYXNzZXJ0IG9wLkJveC5jcmVhdGUoCiAgICAvLyAgICAgc2VsZi5ib3hfYV92b3Rlcl9kYXRhLmtleV9wcmVmaXggKyBUeG4uc2VuZGVyLmJ5dGVzLCBVSW50NjQoMSkKICAgIC8vICksICJUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBhbHJlYWR5IHByZXNlbnQgaW4gYm94IGFfLiIKICAgIGJveF9jcmVhdGUKICAgIGFzc2VydCAvLyBUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBhbHJlYWR5IHByZXNlbnQgaW4gYm94IGFfLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQ1MS00NTIKICAgIC8vICMgQ2hlY2sgaWYgY2hvaWNlIHRhbGxpZXMgYm94IGRvZXNuJ3QgYWxyZWFkeSBleGlzdCwgaWYgbm90IChGYWxzZSkgdGhlbiBjcmVhdGUgaXQgemVybyBmaWxsZWQKICAgIC8vIGlmIG5vdCBzZWxmLmJveF90X2Nob2ljZV90YWxsaWVzOgogICAgYnl0ZWMgMTIgLy8gMHg3NDVmCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiBmdW5kX2FwcF9tYnJfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDU0CiAgICAvLyBzaXplPXNlbGYucG9sbF9udW1fY2hvaWNlcyAqIFVJbnQ2NCg4KQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInBvbGxfbnVtX2Nob2ljZXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9udW1fY2hvaWNlcyBleGlzdHMKICAgIHB1c2hpbnQgOCAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDUzCiAgICAvLyBhc3NlcnQgc2VsZi5ib3hfdF9jaG9pY2VfdGFsbGllcy5jcmVhdGUoCiAgICBieXRlYyAxMiAvLyAweDc0NWYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0NTMtNDU1CiAgICAvLyBhc3NlcnQgc2VsZi5ib3hfdF9jaG9pY2VfdGFsbGllcy5jcmVhdGUoCiAgICAvLyAgICAgc2l6ZT1zZWxmLnBvbGxfbnVtX2Nob2ljZXMgKiBVSW50NjQoOCkKICAgIC8vICksICJDaG9pY2UgdGFsbGllcyBib3ggbXVzdCBub3QgYmUgcHJlc2VudCBpbiBib3ggdF8uIgogICAgc3dhcAogICAgYm94X2NyZWF0ZQogICAgYXNzZXJ0IC8vIENob2ljZSB0YWxsaWVzIGJveCBtdXN0IG5vdCBiZSBwcmVzZW50IGluIGJveCB0Xy4KCmZ1bmRfYXBwX21icl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDU3CiAgICAvLyBsb2dfdGVsZW1ldHJ5KFVJbnQ2NCgyKSkKICAgIGludGNfMiAvLyAyCiAgICBjYWxsc3ViIGxvZ190ZWxlbWV0cnkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90LmNhbGNfdGFsbHlfYm94X21icihudW1fY2hvaWNlczogdWludDY0KSAtPiB1aW50NjQ6CmNhbGNfdGFsbHlfYm94X21icjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxNTAtMTUyCiAgICAvLyAjIENhbGN1bGF0ZSB0aGUgQm94IHN0b3JhZ2UgbWluaW11bSBiYWxhbmNlIHJlcXVpcmVtZW50IGNvc3Qgb2YgdGhlIGNob2ljZSB0YWxsaWVzIGJveCAoOCBieXRlcyBwZXIgY2hvaWNlKQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjYWxjX3RhbGx5X2JveF9tYnIoc2VsZiwgbnVtX2Nob2ljZXM6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTU2CiAgICAvLyBVSW50NjQoMiksIG51bV9jaG9pY2VzICogVUludDY0KDgpCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgOCAvLyA4CiAgICAqCiAgICBpbnRjXzIgLy8gMgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE1NC0xNTcKICAgIC8vICMgQ2FsY3VsYXRlIEJveCBUIGZlZQogICAgLy8gYm94X3RfID0gY2FsY19zaW5nbGVfYm94X2ZlZSgKICAgIC8vICAgICBVSW50NjQoMiksIG51bV9jaG9pY2VzICogVUludDY0KDgpCiAgICAvLyApICAjIGZlZTogMC4wMDMzIEFMR08gKyAwLjAwMzIgQUxHTyBwZXIgY2hvaWNlCiAgICBzd2FwCiAgICBjYWxsc3ViIGNhbGNfc2luZ2xlX2JveF9mZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxNTktMTYwCiAgICAvLyAjIFJldHVybiB0aGUgbWluaW11bSBiYWxhbmNlIHJlcXVpcmVtZW50IHRvdGFsIGNvc3QKICAgIC8vIHJldHVybiBib3hfdF8KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90LnJlcXVlc3RfYm94X3N0b3JhZ2UobWJyX3BheTogdWludDY0KSAtPiB2b2lkOgpyZXF1ZXN0X2JveF9zdG9yYWdlOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQ2MC00NjIKICAgIC8vICMgRW5hYmxlIGFueSBlbGlnaWJsZSBhY2NvdW50IHRvIHJlcXVlc3QgYm94IHN0b3JhZ2UgYnkgcGF5aW5nIGEgTUJSIGNvc3QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHJlcXVlc3RfYm94X3N0b3JhZ2Uoc2VsZiwgbWJyX3BheTogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0NjUKICAgIC8vIFR4bi5zZW5kZXIgIT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICAhPQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQ2My00NjYKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgIT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIkludmFsaWQgc2VuZGVyIGFkZHJlc3MhIEFwcGxpY2F0aW9uIGNyZWF0b3IgYWRkcmVzcyBjYW4gbm90IHVzZSByZXF1ZXN0IGJveCBzdG9yYWdlIG1ldGhvZC4iCiAgICBhc3NlcnQgLy8gSW52YWxpZCBzZW5kZXIgYWRkcmVzcyEgQXBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzIGNhbiBub3QgdXNlIHJlcXVlc3QgYm94IHN0b3JhZ2UgbWV0aG9kLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQ2OQogICAgLy8gc2VsZi5wb2xsX2VsaWdpYmlsaXR5X3Jvb3QubGVuZ3RoID09IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInBvbGxfZWxpZ2liaWxpdHlfcm9vdCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX2VsaWdpYmlsaXR5X3Jvb3QgZXhpc3RzCiAgICBsZW4KICAgICEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0NjgtNDcwCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYucG9sbF9lbGlnaWJpbGl0eV9yb290Lmxlbmd0aCA9PSBVSW50NjQoMCkKICAgIC8vICksICJCb3ggc3RvcmFnZSBjYW4gbm90IGJlIHJlcXVlc3RlZCBmb3IgYSBwb2xsIHdpdGggYW4gZWxpZ2liaWxpdHkgTWVya2xlIHJvb3QgKHByb29mIHZvdGluZykuIgogICAgYXNzZXJ0IC8vIEJveCBzdG9yYWdlIGNhbiBub3QgYmUgcmVxdWVzdGVkIGZvciBhIHBvbGwgd2l0aCBhbiBlbGlnaWJpbGl0eSBNZXJrbGUgcm9vdCAocHJvb2Ygdm90aW5nKS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0NzQKICAgIC8vIHNlbGYucG9sbF9yZWdpc3RyYXRpb25fbW9kZSAhPSBVSW50NjQoUkVHSVNUUkFUSU9OX01PREVfUEFHRUQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAicG9sbF9yZWdpc3RyYXRpb25fbW9kZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX3JlZ2lzdHJhdGlvbl9tb2RlIGV4aXN0cwogICAgaW50Y18yIC8vIDIKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDcyLTQ3NQogICAgLy8gIyBOT1RFOiBBIHBhZ2VkIHBvbGwgc3RheXMgcGFnZWQgYWZ0ZXIgaXRzIHZvdGVyIHBhZ2VzIGFyZSBwdXJnZWQsIHBhZ2VkIHZvdGVycyBjYW4gbm90IGdldCBhIGJveCBhXyB2b3RlCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYucG9sbF9yZWdpc3RyYXRpb25fbW9kZSAhPSBVSW50NjQoUkVHSVNUUkFUSU9OX01PREVfUEFHRUQpCiAgICAvLyApLCAiQm94IHN0b3JhZ2UgY2FuIG5vdCBiZSByZXF1ZXN0ZWQgZm9yIGEgcG9sbCB3aXRoIHZvdGVyIHBhZ2VzIChwYWdlZCB2b3RpbmcpLiIKICAgIGFzc2VydCAvLyBCb3ggc3RvcmFnZSBjYW4gbm90IGJlIHJlcXVlc3RlZCBmb3IgYSBwb2xsIHdpdGggdm90ZXIgcGFnZXMgKHBhZ2VkIHZvdGluZykuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDc5CiAgICAvLyBtYnJfcGF5LnNlbmRlciA9PSBUeG4uc2VuZGVyIG9yIG1icl9wYXkuc2VuZGVyIG5vdCBpbiBzZWxmLmJveF9hX3ZvdGVyX2RhdGEKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICBkdXAKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBibnogcmVxdWVzdF9ib3hfc3RvcmFnZV9ib29sX3RydWVAMgogICAgYnl0ZWNfMSAvLyAweDYxCiAgICBmcmFtZV9kaWcgMAogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiByZXF1ZXN0X2JveF9zdG9yYWdlX2Jvb2xfZmFsc2VAMwoKcmVxdWVzdF9ib3hfc3RvcmFnZV9ib29sX3RydWVAMjoKICAgIGludGNfMSAvLyAxCiAgICBiIHJlcXVlc3RfYm94X3N0b3JhZ2VfYm9vbF9tZXJnZUA0CgpyZXF1ZXN0X2JveF9zdG9yYWdlX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCgpyZXF1ZXN0X2JveF9zdG9yYWdlX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0NzctNDgwCiAgICAvLyAjIFBheW1lbnQgc2VuZGVyIGJveCBpcyBvbmx5IHJlYWQgd2hlbiBhIGRpZmZlcmVudCBhY2NvdW50IHBheXMgZm9yIHRoZSB0cmFuc2FjdGlvbiBzZW5kZXIKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5zZW5kZXIgPT0gVHhuLnNlbmRlciBvciBtYnJfcGF5LnNlbmRlciBub3QgaW4gc2VsZi5ib3hfYV92b3Rlcl9kYXRhCiAgICAvLyApLCAiQm94IHN0b3JhZ2UgTUJSIHBheW1lbnQgc2VuZGVyIGFkZHJlc3MgbXVzdCBub3QgYmUgcHJlc2VudCBpbiBib3ggYV8uIgogICAgYXNzZXJ0IC8vIEJveCBzdG9yYWdlIE1CUiBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3Qgbm90IGJlIHByZXNlbnQgaW4gYm94IGFfLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQ4MwogICAgLy8gbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0ODItNDg0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgIkJveCBzdG9yYWdlIE1CUiBwYXltZW50IHJlY2lldmVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBhZGRyZXNzLiIKICAgIGFzc2VydCAvLyBCb3ggc3RvcmFnZSBNQlIgcGF5bWVudCByZWNpZXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0ODcKICAgIC8vIG1icl9wYXkuYW1vdW50ID49IFVJbnQ2NChCT1hfQV9NQlIpICAjIEJveCBhXyBmZWU6IDAuMDE2MSBBTEdPCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgaW50YyA0IC8vIDE2MTAwCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQ4Ni00ODgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5hbW91bnQgPj0gVUludDY0KEJPWF9BX01CUikgICMgQm94IGFfIGZlZTogMC4wMTYxIEFMR08KICAgIC8vICksICJCb3ggc3RvcmFnZSBNQlIgcGF5bWVudCBhbW91bnQgbXVzdCBiZSBlcXVhbCBvciBncmVhdGVyIHRoYW4gYm94IF9hIGZlZS4iCiAgICBhc3NlcnQgLy8gQm94IHN0b3JhZ2UgTUJSIHBheW1lbnQgYW1vdW50IG11c3QgYmUgZXF1YWwgb3IgZ3JlYXRlciB0aGFuIGJveCBfYSBmZWUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NDkxCiAgICAvLyBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8PSBzZWxmLnBvbGxfZW5kX2RhdGVfdW5peAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gInBvbGxfZW5kX2RhdGVfdW5peCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX2VuZF9kYXRlX3VuaXggZXhpc3RzCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjQ5MC00OTIKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPD0gc2VsZi5wb2xsX2VuZF9kYXRlX3VuaXgKICAgIC8vICksICJVbmFibGUgdG8gcmVxdWVzdCBib3ggc3RvcmFnZSBpZiB2b3RpbmcgcGVyaW9kIGlzIG92ZXIuIgogICAgYXNzZXJ0IC8vIFVuYWJsZSB0byByZXF1ZXN0IGJveCBzdG9yYWdlIGlmIHZvdGluZyBwZXJpb2QgaXMgb3Zlci4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0OTYKICAgIC8vIHNlbGYuYm94X2Ffdm90ZXJfZGF0YS5rZXlfcHJlZml4ICsgVHhuLnNlbmRlci5ieXRlcywgVUludDY0KDEpCiAgICBieXRlY18xIC8vIDB4NjEKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgaW50Y18xIC8vIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0OTQtNDk3CiAgICAvLyAjIENyZWF0ZSB6ZXJvIGZpbGxlZCB2b3RlciBkYXRhIGJveCAoVm90ZXJEYXRhIG5vdCB2b3RlZCksIGZhaWxzIGlmIGl0IGFscmVhZHkgZXhpc3RzCiAgICAvLyBhc3NlcnQgb3AuQm94LmNyZWF0ZSgKICAgIC8vICAgICBzZWxmLmJveF9hX3ZvdGVyX2RhdGEua2V5X3ByZWZpeCArIFR4bi5zZW5kZXIuYnl0ZXMsIFVJbnQ2NCgxKQogICAgLy8gKSwgIlRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIG11c3Qgbm90IGJlIHByZXNlbnQgaW4gYm94IGFfLiIKICAgIGJveF9jcmVhdGUKICAgIGFzc2VydCAvLyBUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBtdXN0IG5vdCBiZSBwcmVzZW50IGluIGJveCBhXy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo0OTgKICAgIC8vIHNlbGYucG9sbF9yZWdpc3RyYXRpb25fbW9kZSA9IFVJbnQ2NChSRUdJU1RSQVRJT05fTU9ERV9CT1hfQSkKICAgIGJ5dGVjXzMgLy8gInBvbGxfcmVnaXN0cmF0aW9uX21vZGUiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1MDAtNTAxCiAgICAvLyAjIEVtaXQgdm90ZXIgcmVnaXN0ZXJlZCBldmVudAogICAgLy8gYXJjNC5lbWl0KFZvdGVyUmVnaXN0ZXJlZChzZWxmLm5leHRfZXZlbnRfc2VxKCksIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSkpCiAgICBjYWxsc3ViIG5leHRfZXZlbnRfc2VxCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJ5dGVjIDIyIC8vIG1ldGhvZCAiVm90ZXJSZWdpc3RlcmVkKHVpbnQ2NCxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTAzLTUwNAogICAgLy8gIyBTZW5kZXIgYm94LCBwbHVzIHRoZSBwYXltZW50IHNlbmRlciBib3ggcmVhZCB3aGVuIHNvbWVvbmUgZWxzZSBwYXlzCiAgICAvLyBsb2dfdGVsZW1ldHJ5KFVJbnQ2NCgxKSArIFVJbnQ2NChtYnJfcGF5LnNlbmRlciAhPSBUeG4uc2VuZGVyKSkKICAgIGZyYW1lX2RpZyAwCiAgICB0eG4gU2VuZGVyCiAgICAhPQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGNhbGxzdWIgbG9nX3RlbGVtZXRyeQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbnRyYWN0Lk9wZW5CYWxsb3QubmV4dF9ldmVudF9zZXEoKSAtPiBieXRlczoKbmV4dF9ldmVudF9zZXE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTg3LTE4OQogICAgLy8gIyBJbmNyZW1lbnQgYW5kIHJldHVybiB0aGUgZXZlbnQgc2VxdWVuY2UgbnVtYmVyIG9mIHRoZSBuZXh0IEFSQy0yOCBldmVudCAoJ3RvdGFsX2V2ZW50cycgcmVhZCBvbmNlKQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBuZXh0X2V2ZW50X3NlcShzZWxmKSAtPiBhcmM0LlVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE5MAogICAgLy8gc2VxID0gc2VsZi50b3RhbF9ldmVudHMgKyBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNiAvLyAidG90YWxfZXZlbnRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2V2ZW50cyBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTkxCiAgICAvLyBzZWxmLnRvdGFsX2V2ZW50cyA9IHNlcQogICAgYnl0ZWMgMTYgLy8gInRvdGFsX2V2ZW50cyIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE5MgogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlcSkKICAgIGl0b2IKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90LnJlZ2lzdGVyX3ZvdGVycyh2b3RlcnM6IGJ5dGVzLCBtYnJfcGF5OiB1aW50NjQpIC0+IHZvaWQ6CnJlZ2lzdGVyX3ZvdGVyczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1MDctNTEzCiAgICAvLyAjIEVuYWJsZSBhcHBsaWNhdGlvbiBjcmVhdG9yIHRvIHJlZ2lzdGVyIGEgYmF0Y2ggb2Ygdm90ZXJzIGJ5IHBheWluZyB0aGVpciBib3ggc3RvcmFnZSBNQlIgaW4gYSBzaW5nbGUgcGF5bWVudAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgcmVnaXN0ZXJfdm90ZXJzKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgdm90ZXJzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LkFkZHJlc3NdLAogICAgLy8gICAgIG1icl9wYXk6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTE2CiAgICAvLyBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1MTQtNTE3CiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJVbmF1dGhvcml6ZWQgYWRkcmVzcyEgT25seSBhcHBsaWNhdGlvbiBjcmVhdG9yIGNhbiByZWdpc3RlciB2b3RlcnMuIgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBhZGRyZXNzISBPbmx5IGFwcGxpY2F0aW9uIGNyZWF0b3IgY2FuIHJlZ2lzdGVyIHZvdGVycy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1MjAKICAgIC8vIHNlbGYucG9sbF9yZWdpc3RyYXRpb25fbW9kZSAhPSBVSW50NjQoUkVHSVNUUkFUSU9OX01PREVfUEFHRUQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAicG9sbF9yZWdpc3RyYXRpb25fbW9kZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX3JlZ2lzdHJhdGlvbl9tb2RlIGV4aXN0cwogICAgaW50Y18yIC8vIDIKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTE5LTUyMQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnBvbGxfcmVnaXN0cmF0aW9uX21vZGUgIT0gVUludDY0KFJFR0lTVFJBVElPTl9NT0RFX1BBR0VEKQogICAgLy8gKSwgIlZvdGVycyBjYW4gbm90IGJlIHJlZ2lzdGVyZWQgaW50byBib3ggYV8gZm9yIGEgcG9sbCB3aXRoIHZvdGVyIHBhZ2VzIChwYWdlZCB2b3RpbmcpLiIKICAgIGFzc2VydCAvLyBWb3RlcnMgY2FuIG5vdCBiZSByZWdpc3RlcmVkIGludG8gYm94IGFfIGZvciBhIHBvbGwgd2l0aCB2b3RlciBwYWdlcyAocGFnZWQgdm90aW5nKS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1MjQKICAgIC8vIHNlbGYucG9sbF9lbGlnaWJpbGl0eV9yb290Lmxlbmd0aCA9PSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJwb2xsX2VsaWdpYmlsaXR5X3Jvb3QiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9lbGlnaWJpbGl0eV9yb290IGV4aXN0cwogICAgbGVuCiAgICAhCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTIzLTUyNQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnBvbGxfZWxpZ2liaWxpdHlfcm9vdC5sZW5ndGggPT0gVUludDY0KDApCiAgICAvLyApLCAiVm90ZXJzIGNhbiBub3QgYmUgcmVnaXN0ZXJlZCBpbnRvIGJveCBhXyBmb3IgYSBwb2xsIHdpdGggYW4gZWxpZ2liaWxpdHkgTWVya2xlIHJvb3QgKHByb29mIHZvdGluZykuIgogICAgYXNzZXJ0IC8vIFZvdGVycyBjYW4gbm90IGJlIHJlZ2lzdGVyZWQgaW50byBib3ggYV8gZm9yIGEgcG9sbCB3aXRoIGFuIGVsaWdpYmlsaXR5IE1lcmtsZSByb290IChwcm9vZiB2b3RpbmcpLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjUyOQogICAgLy8gdm90ZXJzLmxlbmd0aCA+IDAKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1MjctNTMwCiAgICAvLyAjIE5PVEU6IE51bWJlciBvZiB2b3RlcnMgaXMgYm91bmQgYnkgdGhlIGJveCByZWZlcmVuY2VzIGF2YWlsYWJsZSB0byB0aGUgZ3JvdXAgKGdyb3VwIHJlc291cmNlIHNoYXJpbmcpCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHZvdGVycy5sZW5ndGggPiAwCiAgICAvLyApLCAiVGhlIG51bWJlciBvZiBhZGRyZXNzZXMgcmVwcmVzZW50ZWQgYnkgdm90ZXJzIGFycmF5IG11c3QgYmUgZ3JlYXRlciB0aGFuIDAuIgogICAgYXNzZXJ0IC8vIFRoZSBudW1iZXIgb2YgYWRkcmVzc2VzIHJlcHJlc2VudGVkIGJ5IHZvdGVycyBhcnJheSBtdXN0IGJlIGdyZWF0ZXIgdGhhbiAwLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjUzMwogICAgLy8gbWJyX3BheS5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1MzItNTM0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkuc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJNQlIgcGF5bWVudCBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIE1CUiBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwcGxpY2F0aW9uIGNyZWF0b3IgYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1MzcKICAgIC8vIG1icl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTM2LTUzOAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBtYnJfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJNQlIgcGF5bWVudCByZWNpZXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgcmVjaWV2ZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTQxCiAgICAvLyBtYnJfcGF5LmFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1NDIKICAgIC8vID49IHZvdGVycy5sZW5ndGggKiBVSW50NjQoQk9YX0FfU1BPTlNPUkVEX01CUikgICMgQm94IGFfIGZlZTogMC4wMTY1IEFMR08gcGVyIHZvdGVyCiAgICBzd2FwCiAgICBwdXNoaW50IDE2NTAwIC8vIDE2NTAwCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTQxLTU0MgogICAgLy8gbWJyX3BheS5hbW91bnQKICAgIC8vID49IHZvdGVycy5sZW5ndGggKiBVSW50NjQoQk9YX0FfU1BPTlNPUkVEX01CUikgICMgQm94IGFfIGZlZTogMC4wMTY1IEFMR08gcGVyIHZvdGVyCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjU0MC01NDMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5hbW91bnQKICAgIC8vICAgICA+PSB2b3RlcnMubGVuZ3RoICogVUludDY0KEJPWF9BX1NQT05TT1JFRF9NQlIpICAjIEJveCBhXyBmZWU6IDAuMDE2NSBBTEdPIHBlciB2b3RlcgogICAgLy8gKSwgIk1CUiBwYXltZW50IGFtb3VudCBtdXN0IGJlIGVxdWFsIG9yIGdyZWF0ZXIgdGhhbiBib3ggYV8gZmVlIHRpbWVzIHRoZSBudW1iZXIgb2Ygdm90ZXJzLiIKICAgIGFzc2VydCAvLyBNQlIgcGF5bWVudCBhbW91bnQgbXVzdCBiZSBlcXVhbCBvciBncmVhdGVyIHRoYW4gYm94IGFfIGZlZSB0aW1lcyB0aGUgbnVtYmVyIG9mIHZvdGVycy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1NDYKICAgIC8vIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wIDw9IHNlbGYucG9sbF9lbmRfZGF0ZV91bml4CiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAicG9sbF9lbmRfZGF0ZV91bml4IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfZW5kX2RhdGVfdW5peCBleGlzdHMKICAgIDw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTQ1LTU0NwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8PSBzZWxmLnBvbGxfZW5kX2RhdGVfdW5peAogICAgLy8gKSwgIlVuYWJsZSB0byByZWdpc3RlciB2b3RlcnMgaWYgdm90aW5nIHBlcmlvZCBpcyBvdmVyLiIKICAgIGFzc2VydCAvLyBVbmFibGUgdG8gcmVnaXN0ZXIgdm90ZXJzIGlmIHZvdGluZyBwZXJpb2QgaXMgb3Zlci4KICAgIGludGNfMCAvLyAwCgpyZWdpc3Rlcl92b3RlcnNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjU0OS01NTIKICAgIC8vICMgSXRlcmF0ZSB0aHJvdWdoIHRoZSBkeW5hbWljIGFycmF5IG9mIHZvdGVyIGFkZHJlc3NlcyBhbmQgY3JlYXRlIGEgdm90ZXIgZGF0YSBib3ggZm9yIGVhY2gKICAgIC8vICMgTk9URTogU3BvbnNvcmVkIGJveGVzIGNhcnJ5IGEgc3BvbnNvciBieXRlLCBhIHZvdGVyIGRlbGV0aW5nIHRoZWlyIHNwb25zb3JlZCBib3ggcmVmdW5kcyB0aGUgY3JlYXRvcgogICAgLy8gIyBOT1RFOiBObyBWb3RlclJlZ2lzdGVyZWQgZXZlbnQgcGVyIHZvdGVyLCBhIGJhdGNoIHdvdWxkIGV4Y2VlZCB0aGUgMzIgbG9ncyAvIDFLQiBsb2cgbGltaXQgb2YgYSB0cmFuc2FjdGlvbgogICAgLy8gZm9yIHZvdGVyIGluIHZvdGVyczoKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMAogICAgPAogICAgYnogcmVnaXN0ZXJfdm90ZXJzX2FmdGVyX2ZvckA0CiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzMgLy8gMzIKICAgICoKICAgIGludGNfMyAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTU1CiAgICAvLyB2b3Rlci5uYXRpdmUgIT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgZHVwCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTUzLTU1NgogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgdm90ZXIubmF0aXZlICE9IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJWb3RlciBhZGRyZXNzIG11c3Qgbm90IG1hdGNoIGFwcGxpY2F0aW9uIGNyZWF0b3IgYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gVm90ZXIgYWRkcmVzcyBtdXN0IG5vdCBtYXRjaCBhcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTYwCiAgICAvLyBzZWxmLmJveF9hX3ZvdGVyX2RhdGEua2V5X3ByZWZpeCArIHZvdGVyLmJ5dGVzLAogICAgYnl0ZWNfMSAvLyAweDYxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1NjEKICAgIC8vIFVJbnQ2NChTUE9OU09SRURfVk9URVJfREFUQV9TSVpFKSwKICAgIGludGNfMiAvLyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTU4LTU2MgogICAgLy8gIyBDcmVhdGUgemVybyBmaWxsZWQgc3BvbnNvcmVkIHZvdGVyIGRhdGEgYm94IChWb3RlckRhdGEgbm90IHZvdGVkKSwgZmFpbHMgaWYgaXQgYWxyZWFkeSBleGlzdHMKICAgIC8vIGFzc2VydCBvcC5Cb3guY3JlYXRlKAogICAgLy8gICAgIHNlbGYuYm94X2Ffdm90ZXJfZGF0YS5rZXlfcHJlZml4ICsgdm90ZXIuYnl0ZXMsCiAgICAvLyAgICAgVUludDY0KFNQT05TT1JFRF9WT1RFUl9EQVRBX1NJWkUpLAogICAgLy8gKSwgIlZvdGVyIGFkZHJlc3MgbXVzdCBub3QgYmUgcHJlc2VudCBpbiBib3ggYV8uIgogICAgYm94X2NyZWF0ZQogICAgYXNzZXJ0IC8vIFZvdGVyIGFkZHJlc3MgbXVzdCBub3QgYmUgcHJlc2VudCBpbiBib3ggYV8uCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBiIHJlZ2lzdGVyX3ZvdGVyc19mb3JfaGVhZGVyQDEKCnJlZ2lzdGVyX3ZvdGVyc19hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1NjQKICAgIC8vIHNlbGYucG9sbF9yZWdpc3RyYXRpb25fbW9kZSA9IFVJbnQ2NChSRUdJU1RSQVRJT05fTU9ERV9CT1hfQSkKICAgIGJ5dGVjXzMgLy8gInBvbGxfcmVnaXN0cmF0aW9uX21vZGUiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1NjYKICAgIC8vIGxvZ190ZWxlbWV0cnkodm90ZXJzLmxlbmd0aCkKICAgIGZyYW1lX2RpZyAwCiAgICBjYWxsc3ViIGxvZ190ZWxlbWV0cnkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90LnN1Ym1pdF92b3RlKGNob2ljZTogYnl0ZXMpIC0+IHZvaWQ6CnN1Ym1pdF92b3RlOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjU2OS01NzEKICAgIC8vICMgRW5hYmxlIGFueSBlbGlnaWJsZSBhY2NvdW50IHRvIHN1Ym1pdCBhIHZvdGUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHN1Ym1pdF92b3RlKHNlbGYsIGNob2ljZTogYXJjNC5VSW50OCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjU3Mi01NzQKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyAjIFJlYWQgdm90ZXIgZGF0YSBib3ggb25jZSAoVm90ZXJEYXRhIGlzIHRoZSBmaXJzdCBieXRlIGNob2ljZSwgJzAnID0gbm90IHZvdGVkLCBzcG9uc29yZWQgYm94ZXMgYXJlIDIgYnl0ZXMpCiAgICAvLyB2b3Rlcl9rZXkgPSBzZWxmLmJveF9hX3ZvdGVyX2RhdGEua2V5X3ByZWZpeCArIFR4bi5zZW5kZXIuYnl0ZXMKICAgIGJ5dGVjXzEgLy8gMHg2MQogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTc1CiAgICAvLyB2b3Rlcl9kYXRhLCBleGlzdHMgPSBvcC5Cb3guZ2V0KHZvdGVyX2tleSkKICAgIGR1cAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjU3NgogICAgLy8gYXNzZXJ0IGV4aXN0cywgIlRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIG11c3QgYmUgcHJlc2VudCBpbiBib3ggYV8uIgogICAgYXNzZXJ0IC8vIFRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIG11c3QgYmUgcHJlc2VudCBpbiBib3ggYV8uCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTc5CiAgICAvLyBvcC5nZXRieXRlKHZvdGVyX2RhdGEsIDApID09IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGdldGJ5dGUKICAgICEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1NzgtNTgwCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG9wLmdldGJ5dGUodm90ZXJfZGF0YSwgMCkgPT0gVUludDY0KDApCiAgICAvLyApLCAiVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgYWxyZWFkeSBzdWJtaXR0ZWQgYSB2b3RlLiIKICAgIGFzc2VydCAvLyBUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBhbHJlYWR5IHN1Ym1pdHRlZCBhIHZvdGUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTkwLTU5MQogICAgLy8gIyBTZXQgYWNjb3VudCB2b3RlciBkYXRhIChyZXBsYWNlIGtlZXBzIHRoZSBzcG9uc29yIGJ5dGUgb2Ygc3BvbnNvcmVkIGJveGVzKQogICAgLy8gb3AuQm94LnJlcGxhY2Uodm90ZXJfa2V5LCAwLCBWb3RlckRhdGEoY2hvaWNlKS5ieXRlcykKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NTkzLTU5NAogICAgLy8gIyBVcGRhdGUgdm90ZSB0YWxseSAoY29zdCBpcyB0aGUgc2FtZSBmb3IgYW55IGNob2ljZSkKICAgIC8vIHNlbGYudGFsbHlfdm90ZShjaG9pY2UpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgdGFsbHlfdm90ZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjU5Ni01OTcKICAgIC8vICMgRW1pdCB2b3RlIGNhc3QgZXZlbnQKICAgIC8vIGFyYzQuZW1pdChWb3RlQ2FzdChzZWxmLm5leHRfZXZlbnRfc2VxKCksIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgY2hvaWNlKSkKICAgIGNhbGxzdWIgbmV4dF9ldmVudF9zZXEKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJ5dGVjIDE0IC8vIG1ldGhvZCAiVm90ZUNhc3QodWludDY0LGFkZHJlc3MsdWludDgpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo1OTkKICAgIC8vIGxvZ190ZWxlbWV0cnkoVUludDY0KDIpKQogICAgaW50Y18yIC8vIDIKICAgIGNhbGxzdWIgbG9nX3RlbGVtZXRyeQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbnRyYWN0Lk9wZW5CYWxsb3QudGFsbHlfdm90ZShjaG9pY2U6IGJ5dGVzKSAtPiB2b2lkOgp0YWxseV92b3RlOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE5NS0xOTcKICAgIC8vICMgVmFsaWRhdGUgdGhlIGNob2ljZSBhbmQgaW5jcmVtZW50IGl0cyB2b3RlIHRhbGx5ICh1aW50NjQgc2xvdCBvZiB0aGUgY2hvaWNlIGluIHRoZSB0YWxsaWVzIGJveCB1cGRhdGVkIGluIHBsYWNlKQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiB0YWxseV92b3RlKHNlbGYsIGNob2ljZTogYXJjNC5VSW50OCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjE5OC0xOTkKICAgIC8vICMgVm90ZXMgYXJlIG9ubHkgYWNjZXB0ZWQgb25jZSB0aGUgbGFiZWwgb2YgZXZlcnkgcG9sbCBjaG9pY2UgaXMgc3RvcmVkIGluIGJveCBzdG9yYWdlCiAgICAvLyBudW1fY2hvaWNlc19hZGRlZCA9IHNlbGYucG9sbF9udW1fY2hvaWNlc19hZGRlZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJwb2xsX251bV9jaG9pY2VzX2FkZGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX251bV9jaG9pY2VzX2FkZGVkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIwMQogICAgLy8gbnVtX2Nob2ljZXNfYWRkZWQgPT0gc2VsZi5wb2xsX251bV9jaG9pY2VzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAicG9sbF9udW1fY2hvaWNlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX251bV9jaG9pY2VzIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMDAtMjAyCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG51bV9jaG9pY2VzX2FkZGVkID09IHNlbGYucG9sbF9udW1fY2hvaWNlcwogICAgLy8gKSwgIlZvdGluZyBjYW4gbm90IHN0YXJ0IGJlZm9yZSBldmVyeSBwb2xsIGNob2ljZSBpcyBhZGRlZC4iCiAgICBhc3NlcnQgLy8gVm90aW5nIGNhbiBub3Qgc3RhcnQgYmVmb3JlIGV2ZXJ5IHBvbGwgY2hvaWNlIGlzIGFkZGVkLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIwNQogICAgLy8gY2hvaWNlLm5hdGl2ZSA+PSBVSW50NjQoMSkgYW5kIGNob2ljZS5uYXRpdmUgPD0gbnVtX2Nob2ljZXNfYWRkZWQKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgPj0KICAgIGJ6IHRhbGx5X3ZvdGVfYm9vbF9mYWxzZUAzCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIDw9CiAgICBieiB0YWxseV92b3RlX2Jvb2xfZmFsc2VAMwogICAgaW50Y18xIC8vIDEKICAgIGIgdGFsbHlfdm90ZV9ib29sX21lcmdlQDQKCnRhbGx5X3ZvdGVfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKCnRhbGx5X3ZvdGVfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIwNC0yMDYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgY2hvaWNlLm5hdGl2ZSA+PSBVSW50NjQoMSkgYW5kIGNob2ljZS5uYXRpdmUgPD0gbnVtX2Nob2ljZXNfYWRkZWQKICAgIC8vICksICJJbnZhbGlkIGNob2ljZS4gQ2FuIG9ubHkgc2VsZWN0IGEgY2hvaWNlIGJldHdlZW4gMSBhbmQgdGhlIG51bWJlciBvZiBwb2xsIGNob2ljZXMuIgogICAgYXNzZXJ0IC8vIEludmFsaWQgY2hvaWNlLiBDYW4gb25seSBzZWxlY3QgYSBjaG9pY2UgYmV0d2VlbiAxIGFuZCB0aGUgbnVtYmVyIG9mIHBvbGwgY2hvaWNlcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMDgKICAgIC8vIHRhbGx5X29mZnNldCA9IChjaG9pY2UubmF0aXZlIC0gVUludDY0KDEpKSAqIFVJbnQ2NCg4KQogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBwdXNoaW50IDggLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIxMgogICAgLy8gb3AuYnRvaShzZWxmLmJveF90X2Nob2ljZV90YWxsaWVzLmV4dHJhY3QodGFsbHlfb2Zmc2V0LCBVSW50NjQoOCkpKQogICAgYnl0ZWMgMTIgLy8gMHg3NDVmCiAgICBkaWcgMQogICAgcHVzaGludCA4IC8vIDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjEzCiAgICAvLyArIFVJbnQ2NCgxKQogICAgaW50Y18xIC8vIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToyMTItMjEzCiAgICAvLyBvcC5idG9pKHNlbGYuYm94X3RfY2hvaWNlX3RhbGxpZXMuZXh0cmFjdCh0YWxseV9vZmZzZXQsIFVJbnQ2NCg4KSkpCiAgICAvLyArIFVJbnQ2NCgxKQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIxMS0yMTQKICAgIC8vIG9wLml0b2IoCiAgICAvLyAgICAgb3AuYnRvaShzZWxmLmJveF90X2Nob2ljZV90YWxsaWVzLmV4dHJhY3QodGFsbHlfb2Zmc2V0LCBVSW50NjQoOCkpKQogICAgLy8gICAgICsgVUludDY0KDEpCiAgICAvLyApLAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjIwOQogICAgLy8gc2VsZi5ib3hfdF9jaG9pY2VfdGFsbGllcy5yZXBsYWNlKAogICAgYnl0ZWMgMTIgLy8gMHg3NDVmCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MjA5LTIxNQogICAgLy8gc2VsZi5ib3hfdF9jaG9pY2VfdGFsbGllcy5yZXBsYWNlKAogICAgLy8gICAgIHRhbGx5X29mZnNldCwKICAgIC8vICAgICBvcC5pdG9iKAogICAgLy8gICAgICAgICBvcC5idG9pKHNlbGYuYm94X3RfY2hvaWNlX3RhbGxpZXMuZXh0cmFjdCh0YWxseV9vZmZzZXQsIFVJbnQ2NCg4KSkpCiAgICAvLyAgICAgICAgICsgVUludDY0KDEpCiAgICAvLyAgICAgKSwKICAgIC8vICkKICAgIGNvdmVyIDIKICAgIGJveF9yZXBsYWNlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29udHJhY3QuT3BlbkJhbGxvdC5yZWdpc3Rlcl9hbmRfdm90ZShtYnJfcGF5OiB1aW50NjQsIGNob2ljZTogYnl0ZXMpIC0+IHZvaWQ6CnJlZ2lzdGVyX2FuZF92b3RlOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjYwMi02MDYKICAgIC8vICMgRW5hYmxlIGFueSBhY2NvdW50IHRvIHJlcXVlc3QgYm94IHN0b3JhZ2UgYW5kIHN1Ym1pdCB0aGVpciB2b3RlIGluIGEgc2luZ2xlIGFwcGxpY2F0aW9uIGNhbGwKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHJlZ2lzdGVyX2FuZF92b3RlKAogICAgLy8gICAgIHNlbGYsIG1icl9wYXk6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLCBjaG9pY2U6IGFyYzQuVUludDgKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjYwOQogICAgLy8gVHhuLnNlbmRlciAhPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NjA3LTYxMAogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciAhPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiSW52YWxpZCBzZW5kZXIgYWRkcmVzcyEgQXBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzIGNhbiBub3QgdXNlIHJlZ2lzdGVyIGFuZCB2b3RlIG1ldGhvZC4iCiAgICBhc3NlcnQgLy8gSW52YWxpZCBzZW5kZXIgYWRkcmVzcyEgQXBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzIGNhbiBub3QgdXNlIHJlZ2lzdGVyIGFuZCB2b3RlIG1ldGhvZC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2MTMKICAgIC8vIHNlbGYucG9sbF9lbGlnaWJpbGl0eV9yb290Lmxlbmd0aCA9PSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJwb2xsX2VsaWdpYmlsaXR5X3Jvb3QiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9lbGlnaWJpbGl0eV9yb290IGV4aXN0cwogICAgbGVuCiAgICAhCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NjEyLTYxNAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnBvbGxfZWxpZ2liaWxpdHlfcm9vdC5sZW5ndGggPT0gVUludDY0KDApCiAgICAvLyApLCAiQm94IHN0b3JhZ2UgY2FuIG5vdCBiZSByZXF1ZXN0ZWQgZm9yIGEgcG9sbCB3aXRoIGFuIGVsaWdpYmlsaXR5IE1lcmtsZSByb290IChwcm9vZiB2b3RpbmcpLiIKICAgIGFzc2VydCAvLyBCb3ggc3RvcmFnZSBjYW4gbm90IGJlIHJlcXVlc3RlZCBmb3IgYSBwb2xsIHdpdGggYW4gZWxpZ2liaWxpdHkgTWVya2xlIHJvb3QgKHByb29mIHZvdGluZykuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NjE4CiAgICAvLyBzZWxmLnBvbGxfcmVnaXN0cmF0aW9uX21vZGUgIT0gVUludDY0KFJFR0lTVFJBVElPTl9NT0RFX1BBR0VEKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInBvbGxfcmVnaXN0cmF0aW9uX21vZGUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9yZWdpc3RyYXRpb25fbW9kZSBleGlzdHMKICAgIGludGNfMiAvLyAyCiAgICAhPQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjYxNi02MTkKICAgIC8vICMgTk9URTogQSBwYWdlZCBwb2xsIHN0YXlzIHBhZ2VkIGFmdGVyIGl0cyB2b3RlciBwYWdlcyBhcmUgcHVyZ2VkLCBwYWdlZCB2b3RlcnMgY2FuIG5vdCBnZXQgYSBib3ggYV8gdm90ZQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnBvbGxfcmVnaXN0cmF0aW9uX21vZGUgIT0gVUludDY0KFJFR0lTVFJBVElPTl9NT0RFX1BBR0VEKQogICAgLy8gKSwgIkJveCBzdG9yYWdlIGNhbiBub3QgYmUgcmVxdWVzdGVkIGZvciBhIHBvbGwgd2l0aCB2b3RlciBwYWdlcyAocGFnZWQgdm90aW5nKS4iCiAgICBhc3NlcnQgLy8gQm94IHN0b3JhZ2UgY2FuIG5vdCBiZSByZXF1ZXN0ZWQgZm9yIGEgcG9sbCB3aXRoIHZvdGVyIHBhZ2VzIChwYWdlZCB2b3RpbmcpLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjYyMgogICAgLy8gbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2MjEtNjIzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgIkJveCBzdG9yYWdlIE1CUiBwYXltZW50IHJlY2lldmVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBhZGRyZXNzLiIKICAgIGFzc2VydCAvLyBCb3ggc3RvcmFnZSBNQlIgcGF5bWVudCByZWNpZXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2MjYKICAgIC8vIG1icl9wYXkuYW1vdW50ID49IFVJbnQ2NChCT1hfQV9NQlIpICAjIEJveCBhXyBmZWU6IDAuMDE2MSBBTEdPCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIEFtb3VudAogICAgaW50YyA0IC8vIDE2MTAwCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjYyNS02MjcKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5hbW91bnQgPj0gVUludDY0KEJPWF9BX01CUikgICMgQm94IGFfIGZlZTogMC4wMTYxIEFMR08KICAgIC8vICksICJCb3ggc3RvcmFnZSBNQlIgcGF5bWVudCBhbW91bnQgbXVzdCBiZSBlcXVhbCBvciBncmVhdGVyIHRoYW4gYm94IF9hIGZlZS4iCiAgICBhc3NlcnQgLy8gQm94IHN0b3JhZ2UgTUJSIHBheW1lbnQgYW1vdW50IG11c3QgYmUgZXF1YWwgb3IgZ3JlYXRlciB0aGFuIGJveCBfYSBmZWUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NjM0CiAgICAvLyBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8PSBzZWxmLnBvbGxfZW5kX2RhdGVfdW5peAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gInBvbGxfZW5kX2RhdGVfdW5peCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX2VuZF9kYXRlX3VuaXggZXhpc3RzCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjYzMy02MzUKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPD0gc2VsZi5wb2xsX2VuZF9kYXRlX3VuaXgKICAgIC8vICksICJVbmFibGUgdG8gcmVxdWVzdCBib3ggc3RvcmFnZSBpZiB2b3RpbmcgcGVyaW9kIGlzIG92ZXIuIgogICAgYXNzZXJ0IC8vIFVuYWJsZSB0byByZXF1ZXN0IGJveCBzdG9yYWdlIGlmIHZvdGluZyBwZXJpb2QgaXMgb3Zlci4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2MzctNjM4CiAgICAvLyAjIENyZWF0ZSBhY2NvdW50IHZvdGVyIGRhdGEgYWxyZWFkeSBtYXJrZWQgYXMgdm90ZWQsIGJveF9jcmVhdGUgZmFpbHMgaWYgaXQgYWxyZWFkeSBleGlzdHMgKG5vIHNlcGFyYXRlIHJlYWQpCiAgICAvLyB2b3Rlcl9rZXkgPSBzZWxmLmJveF9hX3ZvdGVyX2RhdGEua2V5X3ByZWZpeCArIFR4bi5zZW5kZXIuYnl0ZXMKICAgIGJ5dGVjXzEgLy8gMHg2MQogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NjM5LTY0MQogICAgLy8gYXNzZXJ0IG9wLkJveC5jcmVhdGUoCiAgICAvLyAgICAgdm90ZXJfa2V5LCBVSW50NjQoMSkKICAgIC8vICksICJUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBtdXN0IG5vdCBiZSBwcmVzZW50IGluIGJveCBhXy4iCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2NDAKICAgIC8vIHZvdGVyX2tleSwgVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjYzOS02NDEKICAgIC8vIGFzc2VydCBvcC5Cb3guY3JlYXRlKAogICAgLy8gICAgIHZvdGVyX2tleSwgVUludDY0KDEpCiAgICAvLyApLCAiVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBub3QgYmUgcHJlc2VudCBpbiBib3ggYV8uIgogICAgYm94X2NyZWF0ZQogICAgYXNzZXJ0IC8vIFRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIG11c3Qgbm90IGJlIHByZXNlbnQgaW4gYm94IGFfLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjY0MgogICAgLy8gb3AuQm94LnJlcGxhY2Uodm90ZXJfa2V5LCAwLCBWb3RlckRhdGEoY2hvaWNlKS5ieXRlcykKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NjQzCiAgICAvLyBzZWxmLnBvbGxfcmVnaXN0cmF0aW9uX21vZGUgPSBVSW50NjQoUkVHSVNUUkFUSU9OX01PREVfQk9YX0EpCiAgICBieXRlY18zIC8vICJwb2xsX3JlZ2lzdHJhdGlvbl9tb2RlIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NjQ1LTY0NgogICAgLy8gIyBVcGRhdGUgdm90ZSB0YWxseSAoY29zdCBpcyB0aGUgc2FtZSBmb3IgYW55IGNob2ljZSkKICAgIC8vIHNlbGYudGFsbHlfdm90ZShjaG9pY2UpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgdGFsbHlfdm90ZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjY0OC02NDkKICAgIC8vICMgRW1pdCB2b3RlciByZWdpc3RlcmVkIGFuZCB2b3RlIGNhc3QgZXZlbnRzCiAgICAvLyBhcmM0LmVtaXQoVm90ZXJSZWdpc3RlcmVkKHNlbGYubmV4dF9ldmVudF9zZXEoKSwgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpKSkKICAgIGNhbGxzdWIgbmV4dF9ldmVudF9zZXEKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYnl0ZWMgMjIgLy8gbWV0aG9kICJWb3RlclJlZ2lzdGVyZWQodWludDY0LGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2NTAKICAgIC8vIGFyYzQuZW1pdChWb3RlQ2FzdChzZWxmLm5leHRfZXZlbnRfc2VxKCksIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgY2hvaWNlKSkKICAgIGNhbGxzdWIgbmV4dF9ldmVudF9zZXEKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJ5dGVjIDE0IC8vIG1ldGhvZCAiVm90ZUNhc3QodWludDY0LGFkZHJlc3MsdWludDgpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2NTIKICAgIC8vIGxvZ190ZWxlbWV0cnkoVUludDY0KDIpKQogICAgaW50Y18yIC8vIDIKICAgIGNhbGxzdWIgbG9nX3RlbGVtZXRyeQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbnRyYWN0Lk9wZW5CYWxsb3QucmVnaXN0ZXJfcGFnZWRfdm90ZXJzKHZvdGVyczogYnl0ZXMsIG1icl9wYXk6IHVpbnQ2NCkgLT4gdm9pZDoKcmVnaXN0ZXJfcGFnZWRfdm90ZXJzOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjY1NS02NjEKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gcmVnaXN0ZXIgYW4gYWxsb3dsaXN0IG9mIHZvdGVycyBpbnRvIHZvdGVyIHBhZ2VzICgzMSB2b3RlciBzbG90cyBwZXIgcGFnZSBib3gpCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiByZWdpc3Rlcl9wYWdlZF92b3RlcnMoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICB2b3RlcnM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuQWRkcmVzc10sCiAgICAvLyAgICAgbWJyX3BheTogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24sCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIHB1c2hieXRlcyAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NjY0CiAgICAvLyBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2NjItNjY1CiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJVbmF1dGhvcml6ZWQgYWRkcmVzcyEgT25seSBhcHBsaWNhdGlvbiBjcmVhdG9yIGNhbiByZWdpc3RlciBwYWdlZCB2b3RlcnMuIgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBhZGRyZXNzISBPbmx5IGFwcGxpY2F0aW9uIGNyZWF0b3IgY2FuIHJlZ2lzdGVyIHBhZ2VkIHZvdGVycy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2NjgKICAgIC8vIHNlbGYucG9sbF9lbGlnaWJpbGl0eV9yb290Lmxlbmd0aCA9PSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJwb2xsX2VsaWdpYmlsaXR5X3Jvb3QiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9lbGlnaWJpbGl0eV9yb290IGV4aXN0cwogICAgbGVuCiAgICAhCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NjY3LTY2OQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnBvbGxfZWxpZ2liaWxpdHlfcm9vdC5sZW5ndGggPT0gVUludDY0KDApCiAgICAvLyApLCAiUGFnZWQgdm90ZXJzIGNhbiBub3QgYmUgcmVnaXN0ZXJlZCBmb3IgYSBwb2xsIHdpdGggYW4gZWxpZ2liaWxpdHkgTWVya2xlIHJvb3QgKHByb29mIHZvdGluZykuIgogICAgYXNzZXJ0IC8vIFBhZ2VkIHZvdGVycyBjYW4gbm90IGJlIHJlZ2lzdGVyZWQgZm9yIGEgcG9sbCB3aXRoIGFuIGVsaWdpYmlsaXR5IE1lcmtsZSByb290IChwcm9vZiB2b3RpbmcpLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjY3NAogICAgLy8gc2VsZi5wb2xsX3JlZ2lzdHJhdGlvbl9tb2RlICE9IFVJbnQ2NChSRUdJU1RSQVRJT05fTU9ERV9CT1hfQSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJwb2xsX3JlZ2lzdHJhdGlvbl9tb2RlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfcmVnaXN0cmF0aW9uX21vZGUgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgIT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2NzEtNjc1CiAgICAvLyAjIE5PVEU6IFJlZ2lzdHJhdGlvbiBtb2RlcyBhcmUgZXhjbHVzaXZlIGZvciBnb29kLCBubyBwYWdlZCB2b3RlciBjYW4gaG9sZCBhIGJveCBhXyAob3IgZ2V0IG9uZSBsYXRlciBvbikKICAgIC8vICMgICAgICAgd2l0aG91dCBhIGJveCByZWZlcmVuY2UgcGVyIHZvdGVyIChib3ggYV8gcm91dGVzIGNoZWNrIHRoZSBtb2RlIHRoZSBvdGhlciB3YXkgcm91bmQpCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYucG9sbF9yZWdpc3RyYXRpb25fbW9kZSAhPSBVSW50NjQoUkVHSVNUUkFUSU9OX01PREVfQk9YX0EpCiAgICAvLyApLCAiUGFnZWQgdm90ZXJzIGNhbiBub3QgYmUgcmVnaXN0ZXJlZCBmb3IgYSBwb2xsIHdpdGggdm90ZXJzIGluIGJveCBhXyAoYm94IHN0b3JhZ2Ugdm90aW5nKS4iCiAgICBhc3NlcnQgLy8gUGFnZWQgdm90ZXJzIGNhbiBub3QgYmUgcmVnaXN0ZXJlZCBmb3IgYSBwb2xsIHdpdGggdm90ZXJzIGluIGJveCBhXyAoYm94IHN0b3JhZ2Ugdm90aW5nKS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2NzgKICAgIC8vIHZvdGVycy5sZW5ndGggPiAwCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwbiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Njc3LTY3OQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICB2b3RlcnMubGVuZ3RoID4gMAogICAgLy8gKSwgIlRoZSBudW1iZXIgb2YgYWRkcmVzc2VzIHJlcHJlc2VudGVkIGJ5IHZvdGVycyBhcnJheSBtdXN0IGJlIGdyZWF0ZXIgdGhhbiAwLiIKICAgIGFzc2VydCAvLyBUaGUgbnVtYmVyIG9mIGFkZHJlc3NlcyByZXByZXNlbnRlZCBieSB2b3RlcnMgYXJyYXkgbXVzdCBiZSBncmVhdGVyIHRoYW4gMC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2ODMKICAgIC8vIHNlbGYudG90YWxfcGFnZWRfdm90ZXJzICsgdm90ZXJzLmxlbmd0aCArIFVJbnQ2NChWT1RFUl9QQUdFX1NMT1RTIC0gMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJ0b3RhbF9wYWdlZF92b3RlcnMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfcGFnZWRfdm90ZXJzIGV4aXN0cwogICAgKwogICAgcHVzaGludCAzMCAvLyAzMAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjY4NAogICAgLy8gKSAvLyBVSW50NjQoVk9URVJfUEFHRV9TTE9UUykKICAgIHB1c2hpbnQgMzEgLy8gMzEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2ODEtNjg0CiAgICAvLyAjIE51bWJlciBvZiB2b3RlciBwYWdlcyBuZWVkZWQgb25jZSB0aGUgdm90ZXJzIGFyZSBhcHBlbmRlZCB0byB0aGUgbGFzdCBzbG90IGluIHVzZQogICAgLy8gdG90YWxfcGFnZXMgPSAoCiAgICAvLyAgICAgc2VsZi50b3RhbF9wYWdlZF92b3RlcnMgKyB2b3RlcnMubGVuZ3RoICsgVUludDY0KFZPVEVSX1BBR0VfU0xPVFMgLSAxKQogICAgLy8gKSAvLyBVSW50NjQoVk9URVJfUEFHRV9TTE9UUykKICAgIC8KICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjY4NQogICAgLy8gYXNzZXJ0IHRvdGFsX3BhZ2VzIDw9IFVJbnQ2NCg2NV81MzUpLCAiVG90YWwgdm90ZXIgcGFnZXMgY2FuIG5vdCBleGNlZWQgNjU1MzUuIgogICAgaW50YyA2IC8vIDY1NTM1CiAgICA8PQogICAgYXNzZXJ0IC8vIFRvdGFsIHZvdGVyIHBhZ2VzIGNhbiBub3QgZXhjZWVkIDY1NTM1LgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjY4OAogICAgLy8gbWJyX3BheS5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2ODctNjg5CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkuc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJNQlIgcGF5bWVudCBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIE1CUiBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwcGxpY2F0aW9uIGNyZWF0b3IgYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2OTIKICAgIC8vIG1icl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NjkxLTY5MwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBtYnJfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJNQlIgcGF5bWVudCByZWNpZXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgcmVjaWV2ZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Njk1CiAgICAvLyBuZXdfcGFnZXMgPSB0b3RhbF9wYWdlcyAtIHNlbGYucG9sbF92b3Rlcl9wYWdlcwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInBvbGxfdm90ZXJfcGFnZXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF92b3Rlcl9wYWdlcyBleGlzdHMKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo2OTcKICAgIC8vIG1icl9wYXkuYW1vdW50ID49IG5ld19wYWdlcyAqIFVJbnQ2NChCT1hfUF9NQlIpCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgc3dhcAogICAgcHVzaGludCA0MTMzMDAgLy8gNDEzMzAwCiAgICAqCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjY5Ni02OTgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5hbW91bnQgPj0gbmV3X3BhZ2VzICogVUludDY0KEJPWF9QX01CUikKICAgIC8vICksICJNQlIgcGF5bWVudCBhbW91bnQgbXVzdCBiZSBlcXVhbCBvciBncmVhdGVyIHRoYW4gYm94IHBfIGZlZSB0aW1lcyB0aGUgbnVtYmVyIG9mIG5ldyBwYWdlcy4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgYW1vdW50IG11c3QgYmUgZXF1YWwgb3IgZ3JlYXRlciB0aGFuIGJveCBwXyBmZWUgdGltZXMgdGhlIG51bWJlciBvZiBuZXcgcGFnZXMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NzAxCiAgICAvLyBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8PSBzZWxmLnBvbGxfZW5kX2RhdGVfdW5peAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gInBvbGxfZW5kX2RhdGVfdW5peCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX2VuZF9kYXRlX3VuaXggZXhpc3RzCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjcwMC03MDIKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPD0gc2VsZi5wb2xsX2VuZF9kYXRlX3VuaXgKICAgIC8vICksICJVbmFibGUgdG8gcmVnaXN0ZXIgcGFnZWQgdm90ZXJzIGlmIHZvdGluZyBwZXJpb2QgaXMgb3Zlci4iCiAgICBhc3NlcnQgLy8gVW5hYmxlIHRvIHJlZ2lzdGVyIHBhZ2VkIHZvdGVycyBpZiB2b3RpbmcgcGVyaW9kIGlzIG92ZXIuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NzA0LTcwNwogICAgLy8gIyBXcml0ZSBldmVyeSB2b3RlciBhZGRyZXNzIGludG8gdGhlIG5leHQgZnJlZSBzbG90LCBjcmVhdGluZyBhIHplcm8gZmlsbGVkIHZvdGVyIHBhZ2Ugd2hlbiBhIHBhZ2Ugc3RhcnRzCiAgICAvLyAjIE5PVEU6IFZvdGVyIGFkZHJlc3NlcyBtdXN0IGJlIHN0cmljdGx5IGluY3JlYXNpbmcgYWNyb3NzIGV2ZXJ5IHJlZ2lzdHJhdGlvbiwgc28gYW4gYWRkcmVzcyBob2xkcyBhIHNpbmdsZQogICAgLy8gIyAgICAgICBzbG90IGFuZCB0aGUgc2xvdCBvZiBhIHZvdGVyIGlzIGl0cyBpbmRleCBpbiB0aGUgc29ydGVkIGFsbG93bGlzdCAoa2VwdCBhZnRlciB2b3RlciBwYWdlcyBhcmUgcHVyZ2VkKQogICAgLy8gZmlyc3RfcGFnZSA9IHNlbGYudG90YWxfcGFnZWRfdm90ZXJzIC8vIFVJbnQ2NChWT1RFUl9QQUdFX1NMT1RTKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gInRvdGFsX3BhZ2VkX3ZvdGVycyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9wYWdlZF92b3RlcnMgZXhpc3RzCiAgICBwdXNoaW50IDMxIC8vIDMxCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NzA4CiAgICAvLyBsYXN0X3ZvdGVyID0gc2VsZi5wb2xsX2xhc3RfcGFnZWRfdm90ZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNSAvLyAicG9sbF9sYXN0X3BhZ2VkX3ZvdGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfbGFzdF9wYWdlZF92b3RlciBleGlzdHMKICAgIGludGNfMCAvLyAwCgpyZWdpc3Rlcl9wYWdlZF92b3RlcnNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjcwOQogICAgLy8gZm9yIHZvdGVyIGluIHZvdGVyczoKICAgIGZyYW1lX2RpZyA4CiAgICBmcmFtZV9kaWcgNAogICAgPAogICAgYnogcmVnaXN0ZXJfcGFnZWRfdm90ZXJzX2FmdGVyX2ZvckA2CiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgOAogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBpbnRjXzMgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo3MTEKICAgIC8vIHZvdGVyLm5hdGl2ZSAhPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBkdXAKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgIT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo3MTAtNzEyCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHZvdGVyLm5hdGl2ZSAhPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiVm90ZXIgYWRkcmVzcyBtdXN0IG5vdCBtYXRjaCBhcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIFZvdGVyIGFkZHJlc3MgbXVzdCBub3QgbWF0Y2ggYXBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjcxNC03MTYKICAgIC8vIGFzc2VydCBCaWdVSW50LmZyb21fYnl0ZXModm90ZXIuYnl0ZXMpID4gQmlnVUludC5mcm9tX2J5dGVzKAogICAgLy8gICAgIGxhc3Rfdm90ZXIKICAgIC8vICksICJWb3RlciBhZGRyZXNzZXMgbXVzdCBiZSBzb3J0ZWQgaW4gc3RyaWN0bHkgaW5jcmVhc2luZyBvcmRlciBhbmQgcmVnaXN0ZXJlZCBvbmx5IG9uY2UuIgogICAgZnJhbWVfZGlnIDcKICAgIGI+CiAgICBhc3NlcnQgLy8gVm90ZXIgYWRkcmVzc2VzIG11c3QgYmUgc29ydGVkIGluIHN0cmljdGx5IGluY3JlYXNpbmcgb3JkZXIgYW5kIHJlZ2lzdGVyZWQgb25seSBvbmNlLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjcxOQogICAgLy8gc2xvdCA9IHNlbGYudG90YWxfcGFnZWRfdm90ZXJzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAidG90YWxfcGFnZWRfdm90ZXJzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9wYWdlZF92b3RlcnMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NzIwCiAgICAvLyBwYWdlX2tleSA9IHNlbGYudm90ZXJfcGFnZV9rZXkoc2xvdCAvLyBVSW50NjQoVk9URVJfUEFHRV9TTE9UUykpCiAgICBkdXAKICAgIHB1c2hpbnQgMzEgLy8gMzEKICAgIC8KICAgIGNhbGxzdWIgdm90ZXJfcGFnZV9rZXkKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjcyMQogICAgLy8gaWYgc2xvdCAlIFVJbnQ2NChWT1RFUl9QQUdFX1NMT1RTKSA9PSBVSW50NjQoMCk6CiAgICBwdXNoaW50IDMxIC8vIDMxCiAgICAlCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMwogICAgYm56IHJlZ2lzdGVyX3BhZ2VkX3ZvdGVyc19hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo3MjItNzI0CiAgICAvLyBhc3NlcnQgb3AuQm94LmNyZWF0ZSgKICAgIC8vICAgICBwYWdlX2tleSwgVUludDY0KFZPVEVSX1BBR0VfU0laRSkKICAgIC8vICksICJWb3RlciBwYWdlIG11c3Qgbm90IGJlIHByZXNlbnQgaW4gYm94IHBfLiIKICAgIGZyYW1lX2RpZyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NzIzCiAgICAvLyBwYWdlX2tleSwgVUludDY0KFZPVEVSX1BBR0VfU0laRSkKICAgIHB1c2hpbnQgMTAyMyAvLyAxMDIzCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NzIyLTcyNAogICAgLy8gYXNzZXJ0IG9wLkJveC5jcmVhdGUoCiAgICAvLyAgICAgcGFnZV9rZXksIFVJbnQ2NChWT1RFUl9QQUdFX1NJWkUpCiAgICAvLyApLCAiVm90ZXIgcGFnZSBtdXN0IG5vdCBiZSBwcmVzZW50IGluIGJveCBwXy4iCiAgICBib3hfY3JlYXRlCiAgICBhc3NlcnQgLy8gVm90ZXIgcGFnZSBtdXN0IG5vdCBiZSBwcmVzZW50IGluIGJveCBwXy4KCnJlZ2lzdGVyX3BhZ2VkX3ZvdGVyc19hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NzI4CiAgICAvLyAoc2xvdCAlIFVJbnQ2NChWT1RFUl9QQUdFX1NMT1RTKSkgKiBVSW50NjQoVk9URVJfU0xPVF9TSVpFKSwKICAgIGZyYW1lX2RpZyAzCiAgICBwdXNoaW50IDMzIC8vIDMzCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NzI2LTczMAogICAgLy8gb3AuQm94LnJlcGxhY2UoCiAgICAvLyAgICAgcGFnZV9rZXksCiAgICAvLyAgICAgKHNsb3QgJSBVSW50NjQoVk9URVJfUEFHRV9TTE9UUykpICogVUludDY0KFZPVEVSX1NMT1RfU0laRSksCiAgICAvLyAgICAgdm90ZXIuYnl0ZXMsCiAgICAvLyApCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgY292ZXIgMwogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo3MzEKICAgIC8vIHNlbGYudG90YWxfcGFnZWRfdm90ZXJzID0gc2xvdCArIFVJbnQ2NCgxKQogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyA2IC8vICJ0b3RhbF9wYWdlZF92b3RlcnMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgZnJhbWVfZGlnIDgKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDgKICAgIGZyYW1lX2J1cnkgNwogICAgYiByZWdpc3Rlcl9wYWdlZF92b3RlcnNfZm9yX2hlYWRlckAxCgpyZWdpc3Rlcl9wYWdlZF92b3RlcnNfYWZ0ZXJfZm9yQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NzMzCiAgICAvLyBzZWxmLnBvbGxfbGFzdF9wYWdlZF92b3RlciA9IGxhc3Rfdm90ZXIKICAgIGJ5dGVjIDE1IC8vICJwb2xsX2xhc3RfcGFnZWRfdm90ZXIiCiAgICBmcmFtZV9kaWcgNwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo3MzQKICAgIC8vIHNlbGYucG9sbF92b3Rlcl9wYWdlcyA9IHRvdGFsX3BhZ2VzCiAgICBieXRlY18wIC8vICJwb2xsX3ZvdGVyX3BhZ2VzIgogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgY292ZXIgMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo3MzUKICAgIC8vIHNlbGYucG9sbF9yZWdpc3RyYXRpb25fbW9kZSA9IFVJbnQ2NChSRUdJU1RSQVRJT05fTU9ERV9QQUdFRCkKICAgIGJ5dGVjXzMgLy8gInBvbGxfcmVnaXN0cmF0aW9uX21vZGUiCiAgICBpbnRjXzIgLy8gMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo3MzctNzM4CiAgICAvLyAjIEV2ZXJ5IHZvdGVyIHBhZ2Ugd3JpdHRlbiB0bywgZnJvbSB0aGUgcGFnZSBvZiB0aGUgZmlyc3QgZnJlZSBzbG90IHVwIHRvIHRoZSBsYXN0IHBhZ2UKICAgIC8vIGxvZ190ZWxlbWV0cnkodG90YWxfcGFnZXMgLSBmaXJzdF9wYWdlKQogICAgZnJhbWVfZGlnIDYKICAgIC0KICAgIGNhbGxzdWIgbG9nX3RlbGVtZXRyeQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbnRyYWN0Lk9wZW5CYWxsb3Qudm90ZXJfcGFnZV9rZXkocGFnZTogdWludDY0KSAtPiBieXRlczoKdm90ZXJfcGFnZV9rZXk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTY4LTE3MAogICAgLy8gIyBSZXR1cm4gdGhlIHZvdGVyIHBhZ2UgYm94IGtleSBmb3IgZ2l2ZW4gcGFnZSBpbmRleCAoJ3BfJyArIDIgYnl0ZSBwYWdlIGluZGV4KQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiB2b3Rlcl9wYWdlX2tleShzZWxmLCBwYWdlOiBVSW50NjQpIC0+IEJ5dGVzOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTcxCiAgICAvLyByZXR1cm4gQnl0ZXMoYiJwXyIpICsgb3AuZXh0cmFjdChvcC5pdG9iKHBhZ2UpLCA2LCAyKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcHVzaGJ5dGVzIDB4NzA1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29udHJhY3QuT3BlbkJhbGxvdC5zdWJtaXRfcGFnZWRfdm90ZShjaG9pY2U6IGJ5dGVzLCBzbG90OiB1aW50NjQpIC0+IHZvaWQ6CnN1Ym1pdF9wYWdlZF92b3RlOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojc0MS03NDMKICAgIC8vICMgRW5hYmxlIGFueSByZWdpc3RlcmVkIHBhZ2VkIHZvdGVyIHRvIHN1Ym1pdCBhIHZvdGUgdGhyb3VnaCB0aGVpciBvbmx5IHZvdGVyIHNsb3QgKHNpbmdsZSBwYWdlIGJveCByZWZlcmVuY2UpCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzdWJtaXRfcGFnZWRfdm90ZShzZWxmLCBjaG9pY2U6IGFyYzQuVUludDgsIHNsb3Q6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojc0NgogICAgLy8gc2xvdCA8IHNlbGYudG90YWxfcGFnZWRfdm90ZXJzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAidG90YWxfcGFnZWRfdm90ZXJzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3BhZ2VkX3ZvdGVycyBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojc0NC03NDcKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNsb3QgPCBzZWxmLnRvdGFsX3BhZ2VkX3ZvdGVycwogICAgLy8gKSwgIlZvdGVyIHNsb3QgbXVzdCBiZSByZWdpc3RlcmVkLiIKICAgIGFzc2VydCAvLyBWb3RlciBzbG90IG11c3QgYmUgcmVnaXN0ZXJlZC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo3NDkKICAgIC8vIHBhZ2Vfa2V5ID0gc2VsZi52b3Rlcl9wYWdlX2tleShzbG90IC8vIFVJbnQ2NChWT1RFUl9QQUdFX1NMT1RTKSkKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAzMSAvLyAzMQogICAgLwogICAgY2FsbHN1YiB2b3Rlcl9wYWdlX2tleQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojc1MAogICAgLy8gc2xvdF9vZmZzZXQgPSAoc2xvdCAlIFVJbnQ2NChWT1RFUl9QQUdFX1NMT1RTKSkgKiBVSW50NjQoVk9URVJfU0xPVF9TSVpFKQogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDMxIC8vIDMxCiAgICAlCiAgICBwdXNoaW50IDMzIC8vIDMzCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NzUxCiAgICAvLyB2b3Rlcl9zbG90ID0gb3AuQm94LmV4dHJhY3QocGFnZV9rZXksIHNsb3Rfb2Zmc2V0LCBVSW50NjQoVk9URVJfU0xPVF9TSVpFKSkKICAgIGR1cDIKICAgIHB1c2hpbnQgMzMgLy8gMzMKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NzU0CiAgICAvLyBvcC5leHRyYWN0KHZvdGVyX3Nsb3QsIDAsIDMyKSA9PSBUeG4uc2VuZGVyLmJ5dGVzCiAgICBkdXAKICAgIGV4dHJhY3QgMCAzMgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo3NTMtNzU1CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG9wLmV4dHJhY3Qodm90ZXJfc2xvdCwgMCwgMzIpID09IFR4bi5zZW5kZXIuYnl0ZXMKICAgIC8vICksICJUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIHRoZSBhZGRyZXNzIG9mIHRoZSB2b3RlciBzbG90LiIKICAgIGFzc2VydCAvLyBUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIHRoZSBhZGRyZXNzIG9mIHRoZSB2b3RlciBzbG90LgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojc1NwogICAgLy8gYXNzZXJ0IG9wLmV4dHJhY3Qodm90ZXJfc2xvdCwgMzIsIDEpID09IFZvdGVyRGF0YSgKICAgIGV4dHJhY3QgMzIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojc1OAogICAgLy8gYXJjNC5VSW50OCgwKQogICAgcHVzaGJ5dGVzIDB4MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo3NTctNzU5CiAgICAvLyBhc3NlcnQgb3AuZXh0cmFjdCh2b3Rlcl9zbG90LCAzMiwgMSkgPT0gVm90ZXJEYXRhKAogICAgLy8gICAgIGFyYzQuVUludDgoMCkKICAgIC8vICkuYnl0ZXMsICJUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBhbHJlYWR5IHN1Ym1pdHRlZCBhIHZvdGUuIgogICAgPT0KICAgIGFzc2VydCAvLyBUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBhbHJlYWR5IHN1Ym1pdHRlZCBhIHZvdGUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6NzY5LTc3MAogICAgLy8gIyBTZXQgdm90ZXIgc2xvdCBkYXRhCiAgICAvLyBvcC5Cb3gucmVwbGFjZShwYWdlX2tleSwgc2xvdF9vZmZzZXQgKyBVSW50NjQoMzIpLCBWb3RlckRhdGEoY2hvaWNlKS5ieXRlcykKICAgIGludGNfMyAvLyAzMgogICAgKwogICAgZnJhbWVfZGlnIC0yCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojc3Mi03NzMKICAgIC8vICMgVXBkYXRlIHZvdGUgdGFsbHkgKGNvc3QgaXMgdGhlIHNhbWUgZm9yIGFueSBjaG9pY2UpCiAgICAvLyBzZWxmLnRhbGx5X3ZvdGUoY2hvaWNlKQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIHRhbGx5X3ZvdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo3NzUtNzc2CiAgICAvLyAjIEVtaXQgdm90ZSBjYXN0IGV2ZW50CiAgICAvLyBhcmM0LmVtaXQoVm90ZUNhc3Qoc2VsZi5uZXh0X2V2ZW50X3NlcSgpLCBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIGNob2ljZSkpCiAgICBjYWxsc3ViIG5leHRfZXZlbnRfc2VxCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBieXRlYyAxNCAvLyBtZXRob2QgIlZvdGVDYXN0KHVpbnQ2NCxhZGRyZXNzLHVpbnQ4KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Nzc4CiAgICAvLyBsb2dfdGVsZW1ldHJ5KFVJbnQ2NCgyKSkKICAgIGludGNfMiAvLyAyCiAgICBjYWxsc3ViIGxvZ190ZWxlbWV0cnkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90LnB1cmdlX3ZvdGVyX3BhZ2VzKG51bV9wYWdlczogdWludDY0KSAtPiB2b2lkOgpwdXJnZV92b3Rlcl9wYWdlczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo3ODEtNzgzCiAgICAvLyAjIEVuYWJsZSBhcHBsaWNhdGlvbiBjcmVhdG9yIHRvIHB1cmdlIHZvdGVyIHBhZ2VzIGZyb20gdGhlIGxhc3QgcGFnZSBkb3duLCBlYWNoIHBhZ2UgZnJlZXMgdXAgdG8gMzEgdm90ZXIgc2xvdHMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHB1cmdlX3ZvdGVyX3BhZ2VzKHNlbGYsIG51bV9wYWdlczogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojc4NgogICAgLy8gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Nzg0LTc4NwogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiVW5hdXRob3JpemVkIGFkZHJlc3MhIE9ubHkgYXBwbGljYXRpb24gY3JlYXRvciBjYW4gcHVyZ2Ugdm90ZXIgcGFnZXMuIgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBhZGRyZXNzISBPbmx5IGFwcGxpY2F0aW9uIGNyZWF0b3IgY2FuIHB1cmdlIHZvdGVyIHBhZ2VzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojc5NAogICAgLy8gbnVtX3BhZ2VzID4gMCBhbmQgbnVtX3BhZ2VzIDw9IHNlbGYucG9sbF92b3Rlcl9wYWdlcwogICAgZnJhbWVfZGlnIC0xCiAgICBieiBwdXJnZV92b3Rlcl9wYWdlc19ib29sX2ZhbHNlQDMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJwb2xsX3ZvdGVyX3BhZ2VzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfdm90ZXJfcGFnZXMgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgID49CiAgICBieiBwdXJnZV92b3Rlcl9wYWdlc19ib29sX2ZhbHNlQDMKICAgIGludGNfMSAvLyAxCiAgICBiIHB1cmdlX3ZvdGVyX3BhZ2VzX2Jvb2xfbWVyZ2VANAoKcHVyZ2Vfdm90ZXJfcGFnZXNfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKCnB1cmdlX3ZvdGVyX3BhZ2VzX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo3OTMtNzk1CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG51bV9wYWdlcyA+IDAgYW5kIG51bV9wYWdlcyA8PSBzZWxmLnBvbGxfdm90ZXJfcGFnZXMKICAgIC8vICksICJOdW1iZXIgb2Ygdm90ZXIgcGFnZXMgdG8gcHVyZ2UgbXVzdCBiZSBncmVhdGVyIHRoYW4gMCBhbmQgY2FuIG5vdCBleGNlZWQgdGhlIHZvdGVyIHBhZ2VzIGluIHVzZS4iCiAgICBhc3NlcnQgLy8gTnVtYmVyIG9mIHZvdGVyIHBhZ2VzIHRvIHB1cmdlIG11c3QgYmUgZ3JlYXRlciB0aGFuIDAgYW5kIGNhbiBub3QgZXhjZWVkIHRoZSB2b3RlciBwYWdlcyBpbiB1c2UuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Nzk3LTc5OAogICAgLy8gIyBEZWxldGUgdm90ZXIgcGFnZSBib3hlcyBmcm9tIHRoZSBsYXN0IHBhZ2UgZG93bgogICAgLy8gZm9yIHBhZ2UgaW4gdXJhbmdlKHNlbGYucG9sbF92b3Rlcl9wYWdlcyAtIG51bV9wYWdlcywgc2VsZi5wb2xsX3ZvdGVyX3BhZ2VzKToKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJwb2xsX3ZvdGVyX3BhZ2VzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF92b3Rlcl9wYWdlcyBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJwb2xsX3ZvdGVyX3BhZ2VzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfdm90ZXJfcGFnZXMgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIC0KICAgIGZyYW1lX2J1cnkgMQoKcHVyZ2Vfdm90ZXJfcGFnZXNfZm9yX2hlYWRlckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojc5Ny03OTgKICAgIC8vICMgRGVsZXRlIHZvdGVyIHBhZ2UgYm94ZXMgZnJvbSB0aGUgbGFzdCBwYWdlIGRvd24KICAgIC8vIGZvciBwYWdlIGluIHVyYW5nZShzZWxmLnBvbGxfdm90ZXJfcGFnZXMgLSBudW1fcGFnZXMsIHNlbGYucG9sbF92b3Rlcl9wYWdlcyk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IHB1cmdlX3ZvdGVyX3BhZ2VzX2FmdGVyX2ZvckA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODAwCiAgICAvLyBzZWxmLnZvdGVyX3BhZ2Vfa2V5KHBhZ2UpCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjYWxsc3ViIHZvdGVyX3BhZ2Vfa2V5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6Nzk5LTgwMQogICAgLy8gYXNzZXJ0IG9wLkJveC5kZWxldGUoCiAgICAvLyAgICAgc2VsZi52b3Rlcl9wYWdlX2tleShwYWdlKQogICAgLy8gKSwgIlZvdGVyIHBhZ2UgbXVzdCBiZSBwcmVzZW50IGluIGJveCBwXy4iCiAgICBib3hfZGVsCiAgICBhc3NlcnQgLy8gVm90ZXIgcGFnZSBtdXN0IGJlIHByZXNlbnQgaW4gYm94IHBfLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojc5Ny03OTgKICAgIC8vICMgRGVsZXRlIHZvdGVyIHBhZ2UgYm94ZXMgZnJvbSB0aGUgbGFzdCBwYWdlIGRvd24KICAgIC8vIGZvciBwYWdlIGluIHVyYW5nZShzZWxmLnBvbGxfdm90ZXJfcGFnZXMgLSBudW1fcGFnZXMsIHNlbGYucG9sbF92b3Rlcl9wYWdlcyk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBiIHB1cmdlX3ZvdGVyX3BhZ2VzX2Zvcl9oZWFkZXJANQoKcHVyZ2Vfdm90ZXJfcGFnZXNfYWZ0ZXJfZm9yQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODAzCiAgICAvLyBzZWxmLnBvbGxfdm90ZXJfcGFnZXMgLT0gbnVtX3BhZ2VzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAicG9sbF92b3Rlcl9wYWdlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX3ZvdGVyX3BhZ2VzIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICBieXRlY18wIC8vICJwb2xsX3ZvdGVyX3BhZ2VzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4MDQKICAgIC8vIGlmIHNlbGYudG90YWxfcGFnZWRfdm90ZXJzID4gc2VsZi5wb2xsX3ZvdGVyX3BhZ2VzICogVUludDY0KFZPVEVSX1BBR0VfU0xPVFMpOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gInRvdGFsX3BhZ2VkX3ZvdGVycyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9wYWdlZF92b3RlcnMgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAicG9sbF92b3Rlcl9wYWdlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX3ZvdGVyX3BhZ2VzIGV4aXN0cwogICAgcHVzaGludCAzMSAvLyAzMQogICAgKgogICAgPgogICAgYnogcHVyZ2Vfdm90ZXJfcGFnZXNfYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjgwNQogICAgLy8gc2VsZi50b3RhbF9wYWdlZF92b3RlcnMgPSBzZWxmLnBvbGxfdm90ZXJfcGFnZXMgKiBVSW50NjQoVk9URVJfUEFHRV9TTE9UUykKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJwb2xsX3ZvdGVyX3BhZ2VzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfdm90ZXJfcGFnZXMgZXhpc3RzCiAgICBwdXNoaW50IDMxIC8vIDMxCiAgICAqCiAgICBieXRlYyA2IC8vICJ0b3RhbF9wYWdlZF92b3RlcnMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAoKcHVyZ2Vfdm90ZXJfcGFnZXNfYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4MDcKICAgIC8vIGxvZ190ZWxlbWV0cnkobnVtX3BhZ2VzKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGxvZ190ZWxlbWV0cnkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90LmFsbG9jYXRlX251bGxpZmllcl9wYWdlcyhudW1fcGFnZXM6IHVpbnQ2NCwgbWJyX3BheTogdWludDY0KSAtPiB2b2lkOgphbGxvY2F0ZV9udWxsaWZpZXJfcGFnZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODEwLTgxNAogICAgLy8gIyBFbmFibGUgYXBwbGljYXRpb24gY3JlYXRvciB0byBhbGxvY2F0ZSBudWxsaWZpZXIgYml0bWFwIHBhZ2VzIGZvciBwcm9vZiB2b3RpbmcgYnkgcGF5aW5nIHRoZWlyIGJveCBzdG9yYWdlIE1CUgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgYWxsb2NhdGVfbnVsbGlmaWVyX3BhZ2VzKAogICAgLy8gICAgIHNlbGYsIG51bV9wYWdlczogVUludDY0LCBtYnJfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbgogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjgxNwogICAgLy8gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODE1LTgxOAogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiVW5hdXRob3JpemVkIGFkZHJlc3MhIE9ubHkgYXBwbGljYXRpb24gY3JlYXRvciBjYW4gYWxsb2NhdGUgbnVsbGlmaWVyIHBhZ2VzLiIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQgYWRkcmVzcyEgT25seSBhcHBsaWNhdGlvbiBjcmVhdG9yIGNhbiBhbGxvY2F0ZSBudWxsaWZpZXIgcGFnZXMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODIxCiAgICAvLyBzZWxmLnBvbGxfZWxpZ2liaWxpdHlfcm9vdC5sZW5ndGggPT0gVUludDY0KDMyKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInBvbGxfZWxpZ2liaWxpdHlfcm9vdCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX2VsaWdpYmlsaXR5X3Jvb3QgZXhpc3RzCiAgICBsZW4KICAgIGludGNfMyAvLyAzMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4MjAtODIyCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYucG9sbF9lbGlnaWJpbGl0eV9yb290Lmxlbmd0aCA9PSBVSW50NjQoMzIpCiAgICAvLyApLCAiTnVsbGlmaWVyIHBhZ2VzIGNhbiBvbmx5IGJlIGFsbG9jYXRlZCBmb3IgYSBwb2xsIHdpdGggYW4gZWxpZ2liaWxpdHkgTWVya2xlIHJvb3QgKHByb29mIHZvdGluZykuIgogICAgYXNzZXJ0IC8vIE51bGxpZmllciBwYWdlcyBjYW4gb25seSBiZSBhbGxvY2F0ZWQgZm9yIGEgcG9sbCB3aXRoIGFuIGVsaWdpYmlsaXR5IE1lcmtsZSByb290IChwcm9vZiB2b3RpbmcpLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjgyNQogICAgLy8gbnVtX3BhZ2VzID4gMCBhbmQgc2VsZi5wb2xsX251bGxpZmllcl9wYWdlcyArIG51bV9wYWdlcyA8PSBVSW50NjQoNjVfNTM1KQogICAgZnJhbWVfZGlnIC0yCiAgICBieiBhbGxvY2F0ZV9udWxsaWZpZXJfcGFnZXNfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicG9sbF9udWxsaWZpZXJfcGFnZXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9udWxsaWZpZXJfcGFnZXMgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIGludGMgNiAvLyA2NTUzNQogICAgPD0KICAgIGJ6IGFsbG9jYXRlX251bGxpZmllcl9wYWdlc19ib29sX2ZhbHNlQDMKICAgIGludGNfMSAvLyAxCiAgICBiIGFsbG9jYXRlX251bGxpZmllcl9wYWdlc19ib29sX21lcmdlQDQKCmFsbG9jYXRlX251bGxpZmllcl9wYWdlc19ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzAgLy8gMAoKYWxsb2NhdGVfbnVsbGlmaWVyX3BhZ2VzX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4MjQtODI2CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG51bV9wYWdlcyA+IDAgYW5kIHNlbGYucG9sbF9udWxsaWZpZXJfcGFnZXMgKyBudW1fcGFnZXMgPD0gVUludDY0KDY1XzUzNSkKICAgIC8vICksICJOdW1iZXIgb2YgbnVsbGlmaWVyIHBhZ2VzIG11c3QgYmUgZ3JlYXRlciB0aGFuIDAgYW5kIHRoZSB0b3RhbCBjYW4gbm90IGV4Y2VlZCA2NTUzNS4iCiAgICBhc3NlcnQgLy8gTnVtYmVyIG9mIG51bGxpZmllciBwYWdlcyBtdXN0IGJlIGdyZWF0ZXIgdGhhbiAwIGFuZCB0aGUgdG90YWwgY2FuIG5vdCBleGNlZWQgNjU1MzUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODI5CiAgICAvLyBtYnJfcGF5LnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjgyOC04MzAKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIk1CUiBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwcGxpY2F0aW9uIGNyZWF0b3IgYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgc2VuZGVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjgzMwogICAgLy8gbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4MzItODM0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgIk1CUiBwYXltZW50IHJlY2lldmVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBhZGRyZXNzLiIKICAgIGFzc2VydCAvLyBNQlIgcGF5bWVudCByZWNpZXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4MzcKICAgIC8vIG1icl9wYXkuYW1vdW50ID49IG51bV9wYWdlcyAqIFVJbnQ2NChCT1hfTl9NQlIpICAjIEJveCBuXyBmZWU6IDAuNDEzNyBBTEdPIHBlciBwYWdlCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDQxMzcwMCAvLyA0MTM3MDAKICAgICoKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODM2LTgzOAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBtYnJfcGF5LmFtb3VudCA+PSBudW1fcGFnZXMgKiBVSW50NjQoQk9YX05fTUJSKSAgIyBCb3ggbl8gZmVlOiAwLjQxMzcgQUxHTyBwZXIgcGFnZQogICAgLy8gKSwgIk1CUiBwYXltZW50IGFtb3VudCBtdXN0IGJlIGVxdWFsIG9yIGdyZWF0ZXIgdGhhbiBib3ggbl8gZmVlIHRpbWVzIHRoZSBudW1iZXIgb2YgcGFnZXMuIgogICAgYXNzZXJ0IC8vIE1CUiBwYXltZW50IGFtb3VudCBtdXN0IGJlIGVxdWFsIG9yIGdyZWF0ZXIgdGhhbiBib3ggbl8gZmVlIHRpbWVzIHRoZSBudW1iZXIgb2YgcGFnZXMuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODQwLTg0MQogICAgLy8gIyBDcmVhdGUgemVybyBmaWxsZWQgbnVsbGlmaWVyIGJpdG1hcCBwYWdlcyAoYSB6ZXJvIGJpdCBtZWFucyB0aGUgbGVhZiBpbmRleCBoYXMgbm90IHZvdGVkIHlldCkKICAgIC8vIGZvciBwYWdlIGluIHVyYW5nZShzZWxmLnBvbGxfbnVsbGlmaWVyX3BhZ2VzLCBzZWxmLnBvbGxfbnVsbGlmaWVyX3BhZ2VzICsgbnVtX3BhZ2VzKToKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJwb2xsX251bGxpZmllcl9wYWdlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX251bGxpZmllcl9wYWdlcyBleGlzdHMKICAgIGZyYW1lX2RpZyAtMgogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicG9sbF9udWxsaWZpZXJfcGFnZXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX251bGxpZmllcl9wYWdlcyBleGlzdHMKCmFsbG9jYXRlX251bGxpZmllcl9wYWdlc19mb3JfaGVhZGVyQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODQwLTg0MQogICAgLy8gIyBDcmVhdGUgemVybyBmaWxsZWQgbnVsbGlmaWVyIGJpdG1hcCBwYWdlcyAoYSB6ZXJvIGJpdCBtZWFucyB0aGUgbGVhZiBpbmRleCBoYXMgbm90IHZvdGVkIHlldCkKICAgIC8vIGZvciBwYWdlIGluIHVyYW5nZShzZWxmLnBvbGxfbnVsbGlmaWVyX3BhZ2VzLCBzZWxmLnBvbGxfbnVsbGlmaWVyX3BhZ2VzICsgbnVtX3BhZ2VzKToKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogYWxsb2NhdGVfbnVsbGlmaWVyX3BhZ2VzX2FmdGVyX2ZvckA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODQzCiAgICAvLyBzZWxmLm51bGxpZmllcl9wYWdlX2tleShwYWdlKSwgVUludDY0KE5VTExJRklFUl9QQUdFX1NJWkUpCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBjYWxsc3ViIG51bGxpZmllcl9wYWdlX2tleQogICAgcHVzaGludCAxMDI0IC8vIDEwMjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4NDItODQ0CiAgICAvLyBhc3NlcnQgb3AuQm94LmNyZWF0ZSgKICAgIC8vICAgICBzZWxmLm51bGxpZmllcl9wYWdlX2tleShwYWdlKSwgVUludDY0KE5VTExJRklFUl9QQUdFX1NJWkUpCiAgICAvLyApLCAiTnVsbGlmaWVyIHBhZ2UgbXVzdCBub3QgYmUgcHJlc2VudCBpbiBib3ggbl8uIgogICAgYm94X2NyZWF0ZQogICAgYXNzZXJ0IC8vIE51bGxpZmllciBwYWdlIG11c3Qgbm90IGJlIHByZXNlbnQgaW4gYm94IG5fLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojg0MC04NDEKICAgIC8vICMgQ3JlYXRlIHplcm8gZmlsbGVkIG51bGxpZmllciBiaXRtYXAgcGFnZXMgKGEgemVybyBiaXQgbWVhbnMgdGhlIGxlYWYgaW5kZXggaGFzIG5vdCB2b3RlZCB5ZXQpCiAgICAvLyBmb3IgcGFnZSBpbiB1cmFuZ2Uoc2VsZi5wb2xsX251bGxpZmllcl9wYWdlcywgc2VsZi5wb2xsX251bGxpZmllcl9wYWdlcyArIG51bV9wYWdlcyk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAwCiAgICBiIGFsbG9jYXRlX251bGxpZmllcl9wYWdlc19mb3JfaGVhZGVyQDUKCmFsbG9jYXRlX251bGxpZmllcl9wYWdlc19hZnRlcl9mb3JAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4NDYKICAgIC8vIHNlbGYucG9sbF9udWxsaWZpZXJfcGFnZXMgKz0gbnVtX3BhZ2VzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicG9sbF9udWxsaWZpZXJfcGFnZXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9udWxsaWZpZXJfcGFnZXMgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIGJ5dGVjXzIgLy8gInBvbGxfbnVsbGlmaWVyX3BhZ2VzIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4NDgKICAgIC8vIGxvZ190ZWxlbWV0cnkobnVtX3BhZ2VzKQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIGxvZ190ZWxlbWV0cnkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90Lm51bGxpZmllcl9wYWdlX2tleShwYWdlOiB1aW50NjQpIC0+IGJ5dGVzOgpudWxsaWZpZXJfcGFnZV9rZXk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTYyLTE2NAogICAgLy8gIyBSZXR1cm4gdGhlIG51bGxpZmllciBiaXRtYXAgcGFnZSBib3gga2V5IGZvciBnaXZlbiBwYWdlIGluZGV4ICgnbl8nICsgMiBieXRlIHBhZ2UgaW5kZXgpCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIG51bGxpZmllcl9wYWdlX2tleShzZWxmLCBwYWdlOiBVSW50NjQpIC0+IEJ5dGVzOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTY1CiAgICAvLyByZXR1cm4gQnl0ZXMoYiJuXyIpICsgb3AuZXh0cmFjdChvcC5pdG9iKHBhZ2UpLCA2LCAyKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcHVzaGJ5dGVzIDB4NmU1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29udHJhY3QuT3BlbkJhbGxvdC5zdWJtaXRfdm90ZV93aXRoX3Byb29mKGNob2ljZTogYnl0ZXMsIGxlYWZfaW5kZXg6IHVpbnQ2NCwgcHJvb2Y6IGJ5dGVzKSAtPiB2b2lkOgpzdWJtaXRfdm90ZV93aXRoX3Byb29mOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojg1MS04NTgKICAgIC8vICMgRW5hYmxlIGFueSBlbGlnaWJsZSBhY2NvdW50IHRvIHN1Ym1pdCBhIHZvdGUgYnkgcHJvdmluZyB0aGVpciBhZGRyZXNzIGlzIGEgbGVhZiBvZiB0aGUgZWxpZ2liaWxpdHkgTWVya2xlIHJvb3QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHN1Ym1pdF92b3RlX3dpdGhfcHJvb2YoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBjaG9pY2U6IGFyYzQuVUludDgsCiAgICAvLyAgICAgbGVhZl9pbmRleDogVUludDY0LAogICAgLy8gICAgIHByb29mOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlN0YXRpY0FycmF5W2FyYzQuQnl0ZSwgdC5MaXRlcmFsWzMyXV1dLAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4NjEKICAgIC8vIHNlbGYucG9sbF9lbGlnaWJpbGl0eV9yb290Lmxlbmd0aCA9PSBVSW50NjQoMzIpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAicG9sbF9lbGlnaWJpbGl0eV9yb290IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfZWxpZ2liaWxpdHlfcm9vdCBleGlzdHMKICAgIGxlbgogICAgaW50Y18zIC8vIDMyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojg1OS04NjIKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYucG9sbF9lbGlnaWJpbGl0eV9yb290Lmxlbmd0aCA9PSBVSW50NjQoMzIpCiAgICAvLyApLCAiUHJvb2Ygdm90aW5nIHJlcXVpcmVzIGEgcG9sbCB3aXRoIGFuIGVsaWdpYmlsaXR5IE1lcmtsZSByb290LiIKICAgIGFzc2VydCAvLyBQcm9vZiB2b3RpbmcgcmVxdWlyZXMgYSBwb2xsIHdpdGggYW4gZWxpZ2liaWxpdHkgTWVya2xlIHJvb3QuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODY1CiAgICAvLyBwcm9vZi5sZW5ndGggPD0gVUludDY0KDMyKSBhbmQgbGVhZl9pbmRleCA8IG9wLnNobChVSW50NjQoMSksIHByb29mLmxlbmd0aCkKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGludGNfMyAvLyAzMgogICAgPD0KICAgIGJ6IHN1Ym1pdF92b3RlX3dpdGhfcHJvb2ZfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfZGlnIDMKICAgIHNobAogICAgZnJhbWVfZGlnIC0yCiAgICA+CiAgICBieiBzdWJtaXRfdm90ZV93aXRoX3Byb29mX2Jvb2xfZmFsc2VAMwogICAgaW50Y18xIC8vIDEKICAgIGIgc3VibWl0X3ZvdGVfd2l0aF9wcm9vZl9ib29sX21lcmdlQDQKCnN1Ym1pdF92b3RlX3dpdGhfcHJvb2ZfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKCnN1Ym1pdF92b3RlX3dpdGhfcHJvb2ZfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojg2NC04NjYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcHJvb2YubGVuZ3RoIDw9IFVJbnQ2NCgzMikgYW5kIGxlYWZfaW5kZXggPCBvcC5zaGwoVUludDY0KDEpLCBwcm9vZi5sZW5ndGgpCiAgICAvLyApLCAiTGVhZiBpbmRleCBtdXN0IGJlIGFkZHJlc3NhYmxlIGJ5IHRoZSBwcm9vZiAocHJvb2YgZGVwdGggY2FuIG5vdCBleGNlZWQgMzIpLiIKICAgIGFzc2VydCAvLyBMZWFmIGluZGV4IG11c3QgYmUgYWRkcmVzc2FibGUgYnkgdGhlIHByb29mIChwcm9vZiBkZXB0aCBjYW4gbm90IGV4Y2VlZCAzMikuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODc4CiAgICAvLyBVSW50NjQoNDAwKSArIHByb29mLmxlbmd0aCAqIFVJbnQ2NCg2MCksIGZlZV9zb3VyY2U9T3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdAogICAgZnJhbWVfZGlnIDMKICAgIHB1c2hpbnQgNjAgLy8gNjAKICAgICoKICAgIHB1c2hpbnQgNDAwIC8vIDQwMAogICAgKwogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4NzYtODc5CiAgICAvLyAjIFRvcCB1cCB0aGUgb3Bjb2RlIGJ1ZGdldCAob25lIHNoYTI1NiBwZXIgcHJvb2YgbGV2ZWwpIGZyb20gdGhlIGdyb3VwIGZlZSBjcmVkaXQgaWYgbmVlZGVkCiAgICAvLyBlbnN1cmVfYnVkZ2V0KAogICAgLy8gICAgIFVJbnQ2NCg0MDApICsgcHJvb2YubGVuZ3RoICogVUludDY0KDYwKSwgZmVlX3NvdXJjZT1PcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0CiAgICAvLyApCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4ODEtODgyCiAgICAvLyAjIEhhc2ggdGhlIHBhdGggZnJvbSB0aGUgc2VuZGVyIGxlYWYgdXAgdG8gdGhlIHJvb3QgKGxlYWYgaW5kZXggYml0cyBzZWxlY3QgdGhlIHNpZGUgb2YgZXZlcnkgc2libGluZykKICAgIC8vIG5vZGUgPSBvcC5zaGEyNTYoQnl0ZXMoYiJceDAwIikgKyBUeG4uc2VuZGVyLmJ5dGVzKQogICAgcHVzaGJ5dGVzIDB4MDAKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4ODQKICAgIC8vIGZvciBsZXZlbCBpbiB1cmFuZ2UocHJvb2YubGVuZ3RoKToKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDEKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfYnVyeSAyCgpzdWJtaXRfdm90ZV93aXRoX3Byb29mX2Zvcl9oZWFkZXJANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4ODQKICAgIC8vIGZvciBsZXZlbCBpbiB1cmFuZ2UocHJvb2YubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMwogICAgPAogICAgYnogc3VibWl0X3ZvdGVfd2l0aF9wcm9vZl9hZnRlcl9mb3JAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4ODUKICAgIC8vIHNpYmxpbmcgPSBwcm9vZltsZXZlbF0uYnl0ZXMKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAxCiAgICBpbnRjXzMgLy8gMzIKICAgICoKICAgIGludGNfMyAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODg2CiAgICAvLyBpZiBwYXRoICYgVUludDY0KDEpOgogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMSAvLyAxCiAgICAmCiAgICBieiBzdWJtaXRfdm90ZV93aXRoX3Byb29mX2Vsc2VfYm9keUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODg3CiAgICAvLyBub2RlID0gb3Auc2hhMjU2KEJ5dGVzKGIiXHgwMSIpICsgc2libGluZyArIG5vZGUpCiAgICBieXRlYyAxNyAvLyAweDAxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgZnJhbWVfYnVyeSAwCiAgICBiIHN1Ym1pdF92b3RlX3dpdGhfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUA5CgpzdWJtaXRfdm90ZV93aXRoX3Byb29mX2Vsc2VfYm9keUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojg4OQogICAgLy8gbm9kZSA9IG9wLnNoYTI1NihCeXRlcyhiIlx4MDEiKSArIG5vZGUgKyBzaWJsaW5nKQogICAgYnl0ZWMgMTcgLy8gMHgwMQogICAgZnJhbWVfZGlnIDAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIGZyYW1lX2J1cnkgMAoKc3VibWl0X3ZvdGVfd2l0aF9wcm9vZl9hZnRlcl9pZl9lbHNlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODkwCiAgICAvLyBwYXRoID0gcGF0aCA+PiBVSW50NjQoMSkKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzEgLy8gMQogICAgc2hyCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4ODQKICAgIC8vIGZvciBsZXZlbCBpbiB1cmFuZ2UocHJvb2YubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBiIHN1Ym1pdF92b3RlX3dpdGhfcHJvb2ZfZm9yX2hlYWRlckA1CgpzdWJtaXRfdm90ZV93aXRoX3Byb29mX2FmdGVyX2ZvckAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4OTMKICAgIC8vIG5vZGUgPT0gc2VsZi5wb2xsX2VsaWdpYmlsaXR5X3Jvb3QKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJwb2xsX2VsaWdpYmlsaXR5X3Jvb3QiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9lbGlnaWJpbGl0eV9yb290IGV4aXN0cwogICAgZnJhbWVfZGlnIDAKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6ODkyLTg5NAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBub2RlID09IHNlbGYucG9sbF9lbGlnaWJpbGl0eV9yb290CiAgICAvLyApLCAiTWVya2xlIHByb29mIGRvZXMgbm90IG1hdGNoIHRoZSBlbGlnaWJpbGl0eSByb290IGZvciB0aGUgdHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIE1lcmtsZSBwcm9vZiBkb2VzIG5vdCBtYXRjaCB0aGUgZWxpZ2liaWxpdHkgcm9vdCBmb3IgdGhlIHRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojg5Ni04OTcKICAgIC8vICMgRmxpcCB0aGUgbGVhZiBpbmRleCBiaXQgaW4gaXRzIG51bGxpZmllciBiaXRtYXAgcGFnZSAoYSBzZXQgYml0IG1lYW5zIHRoZSBsZWFmIGluZGV4IGFscmVhZHkgdm90ZWQpCiAgICAvLyBwYWdlID0gbGVhZl9pbmRleCAvLyBVSW50NjQoTlVMTElGSUVSX1BBR0VfQklUUykKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGludCA4MTkyIC8vIDgxOTIKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo4OTkKICAgIC8vIHBhZ2UgPCBzZWxmLnBvbGxfbnVsbGlmaWVyX3BhZ2VzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicG9sbF9udWxsaWZpZXJfcGFnZXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9sbF9udWxsaWZpZXJfcGFnZXMgZXhpc3RzCiAgICBkaWcgMQogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojg5OC05MDAKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGFnZSA8IHNlbGYucG9sbF9udWxsaWZpZXJfcGFnZXMKICAgIC8vICksICJOdWxsaWZpZXIgcGFnZSBvZiB0aGUgbGVhZiBpbmRleCBtdXN0IGJlIGFsbG9jYXRlZC4iCiAgICBhc3NlcnQgLy8gTnVsbGlmaWVyIHBhZ2Ugb2YgdGhlIGxlYWYgaW5kZXggbXVzdCBiZSBhbGxvY2F0ZWQuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6OTAyCiAgICAvLyBwYWdlX2tleSA9IHNlbGYubnVsbGlmaWVyX3BhZ2Vfa2V5KHBhZ2UpCiAgICBjYWxsc3ViIG51bGxpZmllcl9wYWdlX2tleQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjkwMwogICAgLy8gYml0X2luZGV4ID0gbGVhZl9pbmRleCAlIFVJbnQ2NChOVUxMSUZJRVJfUEFHRV9CSVRTKQogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDgxOTIgLy8gODE5MgogICAgJQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjkwNAogICAgLy8gYnl0ZV9vZmZzZXQgPSBiaXRfaW5kZXggLy8gVUludDY0KDgpCiAgICBkdXAKICAgIHB1c2hpbnQgOCAvLyA4CiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6OTA1CiAgICAvLyBiaXRfbWFzayA9IFVJbnQ2NCgweDgwKSA+PiAoYml0X2luZGV4ICUgVUludDY0KDgpKSAgIyBCaXQgMCBpcyB0aGUgbGVmdG1vc3QgYml0IG9mIGl0cyBiaXRtYXAgYnl0ZQogICAgc3dhcAogICAgcHVzaGludCA4IC8vIDgKICAgICUKICAgIHB1c2hpbnQgMTI4IC8vIDEyOAogICAgc3dhcAogICAgc2hyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6OTA2CiAgICAvLyBiaXRtYXBfYnl0ZSA9IG9wLmJ0b2kob3AuQm94LmV4dHJhY3QocGFnZV9rZXksIGJ5dGVfb2Zmc2V0LCBVSW50NjQoMSkpKQogICAgZGlnIDIKICAgIGRpZyAyCiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5MDgKICAgIC8vIGJpdG1hcF9ieXRlICYgYml0X21hc2sKICAgIGR1cAogICAgZGlnIDIKICAgICYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5MDctOTA5CiAgICAvLyBhc3NlcnQgbm90ICgKICAgIC8vICAgICBiaXRtYXBfYnl0ZSAmIGJpdF9tYXNrCiAgICAvLyApLCAiVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgYWxyZWFkeSBzdWJtaXR0ZWQgYSB2b3RlLiIKICAgICEKICAgIGFzc2VydCAvLyBUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBhbHJlYWR5IHN1Ym1pdHRlZCBhIHZvdGUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6OTEyCiAgICAvLyBwYWdlX2tleSwgYnl0ZV9vZmZzZXQsIG9wLmV4dHJhY3Qob3AuaXRvYihiaXRtYXBfYnl0ZSB8IGJpdF9tYXNrKSwgNywgMSkKICAgIHwKICAgIGl0b2IKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6OTExLTkxMwogICAgLy8gb3AuQm94LnJlcGxhY2UoCiAgICAvLyAgICAgcGFnZV9rZXksIGJ5dGVfb2Zmc2V0LCBvcC5leHRyYWN0KG9wLml0b2IoYml0bWFwX2J5dGUgfCBiaXRfbWFzayksIDcsIDEpCiAgICAvLyApCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjkxNS05MTYKICAgIC8vICMgVXBkYXRlIHZvdGUgdGFsbHkgKGNvc3QgaXMgdGhlIHNhbWUgZm9yIGFueSBjaG9pY2UpCiAgICAvLyBzZWxmLnRhbGx5X3ZvdGUoY2hvaWNlKQogICAgZnJhbWVfZGlnIC0zCiAgICBjYWxsc3ViIHRhbGx5X3ZvdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5MTgtOTE5CiAgICAvLyAjIEVtaXQgdm90ZSBjYXN0IGV2ZW50CiAgICAvLyBhcmM0LmVtaXQoVm90ZUNhc3Qoc2VsZi5uZXh0X2V2ZW50X3NlcSgpLCBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIGNob2ljZSkpCiAgICBjYWxsc3ViIG5leHRfZXZlbnRfc2VxCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICBieXRlYyAxNCAvLyBtZXRob2QgIlZvdGVDYXN0KHVpbnQ2NCxhZGRyZXNzLHVpbnQ4KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6OTIxCiAgICAvLyBsb2dfdGVsZW1ldHJ5KFVJbnQ2NCgyKSkKICAgIGludGNfMiAvLyAyCiAgICBjYWxsc3ViIGxvZ190ZWxlbWV0cnkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb250cmFjdC5PcGVuQmFsbG90LmRlbGV0ZV9ib3hfc3RvcmFnZSgpIC0+IHZvaWQ6CmRlbGV0ZV9ib3hfc3RvcmFnZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5MjQtOTI2CiAgICAvLyAjIEVuYWJsZSBhbnkgZWxpZ2JsZSBhY2NvdW50IHRvIGRlbGV0ZSB0aGVpciBib3ggc3RvcmFnZSBhbmQgZ2V0IHRoZWlyIE1CUiBwYXltZW50IHJlZnVuZGVkIHRvIHdob2V2ZXIgcGFpZCBpdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgZGVsZXRlX2JveF9zdG9yYWdlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5MjkKICAgIC8vIFR4bi5zZW5kZXIgIT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICAhPQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjkyNy05MzAKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgIT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIkludmFsaWQgc2VuZGVyIGFkZHJlc3MhIEFwcGxpY2F0aW9uIGNyZWF0b3IgbXVzdCBkZWxldGUgc21hcnQgY29udHJhY3QgdG8gZnJlZSB1cCB0aGVpciBib3ggc3RvcmFnZSBNQlIuIgogICAgYXNzZXJ0IC8vIEludmFsaWQgc2VuZGVyIGFkZHJlc3MhIEFwcGxpY2F0aW9uIGNyZWF0b3IgbXVzdCBkZWxldGUgc21hcnQgY29udHJhY3QgdG8gZnJlZSB1cCB0aGVpciBib3ggc3RvcmFnZSBNQlIuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6OTM3LTkzOAogICAgLy8gIyBSZWFkIHRoZSBib3ggc2l6ZSBiZWZvcmUgZGVsZXRpbmcgaXQsIHNwb25zb3JlZCBib3hlcyAoVm90ZXJEYXRhICsgc3BvbnNvciBieXRlKSB3ZXJlIHBhaWQgYnkgdGhlIGNyZWF0b3IKICAgIC8vIHZvdGVyX2tleSA9IHNlbGYuYm94X2Ffdm90ZXJfZGF0YS5rZXlfcHJlZml4ICsgVHhuLnNlbmRlci5ieXRlcwogICAgYnl0ZWNfMSAvLyAweDYxCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5MzkKICAgIC8vIHZvdGVyX2JveF9zaXplID0gb3AuQm94Lmxlbmd0aCh2b3Rlcl9rZXkpWzBdCiAgICBkdXAKICAgIGJveF9sZW4KICAgIHBvcAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojk0MS05NDQKICAgIC8vICMgRGVsZXRlIGJveCBrZXkgKGFkZHJlc3MpIGZyb20gYm94IHN0b3JhZ2UsIGJveF9kZWwgcmVwb3J0cyB3aGV0aGVyIHRoZSBib3ggZXhpc3RlZAogICAgLy8gYXNzZXJ0IG9wLkJveC5kZWxldGUoCiAgICAvLyAgICAgdm90ZXJfa2V5CiAgICAvLyApLCAiVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBiZSBwcmVzZW50IGluIGJveCBhXy4iCiAgICBib3hfZGVsCiAgICBhc3NlcnQgLy8gVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBiZSBwcmVzZW50IGluIGJveCBhXy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5NDYtOTQ3CiAgICAvLyAjIEVtaXQgYm94IGRlbGV0ZWQgZXZlbnQKICAgIC8vIGFyYzQuZW1pdChCb3hEZWxldGVkKHNlbGYubmV4dF9ldmVudF9zZXEoKSwgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpKSkKICAgIGNhbGxzdWIgbmV4dF9ldmVudF9zZXEKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4OTA3NTBjYjYgLy8gbWV0aG9kICJCb3hEZWxldGVkKHVpbnQ2NCxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6OTQ5LTk1MAogICAgLy8gIyBSZWZ1bmQgdGhlIEJveCBzdG9yYWdlIE1CUiB0byB3aG9ldmVyIHBhaWQgaXQgKGNyZWF0b3IgZm9yIHNwb25zb3JlZCBib3hlcywgZWxzZSB0aGUgdHJhbnNhY3Rpb24gc2VuZGVyKQogICAgLy8gcmVmdW5kX3JlY2VpdmVyID0gVHhuLnNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojk1MQogICAgLy8gcmVmdW5kX2Ftb3VudCA9IFVJbnQ2NChCT1hfQV9NQlIgLSBNSU5fVFhOX0ZFRSkKICAgIHB1c2hpbnQgMTUxMDAgLy8gMTUxMDAKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5NTIKICAgIC8vIGlmIHZvdGVyX2JveF9zaXplID09IFVJbnQ2NChTUE9OU09SRURfVk9URVJfREFUQV9TSVpFKToKICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgYnogZGVsZXRlX2JveF9zdG9yYWdlX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojk1MwogICAgLy8gcmVmdW5kX3JlY2VpdmVyID0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5NTQKICAgIC8vIHJlZnVuZF9hbW91bnQgPSBVSW50NjQoQk9YX0FfU1BPTlNPUkVEX01CUiAtIE1JTl9UWE5fRkVFKQogICAgcHVzaGludCAxNTUwMCAvLyAxNTUwMAogICAgZnJhbWVfYnVyeSAxCgpkZWxldGVfYm94X3N0b3JhZ2VfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojk1Ni05NjIKICAgIC8vICMgU3VibWl0IGlubmVyIHRyYW5zYWN0aW9uIChCb3ggc3RvcmFnZSBNQlIgcGF5ZXIgZ2V0cyBpdCByZWZ1bmRlZCkKICAgIC8vIGJveF9zdG9yYWdlX2RlbF9yZWZ1bmRfaXR4biA9IGl0eG4uUGF5bWVudCgKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZWNlaXZlcj1yZWZ1bmRfcmVjZWl2ZXIsCiAgICAvLyAgICAgYW1vdW50PXJlZnVuZF9hbW91bnQsCiAgICAvLyAgICAgZmVlPU1JTl9UWE5fRkVFLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojk1OAogICAgLy8gc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgZnJhbWVfZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojk1Ni05NTcKICAgIC8vICMgU3VibWl0IGlubmVyIHRyYW5zYWN0aW9uIChCb3ggc3RvcmFnZSBNQlIgcGF5ZXIgZ2V0cyBpdCByZWZ1bmRlZCkKICAgIC8vIGJveF9zdG9yYWdlX2RlbF9yZWZ1bmRfaXR4biA9IGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5NjEKICAgIC8vIGZlZT1NSU5fVFhOX0ZFRSwKICAgIGludGMgNSAvLyAxMDAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojk1Ni05NjIKICAgIC8vICMgU3VibWl0IGlubmVyIHRyYW5zYWN0aW9uIChCb3ggc3RvcmFnZSBNQlIgcGF5ZXIgZ2V0cyBpdCByZWZ1bmRlZCkKICAgIC8vIGJveF9zdG9yYWdlX2RlbF9yZWZ1bmRfaXR4biA9IGl0eG4uUGF5bWVudCgKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZWNlaXZlcj1yZWZ1bmRfcmVjZWl2ZXIsCiAgICAvLyAgICAgYW1vdW50PXJlZnVuZF9hbW91bnQsCiAgICAvLyAgICAgZmVlPU1JTl9UWE5fRkVFLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gUmVjZWl2ZXIKICAgIGl0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6OTY1CiAgICAvLyBib3hfc3RvcmFnZV9kZWxfcmVmdW5kX2l0eG4uc2VuZGVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojk2NC05NjYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYm94X3N0b3JhZ2VfZGVsX3JlZnVuZF9pdHhuLnNlbmRlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiYm94X3N0b3JhZ2VfZGVsX3JlZnVuZF9pdHhuIHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gYm94X3N0b3JhZ2VfZGVsX3JlZnVuZF9pdHhuIHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5NjkKICAgIC8vIGJveF9zdG9yYWdlX2RlbF9yZWZ1bmRfaXR4bi5yZWNlaXZlciA9PSByZWZ1bmRfcmVjZWl2ZXIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6OTY4LTk3MAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBib3hfc3RvcmFnZV9kZWxfcmVmdW5kX2l0eG4ucmVjZWl2ZXIgPT0gcmVmdW5kX3JlY2VpdmVyCiAgICAvLyApLCAiYm94X3N0b3JhZ2VfZGVsX3JlZnVuZF9pdHhuIHJlY2lldmVyIGFkZHJlc3MgbXVzdCBtYXRjaCBib3ggc3RvcmFnZSBNQlIgcGF5ZXIgYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gYm94X3N0b3JhZ2VfZGVsX3JlZnVuZF9pdHhuIHJlY2lldmVyIGFkZHJlc3MgbXVzdCBtYXRjaCBib3ggc3RvcmFnZSBNQlIgcGF5ZXIgYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5NzIKICAgIC8vIGxvZ190ZWxlbWV0cnkoVUludDY0KDEpKQogICAgaW50Y18xIC8vIDEKICAgIGNhbGxzdWIgbG9nX3RlbGVtZXRyeQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbnRyYWN0Lk9wZW5CYWxsb3QucHVyZ2VfYm94X3N0b3JhZ2UoYm94X2tleXM6IGJ5dGVzKSAtPiBieXRlczoKcHVyZ2VfYm94X3N0b3JhZ2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6OTc1LTk3OQogICAgLy8gIyBFbmFibGUgYXBwbGljYXRpb24gY3JlYXRvciB0byBleGVjdXRlIGJveCBzdG9yYWdlIHB1cmdlLCB0aGlzIGRlbGV0ZXMgYW55IGJveGVzIG5vdCBkZWxldGVkIGJ5IG90aGVyIGFjY291bnRzCiAgICAvLyBAYXJjNC5hYmltZXRob2QgICMgTk9URTogQm94IGtleXMgYXJlIGJvdW5kIGJ5IHRoZSBib3ggcmVmZXJlbmNlcyBwb29sZWQgYWNyb3NzIHRoZSBncm91cCAoZ3JvdXAgcmVzb3VyY2Ugc2hhcmluZykKICAgIC8vIGRlZiBwdXJnZV9ib3hfc3RvcmFnZSgKICAgIC8vICAgICBzZWxmLCBib3hfa2V5czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5BZGRyZXNzXQogICAgLy8gKSAtPiBhcmM0LlVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojk4MgogICAgLy8gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6OTgwLTk4MwogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiVW5hdXRob3JpemVkIGFkZHJlc3MhIE9ubHkgYXBwbGljYXRpb24gY3JlYXRvciBjYW4gcHVyZ2UgYm94IHN0b3JhZ2UuIgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBhZGRyZXNzISBPbmx5IGFwcGxpY2F0aW9uIGNyZWF0b3IgY2FuIHB1cmdlIGJveCBzdG9yYWdlLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojk5MAogICAgLy8gYm94X2tleXMubGVuZ3RoID4gMAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojk4OS05OTEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYm94X2tleXMubGVuZ3RoID4gMAogICAgLy8gKSwgIlRoZSBudW1iZXIgb2YgYWRkcmVzc2VzIHJlcHJlc2VudGVkIGJ5IGJveCBrZXlzIGFycmF5IG11c3QgYmUgZ3JlYXRlciB0aGFuIDAuIgogICAgYXNzZXJ0IC8vIFRoZSBudW1iZXIgb2YgYWRkcmVzc2VzIHJlcHJlc2VudGVkIGJ5IGJveCBrZXlzIGFycmF5IG11c3QgYmUgZ3JlYXRlciB0aGFuIDAuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6OTk1CiAgICAvLyBVSW50NjQoMTAwKSArIGJveF9rZXlzLmxlbmd0aCAqIFVJbnQ2NCg0MCksIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgICoKICAgIHB1c2hpbnQgMTAwIC8vIDEwMAogICAgKwogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weTo5OTMtOTk2CiAgICAvLyAjIFRvcCB1cCBvcGNvZGUgYnVkZ2V0IGZvciB0aGUgd2hvbGUgYmF0Y2ggKH40MCBwZXIgYm94IGtleSksIGlubmVyIGFwcCBjYWxsIGZlZXMgYXJlIHBhaWQgYnkgdGhlIGdyb3VwCiAgICAvLyBlbnN1cmVfYnVkZ2V0KAogICAgLy8gICAgIFVJbnQ2NCgxMDApICsgYm94X2tleXMubGVuZ3RoICogVUludDY0KDQwKSwgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdAogICAgLy8gKQogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICBpbnRjXzAgLy8gMAoKcHVyZ2VfYm94X3N0b3JhZ2VfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5Ojk5OC05OTkKICAgIC8vICMgSXRlcmF0ZSB0aHJvdWdoIHRoZSBkeW5hbWljIGFycmF5IG9mIGFkZHJlc3NlcyByZXByZXNlbnRpbmcgdGhlIGJveCBrZXkKICAgIC8vIGZvciBib3hfa2V5IGluIGJveF9rZXlzOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBwdXJnZV9ib3hfc3RvcmFnZV9hZnRlcl9mb3JANAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18zIC8vIDMyCiAgICAqCiAgICBpbnRjXzMgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMDIKICAgIC8vIGJveF9rZXkubmF0aXZlICE9IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIGR1cAogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICAhPQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMDAtMTAwMwogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYm94X2tleS5uYXRpdmUgIT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIkFjY291bnQgYWRkcmVzcyByZXByZXNlbnRlZCBpbiBib3gga2V5IG11c3Qgbm90IG1hdGNoIGFwcGxpY2F0aW9uIGNyZWF0b3IgYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gQWNjb3VudCBhZGRyZXNzIHJlcHJlc2VudGVkIGluIGJveCBrZXkgbXVzdCBub3QgbWF0Y2ggYXBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMDcKICAgIC8vIHNlbGYuYm94X2Ffdm90ZXJfZGF0YS5rZXlfcHJlZml4ICsgYm94X2tleS5ieXRlcwogICAgYnl0ZWNfMSAvLyAweDYxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDA1LTEwMDgKICAgIC8vICMgRGVsZXRlIGJveCBrZXkgKGFkZHJlc3MpIGZyb20gYm94IHN0b3JhZ2UsIGJveF9kZWwgcmVwb3J0cyB3aGV0aGVyIHRoZSBib3ggZXhpc3RlZAogICAgLy8gYXNzZXJ0IG9wLkJveC5kZWxldGUoCiAgICAvLyAgICAgc2VsZi5ib3hfYV92b3Rlcl9kYXRhLmtleV9wcmVmaXggKyBib3hfa2V5LmJ5dGVzCiAgICAvLyApLCAiQWNjb3VudCBhZGRyZXNzIHJlcHJlc2VudGVkIGluIGJveCBrZXkgbXVzdCBiZSBwcmVzZW50IGluIGJveCBhXy4iCiAgICBib3hfZGVsCiAgICBhc3NlcnQgLy8gQWNjb3VudCBhZGRyZXNzIHJlcHJlc2VudGVkIGluIGJveCBrZXkgbXVzdCBiZSBwcmVzZW50IGluIGJveCBhXy4KICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgcHVyZ2VfYm94X3N0b3JhZ2VfZm9yX2hlYWRlckAxCgpwdXJnZV9ib3hfc3RvcmFnZV9hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDEwLTEwMTEKICAgIC8vICMgSW5jcmVtZW50IGJveCAnYV8nIHB1cmdlZCB0b3RhbCBhbW91bnQgb25jZSBmb3IgdGhlIHdob2xlIGJhdGNoCiAgICAvLyBzZWxmLnRvdGFsX3B1cmdlZF9ib3hfYV8gKz0gYm94X2tleXMubGVuZ3RoCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAidG90YWxfcHVyZ2VkX2JveF9hXyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9wdXJnZWRfYm94X2FfIGV4aXN0cwogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMgogICAgKwogICAgYnl0ZWMgNyAvLyAidG90YWxfcHVyZ2VkX2JveF9hXyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTAxMy0xMDE0CiAgICAvLyAjIEVtaXQgYm94ZXMgcHVyZ2VkIGV2ZW50IG9uY2UgZm9yIHRoZSB3aG9sZSBiYXRjaAogICAgLy8gYXJjNC5lbWl0KEJveGVzUHVyZ2VkKHNlbGYubmV4dF9ldmVudF9zZXEoKSwgYXJjNC5VSW50NjQoYm94X2tleXMubGVuZ3RoKSkpCiAgICBjYWxsc3ViIG5leHRfZXZlbnRfc2VxCiAgICBkaWcgMQogICAgaXRvYgogICAgc3dhcAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgYnl0ZWMgMjMgLy8gbWV0aG9kICJCb3hlc1B1cmdlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTAxNi0xMDE3CiAgICAvLyAjIFJldHVybiB0aGUgbnVtYmVyIG9mIHB1cmdlZCBib3hlcwogICAgLy8gbG9nX3RlbGVtZXRyeShib3hfa2V5cy5sZW5ndGgpCiAgICBzd2FwCiAgICBjYWxsc3ViIGxvZ190ZWxlbWV0cnkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDE4CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoYm94X2tleXMubGVuZ3RoKQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29udHJhY3QuT3BlbkJhbGxvdC50cnlfcHVyZ2VfYm94X3N0b3JhZ2UoYm94X2tleXM6IGJ5dGVzKSAtPiBieXRlczoKdHJ5X3B1cmdlX2JveF9zdG9yYWdlOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMjEtMTAyNQogICAgLy8gIyBFbmFibGUgYXBwbGljYXRpb24gY3JlYXRvciB0byBwdXJnZSBib3ggc3RvcmFnZSB3aXRob3V0IGZhaWxpbmcgb24gYm94ZXMgYWxyZWFkeSBkZWxldGVkIGJ5IHZvdGVycyBvciBvdGhlciBwdXJnZXMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHRyeV9wdXJnZV9ib3hfc3RvcmFnZSgKICAgIC8vICAgICBzZWxmLCBib3hfa2V5czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5BZGRyZXNzXQogICAgLy8gKSAtPiBhcmM0LlVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgaW50Y18wIC8vIDAKICAgIHB1c2hieXRlcyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMjgKICAgIC8vIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMjYtMTAyOQogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiVW5hdXRob3JpemVkIGFkZHJlc3MhIE9ubHkgYXBwbGljYXRpb24gY3JlYXRvciBjYW4gcHVyZ2UgYm94IHN0b3JhZ2UuIgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBhZGRyZXNzISBPbmx5IGFwcGxpY2F0aW9uIGNyZWF0b3IgY2FuIHB1cmdlIGJveCBzdG9yYWdlLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwMzIKICAgIC8vIGJveF9rZXlzLmxlbmd0aCA+IDAKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDMxLTEwMzMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYm94X2tleXMubGVuZ3RoID4gMAogICAgLy8gKSwgIlRoZSBudW1iZXIgb2YgYWRkcmVzc2VzIHJlcHJlc2VudGVkIGJ5IGJveCBrZXlzIGFycmF5IG11c3QgYmUgZ3JlYXRlciB0aGFuIDAuIgogICAgYXNzZXJ0IC8vIFRoZSBudW1iZXIgb2YgYWRkcmVzc2VzIHJlcHJlc2VudGVkIGJ5IGJveCBrZXlzIGFycmF5IG11c3QgYmUgZ3JlYXRlciB0aGFuIDAuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTAzNwogICAgLy8gVUludDY0KDEwMCkgKyBib3hfa2V5cy5sZW5ndGggKiBVSW50NjQoNDApLCBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0CiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICAqCiAgICBwdXNoaW50IDEwMCAvLyAxMDAKICAgICsKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTAzNS0xMDM4CiAgICAvLyAjIFRvcCB1cCBvcGNvZGUgYnVkZ2V0IGZvciB0aGUgd2hvbGUgYmF0Y2ggKH40MCBwZXIgYm94IGtleSksIGlubmVyIGFwcCBjYWxsIGZlZXMgYXJlIHBhaWQgYnkgdGhlIGdyb3VwCiAgICAvLyBlbnN1cmVfYnVkZ2V0KAogICAgLy8gICAgIFVJbnQ2NCgxMDApICsgYm94X2tleXMubGVuZ3RoICogVUludDY0KDQwKSwgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdAogICAgLy8gKQogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA0MC0xMDQxCiAgICAvLyAjIERlbGV0ZSBldmVyeSBib3gga2V5IHByZXNlbnQgaW4gYm94IGFfLCBhYnNlbnQgYm94IGtleXMgYW5kIHRoZSBjcmVhdG9yIGJveCBrZXkgYXJlIHNraXBwZWQKICAgIC8vIG51bV9wdXJnZWQgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBkdXAKCnRyeV9wdXJnZV9ib3hfc3RvcmFnZV9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA0MgogICAgLy8gZm9yIGJveF9rZXkgaW4gYm94X2tleXM6CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGJ6IHRyeV9wdXJnZV9ib3hfc3RvcmFnZV9hZnRlcl9mb3JANgogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDQKICAgIGludGNfMyAvLyAzMgogICAgKgogICAgaW50Y18zIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA0MwogICAgLy8gaWYgYm94X2tleS5uYXRpdmUgIT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzczoKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgIT0KICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9idXJ5IDEKICAgIGJ6IHRyeV9wdXJnZV9ib3hfc3RvcmFnZV9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDQ1CiAgICAvLyBvcC5Cb3guZGVsZXRlKHNlbGYuYm94X2Ffdm90ZXJfZGF0YS5rZXlfcHJlZml4ICsgYm94X2tleS5ieXRlcykKICAgIGJ5dGVjXzEgLy8gMHg2MQogICAgZnJhbWVfZGlnIDAKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwNDQtMTA0NgogICAgLy8gbnVtX3B1cmdlZCArPSBVSW50NjQoCiAgICAvLyAgICAgb3AuQm94LmRlbGV0ZShzZWxmLmJveF9hX3ZvdGVyX2RhdGEua2V5X3ByZWZpeCArIGJveF9rZXkuYnl0ZXMpCiAgICAvLyApCiAgICBmcmFtZV9kaWcgMwogICAgKwogICAgZnJhbWVfYnVyeSAxCgp0cnlfcHVyZ2VfYm94X3N0b3JhZ2VfYWZ0ZXJfaWZfZWxzZUA0OgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2J1cnkgMwogICAgZnJhbWVfZGlnIDQKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDQKICAgIGIgdHJ5X3B1cmdlX2JveF9zdG9yYWdlX2Zvcl9oZWFkZXJAMQoKdHJ5X3B1cmdlX2JveF9zdG9yYWdlX2FmdGVyX2ZvckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwNDgtMTA0OQogICAgLy8gIyBJbmNyZW1lbnQgYm94ICdhXycgcHVyZ2VkIHRvdGFsIGFtb3VudCBieSB0aGUgYm94ZXMgYWN0dWFsbHkgZGVsZXRlZAogICAgLy8gc2VsZi50b3RhbF9wdXJnZWRfYm94X2FfICs9IG51bV9wdXJnZWQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJ0b3RhbF9wdXJnZWRfYm94X2FfIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3B1cmdlZF9ib3hfYV8gZXhpc3RzCiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICArCiAgICBieXRlYyA3IC8vICJ0b3RhbF9wdXJnZWRfYm94X2FfIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDUxLTEwNTIKICAgIC8vICMgRW1pdCBib3hlcyBwdXJnZWQgZXZlbnQgb25jZSBmb3IgdGhlIHdob2xlIGJhdGNoCiAgICAvLyBhcmM0LmVtaXQoQm94ZXNQdXJnZWQoc2VsZi5uZXh0X2V2ZW50X3NlcSgpLCBhcmM0LlVJbnQ2NChudW1fcHVyZ2VkKSkpCiAgICBjYWxsc3ViIG5leHRfZXZlbnRfc2VxCiAgICBzd2FwCiAgICBpdG9iCiAgICBzd2FwCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBieXRlYyAyMyAvLyBtZXRob2QgIkJveGVzUHVyZ2VkKHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDU0LTEwNTUKICAgIC8vICMgUmV0dXJuIHRoZSBudW1iZXIgb2YgcHVyZ2VkIGJveGVzCiAgICAvLyBsb2dfdGVsZW1ldHJ5KGJveF9rZXlzLmxlbmd0aCkKICAgIGZyYW1lX2RpZyAyCiAgICBjYWxsc3ViIGxvZ190ZWxlbWV0cnkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDU2CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQobnVtX3B1cmdlZCkKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbnRyYWN0Lk9wZW5CYWxsb3QudGVybWluYXRlKCkgLT4gdm9pZDoKdGVybWluYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwNTktMTA2MQogICAgLy8gIyBBbGxvdyBhcHBsaWNhdGlvbiBjcmVhdG9yIHRvIGRlbGV0ZSB0aGUgc21hcnQgY29udHJhY3QgY2xpZW50LCBkZWNyZWFzZSB0aGVpciBNQlIgYmFsYW5jZSArIGFueSByZW1haW5pbmcgYm94IE1CUgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0iZGlzYWxsb3ciLCBhbGxvd19hY3Rpb25zPVsiRGVsZXRlQXBwbGljYXRpb24iXSkKICAgIC8vIGRlZiB0ZXJtaW5hdGUoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDYyLTEwNjUKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgVGVtcGxhdGVWYXJbVUludDY0XSgKICAgIC8vICAgICAiREVMRVRBQkxFIgogICAgLy8gKSwgIlRlbXBsYXRlIHZhcmlhYmxlICdERUxFVEFCTEUnIG5lZWRzIHRvIGJlICdUcnVlJyBhdCBkZXBsb3ktdGltZS4iCiAgICBpbnRjIDkgLy8gVE1QTF9ERUxFVEFCTEUKICAgIGFzc2VydCAvLyBUZW1wbGF0ZSB2YXJpYWJsZSAnREVMRVRBQkxFJyBuZWVkcyB0byBiZSAnVHJ1ZScgYXQgZGVwbG95LXRpbWUuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA2OAogICAgLy8gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA2Ny0xMDY5CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIlVuYXV0aG9yaXplZCBhZGRyZXNzISBPbmx5IGFwcGxpY2F0aW9uIGNyZWF0b3IgY2FuIGRlbGV0ZSB0aGUgc21hcnQgY29udHJhY3QuIgogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBhZGRyZXNzISBPbmx5IGFwcGxpY2F0aW9uIGNyZWF0b3IgY2FuIGRlbGV0ZSB0aGUgc21hcnQgY29udHJhY3QuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA3NwogICAgLy8gc2VsZi5ib3hfYV92b3Rlcl9kYXRhLmtleV9wcmVmaXggKyBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLmJ5dGVzCiAgICBieXRlY18xIC8vIDB4NjEKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA3NS0xMDc4CiAgICAvLyAjIERlbGV0ZSBib3gga2V5IChjcmVhdG9yIGFkZHJlc3MpIGZyb20gYm94IHN0b3JhZ2UsIGJveF9kZWwgcmVwb3J0cyB3aGV0aGVyIHRoZSBib3ggZXhpc3RlZAogICAgLy8gYXNzZXJ0IG9wLkJveC5kZWxldGUoCiAgICAvLyAgICAgc2VsZi5ib3hfYV92b3Rlcl9kYXRhLmtleV9wcmVmaXggKyBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLmJ5dGVzCiAgICAvLyApLCAiVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBiZSBwcmVzZW50IGluIGJveCBhXy4iCiAgICBib3hfZGVsCiAgICBhc3NlcnQgLy8gVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBiZSBwcmVzZW50IGluIGJveCBhXy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDgyCiAgICAvLyBzZWxmLmJveF90X2Nob2ljZV90YWxsaWVzLmRlbGV0ZSgpCiAgICBieXRlYyAxMiAvLyAweDc0NWYKICAgIGJveF9kZWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDgwLTEwODMKICAgIC8vICMgRGVsZXRlIGNob2ljZSB0YWxsaWVzIGJveCBhbmQgZXZlcnkgcG9sbCBjaG9pY2VzIHBhZ2UgYm94IGZyb20gYm94IHN0b3JhZ2UKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc2VsZi5ib3hfdF9jaG9pY2VfdGFsbGllcy5kZWxldGUoKQogICAgLy8gKSwgIkNob2ljZSB0YWxsaWVzIGJveCBtdXN0IGJlIHByZXNlbnQgaW4gYm94IHRfLiIKICAgIGFzc2VydCAvLyBDaG9pY2UgdGFsbGllcyBib3ggbXVzdCBiZSBwcmVzZW50IGluIGJveCB0Xy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDg0CiAgICAvLyBmb3IgcGFnZSBpbiB1cmFuZ2Uoc2VsZi5wb2xsX2Nob2ljZV9wYWdlcyk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gInBvbGxfY2hvaWNlX3BhZ2VzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfY2hvaWNlX3BhZ2VzIGV4aXN0cwogICAgaW50Y18wIC8vIDAKCnRlcm1pbmF0ZV9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA4NAogICAgLy8gZm9yIHBhZ2UgaW4gdXJhbmdlKHNlbGYucG9sbF9jaG9pY2VfcGFnZXMpOgogICAgZnJhbWVfZGlnIDUKICAgIGZyYW1lX2RpZyA0CiAgICA8CiAgICBieiB0ZXJtaW5hdGVfYWZ0ZXJfZm9yQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMDg1CiAgICAvLyBkZWwgc2VsZi5ib3hfY19wb2xsX2Nob2ljZXNbYXJjNC5VSW50OChwYWdlKV0KICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNyAxCiAgICBieXRlYyAyMSAvLyAweDYzNWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA4NAogICAgLy8gZm9yIHBhZ2UgaW4gdXJhbmdlKHNlbGYucG9sbF9jaG9pY2VfcGFnZXMpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNQogICAgYiB0ZXJtaW5hdGVfZm9yX2hlYWRlckAxCgp0ZXJtaW5hdGVfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA4Ny0xMDg4CiAgICAvLyAjIERlbGV0ZSBldmVyeSBudWxsaWZpZXIgYml0bWFwIHBhZ2UgYW5kIHJlbWFpbmluZyB2b3RlciBwYWdlIGJveCBmcm9tIGJveCBzdG9yYWdlCiAgICAvLyBmb3IgcGFnZSBpbiB1cmFuZ2Uoc2VsZi5wb2xsX251bGxpZmllcl9wYWdlcyk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicG9sbF9udWxsaWZpZXJfcGFnZXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX251bGxpZmllcl9wYWdlcyBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDUKCnRlcm1pbmF0ZV9mb3JfaGVhZGVyQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA4Ny0xMDg4CiAgICAvLyAjIERlbGV0ZSBldmVyeSBudWxsaWZpZXIgYml0bWFwIHBhZ2UgYW5kIHJlbWFpbmluZyB2b3RlciBwYWdlIGJveCBmcm9tIGJveCBzdG9yYWdlCiAgICAvLyBmb3IgcGFnZSBpbiB1cmFuZ2Uoc2VsZi5wb2xsX251bGxpZmllcl9wYWdlcyk6CiAgICBmcmFtZV9kaWcgNQogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGJ6IHRlcm1pbmF0ZV9hZnRlcl9mb3JAOAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwOTAKICAgIC8vIHNlbGYubnVsbGlmaWVyX3BhZ2Vfa2V5KHBhZ2UpCiAgICBmcmFtZV9kaWcgNQogICAgZHVwCiAgICBjYWxsc3ViIG51bGxpZmllcl9wYWdlX2tleQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwODktMTA5MQogICAgLy8gYXNzZXJ0IG9wLkJveC5kZWxldGUoCiAgICAvLyAgICAgc2VsZi5udWxsaWZpZXJfcGFnZV9rZXkocGFnZSkKICAgIC8vICksICJOdWxsaWZpZXIgcGFnZSBtdXN0IGJlIHByZXNlbnQgaW4gYm94IG5fLiIKICAgIGJveF9kZWwKICAgIGFzc2VydCAvLyBOdWxsaWZpZXIgcGFnZSBtdXN0IGJlIHByZXNlbnQgaW4gYm94IG5fLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwODctMTA4OAogICAgLy8gIyBEZWxldGUgZXZlcnkgbnVsbGlmaWVyIGJpdG1hcCBwYWdlIGFuZCByZW1haW5pbmcgdm90ZXIgcGFnZSBib3ggZnJvbSBib3ggc3RvcmFnZQogICAgLy8gZm9yIHBhZ2UgaW4gdXJhbmdlKHNlbGYucG9sbF9udWxsaWZpZXJfcGFnZXMpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNQogICAgYiB0ZXJtaW5hdGVfZm9yX2hlYWRlckA1Cgp0ZXJtaW5hdGVfYWZ0ZXJfZm9yQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA5MwogICAgLy8gZm9yIHBhZ2UgaW4gdXJhbmdlKHNlbGYucG9sbF92b3Rlcl9wYWdlcyk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAicG9sbF92b3Rlcl9wYWdlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDMKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfdm90ZXJfcGFnZXMgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA1Cgp0ZXJtaW5hdGVfZm9yX2hlYWRlckA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwOTMKICAgIC8vIGZvciBwYWdlIGluIHVyYW5nZShzZWxmLnBvbGxfdm90ZXJfcGFnZXMpOgogICAgZnJhbWVfZGlnIDUKICAgIGZyYW1lX2RpZyAzCiAgICA8CiAgICBieiB0ZXJtaW5hdGVfYWZ0ZXJfZm9yQDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTA5NQogICAgLy8gc2VsZi52b3Rlcl9wYWdlX2tleShwYWdlKQogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgY2FsbHN1YiB2b3Rlcl9wYWdlX2tleQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwOTQtMTA5NgogICAgLy8gYXNzZXJ0IG9wLkJveC5kZWxldGUoCiAgICAvLyAgICAgc2VsZi52b3Rlcl9wYWdlX2tleShwYWdlKQogICAgLy8gKSwgIlZvdGVyIHBhZ2UgbXVzdCBiZSBwcmVzZW50IGluIGJveCBwXy4iCiAgICBib3hfZGVsCiAgICBhc3NlcnQgLy8gVm90ZXIgcGFnZSBtdXN0IGJlIHByZXNlbnQgaW4gYm94IHBfLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwOTMKICAgIC8vIGZvciBwYWdlIGluIHVyYW5nZShzZWxmLnBvbGxfdm90ZXJfcGFnZXMpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNQogICAgYiB0ZXJtaW5hdGVfZm9yX2hlYWRlckA5Cgp0ZXJtaW5hdGVfYWZ0ZXJfZm9yQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjEwOTgtMTA5OQogICAgLy8gIyBEZWZpbmUgZmluYWwgZGVsZXRlIGFwcCByZWZ1bmQgdHJhbnNhY3Rpb24KICAgIC8vIGlmIHNlbGYudG90YWxfcHVyZ2VkX2JveF9hXyA+IFVJbnQ2NCgwKToKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJ0b3RhbF9wdXJnZWRfYm94X2FfIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3B1cmdlZF9ib3hfYV8gZXhpc3RzCiAgICBieiB0ZXJtaW5hdGVfZWxzZV9ib2R5QDE1CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTEwMC0xMTA5CiAgICAvLyAjIEV4ZWN1dGUgaW5uZXIgdHJhbnNhY3Rpb24gcGF5bWVudCB3aXRoIHB1cmdlIHJlZnVuZCBhbmQgY2xvc2UgcmVtYWluZGVyCiAgICAvLyBkZWxfYXBwX3JlZnVuZF9pdHhuID0gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PSgKICAgIC8vICAgICAgICAgc2VsZi50b3RhbF9wdXJnZWRfYm94X2FfICogVUludDY0KEJPWF9BX01CUikgLSBVSW50NjQoTUlOX1RYTl9GRUUpCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBmZWU9TUlOX1RYTl9GRUUsCiAgICAvLyAgICAgY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTEwMgogICAgLy8gc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExMDMKICAgIC8vIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMTA1CiAgICAvLyBzZWxmLnRvdGFsX3B1cmdlZF9ib3hfYV8gKiBVSW50NjQoQk9YX0FfTUJSKSAtIFVJbnQ2NChNSU5fVFhOX0ZFRSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJ0b3RhbF9wdXJnZWRfYm94X2FfIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3B1cmdlZF9ib3hfYV8gZXhpc3RzCiAgICBpbnRjIDQgLy8gMTYxMDAKICAgICoKICAgIGludGMgNSAvLyAxMDAwCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTEwOAogICAgLy8gY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIGl0eG5fZmllbGQgQ2xvc2VSZW1haW5kZXJUbwogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTEwMC0xMTAxCiAgICAvLyAjIEV4ZWN1dGUgaW5uZXIgdHJhbnNhY3Rpb24gcGF5bWVudCB3aXRoIHB1cmdlIHJlZnVuZCBhbmQgY2xvc2UgcmVtYWluZGVyCiAgICAvLyBkZWxfYXBwX3JlZnVuZF9pdHhuID0gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExMDcKICAgIC8vIGZlZT1NSU5fVFhOX0ZFRSwKICAgIGludGMgNSAvLyAxMDAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExMDAtMTEwOQogICAgLy8gIyBFeGVjdXRlIGlubmVyIHRyYW5zYWN0aW9uIHBheW1lbnQgd2l0aCBwdXJnZSByZWZ1bmQgYW5kIGNsb3NlIHJlbWFpbmRlcgogICAgLy8gZGVsX2FwcF9yZWZ1bmRfaXR4biA9IGl0eG4uUGF5bWVudCgKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD0oCiAgICAvLyAgICAgICAgIHNlbGYudG90YWxfcHVyZ2VkX2JveF9hXyAqIFVJbnQ2NChCT1hfQV9NQlIpIC0gVUludDY0KE1JTl9UWE5fRkVFKQogICAgLy8gICAgICksCiAgICAvLyAgICAgZmVlPU1JTl9UWE5fRkVFLAogICAgLy8gICAgIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gU2VuZGVyCiAgICBpdHhuIFJlY2VpdmVyCiAgICBmcmFtZV9idXJ5IDEKICAgIGl0eG4gQ2xvc2VSZW1haW5kZXJUbwogICAgZnJhbWVfYnVyeSAwCiAgICBiIHRlcm1pbmF0ZV9hZnRlcl9pZl9lbHNlQDE3Cgp0ZXJtaW5hdGVfZWxzZV9ib2R5QDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExMTEtMTExOAogICAgLy8gIyBFeGVjdXRlIGlubmVyIHRyYW5zYWN0aW9uIHRoYXQgb25seSBjbG9zZXMgYXBwIHJlbWFpbmRlciBiYWxhbmNlIHRvIHRoZSBjcmVhdG9yCiAgICAvLyBkZWxfYXBwX3JlZnVuZF9pdHhuID0gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PVVJbnQ2NCgwKSwgICMgU2VuZCB6ZXJvIGFtb3VudAogICAgLy8gICAgIGZlZT1NSU5fVFhOX0ZFRSwKICAgIC8vICAgICBjbG9zZV9yZW1haW5kZXJfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMTEzCiAgICAvLyBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTExNAogICAgLy8gcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExMTcKICAgIC8vIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZHVwCiAgICBpdHhuX2ZpZWxkIENsb3NlUmVtYWluZGVyVG8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMTE1CiAgICAvLyBhbW91bnQ9VUludDY0KDApLCAgIyBTZW5kIHplcm8gYW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTExMS0xMTEyCiAgICAvLyAjIEV4ZWN1dGUgaW5uZXIgdHJhbnNhY3Rpb24gdGhhdCBvbmx5IGNsb3NlcyBhcHAgcmVtYWluZGVyIGJhbGFuY2UgdG8gdGhlIGNyZWF0b3IKICAgIC8vIGRlbF9hcHBfcmVmdW5kX2l0eG4gPSBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTExNgogICAgLy8gZmVlPU1JTl9UWE5fRkVFLAogICAgaW50YyA1IC8vIDEwMDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTExMS0xMTE4CiAgICAvLyAjIEV4ZWN1dGUgaW5uZXIgdHJhbnNhY3Rpb24gdGhhdCBvbmx5IGNsb3NlcyBhcHAgcmVtYWluZGVyIGJhbGFuY2UgdG8gdGhlIGNyZWF0b3IKICAgIC8vIGRlbF9hcHBfcmVmdW5kX2l0eG4gPSBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9VUludDY0KDApLCAgIyBTZW5kIHplcm8gYW1vdW50CiAgICAvLyAgICAgZmVlPU1JTl9UWE5fRkVFLAogICAgLy8gICAgIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gU2VuZGVyCiAgICBpdHhuIFJlY2VpdmVyCiAgICBmcmFtZV9idXJ5IDEKICAgIGl0eG4gQ2xvc2VSZW1haW5kZXJUbwogICAgZnJhbWVfYnVyeSAwCgp0ZXJtaW5hdGVfYWZ0ZXJfaWZfZWxzZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMTIxCiAgICAvLyBkZWxfYXBwX3JlZnVuZF9pdHhuLnNlbmRlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMTIwLTExMjIKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZGVsX2FwcF9yZWZ1bmRfaXR4bi5zZW5kZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgImRlbF9hcHBfcmVmdW5kX2l0eG4gJ3NlbmRlcicgYWRkcmVzcyBtdXN0IG1hdGNoIEFwcGxpY2F0aW9uIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIGRlbF9hcHBfcmVmdW5kX2l0eG4gJ3NlbmRlcicgYWRkcmVzcyBtdXN0IG1hdGNoIEFwcGxpY2F0aW9uIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTEyNQogICAgLy8gZGVsX2FwcF9yZWZ1bmRfaXR4bi5yZWNlaXZlcgogICAgZnJhbWVfZGlnIDEKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgIT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMTI1LTExMjYKICAgIC8vIGRlbF9hcHBfcmVmdW5kX2l0eG4ucmVjZWl2ZXIKICAgIC8vIGFuZCBkZWxfYXBwX3JlZnVuZF9pdHhuLmNsb3NlX3JlbWFpbmRlcl90byA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBieiB0ZXJtaW5hdGVfYm9vbF9mYWxzZUAyMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExMjYKICAgIC8vIGFuZCBkZWxfYXBwX3JlZnVuZF9pdHhuLmNsb3NlX3JlbWFpbmRlcl90byA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgMAogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExMjUtMTEyNgogICAgLy8gZGVsX2FwcF9yZWZ1bmRfaXR4bi5yZWNlaXZlcgogICAgLy8gYW5kIGRlbF9hcHBfcmVmdW5kX2l0eG4uY2xvc2VfcmVtYWluZGVyX3RvID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIGJ6IHRlcm1pbmF0ZV9ib29sX2ZhbHNlQDIwCiAgICBpbnRjXzEgLy8gMQogICAgYiB0ZXJtaW5hdGVfYm9vbF9tZXJnZUAyMQoKdGVybWluYXRlX2Jvb2xfZmFsc2VAMjA6CiAgICBpbnRjXzAgLy8gMAoKdGVybWluYXRlX2Jvb2xfbWVyZ2VAMjE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTEyNC0xMTI3CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGRlbF9hcHBfcmVmdW5kX2l0eG4ucmVjZWl2ZXIKICAgIC8vICAgICBhbmQgZGVsX2FwcF9yZWZ1bmRfaXR4bi5jbG9zZV9yZW1haW5kZXJfdG8gPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgImRlbF9hcHBfcmVmdW5kX2l0eG4gJ3JlY2lldmVyJyBhbmQgJ2Nsb3NlX3JlbWFpbmRlcl90bycgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIENyZWF0b3IgYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gZGVsX2FwcF9yZWZ1bmRfaXR4biAncmVjaWV2ZXInIGFuZCAnY2xvc2VfcmVtYWluZGVyX3RvJyBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gQ3JlYXRvciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExMzIKICAgIC8vICsgc2VsZi5wb2xsX2Nob2ljZV9wYWdlcwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJwb2xsX2Nob2ljZV9wYWdlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX2Nob2ljZV9wYWdlcyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMTMxCiAgICAvLyBVSW50NjQoMikKICAgIGludGNfMiAvLyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29udHJhY3QucHk6MTEzMS0xMTMyCiAgICAvLyBVSW50NjQoMikKICAgIC8vICsgc2VsZi5wb2xsX2Nob2ljZV9wYWdlcwogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExMzMKICAgIC8vICsgc2VsZi5wb2xsX251bGxpZmllcl9wYWdlcwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInBvbGxfbnVsbGlmaWVyX3BhZ2VzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvbGxfbnVsbGlmaWVyX3BhZ2VzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExMzEtMTEzMwogICAgLy8gVUludDY0KDIpCiAgICAvLyArIHNlbGYucG9sbF9jaG9pY2VfcGFnZXMKICAgIC8vICsgc2VsZi5wb2xsX251bGxpZmllcl9wYWdlcwogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExMzQKICAgIC8vICsgc2VsZi5wb2xsX3ZvdGVyX3BhZ2VzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAicG9sbF92b3Rlcl9wYWdlcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb2xsX3ZvdGVyX3BhZ2VzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbnRyYWN0LnB5OjExMzEtMTEzNAogICAgLy8gVUludDY0KDIpCiAgICAvLyArIHNlbGYucG9sbF9jaG9pY2VfcGFnZXMKICAgIC8vICsgc2VsZi5wb2xsX251bGxpZmllcl9wYWdlcwogICAgLy8gKyBzZWxmLnBvbGxfdm90ZXJfcGFnZXMKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb250cmFjdC5weToxMTI5LTExMzUKICAgIC8vICMgQ3JlYXRvciBib3ggYV8gYW5kIHRhbGxpZXMgYm94LCBwbHVzIGV2ZXJ5IHBvbGwgY2hvaWNlcywgbnVsbGlmaWVyIGFuZCB2b3RlciBwYWdlIGJveAogICAgLy8gbG9nX3RlbGVtZXRyeSgKICAgIC8vICAgICBVSW50NjQoMikKICAgIC8vICAgICArIHNlbGYucG9sbF9jaG9pY2VfcGFnZXMKICAgIC8vICAgICArIHNlbGYucG9sbF9udWxsaWZpZXJfcGFnZXMKICAgIC8vICAgICArIHNlbGYucG9sbF92b3Rlcl9wYWdlcwogICAgLy8gKQogICAgY2FsbHN1YiBsb2dfdGVsZW1ldHJ5CiAgICByZXRzdWIKCgovLyBfcHV5YV9saWIudXRpbC5lbnN1cmVfYnVkZ2V0KHJlcXVpcmVkX2J1ZGdldDogdWludDY0LCBmZWVfc291cmNlOiB1aW50NjQpIC0+IHZvaWQ6CmVuc3VyZV9idWRnZXQ6CiAgICBwcm90byAyIDAKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGludCAxMCAvLyAxMAogICAgKwoKZW5zdXJlX2J1ZGdldF93aGlsZV90b3BAMToKICAgIGZyYW1lX2RpZyAwCiAgICBnbG9iYWwgT3Bjb2RlQnVkZ2V0CiAgICA+CiAgICBieiBlbnN1cmVfYnVkZ2V0X2FmdGVyX3doaWxlQDcKICAgIGl0eG5fYmVnaW4KICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBwdXNoaW50IDUgLy8gRGVsZXRlQXBwbGljYXRpb24KICAgIGl0eG5fZmllbGQgT25Db21wbGV0aW9uCiAgICBieXRlYyAyNCAvLyAweDA2ODEwMQogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW0KICAgIGJ5dGVjIDI0IC8vIDB4MDY4MTAxCiAgICBpdHhuX2ZpZWxkIENsZWFyU3RhdGVQcm9ncmFtCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3aXRjaCBlbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlXzBAMyBlbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlXzFANAogICAgYiBlbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlX25leHRANgoKZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV8wQDM6CiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGIgZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV9uZXh0QDYKCmVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMUA0OgogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgaXR4bl9maWVsZCBGZWUKCmVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfbmV4dEA2OgogICAgaXR4bl9zdWJtaXQKICAgIGIgZW5zdXJlX2J1ZGdldF93aGlsZV90b3BAMQoKZW5zdXJlX2J1ZGdldF9hZnRlcl93aGlsZUA3OgogICAgcmV0c3ViCg==",
+        "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29udHJhY3QuT3BlbkJhbGxvdC5jbGVhcl9zdGF0ZV9wcm9ncmFtOgogICAgcHVzaGludCAxIC8vIDEKICAgIHJldHVybgo="
     },
     "state": {
         "global": {
-            "num_byte_slices": 4,
-            "num_uints": 7
+            "num_byte_slices": 3,
+            "num_uints": 12
         },
         "local": {
             "num_byte_slices": 0,
@@ -86,17 +180,13 @@ _APP_SPEC_JSON = r"""{
     "schema": {
         "global": {
             "declared": {
-                "poll_choice1": {
-                    "type": "bytes",
-                    "key": "poll_choice1"
-                },
-                "poll_choice2": {
-                    "type": "bytes",
-                    "key": "poll_choice2"
+                "poll_choice_pages": {
+                    "type": "uint64",
+                    "key": "poll_choice_pages"
                 },
-                "poll_choice3": {
+                "poll_eligibility_root": {
                     "type": "bytes",
-                    "key": "poll_choice3"
+                    "key": "poll_eligibility_root"
                 },
                 "poll_end_date_unix": {
                     "type": "uint64",
@@ -106,6 +196,26 @@ _APP_SPEC_JSON = r"""{
                     "type": "uint64",
                     "key": "poll_finalized"
                 },
+                "poll_last_paged_voter": {
+                    "type": "bytes",
+                    "key": "poll_last_paged_voter"
+                },
+                "poll_nullifier_pages": {
+                    "type": "uint64",
+                    "key": "poll_nullifier_pages"
+                },
+                "poll_num_choices": {
+                    "type": "uint64",
+                    "key": "poll_num_choices"
+                },
+                "poll_num_choices_added": {
+                    "type": "uint64",
+                    "key": "poll_num_choices_added"
+                },
+                "poll_registration_mode": {
+                    "type": "uint64",
+                    "key": "poll_registration_mode"
+                },
                 "poll_start_date_unix": {
                     "type": "uint64",
                     "key": "poll_start_date_unix"
@@ -114,17 +224,17 @@ _APP_SPEC_JSON = r"""{
                     "type": "bytes",
                     "key": "poll_title"
                 },
-                "total_choice1": {
+                "poll_voter_pages": {
                     "type": "uint64",
-                    "key": "total_choice1"
+                    "key": "poll_voter_pages"
                 },
-                "total_choice2": {
+                "total_events": {
                     "type": "uint64",
-                    "key": "total_choice2"
+                    "key": "total_events"
                 },
-                "total_choice3": {
+                "total_paged_voters": {
                     "type": "uint64",
-                    "key": "total_choice3"
+                    "key": "total_paged_voters"
                 },
                 "total_purged_box_a_": {
                     "type": "uint64",
@@ -155,6 +265,32 @@ _APP_SPEC_JSON = r"""{
                     "type": "uint64"
                 }
             },
+            {
+                "name": "get_poll",
+                "args": [],
+                "returns": {
+                    "type": "(byte[],byte[],uint64,uint64,uint64,uint64)"
+                }
+            },
+            {
+                "name": "get_results",
+                "args": [],
+                "returns": {
+                    "type": "((byte[],byte[],uint64,uint64,uint64,uint64),uint64[])"
+                }
+            },
+            {
+                "name": "get_voters_data",
+                "args": [
+                    {
+                        "type": "address[]",
+                        "name": "voters"
+                    }
+                ],
+                "returns": {
+                    "type": "(uint8,(uint8))[]"
+                }
+            },
             {
                 "name": "set_poll",
                 "args": [
@@ -163,16 +299,12 @@ _APP_SPEC_JSON = r"""{
                         "name": "title"
                     },
                     {
-                        "type": "byte[]",
-                        "name": "choice1"
-                    },
-                    {
-                        "type": "byte[]",
-                        "name": "choice2"
+                        "type": "uint64",
+                        "name": "num_choices"
                     },
                     {
                         "type": "byte[]",
-                        "name": "choice3"
+                        "name": "eligibility_root"
                     },
                     {
                         "type": "uint64",
@@ -187,6 +319,22 @@ _APP_SPEC_JSON = r"""{
                     "type": "void"
                 }
             },
+            {
+                "name": "add_poll_choices",
+                "args": [
+                    {
+                        "type": "byte[][]",
+                        "name": "choices"
+                    },
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
             {
                 "name": "fund_app_mbr",
                 "args": [
@@ -211,6 +359,22 @@ _APP_SPEC_JSON = r"""{
                     "type": "void"
                 }
             },
+            {
+                "name": "register_voters",
+                "args": [
+                    {
+                        "type": "address[]",
+                        "name": "voters"
+                    },
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
             {
                 "name": "submit_vote",
                 "args": [
@@ -223,6 +387,102 @@ _APP_SPEC_JSON = r"""{
                     "type": "void"
                 }
             },
+            {
+                "name": "register_and_vote",
+                "args": [
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    },
+                    {
+                        "type": "uint8",
+                        "name": "choice"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "register_paged_voters",
+                "args": [
+                    {
+                        "type": "address[]",
+                        "name": "voters"
+                    },
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "submit_paged_vote",
+                "args": [
+                    {
+                        "type": "uint8",
+                        "name": "choice"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "slot"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "purge_voter_pages",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "num_pages"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "allocate_nullifier_pages",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "num_pages"
+                    },
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "submit_vote_with_proof",
+                "args": [
+                    {
+                        "type": "uint8",
+                        "name": "choice"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "leaf_index"
+                    },
+                    {
+                        "type": "byte[32][]",
+                        "name": "proof"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
             {
                 "name": "delete_box_storage",
                 "args": [],
@@ -239,7 +499,19 @@ _APP_SPEC_JSON = r"""{
                     }
                 ],
                 "returns": {
-                    "type": "void"
+                    "type": "uint64"
+                }
+            },
+            {
+                "name": "try_purge_box_storage",
+                "args": [
+                    {
+                        "type": "address[]",
+                        "name": "box_keys"
+                    }
+                ],
+                "returns": {
+                    "type": "uint64"
                 }
             },
             {
@@ -344,18 +616,60 @@ class GetVersionUnixArgs(_ArgsBase[int]):
         return "get_version_unix()uint64"
 
 
+@dataclasses.dataclass(kw_only=True)
+class PollInfo:
+    title: bytes | bytearray
+    eligibility_root: bytes | bytearray
+    start_date_unix: int
+    end_date_unix: int
+    finalized: int
+    num_choices: int
+
+
+@dataclasses.dataclass(kw_only=True)
+class GetPollArgs(_ArgsBase[PollInfo]):
+    @staticmethod
+    def method() -> str:
+        return "get_poll()(byte[],byte[],uint64,uint64,uint64,uint64)"
+
+
+@dataclasses.dataclass(kw_only=True)
+class GetResultsArgs(_ArgsBase[tuple[tuple[bytes | bytearray, bytes | bytearray, int, int, int, int], list[int]]]):
+    @staticmethod
+    def method() -> str:
+        return "get_results()((byte[],byte[],uint64,uint64,uint64,uint64),uint64[])"
+
+
+@dataclasses.dataclass(kw_only=True)
+class GetVotersDataArgs(_ArgsBase[list[tuple[int, tuple[int]]]]):
+    voters: list[str]
+
+    @staticmethod
+    def method() -> str:
+        return "get_voters_data(address[])(uint8,(uint8))[]"
+
+
 @dataclasses.dataclass(kw_only=True)
 class SetPollArgs(_ArgsBase[None]):
     title: bytes | bytearray
-    choice1: bytes | bytearray
-    choice2: bytes | bytearray
-    choice3: bytes | bytearray
+    num_choices: int
+    eligibility_root: bytes | bytearray
     start_date_unix: int
     end_date_unix: int
 
     @staticmethod
     def method() -> str:
-        return "set_poll(byte[],byte[],byte[],byte[],uint64,uint64)void"
+        return "set_poll(byte[],uint64,byte[],uint64,uint64)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class AddPollChoicesArgs(_ArgsBase[None]):
+    choices: list[bytes | bytearray]
+    mbr_pay: TransactionWithSigner
+
+    @staticmethod
+    def method() -> str:
+        return "add_poll_choices(byte[][],pay)void"
 
 
 @dataclasses.dataclass(kw_only=True)
@@ -376,6 +690,16 @@ class RequestBoxStorageArgs(_ArgsBase[None]):
         return "request_box_storage(pay)void"
 
 
+@dataclasses.dataclass(kw_only=True)
+class RegisterVotersArgs(_ArgsBase[None]):
+    voters: list[str]
+    mbr_pay: TransactionWithSigner
+
+    @staticmethod
+    def method() -> str:
+        return "register_voters(address[],pay)void"
+
+
 @dataclasses.dataclass(kw_only=True)
 class SubmitVoteArgs(_ArgsBase[None]):
     choice: int
@@ -386,24 +710,93 @@ class SubmitVoteArgs(_ArgsBase[None]):
 
 
 @dataclasses.dataclass(kw_only=True)
-class DeleteBoxStorageArgs(_ArgsBase[None]):
+class RegisterAndVoteArgs(_ArgsBase[None]):
+    mbr_pay: TransactionWithSigner
+    choice: int
+
     @staticmethod
     def method() -> str:
-        return "delete_box_storage()void"
+        return "register_and_vote(pay,uint8)void"
 
 
 @dataclasses.dataclass(kw_only=True)
-class PurgeBoxStorageArgs(_ArgsBase[None]):
-    box_keys: list[str]
+class RegisterPagedVotersArgs(_ArgsBase[None]):
+    voters: list[str]
+    mbr_pay: TransactionWithSigner
 
     @staticmethod
     def method() -> str:
-        return "purge_box_storage(address[])void"
+        return "register_paged_voters(address[],pay)void"
 
 
 @dataclasses.dataclass(kw_only=True)
-class GenerateArgs(_ArgsBase[None]):
-    @staticmethod
+class SubmitPagedVoteArgs(_ArgsBase[None]):
+    choice: int
+    slot: int
+
+    @staticmethod
+    def method() -> str:
+        return "submit_paged_vote(uint8,uint64)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class PurgeVoterPagesArgs(_ArgsBase[None]):
+    num_pages: int
+
+    @staticmethod
+    def method() -> str:
+        return "purge_voter_pages(uint64)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class AllocateNullifierPagesArgs(_ArgsBase[None]):
+    num_pages: int
+    mbr_pay: TransactionWithSigner
+
+    @staticmethod
+    def method() -> str:
+        return "allocate_nullifier_pages(uint64,pay)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class SubmitVoteWithProofArgs(_ArgsBase[None]):
+    choice: int
+    leaf_index: int
+    proof: list[bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]]
+
+    @staticmethod
+    def method() -> str:
+        return "submit_vote_with_proof(uint8,uint64,byte[32][])void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class DeleteBoxStorageArgs(_ArgsBase[None]):
+    @staticmethod
+    def method() -> str:
+        return "delete_box_storage()void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class PurgeBoxStorageArgs(_ArgsBase[int]):
+    box_keys: list[str]
+
+    @staticmethod
+    def method() -> str:
+        return "purge_box_storage(address[])uint64"
+
+
+@dataclasses.dataclass(kw_only=True)
+class TryPurgeBoxStorageArgs(_ArgsBase[int]):
+    box_keys: list[str]
+
+    @staticmethod
+    def method() -> str:
+        return "try_purge_box_storage(address[])uint64"
+
+
+@dataclasses.dataclass(kw_only=True)
+class GenerateArgs(_ArgsBase[None]):
+    @staticmethod
     def method() -> str:
         return "generate()void"
 
@@ -438,16 +831,20 @@ class ByteReader:
 
 class GlobalState:
     def __init__(self, data: dict[bytes, bytes | int]):
-        self.poll_choice1 = ByteReader(typing.cast(bytes, data.get(b"poll_choice1")))
-        self.poll_choice2 = ByteReader(typing.cast(bytes, data.get(b"poll_choice2")))
-        self.poll_choice3 = ByteReader(typing.cast(bytes, data.get(b"poll_choice3")))
+        self.poll_choice_pages = typing.cast(int, data.get(b"poll_choice_pages"))
+        self.poll_eligibility_root = ByteReader(typing.cast(bytes, data.get(b"poll_eligibility_root")))
         self.poll_end_date_unix = typing.cast(int, data.get(b"poll_end_date_unix"))
         self.poll_finalized = typing.cast(int, data.get(b"poll_finalized"))
+        self.poll_last_paged_voter = ByteReader(typing.cast(bytes, data.get(b"poll_last_paged_voter")))
+        self.poll_nullifier_pages = typing.cast(int, data.get(b"poll_nullifier_pages"))
+        self.poll_num_choices = typing.cast(int, data.get(b"poll_num_choices"))
+        self.poll_num_choices_added = typing.cast(int, data.get(b"poll_num_choices_added"))
+        self.poll_registration_mode = typing.cast(int, data.get(b"poll_registration_mode"))
         self.poll_start_date_unix = typing.cast(int, data.get(b"poll_start_date_unix"))
         self.poll_title = ByteReader(typing.cast(bytes, data.get(b"poll_title")))
-        self.total_choice1 = typing.cast(int, data.get(b"total_choice1"))
-        self.total_choice2 = typing.cast(int, data.get(b"total_choice2"))
-        self.total_choice3 = typing.cast(int, data.get(b"total_choice3"))
+        self.poll_voter_pages = typing.cast(int, data.get(b"poll_voter_pages"))
+        self.total_events = typing.cast(int, data.get(b"total_events"))
+        self.total_paged_voters = typing.cast(int, data.get(b"total_paged_voters"))
         self.total_purged_box_a_ = typing.cast(int, data.get(b"total_purged_box_a_"))
 
 
@@ -501,35 +898,292 @@ class Composer:
         )
         return self
 
+    def get_poll(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `get_poll()(byte[],byte[],uint64,uint64,uint64,uint64)` ABI method
+        
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = GetPollArgs()
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def get_results(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `get_results()((byte[],byte[],uint64,uint64,uint64,uint64),uint64[])` ABI method
+        
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = GetResultsArgs()
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def get_voters_data(
+        self,
+        *,
+        voters: list[str],
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `get_voters_data(address[])(uint8,(uint8))[]` ABI method
+        
+        :param list[str] voters: The `voters` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = GetVotersDataArgs(
+            voters=voters,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
     def set_poll(
         self,
         *,
         title: bytes | bytearray,
-        choice1: bytes | bytearray,
-        choice2: bytes | bytearray,
-        choice3: bytes | bytearray,
+        num_choices: int,
+        eligibility_root: bytes | bytearray,
         start_date_unix: int,
         end_date_unix: int,
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> "Composer":
-        """Adds a call to `set_poll(byte[],byte[],byte[],byte[],uint64,uint64)void` ABI method
+        """Adds a call to `set_poll(byte[],uint64,byte[],uint64,uint64)void` ABI method
+        
+        :param bytes | bytearray title: The `title` ABI parameter
+        :param int num_choices: The `num_choices` ABI parameter
+        :param bytes | bytearray eligibility_root: The `eligibility_root` ABI parameter
+        :param int start_date_unix: The `start_date_unix` ABI parameter
+        :param int end_date_unix: The `end_date_unix` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = SetPollArgs(
+            title=title,
+            num_choices=num_choices,
+            eligibility_root=eligibility_root,
+            start_date_unix=start_date_unix,
+            end_date_unix=end_date_unix,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def add_poll_choices(
+        self,
+        *,
+        choices: list[bytes | bytearray],
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `add_poll_choices(byte[][],pay)void` ABI method
+        
+        :param list[bytes | bytearray] choices: The `choices` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = AddPollChoicesArgs(
+            choices=choices,
+            mbr_pay=mbr_pay,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def fund_app_mbr(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `fund_app_mbr(pay)void` ABI method
+        
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = FundAppMbrArgs(
+            mbr_pay=mbr_pay,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def request_box_storage(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `request_box_storage(pay)void` ABI method
+        
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = RequestBoxStorageArgs(
+            mbr_pay=mbr_pay,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def register_voters(
+        self,
+        *,
+        voters: list[str],
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `register_voters(address[],pay)void` ABI method
+        
+        :param list[str] voters: The `voters` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = RegisterVotersArgs(
+            voters=voters,
+            mbr_pay=mbr_pay,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def submit_vote(
+        self,
+        *,
+        choice: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `submit_vote(uint8)void` ABI method
+        
+        :param int choice: The `choice` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = SubmitVoteArgs(
+            choice=choice,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def register_and_vote(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        choice: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `register_and_vote(pay,uint8)void` ABI method
+        
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param int choice: The `choice` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = RegisterAndVoteArgs(
+            mbr_pay=mbr_pay,
+            choice=choice,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def register_paged_voters(
+        self,
+        *,
+        voters: list[str],
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `register_paged_voters(address[],pay)void` ABI method
+        
+        :param list[str] voters: The `voters` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = RegisterPagedVotersArgs(
+            voters=voters,
+            mbr_pay=mbr_pay,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def submit_paged_vote(
+        self,
+        *,
+        choice: int,
+        slot: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `submit_paged_vote(uint8,uint64)void` ABI method
         
-        :param bytes | bytearray title: The `title` ABI parameter
-        :param bytes | bytearray choice1: The `choice1` ABI parameter
-        :param bytes | bytearray choice2: The `choice2` ABI parameter
-        :param bytes | bytearray choice3: The `choice3` ABI parameter
-        :param int start_date_unix: The `start_date_unix` ABI parameter
-        :param int end_date_unix: The `end_date_unix` ABI parameter
+        :param int choice: The `choice` ABI parameter
+        :param int slot: The `slot` ABI parameter
         :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
         :returns Composer: This Composer instance"""
 
-        args = SetPollArgs(
-            title=title,
-            choice1=choice1,
-            choice2=choice2,
-            choice3=choice3,
-            start_date_unix=start_date_unix,
-            end_date_unix=end_date_unix,
+        args = SubmitPagedVoteArgs(
+            choice=choice,
+            slot=slot,
         )
         self.app_client.compose_call(
             self.atc,
@@ -539,20 +1193,20 @@ class Composer:
         )
         return self
 
-    def fund_app_mbr(
+    def purge_voter_pages(
         self,
         *,
-        mbr_pay: TransactionWithSigner,
+        num_pages: int,
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> "Composer":
-        """Adds a call to `fund_app_mbr(pay)void` ABI method
+        """Adds a call to `purge_voter_pages(uint64)void` ABI method
         
-        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param int num_pages: The `num_pages` ABI parameter
         :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
         :returns Composer: This Composer instance"""
 
-        args = FundAppMbrArgs(
-            mbr_pay=mbr_pay,
+        args = PurgeVoterPagesArgs(
+            num_pages=num_pages,
         )
         self.app_client.compose_call(
             self.atc,
@@ -562,19 +1216,22 @@ class Composer:
         )
         return self
 
-    def request_box_storage(
+    def allocate_nullifier_pages(
         self,
         *,
+        num_pages: int,
         mbr_pay: TransactionWithSigner,
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> "Composer":
-        """Adds a call to `request_box_storage(pay)void` ABI method
+        """Adds a call to `allocate_nullifier_pages(uint64,pay)void` ABI method
         
+        :param int num_pages: The `num_pages` ABI parameter
         :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
         :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
         :returns Composer: This Composer instance"""
 
-        args = RequestBoxStorageArgs(
+        args = AllocateNullifierPagesArgs(
+            num_pages=num_pages,
             mbr_pay=mbr_pay,
         )
         self.app_client.compose_call(
@@ -585,20 +1242,26 @@ class Composer:
         )
         return self
 
-    def submit_vote(
+    def submit_vote_with_proof(
         self,
         *,
         choice: int,
+        leaf_index: int,
+        proof: list[bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]],
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> "Composer":
-        """Adds a call to `submit_vote(uint8)void` ABI method
+        """Adds a call to `submit_vote_with_proof(uint8,uint64,byte[32][])void` ABI method
         
         :param int choice: The `choice` ABI parameter
+        :param int leaf_index: The `leaf_index` ABI parameter
+        :param list[bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] proof: The `proof` ABI parameter
         :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
         :returns Composer: This Composer instance"""
 
-        args = SubmitVoteArgs(
+        args = SubmitVoteWithProofArgs(
             choice=choice,
+            leaf_index=leaf_index,
+            proof=proof,
         )
         self.app_client.compose_call(
             self.atc,
@@ -633,7 +1296,7 @@ class Composer:
         box_keys: list[str],
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> "Composer":
-        """Adds a call to `purge_box_storage(address[])void` ABI method
+        """Adds a call to `purge_box_storage(address[])uint64` ABI method
         
         :param list[str] box_keys: The `box_keys` ABI parameter
         :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
@@ -650,6 +1313,29 @@ class Composer:
         )
         return self
 
+    def try_purge_box_storage(
+        self,
+        *,
+        box_keys: list[str],
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `try_purge_box_storage(address[])uint64` ABI method
+        
+        :param list[str] box_keys: The `box_keys` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = TryPurgeBoxStorageArgs(
+            box_keys=box_keys,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
     def create_generate(
         self,
         *,
@@ -854,23 +1540,82 @@ class OpenBallotClient:
         )
         return result
 
+    def get_poll(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[PollInfo]:
+        """Calls `get_poll()(byte[],byte[],uint64,uint64,uint64,uint64)` ABI method
+        
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[PollInfo]: The result of the transaction"""
+
+        args = GetPollArgs()
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        elements = self.app_spec.hints[args.method()].structs["output"]["elements"]
+        result_dict = {element[0]: value for element, value in zip(elements, result.return_value)}
+        result.return_value = PollInfo(**result_dict)
+        return result
+
+    def get_results(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[tuple[tuple[bytes | bytearray, bytes | bytearray, int, int, int, int], list[int]]]:
+        """Calls `get_results()((byte[],byte[],uint64,uint64,uint64,uint64),uint64[])` ABI method
+        
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[tuple[tuple[bytes | bytearray, bytes | bytearray, int, int, int, int], list[int]]]: The result of the transaction"""
+
+        args = GetResultsArgs()
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def get_voters_data(
+        self,
+        *,
+        voters: list[str],
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[list[tuple[int, tuple[int]]]]:
+        """Calls `get_voters_data(address[])(uint8,(uint8))[]` ABI method
+        
+        :param list[str] voters: The `voters` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[list[tuple[int, tuple[int]]]]: The result of the transaction"""
+
+        args = GetVotersDataArgs(
+            voters=voters,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
     def set_poll(
         self,
         *,
         title: bytes | bytearray,
-        choice1: bytes | bytearray,
-        choice2: bytes | bytearray,
-        choice3: bytes | bytearray,
+        num_choices: int,
+        eligibility_root: bytes | bytearray,
         start_date_unix: int,
         end_date_unix: int,
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
     ) -> algokit_utils.ABITransactionResponse[None]:
-        """Calls `set_poll(byte[],byte[],byte[],byte[],uint64,uint64)void` ABI method
+        """Calls `set_poll(byte[],uint64,byte[],uint64,uint64)void` ABI method
         
         :param bytes | bytearray title: The `title` ABI parameter
-        :param bytes | bytearray choice1: The `choice1` ABI parameter
-        :param bytes | bytearray choice2: The `choice2` ABI parameter
-        :param bytes | bytearray choice3: The `choice3` ABI parameter
+        :param int num_choices: The `num_choices` ABI parameter
+        :param bytes | bytearray eligibility_root: The `eligibility_root` ABI parameter
         :param int start_date_unix: The `start_date_unix` ABI parameter
         :param int end_date_unix: The `end_date_unix` ABI parameter
         :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
@@ -878,9 +1623,8 @@ class OpenBallotClient:
 
         args = SetPollArgs(
             title=title,
-            choice1=choice1,
-            choice2=choice2,
-            choice3=choice3,
+            num_choices=num_choices,
+            eligibility_root=eligibility_root,
             start_date_unix=start_date_unix,
             end_date_unix=end_date_unix,
         )
@@ -891,6 +1635,31 @@ class OpenBallotClient:
         )
         return result
 
+    def add_poll_choices(
+        self,
+        *,
+        choices: list[bytes | bytearray],
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `add_poll_choices(byte[][],pay)void` ABI method
+        
+        :param list[bytes | bytearray] choices: The `choices` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = AddPollChoicesArgs(
+            choices=choices,
+            mbr_pay=mbr_pay,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
     def fund_app_mbr(
         self,
         *,
@@ -935,6 +1704,31 @@ class OpenBallotClient:
         )
         return result
 
+    def register_voters(
+        self,
+        *,
+        voters: list[str],
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `register_voters(address[],pay)void` ABI method
+        
+        :param list[str] voters: The `voters` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = RegisterVotersArgs(
+            voters=voters,
+            mbr_pay=mbr_pay,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
     def submit_vote(
         self,
         *,
@@ -957,6 +1751,156 @@ class OpenBallotClient:
         )
         return result
 
+    def register_and_vote(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        choice: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `register_and_vote(pay,uint8)void` ABI method
+        
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param int choice: The `choice` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = RegisterAndVoteArgs(
+            mbr_pay=mbr_pay,
+            choice=choice,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def register_paged_voters(
+        self,
+        *,
+        voters: list[str],
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `register_paged_voters(address[],pay)void` ABI method
+        
+        :param list[str] voters: The `voters` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = RegisterPagedVotersArgs(
+            voters=voters,
+            mbr_pay=mbr_pay,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def submit_paged_vote(
+        self,
+        *,
+        choice: int,
+        slot: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `submit_paged_vote(uint8,uint64)void` ABI method
+        
+        :param int choice: The `choice` ABI parameter
+        :param int slot: The `slot` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = SubmitPagedVoteArgs(
+            choice=choice,
+            slot=slot,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def purge_voter_pages(
+        self,
+        *,
+        num_pages: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `purge_voter_pages(uint64)void` ABI method
+        
+        :param int num_pages: The `num_pages` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = PurgeVoterPagesArgs(
+            num_pages=num_pages,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def allocate_nullifier_pages(
+        self,
+        *,
+        num_pages: int,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `allocate_nullifier_pages(uint64,pay)void` ABI method
+        
+        :param int num_pages: The `num_pages` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = AllocateNullifierPagesArgs(
+            num_pages=num_pages,
+            mbr_pay=mbr_pay,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def submit_vote_with_proof(
+        self,
+        *,
+        choice: int,
+        leaf_index: int,
+        proof: list[bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]],
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `submit_vote_with_proof(uint8,uint64,byte[32][])void` ABI method
+        
+        :param int choice: The `choice` ABI parameter
+        :param int leaf_index: The `leaf_index` ABI parameter
+        :param list[bytes | bytearray | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] proof: The `proof` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = SubmitVoteWithProofArgs(
+            choice=choice,
+            leaf_index=leaf_index,
+            proof=proof,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
     def delete_box_storage(
         self,
         *,
@@ -980,12 +1924,12 @@ class OpenBallotClient:
         *,
         box_keys: list[str],
         transaction_parameters: algokit_utils.TransactionParameters | None = None,
-    ) -> algokit_utils.ABITransactionResponse[None]:
-        """Calls `purge_box_storage(address[])void` ABI method
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `purge_box_storage(address[])uint64` ABI method
         
         :param list[str] box_keys: The `box_keys` ABI parameter
         :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
-        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction"""
 
         args = PurgeBoxStorageArgs(
             box_keys=box_keys,
@@ -997,6 +1941,28 @@ class OpenBallotClient:
         )
         return result
 
+    def try_purge_box_storage(
+        self,
+        *,
+        box_keys: list[str],
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `try_purge_box_storage(address[])uint64` ABI method
+        
+        :param list[str] box_keys: The `box_keys` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction"""
+
+        args = TryPurgeBoxStorageArgs(
+            box_keys=box_keys,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
     def create_generate(
         self,
         *,
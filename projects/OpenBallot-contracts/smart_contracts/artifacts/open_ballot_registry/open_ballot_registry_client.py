@@ -0,0 +1,1164 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^1.2.0
+import base64
+import dataclasses
+import decimal
+import typing
+from abc import ABC, abstractmethod
+
+import algokit_utils
+import algosdk
+from algosdk.v2client import models
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+    SimulateAtomicTransactionResponse,
+    TransactionSigner,
+    TransactionWithSigner
+)
+
+_APP_SPEC_JSON = r"""{
+    "hints": {
+        "generate()void": {
+            "call_config": {
+                "no_op": "CREATE"
+            }
+        },
+        "get_version_unix()uint64": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "fund_app_mbr(pay)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "create_poll(byte[],byte[][],uint64,uint64,pay)uint64": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "request_box_storage(uint64,pay)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "submit_vote(uint64,uint8)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "delete_box_storage(uint64)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "purge_box_storage(uint64,address[])void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "close_poll(uint64)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "terminate()void": {
+            "call_config": {
+                "delete_application": "CALL"
+            }
+        }
+    },
+    "source": {
+        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3RfcmVnaXN0cnkuY29udHJhY3QuT3BlbkJhbGxvdFJlZ2lzdHJ5LmFwcHJvdmFsX3Byb2dyYW06CiAgICBpbnRjYmxvY2sgMSAwIDIgOCAxMDAwIDE5NzAwIFRNUExfVEVMRU1FVFJZIFRNUExfVkVSU0lPTl9VTklYIFRNUExfREVMRVRBQkxFCiAgICBieXRlY2Jsb2NrICJ0b3RhbF9vcGVuX3BvbGxzIiAweDcwNWYgMHg3NjVmICJ0b3RhbF9wb2xscyIgInRvdGFsX2V2ZW50cyIgMHgxNTFmN2M3NQogICAgY2FsbHN1YiBfX3B1eWFfYXJjNF9yb3V0ZXJfXwogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90X3JlZ2lzdHJ5LmNvbnRyYWN0Lk9wZW5CYWxsb3RSZWdpc3RyeS5fX3B1eWFfYXJjNF9yb3V0ZXJfXygpIC0+IHVpbnQ2NDoKX19wdXlhX2FyYzRfcm91dGVyX186CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTAyCiAgICAvLyBjbGFzcyBPcGVuQmFsbG90UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHByb3RvIDAgMQogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2FmdGVyX2lmX2Vsc2VAMTUKICAgIHB1c2hieXRlc3MgMHg1YmUyMTlmMCAweDgxZTE2NThmIDB4ZmU3YjZlMzkgMHgwMDljNzkyOCAweDJlMGZlNDcwIDB4YWE5YTZlNWUgMHg5OGVjNTE2MiAweDc1MGQ5YWY3IDB4ZjE4MWNhNWIgMHg1ZmYxNmRhNCAvLyBtZXRob2QgImdlbmVyYXRlKCl2b2lkIiwgbWV0aG9kICJnZXRfdmVyc2lvbl91bml4KCl1aW50NjQiLCBtZXRob2QgImZ1bmRfYXBwX21icihwYXkpdm9pZCIsIG1ldGhvZCAiY3JlYXRlX3BvbGwoYnl0ZVtdLGJ5dGVbXVtdLHVpbnQ2NCx1aW50NjQscGF5KXVpbnQ2NCIsIG1ldGhvZCAicmVxdWVzdF9ib3hfc3RvcmFnZSh1aW50NjQscGF5KXZvaWQiLCBtZXRob2QgInN1Ym1pdF92b3RlKHVpbnQ2NCx1aW50OCl2b2lkIiwgbWV0aG9kICJkZWxldGVfYm94X3N0b3JhZ2UodWludDY0KXZvaWQiLCBtZXRob2QgInB1cmdlX2JveF9zdG9yYWdlKHVpbnQ2NCxhZGRyZXNzW10pdm9pZCIsIG1ldGhvZCAiY2xvc2VfcG9sbCh1aW50NjQpdm9pZCIsIG1ldGhvZCAidGVybWluYXRlKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggX19wdXlhX2FyYzRfcm91dGVyX19fZ2VuZXJhdGVfcm91dGVAMiBfX3B1eWFfYXJjNF9yb3V0ZXJfX19nZXRfdmVyc2lvbl91bml4X3JvdXRlQDMgX19wdXlhX2FyYzRfcm91dGVyX19fZnVuZF9hcHBfbWJyX3JvdXRlQDQgX19wdXlhX2FyYzRfcm91dGVyX19fY3JlYXRlX3BvbGxfcm91dGVANSBfX3B1eWFfYXJjNF9yb3V0ZXJfX19yZXF1ZXN0X2JveF9zdG9yYWdlX3JvdXRlQDYgX19wdXlhX2FyYzRfcm91dGVyX19fc3VibWl0X3ZvdGVfcm91dGVANyBfX3B1eWFfYXJjNF9yb3V0ZXJfX19kZWxldGVfYm94X3N0b3JhZ2Vfcm91dGVAOCBfX3B1eWFfYXJjNF9yb3V0ZXJfX19wdXJnZV9ib3hfc3RvcmFnZV9yb3V0ZUA5IF9fcHV5YV9hcmM0X3JvdXRlcl9fX2Nsb3NlX3BvbGxfcm91dGVAMTAgX19wdXlhX2FyYzRfcm91dGVyX19fdGVybWluYXRlX3JvdXRlQDExCiAgICBpbnRjXzEgLy8gMAogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19nZW5lcmF0ZV9yb3V0ZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MC0xNjEKICAgIC8vICMgQ2FsbCB0aGUgJ0NyZWF0ZScgYWJpbWV0aG9kIHRoYXQgZ2VuZXJhdGVzIHRoZSBzbWFydCBjb250cmFjdCBjbGllbnQgYW5kIGluaXRpYWxpemVzIGdsb2JhbCBzdG9yYWdlIGludCB2YXJpYWJsZXMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2VuZXJhdGUKICAgIGludGNfMCAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2dldF92ZXJzaW9uX3VuaXhfcm91dGVAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToxODItMTgzCiAgICAvLyAjIFJldHJpZXZlIHRoZSB2ZXJzaW9uIG9mIHRoZSBzbWFydCBjb250cmFjdCBpbiBhbiBVbml4IGZvcm1hdCB0aW1lc3RhbXAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF92ZXJzaW9uX3VuaXgKICAgIGl0b2IKICAgIGJ5dGVjIDUgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2Z1bmRfYXBwX21icl9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4OC0xODkKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gZnVuZCBBcHAgYWRkcmVzcyBhbmQgY292ZXIgaXRzIEdsb2JhbCBtaW5pbXVtIGJhbGFuY2UKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTAyCiAgICAvLyBjbGFzcyBPcGVuQmFsbG90UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18wIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4OC0xODkKICAgIC8vICMgRW5hYmxlIGFwcGxpY2F0aW9uIGNyZWF0b3IgdG8gZnVuZCBBcHAgYWRkcmVzcyBhbmQgY292ZXIgaXRzIEdsb2JhbCBtaW5pbXVtIGJhbGFuY2UKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBmdW5kX2FwcF9tYnIKICAgIGludGNfMCAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2NyZWF0ZV9wb2xsX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MjEwLTIxMQogICAgLy8gIyBFbmFibGUgYW55IGFjY291bnQgdG8gbGF1bmNoIGEgbmV3IHBvbGwgaW4gYSBzaW5nbGUgY2FsbCwgcG9sbCBjcmVhdG9yIHBheXMgdGhlIHBvbGwgYm94IHN0b3JhZ2UgTUJSCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMgogICAgLy8gY2xhc3MgT3BlbkJhbGxvdFJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMCAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyMTAtMjExCiAgICAvLyAjIEVuYWJsZSBhbnkgYWNjb3VudCB0byBsYXVuY2ggYSBuZXcgcG9sbCBpbiBhIHNpbmdsZSBjYWxsLCBwb2xsIGNyZWF0b3IgcGF5cyB0aGUgcG9sbCBib3ggc3RvcmFnZSBNQlIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBjcmVhdGVfcG9sbAogICAgYnl0ZWMgNSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fcmVxdWVzdF9ib3hfc3RvcmFnZV9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3My0yNzQKICAgIC8vICMgRW5hYmxlIGFueSBlbGlnaWJsZSBhY2NvdW50IHRvIHJlcXVlc3QgYm94IHN0b3JhZ2UgZm9yIGEgcG9sbCBieSBwYXlpbmcgYSBNQlIgY29zdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToxMDIKICAgIC8vIGNsYXNzIE9wZW5CYWxsb3RSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MjczLTI3NAogICAgLy8gIyBFbmFibGUgYW55IGVsaWdpYmxlIGFjY291bnQgdG8gcmVxdWVzdCBib3ggc3RvcmFnZSBmb3IgYSBwb2xsIGJ5IHBheWluZyBhIE1CUiBjb3N0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgcmVxdWVzdF9ib3hfc3RvcmFnZQogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fc3VibWl0X3ZvdGVfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozMjktMzMwCiAgICAvLyAjIEVuYWJsZSBhbnkgZWxpZ2libGUgYWNjb3VudCB0byBzdWJtaXQgYSB2b3RlIGZvciBhIHBvbGwKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTAyCiAgICAvLyBjbGFzcyBPcGVuQmFsbG90UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozMjktMzMwCiAgICAvLyAjIEVuYWJsZSBhbnkgZWxpZ2libGUgYWNjb3VudCB0byBzdWJtaXQgYSB2b3RlIGZvciBhIHBvbGwKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBzdWJtaXRfdm90ZQogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fZGVsZXRlX2JveF9zdG9yYWdlX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6Mzc5LTM4MAogICAgLy8gIyBFbmFibGUgYW55IGVsaWdibGUgYWNjb3VudCB0byBkZWxldGUgdGhlaXIgcG9sbCBib3ggc3RvcmFnZSBhbmQgZ2V0IHRoZWlyIE1CUiBwYXltZW50IHJlZnVuZGVkCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMgogICAgLy8gY2xhc3MgT3BlbkJhbGxvdFJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6Mzc5LTM4MAogICAgLy8gIyBFbmFibGUgYW55IGVsaWdibGUgYWNjb3VudCB0byBkZWxldGUgdGhlaXIgcG9sbCBib3ggc3RvcmFnZSBhbmQgZ2V0IHRoZWlyIE1CUiBwYXltZW50IHJlZnVuZGVkCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgZGVsZXRlX2JveF9zdG9yYWdlCiAgICBpbnRjXzAgLy8gMQogICAgcmV0c3ViCgpfX3B1eWFfYXJjNF9yb3V0ZXJfX19wdXJnZV9ib3hfc3RvcmFnZV9yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxMS00MTIKICAgIC8vICMgRW5hYmxlIHBvbGwgY3JlYXRvciB0byBleGVjdXRlIGJveCBzdG9yYWdlIHB1cmdlIGZvciB0aGVpciBwb2xsLCB0aGlzIGRlbGV0ZXMgYW55IHZvdGVyIGJveGVzIGxlZnQgYmVoaW5kCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMgogICAgLy8gY2xhc3MgT3BlbkJhbGxvdFJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDExLTQxMgogICAgLy8gIyBFbmFibGUgcG9sbCBjcmVhdG9yIHRvIGV4ZWN1dGUgYm94IHN0b3JhZ2UgcHVyZ2UgZm9yIHRoZWlyIHBvbGwsIHRoaXMgZGVsZXRlcyBhbnkgdm90ZXIgYm94ZXMgbGVmdCBiZWhpbmQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBwdXJnZV9ib3hfc3RvcmFnZQogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fY2xvc2VfcG9sbF9yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0NTktNDYwCiAgICAvLyAjIEVuYWJsZSBwb2xsIGNyZWF0b3IgdG8gY2xvc2UgdGhlaXIgcG9sbCBvbmNlIGV2ZXJ5IHZvdGVyIGJveCBpcyBnb25lLCBmcmVlcyBwb2xsIGJveGVzIGFuZCByZWZ1bmRzIHRoZWlyIE1CUgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToxMDIKICAgIC8vIGNsYXNzIE9wZW5CYWxsb3RSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ1OS00NjAKICAgIC8vICMgRW5hYmxlIHBvbGwgY3JlYXRvciB0byBjbG9zZSB0aGVpciBwb2xsIG9uY2UgZXZlcnkgdm90ZXIgYm94IGlzIGdvbmUsIGZyZWVzIHBvbGwgYm94ZXMgYW5kIHJlZnVuZHMgdGhlaXIgTUJSCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY2xvc2VfcG9sbAogICAgaW50Y18wIC8vIDEKICAgIHJldHN1YgoKX19wdXlhX2FyYzRfcm91dGVyX19fdGVybWluYXRlX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUwNC01MDUKICAgIC8vICMgQWxsb3cgYXBwbGljYXRpb24gY3JlYXRvciB0byBkZWxldGUgdGhlIHNtYXJ0IGNvbnRyYWN0IGNsaWVudCBvbmNlIGV2ZXJ5IHBvbGwgaXMgY2xvc2VkCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJkaXNhbGxvdyIsIGFsbG93X2FjdGlvbnM9WyJEZWxldGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCA1IC8vIERlbGV0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgRGVsZXRlQXBwbGljYXRpb24KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiB0ZXJtaW5hdGUKICAgIGludGNfMCAvLyAxCiAgICByZXRzdWIKCl9fcHV5YV9hcmM0X3JvdXRlcl9fX2FmdGVyX2lmX2Vsc2VAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTAyCiAgICAvLyBjbGFzcyBPcGVuQmFsbG90UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIGludGNfMSAvLyAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3RfcmVnaXN0cnkuY29udHJhY3QuT3BlbkJhbGxvdFJlZ2lzdHJ5LmdlbmVyYXRlKCkgLT4gdm9pZDoKZ2VuZXJhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTYwLTE2MgogICAgLy8gIyBDYWxsIHRoZSAnQ3JlYXRlJyBhYmltZXRob2QgdGhhdCBnZW5lcmF0ZXMgdGhlIHNtYXJ0IGNvbnRyYWN0IGNsaWVudCBhbmQgaW5pdGlhbGl6ZXMgZ2xvYmFsIHN0b3JhZ2UgaW50IHZhcmlhYmxlcwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICAvLyBkZWYgZ2VuZXJhdGUoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NQogICAgLy8gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTYzLTE2NgogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIFRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2OAogICAgLy8gYXNzZXJ0IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MuYmFsYW5jZSA+PSAoCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0QmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTY5CiAgICAvLyBHbG9iYWwubWluX2JhbGFuY2UKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTcxCiAgICAvLyBudW1fYnl0ZXM9VUludDY0KDApLCBudW1fdWludD1VSW50NjQoMykKICAgIGludGNfMSAvLyAwCiAgICBwdXNoaW50IDMgLy8gMwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MC0xNzIKICAgIC8vICsgY2FsY19zY2hlbWFfbWJyKAogICAgLy8gICAgIG51bV9ieXRlcz1VSW50NjQoMCksIG51bV91aW50PVVJbnQ2NCgzKQogICAgLy8gKSAgIyBHbG9iYWwgc2NoZW1hIE1CUjogMC4xIChHbG9iYWwubWluX2JhbGFuY2UpICsgMC4xODU1IEFMR08gKEdsb2JhbCBzY2hlbWEpCiAgICBjYWxsc3ViIGNhbGNfc2NoZW1hX21icgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2OS0xNzIKICAgIC8vIEdsb2JhbC5taW5fYmFsYW5jZQogICAgLy8gKyBjYWxjX3NjaGVtYV9tYnIoCiAgICAvLyAgICAgbnVtX2J5dGVzPVVJbnQ2NCgwKSwgbnVtX3VpbnQ9VUludDY0KDMpCiAgICAvLyApICAjIEdsb2JhbCBzY2hlbWEgTUJSOiAwLjEgKEdsb2JhbC5taW5fYmFsYW5jZSkgKyAwLjE4NTUgQUxHTyAoR2xvYmFsIHNjaGVtYSkKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToxNjgtMTcyCiAgICAvLyBhc3NlcnQgR2xvYmFsLmNyZWF0b3JfYWRkcmVzcy5iYWxhbmNlID49ICgKICAgIC8vICAgICBHbG9iYWwubWluX2JhbGFuY2UKICAgIC8vICAgICArIGNhbGNfc2NoZW1hX21icigKICAgIC8vICAgICAgICAgbnVtX2J5dGVzPVVJbnQ2NCgwKSwgbnVtX3VpbnQ9VUludDY0KDMpCiAgICAvLyAgICAgKSAgIyBHbG9iYWwgc2NoZW1hIE1CUjogMC4xIChHbG9iYWwubWluX2JhbGFuY2UpICsgMC4xODU1IEFMR08gKEdsb2JhbCBzY2hlbWEpCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2OC0xNzMKICAgIC8vIGFzc2VydCBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLmJhbGFuY2UgPj0gKAogICAgLy8gICAgIEdsb2JhbC5taW5fYmFsYW5jZQogICAgLy8gICAgICsgY2FsY19zY2hlbWFfbWJyKAogICAgLy8gICAgICAgICBudW1fYnl0ZXM9VUludDY0KDApLCBudW1fdWludD1VSW50NjQoMykKICAgIC8vICAgICApICAjIEdsb2JhbCBzY2hlbWEgTUJSOiAwLjEgKEdsb2JhbC5taW5fYmFsYW5jZSkgKyAwLjE4NTUgQUxHTyAoR2xvYmFsIHNjaGVtYSkKICAgIC8vICksICJBcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MgYmFsYW5jZSBtdXN0IGJlIGVxdWFsIG9yIGdyZWF0ZXIgdGhhbiBHbG9iYWwubWluX2JhbGFuY2UgKyBHbG9iYWwgc2NoZW1hIE1CUi4iCiAgICBhc3NlcnQgLy8gQXBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzIGJhbGFuY2UgbXVzdCBiZSBlcXVhbCBvciBncmVhdGVyIHRoYW4gR2xvYmFsLm1pbl9iYWxhbmNlICsgR2xvYmFsIHNjaGVtYSBNQlIuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTc1LTE3NgogICAgLy8gIyBJbml0aWFsaXplIEdsb2JhbCBzdG9yYWdlIHdpdGggZGVmYXVsdCB2YWx1ZSBhc3NpZ25tZW50cwogICAgLy8gc2VsZi50b3RhbF9wb2xscyA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMyAvLyAidG90YWxfcG9sbHMiCiAgICBpbnRjXzEgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToxNzcKICAgIC8vIHNlbGYudG90YWxfb3Blbl9wb2xscyA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAidG90YWxfb3Blbl9wb2xscyIKICAgIGludGNfMSAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3OAogICAgLy8gc2VsZi50b3RhbF9ldmVudHMgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDQgLy8gInRvdGFsX2V2ZW50cyIKICAgIGludGNfMSAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4MAogICAgLy8gbG9nX3RlbGVtZXRyeShVSW50NjQoMCkpCiAgICBpbnRjXzEgLy8gMAogICAgY2FsbHN1YiBsb2dfdGVsZW1ldHJ5CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29tbW9uLmNhbGNfc2NoZW1hX21icihudW1fYnl0ZXM6IHVpbnQ2NCwgbnVtX3VpbnQ6IHVpbnQ2NCkgLT4gdWludDY0OgpjYWxjX3NjaGVtYV9tYnI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5OjMzLTM1CiAgICAvLyAjIENhbGN1bGF0ZSB0aGUgR2xvYmFsIGFuZCBMb2NhbCBzY2hlbWEgbWluaW11bSBiYWxhbmNlIHJlcXVpcmVtZW50IHRvdGFsIGNvc3QgZm9yIHRoZSBzbWFydCBjb250cmFjdAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjYWxjX3NjaGVtYV9tYnIobnVtX2J5dGVzOiBVSW50NjQsIG51bV91aW50OiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTozOQogICAgLy8gYnl0ZV9mZWUgPSBVSW50NjQoNTBfMDAwKSAgIyBCeXRlIHNsaWNlIGZlZSBmb3Iga2V5LXZhbHVlIHBhaXIgKDI1XzAwMCArIDI1XzAwMCkKICAgIHB1c2hpbnQgNTAwMDAgLy8gNTAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6NDItNDMKICAgIC8vICMgTXVsdGlwbHkgcmVzcGVjdGl2ZSBmZWUgY29zdCB3aXRoIHRoZSBudW1iZXIgb2Yga2V5LXZhbHVlIHBhaXJzIGluIGVhY2ggc2NoZW1hIHRvIGdldCB0b3RhbCBmZWUgYW1vdW50CiAgICAvLyB0b3RhbF9ieXRlX2ZlZSA9IGJ5dGVfZmVlICogbnVtX2J5dGVzCiAgICBmcmFtZV9kaWcgLTIKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6NDAKICAgIC8vIHVpbnRfZmVlID0gVUludDY0KDI4XzUwMCkgICMgVUludDY0IGZlZSBmb3Iga2V5LXZhbHVlIHBhaXIgKDI1XzAwMCArIDNfNTAwKQogICAgcHVzaGludCAyODUwMCAvLyAyODUwMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo0NAogICAgLy8gdG90YWxfdWludF9mZWUgPSB1aW50X2ZlZSAqIG51bV91aW50CiAgICBmcmFtZV9kaWcgLTEKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6MzctMzgKICAgIC8vICMgU2NoZW1hIGluZGl2aWR1YWwgZmVlcwogICAgLy8gYmFzZV9mZWUgPSBVSW50NjQoMTAwXzAwMCkgICMgQmFzZSBmZWUgKDEwMF8wMDAgKiAoMSArIEV4dHJhUHJvZ3JhbVBhZ2VzKSkKICAgIHB1c2hpbnQgMTAwMDAwIC8vIDEwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo0Ni00NwogICAgLy8gIyBSZXR1cm4gdGhlIG1pbmltdW0gYmFsYW5jZSByZXF1aXJlbWVudCB0b3RhbCBjb3N0CiAgICAvLyByZXR1cm4gYmFzZV9mZWUgKyB0b3RhbF9ieXRlX2ZlZSArIHRvdGFsX3VpbnRfZmVlCiAgICB1bmNvdmVyIDIKICAgICsKICAgICsKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdC5jb21tb24ubG9nX3RlbGVtZXRyeShib3hlc190b3VjaGVkOiB1aW50NjQpIC0+IHZvaWQ6CmxvZ190ZWxlbWV0cnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5OjgwLTgzCiAgICAvLyAjIExvZyB0aGUgcmVtYWluaW5nIG9wY29kZSBidWRnZXQgYW5kIHRoZSBudW1iZXIgb2YgYm94ZXMgdG91Y2hlZCBieSB0aGUgbWV0aG9kICh0ZWxlbWV0cnkgYnVpbGRzIG9ubHkpCiAgICAvLyAjIE5PVEU6IEV2ZXJ5IG1ldGhvZCBjb3VudHMgdGhlIGJveGVzIGl0IGFjY2Vzc2VkIGZyb20gdGhlIGxvb3AgYm91bmRzIGFuZCBicmFuY2hlcyBpdCB0b29rLCBzZWUgZWFjaCBjYWxsIHNpdGUKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgbG9nX3RlbGVtZXRyeShib3hlc190b3VjaGVkOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6ODQKICAgIC8vIGlmIFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlRFTEVNRVRSWSIpOgogICAgaW50YyA2IC8vIFRNUExfVEVMRU1FVFJZCiAgICBieiBsb2dfdGVsZW1ldHJ5X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo4NwogICAgLy8gYXJjNC5VSW50MzIuZnJvbV9ieXRlcyhUeG4uYXBwbGljYXRpb25fYXJncygwKSksCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5Ojg4CiAgICAvLyBhcmM0LlVJbnQ2NChHbG9iYWwub3Bjb2RlX2J1ZGdldCgpKSwKICAgIGdsb2JhbCBPcGNvZGVCdWRnZXQKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6ODkKICAgIC8vIGFyYzQuVUludDY0KGJveGVzX3RvdWNoZWQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5Ojg2LTkwCiAgICAvLyBNZXRob2RUZWxlbWV0cnkoCiAgICAvLyAgICAgYXJjNC5VSW50MzIuZnJvbV9ieXRlcyhUeG4uYXBwbGljYXRpb25fYXJncygwKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoR2xvYmFsLm9wY29kZV9idWRnZXQoKSksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoYm94ZXNfdG91Y2hlZCksCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo4NS05MQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIE1ldGhvZFRlbGVtZXRyeSgKICAgIC8vICAgICAgICAgYXJjNC5VSW50MzIuZnJvbV9ieXRlcyhUeG4uYXBwbGljYXRpb25fYXJncygwKSksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KEdsb2JhbC5vcGNvZGVfYnVkZ2V0KCkpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChib3hlc190b3VjaGVkKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhiZWIzMjMwNCAvLyBtZXRob2QgIk1ldGhvZFRlbGVtZXRyeSh1aW50MzIsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwoKbG9nX3RlbGVtZXRyeV9hZnRlcl9pZl9lbHNlQDI6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3RfcmVnaXN0cnkuY29udHJhY3QuT3BlbkJhbGxvdFJlZ2lzdHJ5LmdldF92ZXJzaW9uX3VuaXgoKSAtPiB1aW50NjQ6CmdldF92ZXJzaW9uX3VuaXg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTgyLTE4NAogICAgLy8gIyBSZXRyaWV2ZSB0aGUgdmVyc2lvbiBvZiB0aGUgc21hcnQgY29udHJhY3QgaW4gYW4gVW5peCBmb3JtYXQgdGltZXN0YW1wCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBnZXRfdmVyc2lvbl91bml4KHNlbGYpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NQogICAgLy8gbG9nX3RlbGVtZXRyeShVSW50NjQoMCkpCiAgICBpbnRjXzEgLy8gMAogICAgY2FsbHN1YiBsb2dfdGVsZW1ldHJ5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTg2CiAgICAvLyByZXR1cm4gVGVtcGxhdGVWYXJbVUludDY0XSgiVkVSU0lPTl9VTklYIikKICAgIGludGMgNyAvLyBUTVBMX1ZFUlNJT05fVU5JWAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90X3JlZ2lzdHJ5LmNvbnRyYWN0Lk9wZW5CYWxsb3RSZWdpc3RyeS5mdW5kX2FwcF9tYnIobWJyX3BheTogdWludDY0KSAtPiB2b2lkOgpmdW5kX2FwcF9tYnI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTg4LTE5MAogICAgLy8gIyBFbmFibGUgYXBwbGljYXRpb24gY3JlYXRvciB0byBmdW5kIEFwcCBhZGRyZXNzIGFuZCBjb3ZlciBpdHMgR2xvYmFsIG1pbmltdW0gYmFsYW5jZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgZnVuZF9hcHBfbWJyKHNlbGYsIG1icl9wYXk6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTkzCiAgICAvLyBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToxOTEtMTk0CiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGNyZWF0b3IgYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBjcmVhdG9yIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTk3CiAgICAvLyBtYnJfcGF5LnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5Ni0xOTgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgLy8gKSwgIk1CUiBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwcGxpY2F0aW9uIGNyZWF0b3IgYWRkcmVzcy4iCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgc2VuZGVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBwbGljYXRpb24gY3JlYXRvciBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMQogICAgLy8gbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyMDAtMjAyCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgIk1CUiBwYXltZW50IHJlY2lldmVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBhZGRyZXNzLiIKICAgIGFzc2VydCAvLyBNQlIgcGF5bWVudCByZWNpZXZlciBhZGRyZXNzIG11c3QgbWF0Y2ggYXBwbGljYXRpb24gYWRkcmVzcy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyMDUKICAgIC8vIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZSA+PSBHbG9iYWwubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MjA0LTIwNgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UgPj0gR2xvYmFsLm1pbl9iYWxhbmNlCiAgICAvLyApLCAiQXBwbGljYXRpb24gYWRkcmVzcyBiYWxhbmNlIG11c3QgYmUgZXF1YWwgb3IgZ3JlYXRlciB0aGFuIEdsb2JhbC5taW5fYmFsYW5jZS4iCiAgICBhc3NlcnQgLy8gQXBwbGljYXRpb24gYWRkcmVzcyBiYWxhbmNlIG11c3QgYmUgZXF1YWwgb3IgZ3JlYXRlciB0aGFuIEdsb2JhbC5taW5fYmFsYW5jZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyMDgKICAgIC8vIGxvZ190ZWxlbWV0cnkoVUludDY0KDApKQogICAgaW50Y18xIC8vIDAKICAgIGNhbGxzdWIgbG9nX3RlbGVtZXRyeQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90X3JlZ2lzdHJ5LmNvbnRyYWN0Lk9wZW5CYWxsb3RSZWdpc3RyeS5jcmVhdGVfcG9sbCh0aXRsZTogYnl0ZXMsIGNob2ljZXM6IGJ5dGVzLCBzdGFydF9kYXRlX3VuaXg6IGJ5dGVzLCBlbmRfZGF0ZV91bml4OiBieXRlcywgbWJyX3BheTogdWludDY0KSAtPiBieXRlczoKY3JlYXRlX3BvbGw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MjEwLTIxOQogICAgLy8gIyBFbmFibGUgYW55IGFjY291bnQgdG8gbGF1bmNoIGEgbmV3IHBvbGwgaW4gYSBzaW5nbGUgY2FsbCwgcG9sbCBjcmVhdG9yIHBheXMgdGhlIHBvbGwgYm94IHN0b3JhZ2UgTUJSCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBjcmVhdGVfcG9sbCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHRpdGxlOiBhcmM0LkR5bmFtaWNCeXRlcywKICAgIC8vICAgICBjaG9pY2VzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LkR5bmFtaWNCeXRlc10sCiAgICAvLyAgICAgc3RhcnRfZGF0ZV91bml4OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBlbmRfZGF0ZV91bml4OiBhcmM0LlVJbnQ2NCwKICAgIC8vICAgICBtYnJfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwKICAgIC8vICkgLT4gYXJjNC5VSW50NjQ6CiAgICBwcm90byA1IDEKICAgIHB1c2hieXRlcyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyMC0yMjEKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgdGl0bGUubmF0aXZlLmxlbmd0aCA8PSBVSW50NjQoCiAgICBmcmFtZV9kaWcgLTUKICAgIGV4dHJhY3QgMiAwCiAgICBsZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyMjAtMjIzCiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0IHRpdGxlLm5hdGl2ZS5sZW5ndGggPD0gVUludDY0KAogICAgLy8gICAgIDExOAogICAgLy8gKSwgIlBvbGwgdGl0bGUgc2l6ZSBjYW4gbm90IGV4Y2VlZCAxMTggYnl0ZXMgb2YgZGF0YS4iCiAgICBwdXNoaW50IDExOCAvLyAxMTgKICAgIDw9CiAgICBhc3NlcnQgLy8gUG9sbCB0aXRsZSBzaXplIGNhbiBub3QgZXhjZWVkIDExOCBieXRlcyBvZiBkYXRhLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyNQogICAgLy8gYXNzZXJ0X251bV9jaG9pY2VzKGNob2ljZXMubGVuZ3RoKQogICAgZnJhbWVfZGlnIC00CiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgY2FsbHN1YiBhc3NlcnRfbnVtX2Nob2ljZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyMjcKICAgIC8vIGZvciBpIGluIHVyYW5nZShjaG9pY2VzLmxlbmd0aCk6CiAgICBpbnRjXzEgLy8gMAoKY3JlYXRlX3BvbGxfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyNwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGNob2ljZXMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJ6IGNyZWF0ZV9wb2xsX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MjI4CiAgICAvLyBhc3NlcnQgY2hvaWNlc1tpXS5jb3B5KCkubmF0aXZlLmxlbmd0aCA8PSBVSW50NjQoCiAgICBmcmFtZV9kaWcgLTQKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMAogICAgYXNzZXJ0IC8vIEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDEKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGV4dHJhY3QzCiAgICBleHRyYWN0IDIgMAogICAgbGVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MjI4LTIzMAogICAgLy8gYXNzZXJ0IGNob2ljZXNbaV0uY29weSgpLm5hdGl2ZS5sZW5ndGggPD0gVUludDY0KAogICAgLy8gICAgIDExNgogICAgLy8gKSwgIlBvbGwgY2hvaWNlIHNpemUgY2Fubm90IGV4Y2VlZCAxMTYgYnl0ZXMgb2YgZGF0YS4iCiAgICBwdXNoaW50IDExNiAvLyAxMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gUG9sbCBjaG9pY2Ugc2l6ZSBjYW5ub3QgZXhjZWVkIDExNiBieXRlcyBvZiBkYXRhLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyNwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGNob2ljZXMubGVuZ3RoKToKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgY3JlYXRlX3BvbGxfZm9yX2hlYWRlckAxCgpjcmVhdGVfcG9sbF9hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyMzIKICAgIC8vIGFzc2VydF92b3RpbmdfcGVyaW9kKHN0YXJ0X2RhdGVfdW5peC5uYXRpdmUsIGVuZF9kYXRlX3VuaXgubmF0aXZlKQogICAgZnJhbWVfZGlnIC0zCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIGNhbGxzdWIgYXNzZXJ0X3ZvdGluZ19wZXJpb2QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyMzQtMjM1CiAgICAvLyAjIERlZmluZSB0aGUgcG9sbCBkYXRhIHN0b3JlZCB1bmRlciB0aGUgbmV4dCBwb2xsIGlkCiAgICAvLyBwb2xsX2lkID0gc2VsZi50b3RhbF9wb2xscyArIFVJbnQ2NCgxKQogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRvdGFsX3BvbGxzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3BvbGxzIGV4aXN0cwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyMzcKICAgIC8vIGNyZWF0b3I9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzNi0yNDIKICAgIC8vIHBvbGxfZGF0YSA9IFBvbGxEYXRhKAogICAgLy8gICAgIGNyZWF0b3I9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIHN0YXJ0X2RhdGVfdW5peD1zdGFydF9kYXRlX3VuaXgsCiAgICAvLyAgICAgZW5kX2RhdGVfdW5peD1lbmRfZGF0ZV91bml4LAogICAgLy8gICAgIHRpdGxlPXRpdGxlLmNvcHkoKSwKICAgIC8vICAgICBjaG9pY2VzPWNob2ljZXMuY29weSgpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgwMDM0CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNQogICAgbGVuCiAgICBwdXNoaW50IDUyIC8vIDUyCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTUKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC00CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyNDMKICAgIC8vIHBvbGxfc3RhdGVfc2l6ZSA9IFVJbnQ2NChQT0xMX1NUQVRFX1RBTExJRVNfT0ZGU0VUKSArIGNob2ljZXMubGVuZ3RoICogVUludDY0KDgpCiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18zIC8vIDgKICAgICoKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyNDYKICAgIC8vIG1icl9wYXkuc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0NS0yNDcKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5zZW5kZXIgPT0gVHhuLnNlbmRlcgogICAgLy8gKSwgIk1CUiBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggdHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIE1CUiBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggdHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MjUwCiAgICAvLyBtYnJfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0OS0yNTEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiTUJSIHBheW1lbnQgcmVjaWV2ZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIE1CUiBwYXltZW50IHJlY2lldmVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1MwogICAgLy8gYXNzZXJ0IG1icl9wYXkuYW1vdW50ID49ICgKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MjU0CiAgICAvLyBjYWxjX3NpbmdsZV9ib3hfZmVlKFVJbnQ2NCgxMCksIHBvbGxfZGF0YS5ieXRlcy5sZW5ndGgpICAjIEJveCBwXyBmZWUKICAgIGRpZyAyCiAgICBsZW4KICAgIHB1c2hpbnQgMTAgLy8gMTAKICAgIHN3YXAKICAgIGNhbGxzdWIgY2FsY19zaW5nbGVfYm94X2ZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1NQogICAgLy8gKyBjYWxjX3NpbmdsZV9ib3hfZmVlKFVJbnQ2NCgxMCksIHBvbGxfc3RhdGVfc2l6ZSkgICMgQm94IHRfIGZlZQogICAgcHVzaGludCAxMCAvLyAxMAogICAgZGlnIDMKICAgIGNhbGxzdWIgY2FsY19zaW5nbGVfYm94X2ZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1NC0yNTUKICAgIC8vIGNhbGNfc2luZ2xlX2JveF9mZWUoVUludDY0KDEwKSwgcG9sbF9kYXRhLmJ5dGVzLmxlbmd0aCkgICMgQm94IHBfIGZlZQogICAgLy8gKyBjYWxjX3NpbmdsZV9ib3hfZmVlKFVJbnQ2NCgxMCksIHBvbGxfc3RhdGVfc2l6ZSkgICMgQm94IHRfIGZlZQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1My0yNTUKICAgIC8vIGFzc2VydCBtYnJfcGF5LmFtb3VudCA+PSAoCiAgICAvLyAgICAgY2FsY19zaW5nbGVfYm94X2ZlZShVSW50NjQoMTApLCBwb2xsX2RhdGEuYnl0ZXMubGVuZ3RoKSAgIyBCb3ggcF8gZmVlCiAgICAvLyAgICAgKyBjYWxjX3NpbmdsZV9ib3hfZmVlKFVJbnQ2NCgxMCksIHBvbGxfc3RhdGVfc2l6ZSkgICMgQm94IHRfIGZlZQogICAgPj0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyNTMtMjU2CiAgICAvLyBhc3NlcnQgbWJyX3BheS5hbW91bnQgPj0gKAogICAgLy8gICAgIGNhbGNfc2luZ2xlX2JveF9mZWUoVUludDY0KDEwKSwgcG9sbF9kYXRhLmJ5dGVzLmxlbmd0aCkgICMgQm94IHBfIGZlZQogICAgLy8gICAgICsgY2FsY19zaW5nbGVfYm94X2ZlZShVSW50NjQoMTApLCBwb2xsX3N0YXRlX3NpemUpICAjIEJveCB0XyBmZWUKICAgIC8vICksICJNQlIgcGF5bWVudCBmb3IgcG9sbCBib3ggc3RvcmFnZSBtdXN0IG1lZXQgdGhlIG1pbmltdW0gcmVxdWlyZW1lbnQgYW1vdW50LiIKICAgIGFzc2VydCAvLyBNQlIgcGF5bWVudCBmb3IgcG9sbCBib3ggc3RvcmFnZSBtdXN0IG1lZXQgdGhlIG1pbmltdW0gcmVxdWlyZW1lbnQgYW1vdW50LgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1OC0yNTkKICAgIC8vICMgU3RvcmUgcG9sbCBkYXRhIGFuZCBjcmVhdGUgdGhlIHplcm8gZmlsbGVkIHBvbGwgc3RhdGUgYm94ICh2b3RlciBjb3VudGVycyBhbmQgY2hvaWNlIHRhbGxpZXMpCiAgICAvLyBzZWxmLmJveF9wX3BvbGxfZGF0YVthcmM0LlVJbnQ2NChwb2xsX2lkKV0gPSBwb2xsX2RhdGEuY29weSgpCiAgICBkaWcgMgogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDcwNWYKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICB1bmNvdmVyIDMKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyNjEKICAgIC8vIHNlbGYucG9sbF9zdGF0ZV9rZXkocG9sbF9pZCksIHBvbGxfc3RhdGVfc2l6ZQogICAgZGlnIDIKICAgIGNhbGxzdWIgcG9sbF9zdGF0ZV9rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyNjAtMjYyCiAgICAvLyBhc3NlcnQgb3AuQm94LmNyZWF0ZSgKICAgIC8vICAgICBzZWxmLnBvbGxfc3RhdGVfa2V5KHBvbGxfaWQpLCBwb2xsX3N0YXRlX3NpemUKICAgIC8vICksICJQb2xsIGlkIG11c3Qgbm90IGJlIHByZXNlbnQgaW4gYm94IHRfLiIKICAgIHVuY292ZXIgMgogICAgYm94X2NyZWF0ZQogICAgYXNzZXJ0IC8vIFBvbGwgaWQgbXVzdCBub3QgYmUgcHJlc2VudCBpbiBib3ggdF8uCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MjY0LTI2NQogICAgLy8gIyBVcGRhdGUgZ2xvYmFsIHN0YXRlIGtleXMgd2l0aCBuZXcgdmFsdWVzCiAgICAvLyBzZWxmLnRvdGFsX3BvbGxzID0gcG9sbF9pZAogICAgYnl0ZWNfMyAvLyAidG90YWxfcG9sbHMiCiAgICB1bmNvdmVyIDIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MjY2CiAgICAvLyBzZWxmLnRvdGFsX29wZW5fcG9sbHMgKz0gVUludDY0KDEpCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMCAvLyAidG90YWxfb3Blbl9wb2xscyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9vcGVuX3BvbGxzIGV4aXN0cwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGJ5dGVjXzAgLy8gInRvdGFsX29wZW5fcG9sbHMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2OAogICAgLy8gbG9nX3RlbGVtZXRyeShVSW50NjQoMikpCiAgICBpbnRjXzIgLy8gMgogICAgY2FsbHN1YiBsb2dfdGVsZW1ldHJ5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MjcwLTI3MQogICAgLy8gIyBSZXR1cm4gdGhlIHBvbGwgaWQKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChwb2xsX2lkKQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3QuY29tbW9uLmFzc2VydF9udW1fY2hvaWNlcyhudW1fY2hvaWNlczogdWludDY0KSAtPiB2b2lkOgphc3NlcnRfbnVtX2Nob2ljZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5OjU4LTYwCiAgICAvLyAjIFZhbGlkYXRlIHRoZSBudW1iZXIgb2YgcG9sbCBjaG9pY2VzIG9mIGEgbmV3IHBvbGwKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYXNzZXJ0X251bV9jaG9pY2VzKG51bV9jaG9pY2VzOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6NjEKICAgIC8vIGFzc2VydCBudW1fY2hvaWNlcyA+PSBVSW50NjQoMikgYW5kIG51bV9jaG9pY2VzIDw9IFVJbnQ2NCgKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18yIC8vIDIKICAgID49CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5OjYxLTYzCiAgICAvLyBhc3NlcnQgbnVtX2Nob2ljZXMgPj0gVUludDY0KDIpIGFuZCBudW1fY2hvaWNlcyA8PSBVSW50NjQoCiAgICAvLyAgICAgMjU1CiAgICAvLyApLCAiTnVtYmVyIG9mIHBvbGwgY2hvaWNlcyBtdXN0IGJlIGJldHdlZW4gMiBhbmQgMjU1LiIKICAgIGJ6IGFzc2VydF9udW1fY2hvaWNlc19ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAyNTUgLy8gMjU1CiAgICA8PQogICAgYnogYXNzZXJ0X251bV9jaG9pY2VzX2Jvb2xfZmFsc2VAMwogICAgaW50Y18wIC8vIDEKICAgIGIgYXNzZXJ0X251bV9jaG9pY2VzX2Jvb2xfbWVyZ2VANAoKYXNzZXJ0X251bV9jaG9pY2VzX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMSAvLyAwCgphc3NlcnRfbnVtX2Nob2ljZXNfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo2MS02MwogICAgLy8gYXNzZXJ0IG51bV9jaG9pY2VzID49IFVJbnQ2NCgyKSBhbmQgbnVtX2Nob2ljZXMgPD0gVUludDY0KAogICAgLy8gICAgIDI1NQogICAgLy8gKSwgIk51bWJlciBvZiBwb2xsIGNob2ljZXMgbXVzdCBiZSBiZXR3ZWVuIDIgYW5kIDI1NS4iCiAgICBhc3NlcnQgLy8gTnVtYmVyIG9mIHBvbGwgY2hvaWNlcyBtdXN0IGJlIGJldHdlZW4gMiBhbmQgMjU1LgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbW1vbi5hc3NlcnRfdm90aW5nX3BlcmlvZChzdGFydF9kYXRlX3VuaXg6IHVpbnQ2NCwgZW5kX2RhdGVfdW5peDogdWludDY0KSAtPiB2b2lkOgphc3NlcnRfdm90aW5nX3BlcmlvZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6NjYtNjgKICAgIC8vICMgVmFsaWRhdGUgdGhlIHZvdGluZyBwZXJpb2Qgb2YgYSBuZXcgcG9sbCAoMyB0byAxNCBkYXlzKQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBhc3NlcnRfdm90aW5nX3BlcmlvZChzdGFydF9kYXRlX3VuaXg6IFVJbnQ2NCwgZW5kX2RhdGVfdW5peDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5OjY5CiAgICAvLyBhc3NlcnQgc3RhcnRfZGF0ZV91bml4IDwgZW5kX2RhdGVfdW5peCwgIlN0YXJ0IGRhdGUgbXVzdCBiZSBlYXJsaWVyIHRoYW4gZW5kIGRhdGUuIgogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIDwKICAgIGFzc2VydCAvLyBTdGFydCBkYXRlIG11c3QgYmUgZWFybGllciB0aGFuIGVuZCBkYXRlLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo3MS03MwogICAgLy8gYXNzZXJ0IGVuZF9kYXRlX3VuaXggPj0gc3RhcnRfZGF0ZV91bml4ICsgVUludDY0KAogICAgLy8gICAgIDMgKiAyNCAqIDYwICogNjAKICAgIC8vICksICJFbmQgZGF0ZSBtdXN0IGJlIGF0IGxlYXN0IDMgZGF5cyBsYXRlciB0aGFuIHRoZSBzdGFydCBkYXRlLiIKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGludCAyNTkyMDAgLy8gMjU5MjAwCiAgICArCiAgICBmcmFtZV9kaWcgLTEKICAgIDw9CiAgICBhc3NlcnQgLy8gRW5kIGRhdGUgbXVzdCBiZSBhdCBsZWFzdCAzIGRheXMgbGF0ZXIgdGhhbiB0aGUgc3RhcnQgZGF0ZS4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdC9jb21tb24ucHk6NzUKICAgIC8vIGFzc2VydCBlbmRfZGF0ZV91bml4IC0gc3RhcnRfZGF0ZV91bml4IDw9IFVJbnQ2NCgKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIC0yCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3QvY29tbW9uLnB5Ojc1LTc3CiAgICAvLyBhc3NlcnQgZW5kX2RhdGVfdW5peCAtIHN0YXJ0X2RhdGVfdW5peCA8PSBVSW50NjQoCiAgICAvLyAgICAgMTQgKiAyNCAqIDYwICogNjAKICAgIC8vICksICJWb3RpbmcgcGVyaW9kIGNhbiBub3QgZXhjZWVkIDE0IGRheXMuIgogICAgcHVzaGludCAxMjA5NjAwIC8vIDEyMDk2MDAKICAgIDw9CiAgICBhc3NlcnQgLy8gVm90aW5nIHBlcmlvZCBjYW4gbm90IGV4Y2VlZCAxNCBkYXlzLgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90LmNvbW1vbi5jYWxjX3NpbmdsZV9ib3hfZmVlKGtleV9zaXplOiB1aW50NjQsIHZhbHVlX3NpemU6IHVpbnQ2NCkgLT4gdWludDY0OgpjYWxjX3NpbmdsZV9ib3hfZmVlOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo1MC01MgogICAgLy8gIyBDYWxjdWxhdGUgYm94IGZlZSBmb3Igc2luZ2xlIGJveCB1bml0IChvbmx5IGZvciBib3ggc2l6ZXMgbm90IGtub3duIGF0IGNvbXBpbGUgdGltZSkKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgY2FsY19zaW5nbGVfYm94X2ZlZShrZXlfc2l6ZTogVUludDY0LCB2YWx1ZV9zaXplOiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90L2NvbW1vbi5weTo1NC01NQogICAgLy8gIyBGb3JtdWxhIGZvciBjYWxjdWxhdGluZyBzaW5nbGUgYm94IGZlZTogYmFzZSBmZWUgKyBzaXplIGZlZSAoNDAwIHBlciBieXRlICogKGxlbihrZXkpK2xlbih2YWx1ZSkpKQogICAgLy8gcmV0dXJuIFVJbnQ2NChCT1hfQkFTRV9GRUUpICsgVUludDY0KEJPWF9CWVRFX0ZFRSkgKiAoa2V5X3NpemUgKyB2YWx1ZV9zaXplKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIHB1c2hpbnQgNDAwIC8vIDQwMAogICAgKgogICAgcHVzaGludCAyNTAwIC8vIDI1MDAKICAgICsKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdF9yZWdpc3RyeS5jb250cmFjdC5PcGVuQmFsbG90UmVnaXN0cnkucG9sbF9zdGF0ZV9rZXkocG9sbF9pZDogdWludDY0KSAtPiBieXRlczoKcG9sbF9zdGF0ZV9rZXk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTQwLTE0MgogICAgLy8gIyBSZXR1cm4gdGhlIHBvbGwgc3RhdGUgYm94IGtleSBmb3IgZ2l2ZW4gcG9sbCBpZAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBwb2xsX3N0YXRlX2tleShzZWxmLCBwb2xsX2lkOiBVSW50NjQpIC0+IEJ5dGVzOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTQzCiAgICAvLyByZXR1cm4gQnl0ZXMoYiJ0XyIpICsgb3AuaXRvYihwb2xsX2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBwdXNoYnl0ZXMgMHg3NDVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdF9yZWdpc3RyeS5jb250cmFjdC5PcGVuQmFsbG90UmVnaXN0cnkucmVxdWVzdF9ib3hfc3RvcmFnZShwb2xsX2lkOiBieXRlcywgbWJyX3BheTogdWludDY0KSAtPiB2b2lkOgpyZXF1ZXN0X2JveF9zdG9yYWdlOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3My0yNzcKICAgIC8vICMgRW5hYmxlIGFueSBlbGlnaWJsZSBhY2NvdW50IHRvIHJlcXVlc3QgYm94IHN0b3JhZ2UgZm9yIGEgcG9sbCBieSBwYXlpbmcgYSBNQlIgY29zdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgcmVxdWVzdF9ib3hfc3RvcmFnZSgKICAgIC8vICAgICBzZWxmLCBwb2xsX2lkOiBhcmM0LlVJbnQ2NCwgbWJyX3BheTogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24KICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3OC0yNzkKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgcG9sbF9pZCBpbiBzZWxmLmJveF9wX3BvbGxfZGF0YSwgIlBvbGwgaWQgbXVzdCBiZSBwcmVzZW50IGluIGJveCBwXy4iCiAgICBieXRlY18xIC8vIDB4NzA1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFBvbGwgaWQgbXVzdCBiZSBwcmVzZW50IGluIGJveCBwXy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyODEKICAgIC8vIHZvdGVyX2tleSA9IHNlbGYudm90ZXJfa2V5KHBvbGxfaWQubmF0aXZlLCBUeG4uc2VuZGVyKQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBkdXAKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgdm90ZXJfa2V5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MjgzCiAgICAvLyB2b3Rlcl9rZXkgbm90IGluIHNlbGYuYm94X3Zfdm90ZXJfZGF0YQogICAgYnl0ZWNfMiAvLyAweDc2NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyODItMjg0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHZvdGVyX2tleSBub3QgaW4gc2VsZi5ib3hfdl92b3Rlcl9kYXRhCiAgICAvLyApLCAiVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBub3QgYmUgcHJlc2VudCBpbiBib3ggdl8gZm9yIHRoaXMgcG9sbC4iCiAgICBhc3NlcnQgLy8gVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBub3QgYmUgcHJlc2VudCBpbiBib3ggdl8gZm9yIHRoaXMgcG9sbC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyODcKICAgIC8vIG1icl9wYXkuc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4Ni0yODgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5zZW5kZXIgPT0gVHhuLnNlbmRlcgogICAgLy8gKSwgIkJveCBzdG9yYWdlIE1CUiBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggdHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIEJveCBzdG9yYWdlIE1CUiBwYXltZW50IHNlbmRlciBhZGRyZXNzIG11c3QgbWF0Y2ggdHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MjkxCiAgICAvLyBtYnJfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI5MC0yOTIKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiQm94IHN0b3JhZ2UgTUJSIHBheW1lbnQgcmVjaWV2ZXIgYWRkcmVzcyBtdXN0IG1hdGNoIGFwcGxpY2F0aW9uIGFkZHJlc3MuIgogICAgYXNzZXJ0IC8vIEJveCBzdG9yYWdlIE1CUiBwYXltZW50IHJlY2lldmVyIGFkZHJlc3MgbXVzdCBtYXRjaCBhcHBsaWNhdGlvbiBhZGRyZXNzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI5NC0yOTUKICAgIC8vICMgQm94IHZfIGZlZTogMC4wMTk3IEFMR08KICAgIC8vIGFzc2VydCBtYnJfcGF5LmFtb3VudCA+PSBVSW50NjQoCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI5NC0yOTcKICAgIC8vICMgQm94IHZfIGZlZTogMC4wMTk3IEFMR08KICAgIC8vIGFzc2VydCBtYnJfcGF5LmFtb3VudCA+PSBVSW50NjQoCiAgICAvLyAgICAgQk9YX1ZfTUJSCiAgICAvLyApLCAiQm94IHN0b3JhZ2UgTUJSIHBheW1lbnQgYW1vdW50IG11c3QgYmUgZXF1YWwgb3IgZ3JlYXRlciB0aGFuIGJveCB2XyBmZWUuIgogICAgaW50YyA1IC8vIDE5NzAwCiAgICA+PQogICAgYXNzZXJ0IC8vIEJveCBzdG9yYWdlIE1CUiBwYXltZW50IGFtb3VudCBtdXN0IGJlIGVxdWFsIG9yIGdyZWF0ZXIgdGhhbiBib3ggdl8gZmVlLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwMgogICAgLy8gc2VsZi5wb2xsX2RhdGFfa2V5KHBvbGxfaWQubmF0aXZlKSwKICAgIGRpZyAxCiAgICBjYWxsc3ViIHBvbGxfZGF0YV9rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozMDMKICAgIC8vIFVJbnQ2NChQT0xMX0RBVEFfRU5EX0RBVEVfT0ZGU0VUKSwKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozMDQKICAgIC8vIFVJbnQ2NCg4KSwKICAgIGludGNfMyAvLyA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzAxLTMwNQogICAgLy8gb3AuQm94LmV4dHJhY3QoCiAgICAvLyAgICAgc2VsZi5wb2xsX2RhdGFfa2V5KHBvbGxfaWQubmF0aXZlKSwKICAgIC8vICAgICBVSW50NjQoUE9MTF9EQVRBX0VORF9EQVRFX09GRlNFVCksCiAgICAvLyAgICAgVUludDY0KDgpLAogICAgLy8gKQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToyOTktMzA2CiAgICAvLyAjIE9ubHkgdGhlIGVuZCBkYXRlIGlzIHJlYWQgZnJvbSB0aGUgc3RhdGljIGhlYWQgb2YgdGhlIHBvbGwgZGF0YSBib3gKICAgIC8vIGVuZF9kYXRlX3VuaXggPSBvcC5idG9pKAogICAgLy8gICAgIG9wLkJveC5leHRyYWN0KAogICAgLy8gICAgICAgICBzZWxmLnBvbGxfZGF0YV9rZXkocG9sbF9pZC5uYXRpdmUpLAogICAgLy8gICAgICAgICBVSW50NjQoUE9MTF9EQVRBX0VORF9EQVRFX09GRlNFVCksCiAgICAvLyAgICAgICAgIFVJbnQ2NCg4KSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzA4CiAgICAvLyBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCA8PSBlbmRfZGF0ZV91bml4CiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwNy0zMDkKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPD0gZW5kX2RhdGVfdW5peAogICAgLy8gKSwgIlVuYWJsZSB0byByZXF1ZXN0IGJveCBzdG9yYWdlIGlmIHZvdGluZyBwZXJpb2QgaXMgb3Zlci4iCiAgICBhc3NlcnQgLy8gVW5hYmxlIHRvIHJlcXVlc3QgYm94IHN0b3JhZ2UgaWYgdm90aW5nIHBlcmlvZCBpcyBvdmVyLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxMS0zMTIKICAgIC8vICMgQ3JlYXRlIHZvdGVyIGRhdGEgYm94IGFuZCBpbmNyZW1lbnQgdGhlIHBvbGwgbGl2ZSB2b3RlciBib3hlcyB0b3RhbAogICAgLy8gc2VsZi5ib3hfdl92b3Rlcl9kYXRhW3ZvdGVyX2tleV0gPSBWb3RlckRhdGEoYXJjNC5VSW50OCgwKSkKICAgIHB1c2hieXRlcyAweDAwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzE2CiAgICAvLyBzZWxmLnJlYWRfcG9sbF9zdGF0ZShwb2xsX2lkLm5hdGl2ZSwgVUludDY0KFBPTExfU1RBVEVfVk9URVJTX09GRlNFVCkpCiAgICBkdXAKICAgIGludGNfMSAvLyAwCiAgICBjYWxsc3ViIHJlYWRfcG9sbF9zdGF0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxNwogICAgLy8gKyBVSW50NjQoMSksCiAgICBpbnRjXzAgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxNi0zMTcKICAgIC8vIHNlbGYucmVhZF9wb2xsX3N0YXRlKHBvbGxfaWQubmF0aXZlLCBVSW50NjQoUE9MTF9TVEFURV9WT1RFUlNfT0ZGU0VUKSkKICAgIC8vICsgVUludDY0KDEpLAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxNQogICAgLy8gVUludDY0KFBPTExfU1RBVEVfVk9URVJTX09GRlNFVCksCiAgICBpbnRjXzEgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxMy0zMTgKICAgIC8vIHNlbGYud3JpdGVfcG9sbF9zdGF0ZSgKICAgIC8vICAgICBwb2xsX2lkLm5hdGl2ZSwKICAgIC8vICAgICBVSW50NjQoUE9MTF9TVEFURV9WT1RFUlNfT0ZGU0VUKSwKICAgIC8vICAgICBzZWxmLnJlYWRfcG9sbF9zdGF0ZShwb2xsX2lkLm5hdGl2ZSwgVUludDY0KFBPTExfU1RBVEVfVk9URVJTX09GRlNFVCkpCiAgICAvLyAgICAgKyBVSW50NjQoMSksCiAgICAvLyApCiAgICBzd2FwCiAgICBjYWxsc3ViIHdyaXRlX3BvbGxfc3RhdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozMjIKICAgIC8vIHNlbGYubmV4dF9ldmVudF9zZXEoKSwgcG9sbF9pZCwgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpCiAgICBjYWxsc3ViIG5leHRfZXZlbnRfc2VxCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzIxLTMyMwogICAgLy8gUG9sbFZvdGVyUmVnaXN0ZXJlZCgKICAgIC8vICAgICBzZWxmLm5leHRfZXZlbnRfc2VxKCksIHBvbGxfaWQsIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgLy8gKQogICAgc3dhcAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMyMC0zMjQKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBQb2xsVm90ZXJSZWdpc3RlcmVkKAogICAgLy8gICAgICAgICBzZWxmLm5leHRfZXZlbnRfc2VxKCksIHBvbGxfaWQsIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKQogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDRmMmQ4M2ExIC8vIG1ldGhvZCAiUG9sbFZvdGVyUmVnaXN0ZXJlZCh1aW50NjQsdWludDY0LGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozMjYtMzI3CiAgICAvLyAjIFBvbGwgZGF0YSwgcG9sbCBzdGF0ZSBhbmQgc2VuZGVyIHZvdGVyIGJveGVzCiAgICAvLyBsb2dfdGVsZW1ldHJ5KFVJbnQ2NCgzKSkKICAgIHB1c2hpbnQgMyAvLyAzCiAgICBjYWxsc3ViIGxvZ190ZWxlbWV0cnkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdF9yZWdpc3RyeS5jb250cmFjdC5PcGVuQmFsbG90UmVnaXN0cnkudm90ZXJfa2V5KHBvbGxfaWQ6IHVpbnQ2NCwgYWNjb3VudDogYnl0ZXMpIC0+IGJ5dGVzOgp2b3Rlcl9rZXk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ1LTE0NwogICAgLy8gIyBSZXR1cm4gdGhlIHZvdGVyIGRhdGEgYm94IGtleSAod2l0aG91dCBrZXkgcHJlZml4KSBmb3IgZ2l2ZW4gcG9sbCBpZCBhbmQgYWNjb3VudAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiB2b3Rlcl9rZXkoc2VsZiwgcG9sbF9pZDogVUludDY0LCBhY2NvdW50OiBBY2NvdW50KSAtPiBCeXRlczoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OAogICAgLy8gcmV0dXJuIG9wLml0b2IocG9sbF9pZCkgKyBhY2NvdW50LmJ5dGVzCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3RfcmVnaXN0cnkuY29udHJhY3QuT3BlbkJhbGxvdFJlZ2lzdHJ5LnBvbGxfZGF0YV9rZXkocG9sbF9pZDogdWludDY0KSAtPiBieXRlczoKcG9sbF9kYXRhX2tleToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToxMjQtMTI2CiAgICAvLyAjIFJldHVybiB0aGUgcG9sbCBkYXRhIGJveCBrZXkgZm9yIGdpdmVuIHBvbGwgaWQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcG9sbF9kYXRhX2tleShzZWxmLCBwb2xsX2lkOiBVSW50NjQpIC0+IEJ5dGVzOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTI3CiAgICAvLyByZXR1cm4gQnl0ZXMoYiJwXyIpICsgb3AuaXRvYihwb2xsX2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4NzA1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3RfcmVnaXN0cnkuY29udHJhY3QuT3BlbkJhbGxvdFJlZ2lzdHJ5LnJlYWRfcG9sbF9zdGF0ZShwb2xsX2lkOiB1aW50NjQsIG9mZnNldDogdWludDY0KSAtPiB1aW50NjQ6CnJlYWRfcG9sbF9zdGF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToxNTAtMTUyCiAgICAvLyAjIFJlYWQgYSB1aW50NjQgc2xvdCBvZiB0aGUgcG9sbCBzdGF0ZSBib3ggYXQgZ2l2ZW4gYnl0ZSBvZmZzZXQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVhZF9wb2xsX3N0YXRlKHNlbGYsIHBvbGxfaWQ6IFVJbnQ2NCwgb2Zmc2V0OiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MwogICAgLy8gcmV0dXJuIG9wLmJ0b2kob3AuQm94LmV4dHJhY3Qoc2VsZi5wb2xsX3N0YXRlX2tleShwb2xsX2lkKSwgb2Zmc2V0LCBVSW50NjQoOCkpKQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIHBvbGxfc3RhdGVfa2V5CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMyAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90X3JlZ2lzdHJ5LmNvbnRyYWN0Lk9wZW5CYWxsb3RSZWdpc3RyeS53cml0ZV9wb2xsX3N0YXRlKHBvbGxfaWQ6IHVpbnQ2NCwgb2Zmc2V0OiB1aW50NjQsIHZhbHVlOiB1aW50NjQpIC0+IHZvaWQ6CndyaXRlX3BvbGxfc3RhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTU1LTE1NwogICAgLy8gIyBPdmVyd3JpdGUgYSB1aW50NjQgc2xvdCBvZiB0aGUgcG9sbCBzdGF0ZSBib3ggYXQgZ2l2ZW4gYnl0ZSBvZmZzZXQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgd3JpdGVfcG9sbF9zdGF0ZShzZWxmLCBwb2xsX2lkOiBVSW50NjQsIG9mZnNldDogVUludDY0LCB2YWx1ZTogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTU4CiAgICAvLyBvcC5Cb3gucmVwbGFjZShzZWxmLnBvbGxfc3RhdGVfa2V5KHBvbGxfaWQpLCBvZmZzZXQsIG9wLml0b2IodmFsdWUpKQogICAgZnJhbWVfZGlnIC0zCiAgICBjYWxsc3ViIHBvbGxfc3RhdGVfa2V5CiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgYm94X3JlcGxhY2UKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdF9yZWdpc3RyeS5jb250cmFjdC5PcGVuQmFsbG90UmVnaXN0cnkubmV4dF9ldmVudF9zZXEoKSAtPiBieXRlczoKbmV4dF9ldmVudF9zZXE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTE3LTExOQogICAgLy8gIyBJbmNyZW1lbnQgYW5kIHJldHVybiB0aGUgZXZlbnQgc2VxdWVuY2UgbnVtYmVyIG9mIHRoZSBuZXh0IEFSQy0yOCBldmVudCAoJ3RvdGFsX2V2ZW50cycgcmVhZCBvbmNlKQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBuZXh0X2V2ZW50X3NlcShzZWxmKSAtPiBhcmM0LlVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMAogICAgLy8gc2VxID0gc2VsZi50b3RhbF9ldmVudHMgKyBVSW50NjQoMSkKICAgIGludGNfMSAvLyAwCiAgICBieXRlYyA0IC8vICJ0b3RhbF9ldmVudHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfZXZlbnRzIGV4aXN0cwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToxMjEKICAgIC8vIHNlbGYudG90YWxfZXZlbnRzID0gc2VxCiAgICBieXRlYyA0IC8vICJ0b3RhbF9ldmVudHMiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToxMjIKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZXEpCiAgICBpdG9iCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3RfcmVnaXN0cnkuY29udHJhY3QuT3BlbkJhbGxvdFJlZ2lzdHJ5LnN1Ym1pdF92b3RlKHBvbGxfaWQ6IGJ5dGVzLCBjaG9pY2U6IGJ5dGVzKSAtPiB2b2lkOgpzdWJtaXRfdm90ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozMjktMzMxCiAgICAvLyAjIEVuYWJsZSBhbnkgZWxpZ2libGUgYWNjb3VudCB0byBzdWJtaXQgYSB2b3RlIGZvciBhIHBvbGwKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHN1Ym1pdF92b3RlKHNlbGYsIHBvbGxfaWQ6IGFyYzQuVUludDY0LCBjaG9pY2U6IGFyYzQuVUludDgpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozMzItMzM0CiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gIyBSZWFkIHZvdGVyIGRhdGEgYm94IG9uY2UKICAgIC8vIHZvdGVyX2tleSA9IHNlbGYudm90ZXJfa2V5KHBvbGxfaWQubmF0aXZlLCBUeG4uc2VuZGVyKQogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBkdXBuIDIKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgdm90ZXJfa2V5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzM2CiAgICAvLyBzZWxmLmJveF92X3ZvdGVyX2RhdGEua2V5X3ByZWZpeCArIHZvdGVyX2tleQogICAgYnl0ZWNfMiAvLyAweDc2NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzM1LTMzNwogICAgLy8gdm90ZXJfYm94LCB2b3Rlcl9leGlzdHMgPSBvcC5Cb3guZ2V0KAogICAgLy8gICAgIHNlbGYuYm94X3Zfdm90ZXJfZGF0YS5rZXlfcHJlZml4ICsgdm90ZXJfa2V5CiAgICAvLyApCiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzM4LTM0MAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICB2b3Rlcl9leGlzdHMKICAgIC8vICksICJUcmFuc2FjdGlvbiBzZW5kZXIgYWRkcmVzcyBtdXN0IGJlIHByZXNlbnQgaW4gYm94IHZfIGZvciB0aGlzIHBvbGwuIgogICAgYXNzZXJ0IC8vIFRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIG11c3QgYmUgcHJlc2VudCBpbiBib3ggdl8gZm9yIHRoaXMgcG9sbC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozNDIKICAgIC8vIGFzc2VydCBWb3RlckRhdGEuZnJvbV9ieXRlcyh2b3Rlcl9ib3gpLmNob2ljZSA9PSBhcmM0LlVJbnQ4KAogICAgZXh0cmFjdCAwIDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzQyLTM0NAogICAgLy8gYXNzZXJ0IFZvdGVyRGF0YS5mcm9tX2J5dGVzKHZvdGVyX2JveCkuY2hvaWNlID09IGFyYzQuVUludDgoCiAgICAvLyAgICAgMAogICAgLy8gKSwgIlRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIGFscmVhZHkgc3VibWl0dGVkIGEgdm90ZS4iCiAgICBwdXNoYnl0ZXMgMHgwMAogICAgYj09CiAgICBhc3NlcnQgLy8gVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgYWxyZWFkeSBzdWJtaXR0ZWQgYSB2b3RlLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0OAogICAgLy8gc2VsZi5wb2xsX3N0YXRlX2tleShwb2xsX2lkLm5hdGl2ZSkKICAgIGNhbGxzdWIgcG9sbF9zdGF0ZV9rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozNDYtMzQ5CiAgICAvLyAjIE51bWJlciBvZiBwb2xsIGNob2ljZXMgZm9sbG93cyBmcm9tIHRoZSBwb2xsIHN0YXRlIGJveCBzaXplIChubyBwb2xsIGRhdGEgYm94IHJlYWQgbmVlZGVkKQogICAgLy8gcG9sbF9zdGF0ZV9zaXplLCBwb2xsX2V4aXN0cyA9IG9wLkJveC5sZW5ndGgoCiAgICAvLyAgICAgc2VsZi5wb2xsX3N0YXRlX2tleShwb2xsX2lkLm5hdGl2ZSkKICAgIC8vICkKICAgIGJveF9sZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozNTAKICAgIC8vIGFzc2VydCBwb2xsX2V4aXN0cywgIlBvbGwgaWQgbXVzdCBiZSBwcmVzZW50IGluIGJveCB0Xy4iCiAgICBhc3NlcnQgLy8gUG9sbCBpZCBtdXN0IGJlIHByZXNlbnQgaW4gYm94IHRfLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1MgogICAgLy8gYXNzZXJ0IGNob2ljZS5uYXRpdmUgPj0gVUludDY0KDEpIGFuZCBjaG9pY2UubmF0aXZlIDw9ICgKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgZHVwCiAgICBpbnRjXzAgLy8gMQogICAgPj0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozNTItMzU2CiAgICAvLyBhc3NlcnQgY2hvaWNlLm5hdGl2ZSA+PSBVSW50NjQoMSkgYW5kIGNob2ljZS5uYXRpdmUgPD0gKAogICAgLy8gICAgIHBvbGxfc3RhdGVfc2l6ZSAtIFVJbnQ2NChQT0xMX1NUQVRFX1RBTExJRVNfT0ZGU0VUKQogICAgLy8gKSAvLyBVSW50NjQoCiAgICAvLyAgICAgOAogICAgLy8gKSwgIkludmFsaWQgY2hvaWNlLiBDYW4gb25seSBzZWxlY3QgYSBjaG9pY2UgYmV0d2VlbiAxIGFuZCB0aGUgbnVtYmVyIG9mIHBvbGwgY2hvaWNlcy4iCiAgICBieiBzdWJtaXRfdm90ZV9ib29sX2ZhbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozNTMKICAgIC8vIHBvbGxfc3RhdGVfc2l6ZSAtIFVJbnQ2NChQT0xMX1NUQVRFX1RBTExJRVNfT0ZGU0VUKQogICAgZnJhbWVfZGlnIDIKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozNTQtMzU2CiAgICAvLyApIC8vIFVJbnQ2NCgKICAgIC8vICAgICA4CiAgICAvLyApLCAiSW52YWxpZCBjaG9pY2UuIENhbiBvbmx5IHNlbGVjdCBhIGNob2ljZSBiZXR3ZWVuIDEgYW5kIHRoZSBudW1iZXIgb2YgcG9sbCBjaG9pY2VzLiIKICAgIGludGNfMyAvLyA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzUyLTM1NgogICAgLy8gYXNzZXJ0IGNob2ljZS5uYXRpdmUgPj0gVUludDY0KDEpIGFuZCBjaG9pY2UubmF0aXZlIDw9ICgKICAgIC8vICAgICBwb2xsX3N0YXRlX3NpemUgLSBVSW50NjQoUE9MTF9TVEFURV9UQUxMSUVTX09GRlNFVCkKICAgIC8vICkgLy8gVUludDY0KAogICAgLy8gICAgIDgKICAgIC8vICksICJJbnZhbGlkIGNob2ljZS4gQ2FuIG9ubHkgc2VsZWN0IGEgY2hvaWNlIGJldHdlZW4gMSBhbmQgdGhlIG51bWJlciBvZiBwb2xsIGNob2ljZXMuIgogICAgLwogICAgZnJhbWVfZGlnIDMKICAgID49CiAgICBieiBzdWJtaXRfdm90ZV9ib29sX2ZhbHNlQDMKICAgIGludGNfMCAvLyAxCiAgICBiIHN1Ym1pdF92b3RlX2Jvb2xfbWVyZ2VANAoKc3VibWl0X3ZvdGVfYm9vbF9mYWxzZUAzOgogICAgaW50Y18xIC8vIDAKCnN1Ym1pdF92b3RlX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozNTItMzU2CiAgICAvLyBhc3NlcnQgY2hvaWNlLm5hdGl2ZSA+PSBVSW50NjQoMSkgYW5kIGNob2ljZS5uYXRpdmUgPD0gKAogICAgLy8gICAgIHBvbGxfc3RhdGVfc2l6ZSAtIFVJbnQ2NChQT0xMX1NUQVRFX1RBTExJRVNfT0ZGU0VUKQogICAgLy8gKSAvLyBVSW50NjQoCiAgICAvLyAgICAgOAogICAgLy8gKSwgIkludmFsaWQgY2hvaWNlLiBDYW4gb25seSBzZWxlY3QgYSBjaG9pY2UgYmV0d2VlbiAxIGFuZCB0aGUgbnVtYmVyIG9mIHBvbGwgY2hvaWNlcy4iCiAgICBhc3NlcnQgLy8gSW52YWxpZCBjaG9pY2UuIENhbiBvbmx5IHNlbGVjdCBhIGNob2ljZSBiZXR3ZWVuIDEgYW5kIHRoZSBudW1iZXIgb2YgcG9sbCBjaG9pY2VzLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1OC0zNTkKICAgIC8vICMgU2V0IGFjY291bnQgdm90ZXIgZGF0YQogICAgLy8gc2VsZi5ib3hfdl92b3Rlcl9kYXRhW3ZvdGVyX2tleV0gPSBWb3RlckRhdGEoY2hvaWNlKQogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM2MwogICAgLy8gY2hvaWNlLm5hdGl2ZSAtIFVJbnQ2NCgxKQogICAgZnJhbWVfZGlnIDMKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzY0CiAgICAvLyApICogVUludDY0KDgpCiAgICBpbnRjXzMgLy8gOAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM2MS0zNjQKICAgIC8vICMgVXBkYXRlIHZvdGUgdGFsbHkgKGluY3JlbWVudCB0aGUgdWludDY0IHNsb3Qgb2YgdGhlIGNob2ljZSBpbiBwbGFjZSkKICAgIC8vIHRhbGx5X29mZnNldCA9IFVJbnQ2NChQT0xMX1NUQVRFX1RBTExJRVNfT0ZGU0VUKSArICgKICAgIC8vICAgICBjaG9pY2UubmF0aXZlIC0gVUludDY0KDEpCiAgICAvLyApICogVUludDY0KDgpCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzYxLTM2MgogICAgLy8gIyBVcGRhdGUgdm90ZSB0YWxseSAoaW5jcmVtZW50IHRoZSB1aW50NjQgc2xvdCBvZiB0aGUgY2hvaWNlIGluIHBsYWNlKQogICAgLy8gdGFsbHlfb2Zmc2V0ID0gVUludDY0KFBPTExfU1RBVEVfVEFMTElFU19PRkZTRVQpICsgKAogICAgcHVzaGludCAxNiAvLyAxNgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM2MS0zNjQKICAgIC8vICMgVXBkYXRlIHZvdGUgdGFsbHkgKGluY3JlbWVudCB0aGUgdWludDY0IHNsb3Qgb2YgdGhlIGNob2ljZSBpbiBwbGFjZSkKICAgIC8vIHRhbGx5X29mZnNldCA9IFVJbnQ2NChQT0xMX1NUQVRFX1RBTExJRVNfT0ZGU0VUKSArICgKICAgIC8vICAgICBjaG9pY2UubmF0aXZlIC0gVUludDY0KDEpCiAgICAvLyApICogVUludDY0KDgpCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzY4CiAgICAvLyBzZWxmLnJlYWRfcG9sbF9zdGF0ZShwb2xsX2lkLm5hdGl2ZSwgdGFsbHlfb2Zmc2V0KSArIFVJbnQ2NCgxKSwKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGRpZyAxCiAgICBjYWxsc3ViIHJlYWRfcG9sbF9zdGF0ZQogICAgaW50Y18wIC8vIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozNjUtMzY5CiAgICAvLyBzZWxmLndyaXRlX3BvbGxfc3RhdGUoCiAgICAvLyAgICAgcG9sbF9pZC5uYXRpdmUsCiAgICAvLyAgICAgdGFsbHlfb2Zmc2V0LAogICAgLy8gICAgIHNlbGYucmVhZF9wb2xsX3N0YXRlKHBvbGxfaWQubmF0aXZlLCB0YWxseV9vZmZzZXQpICsgVUludDY0KDEpLAogICAgLy8gKQogICAgY2FsbHN1YiB3cml0ZV9wb2xsX3N0YXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzczCiAgICAvLyBzZWxmLm5leHRfZXZlbnRfc2VxKCksIHBvbGxfaWQsIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgY2hvaWNlCiAgICBjYWxsc3ViIG5leHRfZXZlbnRfc2VxCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzcyLTM3NAogICAgLy8gUG9sbFZvdGVDYXN0KAogICAgLy8gICAgIHNlbGYubmV4dF9ldmVudF9zZXEoKSwgcG9sbF9pZCwgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBjaG9pY2UKICAgIC8vICkKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzcxLTM3NQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIFBvbGxWb3RlQ2FzdCgKICAgIC8vICAgICAgICAgc2VsZi5uZXh0X2V2ZW50X3NlcSgpLCBwb2xsX2lkLCBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIGNob2ljZQogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDE5YTcxYWY2IC8vIG1ldGhvZCAiUG9sbFZvdGVDYXN0KHVpbnQ2NCx1aW50NjQsYWRkcmVzcyx1aW50OCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3NwogICAgLy8gbG9nX3RlbGVtZXRyeShVSW50NjQoMikpCiAgICBpbnRjXzIgLy8gMgogICAgY2FsbHN1YiBsb2dfdGVsZW1ldHJ5CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3RfcmVnaXN0cnkuY29udHJhY3QuT3BlbkJhbGxvdFJlZ2lzdHJ5LmRlbGV0ZV9ib3hfc3RvcmFnZShwb2xsX2lkOiBieXRlcykgLT4gdm9pZDoKZGVsZXRlX2JveF9zdG9yYWdlOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3OS0zODEKICAgIC8vICMgRW5hYmxlIGFueSBlbGlnYmxlIGFjY291bnQgdG8gZGVsZXRlIHRoZWlyIHBvbGwgYm94IHN0b3JhZ2UgYW5kIGdldCB0aGVpciBNQlIgcGF5bWVudCByZWZ1bmRlZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgZGVsZXRlX2JveF9zdG9yYWdlKHNlbGYsIHBvbGxfaWQ6IGFyYzQuVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzgyLTM4MwogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIHZvdGVyX2tleSA9IHNlbGYudm90ZXJfa2V5KHBvbGxfaWQubmF0aXZlLCBUeG4uc2VuZGVyKQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBkdXAKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgdm90ZXJfa2V5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6Mzg1CiAgICAvLyB2b3Rlcl9rZXkgaW4gc2VsZi5ib3hfdl92b3Rlcl9kYXRhCiAgICBieXRlY18yIC8vIDB4NzY1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM4NC0zODYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgdm90ZXJfa2V5IGluIHNlbGYuYm94X3Zfdm90ZXJfZGF0YQogICAgLy8gKSwgIlRyYW5zYWN0aW9uIHNlbmRlciBhZGRyZXNzIG11c3QgYmUgcHJlc2VudCBpbiBib3ggdl8gZm9yIHRoaXMgcG9sbC4iCiAgICBhc3NlcnQgLy8gVHJhbnNhY3Rpb24gc2VuZGVyIGFkZHJlc3MgbXVzdCBiZSBwcmVzZW50IGluIGJveCB2XyBmb3IgdGhpcyBwb2xsLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM4OC0zODkKICAgIC8vICMgRGVsZXRlIGJveCBrZXkgKHBvbGwgaWQgKyBhZGRyZXNzKSBmcm9tIGJveCBzdG9yYWdlIGFuZCBkZWNyZW1lbnQgdGhlIHBvbGwgbGl2ZSB2b3RlciBib3hlcyB0b3RhbAogICAgLy8gZGVsIHNlbGYuYm94X3Zfdm90ZXJfZGF0YVt2b3Rlcl9rZXldCiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTozOTMKICAgIC8vIHNlbGYucmVhZF9wb2xsX3N0YXRlKHBvbGxfaWQubmF0aXZlLCBVSW50NjQoUE9MTF9TVEFURV9WT1RFUlNfT0ZGU0VUKSkKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIGNhbGxzdWIgcmVhZF9wb2xsX3N0YXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6Mzk0CiAgICAvLyAtIFVJbnQ2NCgxKSwKICAgIGludGNfMCAvLyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzkzLTM5NAogICAgLy8gc2VsZi5yZWFkX3BvbGxfc3RhdGUocG9sbF9pZC5uYXRpdmUsIFVJbnQ2NChQT0xMX1NUQVRFX1ZPVEVSU19PRkZTRVQpKQogICAgLy8gLSBVSW50NjQoMSksCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzkyCiAgICAvLyBVSW50NjQoUE9MTF9TVEFURV9WT1RFUlNfT0ZGU0VUKSwKICAgIGludGNfMSAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MzkwLTM5NQogICAgLy8gc2VsZi53cml0ZV9wb2xsX3N0YXRlKAogICAgLy8gICAgIHBvbGxfaWQubmF0aXZlLAogICAgLy8gICAgIFVJbnQ2NChQT0xMX1NUQVRFX1ZPVEVSU19PRkZTRVQpLAogICAgLy8gICAgIHNlbGYucmVhZF9wb2xsX3N0YXRlKHBvbGxfaWQubmF0aXZlLCBVSW50NjQoUE9MTF9TVEFURV9WT1RFUlNfT0ZGU0VUKSkKICAgIC8vICAgICAtIFVJbnQ2NCgxKSwKICAgIC8vICkKICAgIHN3YXAKICAgIGNhbGxzdWIgd3JpdGVfcG9sbF9zdGF0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM5OAogICAgLy8gUG9sbEJveERlbGV0ZWQoc2VsZi5uZXh0X2V2ZW50X3NlcSgpLCBwb2xsX2lkLCBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikpCiAgICBjYWxsc3ViIG5leHRfZXZlbnRfc2VxCiAgICB0eG4gU2VuZGVyCiAgICBzd2FwCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6Mzk3LTM5OQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIFBvbGxCb3hEZWxldGVkKHNlbGYubmV4dF9ldmVudF9zZXEoKSwgcG9sbF9pZCwgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4OTBmY2FlMDAgLy8gbWV0aG9kICJQb2xsQm94RGVsZXRlZCh1aW50NjQsdWludDY0LGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0MDEtNDA3CiAgICAvLyAjIFN1Ym1pdCBpbm5lciB0cmFuc2FjdGlvbiAodHJhbnNhY3Rpb24gc2VuZGVyIGdldHMgdGhlaXIgQm94IHN0b3JhZ2UgTUJSIHJlZnVuZGVkKQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHNlbmRlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYW1vdW50PVVJbnQ2NChCT1hfVl9NQlIgLSBNSU5fVFhOX0ZFRSksCiAgICAvLyAgICAgZmVlPU1JTl9UWE5fRkVFLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwMwogICAgLy8gc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwNAogICAgLy8gcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0MDUKICAgIC8vIGFtb3VudD1VSW50NjQoQk9YX1ZfTUJSIC0gTUlOX1RYTl9GRUUpLAogICAgcHVzaGludCAxODcwMCAvLyAxODcwMAogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDAxLTQwMgogICAgLy8gIyBTdWJtaXQgaW5uZXIgdHJhbnNhY3Rpb24gKHRyYW5zYWN0aW9uIHNlbmRlciBnZXRzIHRoZWlyIEJveCBzdG9yYWdlIE1CUiByZWZ1bmRlZCkKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMCAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0MDYKICAgIC8vIGZlZT1NSU5fVFhOX0ZFRSwKICAgIGludGMgNCAvLyAxMDAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwMS00MDcKICAgIC8vICMgU3VibWl0IGlubmVyIHRyYW5zYWN0aW9uICh0cmFuc2FjdGlvbiBzZW5kZXIgZ2V0cyB0aGVpciBCb3ggc3RvcmFnZSBNQlIgcmVmdW5kZWQpCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhbW91bnQ9VUludDY0KEJPWF9WX01CUiAtIE1JTl9UWE5fRkVFKSwKICAgIC8vICAgICBmZWU9TUlOX1RYTl9GRUUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwOQogICAgLy8gbG9nX3RlbGVtZXRyeShVSW50NjQoMikpCiAgICBpbnRjXzIgLy8gMgogICAgY2FsbHN1YiBsb2dfdGVsZW1ldHJ5CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3RfcmVnaXN0cnkuY29udHJhY3QuT3BlbkJhbGxvdFJlZ2lzdHJ5LnB1cmdlX2JveF9zdG9yYWdlKHBvbGxfaWQ6IGJ5dGVzLCBib3hfa2V5czogYnl0ZXMpIC0+IHZvaWQ6CnB1cmdlX2JveF9zdG9yYWdlOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxMS00MTUKICAgIC8vICMgRW5hYmxlIHBvbGwgY3JlYXRvciB0byBleGVjdXRlIGJveCBzdG9yYWdlIHB1cmdlIGZvciB0aGVpciBwb2xsLCB0aGlzIGRlbGV0ZXMgYW55IHZvdGVyIGJveGVzIGxlZnQgYmVoaW5kCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBwdXJnZV9ib3hfc3RvcmFnZSgKICAgIC8vICAgICBzZWxmLCBwb2xsX2lkOiBhcmM0LlVJbnQ2NCwgYm94X2tleXM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuQWRkcmVzc10KICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxNi00MTcKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnBvbGxfY3JlYXRvcigKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0MTgKICAgIC8vIHBvbGxfaWQubmF0aXZlCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxNi00MTkKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnBvbGxfY3JlYXRvcigKICAgIC8vICAgICBwb2xsX2lkLm5hdGl2ZQogICAgLy8gKSwgIlVuYXV0aG9yaXplZCBhZGRyZXNzISBPbmx5IHBvbGwgY3JlYXRvciBjYW4gcHVyZ2UgcG9sbCBib3ggc3RvcmFnZS4iCiAgICBjYWxsc3ViIHBvbGxfY3JlYXRvcgogICAgPT0KICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQgYWRkcmVzcyEgT25seSBwb2xsIGNyZWF0b3IgY2FuIHB1cmdlIHBvbGwgYm94IHN0b3JhZ2UuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDIzCiAgICAvLyBib3hfa2V5cy5sZW5ndGggPiAwCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDIxLTQyNAogICAgLy8gIyBOT1RFOiBOdW1iZXIgb2YgYm94IGtleXMgaXMgYm91bmQgYnkgdGhlIGJveCByZWZlcmVuY2VzIGF2YWlsYWJsZSB0byB0aGUgZ3JvdXAgKHBvbGwgYm94ZXMgKyB2b3RlciBib3hlcykKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYm94X2tleXMubGVuZ3RoID4gMAogICAgLy8gKSwgIlRoZSBudW1iZXIgb2YgYWRkcmVzc2VzIHJlcHJlc2VudGVkIGJ5IGJveCBrZXlzIGFycmF5IG11c3QgYmUgZ3JlYXRlciB0aGFuIDAuIgogICAgYXNzZXJ0IC8vIFRoZSBudW1iZXIgb2YgYWRkcmVzc2VzIHJlcHJlc2VudGVkIGJ5IGJveCBrZXlzIGFycmF5IG11c3QgYmUgZ3JlYXRlciB0aGFuIDAuCiAgICBpbnRjXzEgLy8gMAoKcHVyZ2VfYm94X3N0b3JhZ2VfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQyNi00MjcKICAgIC8vICMgSXRlcmF0ZSB0aHJvdWdoIHRoZSBkeW5hbWljIGFycmF5IG9mIGFkZHJlc3NlcyByZXByZXNlbnRpbmcgdGhlIGJveCBrZXkKICAgIC8vIGZvciBib3hfa2V5IGluIGJveF9rZXlzOgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiBwdXJnZV9ib3hfc3RvcmFnZV9hZnRlcl9mb3JANAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCAzMiAvLyAzMgogICAgKgogICAgcHVzaGludCAzMiAvLyAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDI4CiAgICAvLyB2b3Rlcl9rZXkgPSBzZWxmLnZvdGVyX2tleShwb2xsX2lkLm5hdGl2ZSwgYm94X2tleS5uYXRpdmUpCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgY2FsbHN1YiB2b3Rlcl9rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0MzAKICAgIC8vIHZvdGVyX2tleSBpbiBzZWxmLmJveF92X3ZvdGVyX2RhdGEKICAgIGJ5dGVjXzIgLy8gMHg3NjVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDI5LTQzMQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICB2b3Rlcl9rZXkgaW4gc2VsZi5ib3hfdl92b3Rlcl9kYXRhCiAgICAvLyApLCAiQWNjb3VudCBhZGRyZXNzIHJlcHJlc2VudGVkIGluIGJveCBrZXkgbXVzdCBiZSBwcmVzZW50IGluIGJveCB2XyBmb3IgdGhpcyBwb2xsLiIKICAgIGFzc2VydCAvLyBBY2NvdW50IGFkZHJlc3MgcmVwcmVzZW50ZWQgaW4gYm94IGtleSBtdXN0IGJlIHByZXNlbnQgaW4gYm94IHZfIGZvciB0aGlzIHBvbGwuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDMzLTQzNAogICAgLy8gIyBEZWxldGUgYm94IGtleSAocG9sbCBpZCArIGFkZHJlc3MpIGZyb20gYm94IHN0b3JhZ2UKICAgIC8vIGRlbCBzZWxmLmJveF92X3ZvdGVyX2RhdGFbdm90ZXJfa2V5XQogICAgYm94X2RlbAogICAgcG9wCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIHB1cmdlX2JveF9zdG9yYWdlX2Zvcl9oZWFkZXJAMQoKcHVyZ2VfYm94X3N0b3JhZ2VfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDQwCiAgICAvLyBzZWxmLnJlYWRfcG9sbF9zdGF0ZShwb2xsX2lkLm5hdGl2ZSwgVUludDY0KFBPTExfU1RBVEVfVk9URVJTX09GRlNFVCkpCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgY2FsbHN1YiByZWFkX3BvbGxfc3RhdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0NDAtNDQxCiAgICAvLyBzZWxmLnJlYWRfcG9sbF9zdGF0ZShwb2xsX2lkLm5hdGl2ZSwgVUludDY0KFBPTExfU1RBVEVfVk9URVJTX09GRlNFVCkpCiAgICAvLyAtIGJveF9rZXlzLmxlbmd0aCwKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0MzYtNDQyCiAgICAvLyAjIE1vdmUgdGhlIHB1cmdlZCBib3hlcyBmcm9tIHRoZSBwb2xsIGxpdmUgdm90ZXIgYm94ZXMgdG90YWwgdG8gdGhlIHBvbGwgcHVyZ2VkIHZvdGVyIGJveGVzIHRvdGFsCiAgICAvLyBzZWxmLndyaXRlX3BvbGxfc3RhdGUoCiAgICAvLyAgICAgcG9sbF9pZC5uYXRpdmUsCiAgICAvLyAgICAgVUludDY0KFBPTExfU1RBVEVfVk9URVJTX09GRlNFVCksCiAgICAvLyAgICAgc2VsZi5yZWFkX3BvbGxfc3RhdGUocG9sbF9pZC5uYXRpdmUsIFVJbnQ2NChQT0xMX1NUQVRFX1ZPVEVSU19PRkZTRVQpKQogICAgLy8gICAgIC0gYm94X2tleXMubGVuZ3RoLAogICAgLy8gKQogICAgZGlnIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0MzkKICAgIC8vIFVJbnQ2NChQT0xMX1NUQVRFX1ZPVEVSU19PRkZTRVQpLAogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0MzYtNDQyCiAgICAvLyAjIE1vdmUgdGhlIHB1cmdlZCBib3hlcyBmcm9tIHRoZSBwb2xsIGxpdmUgdm90ZXIgYm94ZXMgdG90YWwgdG8gdGhlIHBvbGwgcHVyZ2VkIHZvdGVyIGJveGVzIHRvdGFsCiAgICAvLyBzZWxmLndyaXRlX3BvbGxfc3RhdGUoCiAgICAvLyAgICAgcG9sbF9pZC5uYXRpdmUsCiAgICAvLyAgICAgVUludDY0KFBPTExfU1RBVEVfVk9URVJTX09GRlNFVCksCiAgICAvLyAgICAgc2VsZi5yZWFkX3BvbGxfc3RhdGUocG9sbF9pZC5uYXRpdmUsIFVJbnQ2NChQT0xMX1NUQVRFX1ZPVEVSU19PRkZTRVQpKQogICAgLy8gICAgIC0gYm94X2tleXMubGVuZ3RoLAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIHdyaXRlX3BvbGxfc3RhdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0NDYKICAgIC8vIHNlbGYucmVhZF9wb2xsX3N0YXRlKHBvbGxfaWQubmF0aXZlLCBVSW50NjQoUE9MTF9TVEFURV9QVVJHRURfT0ZGU0VUKSkKICAgIGR1cAogICAgaW50Y18zIC8vIDgKICAgIGNhbGxzdWIgcmVhZF9wb2xsX3N0YXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDQ2LTQ0NwogICAgLy8gc2VsZi5yZWFkX3BvbGxfc3RhdGUocG9sbF9pZC5uYXRpdmUsIFVJbnQ2NChQT0xMX1NUQVRFX1BVUkdFRF9PRkZTRVQpKQogICAgLy8gKyBib3hfa2V5cy5sZW5ndGgsCiAgICBkaWcgMgogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0NQogICAgLy8gVUludDY0KFBPTExfU1RBVEVfUFVSR0VEX09GRlNFVCksCiAgICBpbnRjXzMgLy8gOAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0My00NDgKICAgIC8vIHNlbGYud3JpdGVfcG9sbF9zdGF0ZSgKICAgIC8vICAgICBwb2xsX2lkLm5hdGl2ZSwKICAgIC8vICAgICBVSW50NjQoUE9MTF9TVEFURV9QVVJHRURfT0ZGU0VUKSwKICAgIC8vICAgICBzZWxmLnJlYWRfcG9sbF9zdGF0ZShwb2xsX2lkLm5hdGl2ZSwgVUludDY0KFBPTExfU1RBVEVfUFVSR0VEX09GRlNFVCkpCiAgICAvLyAgICAgKyBib3hfa2V5cy5sZW5ndGgsCiAgICAvLyApCiAgICBzd2FwCiAgICBjYWxsc3ViIHdyaXRlX3BvbGxfc3RhdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0NTIKICAgIC8vIHNlbGYubmV4dF9ldmVudF9zZXEoKSwgcG9sbF9pZCwgYXJjNC5VSW50NjQoYm94X2tleXMubGVuZ3RoKQogICAgY2FsbHN1YiBuZXh0X2V2ZW50X3NlcQogICAgZGlnIDEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0NTEtNDUzCiAgICAvLyBQb2xsQm94ZXNQdXJnZWQoCiAgICAvLyAgICAgc2VsZi5uZXh0X2V2ZW50X3NlcSgpLCBwb2xsX2lkLCBhcmM0LlVJbnQ2NChib3hfa2V5cy5sZW5ndGgpCiAgICAvLyApCiAgICBzd2FwCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDUwLTQ1NAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIFBvbGxCb3hlc1B1cmdlZCgKICAgIC8vICAgICAgICAgc2VsZi5uZXh0X2V2ZW50X3NlcSgpLCBwb2xsX2lkLCBhcmM0LlVJbnQ2NChib3hfa2V5cy5sZW5ndGgpCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4YzMyYTIyMDMgLy8gbWV0aG9kICJQb2xsQm94ZXNQdXJnZWQodWludDY0LHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0NTYtNDU3CiAgICAvLyAjIFBvbGwgZGF0YSBhbmQgcG9sbCBzdGF0ZSBib3hlcywgcGx1cyBldmVyeSBwdXJnZWQgdm90ZXIgYm94CiAgICAvLyBsb2dfdGVsZW1ldHJ5KFVJbnQ2NCgyKSArIGJveF9rZXlzLmxlbmd0aCkKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBjYWxsc3ViIGxvZ190ZWxlbWV0cnkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5vcGVuX2JhbGxvdF9yZWdpc3RyeS5jb250cmFjdC5PcGVuQmFsbG90UmVnaXN0cnkucG9sbF9jcmVhdG9yKHBvbGxfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CnBvbGxfY3JlYXRvcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToxMjktMTMxCiAgICAvLyAjIFJldHVybiB0aGUgcG9sbCBjcmVhdG9yIGFkZHJlc3MgcmVhZCBmcm9tIHRoZSBzdGF0aWMgaGVhZCBvZiB0aGUgcG9sbCBkYXRhIGJveCAobm8gZnVsbCBwb2xsIGRhdGEgYm94IHJlYWQpCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHBvbGxfY3JlYXRvcihzZWxmLCBwb2xsX2lkOiBVSW50NjQpIC0+IEFjY291bnQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToxMzQKICAgIC8vIHNlbGYucG9sbF9kYXRhX2tleShwb2xsX2lkKSwKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBwb2xsX2RhdGFfa2V5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTM1CiAgICAvLyBVSW50NjQoUE9MTF9EQVRBX0NSRUFUT1JfT0ZGU0VUKSwKICAgIGludGNfMSAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6MTM2CiAgICAvLyBVSW50NjQoMzIpLAogICAgcHVzaGludCAzMiAvLyAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMy0xMzcKICAgIC8vIG9wLkJveC5leHRyYWN0KAogICAgLy8gICAgIHNlbGYucG9sbF9kYXRhX2tleShwb2xsX2lkKSwKICAgIC8vICAgICBVSW50NjQoUE9MTF9EQVRBX0NSRUFUT1JfT0ZGU0VUKSwKICAgIC8vICAgICBVSW50NjQoMzIpLAogICAgLy8gKQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weToxMzItMTM4CiAgICAvLyByZXR1cm4gQWNjb3VudCgKICAgIC8vICAgICBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICAgICAgc2VsZi5wb2xsX2RhdGFfa2V5KHBvbGxfaWQpLAogICAgLy8gICAgICAgICBVSW50NjQoUE9MTF9EQVRBX0NSRUFUT1JfT0ZGU0VUKSwKICAgIC8vICAgICAgICAgVUludDY0KDMyKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGxlbmd0aCBpcyAzMiBieXRlcwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90X3JlZ2lzdHJ5LmNvbnRyYWN0Lk9wZW5CYWxsb3RSZWdpc3RyeS5jbG9zZV9wb2xsKHBvbGxfaWQ6IGJ5dGVzKSAtPiB2b2lkOgpjbG9zZV9wb2xsOgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ1OS00NjEKICAgIC8vICMgRW5hYmxlIHBvbGwgY3JlYXRvciB0byBjbG9zZSB0aGVpciBwb2xsIG9uY2UgZXZlcnkgdm90ZXIgYm94IGlzIGdvbmUsIGZyZWVzIHBvbGwgYm94ZXMgYW5kIHJlZnVuZHMgdGhlaXIgTUJSCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBjbG9zZV9wb2xsKHNlbGYsIHBvbGxfaWQ6IGFyYzQuVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDYyLTQ2MwogICAgLy8gIyBNYWtlIG5lY2Vzc2FyeSBhc3NlcnRpb25zIHRvIHZlcmlmeSB0cmFuc2FjdGlvbiByZXF1aXJlbWVudHMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYucG9sbF9jcmVhdG9yKAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2NAogICAgLy8gcG9sbF9pZC5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2Mi00NjUKICAgIC8vICMgTWFrZSBuZWNlc3NhcnkgYXNzZXJ0aW9ucyB0byB2ZXJpZnkgdHJhbnNhY3Rpb24gcmVxdWlyZW1lbnRzCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnBvbGxfY3JlYXRvcigKICAgIC8vICAgICBwb2xsX2lkLm5hdGl2ZQogICAgLy8gKSwgIlVuYXV0aG9yaXplZCBhZGRyZXNzISBPbmx5IHBvbGwgY3JlYXRvciBjYW4gY2xvc2UgdGhlIHBvbGwuIgogICAgZHVwCiAgICBjYWxsc3ViIHBvbGxfY3JlYXRvcgogICAgdW5jb3ZlciAyCiAgICA9PQogICAgYXNzZXJ0IC8vIFVuYXV0aG9yaXplZCBhZGRyZXNzISBPbmx5IHBvbGwgY3JlYXRvciBjYW4gY2xvc2UgdGhlIHBvbGwuCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDY3LTQ2OQogICAgLy8gYXNzZXJ0IHNlbGYucmVhZF9wb2xsX3N0YXRlKAogICAgLy8gICAgIHBvbGxfaWQubmF0aXZlLCBVSW50NjQoUE9MTF9TVEFURV9WT1RFUlNfT0ZGU0VUKQogICAgLy8gKSA9PSBVSW50NjQoCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0NjgKICAgIC8vIHBvbGxfaWQubmF0aXZlLCBVSW50NjQoUE9MTF9TVEFURV9WT1RFUlNfT0ZGU0VUKQogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0NjctNDY5CiAgICAvLyBhc3NlcnQgc2VsZi5yZWFkX3BvbGxfc3RhdGUoCiAgICAvLyAgICAgcG9sbF9pZC5uYXRpdmUsIFVJbnQ2NChQT0xMX1NUQVRFX1ZPVEVSU19PRkZTRVQpCiAgICAvLyApID09IFVJbnQ2NCgKICAgIGNhbGxzdWIgcmVhZF9wb2xsX3N0YXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDY3LTQ3MQogICAgLy8gYXNzZXJ0IHNlbGYucmVhZF9wb2xsX3N0YXRlKAogICAgLy8gICAgIHBvbGxfaWQubmF0aXZlLCBVSW50NjQoUE9MTF9TVEFURV9WT1RFUlNfT0ZGU0VUKQogICAgLy8gKSA9PSBVSW50NjQoCiAgICAvLyAgICAgMAogICAgLy8gKSwgIkV2ZXJ5IHZvdGVyIGJveCBvZiB0aGUgcG9sbCBtdXN0IGJlIGRlbGV0ZWQgb3IgcHVyZ2VkIGJlZm9yZSBjbG9zaW5nIHRoZSBwb2xsLiIKICAgICEKICAgIGFzc2VydCAvLyBFdmVyeSB2b3RlciBib3ggb2YgdGhlIHBvbGwgbXVzdCBiZSBkZWxldGVkIG9yIHB1cmdlZCBiZWZvcmUgY2xvc2luZyB0aGUgcG9sbC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0NzctNDc4CiAgICAvLyAjIENhbGN1bGF0ZSB0aGUgcmVmdW5kIChwb2xsIGJveGVzIE1CUiArIE1CUiBvZiBwdXJnZWQgdm90ZXIgYm94ZXMpIGJlZm9yZSB0aGUgcG9sbCBib3hlcyBhcmUgZGVsZXRlZAogICAgLy8gcG9sbF9kYXRhX3NpemUgPSBvcC5Cb3gubGVuZ3RoKHNlbGYucG9sbF9kYXRhX2tleShwb2xsX2lkLm5hdGl2ZSkpWzBdCiAgICBkdXAKICAgIGNhbGxzdWIgcG9sbF9kYXRhX2tleQogICAgYm94X2xlbgogICAgcG9wCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDc5CiAgICAvLyBwb2xsX3N0YXRlX3NpemUgPSBvcC5Cb3gubGVuZ3RoKHNlbGYucG9sbF9zdGF0ZV9rZXkocG9sbF9pZC5uYXRpdmUpKVswXQogICAgZHVwCiAgICBjYWxsc3ViIHBvbGxfc3RhdGVfa2V5CiAgICBib3hfbGVuCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0ODEKICAgIC8vIGNhbGNfc2luZ2xlX2JveF9mZWUoVUludDY0KDEwKSwgcG9sbF9kYXRhX3NpemUpICAjIEJveCBwXyBmZWUKICAgIHB1c2hpbnQgMTAgLy8gMTAKICAgIHVuY292ZXIgMwogICAgY2FsbHN1YiBjYWxjX3NpbmdsZV9ib3hfZmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDgyCiAgICAvLyArIGNhbGNfc2luZ2xlX2JveF9mZWUoVUludDY0KDEwKSwgcG9sbF9zdGF0ZV9zaXplKSAgIyBCb3ggdF8gZmVlCiAgICBwdXNoaW50IDEwIC8vIDEwCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgY2FsY19zaW5nbGVfYm94X2ZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4MS00ODIKICAgIC8vIGNhbGNfc2luZ2xlX2JveF9mZWUoVUludDY0KDEwKSwgcG9sbF9kYXRhX3NpemUpICAjIEJveCBwXyBmZWUKICAgIC8vICsgY2FsY19zaW5nbGVfYm94X2ZlZShVSW50NjQoMTApLCBwb2xsX3N0YXRlX3NpemUpICAjIEJveCB0XyBmZWUKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0ODMKICAgIC8vICsgc2VsZi5yZWFkX3BvbGxfc3RhdGUocG9sbF9pZC5uYXRpdmUsIFVJbnQ2NChQT0xMX1NUQVRFX1BVUkdFRF9PRkZTRVQpKQogICAgZGlnIDEKICAgIGludGNfMyAvLyA4CiAgICBjYWxsc3ViIHJlYWRfcG9sbF9zdGF0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4NAogICAgLy8gKiBVSW50NjQoQk9YX1ZfTUJSKSAgIyBQdXJnZWQgYm94ZXMgdl8gZmVlCiAgICBpbnRjIDUgLy8gMTk3MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0ODMtNDg0CiAgICAvLyArIHNlbGYucmVhZF9wb2xsX3N0YXRlKHBvbGxfaWQubmF0aXZlLCBVSW50NjQoUE9MTF9TVEFURV9QVVJHRURfT0ZGU0VUKSkKICAgIC8vICogVUludDY0KEJPWF9WX01CUikgICMgUHVyZ2VkIGJveGVzIHZfIGZlZQogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4MS00ODQKICAgIC8vIGNhbGNfc2luZ2xlX2JveF9mZWUoVUludDY0KDEwKSwgcG9sbF9kYXRhX3NpemUpICAjIEJveCBwXyBmZWUKICAgIC8vICsgY2FsY19zaW5nbGVfYm94X2ZlZShVSW50NjQoMTApLCBwb2xsX3N0YXRlX3NpemUpICAjIEJveCB0XyBmZWUKICAgIC8vICsgc2VsZi5yZWFkX3BvbGxfc3RhdGUocG9sbF9pZC5uYXRpdmUsIFVJbnQ2NChQT0xMX1NUQVRFX1BVUkdFRF9PRkZTRVQpKQogICAgLy8gKiBVSW50NjQoQk9YX1ZfTUJSKSAgIyBQdXJnZWQgYm94ZXMgdl8gZmVlCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDg3LTQ4OAogICAgLy8gIyBEZWxldGUgcG9sbCBkYXRhIGFuZCBwb2xsIHN0YXRlIGJveGVzIGZyb20gYm94IHN0b3JhZ2UKICAgIC8vIGRlbCBzZWxmLmJveF9wX3BvbGxfZGF0YVtwb2xsX2lkXQogICAgYnl0ZWNfMSAvLyAweDcwNWYKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0OTAKICAgIC8vIHNlbGYucG9sbF9zdGF0ZV9rZXkocG9sbF9pZC5uYXRpdmUpCiAgICBzd2FwCiAgICBjYWxsc3ViIHBvbGxfc3RhdGVfa2V5CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDg5LTQ5MQogICAgLy8gYXNzZXJ0IG9wLkJveC5kZWxldGUoCiAgICAvLyAgICAgc2VsZi5wb2xsX3N0YXRlX2tleShwb2xsX2lkLm5hdGl2ZSkKICAgIC8vICksICJQb2xsIGlkIG11c3QgYmUgcHJlc2VudCBpbiBib3ggdF8uIgogICAgYm94X2RlbAogICAgYXNzZXJ0IC8vIFBvbGwgaWQgbXVzdCBiZSBwcmVzZW50IGluIGJveCB0Xy4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0OTIKICAgIC8vIHNlbGYudG90YWxfb3Blbl9wb2xscyAtPSBVSW50NjQoMSkKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18wIC8vICJ0b3RhbF9vcGVuX3BvbGxzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX29wZW5fcG9sbHMgZXhpc3RzCiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgYnl0ZWNfMCAvLyAidG90YWxfb3Blbl9wb2xscyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDk0LTUwMAogICAgLy8gIyBTdWJtaXQgaW5uZXIgdHJhbnNhY3Rpb24gKHBvbGwgY3JlYXRvciBnZXRzIHRoZSBwb2xsIGJveCBzdG9yYWdlIE1CUiByZWZ1bmRlZCkKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFtb3VudD1yZWZ1bmRfYW1vdW50IC0gVUludDY0KE1JTl9UWE5fRkVFKSwKICAgIC8vICAgICBmZWU9TUlOX1RYTl9GRUUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDk2CiAgICAvLyBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDk3CiAgICAvLyByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5OAogICAgLy8gYW1vdW50PXJlZnVuZF9hbW91bnQgLSBVSW50NjQoTUlOX1RYTl9GRUUpLAogICAgdW5jb3ZlciAyCiAgICBpbnRjIDQgLy8gMTAwMAogICAgLQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NDk0LTQ5NQogICAgLy8gIyBTdWJtaXQgaW5uZXIgdHJhbnNhY3Rpb24gKHBvbGwgY3JlYXRvciBnZXRzIHRoZSBwb2xsIGJveCBzdG9yYWdlIE1CUiByZWZ1bmRlZCkKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMCAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo0OTkKICAgIC8vIGZlZT1NSU5fVFhOX0ZFRSwKICAgIGludGMgNCAvLyAxMDAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5NC01MDAKICAgIC8vICMgU3VibWl0IGlubmVyIHRyYW5zYWN0aW9uIChwb2xsIGNyZWF0b3IgZ2V0cyB0aGUgcG9sbCBib3ggc3RvcmFnZSBNQlIgcmVmdW5kZWQpCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhbW91bnQ9cmVmdW5kX2Ftb3VudCAtIFVJbnQ2NChNSU5fVFhOX0ZFRSksCiAgICAvLyAgICAgZmVlPU1JTl9UWE5fRkVFLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo1MDIKICAgIC8vIGxvZ190ZWxlbWV0cnkoVUludDY0KDIpKQogICAgaW50Y18yIC8vIDIKICAgIGNhbGxzdWIgbG9nX3RlbGVtZXRyeQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm9wZW5fYmFsbG90X3JlZ2lzdHJ5LmNvbnRyYWN0Lk9wZW5CYWxsb3RSZWdpc3RyeS50ZXJtaW5hdGUoKSAtPiB2b2lkOgp0ZXJtaW5hdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NTA0LTUwNgogICAgLy8gIyBBbGxvdyBhcHBsaWNhdGlvbiBjcmVhdG9yIHRvIGRlbGV0ZSB0aGUgc21hcnQgY29udHJhY3QgY2xpZW50IG9uY2UgZXZlcnkgcG9sbCBpcyBjbG9zZWQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9ImRpc2FsbG93IiwgYWxsb3dfYWN0aW9ucz1bIkRlbGV0ZUFwcGxpY2F0aW9uIl0pCiAgICAvLyBkZWYgdGVybWluYXRlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo1MDctNTEwCiAgICAvLyAjIE1ha2UgbmVjZXNzYXJ5IGFzc2VydGlvbnMgdG8gdmVyaWZ5IHRyYW5zYWN0aW9uIHJlcXVpcmVtZW50cwogICAgLy8gYXNzZXJ0IFRlbXBsYXRlVmFyW1VJbnQ2NF0oCiAgICAvLyAgICAgIkRFTEVUQUJMRSIKICAgIC8vICksICJUZW1wbGF0ZSB2YXJpYWJsZSAnREVMRVRBQkxFJyBuZWVkcyB0byBiZSAnVHJ1ZScgYXQgZGVwbG95LXRpbWUuIgogICAgaW50YyA4IC8vIFRNUExfREVMRVRBQkxFCiAgICBhc3NlcnQgLy8gVGVtcGxhdGUgdmFyaWFibGUgJ0RFTEVUQUJMRScgbmVlZHMgdG8gYmUgJ1RydWUnIGF0IGRlcGxveS10aW1lLgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxMwogICAgLy8gVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvb3Blbl9iYWxsb3RfcmVnaXN0cnkvY29udHJhY3QucHk6NTEyLTUxNAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIC8vICksICJVbmF1dGhvcml6ZWQgYWRkcmVzcyEgT25seSBhcHBsaWNhdGlvbiBjcmVhdG9yIGNhbiBkZWxldGUgdGhlIHNtYXJ0IGNvbnRyYWN0LiIKICAgIGFzc2VydCAvLyBVbmF1dGhvcml6ZWQgYWRkcmVzcyEgT25seSBhcHBsaWNhdGlvbiBjcmVhdG9yIGNhbiBkZWxldGUgdGhlIHNtYXJ0IGNvbnRyYWN0LgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxNgogICAgLy8gYXNzZXJ0IHNlbGYudG90YWxfb3Blbl9wb2xscyA9PSBVSW50NjQoCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMCAvLyAidG90YWxfb3Blbl9wb2xscyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9vcGVuX3BvbGxzIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxNi01MTgKICAgIC8vIGFzc2VydCBzZWxmLnRvdGFsX29wZW5fcG9sbHMgPT0gVUludDY0KAogICAgLy8gICAgIDAKICAgIC8vICksICJFdmVyeSBwb2xsIG11c3QgYmUgY2xvc2VkIGJlZm9yZSBkZWxldGluZyB0aGUgc21hcnQgY29udHJhY3QuIgogICAgIQogICAgYXNzZXJ0IC8vIEV2ZXJ5IHBvbGwgbXVzdCBiZSBjbG9zZWQgYmVmb3JlIGRlbGV0aW5nIHRoZSBzbWFydCBjb250cmFjdC4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo1MjAtNTI3CiAgICAvLyAjIEV4ZWN1dGUgaW5uZXIgdHJhbnNhY3Rpb24gdGhhdCBjbG9zZXMgYXBwIHJlbWFpbmRlciBiYWxhbmNlIHRvIHRoZSBjcmVhdG9yCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9VUludDY0KDApLCAgIyBTZW5kIHplcm8gYW1vdW50CiAgICAvLyAgICAgZmVlPU1JTl9UWE5fRkVFLAogICAgLy8gICAgIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyMgogICAgLy8gc2VuZGVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyMwogICAgLy8gcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyNgogICAgLy8gY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQ2xvc2VSZW1haW5kZXJUbwogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyNAogICAgLy8gYW1vdW50PVVJbnQ2NCgwKSwgICMgU2VuZCB6ZXJvIGFtb3VudAogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyMC01MjEKICAgIC8vICMgRXhlY3V0ZSBpbm5lciB0cmFuc2FjdGlvbiB0aGF0IGNsb3NlcyBhcHAgcmVtYWluZGVyIGJhbGFuY2UgdG8gdGhlIGNyZWF0b3IKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMCAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9vcGVuX2JhbGxvdF9yZWdpc3RyeS9jb250cmFjdC5weTo1MjUKICAgIC8vIGZlZT1NSU5fVFhOX0ZFRSwKICAgIGludGMgNCAvLyAxMDAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyMC01MjcKICAgIC8vICMgRXhlY3V0ZSBpbm5lciB0cmFuc2FjdGlvbiB0aGF0IGNsb3NlcyBhcHAgcmVtYWluZGVyIGJhbGFuY2UgdG8gdGhlIGNyZWF0b3IKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICBzZW5kZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGFtb3VudD1VSW50NjQoMCksICAjIFNlbmQgemVybyBhbW91bnQKICAgIC8vICAgICBmZWU9TUlOX1RYTl9GRUUsCiAgICAvLyAgICAgY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL29wZW5fYmFsbG90X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyOQogICAgLy8gbG9nX3RlbGVtZXRyeShVSW50NjQoMCkpCiAgICBpbnRjXzEgLy8gMAogICAgY2FsbHN1YiBsb2dfdGVsZW1ldHJ5CiAgICByZXRzdWIK",
+        "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMub3Blbl9iYWxsb3RfcmVnaXN0cnkuY29udHJhY3QuT3BlbkJhbGxvdFJlZ2lzdHJ5LmNsZWFyX3N0YXRlX3Byb2dyYW06CiAgICBwdXNoaW50IDEgLy8gMQogICAgcmV0dXJuCg=="
+    },
+    "state": {
+        "global": {
+            "num_byte_slices": 0,
+            "num_uints": 3
+        },
+        "local": {
+            "num_byte_slices": 0,
+            "num_uints": 0
+        }
+    },
+    "schema": {
+        "global": {
+            "declared": {
+                "total_events": {
+                    "type": "uint64",
+                    "key": "total_events"
+                },
+                "total_open_polls": {
+                    "type": "uint64",
+                    "key": "total_open_polls"
+                },
+                "total_polls": {
+                    "type": "uint64",
+                    "key": "total_polls"
+                }
+            },
+            "reserved": {}
+        },
+        "local": {
+            "declared": {},
+            "reserved": {}
+        }
+    },
+    "contract": {
+        "name": "OpenBallotRegistry",
+        "methods": [
+            {
+                "name": "generate",
+                "args": [],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "get_version_unix",
+                "args": [],
+                "returns": {
+                    "type": "uint64"
+                }
+            },
+            {
+                "name": "fund_app_mbr",
+                "args": [
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "create_poll",
+                "args": [
+                    {
+                        "type": "byte[]",
+                        "name": "title"
+                    },
+                    {
+                        "type": "byte[][]",
+                        "name": "choices"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "start_date_unix"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "end_date_unix"
+                    },
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    }
+                ],
+                "returns": {
+                    "type": "uint64"
+                }
+            },
+            {
+                "name": "request_box_storage",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "poll_id"
+                    },
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "submit_vote",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "poll_id"
+                    },
+                    {
+                        "type": "uint8",
+                        "name": "choice"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "delete_box_storage",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "poll_id"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "purge_box_storage",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "poll_id"
+                    },
+                    {
+                        "type": "address[]",
+                        "name": "box_keys"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "close_poll",
+                "args": [
+                    {
+                        "type": "uint64",
+                        "name": "poll_id"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "terminate",
+                "args": [],
+                "returns": {
+                    "type": "void"
+                }
+            }
+        ],
+        "networks": {}
+    },
+    "bare_call_config": {}
+}"""
+APP_SPEC = algokit_utils.ApplicationSpecification.from_json(_APP_SPEC_JSON)
+_TReturn = typing.TypeVar("_TReturn")
+
+
+class _ArgsBase(ABC, typing.Generic[_TReturn]):
+    @staticmethod
+    @abstractmethod
+    def method() -> str:
+        ...
+
+
+_TArgs = typing.TypeVar("_TArgs", bound=_ArgsBase[typing.Any])
+
+
+@dataclasses.dataclass(kw_only=True)
+class _TArgsHolder(typing.Generic[_TArgs]):
+    args: _TArgs
+
+
+@dataclasses.dataclass(kw_only=True)
+class DeployCreate(algokit_utils.DeployCreateCallArgs, _TArgsHolder[_TArgs], typing.Generic[_TArgs]):
+    pass
+
+
+@dataclasses.dataclass(kw_only=True)
+class Deploy(algokit_utils.DeployCallArgs, _TArgsHolder[_TArgs], typing.Generic[_TArgs]):
+    pass
+
+
+def _filter_none(value: dict | typing.Any) -> dict | typing.Any:
+    if isinstance(value, dict):
+        return {k: _filter_none(v) for k, v in value.items() if v is not None}
+    return value
+
+
+def _as_dict(data: typing.Any, *, convert_all: bool = True) -> dict[str, typing.Any]:
+    if data is None:
+        return {}
+    if not dataclasses.is_dataclass(data):
+        raise TypeError(f"{data} must be a dataclass")
+    if convert_all:
+        result = dataclasses.asdict(data) # type: ignore[call-overload]
+    else:
+        result = {f.name: getattr(data, f.name) for f in dataclasses.fields(data)}
+    return _filter_none(result)
+
+
+def _convert_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.TransactionParametersDict:
+    return typing.cast(algokit_utils.TransactionParametersDict, _as_dict(transaction_parameters))
+
+
+def _convert_call_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.OnCompleteCallParametersDict:
+    return typing.cast(algokit_utils.OnCompleteCallParametersDict, _as_dict(transaction_parameters))
+
+
+def _convert_create_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+    on_complete: algokit_utils.OnCompleteActionName,
+) -> algokit_utils.CreateCallParametersDict:
+    result = typing.cast(algokit_utils.CreateCallParametersDict, _as_dict(transaction_parameters))
+    on_complete_enum = on_complete.replace("_", " ").title().replace(" ", "") + "OC"
+    result["on_complete"] = getattr(algosdk.transaction.OnComplete, on_complete_enum)
+    return result
+
+
+def _convert_deploy_args(
+    deploy_args: algokit_utils.DeployCallArgs | None,
+) -> algokit_utils.ABICreateCallArgsDict | None:
+    if deploy_args is None:
+        return None
+
+    deploy_args_dict = typing.cast(algokit_utils.ABICreateCallArgsDict, _as_dict(deploy_args))
+    if isinstance(deploy_args, _TArgsHolder):
+        deploy_args_dict["args"] = _as_dict(deploy_args.args)
+        deploy_args_dict["method"] = deploy_args.args.method()
+
+    return deploy_args_dict
+
+
+@dataclasses.dataclass(kw_only=True)
+class GetVersionUnixArgs(_ArgsBase[int]):
+    @staticmethod
+    def method() -> str:
+        return "get_version_unix()uint64"
+
+
+@dataclasses.dataclass(kw_only=True)
+class FundAppMbrArgs(_ArgsBase[None]):
+    mbr_pay: TransactionWithSigner
+
+    @staticmethod
+    def method() -> str:
+        return "fund_app_mbr(pay)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class CreatePollArgs(_ArgsBase[int]):
+    title: bytes | bytearray
+    choices: list[bytes | bytearray]
+    start_date_unix: int
+    end_date_unix: int
+    mbr_pay: TransactionWithSigner
+
+    @staticmethod
+    def method() -> str:
+        return "create_poll(byte[],byte[][],uint64,uint64,pay)uint64"
+
+
+@dataclasses.dataclass(kw_only=True)
+class RequestBoxStorageArgs(_ArgsBase[None]):
+    poll_id: int
+    mbr_pay: TransactionWithSigner
+
+    @staticmethod
+    def method() -> str:
+        return "request_box_storage(uint64,pay)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class SubmitVoteArgs(_ArgsBase[None]):
+    poll_id: int
+    choice: int
+
+    @staticmethod
+    def method() -> str:
+        return "submit_vote(uint64,uint8)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class DeleteBoxStorageArgs(_ArgsBase[None]):
+    poll_id: int
+
+    @staticmethod
+    def method() -> str:
+        return "delete_box_storage(uint64)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class PurgeBoxStorageArgs(_ArgsBase[None]):
+    poll_id: int
+    box_keys: list[str]
+
+    @staticmethod
+    def method() -> str:
+        return "purge_box_storage(uint64,address[])void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class ClosePollArgs(_ArgsBase[None]):
+    poll_id: int
+
+    @staticmethod
+    def method() -> str:
+        return "close_poll(uint64)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class GenerateArgs(_ArgsBase[None]):
+    @staticmethod
+    def method() -> str:
+        return "generate()void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class TerminateArgs(_ArgsBase[None]):
+    @staticmethod
+    def method() -> str:
+        return "terminate()void"
+
+
+class GlobalState:
+    def __init__(self, data: dict[bytes, bytes | int]):
+        self.total_events = typing.cast(int, data.get(b"total_events"))
+        self.total_open_polls = typing.cast(int, data.get(b"total_open_polls"))
+        self.total_polls = typing.cast(int, data.get(b"total_polls"))
+
+
+@dataclasses.dataclass(kw_only=True)
+class SimulateOptions:
+    allow_more_logs: bool = dataclasses.field(default=False)
+    allow_empty_signatures: bool = dataclasses.field(default=False)
+    extra_opcode_budget: int = dataclasses.field(default=0)
+    exec_trace_config: models.SimulateTraceConfig | None         = dataclasses.field(default=None)
+
+
+class Composer:
+
+    def __init__(self, app_client: algokit_utils.ApplicationClient, atc: AtomicTransactionComposer):
+        self.app_client = app_client
+        self.atc = atc
+
+    def build(self) -> AtomicTransactionComposer:
+        return self.atc
+
+    def simulate(self, options: SimulateOptions | None = None) -> SimulateAtomicTransactionResponse:
+        request = models.SimulateRequest(
+            allow_more_logs=options.allow_more_logs,
+            allow_empty_signatures=options.allow_empty_signatures,
+            extra_opcode_budget=options.extra_opcode_budget,
+            exec_trace_config=options.exec_trace_config,
+            txn_groups=[]
+        ) if options else None
+        result = self.atc.simulate(self.app_client.algod_client, request)
+        return result
+
+    def execute(self) -> AtomicTransactionResponse:
+        return self.app_client.execute_atc(self.atc)
+
+    def get_version_unix(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `get_version_unix()uint64` ABI method
+        
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = GetVersionUnixArgs()
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def fund_app_mbr(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `fund_app_mbr(pay)void` ABI method
+        
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = FundAppMbrArgs(
+            mbr_pay=mbr_pay,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def create_poll(
+        self,
+        *,
+        title: bytes | bytearray,
+        choices: list[bytes | bytearray],
+        start_date_unix: int,
+        end_date_unix: int,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `create_poll(byte[],byte[][],uint64,uint64,pay)uint64` ABI method
+        
+        :param bytes | bytearray title: The `title` ABI parameter
+        :param list[bytes | bytearray] choices: The `choices` ABI parameter
+        :param int start_date_unix: The `start_date_unix` ABI parameter
+        :param int end_date_unix: The `end_date_unix` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = CreatePollArgs(
+            title=title,
+            choices=choices,
+            start_date_unix=start_date_unix,
+            end_date_unix=end_date_unix,
+            mbr_pay=mbr_pay,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def request_box_storage(
+        self,
+        *,
+        poll_id: int,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `request_box_storage(uint64,pay)void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = RequestBoxStorageArgs(
+            poll_id=poll_id,
+            mbr_pay=mbr_pay,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def submit_vote(
+        self,
+        *,
+        poll_id: int,
+        choice: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `submit_vote(uint64,uint8)void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param int choice: The `choice` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = SubmitVoteArgs(
+            poll_id=poll_id,
+            choice=choice,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def delete_box_storage(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `delete_box_storage(uint64)void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = DeleteBoxStorageArgs(
+            poll_id=poll_id,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def purge_box_storage(
+        self,
+        *,
+        poll_id: int,
+        box_keys: list[str],
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `purge_box_storage(uint64,address[])void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param list[str] box_keys: The `box_keys` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = PurgeBoxStorageArgs(
+            poll_id=poll_id,
+            box_keys=box_keys,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def close_poll(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `close_poll(uint64)void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = ClosePollArgs(
+            poll_id=poll_id,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def create_generate(
+        self,
+        *,
+        on_complete: typing.Literal["no_op"] = "no_op",
+        transaction_parameters: algokit_utils.CreateTransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `generate()void` ABI method
+        
+        :param typing.Literal[no_op] on_complete: On completion type to use
+        :param algokit_utils.CreateTransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = GenerateArgs()
+        self.app_client.compose_create(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_create_transaction_parameters(transaction_parameters, on_complete),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def delete_terminate(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `terminate()void` ABI method
+        
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = TerminateArgs()
+        self.app_client.compose_delete(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def clear_state(
+        self,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+        app_args: list[bytes] | None = None,
+    ) -> "Composer":
+        """Adds a call to the application with on completion set to ClearState
+    
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :param list[bytes] | None app_args: (optional) Application args to pass"""
+    
+        self.app_client.compose_clear_state(self.atc, _convert_transaction_parameters(transaction_parameters), app_args)
+        return self
+
+
+class OpenBallotRegistryClient:
+    """A class for interacting with the OpenBallotRegistry app providing high productivity and
+    strongly typed methods to deploy and call the app"""
+
+    @typing.overload
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        app_id: int = 0,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        ...
+
+    @typing.overload
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        creator: str | algokit_utils.Account,
+        indexer_client: algosdk.v2client.indexer.IndexerClient | None = None,
+        existing_deployments: algokit_utils.AppLookup | None = None,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        ...
+
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        creator: str | algokit_utils.Account | None = None,
+        indexer_client: algosdk.v2client.indexer.IndexerClient | None = None,
+        existing_deployments: algokit_utils.AppLookup | None = None,
+        app_id: int = 0,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        """
+        OpenBallotRegistryClient can be created with an app_id to interact with an existing application, alternatively
+        it can be created with a creator and indexer_client specified to find existing applications by name and creator.
+        
+        :param AlgodClient algod_client: AlgoSDK algod client
+        :param int app_id: The app_id of an existing application, to instead find the application by creator and name
+        use the creator and indexer_client parameters
+        :param str | Account creator: The address or Account of the app creator to resolve the app_id
+        :param IndexerClient indexer_client: AlgoSDK indexer client, only required if deploying or finding app_id by
+        creator and app name
+        :param AppLookup existing_deployments:
+        :param TransactionSigner | Account signer: Account or signer to use to sign transactions, if not specified and
+        creator was passed as an Account will use that.
+        :param str sender: Address to use as the sender for all transactions, will use the address associated with the
+        signer if not specified.
+        :param TemplateValueMapping template_values: Values to use for TMPL_* template variables, dictionary keys should
+        *NOT* include the TMPL_ prefix
+        :param str | None app_name: Name of application to use when deploying, defaults to name defined on the
+        Application Specification
+            """
+
+        self.app_spec = APP_SPEC
+        
+        # calling full __init__ signature, so ignoring mypy warning about overloads
+        self.app_client = algokit_utils.ApplicationClient(  # type: ignore[call-overload, misc]
+            algod_client=algod_client,
+            app_spec=self.app_spec,
+            app_id=app_id,
+            creator=creator,
+            indexer_client=indexer_client,
+            existing_deployments=existing_deployments,
+            signer=signer,
+            sender=sender,
+            suggested_params=suggested_params,
+            template_values=template_values,
+            app_name=app_name,
+        )
+
+    @property
+    def algod_client(self) -> algosdk.v2client.algod.AlgodClient:
+        return self.app_client.algod_client
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+
+    @app_id.setter
+    def app_id(self, value: int) -> None:
+        self.app_client.app_id = value
+
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+
+    @property
+    def sender(self) -> str | None:
+        return self.app_client.sender
+
+    @sender.setter
+    def sender(self, value: str) -> None:
+        self.app_client.sender = value
+
+    @property
+    def signer(self) -> TransactionSigner | None:
+        return self.app_client.signer
+
+    @signer.setter
+    def signer(self, value: TransactionSigner) -> None:
+        self.app_client.signer = value
+
+    @property
+    def suggested_params(self) -> algosdk.transaction.SuggestedParams | None:
+        return self.app_client.suggested_params
+
+    @suggested_params.setter
+    def suggested_params(self, value: algosdk.transaction.SuggestedParams | None) -> None:
+        self.app_client.suggested_params = value
+
+    def get_global_state(self) -> GlobalState:
+        """Returns the application's global state wrapped in a strongly typed class with options to format the stored value"""
+
+        state = typing.cast(dict[bytes, bytes | int], self.app_client.get_global_state(raw=True))
+        return GlobalState(state)
+
+    def get_version_unix(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `get_version_unix()uint64` ABI method
+        
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction"""
+
+        args = GetVersionUnixArgs()
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def fund_app_mbr(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `fund_app_mbr(pay)void` ABI method
+        
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = FundAppMbrArgs(
+            mbr_pay=mbr_pay,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def create_poll(
+        self,
+        *,
+        title: bytes | bytearray,
+        choices: list[bytes | bytearray],
+        start_date_unix: int,
+        end_date_unix: int,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `create_poll(byte[],byte[][],uint64,uint64,pay)uint64` ABI method
+        
+        :param bytes | bytearray title: The `title` ABI parameter
+        :param list[bytes | bytearray] choices: The `choices` ABI parameter
+        :param int start_date_unix: The `start_date_unix` ABI parameter
+        :param int end_date_unix: The `end_date_unix` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction"""
+
+        args = CreatePollArgs(
+            title=title,
+            choices=choices,
+            start_date_unix=start_date_unix,
+            end_date_unix=end_date_unix,
+            mbr_pay=mbr_pay,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def request_box_storage(
+        self,
+        *,
+        poll_id: int,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `request_box_storage(uint64,pay)void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = RequestBoxStorageArgs(
+            poll_id=poll_id,
+            mbr_pay=mbr_pay,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def submit_vote(
+        self,
+        *,
+        poll_id: int,
+        choice: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `submit_vote(uint64,uint8)void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param int choice: The `choice` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = SubmitVoteArgs(
+            poll_id=poll_id,
+            choice=choice,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def delete_box_storage(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `delete_box_storage(uint64)void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = DeleteBoxStorageArgs(
+            poll_id=poll_id,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def purge_box_storage(
+        self,
+        *,
+        poll_id: int,
+        box_keys: list[str],
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `purge_box_storage(uint64,address[])void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param list[str] box_keys: The `box_keys` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = PurgeBoxStorageArgs(
+            poll_id=poll_id,
+            box_keys=box_keys,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def close_poll(
+        self,
+        *,
+        poll_id: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `close_poll(uint64)void` ABI method
+        
+        :param int poll_id: The `poll_id` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = ClosePollArgs(
+            poll_id=poll_id,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def create_generate(
+        self,
+        *,
+        on_complete: typing.Literal["no_op"] = "no_op",
+        transaction_parameters: algokit_utils.CreateTransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `generate()void` ABI method
+        
+        :param typing.Literal[no_op] on_complete: On completion type to use
+        :param algokit_utils.CreateTransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = GenerateArgs()
+        result = self.app_client.create(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_create_transaction_parameters(transaction_parameters, on_complete),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def delete_terminate(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `terminate()void` ABI method
+        
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = TerminateArgs()
+        result = self.app_client.delete(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def clear_state(
+        self,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+        app_args: list[bytes] | None = None,
+    ) -> algokit_utils.TransactionResponse:
+        """Calls the application with on completion set to ClearState
+    
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :param list[bytes] | None app_args: (optional) Application args to pass
+        :returns algokit_utils.TransactionResponse: The result of the transaction"""
+    
+        return self.app_client.clear_state(_convert_transaction_parameters(transaction_parameters), app_args)
+
+    def deploy(
+        self,
+        version: str | None = None,
+        *,
+        signer: TransactionSigner | None = None,
+        sender: str | None = None,
+        allow_update: bool | None = None,
+        allow_delete: bool | None = None,
+        on_update: algokit_utils.OnUpdate = algokit_utils.OnUpdate.Fail,
+        on_schema_break: algokit_utils.OnSchemaBreak = algokit_utils.OnSchemaBreak.Fail,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        create_args: DeployCreate[GenerateArgs],
+        update_args: algokit_utils.DeployCallArgs | None = None,
+        delete_args: Deploy[TerminateArgs],
+    ) -> algokit_utils.DeployResponse:
+        """Deploy an application and update client to reference it.
+        
+        Idempotently deploy (create, update/delete if changed) an app against the given name via the given creator
+        account, including deploy-time template placeholder substitutions.
+        To understand the architecture decisions behind this functionality please see
+        <https://github.com/algorandfoundation/algokit-cli/blob/main/docs/architecture-decisions/2023-01-12_smart-contract-deployment.md>
+        
+        ```{note}
+        If there is a breaking state schema change to an existing app (and `on_schema_break` is set to
+        'ReplaceApp' the existing app will be deleted and re-created.
+        ```
+        
+        ```{note}
+        If there is an update (different TEAL code) to an existing app (and `on_update` is set to 'ReplaceApp')
+        the existing app will be deleted and re-created.
+        ```
+        
+        :param str version: version to use when creating or updating app, if None version will be auto incremented
+        :param algosdk.atomic_transaction_composer.TransactionSigner signer: signer to use when deploying app
+        , if None uses self.signer
+        :param str sender: sender address to use when deploying app, if None uses self.sender
+        :param bool allow_delete: Used to set the `TMPL_DELETABLE` template variable to conditionally control if an app
+        can be deleted
+        :param bool allow_update: Used to set the `TMPL_UPDATABLE` template variable to conditionally control if an app
+        can be updated
+        :param OnUpdate on_update: Determines what action to take if an application update is required
+        :param OnSchemaBreak on_schema_break: Determines what action to take if an application schema requirements
+        has increased beyond the current allocation
+        :param dict[str, int|str|bytes] template_values: Values to use for `TMPL_*` template variables, dictionary keys
+        should *NOT* include the TMPL_ prefix
+        :param DeployCreate[GenerateArgs] create_args: Arguments used when creating an application
+        :param algokit_utils.DeployCallArgs | None update_args: Arguments used when updating an application
+        :param Deploy[TerminateArgs] delete_args: Arguments used when deleting an application
+        :return DeployResponse: details action taken and relevant transactions
+        :raises DeploymentError: If the deployment failed"""
+
+        return self.app_client.deploy(
+            version,
+            signer=signer,
+            sender=sender,
+            allow_update=allow_update,
+            allow_delete=allow_delete,
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            template_values=template_values,
+            create_args=_convert_deploy_args(create_args),
+            update_args=_convert_deploy_args(update_args),
+            delete_args=_convert_deploy_args(delete_args),
+        )
+
+    def compose(self, atc: AtomicTransactionComposer | None = None) -> Composer:
+        return Composer(self.app_client, atc or AtomicTransactionComposer())
@@ -0,0 +1,255 @@
+# smart_contracts/open_ballot/box_reader.py
+import base64
+import dataclasses
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import NotRequired, TypedDict, cast
+
+from algosdk.encoding import decode_address, encode_address
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.open_ballot.boxes import (
+    LEGACY_VOTER_BOX_KEY_PREFIX,
+    VOTER_BOX_KEY_PREFIX,
+    decode_voter_box,
+    is_voter_box_name,
+)
+
+# Default number of box reads in flight at once (bounds the number of open algod connections)
+MAX_CONNECTIONS = 32
+
+# Default number of box names requested per 'application_boxes' page
+PAGE_SIZE = 1_000
+
+
+@dataclasses.dataclass
+class VoterColumns:
+    addresses: list[str] = dataclasses.field(default_factory=list)
+    # 1 if the voter voted, one byte per voter
+    voted: bytearray = dataclasses.field(default_factory=bytearray)
+    # Voted choice (0 = not voted), one byte each
+    choices: bytearray = dataclasses.field(default_factory=bytearray)
+    # Requested addresses without a voter data box
+    missing: list[str] = dataclasses.field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    # Return the number of live voter data boxes that voted for every choice (choice 1 first)
+    def choice_counts(self, num_choices: int) -> list[int]:
+        return [self.choices.count(choice) for choice in range(1, num_choices + 1)]
+
+
+# JSON shapes of the algod responses read by the box reader (only the fields that are used)
+class _BoxResponse(TypedDict):
+    name: str
+    value: str
+
+
+class _BoxDescriptor(TypedDict):
+    name: str
+
+
+_BoxesResponse = TypedDict(
+    "_BoxesResponse", {"boxes": list[_BoxDescriptor], "next-token": NotRequired[str]}
+)
+
+
+class _ApplicationParams(TypedDict):
+    creator: str
+
+
+class _ApplicationResponse(TypedDict):
+    params: _ApplicationParams
+
+
+# Helper function: Return the HTTP status code of an algod error (AlgodHTTPError 'code', None for any other error)
+def _http_status(error: Exception) -> int | None:
+    code: int | None = getattr(error, "code", None)
+    return code
+
+
+# Helper function: Read a single box value, an absent box returns None
+def _read_box(algod: AlgodClient, app_id: int, box_name: bytes) -> bytes | None:
+    try:
+        box = cast(_BoxResponse, algod.application_box_by_name(app_id, box_name))
+    except Exception as e:
+        if _http_status(e) == 404:
+            return None
+        raise
+
+    return base64.b64decode(box["value"])
+
+
+# Helper function: Return the voter data box key prefix of an app, compact 'a' or legacy 'a_' (apps deployed before
+# the compact voter record), probed once per app on the creator voter data box (present from 'fund_app_mbr' until the
+# app is deleted), None when the app has no creator voter data box and so no voter data boxes at all
+def _voter_box_key_prefix(algod: AlgodClient, app_id: int) -> bytes | None:
+    app = cast(_ApplicationResponse, algod.application_info(app_id))
+    creator_key: bytes = decode_address(app["params"]["creator"])
+    for key_prefix in (VOTER_BOX_KEY_PREFIX, LEGACY_VOTER_BOX_KEY_PREFIX):
+        if _read_box(algod, app_id, key_prefix + creator_key) is not None:
+            return key_prefix
+
+    return None
+
+
+# Helper function: Read the voter data box of an address with the app's voter data box key prefix, returns
+# (box name, box value) or None when the address has no voter data box
+def _read_voter_box(
+    algod: AlgodClient, app_id: int, key_prefix: bytes, address: str
+) -> tuple[bytes, bytes] | None:
+    address_key: bytes = decode_address(address)
+    box_name = key_prefix + address_key
+    box_value = _read_box(algod, app_id, box_name)
+    return None if box_value is None else (box_name, box_value)
+
+
+# Helper function: Fetch a page of box names of an app, returns its decoded box names and the token of the next page
+# (None on the last page)
+def _fetch_box_page(
+    algod: AlgodClient, app_id: int, page_size: int, next_token: str | None
+) -> tuple[list[bytes], str | None]:
+    params: dict[str, int | str] = {"max": page_size}
+    if next_token is not None:
+        params["next"] = next_token
+
+    try:
+        response = cast(
+            _BoxesResponse,
+            algod.algod_request("GET", f"/applications/{app_id}/boxes", params=params),
+        )
+    except Exception as e:
+        # algod releases without box name pagination reject a 'max' below the number of boxes, listing every box name
+        # in one response instead would defeat the page by page iteration, so fail with a clear error
+        if _http_status(e) == 400 and next_token is None:
+            raise AlgodHTTPError(
+                f"algod rejected box name pagination (max={page_size}) for app {app_id}, box names can only be paged "
+                f"with an algod release that supports the 'max' and 'next' parameters of application boxes: {e}",
+                400,
+            ) from e
+        raise
+
+    return [base64.b64decode(box["name"]) for box in response["boxes"]], response.get(
+        "next-token"
+    )
+
+
+# Page through the box names of an app with the 'max' & 'next' tokens of 'application_boxes', yielding one list of
+# decoded box names per page (at most two pages held in memory, the next page is fetched while one is consumed)
+def iter_box_name_pages(
+    algod: AlgodClient,
+    app_id: int,
+    page_size: int = PAGE_SIZE,
+    *,
+    prefetch: bool = True,
+) -> Iterator[list[bytes]]:
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="box-pages") as executor:
+        box_names, next_token = _fetch_box_page(algod, app_id, page_size, None)
+        while True:
+            next_page = (
+                executor.submit(_fetch_box_page, algod, app_id, page_size, next_token)
+                if prefetch and next_token is not None
+                else None
+            )
+            yield box_names
+
+            if next_token is None:
+                return
+            box_names, next_token = (
+                next_page.result()
+                if next_page is not None
+                else _fetch_box_page(algod, app_id, page_size, next_token)
+            )
+
+
+# Lazily yield the voter data box names of an app (compact and legacy key prefixes), page by page
+def iter_voter_box_names(
+    algod: AlgodClient,
+    app_id: int,
+    page_size: int = PAGE_SIZE,
+    *,
+    prefetch: bool = True,
+) -> Iterator[bytes]:
+    for box_names in iter_box_name_pages(algod, app_id, page_size, prefetch=prefetch):
+        yield from (box_name for box_name in box_names if is_voter_box_name(box_name))
+
+
+# Lazily yield the voter addresses of an app decoded from its voter data box names, page by page
+def iter_voter_addresses(
+    algod: AlgodClient,
+    app_id: int,
+    page_size: int = PAGE_SIZE,
+    *,
+    prefetch: bool = True,
+) -> Iterator[str]:
+    for box_name in iter_voter_box_names(algod, app_id, page_size, prefetch=prefetch):
+        # Last 32 bytes of the box name are the address (rest is key prefix)
+        address: str = encode_address(box_name[-32:])
+        yield address
+
+
+# Helper function: Decode read voter data boxes into columns, requested addresses without a box are reported missing
+def _append_voter_boxes(
+    columns: VoterColumns,
+    boxes: Iterable[tuple[bytes, bytes | None] | None],
+    requested: list[str] | None,
+) -> None:
+    for i, box in enumerate(boxes):
+        # Listed boxes deleted while reading and requested addresses without a box are left out of the columns
+        if box is None or box[1] is None:
+            if requested is not None:
+                columns.missing.append(requested[i])
+            continue
+
+        address, voted, choice = decode_voter_box(box[0], box[1])
+        columns.addresses.append(address)
+        columns.voted.append(voted)
+        columns.choices.append(choice)
+
+
+# Read voter data boxes concurrently over a bounded pool of algod connections and decode them into columns, in the
+# order of the given addresses (every voter data box of the app, listed page by page, when no addresses are given)
+def read_voter_boxes(
+    algod: AlgodClient,
+    app_id: int,
+    addresses: Iterable[str] | None = None,
+    max_connections: int = MAX_CONNECTIONS,
+    page_size: int = PAGE_SIZE,
+) -> VoterColumns:
+    columns = VoterColumns()
+    with ThreadPoolExecutor(
+        max_workers=max_connections, thread_name_prefix="box-reader"
+    ) as executor:
+        if addresses is not None:
+            # One GET per address, the voter data box key prefix is picked once for the app
+            requested = list(addresses)
+            key_prefix = _voter_box_key_prefix(algod, app_id)
+            if key_prefix is None:
+                columns.missing.extend(requested)
+                return columns
+
+            _append_voter_boxes(
+                columns,
+                executor.map(
+                    lambda address: _read_voter_box(algod, app_id, key_prefix, address),
+                    requested,
+                ),
+                requested,
+            )
+            return columns
+
+        # Box values of a page are read while the next page of box names is prefetched
+        for box_names in iter_box_name_pages(algod, app_id, page_size):
+            voter_box_names = [
+                box_name for box_name in box_names if is_voter_box_name(box_name)
+            ]
+            box_values = executor.map(
+                lambda box_name: _read_box(algod, app_id, box_name), voter_box_names
+            )
+            _append_voter_boxes(
+                columns, zip(voter_box_names, box_values, strict=True), None
+            )
+
+    return columns
@@ -0,0 +1,139 @@
+# smart_contracts/open_ballot/boxes.py
+import base64
+import bisect
+from typing import TypedDict, cast
+
+from algosdk.abi import ABIType
+from algosdk.encoding import decode_address, encode_address
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.open_ballot.open_ballot_client import OpenBallotClient
+
+# Box key and key prefixes used by the OpenBallot smart contract box storage
+TALLY_BOX_KEY = b"t_"
+VOTER_BOX_KEY_PREFIX = b"a"
+# Voter data box key prefix of apps deployed before the compact voter record
+LEGACY_VOTER_BOX_KEY_PREFIX = b"a_"
+CHOICES_BOX_KEY_PREFIX = b"c_"
+VOTER_PAGE_BOX_KEY_PREFIX = b"p_"
+
+# Voter page layout, must match VOTER_SLOT_SIZE and VOTER_PAGE_SLOTS in the OpenBallot smart contract
+VOTER_SLOT_SIZE = 33  # Voter address (32 bytes) + VoterData (1 byte)
+VOTER_PAGE_SLOTS = 31
+
+# ARC-4 type of a single poll choices page (box value)
+CHOICES_PAGE_TYPE = ABIType.from_string("byte[][]")
+
+
+# JSON shape of an algod 'application_box_by_name' response (only the field that is used)
+class _BoxResponse(TypedDict):
+    value: str
+
+
+# Return the voter data box name of an address ('a' + 32 byte address)
+def voter_box_name(address: str) -> bytes:
+    public_key: bytes = decode_address(address)
+    return VOTER_BOX_KEY_PREFIX + public_key
+
+
+# Return True if box name is a voter data box name (compact 'a' or legacy 'a_' key prefix)
+def is_voter_box_name(box_name: bytes) -> bool:
+    return (len(box_name) == 33 and box_name.startswith(VOTER_BOX_KEY_PREFIX)) or (
+        len(box_name) == 34 and box_name.startswith(LEGACY_VOTER_BOX_KEY_PREFIX)
+    )
+
+
+# Decode a voter data box into (address, voted, choice), reads compact 'a' and legacy 'a_' voter data boxes
+# NOTE: Compact values of creator sponsored voters carry a sponsor byte after the single byte VoterData
+def decode_voter_box(box_name: bytes, box_value: bytes) -> tuple[str, bool, int]:
+    address: str = encode_address(box_name[-32:])
+    if box_name.startswith(LEGACY_VOTER_BOX_KEY_PREFIX) and len(box_name) == 34:
+        # Legacy VoterData layout: voted (1 byte) + choice (1 byte)
+        return address, box_value[0] == 1, box_value[1]
+
+    return address, box_value[0] != 0, box_value[0]
+
+
+# Return the box name of the poll choices page box with given page index
+def choices_box_name(page: int) -> bytes:
+    return CHOICES_BOX_KEY_PREFIX + page.to_bytes(1, "big")
+
+
+# Return the box name of the voter page box with given page index ('p_' + 2 byte page index)
+def voter_page_box_name(page: int) -> bytes:
+    return VOTER_PAGE_BOX_KEY_PREFIX + page.to_bytes(2, "big")
+
+
+# Return the voter page index of a voter slot
+def voter_slot_page(slot: int) -> int:
+    return slot // VOTER_PAGE_SLOTS
+
+
+# Return the number of voter pages needed to hold a number of paged voters
+def voter_pages_needed(num_voters: int) -> int:
+    return (num_voters + VOTER_PAGE_SLOTS - 1) // VOTER_PAGE_SLOTS
+
+
+# Return the 32 byte public key of an address, paged voters are ordered by it
+def _address_key(address: str) -> bytes:
+    public_key: bytes = decode_address(address)
+    return public_key
+
+
+# Sort voter addresses in the order 'register_paged_voters' accepts them (strictly increasing address bytes)
+def sort_paged_voters(addresses: list[str]) -> list[str]:
+    return sorted(set(addresses), key=_address_key)
+
+
+# Return the voter slot of a paged voter, given every address registered so far in registration (sorted) order
+def paged_voter_slot(registered: list[str], address: str) -> int:
+    slot = bisect.bisect_left(registered, _address_key(address), key=_address_key)
+    if slot == len(registered) or registered[slot] != address:
+        raise ValueError(f"Address {address} is not a registered paged voter.")
+
+    return slot
+
+
+# Encode poll choices into a poll choices page box value (ARC-4 encoded byte[][])
+def encode_choices_page(choices: list[bytes]) -> bytes:
+    page: list[list[int]] = [list(choice) for choice in choices]
+    return CHOICES_PAGE_TYPE.encode(page)
+
+
+# Decode a poll choices page box value (ARC-4 encoded byte[][]) into poll choices
+def decode_choices_page(page_value: bytes) -> list[bytes]:
+    page: list[list[int]] = CHOICES_PAGE_TYPE.decode(page_value)
+    return [bytes(choice) for choice in page]
+
+
+# Decode a packed uint64 tally array (8 bytes per choice) into a list of vote totals
+def decode_tallies(packed_tallies: bytes) -> list[int]:
+    return [
+        int.from_bytes(packed_tallies[i : i + 8], "big")
+        for i in range(0, len(packed_tallies), 8)
+    ]
+
+
+# Helper function: Read the value of an app box
+def _read_box_value(algod: AlgodClient, app_id: int, box_name: bytes) -> bytes:
+    box = cast(_BoxResponse, algod.application_box_by_name(app_id, box_name))
+    return base64.b64decode(box["value"])
+
+
+# Read the whole choice tallies box with a single box read and return the vote total of every choice
+def get_choice_tallies(app_client: OpenBallotClient) -> list[int]:
+    return decode_tallies(
+        _read_box_value(app_client.algod_client, app_client.app_id, TALLY_BOX_KEY)
+    )
+
+
+# Read every poll choices page box and return the poll choices in choice order (choice 1 first)
+def get_poll_choices(app_client: OpenBallotClient) -> list[bytes]:
+    choices: list[bytes] = []
+    for page in range(app_client.get_global_state().poll_choice_pages):
+        page_value = _read_box_value(
+            app_client.algod_client, app_client.app_id, choices_box_name(page)
+        )
+        choices.extend(decode_choices_page(page_value))
+
+    return choices
@@ -0,0 +1,91 @@
+# smart_contracts/open_ballot/common.py
+# Types, constants and subroutines shared by the OpenBallot and OpenBallotRegistry smart contracts
+from algopy import Global, TemplateVar, Txn, UInt64, arc4, subroutine
+
+
+class VoterData(arc4.Struct):
+    choice: (
+        arc4.UInt8
+    )  # Description="VoterData.choice ('0' = not voted, else arc4.UInt8 value corresponding w/ choice)"
+
+
+# Opcode budget telemetry, only emitted by builds deployed with template variable 'TELEMETRY' set (no event sequence)
+class MethodTelemetry(arc4.Struct):
+    selector: (
+        arc4.UInt32
+    )  # Description="MethodTelemetry.selector (ARC-4 method selector of the app call)"
+    opcode_budget: (
+        arc4.UInt64
+    )  # Description="MethodTelemetry.opcode_budget (opcode budget left before returning)"
+    boxes_touched: (
+        arc4.UInt64
+    )  # Description="MethodTelemetry.boxes_touched (number of boxes read, written or deleted)"
+
+
+# Box storage MBR constants, folded at compile time (2_500 base fee + 400 per byte * (len(key) + len(value)))
+BOX_BASE_FEE = 2_500
+BOX_BYTE_FEE = 400
+
+# Minimum acceptable fee for an inner transaction
+MIN_TXN_FEE = 1_000
+
+
+# Calculate the Global and Local schema minimum balance requirement total cost for the smart contract
+@subroutine
+def calc_schema_mbr(num_bytes: UInt64, num_uint: UInt64) -> UInt64:
+
+    # Schema individual fees
+    base_fee = UInt64(100_000)  # Base fee (100_000 * (1 + ExtraProgramPages))
+    byte_fee = UInt64(50_000)  # Byte slice fee for key-value pair (25_000 + 25_000)
+    uint_fee = UInt64(28_500)  # UInt64 fee for key-value pair (25_000 + 3_500)
+
+    # Multiply respective fee cost with the number of key-value pairs in each schema to get total fee amount
+    total_byte_fee = byte_fee * num_bytes
+    total_uint_fee = uint_fee * num_uint
+
+    # Return the minimum balance requirement total cost
+    return base_fee + total_byte_fee + total_uint_fee
+
+
+# Calculate box fee for single box unit (only for box sizes not known at compile time)
+@subroutine
+def calc_single_box_fee(key_size: UInt64, value_size: UInt64) -> UInt64:
+
+    # Formula for calculating single box fee: base fee + size fee (400 per byte * (len(key)+len(value)))
+    return UInt64(BOX_BASE_FEE) + UInt64(BOX_BYTE_FEE) * (key_size + value_size)
+
+
+# Validate the number of poll choices of a new poll
+@subroutine
+def assert_num_choices(num_choices: UInt64) -> None:
+    assert num_choices >= UInt64(2) and num_choices <= UInt64(
+        255
+    ), "Number of poll choices must be between 2 and 255."
+
+
+# Validate the voting period of a new poll (3 to 14 days)
+@subroutine
+def assert_voting_period(start_date_unix: UInt64, end_date_unix: UInt64) -> None:
+    assert start_date_unix < end_date_unix, "Start date must be earlier than end date."
+
+    assert end_date_unix >= start_date_unix + UInt64(
+        3 * 24 * 60 * 60
+    ), "End date must be at least 3 days later than the start date."
+
+    assert end_date_unix - start_date_unix <= UInt64(
+        14 * 24 * 60 * 60
+    ), "Voting period can not exceed 14 days."
+
+
+# Log the remaining opcode budget and the number of boxes touched by the method (telemetry builds only)
+# NOTE: Every method counts the boxes it accessed from the loop bounds and branches it took, see each call site
+@subroutine
+def log_telemetry(boxes_touched: UInt64) -> None:
+    if TemplateVar[UInt64]("TELEMETRY"):
+        arc4.emit(
+            MethodTelemetry(
+                arc4.UInt32.from_bytes(Txn.application_args(0)),
+                arc4.UInt64(Global.opcode_budget()),
+                arc4.UInt64(boxes_touched),
+            )
+        )
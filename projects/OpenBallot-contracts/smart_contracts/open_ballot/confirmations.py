@@ -0,0 +1,219 @@
+# smart_contracts/open_ballot/confirmations.py
+import asyncio
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.error import ConfirmationTimeoutError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.open_ballot.open_ballot_client import Composer
+from smart_contracts.open_ballot.params import SuggestedParamsCache
+
+# Rounds a watched transaction may stay unconfirmed before its future fails (same default as 'wait_for_confirmation')
+WAIT_ROUNDS = 10
+
+# Rounds scanned before the current round when an idle watcher starts following blocks again, so transactions
+# confirmed while the watcher was idle and watched right after are still found
+LOOKBACK_ROUNDS = 2
+
+# Transaction IDs of recently scanned blocks kept to resolve transactions watched after their block was scanned
+RECENT_TXIDS = 100_000
+
+# Seconds to wait before retrying a block after a transient algod error, doubled on every consecutive error
+RETRY_BACKOFF = 0.5
+RETRY_BACKOFF_MAX = 8.0
+
+# Seconds transient algod errors may keep failing in a row before every pending future fails with the last error
+RETRY_DEADLINE = 60.0
+
+
+# Helper function: Return whether an algod error is worth retrying, a round that is not committed yet (404, e.g. an
+# idle dev mode localnet once 'status_after_block' times out), an algod side error (5xx) or a connection error
+def is_transient_error(error: Exception) -> bool:
+    # Connection refused/reset and request timeouts
+    if isinstance(error, OSError):
+        return True
+
+    # HTTP status of an AlgodHTTPError (None for other errors and algod errors without a status)
+    code: int | None = getattr(error, "code", None)
+    return code is not None and (code == 404 or code >= 500)
+
+
+# Block following confirmation watcher shared by every caller of an algod connection: a single thread follows new
+# blocks with 'status_after_block' and resolves the futures of every watched transaction ID found in each block, two
+# algod calls per round however many transactions are outstanding (instead of a polling loop per transaction)
+# NOTE: Watch a transaction before sending it when possible, a transaction confirmed while the watcher was idle for
+#       more than LOOKBACK_ROUNDS rounds before it is watched times out
+class ConfirmationWatcher:
+    _watchers: "weakref.WeakKeyDictionary[AlgodClient, ConfirmationWatcher]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _watchers_lock = threading.Lock()
+
+    def __init__(
+        self,
+        algod: AlgodClient,
+        wait_rounds: int = WAIT_ROUNDS,
+        retry_deadline: float = RETRY_DEADLINE,
+    ) -> None:
+        self.algod = algod
+        self.wait_rounds = wait_rounds
+        self.retry_deadline = retry_deadline
+        self._lock = threading.Lock()
+        # tx ID -> (future, last valid round)
+        self._pending: dict[str, list[tuple[Future[int], int]]] = {}
+        # tx ID -> confirmed round of recently scanned blocks
+        self._recent: OrderedDict[str, int] = OrderedDict()
+        # Next round to scan while following blocks (set when the watcher starts)
+        self._next_round = 0
+        self._thread: threading.Thread | None = None
+
+    # Return the watcher shared by every caller of an algod client
+    @classmethod
+    def for_client(cls, algod: AlgodClient) -> "ConfirmationWatcher":
+        with cls._watchers_lock:
+            if algod not in cls._watchers:
+                cls._watchers[algod] = cls(algod)
+            return cls._watchers[algod]
+
+    # Return a future resolved with the confirmed round of a transaction (thread safe, usable before sending it), the
+    # future fails once its last valid round is scanned without it (wait_rounds from now when it is not given)
+    def watch(self, tx_id: str, last_valid: int | None = None) -> Future[int]:
+        future: Future[int] = Future()
+        with self._lock:
+            if tx_id in self._recent:
+                future.set_result(self._recent[tx_id])
+                return future
+
+            if self._thread is None:
+                status = self.algod.status()
+                if not isinstance(status, dict):
+                    raise TypeError("Expected a JSON response from algod.")
+                last_round: int = status["last-round"]
+                self._next_round = max(1, last_round - LOOKBACK_ROUNDS)
+                self._thread = threading.Thread(
+                    target=self._follow_blocks, name="confirmation-watcher", daemon=True
+                )
+                self._thread.start()
+            if last_valid is None:
+                last_valid = self._next_round + self.wait_rounds
+            self._pending.setdefault(tx_id, []).append((future, last_valid))
+
+        return future
+
+    # Wait for the confirmation of a transaction from asyncio code and return its confirmed round
+    async def confirmed(self, tx_id: str) -> int:
+        return await asyncio.wrap_future(self.watch(tx_id))
+
+    # Wait for the confirmation of a transaction from blocking code and return its confirmed round
+    def wait(self, tx_id: str) -> int:
+        return self.watch(tx_id).result()
+
+    # Helper function: Follow new blocks while transactions are watched, the thread exits once nothing is pending
+    # NOTE: Transient algod errors retry the same round with backoff, pending futures keep waiting for their last
+    #       valid round to be scanned until the errors last longer than the retry deadline, other errors (e.g. a
+    #       rejected API token) fail every pending future right away
+    def _follow_blocks(self) -> None:
+        backoff = RETRY_BACKOFF
+        failing_since: float | None = None
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+                round_num = self._next_round
+
+            try:
+                # Returns once round 'round_num' is committed
+                self.algod.status_after_block(round_num - 1)
+                response = self.algod.get_block_txids(round_num)
+                if not isinstance(response, dict):
+                    raise TypeError("Expected a JSON response from algod.")
+                block_txids: list[str] = response["blockTxids"]
+            except Exception as e:
+                if failing_since is None:
+                    failing_since = time.monotonic()
+                if (
+                    not is_transient_error(e)
+                    or time.monotonic() - failing_since >= self.retry_deadline
+                ):
+                    self._fail_pending(e)
+                    backoff = RETRY_BACKOFF
+                    failing_since = None
+                    continue
+
+                time.sleep(backoff)
+                backoff = min(2 * backoff, RETRY_BACKOFF_MAX)
+                continue
+
+            backoff = RETRY_BACKOFF
+            failing_since = None
+            self._resolve_block(round_num, block_txids)
+
+    # Helper function: Resolve the futures of the transactions of a block and expire the ones waited for too long
+    def _resolve_block(self, round_num: int, block_txids: list[str]) -> None:
+        with self._lock:
+            for tx_id in block_txids:
+                self._recent[tx_id] = round_num
+                for future, _ in self._pending.pop(tx_id, []):
+                    if not future.done():
+                        future.set_result(round_num)
+            while len(self._recent) > RECENT_TXIDS:
+                self._recent.popitem(last=False)
+
+            for tx_id, waiters in list(self._pending.items()):
+                expired = [
+                    future for future, last_valid in waiters if last_valid <= round_num
+                ]
+                for future in expired:
+                    if not future.done():
+                        future.set_exception(
+                            ConfirmationTimeoutError(
+                                f"Transaction {tx_id} not confirmed by round {round_num}"
+                            )
+                        )
+                waiters[:] = [waiter for waiter in waiters if not waiter[0].done()]
+                if not waiters:
+                    del self._pending[tx_id]
+
+            self._next_round = round_num + 1
+
+        # Let the shared suggested params cache know about the new round (round based invalidation)
+        SuggestedParamsCache.for_client(self.algod).observe_round(round_num)
+
+    # Helper function: Fail every pending future after a non transient algod error or transient errors past the retry
+    # deadline (the next watch starts following blocks again)
+    def _fail_pending(self, error: Exception) -> None:
+        with self._lock:
+            for waiters in self._pending.values():
+                for future, _ in waiters:
+                    if not future.done():
+                        future.set_exception(error)
+            self._pending.clear()
+
+
+# Submit the group of a composer and wait for its confirmation through the shared watcher of its algod client,
+# returns the group transaction IDs and its confirmed round (ABI return values are not decoded)
+async def execute(
+    composer: Composer, watcher: ConfirmationWatcher | None = None
+) -> tuple[list[str], int]:
+    algod = composer.app_client.algod_client
+    watcher = watcher or ConfirmationWatcher.for_client(algod)
+    atc: AtomicTransactionComposer = composer.build()
+
+    # Group members are confirmed in the same round, watching the first one confirms the whole group
+    group = atc.build_group()
+    tx_ids = list(atc.tx_ids)
+    last_valid: int = group[0].txn.last_valid_round
+    confirmation = watcher.watch(tx_ids[0], last_valid)
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, atc.submit, algod)
+    except Exception:
+        confirmation.cancel()
+        raise
+
+    return tx_ids, await asyncio.wrap_future(confirmation)
@@ -1,50 +1,138 @@
 # smart_contracts/open_ballot/contract.py
+import typing as t
+
 from algopy import (
     Account,
     ARC4Contract,
+    BigUInt,
     BoxMap,
+    BoxRef,
     Bytes,
     Global,
+    OpUpFeeSource,
     TemplateVar,
     Txn,
     UInt64,
     arc4,
+    ensure_budget,
     gtxn,
     itxn,
+    op,
     subroutine,
+    urange,
+)
+
+from smart_contracts.open_ballot.common import (
+    BOX_BASE_FEE,
+    BOX_BYTE_FEE,
+    MIN_TXN_FEE,
+    VoterData,
+    assert_num_choices,
+    assert_voting_period,
+    calc_schema_mbr,
+    calc_single_box_fee,
+    log_telemetry,
 )
 
 
-class VoterData(arc4.Struct):
-    voted: arc4.UInt8  # Description="VoterData.voted ('0' = not voted, '1' = voted)",
-    choice: (
-        arc4.UInt8
-    )  # Description="VoterData.choice (based on arc4.UInt8 value corresponding w/ choice)"
+class VoterStatus(arc4.Struct):
+    present: arc4.UInt8  # Description="VoterStatus.present ('0' = absent from box a_, '1' = present in box a_)"
+    voter_data: VoterData  # Description="VoterStatus.voter_data (zeroed VoterData if absent from box a_)"
+
+
+# ARC-28 events, every event carries the app wide event sequence number ('total_events' after the event is emitted)
+class VoterRegistered(arc4.Struct):
+    seq: arc4.UInt64  # Description="VoterRegistered.seq (event sequence number)"
+    voter: arc4.Address  # Description="VoterRegistered.voter (address that got box a_ storage)"
+
+
+class VoteCast(arc4.Struct):
+    seq: arc4.UInt64  # Description="VoteCast.seq (event sequence number)"
+    voter: arc4.Address  # Description="VoteCast.voter (address that submitted the vote)"
+    choice: arc4.UInt8  # Description="VoteCast.choice (selected choice)"
+
+
+class BoxDeleted(arc4.Struct):
+    seq: arc4.UInt64  # Description="BoxDeleted.seq (event sequence number)"
+    voter: arc4.Address  # Description="BoxDeleted.voter (address whose box a_ storage was deleted)"
+
+
+class BoxesPurged(arc4.Struct):
+    seq: arc4.UInt64  # Description="BoxesPurged.seq (event sequence number)"
+    count: arc4.UInt64  # Description="BoxesPurged.count (number of box a_ boxes purged)"
+
+
+class PollInfo(arc4.Struct):
+    title: arc4.DynamicBytes  # Description="PollInfo.title (poll title)"
+    eligibility_root: (
+        arc4.DynamicBytes
+    )  # Description="PollInfo.eligibility_root (Merkle root of eligible addresses, empty = box storage voting)"
+    start_date_unix: arc4.UInt64  # Description="PollInfo.start_date_unix (voting period start)"
+    end_date_unix: arc4.UInt64  # Description="PollInfo.end_date_unix (voting period end)"
+    finalized: arc4.UInt64  # Description="PollInfo.finalized ('0' = not set up, '1' = set up)"
+    num_choices: arc4.UInt64  # Description="PollInfo.num_choices (number of poll choices)"
+
+
+# Nullifier bitmap page ('n_' + page index) size in bytes, each page tracks the vote status of 8 * 1024 leaf indexes
+NULLIFIER_PAGE_SIZE = 1024
+NULLIFIER_PAGE_BITS = NULLIFIER_PAGE_SIZE * 8
+
+# Voter page ('p_' + page index) layout, each slot holds a voter address (32 bytes) followed by its VoterData (1 byte)
+VOTER_SLOT_SIZE = 33
+VOTER_PAGE_SLOTS = 31
+VOTER_PAGE_SIZE = VOTER_SLOT_SIZE * VOTER_PAGE_SLOTS  # 1023 bytes, fits the I/O budget of a single box reference
+# NOTE: Each box reference grants 1KB of box I/O, so a voter page holds 31 voter slots rather than thousands of them and
+#       the 65_535 voter pages (2 byte page index) cap a paged poll at 2_031_585 voters
+
+# Creator sponsored voter data box value, VoterData (1 byte) followed by a sponsor byte (box size marks the sponsor)
+SPONSORED_VOTER_DATA_SIZE = 2
+
+# Voter registration mode of a poll, set by the first voter registration and kept for good (box a_ or voter pages)
+REGISTRATION_MODE_BOX_A = 1
+REGISTRATION_MODE_PAGED = 2
+
+# Box storage MBR constants, folded at compile time (2_500 base fee + 400 per byte * (len(key) + len(value)))
+BOX_A_MBR = BOX_BASE_FEE + BOX_BYTE_FEE * (33 + 1)  # fee: 0.0161 ALGO
+BOX_A_SPONSORED_MBR = BOX_BASE_FEE + BOX_BYTE_FEE * (33 + 2)  # fee: 0.0165 ALGO (creator sponsored voter)
+BOX_N_MBR = BOX_BASE_FEE + BOX_BYTE_FEE * (4 + NULLIFIER_PAGE_SIZE)  # fee: 0.4137 ALGO
+BOX_P_MBR = BOX_BASE_FEE + BOX_BYTE_FEE * (4 + VOTER_PAGE_SIZE)  # fee: 0.4133 ALGO (31 voter slots)
 
 
 class OpenBallot(ARC4Contract):
     # Global State type declarations
     poll_title: Bytes
-    poll_choice1: Bytes
-    poll_choice2: Bytes
-    poll_choice3: Bytes
+    poll_eligibility_root: Bytes  # Merkle root of eligible addresses (empty = box storage voting)
+    poll_last_paged_voter: Bytes  # Highest paged voter address registered (paged voters are registered in order)
 
     poll_start_date_unix: UInt64
     poll_end_date_unix: UInt64
     poll_finalized: UInt64
 
-    total_purged_box_a_: UInt64
+    poll_num_choices: UInt64
+    poll_num_choices_added: UInt64
+    poll_choice_pages: UInt64
+    poll_nullifier_pages: UInt64
+    poll_voter_pages: UInt64
+    poll_registration_mode: UInt64  # Voter registration mode ('0' = no voter registered yet, see REGISTRATION_MODE_*)
 
-    total_choice1: UInt64
-    total_choice2: UInt64
-    total_choice3: UInt64
+    total_purged_box_a_: UInt64
+    total_paged_voters: UInt64
+    total_events: UInt64  # Number of ARC-28 events emitted (last event sequence number)
 
 
     # Initializes the smart contract's box and local storage variables if any
     def __init__(self) -> None:
         super().__init__()
         # Box Storage type declarations
-        self.box_a_voter_data = BoxMap(Account, VoterData, key_prefix=b"a_")
+        self.box_a_voter_data = BoxMap(
+            Account, VoterData, key_prefix=b"a"
+        )  # Key: 1 byte prefix + account address (32 bytes)
+        self.box_c_poll_choices = BoxMap(
+            arc4.UInt8, arc4.DynamicArray[arc4.DynamicBytes], key_prefix=b"c_"
+        )  # Poll choices page index -> page of poll choices
+        self.box_t_choice_tallies = BoxRef(
+            key=b"t_"
+        )  # Packed uint64 array, vote tally for choice N is stored at byte offset (N - 1) * 8
 
         # Local State type declarations
         # self.local_vote_status = LocalState(
@@ -59,50 +147,72 @@ class OpenBallot(ARC4Contract):
         # )
 
 
-    # Calculate the Global and Local schema minimum balance requirement total cost for the smart contract
+    # Calculate the Box storage minimum balance requirement cost of the choice tallies box (8 bytes per choice)
     @subroutine
-    def calc_schema_mbr(self, num_bytes: UInt64, num_uint: UInt64) -> UInt64:
-
-        # Schema individual fees
-        base_fee = UInt64(100_000)  # Base fee (100_000 * (1 + ExtraProgramPages))
-        byte_fee = UInt64(50_000)  # Byte slice fee for key-value pair (25_000 + 25_000)
-        uint_fee = UInt64(28_500)  # UInt64 fee for key-value pair (25_000 + 3_500)
+    def calc_tally_box_mbr(self, num_choices: UInt64) -> UInt64:
 
-        # Multiply respective fee cost with the number of key-value pairs in each schema to get total fee amount
-        total_byte_fee = byte_fee * num_bytes
-        total_uint_fee = uint_fee * num_uint
+        # Calculate Box T fee
+        box_t_ = calc_single_box_fee(
+            UInt64(2), num_choices * UInt64(8)
+        )  # fee: 0.0033 ALGO + 0.0032 ALGO per choice
 
         # Return the minimum balance requirement total cost
-        return base_fee + total_byte_fee + total_uint_fee
+        return box_t_
 
+    # Return the nullifier bitmap page box key for given page index ('n_' + 2 byte page index)
+    @subroutine
+    def nullifier_page_key(self, page: UInt64) -> Bytes:
+        return Bytes(b"n_") + op.extract(op.itob(page), 6, 2)
 
-    # Calculate box fee for single box unit
+
+    # Return the voter page box key for given page index ('p_' + 2 byte page index)
     @subroutine
-    def calc_single_box_fee(
-        self, key_size: arc4.UInt8, value_size: arc4.UInt8
-    ) -> UInt64:
+    def voter_page_key(self, page: UInt64) -> Bytes:
+        return Bytes(b"p_") + op.extract(op.itob(page), 6, 2)
 
-        # Formula for calculating single box fee
-        base_fee = arc4.UInt16(2_500)  # Base fee (2_500)
-        size_fee = arc4.UInt16(400).native * (
-            key_size.native + value_size.native
-        )  # Size fee (400 per byte * (len(key)+len(value)))
 
-        # Return single box fee
-        return base_fee.native + size_fee
+    # Return the poll metadata stored in global state as a PollInfo struct
+    @subroutine
+    def poll_info(self) -> PollInfo:
+        return PollInfo(
+            title=arc4.DynamicBytes(self.poll_title),
+            eligibility_root=arc4.DynamicBytes(self.poll_eligibility_root),
+            start_date_unix=arc4.UInt64(self.poll_start_date_unix),
+            end_date_unix=arc4.UInt64(self.poll_end_date_unix),
+            finalized=arc4.UInt64(self.poll_finalized),
+            num_choices=arc4.UInt64(self.poll_num_choices),
+        )
+
+
+    # Increment and return the event sequence number of the next ARC-28 event ('total_events' read once)
+    @subroutine
+    def next_event_seq(self) -> arc4.UInt64:
+        seq = self.total_events + UInt64(1)
+        self.total_events = seq
+        return arc4.UInt64(seq)
 
 
-    # Calculate the Box storage minimum balance requirement total cost for the smart contract
+    # Validate the choice and increment its vote tally (uint64 slot of the choice in the tallies box updated in place)
     @subroutine
-    def calc_box_storage_mbr(self) -> UInt64:
+    def tally_vote(self, choice: arc4.UInt8) -> None:
+        # Votes are only accepted once the label of every poll choice is stored in box storage
+        num_choices_added = self.poll_num_choices_added
+        assert (
+            num_choices_added == self.poll_num_choices
+        ), "Voting can not start before every poll choice is added."
 
-        # Calculate Box A fee
-        box_a_ = self.calc_single_box_fee(
-            arc4.UInt8(34), arc4.UInt8(2)
-        )  # fee: 0.0169 ALGO
+        assert (
+            choice.native >= UInt64(1) and choice.native <= num_choices_added
+        ), "Invalid choice. Can only select a choice between 1 and the number of poll choices."
 
-        # Return the minimum balance requirement total cost
-        return box_a_
+        tally_offset = (choice.native - UInt64(1)) * UInt64(8)
+        self.box_t_choice_tallies.replace(
+            tally_offset,
+            op.itob(
+                op.btoi(self.box_t_choice_tallies.extract(tally_offset, UInt64(8)))
+                + UInt64(1)
+            ),
+        )
 
 
     # Call the 'Create' abimethod that generates the smart contract client and initializes global storage int variables
@@ -115,35 +225,97 @@ class OpenBallot(ARC4Contract):
 
         assert Global.creator_address.balance >= (
             Global.min_balance
-            + self.calc_schema_mbr(
-                num_bytes=UInt64(4), num_uint=UInt64(7)
-            )  # Global schema MBR: 0.1 (Global.min_balance) + 0.3995 ALGO (Global schema)
+            + calc_schema_mbr(
+                num_bytes=UInt64(3), num_uint=UInt64(12)
+            )  # Global schema MBR: 0.1 (Global.min_balance) + 0.592 ALGO (Global schema)
         ), "Application creator address balance must be equal or greater than Global.min_balance + Global schema MBR."
 
         # Initialize Global storage with default value assignments
         self.poll_finalized = UInt64(0)
+        self.poll_last_paged_voter = Bytes()
 
-        self.total_choice1 = UInt64(0)
-        self.total_choice2 = UInt64(0)
-        self.total_choice3 = UInt64(0)
+        self.poll_num_choices = UInt64(0)
+        self.poll_num_choices_added = UInt64(0)
+        self.poll_choice_pages = UInt64(0)
+        self.poll_nullifier_pages = UInt64(0)
+        self.poll_voter_pages = UInt64(0)
+        self.poll_registration_mode = UInt64(0)
 
         self.total_purged_box_a_ = UInt64(0)
+        self.total_paged_voters = UInt64(0)
+        self.total_events = UInt64(0)
+
+        log_telemetry(UInt64(0))
 
 
     # Retrieve the version of the smart contract in an Unix format timestamp
     @arc4.abimethod
     def get_version_unix(self) -> UInt64:
+        log_telemetry(UInt64(0))
         return TemplateVar[UInt64]("VERSION_UNIX")
 
 
-    # Enable application creator to set up poll data values including title, choices, and dates
+    # Retrieve the poll metadata in a single read-only call
+    @arc4.abimethod(readonly=True)
+    def get_poll(self) -> PollInfo:
+        log_telemetry(UInt64(0))
+        return self.poll_info()
+
+
+    # Retrieve the poll metadata and the vote tally of every choice (choice 1 first) in a single read-only call
+    @arc4.abimethod(readonly=True)
+    def get_results(
+        self,
+    ) -> arc4.Tuple[PollInfo, arc4.DynamicArray[arc4.UInt64]]:
+        # Packed uint64 tallies box is already the body of an ARC-4 uint64[], only the length prefix is added
+        packed_tallies, exists = self.box_t_choice_tallies.maybe()
+        if not exists:
+            packed_tallies = op.bzero(self.poll_num_choices * UInt64(8))  # Tallies box not created yet, all zero
+
+        tallies = arc4.DynamicArray[arc4.UInt64].from_bytes(
+            op.extract(op.itob(packed_tallies.length // UInt64(8)), 6, 2) + packed_tallies
+        )
+
+        log_telemetry(UInt64(1))
+        return arc4.Tuple((self.poll_info(), tallies.copy()))
+
+
+    # Retrieve the box a_ VoterData of a batch of addresses in a single read-only call (absent addresses are marked)
+    @arc4.abimethod(readonly=True)  # NOTE: Addresses are bound by the box references pooled across the group
+    def get_voters_data(
+        self, voters: arc4.DynamicArray[arc4.Address]
+    ) -> arc4.DynamicArray[VoterStatus]:
+        # Top up opcode budget for the whole batch (~40 per address), simulate 'extra_opcode_budget' makes this free
+        ensure_budget(
+            UInt64(100) + voters.length * UInt64(40), OpUpFeeSource.GroupCredit
+        )
+
+        # Read every voter data box once, absent addresses get a zeroed VoterData with 'present' set to '0'
+        voters_data = arc4.DynamicArray[VoterStatus]()
+        for voter in voters:
+            voter_data, exists = op.Box.get(self.box_a_voter_data.key_prefix + voter.bytes)
+            if exists:
+                voters_data.append(
+                    VoterStatus(
+                        arc4.UInt8(1), VoterData.from_bytes(op.extract(voter_data, 0, 1))
+                    )
+                )
+            else:
+                voters_data.append(
+                    VoterStatus(arc4.UInt8(0), VoterData(arc4.UInt8(0)))
+                )
+
+        log_telemetry(voters.length)
+        return voters_data
+
+
+    # Enable application creator to set up poll data values including title, number of choices, eligibility and dates
     @arc4.abimethod
     def set_poll(
         self,
         title: Bytes,
-        choice1: Bytes,
-        choice2: Bytes,
-        choice3: Bytes,
+        num_choices: UInt64,
+        eligibility_root: Bytes,
         start_date_unix: UInt64,
         end_date_unix: UInt64,
     ) -> None:
@@ -156,11 +328,11 @@ class OpenBallot(ARC4Contract):
             118
         ), "Poll title size can not exceed 118 bytes of data per key-value."
 
+        assert_num_choices(num_choices)
+
         assert (
-            choice1.length <= UInt64(116)
-            and choice2.length <= UInt64(116)
-            and choice3.length <= UInt64(116)
-        ), "Poll choice size cannot exceed 116 bytes of data per key-value."
+            eligibility_root.length == UInt64(0) or eligibility_root.length == UInt64(32)
+        ), "Eligibility root must be empty (box storage voting) or a 32 byte Merkle root (proof voting)."
 
         # assert (
         #     start_date_unix >= Global.latest_timestamp
@@ -170,31 +342,70 @@ class OpenBallot(ARC4Contract):
         #     end_date_unix >= Global.latest_timestamp
         # ), "End date must not be earlier than the current timestamp."
 
-        assert (
-            start_date_unix < end_date_unix
-        ), "Start date must be earlier than end date."
-
-        assert end_date_unix >= start_date_unix + UInt64(
-            3 * 24 * 60 * 60
-        ), "End date must be at least 3 days later than the start date."
-
-        assert end_date_unix - start_date_unix <= UInt64(
-            14 * 24 * 60 * 60
-        ), "Voting period can not exceed 14 days."
+        assert_voting_period(start_date_unix, end_date_unix)
 
         assert self.poll_finalized == UInt64(0), "Poll can only be setup once."
 
         # Update global state keys with new values
         self.poll_title = title
-        self.poll_choice1 = choice1
-        self.poll_choice2 = choice2
-        self.poll_choice3 = choice3
+        self.poll_num_choices = num_choices
+        self.poll_eligibility_root = eligibility_root
         self.poll_start_date_unix = start_date_unix
         self.poll_end_date_unix = end_date_unix
 
         # Finalize poll (ensures poll can only be set once)
         self.poll_finalized = UInt64(1)
 
+        log_telemetry(UInt64(0))
+
+
+    # Enable application creator to add a page of poll choices, each page is stored in its own box
+    @arc4.abimethod
+    def add_poll_choices(
+        self,
+        choices: arc4.DynamicArray[arc4.DynamicBytes],
+        mbr_pay: gtxn.PaymentTransaction,
+    ) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert (
+            Txn.sender == Global.creator_address
+        ), "Only application creator can add poll choices."
+
+        assert (
+            self.poll_finalized == UInt64(1)
+        ), "Poll must be set up before adding poll choices."
+
+        assert (
+            choices.length > 0
+            and self.poll_num_choices_added + choices.length <= self.poll_num_choices
+        ), "Number of poll choices added can not exceed the number of poll choices set up."
+
+        for i in urange(choices.length):
+            assert choices[i].copy().length <= UInt64(
+                116
+            ), "Poll choice size cannot exceed 116 bytes of data."
+
+        assert (
+            mbr_pay.sender == Global.creator_address
+        ), "MBR payment sender address must match appplication creator address."
+
+        assert (
+            mbr_pay.receiver == Global.current_application_address
+        ), "MBR payment reciever address must match application address."
+
+        assert mbr_pay.amount >= calc_single_box_fee(
+            UInt64(3), choices.bytes.length
+        ), "MBR payment for poll choices box storage must meet the minimum requirement amount."
+
+        # Store the page of poll choices in box storage under the next page index
+        self.box_c_poll_choices[arc4.UInt8(self.poll_choice_pages)] = choices.copy()
+
+        # Update global state keys with new values
+        self.poll_choice_pages += UInt64(1)
+        self.poll_num_choices_added += choices.length
+
+        log_telemetry(UInt64(1))
+
 
     # Enable application creator to fund App address and covers its Global minimum balance and Box storage MBR
     @arc4.abimethod
@@ -204,10 +415,6 @@ class OpenBallot(ARC4Contract):
             Txn.sender == Global.creator_address
         ), "Transaction sender address must match application creator address."
 
-        assert (
-            Txn.sender not in self.box_a_voter_data
-        ), "Transaction sender address already present in box a_."
-
         assert (
             mbr_pay.sender == Global.creator_address
         ), "MBR payment sender address must match appplication creator address."
@@ -217,24 +424,37 @@ class OpenBallot(ARC4Contract):
         ), "MBR payment reciever address must match application address."
 
         assert (
-            mbr_pay.amount
-            >= self.calc_box_storage_mbr()  # Box Storage MBR: 0.0169 ALGO
+            self.poll_finalized == UInt64(1)
+        ), "Poll must be set up before funding app mbr."
+
+        box_storage_mbr = UInt64(BOX_A_MBR) + self.calc_tally_box_mbr(
+            self.poll_num_choices
+        )  # Box a_ fee: 0.0161 ALGO + Box t_ fee: 0.0033 ALGO + 0.0032 ALGO per choice
+
+        assert (
+            mbr_pay.amount >= box_storage_mbr
         ), "MBR payment for box storage must meet the minimum requirement amount."
 
         assert Global.current_application_address.balance >= (
-            Global.min_balance + self.calc_box_storage_mbr()
+            Global.min_balance + box_storage_mbr
         ), "Application address balance must be equal or greater than Global.min_balance + Box storage fee."
 
         assert (
             Global.latest_timestamp <= self.poll_end_date_unix
         ), "Unable to fund app mbr if voting period is over."
 
-        # Check if voter data box doesn't already exist, if not (False) then create new one
-        # if not self.box_a_voter_data.maybe(Txn.sender)[1]: <- This works too if copy() used
-        if Global.creator_address not in self.box_a_voter_data:
-            self.box_a_voter_data[Global.creator_address] = VoterData(
-                arc4.UInt8(0), arc4.UInt8(0)
-            )
+        # Create zero filled voter data box (VoterData not voted), fails if it already exists
+        assert op.Box.create(
+            self.box_a_voter_data.key_prefix + Txn.sender.bytes, UInt64(1)
+        ), "Transaction sender address already present in box a_."
+
+        # Check if choice tallies box doesn't already exist, if not (False) then create it zero filled
+        if not self.box_t_choice_tallies:
+            assert self.box_t_choice_tallies.create(
+                size=self.poll_num_choices * UInt64(8)
+            ), "Choice tallies box must not be present in box t_."
+
+        log_telemetry(UInt64(2))
 
 
     # Enable any eligible account to request box storage by paying a MBR cost
@@ -246,11 +466,17 @@ class OpenBallot(ARC4Contract):
         ), "Invalid sender address! Application creator address can not use request box storage method."
 
         assert (
-            Txn.sender not in self.box_a_voter_data
-        ), "Transaction sender address must not be present in box a_."
+            self.poll_eligibility_root.length == UInt64(0)
+        ), "Box storage can not be requested for a poll with an eligibility Merkle root (proof voting)."
 
+        # NOTE: A paged poll stays paged after its voter pages are purged, paged voters can not get a box a_ vote
         assert (
-            mbr_pay.sender not in self.box_a_voter_data
+            self.poll_registration_mode != UInt64(REGISTRATION_MODE_PAGED)
+        ), "Box storage can not be requested for a poll with voter pages (paged voting)."
+
+        # Payment sender box is only read when a different account pays for the transaction sender
+        assert (
+            mbr_pay.sender == Txn.sender or mbr_pay.sender not in self.box_a_voter_data
         ), "Box storage MBR payment sender address must not be present in box a_."
 
         assert (
@@ -258,40 +484,279 @@ class OpenBallot(ARC4Contract):
         ), "Box storage MBR payment reciever address must match application address."
 
         assert (
-            mbr_pay.amount >= self.calc_box_storage_mbr()  # Box a_ fee: 0.0169 ALGO
+            mbr_pay.amount >= UInt64(BOX_A_MBR)  # Box a_ fee: 0.0161 ALGO
         ), "Box storage MBR payment amount must be equal or greater than box _a fee."
 
         assert (
             Global.latest_timestamp <= self.poll_end_date_unix
         ), "Unable to request box storage if voting period is over."
 
-        # Check if voter data box doesn't already exist, if not (False) then create new one
-        # if not self.box_a_voter_data.maybe(Txn.sender)[1]: <- This works too if copy() used
-        if Txn.sender not in self.box_a_voter_data:
-            self.box_a_voter_data[Txn.sender] = VoterData(arc4.UInt8(0), arc4.UInt8(0))
+        # Create zero filled voter data box (VoterData not voted), fails if it already exists
+        assert op.Box.create(
+            self.box_a_voter_data.key_prefix + Txn.sender.bytes, UInt64(1)
+        ), "Transaction sender address must not be present in box a_."
+        self.poll_registration_mode = UInt64(REGISTRATION_MODE_BOX_A)
+
+        # Emit voter registered event
+        arc4.emit(VoterRegistered(self.next_event_seq(), arc4.Address(Txn.sender)))
+
+        # Sender box, plus the payment sender box read when someone else pays
+        log_telemetry(UInt64(1) + UInt64(mbr_pay.sender != Txn.sender))
+
+
+    # Enable application creator to register a batch of voters by paying their box storage MBR in a single payment
+    @arc4.abimethod
+    def register_voters(
+        self,
+        voters: arc4.DynamicArray[arc4.Address],
+        mbr_pay: gtxn.PaymentTransaction,
+    ) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert (
+            Txn.sender == Global.creator_address
+        ), "Unauthorized address! Only application creator can register voters."
+
+        assert (
+            self.poll_registration_mode != UInt64(REGISTRATION_MODE_PAGED)
+        ), "Voters can not be registered into box a_ for a poll with voter pages (paged voting)."
+
+        assert (
+            self.poll_eligibility_root.length == UInt64(0)
+        ), "Voters can not be registered into box a_ for a poll with an eligibility Merkle root (proof voting)."
+
+        # NOTE: Number of voters is bound by the box references available to the group (group resource sharing)
+        assert (
+            voters.length > 0
+        ), "The number of addresses represented by voters array must be greater than 0."
+
+        assert (
+            mbr_pay.sender == Global.creator_address
+        ), "MBR payment sender address must match appplication creator address."
+
+        assert (
+            mbr_pay.receiver == Global.current_application_address
+        ), "MBR payment reciever address must match application address."
+
+        assert (
+            mbr_pay.amount
+            >= voters.length * UInt64(BOX_A_SPONSORED_MBR)  # Box a_ fee: 0.0165 ALGO per voter
+        ), "MBR payment amount must be equal or greater than box a_ fee times the number of voters."
+
+        assert (
+            Global.latest_timestamp <= self.poll_end_date_unix
+        ), "Unable to register voters if voting period is over."
+
+        # Iterate through the dynamic array of voter addresses and create a voter data box for each
+        # NOTE: Sponsored boxes carry a sponsor byte, a voter deleting their sponsored box refunds the creator
+        # NOTE: No VoterRegistered event per voter, a batch would exceed the 32 logs / 1KB log limit of a transaction
+        for voter in voters:
+            # Make necessary assertions to verify transaction requirements
+            assert (
+                voter.native != Global.creator_address
+            ), "Voter address must not match application creator address."
+
+            # Create zero filled sponsored voter data box (VoterData not voted), fails if it already exists
+            assert op.Box.create(
+                self.box_a_voter_data.key_prefix + voter.bytes,
+                UInt64(SPONSORED_VOTER_DATA_SIZE),
+            ), "Voter address must not be present in box a_."
+
+        self.poll_registration_mode = UInt64(REGISTRATION_MODE_BOX_A)
+
+        log_telemetry(voters.length)
 
 
     # Enable any eligible account to submit a vote
     @arc4.abimethod
     def submit_vote(self, choice: arc4.UInt8) -> None:
         # Make necessary assertions to verify transaction requirements
-        assert (
-            Txn.sender in self.box_a_voter_data
-        ), "Transaction sender address must be present in box a_."
+        # Read voter data box once (VoterData is the first byte choice, '0' = not voted, sponsored boxes are 2 bytes)
+        voter_key = self.box_a_voter_data.key_prefix + Txn.sender.bytes
+        voter_data, exists = op.Box.get(voter_key)
+        assert exists, "Transaction sender address must be present in box a_."
 
         assert (
-            self.box_a_voter_data[Txn.sender].voted,
-            self.box_a_voter_data[Txn.sender].choice,
-        ) == (
-            arc4.UInt8(0),
-            arc4.UInt8(0),
+            op.getbyte(voter_data, 0) == UInt64(0)
         ), "Transaction sender address already submitted a vote."
 
+        # assert (
+        #     Global.latest_timestamp >= self.poll_start_date_unix
+        # ), "Voting period has not started yet."
+
+        # assert (
+        #     Global.latest_timestamp <= self.poll_end_date_unix
+        # ), "Voting period has ended."
+
+        # Set account voter data (replace keeps the sponsor byte of sponsored boxes)
+        op.Box.replace(voter_key, 0, VoterData(choice).bytes)
+
+        # Update vote tally (cost is the same for any choice)
+        self.tally_vote(choice)
+
+        # Emit vote cast event
+        arc4.emit(VoteCast(self.next_event_seq(), arc4.Address(Txn.sender), choice))
+
+        log_telemetry(UInt64(2))
+
+
+    # Enable any account to request box storage and submit their vote in a single application call
+    @arc4.abimethod
+    def register_and_vote(
+        self, mbr_pay: gtxn.PaymentTransaction, choice: arc4.UInt8
+    ) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert (
+            Txn.sender != Global.creator_address
+        ), "Invalid sender address! Application creator address can not use register and vote method."
+
+        assert (
+            self.poll_eligibility_root.length == UInt64(0)
+        ), "Box storage can not be requested for a poll with an eligibility Merkle root (proof voting)."
+
+        # NOTE: A paged poll stays paged after its voter pages are purged, paged voters can not get a box a_ vote
+        assert (
+            self.poll_registration_mode != UInt64(REGISTRATION_MODE_PAGED)
+        ), "Box storage can not be requested for a poll with voter pages (paged voting)."
+
         assert (
-            choice == arc4.UInt8(1)
-            or choice == arc4.UInt8(2)
-            or choice == arc4.UInt8(3)
-        ), "Invalid choice. Can only select choices 1, 2, 3."
+            mbr_pay.receiver == Global.current_application_address
+        ), "Box storage MBR payment reciever address must match application address."
+
+        assert (
+            mbr_pay.amount >= UInt64(BOX_A_MBR)  # Box a_ fee: 0.0161 ALGO
+        ), "Box storage MBR payment amount must be equal or greater than box _a fee."
+
+        # assert (
+        #     Global.latest_timestamp >= self.poll_start_date_unix
+        # ), "Voting period has not started yet."
+
+        assert (
+            Global.latest_timestamp <= self.poll_end_date_unix
+        ), "Unable to request box storage if voting period is over."
+
+        # Create account voter data already marked as voted, box_create fails if it already exists (no separate read)
+        voter_key = self.box_a_voter_data.key_prefix + Txn.sender.bytes
+        assert op.Box.create(
+            voter_key, UInt64(1)
+        ), "Transaction sender address must not be present in box a_."
+        op.Box.replace(voter_key, 0, VoterData(choice).bytes)
+        self.poll_registration_mode = UInt64(REGISTRATION_MODE_BOX_A)
+
+        # Update vote tally (cost is the same for any choice)
+        self.tally_vote(choice)
+
+        # Emit voter registered and vote cast events
+        arc4.emit(VoterRegistered(self.next_event_seq(), arc4.Address(Txn.sender)))
+        arc4.emit(VoteCast(self.next_event_seq(), arc4.Address(Txn.sender), choice))
+
+        log_telemetry(UInt64(2))
+
+
+    # Enable application creator to register an allowlist of voters into voter pages (31 voter slots per page box)
+    @arc4.abimethod
+    def register_paged_voters(
+        self,
+        voters: arc4.DynamicArray[arc4.Address],
+        mbr_pay: gtxn.PaymentTransaction,
+    ) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert (
+            Txn.sender == Global.creator_address
+        ), "Unauthorized address! Only application creator can register paged voters."
+
+        assert (
+            self.poll_eligibility_root.length == UInt64(0)
+        ), "Paged voters can not be registered for a poll with an eligibility Merkle root (proof voting)."
+
+        # NOTE: Registration modes are exclusive for good, no paged voter can hold a box a_ (or get one later on)
+        #       without a box reference per voter (box a_ routes check the mode the other way round)
+        assert (
+            self.poll_registration_mode != UInt64(REGISTRATION_MODE_BOX_A)
+        ), "Paged voters can not be registered for a poll with voters in box a_ (box storage voting)."
+
+        assert (
+            voters.length > 0
+        ), "The number of addresses represented by voters array must be greater than 0."
+
+        # Number of voter pages needed once the voters are appended to the last slot in use
+        total_pages = (
+            self.total_paged_voters + voters.length + UInt64(VOTER_PAGE_SLOTS - 1)
+        ) // UInt64(VOTER_PAGE_SLOTS)
+        assert total_pages <= UInt64(65_535), "Total voter pages can not exceed 65535."
+
+        assert (
+            mbr_pay.sender == Global.creator_address
+        ), "MBR payment sender address must match appplication creator address."
+
+        assert (
+            mbr_pay.receiver == Global.current_application_address
+        ), "MBR payment reciever address must match application address."
+
+        new_pages = total_pages - self.poll_voter_pages
+        assert (
+            mbr_pay.amount >= new_pages * UInt64(BOX_P_MBR)
+        ), "MBR payment amount must be equal or greater than box p_ fee times the number of new pages."
+
+        assert (
+            Global.latest_timestamp <= self.poll_end_date_unix
+        ), "Unable to register paged voters if voting period is over."
+
+        # Write every voter address into the next free slot, creating a zero filled voter page when a page starts
+        # NOTE: Voter addresses must be strictly increasing across every registration, so an address holds a single
+        #       slot and the slot of a voter is its index in the sorted allowlist (kept after voter pages are purged)
+        first_page = self.total_paged_voters // UInt64(VOTER_PAGE_SLOTS)
+        last_voter = self.poll_last_paged_voter
+        for voter in voters:
+            assert (
+                voter.native != Global.creator_address
+            ), "Voter address must not match application creator address."
+
+            assert BigUInt.from_bytes(voter.bytes) > BigUInt.from_bytes(
+                last_voter
+            ), "Voter addresses must be sorted in strictly increasing order and registered only once."
+            last_voter = voter.bytes
+
+            slot = self.total_paged_voters
+            page_key = self.voter_page_key(slot // UInt64(VOTER_PAGE_SLOTS))
+            if slot % UInt64(VOTER_PAGE_SLOTS) == UInt64(0):
+                assert op.Box.create(
+                    page_key, UInt64(VOTER_PAGE_SIZE)
+                ), "Voter page must not be present in box p_."
+
+            op.Box.replace(
+                page_key,
+                (slot % UInt64(VOTER_PAGE_SLOTS)) * UInt64(VOTER_SLOT_SIZE),
+                voter.bytes,
+            )
+            self.total_paged_voters = slot + UInt64(1)
+
+        self.poll_last_paged_voter = last_voter
+        self.poll_voter_pages = total_pages
+        self.poll_registration_mode = UInt64(REGISTRATION_MODE_PAGED)
+
+        # Every voter page written to, from the page of the first free slot up to the last page
+        log_telemetry(total_pages - first_page)
+
+
+    # Enable any registered paged voter to submit a vote through their only voter slot (single page box reference)
+    @arc4.abimethod
+    def submit_paged_vote(self, choice: arc4.UInt8, slot: UInt64) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert (
+            slot < self.total_paged_voters
+        ), "Voter slot must be registered."
+
+        page_key = self.voter_page_key(slot // UInt64(VOTER_PAGE_SLOTS))
+        slot_offset = (slot % UInt64(VOTER_PAGE_SLOTS)) * UInt64(VOTER_SLOT_SIZE)
+        voter_slot = op.Box.extract(page_key, slot_offset, UInt64(VOTER_SLOT_SIZE))
+
+        assert (
+            op.extract(voter_slot, 0, 32) == Txn.sender.bytes
+        ), "Transaction sender address must match the address of the voter slot."
+
+        assert op.extract(voter_slot, 32, 1) == VoterData(
+            arc4.UInt8(0)
+        ).bytes, "Transaction sender address already submitted a vote."
 
         # assert (
         #     Global.latest_timestamp >= self.poll_start_date_unix
@@ -301,19 +766,162 @@ class OpenBallot(ARC4Contract):
         #     Global.latest_timestamp <= self.poll_end_date_unix
         # ), "Voting period has ended."
 
-        # Set account voter data
-        self.box_a_voter_data[Txn.sender] = VoterData(arc4.UInt8(1), choice)
+        # Set voter slot data
+        op.Box.replace(page_key, slot_offset + UInt64(32), VoterData(choice).bytes)
 
-        # Update vote tally
-        if choice == UInt64(1):
-            self.total_choice1 += UInt64(1)
-        elif choice == UInt64(2):
-            self.total_choice2 += UInt64(1)
-        else:
-            self.total_choice3 += UInt64(1)
+        # Update vote tally (cost is the same for any choice)
+        self.tally_vote(choice)
+
+        # Emit vote cast event
+        arc4.emit(VoteCast(self.next_event_seq(), arc4.Address(Txn.sender), choice))
+
+        log_telemetry(UInt64(2))
+
+
+    # Enable application creator to purge voter pages from the last page down, each page frees up to 31 voter slots
+    @arc4.abimethod
+    def purge_voter_pages(self, num_pages: UInt64) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert (
+            Txn.sender == Global.creator_address
+        ), "Unauthorized address! Only application creator can purge voter pages."
+
+        # assert (
+        #     Global.latest_timestamp >= (self.poll_end_date_unix + UInt64(7 * 24 * 60 * 60))
+        # ), "Voter pages purge only possible after voting period + 7-day box storage deletion window is over."
+
+        assert (
+            num_pages > 0 and num_pages <= self.poll_voter_pages
+        ), "Number of voter pages to purge must be greater than 0 and can not exceed the voter pages in use."
+
+        # Delete voter page boxes from the last page down
+        for page in urange(self.poll_voter_pages - num_pages, self.poll_voter_pages):
+            assert op.Box.delete(
+                self.voter_page_key(page)
+            ), "Voter page must be present in box p_."
+
+        self.poll_voter_pages -= num_pages
+        if self.total_paged_voters > self.poll_voter_pages * UInt64(VOTER_PAGE_SLOTS):
+            self.total_paged_voters = self.poll_voter_pages * UInt64(VOTER_PAGE_SLOTS)
+
+        log_telemetry(num_pages)
+
+
+    # Enable application creator to allocate nullifier bitmap pages for proof voting by paying their box storage MBR
+    @arc4.abimethod
+    def allocate_nullifier_pages(
+        self, num_pages: UInt64, mbr_pay: gtxn.PaymentTransaction
+    ) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert (
+            Txn.sender == Global.creator_address
+        ), "Unauthorized address! Only application creator can allocate nullifier pages."
+
+        assert (
+            self.poll_eligibility_root.length == UInt64(32)
+        ), "Nullifier pages can only be allocated for a poll with an eligibility Merkle root (proof voting)."
+
+        assert (
+            num_pages > 0 and self.poll_nullifier_pages + num_pages <= UInt64(65_535)
+        ), "Number of nullifier pages must be greater than 0 and the total can not exceed 65535."
+
+        assert (
+            mbr_pay.sender == Global.creator_address
+        ), "MBR payment sender address must match appplication creator address."
+
+        assert (
+            mbr_pay.receiver == Global.current_application_address
+        ), "MBR payment reciever address must match application address."
+
+        assert (
+            mbr_pay.amount >= num_pages * UInt64(BOX_N_MBR)  # Box n_ fee: 0.4137 ALGO per page
+        ), "MBR payment amount must be equal or greater than box n_ fee times the number of pages."
+
+        # Create zero filled nullifier bitmap pages (a zero bit means the leaf index has not voted yet)
+        for page in urange(self.poll_nullifier_pages, self.poll_nullifier_pages + num_pages):
+            assert op.Box.create(
+                self.nullifier_page_key(page), UInt64(NULLIFIER_PAGE_SIZE)
+            ), "Nullifier page must not be present in box n_."
+
+        self.poll_nullifier_pages += num_pages
+
+        log_telemetry(num_pages)
+
+
+    # Enable any eligible account to submit a vote by proving their address is a leaf of the eligibility Merkle root
+    @arc4.abimethod
+    def submit_vote_with_proof(
+        self,
+        choice: arc4.UInt8,
+        leaf_index: UInt64,
+        proof: arc4.DynamicArray[arc4.StaticArray[arc4.Byte, t.Literal[32]]],
+    ) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert (
+            self.poll_eligibility_root.length == UInt64(32)
+        ), "Proof voting requires a poll with an eligibility Merkle root."
+
+        assert (
+            proof.length <= UInt64(32) and leaf_index < op.shl(UInt64(1), proof.length)
+        ), "Leaf index must be addressable by the proof (proof depth can not exceed 32)."
+
+        # assert (
+        #     Global.latest_timestamp >= self.poll_start_date_unix
+        # ), "Voting period has not started yet."
+
+        # assert (
+        #     Global.latest_timestamp <= self.poll_end_date_unix
+        # ), "Voting period has ended."
+
+        # Top up the opcode budget (one sha256 per proof level) from the group fee credit if needed
+        ensure_budget(
+            UInt64(400) + proof.length * UInt64(60), fee_source=OpUpFeeSource.GroupCredit
+        )
+
+        # Hash the path from the sender leaf up to the root (leaf index bits select the side of every sibling)
+        node = op.sha256(Bytes(b"\x00") + Txn.sender.bytes)
+        path = leaf_index
+        for level in urange(proof.length):
+            sibling = proof[level].bytes
+            if path & UInt64(1):
+                node = op.sha256(Bytes(b"\x01") + sibling + node)
+            else:
+                node = op.sha256(Bytes(b"\x01") + node + sibling)
+            path = path >> UInt64(1)
+
+        assert (
+            node == self.poll_eligibility_root
+        ), "Merkle proof does not match the eligibility root for the transaction sender address."
+
+        # Flip the leaf index bit in its nullifier bitmap page (a set bit means the leaf index already voted)
+        page = leaf_index // UInt64(NULLIFIER_PAGE_BITS)
+        assert (
+            page < self.poll_nullifier_pages
+        ), "Nullifier page of the leaf index must be allocated."
+
+        page_key = self.nullifier_page_key(page)
+        bit_index = leaf_index % UInt64(NULLIFIER_PAGE_BITS)
+        byte_offset = bit_index // UInt64(8)
+        bit_mask = UInt64(0x80) >> (bit_index % UInt64(8))  # Bit 0 is the leftmost bit of its bitmap byte
+        bitmap_byte = op.btoi(op.Box.extract(page_key, byte_offset, UInt64(1)))
+        assert not (
+            bitmap_byte & bit_mask
+        ), "Transaction sender address already submitted a vote."
+
+        op.Box.replace(
+            page_key, byte_offset, op.extract(op.itob(bitmap_byte | bit_mask), 7, 1)
+        )
+
+        # Update vote tally (cost is the same for any choice)
+        self.tally_vote(choice)
+
+        # Emit vote cast event
+        arc4.emit(VoteCast(self.next_event_seq(), arc4.Address(Txn.sender), choice))
+
+        log_telemetry(UInt64(2))
 
 
-    # Enable any eligble account to delete their box storage and get their MBR payment refunded
+    # Enable any eligble account to delete their box storage and get their MBR payment refunded to whoever paid it
     @arc4.abimethod
     def delete_box_storage(self) -> None:
         # Make necessary assertions to verify transaction requirements
@@ -321,25 +929,36 @@ class OpenBallot(ARC4Contract):
             Txn.sender != Global.creator_address
         ), "Invalid sender address! Application creator must delete smart contract to free up their box storage MBR."
 
-        assert (
-            Txn.sender in self.box_a_voter_data
-        ), "Transaction sender address must be present in box a_."
-
         # assert (
         #     Global.latest_timestamp >= self.poll_end_date_unix and
         #     Global.latest_timestamp <= (self.poll_end_date_unix + UInt64(7 * 24 * 60 * 60))
         # ), "Box storage can only be deleted within a 7-day window after voting period is over."
 
-        # Delete box key (address) from box storage
-        del self.box_a_voter_data[Txn.sender]
+        # Read the box size before deleting it, sponsored boxes (VoterData + sponsor byte) were paid by the creator
+        voter_key = self.box_a_voter_data.key_prefix + Txn.sender.bytes
+        voter_box_size = op.Box.length(voter_key)[0]
+
+        # Delete box key (address) from box storage, box_del reports whether the box existed
+        assert op.Box.delete(
+            voter_key
+        ), "Transaction sender address must be present in box a_."
+
+        # Emit box deleted event
+        arc4.emit(BoxDeleted(self.next_event_seq(), arc4.Address(Txn.sender)))
+
+        # Refund the Box storage MBR to whoever paid it (creator for sponsored boxes, else the transaction sender)
+        refund_receiver = Txn.sender
+        refund_amount = UInt64(BOX_A_MBR - MIN_TXN_FEE)
+        if voter_box_size == UInt64(SPONSORED_VOTER_DATA_SIZE):
+            refund_receiver = Global.creator_address
+            refund_amount = UInt64(BOX_A_SPONSORED_MBR - MIN_TXN_FEE)
 
-        # Submit inner transaction (transaction sender gets their Box storage MBR refunded)
-        min_txn_fee = arc4.UInt16(1000).native
+        # Submit inner transaction (Box storage MBR payer gets it refunded)
         box_storage_del_refund_itxn = itxn.Payment(
             sender=Global.current_application_address,
-            receiver=Txn.sender,
-            amount=self.calc_box_storage_mbr() - min_txn_fee,
-            fee=min_txn_fee,
+            receiver=refund_receiver,
+            amount=refund_amount,
+            fee=MIN_TXN_FEE,
         ).submit()
 
         assert (
@@ -347,13 +966,17 @@ class OpenBallot(ARC4Contract):
         ), "box_storage_del_refund_itxn sender address must match application address."
 
         assert (
-            box_storage_del_refund_itxn.receiver == Txn.sender
-        ), "box_storage_del_refund_itxn reciever address must match transaction sender address."
+            box_storage_del_refund_itxn.receiver == refund_receiver
+        ), "box_storage_del_refund_itxn reciever address must match box storage MBR payer address."
+
+        log_telemetry(UInt64(1))
 
 
     # Enable application creator to execute box storage purge, this deletes any boxes not deleted by other accounts
-    @arc4.abimethod  # NOTE: Can also use arc4.StaticArray[arc4.Address, t.Literal[8]] to enforce strict size of 8
-    def purge_box_storage(self, box_keys: arc4.DynamicArray[arc4.Address]) -> None:
+    @arc4.abimethod  # NOTE: Box keys are bound by the box references pooled across the group (group resource sharing)
+    def purge_box_storage(
+        self, box_keys: arc4.DynamicArray[arc4.Address]
+    ) -> arc4.UInt64:
         # Make necessary assertions to verify transaction requirements
         assert (
             Txn.sender == Global.creator_address
@@ -364,26 +987,73 @@ class OpenBallot(ARC4Contract):
         # ), "Box storage purge only possible after voting period + 7-day box storage deletion window is over."
 
         assert (
-            box_keys.length > 0 and box_keys.length < 9
-        ), "The number of addresses represented by box keys array must be greater than 0 and lesser than 9."
+            box_keys.length > 0
+        ), "The number of addresses represented by box keys array must be greater than 0."
+
+        # Top up opcode budget for the whole batch (~40 per box key), inner app call fees are paid by the group
+        ensure_budget(
+            UInt64(100) + box_keys.length * UInt64(40), OpUpFeeSource.GroupCredit
+        )
 
         # Iterate through the dynamic array of addresses representing the box key
         for box_key in box_keys:
             # Make necessary assertions to verify transaction requirements
-            assert (
-                box_key.native in self.box_a_voter_data
-            ), "Account address represented in box key must be present in box a_."
-
             assert (
                 box_key.native != Global.creator_address
             ), "Account address represented in box key must not match application creator address."
 
-            del self.box_a_voter_data[
-                box_key.native
-            ]  # Delete box key (address) from box storage
-            self.total_purged_box_a_ += UInt64(
-                1
-            )  # Increment box 'a_' purged total amount
+            # Delete box key (address) from box storage, box_del reports whether the box existed
+            assert op.Box.delete(
+                self.box_a_voter_data.key_prefix + box_key.bytes
+            ), "Account address represented in box key must be present in box a_."
+
+        # Increment box 'a_' purged total amount once for the whole batch
+        self.total_purged_box_a_ += box_keys.length
+
+        # Emit boxes purged event once for the whole batch
+        arc4.emit(BoxesPurged(self.next_event_seq(), arc4.UInt64(box_keys.length)))
+
+        # Return the number of purged boxes
+        log_telemetry(box_keys.length)
+        return arc4.UInt64(box_keys.length)
+
+
+    # Enable application creator to purge box storage without failing on boxes already deleted by voters or other purges
+    @arc4.abimethod
+    def try_purge_box_storage(
+        self, box_keys: arc4.DynamicArray[arc4.Address]
+    ) -> arc4.UInt64:
+        # Make necessary assertions to verify transaction requirements
+        assert (
+            Txn.sender == Global.creator_address
+        ), "Unauthorized address! Only application creator can purge box storage."
+
+        assert (
+            box_keys.length > 0
+        ), "The number of addresses represented by box keys array must be greater than 0."
+
+        # Top up opcode budget for the whole batch (~40 per box key), inner app call fees are paid by the group
+        ensure_budget(
+            UInt64(100) + box_keys.length * UInt64(40), OpUpFeeSource.GroupCredit
+        )
+
+        # Delete every box key present in box a_, absent box keys and the creator box key are skipped
+        num_purged = UInt64(0)
+        for box_key in box_keys:
+            if box_key.native != Global.creator_address:
+                num_purged += UInt64(
+                    op.Box.delete(self.box_a_voter_data.key_prefix + box_key.bytes)
+                )
+
+        # Increment box 'a_' purged total amount by the boxes actually deleted
+        self.total_purged_box_a_ += num_purged
+
+        # Emit boxes purged event once for the whole batch
+        arc4.emit(BoxesPurged(self.next_event_seq(), arc4.UInt64(num_purged)))
+
+        # Return the number of purged boxes
+        log_telemetry(box_keys.length)
+        return arc4.UInt64(num_purged)
 
 
     # Allow application creator to delete the smart contract client, decrease their MBR balance + any remaining box MBR
@@ -398,28 +1068,43 @@ class OpenBallot(ARC4Contract):
             Txn.sender == Global.creator_address
         ), "Unauthorized address! Only application creator can delete the smart contract."
 
-        assert (
-            Global.creator_address in self.box_a_voter_data
-        ), "Transaction sender address must be present in box a_."
-
         # assert (
         #     Global.latest_timestamp >= (self.poll_end_date_unix + UInt64(7 * 24 * 60 * 60))
         # ), "App can only be deleted after voting period + 7-day box storage deletion window is over."
 
-        # Delete box key (creator address) from box storage
-        del self.box_a_voter_data[Global.creator_address]
+        # Delete box key (creator address) from box storage, box_del reports whether the box existed
+        assert op.Box.delete(
+            self.box_a_voter_data.key_prefix + Global.creator_address.bytes
+        ), "Transaction sender address must be present in box a_."
+
+        # Delete choice tallies box and every poll choices page box from box storage
+        assert (
+            self.box_t_choice_tallies.delete()
+        ), "Choice tallies box must be present in box t_."
+        for page in urange(self.poll_choice_pages):
+            del self.box_c_poll_choices[arc4.UInt8(page)]
+
+        # Delete every nullifier bitmap page and remaining voter page box from box storage
+        for page in urange(self.poll_nullifier_pages):
+            assert op.Box.delete(
+                self.nullifier_page_key(page)
+            ), "Nullifier page must be present in box n_."
+
+        for page in urange(self.poll_voter_pages):
+            assert op.Box.delete(
+                self.voter_page_key(page)
+            ), "Voter page must be present in box p_."
 
         # Define final delete app refund transaction
-        min_txn_fee = arc4.UInt16(1000).native  # Minimum acceptable fee for transaction
         if self.total_purged_box_a_ > UInt64(0):
             # Execute inner transaction payment with purge refund and close remainder
             del_app_refund_itxn = itxn.Payment(
                 sender=Global.current_application_address,
                 receiver=Global.creator_address,
                 amount=(
-                    self.total_purged_box_a_ * self.calc_box_storage_mbr() - min_txn_fee
+                    self.total_purged_box_a_ * UInt64(BOX_A_MBR) - UInt64(MIN_TXN_FEE)
                 ),
-                fee=min_txn_fee,
+                fee=MIN_TXN_FEE,
                 close_remainder_to=Global.creator_address,
             ).submit()
         else:
@@ -428,7 +1113,7 @@ class OpenBallot(ARC4Contract):
                 sender=Global.current_application_address,
                 receiver=Global.creator_address,
                 amount=UInt64(0),  # Send zero amount
-                fee=min_txn_fee,
+                fee=MIN_TXN_FEE,
                 close_remainder_to=Global.creator_address,
             ).submit()
 
@@ -441,4 +1126,12 @@ class OpenBallot(ARC4Contract):
             and del_app_refund_itxn.close_remainder_to == Global.creator_address
         ), "del_app_refund_itxn 'reciever' and 'close_remainder_to' address must match application Creator address."
 
+        # Creator box a_ and tallies box, plus every poll choices, nullifier and voter page box
+        log_telemetry(
+            UInt64(2)
+            + self.poll_choice_pages
+            + self.poll_nullifier_pages
+            + self.poll_voter_pages
+        )
+
 
@@ -0,0 +1,120 @@
+# smart_contracts/open_ballot/events.py
+import base64
+import dataclasses
+from typing import TypedDict
+
+from algosdk.abi import ABIType
+from algosdk.encoding import checksum
+
+# ARC-28 event signatures emitted by the OpenBallot and OpenBallotRegistry smart contracts
+# (event name -> ARC-4 argument types)
+EVENT_SIGNATURES = {
+    "VoterRegistered": "(uint64,address)",
+    "VoteCast": "(uint64,address,uint8)",
+    "BoxDeleted": "(uint64,address)",
+    "BoxesPurged": "(uint64,uint64)",
+    "PollVoterRegistered": "(uint64,uint64,address)",
+    "PollVoteCast": "(uint64,uint64,address,uint8)",
+    "PollBoxDeleted": "(uint64,uint64,address)",
+    "PollBoxesPurged": "(uint64,uint64,uint64)",
+}
+
+# Event argument names in struct field order, must match the event structs in the OpenBallot and OpenBallotRegistry
+# smart contracts
+EVENT_FIELDS = {
+    "VoterRegistered": ("seq", "voter"),
+    "VoteCast": ("seq", "voter", "choice"),
+    "BoxDeleted": ("seq", "voter"),
+    "BoxesPurged": ("seq", "count"),
+    "PollVoterRegistered": ("seq", "poll_id", "voter"),
+    "PollVoteCast": ("seq", "poll_id", "voter", "choice"),
+    "PollBoxDeleted": ("seq", "poll_id", "voter"),
+    "PollBoxesPurged": ("seq", "poll_id", "count"),
+}
+
+
+# Return the ARC-28 event selector (first 4 bytes of the SHA-512/256 hash of the event signature)
+def event_selector(name: str) -> bytes:
+    digest: bytes = checksum(f"{name}{EVENT_SIGNATURES[name]}".encode())
+    return digest[:4]
+
+
+# Event selector -> (event name, ARC-4 argument tuple type)
+EVENT_SELECTORS = {
+    event_selector(name): (name, ABIType.from_string(signature))
+    for name, signature in EVENT_SIGNATURES.items()
+}
+
+
+# JSON shapes of the algod 'block_info' response read by the event decoder (only the fields that are used)
+class _Txn(TypedDict, total=False):
+    type: str
+    apid: int
+
+
+class _ApplyData(TypedDict, total=False):
+    lg: list[str]
+
+
+class _SignedTxnInBlock(TypedDict, total=False):
+    txn: _Txn
+    dt: _ApplyData
+
+
+class _Block(TypedDict, total=False):
+    txns: list[_SignedTxnInBlock]
+
+
+class BlockInfo(TypedDict):
+    block: _Block
+
+
+@dataclasses.dataclass
+class OpenBallotEvent:
+    name: str
+    seq: int
+    args: dict[str, int | str]
+    tx_id: str | None = None
+
+
+# Decode a single app call log into an event, logs that are not OpenBallot events return None
+def decode_event(log: bytes, tx_id: str | None = None) -> OpenBallotEvent | None:
+    event = EVENT_SELECTORS.get(log[:4])
+    if event is None:
+        return None
+
+    name, args_type = event
+    values: list[int | str] = args_type.decode(log[4:])
+    args = dict(zip(EVENT_FIELDS[name], values, strict=True))
+    seq = args.pop("seq")
+    assert isinstance(seq, int)
+    return OpenBallotEvent(name=name, seq=seq, args=args, tx_id=tx_id)
+
+
+# Decode the base64 encoded logs of a transaction (e.g. 'logs' of pending transaction info) into events
+def decode_logs(logs: list[str], tx_id: str | None = None) -> list[OpenBallotEvent]:
+    events = (decode_event(base64.b64decode(log), tx_id) for log in logs)
+    return [event for event in events if event is not None]
+
+
+# Helper function: Return the sequence number of an event (sort key)
+def _event_seq(event: OpenBallotEvent) -> int:
+    return event.seq
+
+
+# Decode the events emitted by an app in a block (algod 'block_info' response), ordered by event sequence number
+def decode_block_events(
+    block_info: BlockInfo, app_id: int, block_txids: list[str] | None = None
+) -> list[OpenBallotEvent]:
+    events: list[OpenBallotEvent] = []
+    for i, stxn in enumerate(block_info["block"].get("txns", [])):
+        tx_id = block_txids[i] if block_txids else None
+
+        # Only app calls to given app emit OpenBallot events (opcode budget top up inner app calls never log)
+        txn = stxn.get("txn", _Txn())
+        if txn.get("type") != "appl" or txn.get("apid") != app_id:
+            continue
+
+        events.extend(decode_logs(stxn.get("dt", _ApplyData()).get("lg", []), tx_id))
+
+    return sorted(events, key=_event_seq)
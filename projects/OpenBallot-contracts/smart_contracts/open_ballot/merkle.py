@@ -0,0 +1,96 @@
+# smart_contracts/open_ballot/merkle.py
+import hashlib
+
+from algosdk.encoding import decode_address
+
+# Domain separation prefixes (a leaf hash can never be mistaken for an inner node hash and vice versa)
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+# Padding leaf used to fill the tree up to a power of two (no address hashes to 32 zero bytes)
+EMPTY_LEAF = bytes(32)
+
+# Nullifier bitmap page layout, must match NULLIFIER_PAGE_SIZE in the OpenBallot smart contract
+NULLIFIER_PAGE_SIZE = 1024
+NULLIFIER_PAGE_BITS = NULLIFIER_PAGE_SIZE * 8
+
+
+# Return the leaf hash of an eligible address
+def leaf_hash(address: str) -> bytes:
+    public_key: bytes = decode_address(address)
+    return hashlib.sha256(LEAF_PREFIX + public_key).digest()
+
+
+# Return the inner node hash of two child hashes
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+# Return the root reached by hashing a leaf up through its proof, mirrors 'submit_vote_with_proof' verification
+def compute_root(leaf: bytes, leaf_index: int, proof: list[bytes]) -> bytes:
+    node = leaf
+    for sibling in proof:
+        node = node_hash(sibling, node) if leaf_index & 1 else node_hash(node, sibling)
+        leaf_index >>= 1
+
+    return node
+
+
+# Return the nullifier bitmap page index of a leaf index
+def nullifier_page(leaf_index: int) -> int:
+    return leaf_index // NULLIFIER_PAGE_BITS
+
+
+# Return the nullifier bitmap page box name of a page index ('n_' + 2 byte page index)
+def nullifier_box_name(page: int) -> bytes:
+    return b"n_" + page.to_bytes(2, "big")
+
+
+# Return the number of nullifier bitmap pages needed to cover a number of eligible addresses
+def nullifier_pages_needed(num_leaves: int) -> int:
+    return (num_leaves + NULLIFIER_PAGE_BITS - 1) // NULLIFIER_PAGE_BITS
+
+
+# Eligibility Merkle tree built off-chain by the poll creator, its root is committed in 'set_poll'
+class EligibilityTree:
+    def __init__(self, addresses: list[str]) -> None:
+        if not addresses:
+            raise ValueError("Eligibility tree needs at least one address.")
+
+        # Map every address to its leaf index (leaf index is also the voter's nullifier bit)
+        self.leaf_indexes = {address: i for i, address in enumerate(addresses)}
+        if len(self.leaf_indexes) != len(addresses):
+            raise ValueError("Eligibility tree addresses must be unique.")
+
+        # Pad the leaves up to a power of two and hash every level up to the root
+        leaves = [leaf_hash(address) for address in addresses]
+        width = 1
+        while width < len(leaves):
+            width *= 2
+        leaves.extend([EMPTY_LEAF] * (width - len(leaves)))
+
+        self.levels = [leaves]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            self.levels.append(
+                [node_hash(level[i], level[i + 1]) for i in range(0, len(level), 2)]
+            )
+
+    @property
+    def root(self) -> bytes:
+        return self.levels[-1][0]
+
+    @property
+    def depth(self) -> int:
+        return len(self.levels) - 1
+
+    # Return the leaf index and proof (sibling hashes from the leaf level up) of an eligible address
+    def proof(self, address: str) -> tuple[int, list[bytes]]:
+        leaf_index = self.leaf_indexes[address]
+        proof = []
+        index = leaf_index
+        for level in self.levels[:-1]:
+            proof.append(level[index ^ 1])
+            index >>= 1
+
+        return leaf_index, proof
@@ -0,0 +1,120 @@
+# smart_contracts/open_ballot/params.py
+import asyncio
+import copy
+import threading
+import weakref
+
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+
+# Suggested params and last round provider shared by every caller of an algod connection: params are fetched at most
+# once per round, concurrent callers wait for the same fetch
+# While the cache is in use a single thread follows new rounds with 'status_after_block' (one long poll per round,
+# not a status call per transaction), a call after the last round moved past the cached round fetches the params again
+# NOTE: Every call returns its own copy, callers may change the fee or validity rounds of the params they get
+class SuggestedParamsCache:
+    _caches: "weakref.WeakKeyDictionary[AlgodClient, SuggestedParamsCache]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _caches_lock = threading.Lock()
+
+    def __init__(self, algod: AlgodClient) -> None:
+        self.algod = algod
+        self.fetches = 0  # Number of suggested params fetched from algod
+        self._lock = threading.Lock()
+        self._params: SuggestedParams | None = None
+        self._round = 0  # Latest round known to the cache (fetched or observed)
+        # Params were served since the round follower last saw a round
+        self._used = False
+        self._thread: threading.Thread | None = None
+
+    # Return the cache shared by every caller of an algod client
+    @classmethod
+    def for_client(cls, algod: AlgodClient) -> "SuggestedParamsCache":
+        with cls._caches_lock:
+            if algod not in cls._caches:
+                cls._caches[algod] = cls(algod)
+            return cls._caches[algod]
+
+    # Return a copy of the cached suggested params, fetching them first when the cached ones are stale
+    def suggested_params(self) -> SuggestedParams:
+        with self._lock:
+            params = self._params
+            if params is None or self._is_stale(params):
+                # Valid from the last round for 1_000 rounds
+                params = self.algod.suggested_params()
+                first_round: int = params.first
+                self._params = params
+                self._round = max(self._round, first_round)
+                self.fetches += 1
+                self._follow_rounds()
+            self._used = True
+            return copy.copy(params)
+
+    # Return a copy of the cached suggested params from asyncio code (a stale cache is refreshed in a worker thread)
+    async def suggested_params_async(self) -> SuggestedParams:
+        with self._lock:
+            params = self._params
+            if params is not None and not self._is_stale(params):
+                self._used = True
+                return copy.copy(params)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.suggested_params
+        )
+
+    # Return the latest round known to the cache (the first valid round of fresh params or a newer observed round)
+    def last_round(self) -> int:
+        first_round: int = self.suggested_params().first
+        with self._lock:
+            return max(self._round, first_round)
+
+    # Report a round seen elsewhere (e.g. a block scanned by the confirmation watcher)
+    def observe_round(self, round_num: int) -> None:
+        with self._lock:
+            self._round = max(self._round, round_num)
+
+    # Drop the cached params, the next call fetches them again
+    def invalidate(self) -> None:
+        with self._lock:
+            self._params = None
+
+    # Helper function: Return True if the last round moved past the cached round, or no round follower is running (the
+    # cache was idle, so rounds may have gone by unseen)
+    def _is_stale(self, params: SuggestedParams) -> bool:
+        first_round: int = params.first
+        return self._round > first_round or self._thread is None
+
+    # Helper function: Start following new rounds unless a round follower is already running (lock must be held)
+    def _follow_rounds(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run_round_follower,
+                name="params-round-follower",
+                daemon=True,
+            )
+            self._thread.start()
+
+    # Helper function: Record every new round until the params were not used for a whole round or algod fails, the
+    # next call then fetches fresh params and starts following rounds again
+    def _run_round_follower(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if not self._used:
+                        break
+                    self._used = False
+                    round_num = self._round
+
+                # Returns once the round after 'round_num' is committed (or after the algod wait timeout)
+                status = self.algod.status_after_block(round_num)
+                if not isinstance(status, dict):
+                    raise TypeError("Expected a JSON response from algod.")
+                last_round: int = status["last-round"]
+                with self._lock:
+                    self._round = max(self._round, last_round)
+        except Exception:
+            pass  # The next call fetches fresh params and follows rounds again
+        finally:
+            with self._lock:
+                self._thread = None
@@ -0,0 +1,298 @@
+# smart_contracts/open_ballot/profiler.py
+import argparse
+import dataclasses
+import json
+from collections import Counter
+from pathlib import Path
+from typing import NotRequired, TypedDict, cast
+
+from algosdk.source_map import SourceMap
+
+# Build artifacts of the OpenBallot smart contract, source map paths are relative to the artifacts directory
+ARTIFACTS_DIR = Path(__file__).parent.parent / "artifacts" / "open_ballot"
+APPROVAL_TEAL_PATH = ARTIFACTS_DIR / "OpenBallot.approval.teal"
+APPROVAL_MAP_PATH = ARTIFACTS_DIR / "OpenBallot.approval.puya.map"
+
+# Base64 VLQ digit values of source map mappings
+_VLQ_DIGITS = {
+    char: i
+    for i, char in enumerate(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+    )
+}
+
+# Opcodes that cost more than 1 from the opcode budget (every other opcode costs 1)
+OPCODE_COSTS = {
+    "sha256": 35,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "keccak256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 1700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+}
+
+# Constant block opcodes emitted ahead of the mapped program body (not part of the puya source map)
+CONSTANT_BLOCK_OPCODES = ("intcblock", "bytecblock")
+
+# Stack frame of approval program code that is not inside a subroutine
+MAIN_FRAME = "main"
+
+
+# Executed opcode of an approval program trace (simulate 'exec-trace-config' with 'enable')
+class TraceUnit(TypedDict):
+    pc: int
+
+
+# Transaction fields read by the profiler
+class _AppCallTxn(TypedDict, total=False):
+    apid: int
+
+
+class _SignedTxn(TypedDict):
+    txn: _AppCallTxn
+
+
+class _PendingTxnResult(TypedDict):
+    txn: _SignedTxn
+
+
+_ExecTrace = TypedDict(
+    "_ExecTrace", {"approval-program-trace": NotRequired[list[TraceUnit]]}
+)
+
+_SimulateTxnResult = TypedDict(
+    "_SimulateTxnResult",
+    {"txn-result": _PendingTxnResult, "exec-trace": NotRequired[_ExecTrace]},
+)
+
+_SimulateTxnGroup = TypedDict(
+    "_SimulateTxnGroup", {"txn-results": list[_SimulateTxnResult]}
+)
+
+# Algod 'simulate' response (JSON format)
+SimulateResponse = TypedDict(
+    "SimulateResponse", {"txn-groups": list[_SimulateTxnGroup]}
+)
+
+
+# Puya source map event of a program counter (subroutine entry, opcode and subroutine return)
+class _PcEvent(TypedDict, total=False):
+    subroutine: str
+    op: str
+    retsub: bool
+
+
+@dataclasses.dataclass
+class Profile:
+    # (Contract source file, source line (1 based)) -> cost
+    line_costs: Counter[tuple[str, int]] = dataclasses.field(default_factory=Counter)
+    # Subroutine -> cost of its own opcodes
+    self_costs: Counter[str] = dataclasses.field(default_factory=Counter)
+    # Subroutine -> cost including callees
+    total_costs: Counter[str] = dataclasses.field(default_factory=Counter)
+    # Folded call stack -> cost
+    stacks: Counter[str] = dataclasses.field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        return sum(self.self_costs.values())
+
+
+# Helper function: Decode a source map mapping segment into its Base64 VLQ values
+def _decode_vlq(segment: str) -> list[int]:
+    values: list[int] = []
+    value = shift = 0
+    for char in segment:
+        digit = _VLQ_DIGITS[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+            continue
+        values.append(-(value >> 1) if value & 1 else value >> 1)
+        value = shift = 0
+
+    return values
+
+
+# Helper function: Map every program counter of a puya source map to its source file, the algosdk SourceMap only
+# decodes source lines (shared subroutines are mapped to another source file than the contract)
+def _pc_sources(puya_map: dict[str, object]) -> dict[int, str]:
+    sources = cast(list[str], puya_map["sources"])
+    pc_sources = {}
+    source = 0
+    for pc, segment in enumerate(cast(str, puya_map["mappings"]).split(";")):
+        values = _decode_vlq(segment)
+        if len(values) > 1:
+            source += values[1]
+        pc_sources[pc] = sources[source]
+
+    return pc_sources
+
+
+# Count the constant block opcodes at the start of the approval TEAL (executed before the first mapped opcode)
+def count_constant_blocks(teal: str) -> int:
+    ops = (
+        line.split()[0]
+        for line in teal.splitlines()
+        if line.strip() and not line.lstrip().startswith(("#", "//"))
+    )
+    count = 0
+    for op in ops:
+        if op not in CONSTANT_BLOCK_OPCODES:
+            break
+        count += 1
+
+    return count
+
+
+# Return the approval program traces of every app call in simulate responses (optionally only for a given app ID)
+def approval_traces(
+    simulate_responses: list[SimulateResponse], app_id: int | None = None
+) -> list[list[TraceUnit]]:
+    traces = []
+    for simulate_res in simulate_responses:
+        for txn_group in simulate_res["txn-groups"]:
+            for txn_res in txn_group["txn-results"]:
+                trace = txn_res.get("exec-trace", _ExecTrace()).get(
+                    "approval-program-trace"
+                )
+                txn = txn_res["txn-result"]["txn"]["txn"]
+                if trace and (app_id is None or txn.get("apid") == app_id):
+                    traces.append(trace)
+
+    return traces
+
+
+# Map executed opcodes of approval program traces back to contract source lines and subroutines
+def profile_traces(
+    traces: list[list[TraceUnit]],
+    puya_map: dict[str, object],
+    num_constant_blocks: int,
+) -> Profile:
+    puya_pc_events = cast(dict[str, _PcEvent], puya_map["pc_events"])
+    pc_events = {int(pc): event for pc, event in puya_pc_events.items()}
+    pc_to_line = SourceMap(puya_map).pc_to_line
+    pc_sources = _pc_sources(puya_map)
+    first_mapped_pc = min(pc_events)
+
+    profile = Profile()
+    for trace in traces:
+        # Program counters in the trace are shifted by the constant blocks (their size depends on template values)
+        body = trace[num_constant_blocks:]
+        if not body:
+            continue
+        pc_shift = body[0]["pc"] - first_mapped_pc
+
+        stack = [MAIN_FRAME]
+        for unit in body:
+            pc = unit["pc"] - pc_shift
+            event = pc_events.get(pc, _PcEvent())
+            if "subroutine" in event:
+                stack.append(event["subroutine"].rsplit(".", 1)[-1])
+
+            cost = OPCODE_COSTS.get(event.get("op", "").split(" ", 1)[0], 1)
+            profile.line_costs[
+                (pc_sources.get(pc, ""), pc_to_line.get(pc, -1) + 1)
+            ] += cost
+            profile.self_costs[stack[-1]] += cost
+            for frame in set(stack):
+                profile.total_costs[frame] += cost
+            profile.stacks[";".join(stack)] += cost
+
+            if event.get("retsub") and len(stack) > 1:
+                stack.pop()
+
+    return profile
+
+
+# Format the most expensive contract source lines as a table
+def format_line_table(profile: Profile, top: int = 20) -> str:
+    source_lines: dict[str, list[str]] = {}
+    rows = [f"{'cost':>8} {'%':>6}  line  source"]
+    for (source_file, line), cost in profile.line_costs.most_common(top):
+        if source_file and source_file not in source_lines:
+            source_lines[source_file] = (
+                (ARTIFACTS_DIR / source_file).read_text().splitlines()
+            )
+        lines = source_lines.get(source_file, [])
+        source = (
+            f"{Path(source_file).name}: {lines[line - 1].strip()}"
+            if 0 < line <= len(lines)
+            else "<unmapped>"
+        )
+        rows.append(
+            f"{cost:>8} {100 * cost / profile.total:>5.1f}% {line:>5}  {source}"
+        )
+
+    return "\n".join(rows)
+
+
+# Format the cost of every subroutine (own opcodes and including callees) as a table
+def format_subroutine_table(profile: Profile) -> str:
+    rows = [f"{'self':>8} {'total':>8} {'%':>6}  subroutine"]
+    for subroutine, cost in profile.self_costs.most_common():
+        total = profile.total_costs[subroutine]
+        rows.append(
+            f"{cost:>8} {total:>8} {100 * cost / profile.total:>5.1f}%  {subroutine}"
+        )
+
+    return "\n".join(rows)
+
+
+# Format folded call stacks, one 'frame;frame;frame cost' line per stack (flamegraph.pl / speedscope input)
+def format_folded_stacks(profile: Profile) -> str:
+    return "\n".join(
+        f"{stack} {cost}" for stack, cost in sorted(profile.stacks.items())
+    )
+
+
+# Profile simulate responses (JSON files, e.g. AlgoKit debug traces) and print the cost tables
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Map OpenBallot simulate traces back to contract source lines."
+    )
+    parser.add_argument(
+        "traces", nargs="+", help="Simulate response JSON files with an execution trace"
+    )
+    parser.add_argument(
+        "--app-id", type=int, help="Only profile app calls to this app ID"
+    )
+    parser.add_argument(
+        "--top", type=int, default=20, help="Number of contract source lines to print"
+    )
+    parser.add_argument(
+        "--folded", help="Write folded call stacks for flamegraph tools to this file"
+    )
+    args = parser.parse_args()
+    trace_files: list[str] = args.traces
+    app_id: int | None = args.app_id
+    top: int = args.top
+    folded: str | None = args.folded
+
+    simulate_responses = [
+        cast(SimulateResponse, json.loads(Path(path).read_text()))
+        for path in trace_files
+    ]
+    puya_map: dict[str, object] = json.loads(APPROVAL_MAP_PATH.read_text())
+    traces = approval_traces(simulate_responses, app_id)
+    profile = profile_traces(
+        traces,
+        puya_map,
+        count_constant_blocks(APPROVAL_TEAL_PATH.read_text()),
+    )
+
+    print(f"Profiled {len(traces)} app calls, total opcode cost {profile.total}\n")
+    print(format_line_table(profile, top))
+    print()
+    print(format_subroutine_table(profile))
+
+    if folded:
+        Path(folded).write_text(format_folded_stacks(profile) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+# smart_contracts/open_ballot/submitter.py
+import asyncio
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+
+from algokit_utils import TransactionParameters
+from algosdk.atomic_transaction_composer import TransactionSigner
+
+from smart_contracts.artifacts.open_ballot.open_ballot_client import OpenBallotClient
+from smart_contracts.open_ballot.boxes import TALLY_BOX_KEY, voter_box_name
+from smart_contracts.open_ballot.confirmations import ConfirmationWatcher, execute
+from smart_contracts.open_ballot.params import SuggestedParamsCache
+
+# Largest atomic group accepted by algod
+MAX_GROUP_SIZE = 16
+
+# Default number of groups sent to algod and not confirmed yet
+MAX_IN_FLIGHT = 8
+
+# Default number of signing worker threads (ed25519 signing releases the GIL)
+SIGNING_WORKERS = 4
+
+# Default seconds a partial group waits for more votes before it is sent
+LINGER = 0.005
+
+
+@dataclasses.dataclass
+class VoteReceipt:
+    tx_id: str
+    confirmed_round: int
+
+
+@dataclasses.dataclass
+class _PendingVote:
+    sender: str
+    signer: TransactionSigner
+    choice: int
+    future: asyncio.Future[VoteReceipt]
+
+
+# Pipelined vote submission: packs 'submit_vote' calls of independent voters into atomic groups, signs the groups in a
+# worker pool and keeps a bounded window of groups in flight to algod, resolving a future per vote on confirmation
+# NOTE: A group is confirmed or rejected as a whole, a rejected group fails the future of every vote packed into it
+class VoteSubmitter:
+    def __init__(
+        self,
+        app_client: OpenBallotClient,
+        group_size: int = MAX_GROUP_SIZE,
+        max_in_flight: int = MAX_IN_FLIGHT,
+        signing_workers: int = SIGNING_WORKERS,
+        linger: float = LINGER,
+    ) -> None:
+        assert (
+            1 <= group_size <= MAX_GROUP_SIZE
+        ), f"Group size must be between 1 and {MAX_GROUP_SIZE}."
+        self.app_client = app_client
+        self.group_size = group_size
+        self.linger = linger
+        self._queue: asyncio.Queue[_PendingVote | None] = asyncio.Queue()
+        self._window = asyncio.Semaphore(max_in_flight)
+        self._signing_pool = ThreadPoolExecutor(
+            max_workers=signing_workers, thread_name_prefix="vote-signer"
+        )
+        self._watcher = ConfirmationWatcher.for_client(app_client.algod_client)
+        self._params = SuggestedParamsCache.for_client(app_client.algod_client)
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._batcher: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> "VoteSubmitter":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    # Start the batching task (must be called from the event loop that submits the votes)
+    def start(self) -> None:
+        if self._batcher is None:
+            self._batcher = asyncio.create_task(self._batch_votes())
+
+    # Queue the vote of a voter and return a future resolved with its receipt once its group is confirmed
+    def submit(
+        self, sender: str, signer: TransactionSigner, choice: int
+    ) -> asyncio.Future[VoteReceipt]:
+        self.start()
+        future: asyncio.Future[VoteReceipt] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_PendingVote(sender, signer, choice, future))
+        return future
+
+    # Send the queued votes, wait for every group in flight and release the worker pools
+    async def close(self) -> None:
+        if self._batcher is not None:
+            self._queue.put_nowait(None)
+            await self._batcher
+            self._batcher = None
+        await asyncio.gather(*self._in_flight)
+        self._signing_pool.shutdown()
+
+    # Helper function: Cut the queued votes into groups, a group is sent when full or after lingering for more votes
+    async def _batch_votes(self) -> None:
+        loop = asyncio.get_running_loop()
+        closing = False
+        while not closing:
+            vote = await self._queue.get()
+            if vote is None:
+                break
+
+            votes = [vote]
+            deadline = loop.time() + self.linger
+            while len(votes) < self.group_size:
+                try:
+                    vote = await asyncio.wait_for(
+                        self._queue.get(), max(0.0, deadline - loop.time())
+                    )
+                except TimeoutError:
+                    break
+                if vote is None:
+                    closing = True
+                    break
+                votes.append(vote)
+
+            # Block the batcher (and so the producers' queue) while the in flight window is full
+            await self._window.acquire()
+            task = asyncio.create_task(self._send_group(votes))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    # Helper function: Compose, sign, send and confirm a group of votes, then resolve the future of every vote in it
+    async def _send_group(self, votes: list[_PendingVote]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            sp = await self._params.suggested_params_async()
+            composer = self.app_client.compose()
+            for vote in votes:
+                composer.submit_vote(
+                    choice=vote.choice,
+                    transaction_parameters=TransactionParameters(
+                        signer=vote.signer,
+                        sender=vote.sender,
+                        suggested_params=sp,
+                        boxes=[(0, voter_box_name(vote.sender)), (0, TALLY_BOX_KEY)],
+                    ),
+                )
+
+            # Sign in the worker pool, the shared block watcher then confirms the submitted group
+            await loop.run_in_executor(
+                self._signing_pool, composer.build().gather_signatures
+            )
+            tx_ids, confirmed_round = await execute(composer, self._watcher)
+            for vote, tx_id in zip(votes, tx_ids, strict=True):
+                if not vote.future.done():
+                    vote.future.set_result(VoteReceipt(tx_id, confirmed_round))
+        except Exception as e:
+            for vote in votes:
+                if not vote.future.done():
+                    vote.future.set_exception(e)
+        finally:
+            self._window.release()
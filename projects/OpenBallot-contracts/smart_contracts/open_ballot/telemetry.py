@@ -0,0 +1,303 @@
+# smart_contracts/open_ballot/telemetry.py
+import argparse
+import base64
+import dataclasses
+import json
+import statistics
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import NotRequired, TypedDict, cast
+
+from algosdk.abi import Contract
+from algosdk.encoding import checksum
+from algosdk.v2client.algod import AlgodClient
+
+# ARC-32 app spec of the OpenBallot smart contract, used to map method selectors back to method names
+ARC32_PATH = (
+    Path(__file__).parent.parent / "artifacts" / "open_ballot" / "OpenBallot.arc32.json"
+)
+
+
+# Helper function: Return the ARC-28 selector of an event signature (first 4 bytes of its SHA-512/256 hash)
+def _event_selector(signature: str) -> bytes:
+    digest: bytes = checksum(signature.encode())
+    return digest[:4]
+
+
+# ARC-28 selector of the MethodTelemetry struct logged by telemetry builds (deployed with template variable 'TELEMETRY')
+TELEMETRY_SELECTOR = _event_selector("MethodTelemetry(uint32,uint64,uint64)")
+TELEMETRY_LOG_SIZE = 4 + 4 + 8 + 8
+
+# Opcode budget every app call (top level or inner) adds to the pooled opcode budget of the group
+APP_CALL_BUDGET = 700
+
+# Default histogram bucket width in opcodes
+BUCKET_SIZE = 50
+
+
+# Transaction fields read by the collector (block and transaction result transactions share their field names)
+class _Txn(TypedDict, total=False):
+    type: str
+    apid: int
+    grp: str
+
+
+# Signed transaction of a transaction result
+class _SignedTxn(TypedDict):
+    txn: _Txn
+
+
+# Apply data of a block transaction (logs and inner transactions)
+class _ApplyData(TypedDict, total=False):
+    lg: list[str]
+    itx: list["TxnEntry"]
+
+
+# Block 'stxn' entry ('txn' and 'dt') or transaction result ('txn', 'logs' and 'inner-txns'), see '_txn_fields'
+TxnEntry = TypedDict(
+    "TxnEntry",
+    {
+        "txn": _Txn | _SignedTxn,
+        "dt": NotRequired[_ApplyData],
+        "logs": NotRequired[list[str]],
+        "inner-txns": NotRequired[list["TxnEntry"]],
+    },
+)
+
+
+class _Block(TypedDict, total=False):
+    txns: list[TxnEntry]
+
+
+# Algod 'block_info' response (JSON format)
+class BlockInfo(TypedDict):
+    block: _Block
+
+
+# Per method summary of the telemetry samples, see 'summarize'
+class MethodSummary(TypedDict):
+    calls: int
+    min: int
+    p50: int
+    p95: int
+    max: int
+    mean: float
+    max_boxes_touched: int
+    histogram: dict[int, int]
+
+
+@dataclasses.dataclass
+class MethodSample:
+    method: str
+    opcode_cost: int  # Opcodes consumed by the app call (pooled budget available to the call - budget left)
+    boxes_touched: int  # Boxes read, written or deleted by the app call
+    tx_id: str | None = None
+
+
+# Return the ARC-4 method selector -> method name map of the OpenBallot smart contract
+def method_names(arc32_path: Path = ARC32_PATH) -> dict[bytes, str]:
+    app_spec: dict[str, object] = json.loads(arc32_path.read_text())
+    contract = Contract.from_json(json.dumps(app_spec["contract"]))
+    return {method.get_selector(): method.name for method in contract.methods}
+
+
+# Decode a single app call log into (method selector, opcode budget left, boxes touched), other logs return None
+def decode_telemetry(log: bytes) -> tuple[bytes, int, int] | None:
+    if len(log) != TELEMETRY_LOG_SIZE or log[:4] != TELEMETRY_SELECTOR:
+        return None
+
+    return log[4:8], int.from_bytes(log[8:16], "big"), int.from_bytes(log[16:24], "big")
+
+
+# Helper function: Return the transaction, logs and inner transactions of a block 'stxn' or a transaction result
+# ('pending_transaction_info' / simulate 'txn-result'), both shapes are accepted so the same collector works for either
+def _txn_fields(entry: TxnEntry) -> tuple[_Txn, list[str], list[TxnEntry]]:
+    if "type" in entry["txn"]:
+        apply_data = entry.get("dt", _ApplyData())
+        return (
+            cast(_Txn, entry["txn"]),
+            apply_data.get("lg", []),
+            apply_data.get("itx", []),
+        )
+
+    signed_txn = cast(_SignedTxn, entry["txn"])
+    return signed_txn["txn"], entry.get("logs", []), entry.get("inner-txns", [])
+
+
+# Helper function: Count the inner app calls of a transaction, including app calls nested in inner app calls
+def _count_inner_app_calls(inner_txns: list[TxnEntry]) -> int:
+    count = 0
+    for inner in inner_txns:
+        txn, _, nested = _txn_fields(inner)
+        count += (txn.get("type") == "appl") + _count_inner_app_calls(nested)
+
+    return count
+
+
+# Collect the telemetry samples of a transaction group (block 'stxn' entries or transaction results in group order)
+# NOTE: The pooled opcode budget is only tracked while every app call of the group logs telemetry, app calls after an
+#       app call without telemetry or to another app than 'app_id' (when given) can not be attributed and are skipped
+def group_samples(
+    entries: list[TxnEntry],
+    names: dict[bytes, str],
+    tx_ids: list[str] | None = None,
+    app_id: int | None = None,
+) -> list[MethodSample]:
+    num_app_calls = sum(
+        _txn_fields(entry)[0].get("type") == "appl" for entry in entries
+    )
+    budget_left = APP_CALL_BUDGET * num_app_calls
+
+    samples = []
+    for i, entry in enumerate(entries):
+        txn, logs, inner_txns = _txn_fields(entry)
+        if txn.get("type") != "appl":
+            continue
+
+        # Logs of other apps may decode as telemetry too, only the app calls of given app are sampled
+        if app_id is not None and txn.get("apid", 0) != app_id:
+            break
+
+        decoded = (decode_telemetry(base64.b64decode(log)) for log in logs)
+        telemetry = [sample for sample in decoded if sample is not None]
+        if not telemetry:
+            break
+
+        selector, opcode_budget, boxes_touched = telemetry[-1]
+        available = budget_left + APP_CALL_BUDGET * _count_inner_app_calls(inner_txns)
+        samples.append(
+            MethodSample(
+                method=names.get(selector, selector.hex()),
+                opcode_cost=available - opcode_budget,
+                boxes_touched=boxes_touched,
+                tx_id=tx_ids[i] if tx_ids else None,
+            )
+        )
+        budget_left = opcode_budget
+
+    return samples
+
+
+# Collect the telemetry samples of every transaction group in a block (algod 'block_info' response) calling given app
+def collect_block_samples(
+    block_info: BlockInfo,
+    names: dict[bytes, str],
+    block_txids: list[str] | None = None,
+    app_id: int | None = None,
+) -> list[MethodSample]:
+    # Group members are consecutive in a block and share the 'grp' field, ungrouped transactions are their own group
+    txns = block_info["block"].get("txns", [])
+    groups: list[list[int]] = []
+    for i, stxn in enumerate(txns):
+        grp = _txn_fields(stxn)[0].get("grp")
+        if (
+            groups
+            and grp is not None
+            and _txn_fields(txns[groups[-1][0]])[0].get("grp") == grp
+        ):
+            groups[-1].append(i)
+        else:
+            groups.append([i])
+
+    samples = []
+    for group in groups:
+        samples.extend(
+            group_samples(
+                [txns[i] for i in group],
+                names,
+                [block_txids[i] for i in group] if block_txids else None,
+                app_id,
+            )
+        )
+
+    return samples
+
+
+# Bucket the opcode cost of every sample into a per method histogram (bucket start -> number of app calls)
+def cost_histograms(
+    samples: list[MethodSample], bucket_size: int = BUCKET_SIZE
+) -> dict[str, dict[int, int]]:
+    histograms: dict[str, Counter[int]] = defaultdict(Counter)
+    for sample in samples:
+        histograms[sample.method][sample.opcode_cost // bucket_size * bucket_size] += 1
+
+    return {
+        method: dict(sorted(histogram.items()))
+        for method, histogram in sorted(histograms.items())
+    }
+
+
+# Summarize the samples of every method (call count, opcode cost percentiles, boxes touched and cost histogram)
+def summarize(
+    samples: list[MethodSample], bucket_size: int = BUCKET_SIZE
+) -> dict[str, MethodSummary]:
+    by_method: dict[str, list[MethodSample]] = defaultdict(list)
+    for sample in samples:
+        by_method[sample.method].append(sample)
+
+    histograms = cost_histograms(samples, bucket_size)
+    summary: dict[str, MethodSummary] = {}
+    for method, method_samples in sorted(by_method.items()):
+        costs = sorted(sample.opcode_cost for sample in method_samples)
+        summary[method] = {
+            "calls": len(costs),
+            "min": costs[0],
+            "p50": costs[(len(costs) - 1) // 2],
+            "p95": costs[round(0.95 * (len(costs) - 1))],
+            "max": costs[-1],
+            "mean": round(statistics.fmean(costs), 1),
+            "max_boxes_touched": max(sample.boxes_touched for sample in method_samples),
+            "histogram": histograms[method],
+        }
+
+    return summary
+
+
+# Collect the telemetry of an app over a round range from algod and print the per method summary as JSON
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Collect OpenBallot opcode budget telemetry into cost histograms."
+    )
+    parser.add_argument(
+        "first_round", type=int, help="First round to collect telemetry from"
+    )
+    parser.add_argument(
+        "last_round", type=int, help="Last round to collect telemetry from (inclusive)"
+    )
+    parser.add_argument(
+        "--app-id",
+        type=int,
+        required=True,
+        help="OpenBallot app id to collect telemetry of",
+    )
+    parser.add_argument(
+        "--algod-server", default="http://localhost:4001", help="Algod server address"
+    )
+    parser.add_argument("--algod-token", default="a" * 64, help="Algod API token")
+    parser.add_argument(
+        "--bucket",
+        type=int,
+        default=BUCKET_SIZE,
+        help="Histogram bucket width in opcodes",
+    )
+    args = parser.parse_args()
+    first_round: int = args.first_round
+    last_round: int = args.last_round
+    app_id: int = args.app_id
+    algod_token: str = args.algod_token
+    algod_server: str = args.algod_server
+    bucket_size: int = args.bucket
+
+    algod = AlgodClient(algod_token, algod_server)
+    names = method_names()
+
+    samples = []
+    for round_num in range(first_round, last_round + 1):
+        block_info = cast(BlockInfo, algod.block_info(round_num))
+        samples.extend(collect_block_samples(block_info, names, app_id=app_id))
+
+    print(json.dumps(summarize(samples, bucket_size), indent=2))
+
+
+if __name__ == "__main__":
+    main()
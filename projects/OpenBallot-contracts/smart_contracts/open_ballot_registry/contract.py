@@ -0,0 +1,529 @@
+# smart_contracts/open_ballot_registry/contract.py
+from algopy import (
+    Account,
+    ARC4Contract,
+    BoxMap,
+    Bytes,
+    Global,
+    TemplateVar,
+    Txn,
+    UInt64,
+    arc4,
+    gtxn,
+    itxn,
+    op,
+    subroutine,
+    urange,
+)
+
+from smart_contracts.open_ballot.common import (
+    BOX_BASE_FEE,
+    BOX_BYTE_FEE,
+    MIN_TXN_FEE,
+    VoterData,
+    assert_num_choices,
+    assert_voting_period,
+    calc_schema_mbr,
+    calc_single_box_fee,
+    log_telemetry,
+)
+
+
+class PollData(arc4.Struct):
+    creator: (
+        arc4.Address
+    )  # Description="PollData.creator (poll creator address, manages the poll)"
+    start_date_unix: (
+        arc4.UInt64
+    )  # Description="PollData.start_date_unix (voting period start)"
+    end_date_unix: (
+        arc4.UInt64
+    )  # Description="PollData.end_date_unix (voting period end)"
+    title: arc4.DynamicBytes  # Description="PollData.title (poll title)"
+    choices: arc4.DynamicArray[
+        arc4.DynamicBytes
+    ]  # Description="PollData.choices (poll choices, choice N is stored at index N - 1)"
+
+
+# ARC-28 events, every event carries the app wide event sequence number ('total_events' after the event is emitted)
+class PollVoterRegistered(arc4.Struct):
+    seq: arc4.UInt64  # Description="PollVoterRegistered.seq (event sequence number)"
+    poll_id: (
+        arc4.UInt64
+    )  # Description="PollVoterRegistered.poll_id (poll of the voter box)"
+    voter: (
+        arc4.Address
+    )  # Description="PollVoterRegistered.voter (address that got box v_ storage)"
+
+
+class PollVoteCast(arc4.Struct):
+    seq: arc4.UInt64  # Description="PollVoteCast.seq (event sequence number)"
+    poll_id: (
+        arc4.UInt64
+    )  # Description="PollVoteCast.poll_id (poll the vote was submitted for)"
+    voter: (
+        arc4.Address
+    )  # Description="PollVoteCast.voter (address that submitted the vote)"
+    choice: arc4.UInt8  # Description="PollVoteCast.choice (selected choice)"
+
+
+class PollBoxDeleted(arc4.Struct):
+    seq: arc4.UInt64  # Description="PollBoxDeleted.seq (event sequence number)"
+    poll_id: arc4.UInt64  # Description="PollBoxDeleted.poll_id (poll of the voter box)"
+    voter: (
+        arc4.Address
+    )  # Description="PollBoxDeleted.voter (address whose box v_ storage was deleted)"
+
+
+class PollBoxesPurged(arc4.Struct):
+    seq: arc4.UInt64  # Description="PollBoxesPurged.seq (event sequence number)"
+    poll_id: (
+        arc4.UInt64
+    )  # Description="PollBoxesPurged.poll_id (poll of the purged voter boxes)"
+    count: (
+        arc4.UInt64
+    )  # Description="PollBoxesPurged.count (number of box v_ boxes purged)"
+
+
+# Poll data box ('p_' + poll id) static head layout: creator (32 bytes) | start_date_unix | end_date_unix (uint64 each)
+POLL_DATA_CREATOR_OFFSET = 0
+POLL_DATA_END_DATE_OFFSET = 40
+
+# Poll state box ('t_' + poll id) layout:
+# live voter boxes | purged voter boxes | vote tally of choice 1..N (uint64 each)
+POLL_STATE_VOTERS_OFFSET = 0
+POLL_STATE_PURGED_OFFSET = 8
+POLL_STATE_TALLIES_OFFSET = 16
+
+# Box v_ MBR, folded at compile time (2_500 base fee + 400 per byte * (len(key) + len(value)))
+BOX_V_MBR = BOX_BASE_FEE + BOX_BYTE_FEE * (42 + 1)  # fee: 0.0197 ALGO
+
+
+class OpenBallotRegistry(ARC4Contract):
+    # Global State type declarations
+    total_polls: UInt64
+    total_open_polls: UInt64
+    total_events: UInt64  # Number of ARC-28 events emitted (last event sequence number)
+
+    # Initializes the smart contract's box storage variables
+    def __init__(self) -> None:
+        super().__init__()
+        # Box Storage type declarations
+        self.box_p_poll_data = BoxMap(arc4.UInt64, PollData, key_prefix=b"p_")
+        self.box_v_voter_data = BoxMap(
+            Bytes, VoterData, key_prefix=b"v_"
+        )  # Key: poll id (8 bytes) + account address (32 bytes)
+
+    # Increment and return the event sequence number of the next ARC-28 event ('total_events' read once)
+    @subroutine
+    def next_event_seq(self) -> arc4.UInt64:
+        seq = self.total_events + UInt64(1)
+        self.total_events = seq
+        return arc4.UInt64(seq)
+
+    # Return the poll data box key for given poll id
+    @subroutine
+    def poll_data_key(self, poll_id: UInt64) -> Bytes:
+        return Bytes(b"p_") + op.itob(poll_id)
+
+    # Return the poll creator address read from the static head of the poll data box (no full poll data box read)
+    @subroutine
+    def poll_creator(self, poll_id: UInt64) -> Account:
+        return Account(
+            op.Box.extract(
+                self.poll_data_key(poll_id),
+                UInt64(POLL_DATA_CREATOR_OFFSET),
+                UInt64(32),
+            )
+        )
+
+    # Return the poll state box key for given poll id
+    @subroutine
+    def poll_state_key(self, poll_id: UInt64) -> Bytes:
+        return Bytes(b"t_") + op.itob(poll_id)
+
+    # Return the voter data box key (without key prefix) for given poll id and account
+    @subroutine
+    def voter_key(self, poll_id: UInt64, account: Account) -> Bytes:
+        return op.itob(poll_id) + account.bytes
+
+    # Read a uint64 slot of the poll state box at given byte offset
+    @subroutine
+    def read_poll_state(self, poll_id: UInt64, offset: UInt64) -> UInt64:
+        return op.btoi(op.Box.extract(self.poll_state_key(poll_id), offset, UInt64(8)))
+
+    # Overwrite a uint64 slot of the poll state box at given byte offset
+    @subroutine
+    def write_poll_state(self, poll_id: UInt64, offset: UInt64, value: UInt64) -> None:
+        op.Box.replace(self.poll_state_key(poll_id), offset, op.itob(value))
+
+    # Call the 'Create' abimethod that generates the smart contract client and initializes global storage int variables
+    @arc4.abimethod(create="require")
+    def generate(self) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert (
+            Txn.sender == Global.creator_address
+        ), "Transaction sender address must match application creator address."
+
+        assert Global.creator_address.balance >= (
+            Global.min_balance
+            + calc_schema_mbr(
+                num_bytes=UInt64(0), num_uint=UInt64(3)
+            )  # Global schema MBR: 0.1 (Global.min_balance) + 0.1855 ALGO (Global schema)
+        ), "Application creator address balance must be equal or greater than Global.min_balance + Global schema MBR."
+
+        # Initialize Global storage with default value assignments
+        self.total_polls = UInt64(0)
+        self.total_open_polls = UInt64(0)
+        self.total_events = UInt64(0)
+
+        log_telemetry(UInt64(0))
+
+    # Retrieve the version of the smart contract in an Unix format timestamp
+    @arc4.abimethod
+    def get_version_unix(self) -> UInt64:
+        log_telemetry(UInt64(0))
+        return TemplateVar[UInt64]("VERSION_UNIX")
+
+    # Enable application creator to fund App address and cover its Global minimum balance
+    @arc4.abimethod
+    def fund_app_mbr(self, mbr_pay: gtxn.PaymentTransaction) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert (
+            Txn.sender == Global.creator_address
+        ), "Transaction sender address must match application creator address."
+
+        assert (
+            mbr_pay.sender == Global.creator_address
+        ), "MBR payment sender address must match appplication creator address."
+
+        assert (
+            mbr_pay.receiver == Global.current_application_address
+        ), "MBR payment reciever address must match application address."
+
+        assert (
+            Global.current_application_address.balance >= Global.min_balance
+        ), "Application address balance must be equal or greater than Global.min_balance."
+
+        log_telemetry(UInt64(0))
+
+    # Enable any account to launch a new poll in a single call, poll creator pays the poll box storage MBR
+    @arc4.abimethod
+    def create_poll(
+        self,
+        title: arc4.DynamicBytes,
+        choices: arc4.DynamicArray[arc4.DynamicBytes],
+        start_date_unix: arc4.UInt64,
+        end_date_unix: arc4.UInt64,
+        mbr_pay: gtxn.PaymentTransaction,
+    ) -> arc4.UInt64:
+        # Make necessary assertions to verify transaction requirements
+        assert title.native.length <= UInt64(
+            118
+        ), "Poll title size can not exceed 118 bytes of data."
+
+        assert_num_choices(choices.length)
+
+        for i in urange(choices.length):
+            assert choices[i].copy().native.length <= UInt64(
+                116
+            ), "Poll choice size cannot exceed 116 bytes of data."
+
+        assert_voting_period(start_date_unix.native, end_date_unix.native)
+
+        # Define the poll data stored under the next poll id
+        poll_id = self.total_polls + UInt64(1)
+        poll_data = PollData(
+            creator=arc4.Address(Txn.sender),
+            start_date_unix=start_date_unix,
+            end_date_unix=end_date_unix,
+            title=title.copy(),
+            choices=choices.copy(),
+        )
+        poll_state_size = UInt64(POLL_STATE_TALLIES_OFFSET) + choices.length * UInt64(8)
+
+        assert (
+            mbr_pay.sender == Txn.sender
+        ), "MBR payment sender address must match transaction sender address."
+
+        assert (
+            mbr_pay.receiver == Global.current_application_address
+        ), "MBR payment reciever address must match application address."
+
+        assert mbr_pay.amount >= (
+            calc_single_box_fee(UInt64(10), poll_data.bytes.length)  # Box p_ fee
+            + calc_single_box_fee(UInt64(10), poll_state_size)  # Box t_ fee
+        ), "MBR payment for poll box storage must meet the minimum requirement amount."
+
+        # Store poll data and create the zero filled poll state box (voter counters and choice tallies)
+        self.box_p_poll_data[arc4.UInt64(poll_id)] = poll_data.copy()
+        assert op.Box.create(
+            self.poll_state_key(poll_id), poll_state_size
+        ), "Poll id must not be present in box t_."
+
+        # Update global state keys with new values
+        self.total_polls = poll_id
+        self.total_open_polls += UInt64(1)
+
+        log_telemetry(UInt64(2))
+
+        # Return the poll id
+        return arc4.UInt64(poll_id)
+
+    # Enable any eligible account to request box storage for a poll by paying a MBR cost
+    @arc4.abimethod
+    def request_box_storage(
+        self, poll_id: arc4.UInt64, mbr_pay: gtxn.PaymentTransaction
+    ) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert poll_id in self.box_p_poll_data, "Poll id must be present in box p_."
+
+        voter_key = self.voter_key(poll_id.native, Txn.sender)
+        assert (
+            voter_key not in self.box_v_voter_data
+        ), "Transaction sender address must not be present in box v_ for this poll."
+
+        assert (
+            mbr_pay.sender == Txn.sender
+        ), "Box storage MBR payment sender address must match transaction sender address."
+
+        assert (
+            mbr_pay.receiver == Global.current_application_address
+        ), "Box storage MBR payment reciever address must match application address."
+
+        # Box v_ fee: 0.0197 ALGO
+        assert mbr_pay.amount >= UInt64(
+            BOX_V_MBR
+        ), "Box storage MBR payment amount must be equal or greater than box v_ fee."
+
+        # Only the end date is read from the static head of the poll data box
+        end_date_unix = op.btoi(
+            op.Box.extract(
+                self.poll_data_key(poll_id.native),
+                UInt64(POLL_DATA_END_DATE_OFFSET),
+                UInt64(8),
+            )
+        )
+        assert (
+            Global.latest_timestamp <= end_date_unix
+        ), "Unable to request box storage if voting period is over."
+
+        # Create voter data box and increment the poll live voter boxes total
+        self.box_v_voter_data[voter_key] = VoterData(arc4.UInt8(0))
+        self.write_poll_state(
+            poll_id.native,
+            UInt64(POLL_STATE_VOTERS_OFFSET),
+            self.read_poll_state(poll_id.native, UInt64(POLL_STATE_VOTERS_OFFSET))
+            + UInt64(1),
+        )
+
+        arc4.emit(
+            PollVoterRegistered(
+                self.next_event_seq(), poll_id, arc4.Address(Txn.sender)
+            )
+        )
+
+        # Poll data, poll state and sender voter boxes
+        log_telemetry(UInt64(3))
+
+    # Enable any eligible account to submit a vote for a poll
+    @arc4.abimethod
+    def submit_vote(self, poll_id: arc4.UInt64, choice: arc4.UInt8) -> None:
+        # Make necessary assertions to verify transaction requirements
+        # Read voter data box once
+        voter_key = self.voter_key(poll_id.native, Txn.sender)
+        voter_box, voter_exists = op.Box.get(
+            self.box_v_voter_data.key_prefix + voter_key
+        )
+        assert (
+            voter_exists
+        ), "Transaction sender address must be present in box v_ for this poll."
+
+        assert VoterData.from_bytes(voter_box).choice == arc4.UInt8(
+            0
+        ), "Transaction sender address already submitted a vote."
+
+        # Number of poll choices follows from the poll state box size (no poll data box read needed)
+        poll_state_size, poll_exists = op.Box.length(
+            self.poll_state_key(poll_id.native)
+        )
+        assert poll_exists, "Poll id must be present in box t_."
+
+        assert choice.native >= UInt64(1) and choice.native <= (
+            poll_state_size - UInt64(POLL_STATE_TALLIES_OFFSET)
+        ) // UInt64(
+            8
+        ), "Invalid choice. Can only select a choice between 1 and the number of poll choices."
+
+        # Set account voter data
+        self.box_v_voter_data[voter_key] = VoterData(choice)
+
+        # Update vote tally (increment the uint64 slot of the choice in place)
+        tally_offset = UInt64(POLL_STATE_TALLIES_OFFSET) + (
+            choice.native - UInt64(1)
+        ) * UInt64(8)
+        self.write_poll_state(
+            poll_id.native,
+            tally_offset,
+            self.read_poll_state(poll_id.native, tally_offset) + UInt64(1),
+        )
+
+        arc4.emit(
+            PollVoteCast(
+                self.next_event_seq(), poll_id, arc4.Address(Txn.sender), choice
+            )
+        )
+
+        log_telemetry(UInt64(2))
+
+    # Enable any eligble account to delete their poll box storage and get their MBR payment refunded
+    @arc4.abimethod
+    def delete_box_storage(self, poll_id: arc4.UInt64) -> None:
+        # Make necessary assertions to verify transaction requirements
+        voter_key = self.voter_key(poll_id.native, Txn.sender)
+        assert (
+            voter_key in self.box_v_voter_data
+        ), "Transaction sender address must be present in box v_ for this poll."
+
+        # Delete box key (poll id + address) from box storage and decrement the poll live voter boxes total
+        del self.box_v_voter_data[voter_key]
+        self.write_poll_state(
+            poll_id.native,
+            UInt64(POLL_STATE_VOTERS_OFFSET),
+            self.read_poll_state(poll_id.native, UInt64(POLL_STATE_VOTERS_OFFSET))
+            - UInt64(1),
+        )
+
+        arc4.emit(
+            PollBoxDeleted(self.next_event_seq(), poll_id, arc4.Address(Txn.sender))
+        )
+
+        # Submit inner transaction (transaction sender gets their Box storage MBR refunded)
+        itxn.Payment(
+            sender=Global.current_application_address,
+            receiver=Txn.sender,
+            amount=UInt64(BOX_V_MBR - MIN_TXN_FEE),
+            fee=MIN_TXN_FEE,
+        ).submit()
+
+        log_telemetry(UInt64(2))
+
+    # Enable poll creator to execute box storage purge for their poll, this deletes any voter boxes left behind
+    @arc4.abimethod
+    def purge_box_storage(
+        self, poll_id: arc4.UInt64, box_keys: arc4.DynamicArray[arc4.Address]
+    ) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert Txn.sender == self.poll_creator(
+            poll_id.native
+        ), "Unauthorized address! Only poll creator can purge poll box storage."
+
+        # NOTE: Number of box keys is bound by the box references available to the group (poll boxes + voter boxes)
+        assert (
+            box_keys.length > 0
+        ), "The number of addresses represented by box keys array must be greater than 0."
+
+        # Iterate through the dynamic array of addresses representing the box key
+        for box_key in box_keys:
+            voter_key = self.voter_key(poll_id.native, box_key.native)
+            assert (
+                voter_key in self.box_v_voter_data
+            ), "Account address represented in box key must be present in box v_ for this poll."
+
+            # Delete box key (poll id + address) from box storage
+            del self.box_v_voter_data[voter_key]
+
+        # Move the purged boxes from the poll live voter boxes total to the poll purged voter boxes total
+        self.write_poll_state(
+            poll_id.native,
+            UInt64(POLL_STATE_VOTERS_OFFSET),
+            self.read_poll_state(poll_id.native, UInt64(POLL_STATE_VOTERS_OFFSET))
+            - box_keys.length,
+        )
+        self.write_poll_state(
+            poll_id.native,
+            UInt64(POLL_STATE_PURGED_OFFSET),
+            self.read_poll_state(poll_id.native, UInt64(POLL_STATE_PURGED_OFFSET))
+            + box_keys.length,
+        )
+
+        arc4.emit(
+            PollBoxesPurged(
+                self.next_event_seq(), poll_id, arc4.UInt64(box_keys.length)
+            )
+        )
+
+        # Poll data and poll state boxes, plus every purged voter box
+        log_telemetry(UInt64(2) + box_keys.length)
+
+    # Enable poll creator to close their poll once every voter box is gone, frees poll boxes and refunds their MBR
+    @arc4.abimethod
+    def close_poll(self, poll_id: arc4.UInt64) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert Txn.sender == self.poll_creator(
+            poll_id.native
+        ), "Unauthorized address! Only poll creator can close the poll."
+
+        assert self.read_poll_state(
+            poll_id.native, UInt64(POLL_STATE_VOTERS_OFFSET)
+        ) == UInt64(
+            0
+        ), "Every voter box of the poll must be deleted or purged before closing the poll."
+
+        # assert (
+        #     Global.latest_timestamp >= (poll_data.end_date_unix.native + UInt64(7 * 24 * 60 * 60))
+        # ), "Poll can only be closed after voting period + 7-day box storage deletion window is over."
+
+        # Calculate the refund (poll boxes MBR + MBR of purged voter boxes) before the poll boxes are deleted
+        poll_data_size = op.Box.length(self.poll_data_key(poll_id.native))[0]
+        poll_state_size = op.Box.length(self.poll_state_key(poll_id.native))[0]
+        refund_amount = (
+            calc_single_box_fee(UInt64(10), poll_data_size)  # Box p_ fee
+            + calc_single_box_fee(UInt64(10), poll_state_size)  # Box t_ fee
+            + self.read_poll_state(poll_id.native, UInt64(POLL_STATE_PURGED_OFFSET))
+            * UInt64(BOX_V_MBR)  # Purged boxes v_ fee
+        )
+
+        # Delete poll data and poll state boxes from box storage
+        del self.box_p_poll_data[poll_id]
+        assert op.Box.delete(
+            self.poll_state_key(poll_id.native)
+        ), "Poll id must be present in box t_."
+        self.total_open_polls -= UInt64(1)
+
+        # Submit inner transaction (poll creator gets the poll box storage MBR refunded)
+        itxn.Payment(
+            sender=Global.current_application_address,
+            receiver=Txn.sender,
+            amount=refund_amount - UInt64(MIN_TXN_FEE),
+            fee=MIN_TXN_FEE,
+        ).submit()
+
+        log_telemetry(UInt64(2))
+
+    # Allow application creator to delete the smart contract client once every poll is closed
+    @arc4.abimethod(create="disallow", allow_actions=["DeleteApplication"])
+    def terminate(self) -> None:
+        # Make necessary assertions to verify transaction requirements
+        assert TemplateVar[UInt64](
+            "DELETABLE"
+        ), "Template variable 'DELETABLE' needs to be 'True' at deploy-time."
+
+        assert (
+            Txn.sender == Global.creator_address
+        ), "Unauthorized address! Only application creator can delete the smart contract."
+
+        assert self.total_open_polls == UInt64(
+            0
+        ), "Every poll must be closed before deleting the smart contract."
+
+        # Execute inner transaction that closes app remainder balance to the creator
+        itxn.Payment(
+            sender=Global.current_application_address,
+            receiver=Global.creator_address,
+            amount=UInt64(0),  # Send zero amount
+            fee=MIN_TXN_FEE,
+            close_remainder_to=Global.creator_address,
+        ).submit()
+
+        log_telemetry(UInt64(0))
@@ -0,0 +1,132 @@
+# tests/_helpers/benchmark.py
+import base64
+import dataclasses
+import json
+from pathlib import Path
+
+from algosdk.source_map import SourceMap
+from algosdk.v2client import models
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.open_ballot.open_ballot_client import (
+    Composer,
+    SimulateOptions,
+)
+
+# Approval program of the OpenBallot smart contract built by 'algokit project run build'
+APPROVAL_TEAL_PATH = Path(
+    "./smart_contracts/artifacts/open_ballot/OpenBallot.approval.teal"
+)
+
+# Box opcodes that push box bytes on the stack (box bytes read)
+BOX_READ_OPCODES = ("box_get", "box_extract")
+
+# Minimum fee of a single transaction (outer or inner) in micro Algos
+MIN_TXN_FEE = 1_000
+
+
+@dataclasses.dataclass
+class MethodCost:
+    opcode_cost: int
+    box_bytes_read: int
+    box_bytes_written: int
+    fee: int
+
+
+# Helper function: Decode a simulate response bytes field (base64 string in JSON responses, raw bytes in msgpack ones)
+def _trace_bytes(value: str | bytes) -> bytes:
+    return base64.b64decode(value) if isinstance(value, str) else value
+
+
+# Helper function: Compile the approval TEAL with deploy-time template values, map every program counter to its opcode
+def approval_opcodes(
+    algod: AlgodClient, template_values: dict[str, int]
+) -> dict[int, str]:
+    teal = APPROVAL_TEAL_PATH.read_text()
+    for name, value in template_values.items():
+        teal = teal.replace(f"TMPL_{name}", str(value))
+
+    source_map = SourceMap(algod.compile(teal, source_map=True)["sourcemap"])
+    teal_lines = teal.splitlines()
+    return {
+        pc: teal_lines[line].split()[0] for pc, line in source_map.pc_to_line.items()
+    }
+
+
+# Helper function: Count a transaction result and all of its inner transactions
+def _count_txns(txn_result: dict) -> int:
+    return 1 + sum(_count_txns(inner) for inner in txn_result.get("inner-txns", []))
+
+
+# Helper function: Simulate a composed group with an execution trace and return its opcode cost, box I/O and fees
+def measure_method_cost(composer: Composer, opcodes: dict[int, str]) -> MethodCost:
+    simulate_res = composer.simulate(
+        SimulateOptions(
+            allow_empty_signatures=True,
+            exec_trace_config=models.SimulateTraceConfig(
+                enable=True, stack_change=True, state_change=True
+            ),
+        )
+    )
+    txn_group = simulate_res.simulate_response["txn-groups"][0]
+    assert "failure-message" not in txn_group, txn_group.get("failure-message")
+
+    cost = MethodCost(opcode_cost=0, box_bytes_read=0, box_bytes_written=0, fee=0)
+    for txn_res in txn_group["txn-results"]:
+        cost.opcode_cost += txn_res.get("app-budget-consumed", 0)
+        cost.fee += MIN_TXN_FEE * _count_txns(txn_res["txn-result"])
+
+        # Walk the approval program trace of the top level app call (opcode budget top up inner calls touch no boxes)
+        for unit in txn_res.get("exec-trace", {}).get("approval-program-trace", []):
+            if opcodes.get(unit["pc"]) in BOX_READ_OPCODES:
+                cost.box_bytes_read += len(
+                    _trace_bytes(unit["stack-additions"][0].get("bytes", b""))
+                )
+
+            for change in unit.get("state-changes", []):
+                if change["app-state-type"] == "b" and change["operation"] == "w":
+                    cost.box_bytes_written += len(
+                        _trace_bytes(change["new-value"].get("bytes", b""))
+                    )
+
+    return cost
+
+
+# Helper function: Load the method cost baseline JSON
+def load_baseline(baseline_path: Path) -> dict[str, MethodCost]:
+    return {
+        method: MethodCost(**cost)
+        for method, cost in json.loads(baseline_path.read_text()).items()
+    }
+
+
+# Helper function: Store measured method costs as the new baseline JSON (sorted, so diffs stay readable)
+def store_baseline(baseline_path: Path, costs: dict[str, MethodCost]) -> None:
+    baseline_path.parent.mkdir(parents=True, exist_ok=True)
+    baseline_path.write_text(
+        json.dumps(
+            {
+                method: dataclasses.asdict(cost)
+                for method, cost in sorted(costs.items())
+            },
+            indent=2,
+        )
+        + "\n"
+    )
+
+
+# Helper function: Return a description of every measured figure that exceeds its baseline by more than the threshold
+def find_regressions(
+    costs: dict[str, MethodCost], baseline: dict[str, MethodCost], threshold: float
+) -> list[str]:
+    regressions = []
+    for method, cost in costs.items():
+        if method not in baseline:
+            continue
+
+        for field, value in dataclasses.asdict(cost).items():
+            baseline_value = getattr(baseline[method], field)
+            if value > baseline_value * (1 + threshold):
+                regressions.append(f"{method}.{field}: {baseline_value} -> {value}")
+
+    return regressions
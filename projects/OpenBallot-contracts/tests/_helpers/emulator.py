@@ -0,0 +1,196 @@
+# tests/_helpers/emulator.py
+import contextlib
+import typing as t
+from collections.abc import Iterator
+
+import _algopy_testing.arc4 as _emulator_arc4
+from algopy import Account, Bytes, UInt64, arc4, gtxn
+from algopy_testing import AlgopyTestContext
+
+from smart_contracts.open_ballot.boxes import TALLY_BOX_KEY, voter_box_name
+
+
+# Helper function: Work around two algorand-python-testing 0.4.x emulator limitations hit by the OpenBallot contract
+#   1. Single field structs (VoterData) are turned into 'Tuple[UInt8]' instead of 'Tuple[(UInt8,)]' when the abimethod
+#      signatures are generated, which fails while the contract class is defined
+#   2. Static structs are sized as 0 bytes when a DynamicArray of them is decoded, so appending a second struct to
+#      a DynamicArray (VoterStatus in 'get_voters_data') fails, structs are sized as their field tuple here
+# NOTE: Must run before the contract module is imported, drop it once the emulator dependency handles both cases
+def _patch_emulator() -> None:
+    parameterize_type = _emulator_arc4._parameterize_type
+    get_max_bytes_len = _emulator_arc4._get_max_bytes_len
+
+    def _parameterize_type(type_: type, *params: type) -> type:
+        if type_ is _emulator_arc4.Tuple:
+            return type_[tuple(params)]
+        return parameterize_type(type_, *params)
+
+    def _get_max_bytes_len(type_info: _emulator_arc4._TypeInfo) -> int:
+        if isinstance(type_info, _emulator_arc4._StructTypeInfo):
+            struct_tuple = _emulator_arc4._tuple_type_from_struct(type_info.struct_type)
+            return get_max_bytes_len(struct_tuple._type_info)
+        return get_max_bytes_len(type_info)
+
+    _emulator_arc4._parameterize_type = _parameterize_type
+    _emulator_arc4._get_max_bytes_len = _get_max_bytes_len
+
+
+_patch_emulator()
+
+from smart_contracts.open_ballot.contract import OpenBallot  # noqa: E402
+
+# Template values every emulated OpenBallot app is deployed with
+TEMPLATE_VALUES = {"DELETABLE": 1, "TELEMETRY": 0, "VERSION_UNIX": 1739871607}
+
+# Opcode budget reported by 'Global.opcode_budget()' in the emulator (telemetry builds)
+EMULATED_OPCODE_BUDGET = 700
+
+# Poll used by every emulated app (voting period is 10 days from the start date)
+POLL_START_DATE_UNIX = 1739871607
+POLL_END_DATE_UNIX = 1740735607
+poll_choices = [b"MyChoice1", b"MyChoice2", b"MyChoice3"]
+
+# Box storage MBR in micro Algos (see contract constants)
+BOX_A_FEE = 16_100
+BOX_A_SPONSORED_FEE = 16_500  # 2_500 + 400 * (33 + 2), VoterData + sponsor byte
+BOX_N_FEE = 413_700  # 2_500 + 400 * (4 + 1_024)
+BOX_P_FEE = 413_300  # 2_500 + 400 * (4 + 1_023)
+BOX_T_FEE = 2_500 + 400 * (2 + 8 * len(poll_choices))
+
+
+# Helper function: Return a payment transaction and move its amount between the ledger balances of both accounts
+# NOTE: The emulator does not execute group transactions, balances are moved here so MBR balance checks hold
+def payment(
+    context: AlgopyTestContext, sender: Account, receiver: Account, amount: int
+) -> gtxn.PaymentTransaction:
+    context.ledger.update_account(sender, balance=sender.balance - UInt64(amount))
+    context.ledger.update_account(receiver, balance=receiver.balance + UInt64(amount))
+    return context.any.txn.payment(
+        sender=sender, receiver=receiver, amount=UInt64(amount)
+    )
+
+
+# Helper function: Run the app calls made inside the block as transactions sent by given account
+@contextlib.contextmanager
+def sent_by(context: AlgopyTestContext, sender: Account) -> Iterator[None]:
+    with context.txn.create_group(active_txn_overrides={"sender": sender}):
+        yield
+
+
+# Helper function: Create an OpenBallot app with the creator as default sender and call its 'generate' method
+def create_app(context: AlgopyTestContext, telemetry: int = 0) -> OpenBallot:
+    for name, value in {**TEMPLATE_VALUES, "TELEMETRY": telemetry}.items():
+        context.set_template_var(name, UInt64(value))
+
+    context.ledger.update_account(context.default_sender, balance=UInt64(50_000_000))
+
+    # The emulator does not meter opcodes, telemetry builds log a fixed opcode budget
+    if telemetry:
+        context.ledger.patch_global_fields(
+            opcode_budget=lambda: UInt64(EMULATED_OPCODE_BUDGET)
+        )
+    contract = OpenBallot()
+    contract.generate()
+
+    # Global.latest_timestamp is fixed to the start of the voting period
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(POLL_START_DATE_UNIX))
+    return contract
+
+
+# Helper function: Set up the poll, fund the app MBR and add the poll choices of an app created by 'create_app'
+def setup_poll(
+    context: AlgopyTestContext, contract: OpenBallot, eligibility_root: bytes = b""
+) -> None:
+    creator = context.default_sender
+    app_address = app_account(context, contract)
+
+    contract.set_poll(
+        Bytes(b"MyTitle"),
+        UInt64(len(poll_choices)),
+        Bytes(eligibility_root),
+        UInt64(POLL_START_DATE_UNIX),
+        UInt64(POLL_END_DATE_UNIX),
+    )
+    contract.fund_app_mbr(
+        payment(context, creator, app_address, 100_000 + BOX_A_FEE + BOX_T_FEE)
+    )  # 100_000 (Global.min_balance) + Box a_ fee + Box t_ fee
+    contract.add_poll_choices(
+        arc4.DynamicArray[arc4.DynamicBytes](
+            *[arc4.DynamicBytes(choice) for choice in poll_choices]
+        ),
+        payment(context, creator, app_address, 100_000),
+    )
+
+
+# Helper function: Return new voter accounts funded with given balance
+def new_voters(
+    context: AlgopyTestContext, num_voters: int, balance: int = 1_000_000
+) -> list[Account]:
+    return [context.any.account(balance=UInt64(balance)) for _ in range(num_voters)]
+
+
+# Helper function: Register voter via 'request_box_storage', paying their own box a_ MBR
+def request_box_storage(
+    context: AlgopyTestContext, contract: OpenBallot, voter: Account
+) -> None:
+    with sent_by(context, voter):
+        contract.request_box_storage(
+            payment(context, voter, app_account(context, contract), BOX_A_FEE)
+        )
+
+
+# Helper function: Submit the vote of a registered voter
+def submit_vote(
+    context: AlgopyTestContext, contract: OpenBallot, voter: Account, choice: int
+) -> None:
+    with sent_by(context, voter):
+        contract.submit_vote(arc4.UInt8(choice))
+
+
+# Helper function: Return (voted, choice) of an account box a_, absent accounts return None
+def voter_data(
+    context: AlgopyTestContext, contract: OpenBallot, account: Account
+) -> tuple[bool, int] | None:
+    box_name = voter_box_name(str(account))
+    if not context.ledger.box_exists(contract, box_name):
+        return None
+
+    # VoterData is the first byte (sponsored boxes are 2 bytes)
+    choice = context.ledger.get_box(contract, box_name)[0]
+    return choice != 0, choice
+
+
+# Helper function: Return the vote tally of every choice from the packed tallies box (choice 1 first)
+def choice_tallies(context: AlgopyTestContext, contract: OpenBallot) -> list[int]:
+    packed = bytes(context.ledger.get_box(contract, TALLY_BOX_KEY))
+    return [int.from_bytes(packed[i : i + 8], "big") for i in range(0, len(packed), 8)]
+
+
+# Helper function: Return the logs of the last app call made in the emulator
+def last_logs(context: AlgopyTestContext) -> list[bytes]:
+    txn = context.txn.last_group.active_txn
+    return [bytes(txn.logs(i)) for i in range(txn.num_logs)]
+
+
+# Helper function: Wrap addresses into the ARC-4 address array taken by the batch methods
+def address_array(accounts: list[Account]) -> arc4.DynamicArray[arc4.Address]:
+    return arc4.DynamicArray[arc4.Address](
+        *[arc4.Address(account) for account in accounts]
+    )
+
+
+# Helper function: Wrap Merkle proof sibling hashes into the ARC-4 array taken by 'submit_vote_with_proof'
+def proof_array(
+    proof: list[bytes],
+) -> arc4.DynamicArray[arc4.StaticArray[arc4.Byte, t.Literal[32]]]:
+    return arc4.DynamicArray[arc4.StaticArray[arc4.Byte, t.Literal[32]]](
+        *[
+            arc4.StaticArray[arc4.Byte, t.Literal[32]].from_bytes(sibling)
+            for sibling in proof
+        ]
+    )
+
+
+# Helper function: Return the account of an emulated app (holds the box storage MBR)
+def app_account(context: AlgopyTestContext, contract: OpenBallot) -> Account:
+    return context.ledger.get_app(contract).address
@@ -0,0 +1,329 @@
+# tests/_helpers/fuzz.py
+import contextlib
+import dataclasses
+import random
+from collections.abc import Iterator
+
+from algopy import Account, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.open_ballot.boxes import voter_box_name
+
+from .emulator import (
+    BOX_A_FEE,
+    BOX_A_SPONSORED_FEE,
+    BOX_T_FEE,
+    OpenBallot,
+    address_array,
+    app_account,
+    choice_tallies,
+    create_app,
+    payment,
+    poll_choices,
+    sent_by,
+    setup_poll,
+    voter_data,
+)
+
+# Operations drawn by the fuzzer, weighted towards registrations and votes so sequences build up state
+OPERATION_WEIGHTS = {
+    "request_box_storage": 6,
+    "register_and_vote": 3,
+    "register_voters": 2,
+    "submit_vote": 8,
+    "delete_box_storage": 2,
+    "purge_box_storage": 1,
+    "try_purge_box_storage": 2,
+}
+
+# Largest batch of addresses passed to the batch methods (box references of a single app call)
+MAX_BATCH = 8
+
+# Starting balance of every account taking part in a sequence
+ACCOUNT_BALANCE = 10_000_000
+
+# Minimum balance the app account must keep on top of its box storage MBR (see 'setup_poll')
+APP_MIN_BALANCE = 100_000
+
+
+@dataclasses.dataclass
+class Step:
+    operation: str
+    accounts: tuple[Account, ...]
+    choice: int = 0
+
+    def __str__(self) -> str:
+        accounts = ",".join(str(account)[:6] for account in self.accounts)
+        return f"{self.operation}([{accounts}], choice={self.choice})"
+
+
+@dataclasses.dataclass
+class PollModel:
+    creator: Account
+    # Live box a_ of every account -> choice ('0' = not voted)
+    boxes: dict[Account, int]
+    tallies: list[int]
+    # Live boxes a_ paid by the creator
+    sponsored: set[Account] = dataclasses.field(default_factory=set)
+    # Boxes deleted by the creator purge methods (their MBR stays with the app until terminate)
+    purged: int = 0
+    # Votes of voted boxes that were deleted or purged (their tally is kept)
+    deleted_votes: int = 0
+
+    # Return whether the contract is expected to accept given step (every assertion of the method holds)
+    def accepts(self, step: Step) -> bool:
+        valid_choice = 1 <= step.choice <= len(self.tallies)
+        match step.operation, step.accounts:
+            case "request_box_storage", (account,):
+                return account != self.creator and account not in self.boxes
+            case "register_and_vote", (account,):
+                return (
+                    account != self.creator
+                    and account not in self.boxes
+                    and valid_choice
+                )
+            case "register_voters", accounts:
+                return (
+                    self.creator not in accounts
+                    and len(set(accounts)) == len(accounts)
+                    and not any(account in self.boxes for account in accounts)
+                )
+            case "submit_vote", (account,):
+                return self.boxes.get(account) == 0 and valid_choice
+            case "delete_box_storage", (account,):
+                return account != self.creator and account in self.boxes
+            case "purge_box_storage", accounts:
+                return (
+                    self.creator not in accounts
+                    and len(set(accounts)) == len(accounts)
+                    and all(account in self.boxes for account in accounts)
+                )
+            case "try_purge_box_storage", _:
+                return True
+
+        raise ValueError(f"Unknown operation: {step.operation}")
+
+    # Apply an accepted step to the model
+    def apply(self, step: Step) -> None:
+        match step.operation:
+            case "request_box_storage":
+                self.boxes.update((account, 0) for account in step.accounts)
+            case "register_voters":
+                self.boxes.update((account, 0) for account in step.accounts)
+                self.sponsored.update(step.accounts)
+            case "register_and_vote" | "submit_vote":
+                self.boxes[step.accounts[0]] = step.choice
+                self.tallies[step.choice - 1] += 1
+            case "delete_box_storage":
+                self.deleted_votes += self.boxes.pop(step.accounts[0]) != 0
+                self.sponsored.discard(step.accounts[0])
+            case "purge_box_storage" | "try_purge_box_storage":
+                for account in step.accounts:
+                    if account != self.creator and account in self.boxes:
+                        self.deleted_votes += self.boxes.pop(account) != 0
+                        self.sponsored.discard(account)
+                        self.purged += 1
+
+
+# Helper function: Draw a random step, accounts and choices are drawn so invalid steps (double votes, absent boxes,
+# duplicate batch entries, out of range choices) come up regularly
+def random_step(rng: random.Random, accounts: list[Account]) -> Step:
+    operation = rng.choices(
+        list(OPERATION_WEIGHTS), weights=list(OPERATION_WEIGHTS.values())
+    )[0]
+    choice = rng.randint(0, len(poll_choices) + 1)
+    if operation in ("register_voters", "purge_box_storage", "try_purge_box_storage"):
+        return Step(
+            operation, tuple(rng.choices(accounts, k=rng.randint(1, MAX_BATCH))), choice
+        )
+
+    return Step(operation, (rng.choice(accounts),), choice)
+
+
+# Helper function: Roll back the app state and account balances if the block raises (the AVM rejects the whole group)
+# NOTE: The emulator keeps the writes a method made before a failed assertion, the AVM never commits them
+@contextlib.contextmanager
+def atomic(
+    context: AlgopyTestContext, contract: OpenBallot, accounts: tuple[Account, ...]
+) -> Iterator[None]:
+    app_data = context.ledger._get_app_data(contract)
+    boxes, global_state = dict(app_data.boxes), dict(app_data.global_state)
+    balances = {
+        account: account.balance
+        for account in {*accounts, app_account(context, contract)}
+    }
+    try:
+        yield
+    except AssertionError:
+        app_data.boxes, app_data.global_state = boxes, global_state
+        for account, balance in balances.items():
+            context.ledger.update_account(account, balance=balance)
+        raise
+
+
+# Helper function: Move the inner payment of the last app call between the ledger balances (app pays the fee)
+def settle_inner_payment(context: AlgopyTestContext, contract: OpenBallot) -> None:
+    refund = context.txn.last_group.last_itxn.payment
+    app_address = app_account(context, contract)
+    context.ledger.update_account(
+        app_address, balance=app_address.balance - refund.amount - refund.fee
+    )
+    context.ledger.update_account(
+        refund.receiver, balance=refund.receiver.balance + refund.amount
+    )
+
+
+# Helper function: Send a step to the contract, returns whether it was accepted
+def execute(
+    context: AlgopyTestContext, contract: OpenBallot, creator: Account, step: Step
+) -> bool:
+    app_address = app_account(context, contract)
+    account = step.accounts[0]
+    try:
+        with atomic(context, contract, (creator, *step.accounts)):
+            match step.operation:
+                case "request_box_storage":
+                    with sent_by(context, account):
+                        contract.request_box_storage(
+                            payment(context, account, app_address, BOX_A_FEE)
+                        )
+                case "register_and_vote":
+                    with sent_by(context, account):
+                        contract.register_and_vote(
+                            payment(context, account, app_address, BOX_A_FEE),
+                            arc4.UInt8(step.choice),
+                        )
+                case "register_voters":
+                    contract.register_voters(
+                        address_array(list(step.accounts)),
+                        payment(
+                            context,
+                            creator,
+                            app_address,
+                            BOX_A_SPONSORED_FEE * len(step.accounts),
+                        ),
+                    )
+                case "submit_vote":
+                    with sent_by(context, account):
+                        contract.submit_vote(arc4.UInt8(step.choice))
+                case "delete_box_storage":
+                    with sent_by(context, account):
+                        contract.delete_box_storage()
+                    settle_inner_payment(context, contract)
+                case "purge_box_storage":
+                    contract.purge_box_storage(address_array(list(step.accounts)))
+                case "try_purge_box_storage":
+                    contract.try_purge_box_storage(address_array(list(step.accounts)))
+    except AssertionError:
+        return False
+
+    return True
+
+
+# Helper function: Assert the invariants of the poll against the model after every step
+def check_invariants(
+    context: AlgopyTestContext,
+    contract: OpenBallot,
+    model: PollModel,
+    accounts: list[Account],
+) -> None:
+    tallies = choice_tallies(context, contract)
+    assert (
+        tallies == model.tallies
+    ), f"Vote tallies {tallies} must match the model tallies {model.tallies}."
+
+    for account in accounts:
+        expected = (
+            None
+            if account not in model.boxes
+            else (model.boxes[account] != 0, model.boxes[account])
+        )
+        assert (
+            voter_data(context, contract, account) == expected
+        ), f"Box a_ of {account} must match the model."
+
+    # Every counted vote is held by a live voted box or by a box deleted or purged after voting
+    num_voted_boxes = sum(1 for choice in model.boxes.values() if choice)
+    assert (
+        sum(tallies) >= num_voted_boxes
+    ), "Tally sum can not be lower than the number of voted boxes."
+    assert (
+        sum(tallies) == num_voted_boxes + model.deleted_votes
+    ), "Tally sum must equal votes held by voted boxes."
+
+    purged = context.ledger.get_global_state(contract, b"total_purged_box_a_")
+    assert (
+        purged == model.purged
+    ), f"total_purged_box_a_ {purged} must match the purged boxes {model.purged}."
+
+    min_balance = (
+        APP_MIN_BALANCE
+        + BOX_T_FEE
+        + BOX_A_FEE * (len(model.boxes) + model.purged)
+        + (BOX_A_SPONSORED_FEE - BOX_A_FEE) * len(model.sponsored)
+    )
+    balance = app_account(context, contract).balance
+    assert (
+        balance >= min_balance
+    ), f"App balance {balance} must cover the MBR of live and purged boxes {min_balance}."
+
+
+# Helper function: Run one random sequence of steps against a fresh app and terminate it, returns the steps run
+# NOTE: Failures carry the seed and the steps so far, the same seed and address pool replay the same sequence
+#       (the first pool address is the creator)
+def run_sequence(seed: int, address_pool: list[str], max_steps: int) -> list[Step]:
+    rng = random.Random(seed)
+    steps: list[Step] = []
+    with algopy_testing_context(default_sender=address_pool[0]) as context:
+        contract = create_app(context)
+        setup_poll(context, contract)
+
+        # A few voters per sequence keeps double registrations, double votes and purge overlaps frequent
+        creator = context.default_sender
+        accounts = [
+            Account(address)
+            for address in rng.sample(address_pool[1:], rng.randint(1, MAX_BATCH))
+        ]
+        for account in accounts:
+            context.ledger.update_account(account, balance=UInt64(ACCOUNT_BALANCE))
+        accounts.append(creator)
+
+        model = PollModel(
+            creator=creator, boxes={creator: 0}, tallies=[0] * len(poll_choices)
+        )
+        for _ in range(rng.randint(1, max_steps)):
+            step = random_step(rng, accounts)
+            steps.append(step)
+
+            trace = f"seed {seed}: " + " -> ".join(map(str, steps))
+            expected = model.accepts(step)
+            assert (
+                execute(context, contract, creator, step) == expected
+            ), f"{trace} must be {'accepted' if expected else 'rejected'}."
+            if expected:
+                model.apply(step)
+            try:
+                check_invariants(context, contract, model, accounts)
+            except AssertionError as e:
+                raise AssertionError(f"{trace}: {e}") from e
+
+        # Terminate refunds the MBR of purged boxes to the creator and deletes the creator, tallies and choices boxes
+        contract.terminate()
+        close_payment = context.txn.last_group.last_itxn.payment
+        expected_refund = model.purged * BOX_A_FEE - 1_000 if model.purged else 0
+        assert (
+            close_payment.amount == expected_refund
+        ), f"seed {seed}: Terminate must refund the purged box MBR."
+        assert (
+            close_payment.close_remainder_to == creator
+        ), f"seed {seed}: App balance must be closed to the creator."
+
+        # Only the boxes a_ that were never deleted or purged are left behind (their MBR stays locked)
+        remaining_boxes = set(context.ledger._get_app_data(contract).boxes)
+        assert remaining_boxes == {
+            voter_box_name(str(account))
+            for account in model.boxes
+            if account != creator
+        }, f"seed {seed}: Terminate must delete every box except the live boxes a_ of voters."
+
+    return steps
@@ -0,0 +1,491 @@
+# tests/_helpers/load.py
+# Synthetic load generator: drives N voters through registration, voting and cleanup of a poll and reports throughput,
+# confirmation latency, fees and opcode usage per phase as JSON (run with 'python -m tests._helpers.load --help')
+import argparse
+import copy
+import dataclasses
+import json
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from algokit_utils import TransactionParameters
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient
+from algopy_testing import algopy_testing_context
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+    TransactionWithSigner,
+)
+from algosdk.transaction import PaymentTxn, SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.open_ballot.open_ballot_client import OpenBallotClient
+from smart_contracts.open_ballot.boxes import (
+    TALLY_BOX_KEY,
+    choices_box_name,
+    encode_choices_page,
+    voter_box_name,
+)
+from smart_contracts.open_ballot.params import SuggestedParamsCache
+from smart_contracts.open_ballot.telemetry import collect_block_samples, method_names
+
+from .emulator import (
+    BOX_A_FEE,
+    BOX_T_FEE,
+    address_array,
+    choice_tallies,
+    create_app,
+    new_voters,
+    poll_choices,
+    request_box_storage,
+    setup_poll,
+    submit_vote,
+)
+
+# Phases every synthetic voter goes through, in order
+PHASES = ("register", "vote", "cleanup")
+
+# Largest atomic group accepted by algod
+MAX_GROUP_SIZE = 16
+
+# Addresses purged by a single 'purge_box_storage' call (one box reference each, 8 references per app call)
+PURGE_BATCH = 8
+
+# Minimum fee of a single transaction in micro Algos
+MIN_TXN_FEE = 1_000
+
+# Balance of every synthetic voter: box a_ MBR, fees and the 0.1 ALGO account minimum balance with some headroom
+VOTER_BALANCE = 200_000
+
+# Creator balance for localnet loads (app MBR, poll set up and purge fees)
+CREATOR_BALANCE = 50_000_000
+
+# Localnet apps are deployed as telemetry builds, opcode usage per phase is decoded from their MethodTelemetry logs
+LOCALNET_TEMPLATE_VALUES = {"DELETABLE": 1, "TELEMETRY": 1, "VERSION_UNIX": 1739871607}
+
+# Poll choices page box MBR in micro Algos
+BOX_C_FEE = 2_500 + 400 * (3 + len(encode_choices_page(poll_choices)))
+
+
+@dataclasses.dataclass
+class LoadConfig:
+    num_voters: int = 1_000
+    # Groups in flight at once (localnet only, the emulator runs in-process one group at a time)
+    concurrency: int = 4
+    # Voter operations packed into one atomic group (capped by MAX_GROUP_SIZE)
+    group_size: int = 8
+
+
+@dataclasses.dataclass
+class PhaseStats:
+    operations: int = 0  # Voter operations (registrations, votes or purged boxes)
+    groups: int = 0
+    txns: int = 0
+    fees: int = 0
+    # Opcodes consumed by the phase app calls, None when the backend can not meter them
+    opcode_cost: int | None = None
+    # Seconds from the first group sent to the last group confirmed
+    elapsed: float = 0.0
+    # Group confirmation latency of every operation
+    latencies: list[float] = dataclasses.field(default_factory=list)
+    # Rounds the phase groups were confirmed in
+    rounds: set[int] = dataclasses.field(default_factory=set)
+
+
+# Helper function: Split items into consecutive batches of at most given size
+def batches(items: list[Any], size: int) -> list[list[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+# Helper function: Return the number of voter operations per group for operations made of a number of transactions
+def ops_per_group(group_size: int, txns_per_op: int) -> int:
+    return max(1, min(group_size, MAX_GROUP_SIZE // txns_per_op))
+
+
+# Helper function: Return the flat fee of a purge call (outer fee plus opcode budget top up, ~40 opcodes per box key)
+def purge_fee(num_box_keys: int) -> int:
+    return MIN_TXN_FEE * (2 + (100 + 40 * num_box_keys) // 700)
+
+
+# Helper function: Return the nearest rank percentile of a list of values (0 <= fraction <= 1)
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[round(fraction * (len(ordered) - 1))]
+
+
+# Helper function: Send every group through the send function with a number of groups in flight, recording the
+# confirmation latency of every operation, returns the send function results in group order
+def drive_phase(
+    stats: PhaseStats,
+    groups: list[list[Any]],
+    send: Callable[[list[Any]], Any],
+    concurrency: int = 1,
+) -> list[Any]:
+    def timed_send(group: list[Any]) -> tuple[float, Any]:
+        start = time.perf_counter()
+        result = send(group)
+        return time.perf_counter() - start, result
+
+    start = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(timed_send, groups))
+    else:
+        results = [timed_send(group) for group in groups]
+    stats.elapsed = time.perf_counter() - start
+
+    for group, (latency, _) in zip(groups, results, strict=True):
+        stats.operations += len(group)
+        stats.groups += 1
+        stats.latencies.extend([latency] * len(group))
+
+    return [result for _, result in results]
+
+
+# Summarize the stats of a phase (throughput, latency percentiles in milliseconds, fees and opcode usage)
+def phase_report(stats: PhaseStats) -> dict[str, Any]:
+    return {
+        "operations": stats.operations,
+        "groups": stats.groups,
+        "txns": stats.txns,
+        "elapsed_s": round(stats.elapsed, 3),
+        "ops_per_s": (
+            round(stats.operations / stats.elapsed, 1) if stats.elapsed else None
+        ),
+        "ops_per_round": (
+            round(stats.operations / len(stats.rounds), 1) if stats.rounds else None
+        ),
+        "latency_ms": {
+            name: (
+                round(1_000 * percentile(stats.latencies, fraction), 2)
+                if stats.latencies
+                else None
+            )
+            for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+        },
+        "fees": stats.fees,
+        "fees_per_op": (
+            round(stats.fees / stats.operations, 1) if stats.operations else None
+        ),
+        "opcode_cost": stats.opcode_cost,
+        "opcode_cost_per_op": (
+            round(stats.opcode_cost / stats.operations, 1)
+            if stats.opcode_cost is not None and stats.operations
+            else None
+        ),
+    }
+
+
+# Build the JSON report of a load run
+def load_report(
+    backend: str, config: LoadConfig, phases: dict[str, PhaseStats]
+) -> dict[str, Any]:
+    return {
+        "backend": backend,
+        "config": dataclasses.asdict(config),
+        "phases": {phase: phase_report(stats) for phase, stats in phases.items()},
+    }
+
+
+# Drive a load through an app on the in-process emulator (fees follow the localnet fee rules, opcodes are not metered)
+def run_emulator_load(config: LoadConfig) -> dict[str, PhaseStats]:
+    phases = {phase: PhaseStats() for phase in PHASES}
+    with algopy_testing_context() as context:
+        contract = create_app(context)
+        setup_poll(context, contract)
+        voters = new_voters(context, config.num_voters, VOTER_BALANCE)
+        choices = {voter: i % len(poll_choices) + 1 for i, voter in enumerate(voters)}
+
+        # Registration: payment and 'request_box_storage' app call per voter
+        drive_phase(
+            phases["register"],
+            batches(voters, ops_per_group(config.group_size, 2)),
+            lambda group: [
+                request_box_storage(context, contract, voter) for voter in group
+            ],
+        )
+        phases["register"].txns = 2 * len(voters)
+        phases["register"].fees = MIN_TXN_FEE * phases["register"].txns
+
+        # Voting: one 'submit_vote' app call per voter
+        drive_phase(
+            phases["vote"],
+            batches(voters, ops_per_group(config.group_size, 1)),
+            lambda group: [
+                submit_vote(context, contract, voter, choices[voter]) for voter in group
+            ],
+        )
+        phases["vote"].txns = len(voters)
+        phases["vote"].fees = MIN_TXN_FEE * phases["vote"].txns
+        assert sum(choice_tallies(context, contract)) == len(
+            voters
+        ), "Every synthetic vote must be counted."
+
+        # Cleanup: creator purges the voter boxes, PURGE_BATCH boxes per 'purge_box_storage' call
+        drive_phase(
+            phases["cleanup"],
+            batches(voters, PURGE_BATCH * ops_per_group(config.group_size, 1)),
+            lambda group: [
+                contract.purge_box_storage(address_array(batch))
+                for batch in batches(group, PURGE_BATCH)
+            ],
+        )
+        purge_batches = batches(voters, PURGE_BATCH)
+        phases["cleanup"].txns = len(purge_batches)
+        phases["cleanup"].fees = sum(purge_fee(len(batch)) for batch in purge_batches)
+        assert context.ledger.get_global_state(contract, b"total_purged_box_a_") == len(
+            voters
+        ), "Every synthetic voter box must be purged."
+
+        contract.terminate()
+
+    return phases
+
+
+# Helper function: Return a payment transaction with signer built from given suggested params
+def payment_stxn(
+    sender: AddressAndSigner, receiver: str, amount: int, sp: SuggestedParams
+) -> TransactionWithSigner:
+    return TransactionWithSigner(
+        txn=PaymentTxn(sender.address, sp, receiver, amount), signer=sender.signer
+    )
+
+
+# Helper function: Fund accounts from the dispenser in full atomic groups of payments
+def fund_accounts(
+    algorand: AlgorandClient,
+    dispenser: AddressAndSigner,
+    addresses: list[str],
+    amount: int,
+    concurrency: int,
+) -> None:
+    def send(group: list[str]) -> AtomicTransactionResponse:
+        sp = SuggestedParamsCache.for_client(algorand.client.algod).suggested_params()
+        atc = AtomicTransactionComposer()
+        for address in group:
+            atc.add_transaction(payment_stxn(dispenser, address, amount, sp))
+        return atc.execute(algorand.client.algod, 4)
+
+    drive_phase(PhaseStats(), batches(addresses, MAX_GROUP_SIZE), send, concurrency)
+
+
+# Helper function: Collect the fees, transaction count and telemetry opcode cost of the phase transactions from the
+# blocks the phase groups were confirmed in
+def collect_phase_blocks(
+    algod: AlgodClient,
+    stats: PhaseStats,
+    responses: list[AtomicTransactionResponse],
+    names: dict[bytes, str],
+    app_id: int,
+) -> None:
+    tx_ids = {tx_id for response in responses for tx_id in response.tx_ids}
+    stats.rounds = {response.confirmed_round for response in responses}
+    stats.opcode_cost = 0
+
+    for round_num in sorted(stats.rounds):
+        block_info = algod.block_info(round_num)
+        block_txids = algod.get_block_txids(round_num)["blockTxids"]
+        for stxn, tx_id in zip(
+            block_info["block"].get("txns", []), block_txids, strict=True
+        ):
+            if tx_id in tx_ids:
+                stats.txns += 1
+                stats.fees += stxn["txn"].get("fee", 0) + sum(
+                    inner["txn"].get("fee", 0)
+                    for inner in stxn.get("dt", {}).get("itx", [])
+                )
+
+        stats.opcode_cost += sum(
+            sample.opcode_cost
+            for sample in collect_block_samples(block_info, names, block_txids, app_id)
+            if sample.tx_id in tx_ids
+        )
+
+
+# Drive a load through a fresh telemetry build app on localnet, reusing OpenBallotClient to compose every group
+def run_localnet_load(
+    algorand: AlgorandClient, config: LoadConfig
+) -> dict[str, PhaseStats]:
+    algod = algorand.client.algod
+    params = SuggestedParamsCache.for_client(algod)
+    dispenser = algorand.account.dispenser()
+    creator = algorand.account.random()
+    voters = [algorand.account.random() for _ in range(config.num_voters)]
+    choices = {
+        voter.address: i % len(poll_choices) + 1 for i, voter in enumerate(voters)
+    }
+    fund_accounts(algorand, dispenser, [creator.address], CREATOR_BALANCE, 1)
+    fund_accounts(
+        algorand,
+        dispenser,
+        [voter.address for voter in voters],
+        VOTER_BALANCE,
+        config.concurrency,
+    )
+
+    # Create the app and set up its poll
+    app_client = OpenBallotClient(
+        algod_client=algod,
+        sender=creator.address,
+        signer=creator.signer,
+        template_values=LOCALNET_TEMPLATE_VALUES,
+    )
+    app_client.create_generate()
+    start_date_unix = int(time.time())
+    app_client.set_poll(
+        title=b"LoadTest",
+        num_choices=len(poll_choices),
+        eligibility_root=b"",
+        start_date_unix=start_date_unix,
+        end_date_unix=start_date_unix + 10 * 24 * 60 * 60,
+    )
+    sp = params.suggested_params()
+    app_client.fund_app_mbr(
+        mbr_pay=payment_stxn(
+            creator, app_client.app_address, 100_000 + BOX_A_FEE + BOX_T_FEE, sp
+        ),
+        transaction_parameters=TransactionParameters(
+            boxes=[(0, voter_box_name(creator.address)), (0, TALLY_BOX_KEY)]
+        ),
+    )
+    app_client.add_poll_choices(
+        choices=poll_choices,
+        mbr_pay=payment_stxn(creator, app_client.app_address, BOX_C_FEE, sp),
+        transaction_parameters=TransactionParameters(boxes=[(0, choices_box_name(0))]),
+    )
+
+    # Every group takes a copy of the shared cached suggested params for its transactions
+    def register(group: list[AddressAndSigner]) -> AtomicTransactionResponse:
+        sp = params.suggested_params()
+        composer = app_client.compose()
+        for voter in group:
+            composer.request_box_storage(
+                mbr_pay=payment_stxn(voter, app_client.app_address, BOX_A_FEE, sp),
+                transaction_parameters=TransactionParameters(
+                    signer=voter.signer,
+                    sender=voter.address,
+                    suggested_params=sp,
+                    boxes=[(0, voter_box_name(voter.address))],
+                ),
+            )
+        return composer.execute()
+
+    def vote(group: list[AddressAndSigner]) -> AtomicTransactionResponse:
+        sp = params.suggested_params()
+        composer = app_client.compose()
+        for voter in group:
+            composer.submit_vote(
+                choice=choices[voter.address],
+                transaction_parameters=TransactionParameters(
+                    signer=voter.signer,
+                    sender=voter.address,
+                    suggested_params=sp,
+                    boxes=[(0, voter_box_name(voter.address)), (0, TALLY_BOX_KEY)],
+                ),
+            )
+        return composer.execute()
+
+    def cleanup(group: list[AddressAndSigner]) -> AtomicTransactionResponse:
+        sp = params.suggested_params()
+        composer = app_client.compose()
+        for batch in batches(group, PURGE_BATCH):
+            purge_sp = copy.copy(sp)
+            purge_sp.flat_fee = True
+            purge_sp.fee = purge_fee(len(batch))
+            composer.purge_box_storage(
+                box_keys=[voter.address for voter in batch],
+                transaction_parameters=TransactionParameters(
+                    suggested_params=purge_sp,
+                    boxes=[(0, voter_box_name(voter.address)) for voter in batch],
+                ),
+            )
+        return composer.execute()
+
+    names = method_names()
+    phases = {phase: PhaseStats() for phase in PHASES}
+    for phase, send, group_ops in (
+        ("register", register, ops_per_group(config.group_size, 2)),
+        ("vote", vote, ops_per_group(config.group_size, 1)),
+        ("cleanup", cleanup, PURGE_BATCH * ops_per_group(config.group_size, 1)),
+    ):
+        responses = drive_phase(
+            phases[phase], batches(voters, group_ops), send, config.concurrency
+        )
+        collect_phase_blocks(algod, phases[phase], responses, names, app_client.app_id)
+
+    # Delete the app, closing its balance back to the creator
+    terminate_sp = params.suggested_params()
+    terminate_sp.flat_fee = True
+    terminate_sp.fee = 2 * MIN_TXN_FEE
+    app_client.delete_terminate(
+        transaction_parameters=TransactionParameters(
+            suggested_params=terminate_sp,
+            boxes=[
+                (0, voter_box_name(creator.address)),
+                (0, TALLY_BOX_KEY),
+                (0, choices_box_name(0)),
+            ],
+        )
+    )
+
+    return phases
+
+
+# Run a load from the command line and print (or write) its JSON report
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Drive synthetic voters through an OpenBallot poll lifecycle."
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("emulator", "localnet"),
+        default="emulator",
+        help="Where to run the load",
+    )
+    parser.add_argument(
+        "--voters",
+        type=int,
+        default=LoadConfig.num_voters,
+        help="Number of synthetic voters",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=LoadConfig.concurrency,
+        help="Groups in flight at once",
+    )
+    parser.add_argument(
+        "--group-size",
+        type=int,
+        default=LoadConfig.group_size,
+        help="Voter operations per group",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Write the JSON report to this file instead of stdout",
+    )
+    args = parser.parse_args()
+
+    config = LoadConfig(
+        num_voters=args.voters, concurrency=args.concurrency, group_size=args.group_size
+    )
+    if args.backend == "localnet":
+        phases = run_localnet_load(AlgorandClient.default_local_net(), config)
+    else:
+        phases = run_emulator_load(config)
+
+    report = json.dumps(load_report(args.backend, config, phases), indent=2)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# tests/_helpers/tally_layouts.py
+import base64
+
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+from algosdk.logic import get_application_address
+from algosdk.v2client import models
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.open_ballot.boxes import TALLY_BOX_KEY
+
+# Maximum number of global state keys of an app, the branch chain layout keeps one global uint key per choice
+MAX_GLOBAL_KEYS = 64
+
+# Shared prologue of both reference programs: approve the create call and the setup call (no app args), then
+# validate the choice (first app arg) the same way for both layouts
+_PROLOGUE = """#pragma version 10
+txn ApplicationID
+bz approve
+txn NumAppArgs
+bz setup
+txna ApplicationArgs 0
+btoi
+dup
+int 1
+>=
+assert
+dup
+int {num_choices}
+<=
+assert
+"""
+
+_APPROVE = """approve:
+int 1
+return
+"""
+
+
+# Helper function: Build the approval TEAL of the former tally layout (one global uint key 'total_choiceN' per
+# choice updated through an if/elif/.../else chain, the last choice is the else branch)
+def branch_chain_teal(num_choices: int) -> str:
+    teal = _PROLOGUE.format(num_choices=num_choices) + "store 0\n"
+    for choice in range(1, num_choices):
+        teal += f"load 0\nint {choice}\n==\nbnz choice_{choice}\n"
+    teal += f"b choice_{num_choices}\n"
+    for choice in range(1, num_choices + 1):
+        teal += (
+            f'choice_{choice}:\nbyte "total_choice{choice}"\ndup\napp_global_get\nint 1\n+\napp_global_put\n'
+            "b approve\n"
+        )
+    return teal + "setup:\n" + _APPROVE
+
+
+# Helper function: Build the approval TEAL of the packed tally layout (uint64 slot of the choice in the tallies box
+# updated in place), the setup call creates the tallies box
+def packed_tally_teal(num_choices: int) -> str:
+    return (
+        _PROLOGUE.format(num_choices=num_choices)
+        + f"""int 1
+-
+int 8
+*
+store 0
+byte 0x{TALLY_BOX_KEY.hex()}
+load 0
+int 8
+box_extract
+btoi
+int 1
++
+itob
+store 1
+byte 0x{TALLY_BOX_KEY.hex()}
+load 0
+load 1
+box_replace
+b approve
+setup:
+byte 0x{TALLY_BOX_KEY.hex()}
+int {num_choices * 8}
+box_create
+assert
+"""
+        + _APPROVE
+    )
+
+
+# Helper function: Deploy a reference tally program, fund its tallies box MBR and run its setup call, return the app ID
+def deploy_tally_app(
+    algod: AlgodClient, creator: AddressAndSigner, teal: str, num_global_uints: int
+) -> int:
+    approval = base64.b64decode(algod.compile(teal)["result"])
+    clear = base64.b64decode(algod.compile("#pragma version 10\nint 1\n")["result"])
+
+    atc = AtomicTransactionComposer()
+    atc.add_transaction(
+        TransactionWithSigner(
+            transaction.ApplicationCreateTxn(
+                sender=creator.address,
+                sp=algod.suggested_params(),
+                on_complete=transaction.OnComplete.NoOpOC,
+                approval_program=approval,
+                clear_program=clear,
+                global_schema=transaction.StateSchema(
+                    num_uints=num_global_uints, num_byte_slices=0
+                ),
+                local_schema=transaction.StateSchema(num_uints=0, num_byte_slices=0),
+            ),
+            creator.signer,
+        )
+    )
+    app_id = algod.pending_transaction_info(atc.execute(algod, 4).tx_ids[0])[
+        "application-index"
+    ]
+
+    # Fund the app account minimum balance plus the box MBR of the largest tallies box, then run the setup call
+    atc = AtomicTransactionComposer()
+    sp = algod.suggested_params()
+    atc.add_transaction(
+        TransactionWithSigner(
+            transaction.PaymentTxn(
+                creator.address, sp, get_application_address(app_id), 1_000_000
+            ),
+            creator.signer,
+        )
+    )
+    atc.add_transaction(
+        TransactionWithSigner(
+            transaction.ApplicationNoOpTxn(
+                creator.address, sp, app_id, boxes=[(0, TALLY_BOX_KEY)]
+            ),
+            creator.signer,
+        )
+    )
+    atc.execute(algod, 4)
+    return app_id
+
+
+# Helper function: Simulate a tally update for a choice on a reference tally program, return its opcode cost
+def simulate_tally_cost(
+    algod: AlgodClient, creator: AddressAndSigner, app_id: int, choice: int
+) -> int:
+    atc = AtomicTransactionComposer()
+    atc.add_transaction(
+        TransactionWithSigner(
+            transaction.ApplicationNoOpTxn(
+                creator.address,
+                algod.suggested_params(),
+                app_id,
+                app_args=[choice.to_bytes(8, "big")],
+                boxes=[(0, TALLY_BOX_KEY)],
+            ),
+            creator.signer,
+        )
+    )
+    simulate_res = atc.simulate(algod, models.SimulateRequest(txn_groups=[]))
+    return simulate_res.simulate_response["txn-groups"][0]["txn-results"][0][
+        "app-budget-consumed"
+    ]
@@ -8,7 +8,13 @@ from algokit_utils.beta.algorand_client import AlgorandClient, PayParams
 from algosdk.atomic_transaction_composer import TransactionWithSigner
 from algosdk.encoding import encode_address
 
-from smart_contracts.artifacts.open_ballot.open_ballot_client import OpenBallotClient
+from smart_contracts.artifacts.open_ballot.open_ballot_client import (
+    Composer,
+    OpenBallotClient,
+    SimulateOptions,
+)
+from smart_contracts.open_ballot.boxes import decode_voter_box
+from smart_contracts.open_ballot.params import SuggestedParamsCache
 
 
 # Helper function: Sets up a logging.Logger for console and isolated file debugging
@@ -93,14 +99,17 @@ def setup_stxn(
     extra_fee: int = 0,
 ) -> TransactionWithSigner:
 
+    # Take the validity rounds from the shared suggested params cache (no status call per payment)
+    sp = SuggestedParamsCache.for_client(algorand.client.algod).suggested_params()
+
     # Define the payment parameters of the transaction
     payment_params = PayParams(
         sender=sender.address,
         receiver=receiver,
         amount=amount,
         extra_fee=extra_fee if extra_fee > 0 else 0,
-        first_valid_round=algorand.client.algod.status().get("last-round"),
-        last_valid_round=algorand.client.algod.status().get("last-round") + 1000,
+        first_valid_round=sp.first,
+        last_valid_round=sp.last,
         validity_window=validity_window,
     )
 
@@ -213,6 +222,13 @@ def log_global_state_info(
             logger.info(f"Entry Key: {key}, Decoded Uint: {uint_value}")
 
 
+# Helper function: Simulates a composed group and returns the opcode budget consumed by each transaction in it
+def simulate_opcode_cost(composer: Composer) -> list[int]:
+    simulate_res = composer.simulate(SimulateOptions(allow_empty_signatures=True))
+    txn_results = simulate_res.simulate_response["txn-groups"][0]["txn-results"]
+    return [txn_res.get("app-budget-consumed", 0) for txn_res in txn_results]
+
+
 def log_local_state_info(
     app_client: OpenBallotClient, address: str, logger: logging.Logger
 ) -> None:
@@ -247,13 +263,12 @@ def read_box_data(
 
     box = algorand.client.algod.application_box_by_name(app_id, box_name)
     box_title = base64.b64decode(box["name"])
-    box_value = list(base64.b64decode(box["value"]))
 
-    if len(box_title[-32:]) == 32:
-        addr_base32 = encode_address(box_title[-32:])
-        logger.info(
-            f"Address: {addr_base32} using box with key prefix: {box_title[:-32]}"
-        )
+    # Decode compact (sponsored boxes carry a sponsor byte) and legacy (2 byte) VoterData values alike
+    addr_base32, voted, choice = decode_voter_box(
+        box_title, base64.b64decode(box["value"])
+    )
+    logger.info(f"Address: {addr_base32} using box with key prefix: {box_title[:-32]}")
 
-    logger.info(f"Address: {addr_base32} - VoterData.voted: {box_value[0]}")
-    logger.info(f"Address: {addr_base32} - VoterData.choice: {box_value[1]}")
+    logger.info(f"Address: {addr_base32} - VoterData voted: {voted}")
+    logger.info(f"Address: {addr_base32} - VoterData.choice: {choice}")
@@ -4,6 +4,8 @@ from algokit_utils import (
     get_default_localnet_config,
     get_indexer_client,
 )
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 
@@ -24,3 +26,15 @@ def algod_client() -> AlgodClient:
 @pytest.fixture(scope="session")
 def indexer_client() -> IndexerClient:
     return get_indexer_client(get_default_localnet_config("indexer"))
+
+
+# Return an instance of the Algorand client from the default localnet config
+@pytest.fixture(scope="session")
+def algorand() -> AlgorandClient:
+    return AlgorandClient.default_local_net()
+
+
+# Create a dispenser account as AddreessAndSigner object that will fund other accounts
+@pytest.fixture(scope="session")
+def dispenser(algorand: AlgorandClient) -> AddressAndSigner:
+    return algorand.account.dispenser()
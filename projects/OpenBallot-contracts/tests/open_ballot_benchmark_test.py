@@ -0,0 +1,444 @@
+# tests/open_ballot_benchmark_test.py
+import json
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from algokit_utils import TransactionParameters
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient
+
+from smart_contracts.artifacts.open_ballot.open_ballot_client import (
+    Composer,
+    OpenBallotClient,
+)
+from smart_contracts.open_ballot.boxes import (
+    TALLY_BOX_KEY,
+    choices_box_name,
+    encode_choices_page,
+    voter_box_name,
+    voter_page_box_name,
+)
+from smart_contracts.open_ballot.merkle import EligibilityTree, nullifier_box_name
+
+from ._helpers.benchmark import (
+    MethodCost,
+    approval_opcodes,
+    find_regressions,
+    load_baseline,
+    measure_method_cost,
+    store_baseline,
+)
+from ._helpers.test_utils import setup_logger, setup_stxn
+
+# Setup the logging.Logger
+logger = setup_logger()
+
+# Method cost baseline, rewrite it with OPEN_BALLOT_UPDATE_BASELINE=1 after an intended cost change
+BASELINE_PATH = Path("./tests/benchmarks/open_ballot_baseline.json")
+
+# Relative increase over the baseline tolerated for every figure (0.1 = 10%)
+REGRESSION_THRESHOLD = float(os.environ.get("OPEN_BALLOT_BENCHMARK_THRESHOLD", "0.1"))
+
+# Deploy-time template values, the approval TEAL is compiled with the same values to map program counters
+TEMPLATE_VALUES = {"DELETABLE": 1, "TELEMETRY": 0, "VERSION_UNIX": 1739871607}
+
+# Poll choices used by every benchmark poll
+poll_choices = [b"MyChoice1", b"MyChoice2", b"MyChoice3"]
+
+# Box storage MBR figures in micro Algos
+BOX_A_FEE = 16_100  # 2_500 + 400 * (33 + 1)
+BOX_A_SPONSORED_FEE = 16_500  # 2_500 + 400 * (33 + 2), creator sponsored voters (VoterData + sponsor byte)
+BOX_C_FEE = 2_500 + 400 * (3 + len(encode_choices_page(poll_choices)))
+BOX_N_FEE = 413_700  # 2_500 + 400 * (4 + 1_024)
+BOX_P_FEE = 413_300  # 2_500 + 400 * (4 + 1_023)
+BOX_T_FEE = 12_900  # 2_500 + 400 * (2 + 8 * 3)
+
+
+# Helper function: Return an app client for an account, a new app is created when no app ID is given
+def account_client(
+    algorand: AlgorandClient, account: AddressAndSigner, app_id: int = 0
+) -> OpenBallotClient:
+    return OpenBallotClient(
+        algod_client=algorand.client.algod,
+        sender=account.address,
+        signer=account.signer,
+        app_id=app_id,
+        template_values=TEMPLATE_VALUES,
+    )
+
+
+# Helper function: Return transaction parameters with a flat fee covering a number of inner transactions
+def inner_fee_parameters(
+    algorand: AlgorandClient, num_inner_txns: int, boxes: list[tuple[int, bytes]]
+) -> TransactionParameters:
+    sp = algorand.get_suggested_params()
+    sp.flat_fee = True
+    sp.fee = 1_000 * (1 + num_inner_txns)
+    return TransactionParameters(suggested_params=sp, boxes=boxes)
+
+
+# Map every approval program counter to its opcode
+@pytest.fixture(scope="module")
+def opcodes(algorand: AlgorandClient) -> dict[int, str]:
+    return approval_opcodes(algorand.client.algod, TEMPLATE_VALUES)
+
+
+# Collect the measured cost of every ABI method across the benchmark polls
+@pytest.fixture(scope="module")
+def costs() -> dict[str, MethodCost]:
+    return {}
+
+
+# Return a function that simulates a freshly composed call, records its cost and sends it unless told otherwise
+@pytest.fixture(scope="module")
+def measure(
+    opcodes: dict[int, str], costs: dict[str, MethodCost]
+) -> Callable[..., None]:
+    def measure_and_send(
+        method: str, compose: Callable[[], Composer], *, send: bool = True
+    ) -> None:
+        costs[method] = measure_method_cost(compose(), opcodes)
+        if send:
+            compose().execute()
+
+    return measure_and_send
+
+
+# Generate a creator account for benchmarking and fund it with some ALGO via the dispenser account
+@pytest.fixture(scope="module")
+def creator(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AddressAndSigner:
+    creator = algorand.account.random()
+    algorand.send.payment(setup_stxn(algorand, dispenser, creator.address, 50_000_000))
+    return creator
+
+
+# Create a list of funded voter accounts
+@pytest.fixture(scope="module")
+def voters(
+    algorand: AlgorandClient, dispenser: AddressAndSigner
+) -> list[AddressAndSigner]:
+    voters = [algorand.account.random() for _ in range(4)]
+    for voter in voters:
+        algorand.send.payment(setup_stxn(algorand, dispenser, voter.address, 1_000_000))
+
+    return voters
+
+
+# Helper function: Create an app and set up its poll, measuring every set up method when a measure function is given
+def create_poll_app(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    measure: Callable[..., None] | None = None,
+    eligibility_root: bytes = b"",
+) -> OpenBallotClient:
+
+    # Set up methods are only sent when they are not measured
+    def step(
+        method: str, compose: Callable[[], Composer], *, send: bool = True
+    ) -> None:
+        if measure:
+            measure(method, compose, send=send)
+        elif send:
+            compose().execute()
+
+    step(
+        "generate",
+        lambda: account_client(algorand, creator).compose().create_generate(),
+        send=False,
+    )
+    app_client = account_client(algorand, creator)
+    app_client.create_generate()
+
+    # Voting period starts now and lasts 7 days (box storage can only be funded before the end date)
+    start_date_unix = int(time.time())
+    step(
+        "set_poll",
+        lambda: app_client.compose().set_poll(
+            title=b"MyTitle",
+            num_choices=len(poll_choices),
+            eligibility_root=eligibility_root,
+            start_date_unix=start_date_unix,
+            end_date_unix=start_date_unix + 7 * 24 * 60 * 60,
+        ),
+    )
+    step(
+        "fund_app_mbr",
+        lambda: app_client.compose().fund_app_mbr(
+            mbr_pay=setup_stxn(
+                algorand,
+                creator,
+                app_client.app_address,
+                100_000 + BOX_A_FEE + BOX_T_FEE,
+            ),
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_box_name(creator.address)), (0, TALLY_BOX_KEY)]
+            ),
+        ),
+    )
+    step(
+        "add_poll_choices",
+        lambda: app_client.compose().add_poll_choices(
+            choices=poll_choices,
+            mbr_pay=setup_stxn(algorand, creator, app_client.app_address, BOX_C_FEE),
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, choices_box_name(0))]
+            ),
+        ),
+    )
+
+    return app_client
+
+
+# Test case: Measure every box storage voting method over a full poll lifecycle
+def test_benchmark_box_storage_poll(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    voters: list[AddressAndSigner],
+    measure: Callable[..., None],
+) -> None:
+
+    app_client = create_poll_app(algorand, creator, measure)
+    voter_1, voter_2 = (
+        account_client(algorand, voter, app_client.app_id) for voter in voters[:2]
+    )
+    sponsored_voters = [algorand.account.random().address for _ in range(3)]
+
+    measure(
+        "request_box_storage",
+        lambda: voter_1.compose().request_box_storage(
+            mbr_pay=setup_stxn(algorand, voters[0], app_client.app_address, BOX_A_FEE),
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_box_name(voters[0].address))]
+            ),
+        ),
+    )
+    measure(
+        "register_voters",
+        lambda: app_client.compose().register_voters(
+            voters=sponsored_voters,
+            mbr_pay=setup_stxn(
+                algorand,
+                creator,
+                app_client.app_address,
+                len(sponsored_voters) * BOX_A_SPONSORED_FEE,
+            ),
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_box_name(address)) for address in sponsored_voters]
+            ),
+        ),
+    )
+    measure(
+        "submit_vote",
+        lambda: voter_1.compose().submit_vote(
+            choice=1,
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_box_name(voters[0].address)), (0, TALLY_BOX_KEY)]
+            ),
+        ),
+    )
+    measure(
+        "register_and_vote",
+        lambda: voter_2.compose().register_and_vote(
+            mbr_pay=setup_stxn(algorand, voters[1], app_client.app_address, BOX_A_FEE),
+            choice=2,
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_box_name(voters[1].address)), (0, TALLY_BOX_KEY)]
+            ),
+        ),
+    )
+
+    # Read-only methods are only simulated
+    measure(
+        "get_version_unix", lambda: app_client.compose().get_version_unix(), send=False
+    )
+    measure("get_poll", lambda: app_client.compose().get_poll(), send=False)
+    measure(
+        "get_results",
+        lambda: app_client.compose().get_results(
+            transaction_parameters=TransactionParameters(boxes=[(0, TALLY_BOX_KEY)])
+        ),
+        send=False,
+    )
+    measure(
+        "get_voters_data",
+        lambda: app_client.compose().get_voters_data(
+            voters=[voter.address for voter in voters[:2]],
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_box_name(voter.address)) for voter in voters[:2]]
+            ),
+        ),
+        send=False,
+    )
+
+    # Clean up every voter data box, then delete the app
+    measure(
+        "delete_box_storage",
+        lambda: voter_1.compose().delete_box_storage(
+            transaction_parameters=inner_fee_parameters(
+                algorand, 1, [(0, voter_box_name(voters[0].address))]
+            ),
+        ),
+    )
+    measure(
+        "purge_box_storage",
+        lambda: app_client.compose().purge_box_storage(
+            box_keys=sponsored_voters[:1],
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_box_name(sponsored_voters[0]))]
+            ),
+        ),
+    )
+    # Last box is already deleted
+    remaining_voters = [*sponsored_voters[1:], voters[1].address, voters[0].address]
+    measure(
+        "try_purge_box_storage",
+        lambda: app_client.compose().try_purge_box_storage(
+            box_keys=remaining_voters,
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_box_name(address)) for address in remaining_voters]
+            ),
+        ),
+    )
+    measure(
+        "terminate",
+        lambda: app_client.compose().delete_terminate(
+            transaction_parameters=inner_fee_parameters(
+                algorand,
+                1,
+                [
+                    (0, voter_box_name(creator.address)),
+                    (0, TALLY_BOX_KEY),
+                    (0, choices_box_name(0)),
+                ],
+            ),
+        ),
+    )
+
+
+# Test case: Measure every paged voting method
+def test_benchmark_paged_poll(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    voters: list[AddressAndSigner],
+    measure: Callable[..., None],
+) -> None:
+
+    app_client = create_poll_app(algorand, creator)
+
+    measure(
+        "register_paged_voters",
+        lambda: app_client.compose().register_paged_voters(
+            voters=[voters[2].address],
+            mbr_pay=setup_stxn(algorand, creator, app_client.app_address, BOX_P_FEE),
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_page_box_name(0))]
+            ),
+        ),
+    )
+    measure(
+        "submit_paged_vote",
+        lambda: account_client(algorand, voters[2], app_client.app_id)
+        .compose()
+        .submit_paged_vote(
+            choice=3,
+            slot=0,
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_page_box_name(0)), (0, TALLY_BOX_KEY)]
+            ),
+        ),
+    )
+    measure(
+        "purge_voter_pages",
+        lambda: app_client.compose().purge_voter_pages(
+            num_pages=1,
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_page_box_name(0))]
+            ),
+        ),
+    )
+
+
+# Test case: Measure every proof voting method
+def test_benchmark_proof_poll(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    voters: list[AddressAndSigner],
+    measure: Callable[..., None],
+) -> None:
+
+    tree = EligibilityTree([voter.address for voter in voters])
+    app_client = create_poll_app(algorand, creator, eligibility_root=tree.root)
+
+    measure(
+        "allocate_nullifier_pages",
+        lambda: app_client.compose().allocate_nullifier_pages(
+            num_pages=1,
+            mbr_pay=setup_stxn(algorand, creator, app_client.app_address, BOX_N_FEE),
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, nullifier_box_name(0))]
+            ),
+        ),
+    )
+
+    leaf_index, proof = tree.proof(voters[3].address)
+    measure(
+        "submit_vote_with_proof",
+        lambda: account_client(algorand, voters[3], app_client.app_id)
+        .compose()
+        .submit_vote_with_proof(
+            choice=1,
+            leaf_index=leaf_index,
+            proof=list(proof),
+            transaction_parameters=inner_fee_parameters(
+                algorand, 3, [(0, TALLY_BOX_KEY), (0, nullifier_box_name(0))]
+            ),
+        ),
+    )
+
+
+# Test case: Compare the measured method costs against the stored baseline and fail on regressions
+def test_benchmark_regressions(costs: dict[str, MethodCost]) -> None:
+
+    # Log
+    logger.info(
+        f"Method costs: {json.dumps({method: vars(cost) for method, cost in costs.items()})}"
+    )
+
+    # Costs are collected by the benchmark poll tests of this module, running this test on its own measures nothing
+    assert (
+        costs
+    ), "No method cost was measured, run the whole benchmark module to compare or record the baseline."
+
+    # The baseline is only rewritten on request, a missing baseline fails instead of silently becoming the new one
+    if os.environ.get("OPEN_BALLOT_UPDATE_BASELINE") == "1":
+        # A partial run must not drop the methods it did not measure from the baseline it replaces
+        if BASELINE_PATH.exists():
+            unmeasured = sorted(set(load_baseline(BASELINE_PATH)) - set(costs))
+            assert (
+                not unmeasured
+            ), f"Refusing to write a baseline without the unmeasured methods {unmeasured}."
+
+        store_baseline(BASELINE_PATH, costs)
+        pytest.skip(f"Method cost baseline written to {BASELINE_PATH}.")
+
+    assert (
+        BASELINE_PATH.exists()
+    ), f"Method cost baseline {BASELINE_PATH} is missing (rerun with OPEN_BALLOT_UPDATE_BASELINE=1 and commit it)."
+    baseline = load_baseline(BASELINE_PATH)
+
+    # Every baseline method must be measured again, a method left out of the run would never be compared
+    unmeasured = sorted(set(baseline) - set(costs))
+    assert (
+        not unmeasured
+    ), f"Baseline methods not measured by this run (run the whole benchmark module): {unmeasured}"
+
+    regressions = find_regressions(costs, baseline, REGRESSION_THRESHOLD)
+    assert not regressions, f"Method costs regressed over the baseline: {regressions}"
+
+    missing = sorted(set(costs) - set(baseline))
+    assert (
+        not missing
+    ), f"Methods missing from the baseline (rerun with OPEN_BALLOT_UPDATE_BASELINE=1): {missing}"
@@ -0,0 +1,626 @@
+# tests/open_ballot_emulator_test.py
+# Offline test tier: runs the OpenBallot contract in-process on the algorand-python-testing emulator (no localnet)
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, Bytes, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.open_ballot.boxes import (
+    TALLY_BOX_KEY,
+    choices_box_name,
+    paged_voter_slot,
+    voter_box_name,
+)
+from smart_contracts.open_ballot.events import decode_event
+from smart_contracts.open_ballot.merkle import EligibilityTree, nullifier_box_name
+from smart_contracts.open_ballot.telemetry import decode_telemetry, method_names
+
+from ._helpers.emulator import (
+    BOX_A_FEE,
+    BOX_A_SPONSORED_FEE,
+    BOX_N_FEE,
+    BOX_P_FEE,
+    BOX_T_FEE,
+    POLL_END_DATE_UNIX,
+    POLL_START_DATE_UNIX,
+    OpenBallot,
+    address_array,
+    app_account,
+    choice_tallies,
+    create_app,
+    last_logs,
+    new_voters,
+    payment,
+    poll_choices,
+    proof_array,
+    request_box_storage,
+    sent_by,
+    setup_poll,
+    submit_vote,
+    voter_data,
+)
+
+# Number of voters registered by the bulk tests (the emulator handles thousands of voters per test in seconds)
+NUM_BULK_VOTERS = 2_000
+
+
+# Return a fresh emulator context, every test starts from an empty ledger
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as context:
+        yield context
+
+
+# Return the creator account (default sender of the emulator context)
+@pytest.fixture()
+def creator(context: AlgopyTestContext) -> Account:
+    return context.default_sender
+
+
+# Create an app with a set up poll, funded app MBR and added poll choices
+@pytest.fixture()
+def app(context: AlgopyTestContext) -> OpenBallot:
+    contract = create_app(context)
+    setup_poll(context, contract)
+    return contract
+
+
+# Return a handful of funded voter accounts
+@pytest.fixture()
+def voters(context: AlgopyTestContext) -> list[Account]:
+    return new_voters(context, 8)
+
+
+# Test case: 'set_poll' stores the poll metadata once and rejects invalid poll data
+def test_set_poll(context: AlgopyTestContext) -> None:
+    contract = create_app(context)
+
+    with pytest.raises(
+        AssertionError, match="Number of poll choices must be between 2 and 255."
+    ):
+        contract.set_poll(
+            Bytes(b"MyTitle"),
+            UInt64(1),
+            Bytes(b""),
+            UInt64(POLL_START_DATE_UNIX),
+            UInt64(POLL_END_DATE_UNIX),
+        )
+
+    with pytest.raises(
+        AssertionError,
+        match="End date must be at least 3 days later than the start date.",
+    ):
+        contract.set_poll(
+            Bytes(b"MyTitle"),
+            UInt64(3),
+            Bytes(b""),
+            UInt64(POLL_START_DATE_UNIX),
+            UInt64(POLL_START_DATE_UNIX + 1),
+        )
+
+    setup_poll(context, contract)
+    poll = contract.get_poll()
+    assert poll.title.native == b"MyTitle", "Poll title must match 'set_poll' title."
+    assert (
+        poll.eligibility_root.native == b""
+    ), "Box storage voting poll must not have an eligibility root."
+    assert (poll.start_date_unix, poll.end_date_unix) == (
+        POLL_START_DATE_UNIX,
+        POLL_END_DATE_UNIX,
+    ), "Poll dates must match 'set_poll' dates."
+    assert (poll.finalized, poll.num_choices) == (
+        1,
+        len(poll_choices),
+    ), "Poll must be finalized with 3 choices."
+
+    with pytest.raises(AssertionError, match="Poll can only be setup once."):
+        contract.set_poll(
+            Bytes(b"MyTitle"),
+            UInt64(3),
+            Bytes(b""),
+            UInt64(POLL_START_DATE_UNIX),
+            UInt64(POLL_END_DATE_UNIX),
+        )
+
+
+# Test case: 'fund_app_mbr' creates the creator box a_ and the zero filled tallies box, poll choices get their box
+def test_fund_app_mbr(
+    context: AlgopyTestContext, creator: Account, app: OpenBallot
+) -> None:
+    assert voter_data(context, app, creator) == (
+        False,
+        0,
+    ), "Creator box a_ must be created not voted."
+    assert choice_tallies(context, app) == [
+        0,
+        0,
+        0,
+    ], "Tallies box must hold a zero tally per choice."
+    assert context.ledger.box_exists(
+        app, choices_box_name(0)
+    ), "Poll choices page 0 box must be created."
+
+    with pytest.raises(
+        AssertionError, match="Transaction sender address already present in box a_."
+    ):
+        app.fund_app_mbr(payment(context, creator, app_account(context, app), 200_000))
+
+
+# Test case: Voters request box storage by paying their box a_ MBR, a second request of the same voter fails
+def test_request_box_storage(
+    context: AlgopyTestContext, creator: Account, app: OpenBallot, voters: list[Account]
+) -> None:
+    for voter in voters:
+        request_box_storage(context, app, voter)
+        assert voter_data(context, app, voter) == (
+            False,
+            0,
+        ), "Voter box a_ must be created not voted."
+
+    event = decode_event(last_logs(context)[0])
+    assert event is not None and (event.name, event.args) == (
+        "VoterRegistered",
+        {"voter": str(voters[-1])},
+    ), "request_box_storage must emit a VoterRegistered event."
+
+    with pytest.raises(
+        AssertionError,
+        match="Transaction sender address must not be present in box a_.",
+    ):
+        request_box_storage(context, app, voters[0])
+
+    with pytest.raises(
+        AssertionError,
+        match="Application creator address can not use request box storage method.",
+    ):
+        request_box_storage(context, app, creator)
+
+
+# Test case: Registered voters submit one vote each, double votes, invalid choices and unregistered voters fail
+def test_submit_vote(
+    context: AlgopyTestContext, creator: Account, app: OpenBallot, voters: list[Account]
+) -> None:
+    for voter in voters[:-1]:
+        request_box_storage(context, app, voter)
+
+    votes = [
+        (creator, 3),
+        (voters[0], 2),
+        (voters[1], 1),
+        (voters[2], 3),
+        (voters[3], 1),
+        (voters[4], 1),
+    ]
+    for voter, choice in votes:
+        submit_vote(context, app, voter, choice)
+        assert voter_data(context, app, voter) == (
+            True,
+            choice,
+        ), "Voter data must be marked as voted."
+
+    assert choice_tallies(context, app) == [
+        3,
+        1,
+        2,
+    ], "Packed vote tally must match the submitted votes."
+
+    with pytest.raises(
+        AssertionError, match="Transaction sender address already submitted a vote."
+    ):
+        submit_vote(context, app, voters[0], 1)
+
+    with pytest.raises(AssertionError, match="Invalid choice."):
+        submit_vote(context, app, voters[5], 4)
+
+    with pytest.raises(
+        AssertionError, match="Transaction sender address must be present in box a_."
+    ):
+        submit_vote(context, app, voters[-1], 1)
+
+
+# Test case: Votes are rejected until the label of every poll choice is stored in box storage
+def test_submit_vote_before_choices_added(
+    context: AlgopyTestContext, creator: Account
+) -> None:
+    contract = create_app(context)
+    contract.set_poll(
+        Bytes(b"MyTitle"),
+        UInt64(len(poll_choices)),
+        Bytes(b""),
+        UInt64(POLL_START_DATE_UNIX),
+        UInt64(POLL_END_DATE_UNIX),
+    )
+    contract.fund_app_mbr(
+        payment(
+            context,
+            creator,
+            app_account(context, contract),
+            100_000 + BOX_A_FEE + BOX_T_FEE,
+        )
+    )
+
+    # Only the first two of the three poll choices are added
+    contract.add_poll_choices(
+        arc4.DynamicArray[arc4.DynamicBytes](
+            *[arc4.DynamicBytes(choice) for choice in poll_choices[:2]]
+        ),
+        payment(context, creator, app_account(context, contract), 100_000),
+    )
+    with pytest.raises(
+        AssertionError, match="Voting can not start before every poll choice is added."
+    ):
+        submit_vote(context, contract, creator, 1)
+
+
+# Test case: 'register_and_vote' creates the voter box already marked as voted in a single call
+def test_register_and_vote(
+    context: AlgopyTestContext, app: OpenBallot, voters: list[Account]
+) -> None:
+    with sent_by(context, voters[0]):
+        app.register_and_vote(
+            payment(context, voters[0], app_account(context, app), BOX_A_FEE),
+            arc4.UInt8(2),
+        )
+
+    assert voter_data(context, app, voters[0]) == (
+        True,
+        2,
+    ), "Voter data must be marked as voted for choice 2."
+    assert choice_tallies(context, app) == [
+        0,
+        1,
+        0,
+    ], "Packed vote tally must count the registered vote."
+    assert [event.name for event in map(decode_event, last_logs(context)) if event] == [
+        "VoterRegistered",
+        "VoteCast",
+    ], "register_and_vote must emit VoterRegistered and VoteCast events."
+
+
+# Test case: 'get_voters_data' reads the voter data of a batch of addresses, absent addresses are marked
+def test_get_voters_data(
+    context: AlgopyTestContext, app: OpenBallot, voters: list[Account]
+) -> None:
+    for voter in voters[:2]:
+        request_box_storage(context, app, voter)
+    submit_vote(context, app, voters[0], 3)
+
+    voters_data = app.get_voters_data(address_array(voters[:3]))
+    assert [
+        (status.present.native, status.voter_data.choice.native)
+        for status in voters_data
+    ] == [
+        (1, 3),
+        (1, 0),
+        (0, 0),
+    ], "Voter statuses must match the submitted votes and mark absent addresses."
+
+
+# Test case: Eligible voters vote with a Merkle proof, their nullifier bit is set and a second proof vote fails
+def test_submit_vote_with_proof(
+    context: AlgopyTestContext, creator: Account, voters: list[Account]
+) -> None:
+    tree = EligibilityTree([str(voter) for voter in voters[:5]])
+    contract = create_app(context)
+    setup_poll(context, contract, eligibility_root=tree.root)
+    contract.allocate_nullifier_pages(
+        UInt64(1), payment(context, creator, app_account(context, contract), BOX_N_FEE)
+    )
+
+    for i, voter in enumerate(voters[:5]):
+        leaf_index, proof = tree.proof(str(voter))
+        with sent_by(context, voter):
+            choice = arc4.UInt8(i % len(poll_choices) + 1)
+            contract.submit_vote_with_proof(
+                choice, UInt64(leaf_index), proof_array(proof)
+            )
+
+    nullifier_bitmap = bytes(context.ledger.get_box(contract, nullifier_box_name(0)))
+    assert (
+        nullifier_bitmap[0] == 0b1111_1000
+    ), "Nullifier bits of leaf indexes 0 to 4 must be set (leftmost first)."
+    assert choice_tallies(context, contract) == [
+        2,
+        2,
+        1,
+    ], "Packed vote tally must count every proof vote."
+
+    leaf_index, proof = tree.proof(str(voters[0]))
+    with pytest.raises(AssertionError, match="already submitted a vote."), sent_by(
+        context, voters[0]
+    ):
+        contract.submit_vote_with_proof(
+            arc4.UInt8(1), UInt64(leaf_index), proof_array(proof)
+        )
+
+    with pytest.raises(AssertionError, match="Merkle proof does not match"), sent_by(
+        context, voters[5]
+    ):
+        contract.submit_vote_with_proof(
+            arc4.UInt8(1), UInt64(leaf_index), proof_array(proof)
+        )
+
+
+# Test case: A voter deletes their box a_ and gets its MBR refunded minus the inner transaction fee
+def test_delete_box_storage(
+    context: AlgopyTestContext, app: OpenBallot, voters: list[Account]
+) -> None:
+    request_box_storage(context, app, voters[0])
+    submit_vote(context, app, voters[0], 1)
+
+    with sent_by(context, voters[0]):
+        app.delete_box_storage()
+
+    refund = context.txn.last_group.last_itxn.payment
+    assert (refund.receiver, refund.amount) == (
+        voters[0],
+        BOX_A_FEE - 1_000,
+    ), "Box a_ MBR must be refunded."
+    assert voter_data(context, app, voters[0]) is None, "Voter box a_ must be deleted."
+    assert choice_tallies(context, app) == [
+        1,
+        0,
+        0,
+    ], "Deleting box storage must not change the vote tally."
+
+    with pytest.raises(
+        AssertionError, match="Transaction sender address must be present in box a_."
+    ), sent_by(context, voters[0]):
+        app.delete_box_storage()
+
+
+# Test case: Creator sponsored voters vote, deleting a sponsored box refunds its MBR to the creator instead of the voter
+def test_register_voters_delete_refunds_creator(
+    context: AlgopyTestContext, creator: Account, app: OpenBallot, voters: list[Account]
+) -> None:
+    app.register_voters(
+        address_array(voters[:2]),
+        payment(context, creator, app_account(context, app), 2 * BOX_A_SPONSORED_FEE),
+    )
+    submit_vote(context, app, voters[0], 3)
+    assert voter_data(context, app, voters[0]) == (
+        True,
+        3,
+    ), "Sponsored voter data must be marked as voted."
+    assert (
+        len(context.ledger.get_box(app, voter_box_name(str(voters[0])))) == 2
+    ), "Sponsor byte must be kept."
+
+    with sent_by(context, voters[0]):
+        app.delete_box_storage()
+
+    refund = context.txn.last_group.last_itxn.payment
+    assert (refund.receiver, refund.amount) == (
+        creator,
+        BOX_A_SPONSORED_FEE - 1_000,
+    ), "Sponsored box a_ MBR must be refunded to the creator."
+
+    with pytest.raises(
+        AssertionError,
+        match="must be equal or greater than box a_ fee times the number of voters.",
+    ):
+        app.register_voters(
+            address_array(voters[2:4]),
+            payment(context, creator, app_account(context, app), 2 * BOX_A_FEE),
+        )
+
+
+# Test case: Voters can not be registered into box a_ for a proof voting poll (eligibility Merkle root set)
+def test_register_voters_proof_voting(
+    context: AlgopyTestContext, creator: Account, voters: list[Account]
+) -> None:
+    contract = create_app(context)
+    setup_poll(
+        context, contract, eligibility_root=EligibilityTree([str(voters[0])]).root
+    )
+
+    with pytest.raises(AssertionError, match="poll with an eligibility Merkle root"):
+        contract.register_voters(
+            address_array(voters[:1]),
+            payment(
+                context, creator, app_account(context, contract), BOX_A_SPONSORED_FEE
+            ),
+        )
+
+
+# Test case: Box a_ and voter page registration exclude each other for good, purging every voter page keeps it paged
+def test_registration_modes_exclusive(
+    context: AlgopyTestContext, creator: Account, app: OpenBallot, voters: list[Account]
+) -> None:
+    request_box_storage(context, app, voters[0])
+    with pytest.raises(AssertionError, match="poll with voters in box a_"):
+        app.register_paged_voters(
+            address_array(voters[:1]),
+            payment(context, creator, app_account(context, app), BOX_P_FEE),
+        )
+
+    contract = create_app(context)
+    setup_poll(context, contract)
+    contract.register_paged_voters(
+        address_array(sorted(voters[:2], key=lambda voter: voter.bytes.value)),
+        payment(context, creator, app_account(context, contract), BOX_P_FEE),
+    )
+    contract.purge_voter_pages(UInt64(1))
+    with pytest.raises(AssertionError, match="poll with voter pages"):
+        request_box_storage(context, contract, voters[0])
+
+    with pytest.raises(AssertionError, match="poll with voter pages"):
+        contract.register_voters(
+            address_array(voters[2:3]),
+            payment(
+                context, creator, app_account(context, contract), BOX_A_SPONSORED_FEE
+            ),
+        )
+
+
+# Test case: Paged voters are registered once in increasing address order, a second vote from the same address fails
+def test_register_paged_voters_once(
+    context: AlgopyTestContext, creator: Account, app: OpenBallot, voters: list[Account]
+) -> None:
+    registered = sorted(voters, key=lambda voter: voter.bytes.value)
+    app.register_paged_voters(
+        address_array(registered[:4]),
+        payment(context, creator, app_account(context, app), BOX_P_FEE),
+    )
+
+    # NOTE: The emulator does not roll back a failed call, the duplicate batch (first address valid) goes last
+    for batch in (registered[3:5], registered[:1], [registered[5], registered[5]]):
+        with pytest.raises(AssertionError, match="strictly increasing order"):
+            app.register_paged_voters(
+                address_array(batch),
+                payment(context, creator, app_account(context, app), 0),
+            )
+
+    # The voter slot is the index of the address in the sorted allowlist
+    slot = paged_voter_slot(
+        [str(voter) for voter in registered[:4]], str(registered[2])
+    )
+    with sent_by(context, registered[2]):
+        app.submit_paged_vote(arc4.UInt8(2), UInt64(slot))
+        with pytest.raises(AssertionError, match="already submitted a vote"):
+            app.submit_paged_vote(arc4.UInt8(1), UInt64(slot))
+
+    assert choice_tallies(context, app) == [0, 1, 0], "Only the first vote must count."
+
+
+# Test case: Creator purges the remaining boxes, 'purge_box_storage' fails on absent boxes where 'try_purge' skips them
+def test_purge_box_storage(
+    context: AlgopyTestContext, creator: Account, app: OpenBallot, voters: list[Account]
+) -> None:
+    for voter in voters:
+        request_box_storage(context, app, voter)
+
+    assert (
+        app.purge_box_storage(address_array(voters[:4])) == 4
+    ), "purge_box_storage must return purged count."
+    assert all(
+        voter_data(context, app, voter) is None for voter in voters[:4]
+    ), "Purged boxes must be deleted."
+
+    with pytest.raises(AssertionError, match="must be present in box a_."):
+        app.purge_box_storage(address_array(voters[3:5]))
+
+    with pytest.raises(
+        AssertionError, match="must not match application creator address."
+    ):
+        app.purge_box_storage(address_array([creator]))
+
+    # Overlapping batch: already purged boxes and the creator box are skipped
+    assert (
+        app.try_purge_box_storage(address_array([creator, *voters])) == 4
+    ), "try_purge must skip absent boxes."
+    assert voter_data(context, app, creator) == (
+        False,
+        0,
+    ), "Creator box a_ must never be purged."
+    assert context.ledger.get_global_state(app, b"total_purged_box_a_") == len(
+        voters
+    ), "Purged total must match."
+
+
+# Test case: Creator terminates the app, deleting every remaining box and closing the app balance to themself
+def test_terminate(
+    context: AlgopyTestContext, creator: Account, app: OpenBallot, voters: list[Account]
+) -> None:
+    for voter in voters[:2]:
+        request_box_storage(context, app, voter)
+    app.purge_box_storage(address_array(voters[:2]))
+
+    with pytest.raises(
+        AssertionError, match="Only application creator can delete the smart contract."
+    ), sent_by(context, voters[0]):
+        app.terminate()
+
+    app.terminate()
+
+    close_payment = context.txn.last_group.last_itxn.payment
+    assert (
+        close_payment.amount == 2 * BOX_A_FEE - 1_000
+    ), "Purged box a_ MBR must be refunded to the creator."
+    assert (
+        close_payment.close_remainder_to == creator
+    ), "Remaining app balance must be closed to the creator."
+    for box_name in (voter_box_name(str(creator)), TALLY_BOX_KEY, choices_box_name(0)):
+        assert not context.ledger.box_exists(
+            app, box_name
+        ), "Every app box must be deleted."
+
+
+# Test case: Telemetry builds log the number of boxes each method read, wrote or deleted
+def test_telemetry_boxes_touched(
+    context: AlgopyTestContext, voters: list[Account]
+) -> None:
+    contract = create_app(context, telemetry=1)
+    setup_poll(context, contract)
+    names = method_names()
+
+    # Return (method name, boxes touched) of the telemetry logged by the last app call
+    def last_telemetry() -> tuple[str, int]:
+        samples = [decode_telemetry(log) for log in last_logs(context)]
+        telemetry = [sample for sample in samples if sample is not None]
+        assert len(telemetry) == 1, "Every app call must log telemetry once."
+        selector, _, boxes_touched = telemetry[0]
+        return names[selector], boxes_touched
+
+    assert last_telemetry() == ("add_poll_choices", 1), "Choices page box is written."
+
+    request_box_storage(context, contract, voters[0])
+    assert last_telemetry() == (
+        "request_box_storage",
+        1,
+    ), "Only the sender box is created."
+
+    # A payment from another account also reads the payment sender box
+    with sent_by(context, voters[1]):
+        contract.request_box_storage(
+            payment(context, voters[2], app_account(context, contract), BOX_A_FEE)
+        )
+    assert last_telemetry() == (
+        "request_box_storage",
+        2,
+    ), "Payment sender box is read when someone else pays."
+
+    submit_vote(context, contract, voters[0], 2)
+    assert last_telemetry() == (
+        "submit_vote",
+        2,
+    ), "Voter box and tallies box are touched."
+
+    contract.get_voters_data(address_array(voters[:3]))
+    assert last_telemetry() == (
+        "get_voters_data",
+        3,
+    ), "Every looked up voter box is read."
+
+    contract.try_purge_box_storage(address_array(voters[:3]))
+    assert last_telemetry() == (
+        "try_purge_box_storage",
+        3,
+    ), "Every given box key is deleted or looked up."
+
+
+# Test case: Thousands of voters register, vote and get purged in a single emulated poll
+def test_bulk_poll_lifecycle(context: AlgopyTestContext, app: OpenBallot) -> None:
+    voters = new_voters(context, NUM_BULK_VOTERS)
+    for i, voter in enumerate(voters):
+        request_box_storage(context, app, voter)
+        submit_vote(context, app, voter, i % len(poll_choices) + 1)
+
+    expected_tallies = [
+        len(voters[choice :: len(poll_choices)]) for choice in range(len(poll_choices))
+    ]
+    assert (
+        choice_tallies(context, app) == expected_tallies
+    ), "Packed vote tally must count every vote."
+
+    # Purge batches are sized like a group with 8 box references per app call (16 calls, one batch each)
+    for batch_start in range(0, len(voters), 120):
+        app.purge_box_storage(address_array(voters[batch_start : batch_start + 120]))
+
+    assert context.ledger.get_global_state(app, b"total_purged_box_a_") == len(
+        voters
+    ), "Every box must be purged."
+    assert (
+        app_account(context, app).balance >= 100_000 + len(voters) * BOX_A_FEE
+    ), "App must hold the purged MBR."
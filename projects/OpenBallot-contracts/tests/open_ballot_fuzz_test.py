@@ -0,0 +1,44 @@
+# tests/open_ballot_fuzz_test.py
+import os
+import random
+
+import algosdk
+import pytest
+
+from ._helpers.fuzz import run_sequence
+
+# Number of random sequences per test run, CI raises it (e.g. OPEN_BALLOT_FUZZ_SEQUENCES=20000) for deeper runs
+NUM_SEQUENCES = int(os.environ.get("OPEN_BALLOT_FUZZ_SEQUENCES", "300"))
+
+# Seed of the first sequence, set it to a seed reported by a failure to replay that sequence first
+FIRST_SEED = int(os.environ.get("OPEN_BALLOT_FUZZ_SEED", random.randrange(2**32)))
+
+# Longest sequence of steps before the app is terminated
+MAX_STEPS = 24
+
+# Number of addresses sequences draw their voters from
+ADDRESS_POOL_SIZE = 2_000
+
+
+# Generate the address pool once, sequences sample a few voters each from it
+@pytest.fixture(scope="module")
+def address_pool() -> list[str]:
+    return [algosdk.account.generate_account()[1] for _ in range(ADDRESS_POOL_SIZE)]
+
+
+# Test case: Random interleavings of register, vote, delete, purge and terminate keep every poll invariant
+def test_fuzz_poll_sequences(address_pool: list[str]) -> None:
+    num_steps = 0
+    for seed in range(FIRST_SEED, FIRST_SEED + NUM_SEQUENCES):
+        num_steps += len(run_sequence(seed, address_pool, MAX_STEPS))
+
+    assert num_steps >= NUM_SEQUENCES, "Every sequence must run at least one step."
+
+
+# Test case: The same seed replays the same sequence of steps
+def test_fuzz_sequence_replay(address_pool: list[str]) -> None:
+    assert [
+        str(step) for step in run_sequence(FIRST_SEED, address_pool, MAX_STEPS)
+    ] == [
+        str(step) for step in run_sequence(FIRST_SEED, address_pool, MAX_STEPS)
+    ], "Sequences must be reproducible from their seed."
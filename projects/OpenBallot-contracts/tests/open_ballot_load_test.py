@@ -0,0 +1,90 @@
+# tests/open_ballot_load_test.py
+import json
+import os
+from pathlib import Path
+
+from algokit_utils.beta.algorand_client import AlgorandClient
+
+from ._helpers.load import (
+    MIN_TXN_FEE,
+    PHASES,
+    LoadConfig,
+    load_report,
+    run_emulator_load,
+    run_localnet_load,
+)
+from ._helpers.test_utils import setup_logger
+
+# Setup the logging.Logger
+logger = setup_logger()
+
+# Localnet load size, raised in trend tracking runs (e.g. OPEN_BALLOT_LOAD_VOTERS=10000 OPEN_BALLOT_LOAD_CONCURRENCY=8)
+LOAD_CONFIG = LoadConfig(
+    num_voters=int(os.environ.get("OPEN_BALLOT_LOAD_VOTERS", "64")),
+    concurrency=int(os.environ.get("OPEN_BALLOT_LOAD_CONCURRENCY", "4")),
+    group_size=int(os.environ.get("OPEN_BALLOT_LOAD_GROUP_SIZE", "8")),
+)
+
+# Optional path the localnet load report JSON is written to for trend tracking
+LOAD_REPORT_PATH = os.environ.get("OPEN_BALLOT_LOAD_REPORT")
+
+
+# Test case: An emulated load runs every voter through every phase and reports figures for each phase
+def test_emulator_load() -> None:
+    config = LoadConfig(num_voters=100, group_size=8)
+    report = load_report("emulator", config, run_emulator_load(config))
+
+    assert list(report["phases"]) == list(
+        PHASES
+    ), "Report must hold every phase in order."
+    for phase, figures in report["phases"].items():
+        assert (
+            figures["operations"] == config.num_voters
+        ), f"Every voter must go through the {phase} phase."
+        assert figures["ops_per_s"] > 0, f"{phase} throughput must be measured."
+        assert (
+            0
+            < figures["latency_ms"]["p50"]
+            <= figures["latency_ms"]["p95"]
+            <= figures["latency_ms"]["p99"]
+        ), f"{phase} latency percentiles must be ordered."
+
+    # Registrations pack 8 payment + app call pairs per group, votes 8 app calls per group
+    assert (
+        report["phases"]["register"]["groups"],
+        report["phases"]["vote"]["groups"],
+    ) == (
+        13,
+        13,
+    ), "Voter operations must be packed into groups of the configured size."
+    assert (
+        report["phases"]["register"]["fees"] == 2 * MIN_TXN_FEE * config.num_voters
+    ), "Register fees must match."
+    assert json.loads(json.dumps(report)) == report, "Report must be JSON serializable."
+
+
+# Test case: A localnet load reports throughput, confirmation latency, fees and telemetry opcode usage per phase
+def test_localnet_load(algorand: AlgorandClient) -> None:
+    report = load_report(
+        "localnet", LOAD_CONFIG, run_localnet_load(algorand, LOAD_CONFIG)
+    )
+
+    # Log
+    logger.info(f"Load report: {json.dumps(report)}")
+
+    if LOAD_REPORT_PATH:
+        Path(LOAD_REPORT_PATH).write_text(json.dumps(report, indent=2) + "\n")
+
+    for phase, figures in report["phases"].items():
+        assert (
+            figures["operations"] == LOAD_CONFIG.num_voters
+        ), f"Every voter must go through the {phase} phase."
+        assert (
+            figures["ops_per_round"] > 0
+        ), f"{phase} operations per round must be measured."
+        assert (
+            figures["fees"] >= MIN_TXN_FEE * figures["groups"]
+        ), f"{phase} fees must be collected from blocks."
+        assert (
+            figures["opcode_cost"] > 0
+        ), f"{phase} opcode usage must be decoded from telemetry logs."
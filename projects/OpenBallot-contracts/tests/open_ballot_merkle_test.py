@@ -0,0 +1,227 @@
+# tests/open_ballot_merkle_test.py
+import os
+import time
+
+import pytest
+from algokit_utils import TransactionParameters
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient
+
+from smart_contracts.artifacts.open_ballot.open_ballot_client import OpenBallotClient
+from smart_contracts.open_ballot.boxes import (
+    TALLY_BOX_KEY,
+    choices_box_name,
+    encode_choices_page,
+    get_choice_tallies,
+    voter_box_name,
+)
+from smart_contracts.open_ballot.merkle import (
+    EligibilityTree,
+    compute_root,
+    leaf_hash,
+    nullifier_box_name,
+    nullifier_page,
+    nullifier_pages_needed,
+)
+
+from ._helpers.test_utils import setup_logger, setup_stxn, simulate_opcode_cost
+
+# Setup the logging.Logger
+logger = setup_logger()
+
+# Poll choices used by every proof voting poll created in this test module
+poll_choices = [b"MyChoice1", b"MyChoice2", b"MyChoice3"]
+
+
+# Helper function: Create an OpenBallot app set up for proof voting with given eligibility root and nullifier pages
+def create_proof_poll(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    eligibility_root: bytes,
+    num_pages: int,
+) -> OpenBallotClient:
+
+    app_client = OpenBallotClient(
+        algod_client=algorand.client.algod,
+        sender=creator.address,
+        signer=creator.signer,
+        template_values={
+            "DELETABLE": 1,
+            "TELEMETRY": 0,
+            "VERSION_UNIX": int(time.time()),
+        },
+    )
+    app_client.create_generate()
+
+    # Set up poll, fund app MBR, add poll choices and allocate nullifier pages in a single Atomic Transaction
+    app_client.compose().set_poll(
+        title=b"MyTitle",
+        num_choices=len(poll_choices),
+        eligibility_root=eligibility_root,
+        start_date_unix=1739871607,
+        end_date_unix=1740735607,
+    ).fund_app_mbr(
+        mbr_pay=setup_stxn(
+            algorand, creator, app_client.app_address, 129_000
+        ),  # 100_000 (Global.min_balance) + 16_100 (Box a_ fee) + 12_900 (Box t_ fee)
+        transaction_parameters=TransactionParameters(
+            boxes=[(0, voter_box_name(creator.address)), (0, TALLY_BOX_KEY)]
+        ),
+    ).add_poll_choices(
+        choices=poll_choices,
+        mbr_pay=setup_stxn(
+            algorand,
+            creator,
+            app_client.app_address,
+            2_500 + 400 * (3 + len(encode_choices_page(poll_choices))),
+        ),  # Box c_ fee
+        transaction_parameters=TransactionParameters(boxes=[(0, choices_box_name(0))]),
+    ).allocate_nullifier_pages(
+        num_pages=num_pages,
+        mbr_pay=setup_stxn(
+            algorand, creator, app_client.app_address, num_pages * 413_700
+        ),  # Box n_ fee of 413,700 micro Algos per page
+        transaction_parameters=TransactionParameters(
+            boxes=[(0, nullifier_box_name(page)) for page in range(num_pages)]
+        ),
+    ).execute()
+
+    return app_client
+
+
+# Helper function: Return a proof vote client for a voter of an existing proof voting app
+def voter_client(
+    algorand: AlgorandClient, app_client: OpenBallotClient, voter: AddressAndSigner
+) -> OpenBallotClient:
+    return OpenBallotClient(
+        algod_client=algorand.client.algod,
+        sender=voter.address,
+        signer=voter.signer,
+        app_id=app_client.app_id,
+    )
+
+
+# Helper function: Return the transaction parameters of a proof vote (fee covers the opcode budget top ups)
+def proof_vote_parameters(
+    algorand: AlgorandClient, leaf_index: int
+) -> TransactionParameters:
+    sp = algorand.get_suggested_params()
+    sp.flat_fee = True
+    # Outer transaction fee + up to 3 opcode budget top up inner transactions
+    sp.fee = 4_000
+
+    return TransactionParameters(
+        suggested_params=sp,
+        boxes=[(0, TALLY_BOX_KEY), (0, nullifier_box_name(nullifier_page(leaf_index)))],
+    )
+
+
+# Generate a creator account for testing and fund it with some ALGO via the dispenser account
+@pytest.fixture(scope="module")
+def creator(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AddressAndSigner:
+    creator = algorand.account.random()
+    algorand.send.payment(setup_stxn(algorand, dispenser, creator.address, 50_000_000))
+    return creator
+
+
+# Create a list of funded eligible voter accounts
+@pytest.fixture(scope="module")
+def voters(
+    algorand: AlgorandClient, dispenser: AddressAndSigner
+) -> list[AddressAndSigner]:
+    voters = [algorand.account.random() for _ in range(5)]
+    for voter in voters:
+        algorand.send.payment(setup_stxn(algorand, dispenser, voter.address, 1_000_000))
+
+    return voters
+
+
+# Test case: Eligible voters vote with a single proof transaction each, double votes and outsiders are rejected
+def test_submit_vote_with_proof(
+    algorand: AlgorandClient,
+    dispenser: AddressAndSigner,
+    creator: AddressAndSigner,
+    voters: list[AddressAndSigner],
+) -> None:
+
+    # Build the eligibility tree off-chain and commit its root in 'set_poll'
+    tree = EligibilityTree([voter.address for voter in voters])
+    app_client = create_proof_poll(
+        algorand, creator, tree.root, nullifier_pages_needed(len(voters))
+    )
+
+    # Every eligible voter votes with one transaction (no box storage request needed)
+    for voter, choice in zip(voters, [1, 3, 3, 2, 3]):
+        leaf_index, proof = tree.proof(voter.address)
+        voter_client(algorand, app_client, voter).submit_vote_with_proof(
+            choice=choice,
+            leaf_index=leaf_index,
+            proof=list(proof),
+            transaction_parameters=proof_vote_parameters(algorand, leaf_index),
+        )
+
+    assert get_choice_tallies(app_client) == [
+        1,
+        1,
+        3,
+    ], "Choice tallies must match the proof votes."
+
+    # Voting twice with the same leaf index is rejected by the nullifier bitmap
+    leaf_index, proof = tree.proof(voters[0].address)
+    with pytest.raises(Exception, match="already submitted a vote"):
+        voter_client(algorand, app_client, voters[0]).submit_vote_with_proof(
+            choice=1,
+            leaf_index=leaf_index,
+            proof=list(proof),
+            transaction_parameters=proof_vote_parameters(algorand, leaf_index),
+        )
+
+    # An address outside of the tree can not reuse an eligible voter's proof
+    outsider = algorand.account.random()
+    algorand.send.payment(setup_stxn(algorand, dispenser, outsider.address, 1_000_000))
+    with pytest.raises(Exception, match="Merkle proof does not match"):
+        voter_client(algorand, app_client, outsider).submit_vote_with_proof(
+            choice=1,
+            leaf_index=leaf_index,
+            proof=list(proof),
+            transaction_parameters=proof_vote_parameters(algorand, leaf_index),
+        )
+
+
+# Test case: Benchmark 'submit_vote_with_proof' opcode cost for proof depths 1 to 20
+def test_submit_vote_with_proof_opcode_cost(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    voters: list[AddressAndSigner],
+) -> None:
+
+    voter = voters[0]
+    costs = {}
+    for depth in range(1, 21):
+        # Root of a tree of given depth where the voter is leaf 0 (siblings are random, cost only depends on depth)
+        proof = [os.urandom(32) for _ in range(depth)]
+        app_client = create_proof_poll(
+            algorand, creator, compute_root(leaf_hash(voter.address), 0, proof), 1
+        )
+
+        costs[depth] = sum(
+            simulate_opcode_cost(
+                voter_client(algorand, app_client, voter)
+                .compose()
+                .submit_vote_with_proof(
+                    choice=1,
+                    leaf_index=0,
+                    proof=proof,
+                    transaction_parameters=proof_vote_parameters(algorand, 0),
+                )
+            )
+        )
+
+    # Log
+    for depth, cost in costs.items():
+        logger.info(f"submit_vote_with_proof depth {depth}: opcode cost {cost}")
+
+    # Cost grows with every proof level (one sha256 per level)
+    assert all(
+        costs[depth] < costs[depth + 1] for depth in range(1, 20)
+    ), "Proof vote opcode cost must grow with proof depth."
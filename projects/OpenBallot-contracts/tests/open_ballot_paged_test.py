@@ -0,0 +1,390 @@
+# tests/open_ballot_paged_test.py
+import json
+import time
+
+import pytest
+from algokit_utils import LogicError, TransactionParameters
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient
+from algosdk.encoding import decode_address, encode_address
+
+from smart_contracts.artifacts.open_ballot.open_ballot_client import OpenBallotClient
+from smart_contracts.open_ballot.boxes import (
+    TALLY_BOX_KEY,
+    VOTER_PAGE_SLOTS,
+    choices_box_name,
+    encode_choices_page,
+    get_choice_tallies,
+    paged_voter_slot,
+    voter_box_name,
+    voter_page_box_name,
+    voter_pages_needed,
+    voter_slot_page,
+)
+
+from ._helpers.test_utils import setup_logger, setup_stxn, simulate_opcode_cost
+
+# Setup the logging.Logger
+logger = setup_logger()
+
+# Poll choices used by the paged voters poll
+poll_choices = [b"MyChoice1", b"MyChoice2", b"MyChoice3"]
+
+# Voter slots that get funded and vote, spread across the first, second and third voter page
+voting_slots = {
+    0: 1,
+    VOTER_PAGE_SLOTS - 1: 3,
+    VOTER_PAGE_SLOTS: 3,
+    2 * VOTER_PAGE_SLOTS: 2,
+}
+
+# Deploy-time template values, voter clients use the same values so logic errors map back to the TEAL source
+TEMPLATE_VALUES = {"DELETABLE": 1, "TELEMETRY": 0, "VERSION_UNIX": int(time.time())}
+
+# Box storage MBR figures in micro Algos
+BOX_A_FEE = 16_100  # 2_500 + 400 * (33 + 1)
+BOX_P_FEE = 413_300  # 2_500 + 400 * (4 + 1_023)
+
+
+# Helper function: Return an app client for a voter of an existing app
+def voter_client(
+    algorand: AlgorandClient, app_client: OpenBallotClient, voter: AddressAndSigner
+) -> OpenBallotClient:
+    return OpenBallotClient(
+        algod_client=algorand.client.algod,
+        sender=voter.address,
+        signer=voter.signer,
+        app_id=app_client.app_id,
+        template_values=TEMPLATE_VALUES,
+    )
+
+
+# Generate a creator account for testing and fund it with some ALGO via the dispenser account
+@pytest.fixture(scope="module")
+def creator(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AddressAndSigner:
+    creator = algorand.account.random()
+    algorand.send.payment(setup_stxn(algorand, dispenser, creator.address, 50_000_000))
+    return creator
+
+
+# Create a list of voter accounts sorted by address (registration order), only the voting slots are funded since the
+# rest never send a transaction
+@pytest.fixture(scope="module")
+def voters(
+    algorand: AlgorandClient, dispenser: AddressAndSigner
+) -> list[AddressAndSigner]:
+    voters = sorted(
+        (algorand.account.random() for _ in range(2 * VOTER_PAGE_SLOTS + 5)),
+        key=lambda voter: decode_address(voter.address),
+    )
+    for slot in [*voting_slots, len(voters) - 1]:  # Last voter is kept for benchmarks
+        algorand.send.payment(
+            setup_stxn(algorand, dispenser, voters[slot].address, 1_000_000)
+        )
+
+    return voters
+
+
+# Helper function: Create an app with a set up poll (box storage voting) and return its creator app client
+def create_poll_app(
+    algorand: AlgorandClient, creator: AddressAndSigner
+) -> OpenBallotClient:
+    app_client = OpenBallotClient(
+        algod_client=algorand.client.algod,
+        sender=creator.address,
+        signer=creator.signer,
+        template_values=TEMPLATE_VALUES,
+    )
+    app_client.create_generate()
+
+    # Voting period starts now and lasts 7 days (box storage can only be funded before the end date)
+    start_date_unix = int(time.time())
+    app_client.compose().set_poll(
+        title=b"MyTitle",
+        num_choices=len(poll_choices),
+        eligibility_root=b"",
+        start_date_unix=start_date_unix,
+        end_date_unix=start_date_unix + 7 * 24 * 60 * 60,
+    ).fund_app_mbr(
+        mbr_pay=setup_stxn(
+            algorand, creator, app_client.app_address, 129_000
+        ),  # 100_000 (Global.min_balance) + 16_100 (Box a_ fee) + 12_900 (Box t_ fee)
+        transaction_parameters=TransactionParameters(
+            boxes=[(0, voter_box_name(creator.address)), (0, TALLY_BOX_KEY)]
+        ),
+    ).add_poll_choices(
+        choices=poll_choices,
+        mbr_pay=setup_stxn(
+            algorand,
+            creator,
+            app_client.app_address,
+            2_500 + 400 * (3 + len(encode_choices_page(poll_choices))),
+        ),  # Box c_ fee
+        transaction_parameters=TransactionParameters(boxes=[(0, choices_box_name(0))]),
+    ).execute()
+
+    return app_client
+
+
+# Create the app used for paged voting
+@pytest.fixture(scope="module")
+def app_client(algorand: AlgorandClient, creator: AddressAndSigner) -> OpenBallotClient:
+    return create_poll_app(algorand, creator)
+
+
+# Create the app used as box a_ storage reference in benchmarks
+@pytest.fixture(scope="module")
+def box_app_client(
+    algorand: AlgorandClient, creator: AddressAndSigner
+) -> OpenBallotClient:
+    return create_poll_app(algorand, creator)
+
+
+# Test case: Creator registers paged voters page by page, voters vote through their slot, double votes are rejected
+def test_register_paged_voters_and_vote(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    app_client: OpenBallotClient,
+    voters: list[AddressAndSigner],
+) -> None:
+
+    # Register voters in batches of a single page each (last batch starts a third, partially filled page)
+    for start in range(0, len(voters), VOTER_PAGE_SLOTS):
+        batch = voters[start : start + VOTER_PAGE_SLOTS]
+        new_pages = voter_pages_needed(start + len(batch)) - voter_pages_needed(start)
+        app_client.register_paged_voters(
+            voters=[voter.address for voter in batch],
+            mbr_pay=setup_stxn(
+                algorand, creator, app_client.app_address, new_pages * BOX_P_FEE
+            ),
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_page_box_name(voter_slot_page(start)))]
+            ),
+        )
+
+    global_state = app_client.get_global_state()
+    assert global_state.total_paged_voters == len(
+        voters
+    ), "Every voter must have a slot."
+    assert global_state.poll_voter_pages == voter_pages_needed(
+        len(voters)
+    ), "Voter pages must match the voters."
+
+    # Voters in the first, second and third page vote through their slot (index in the sorted allowlist)
+    registered = [voter.address for voter in voters]
+    for slot, choice in voting_slots.items():
+        assert paged_voter_slot(registered, voters[slot].address) == slot
+        voter_client(algorand, app_client, voters[slot]).submit_paged_vote(
+            choice=choice,
+            slot=slot,
+            transaction_parameters=TransactionParameters(
+                boxes=[
+                    (0, voter_page_box_name(voter_slot_page(slot))),
+                    (0, TALLY_BOX_KEY),
+                ]
+            ),
+        )
+
+    assert get_choice_tallies(app_client) == [
+        1,
+        1,
+        2,
+    ], "Choice tallies must match the paged votes."
+
+    # A voter can not vote twice nor vote through another voter's slot
+    rejections = {
+        0: "Transaction sender address already submitted a vote.",
+        1: "Transaction sender address must match the address of the voter slot.",
+    }
+    for slot, message in rejections.items():
+        with pytest.raises(LogicError, match=message):
+            voter_client(algorand, app_client, voters[0]).submit_paged_vote(
+                choice=1,
+                slot=slot,
+                transaction_parameters=TransactionParameters(
+                    boxes=[(0, voter_page_box_name(0)), (0, TALLY_BOX_KEY)]
+                ),
+            )
+
+
+# Test case: Already registered and unsorted addresses can not be registered, so every voter holds a single slot
+def test_register_paged_voters_rejects_duplicates(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    app_client: OpenBallotClient,
+    voters: list[AddressAndSigner],
+) -> None:
+
+    next_page = voter_pages_needed(len(voters))
+    batches = {
+        "already registered": [voters[0].address],
+        "duplicate": [encode_address(b"\xff" * 32)] * 2,
+        "unsorted": [
+            encode_address(b"\xff" * 32),
+            encode_address(b"\xff" * 31 + b"\xfe"),
+        ],
+    }
+    for name, batch in batches.items():
+        with pytest.raises(LogicError, match="strictly increasing order"):
+            app_client.register_paged_voters(
+                voters=batch,
+                mbr_pay=setup_stxn(
+                    algorand, creator, app_client.app_address, BOX_P_FEE
+                ),
+                transaction_parameters=TransactionParameters(
+                    boxes=[
+                        (0, voter_page_box_name(next_page - 1)),
+                        (0, voter_page_box_name(next_page)),
+                    ]
+                ),
+            )
+        logger.info(f"Rejected {name} paged voter batch.")
+
+    assert app_client.get_global_state().total_paged_voters == len(
+        voters
+    ), "Rejected batches must not take a voter slot."
+
+
+# Test case: Benchmark box storage MBR, opcode cost and box references per 10k voters of box a_ vs voter page storage
+def test_paged_voter_storage_benchmark(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    app_client: OpenBallotClient,
+    box_app_client: OpenBallotClient,
+    voters: list[AddressAndSigner],
+) -> None:
+
+    num_voters = 10_000
+    benchmark_voter = voters[-1]
+    benchmark_client = voter_client(algorand, app_client, benchmark_voter)
+    benchmark_slot = len(voters) - 1
+
+    # Opcode cost of registering a single box a_ voter vs a full page of paged voters (per voter)
+    box_register_cost = sum(
+        simulate_opcode_cost(
+            voter_client(algorand, box_app_client, benchmark_voter)
+            .compose()
+            .request_box_storage(
+                mbr_pay=setup_stxn(
+                    algorand, benchmark_voter, box_app_client.app_address, BOX_A_FEE
+                ),
+                transaction_parameters=TransactionParameters(
+                    boxes=[(0, voter_box_name(benchmark_voter.address))]
+                ),
+            )
+        )
+    )
+    next_page = voter_pages_needed(len(voters))
+    paged_register_cost = (
+        sum(
+            simulate_opcode_cost(
+                app_client.compose().register_paged_voters(
+                    # Addresses above any random voter address, registration requires increasing addresses
+                    voters=[
+                        encode_address(b"\xff" * 31 + bytes([slot]))
+                        for slot in range(VOTER_PAGE_SLOTS)
+                    ],
+                    # Batch fills up the last partially filled page and starts a new page
+                    mbr_pay=setup_stxn(
+                        algorand, creator, app_client.app_address, BOX_P_FEE
+                    ),
+                    transaction_parameters=TransactionParameters(
+                        boxes=[
+                            (0, voter_page_box_name(next_page - 1)),
+                            (0, voter_page_box_name(next_page)),
+                        ]
+                    ),
+                )
+            )
+        )
+        / VOTER_PAGE_SLOTS
+    )
+
+    # Opcode cost of a single vote with box a_ (creator box) vs voter page storage
+    box_vote_cost = sum(
+        simulate_opcode_cost(
+            box_app_client.compose().submit_vote(
+                choice=1,
+                transaction_parameters=TransactionParameters(
+                    boxes=[(0, voter_box_name(creator.address)), (0, TALLY_BOX_KEY)]
+                ),
+            )
+        )
+    )
+    paged_vote_cost = sum(
+        simulate_opcode_cost(
+            benchmark_client.compose().submit_paged_vote(
+                choice=1,
+                slot=benchmark_slot,
+                transaction_parameters=TransactionParameters(
+                    boxes=[
+                        (0, voter_page_box_name(voter_slot_page(benchmark_slot))),
+                        (0, TALLY_BOX_KEY),
+                    ]
+                ),
+            )
+        )
+    )
+
+    # Side by side figures per 10k voters (register, vote and purge every voter once)
+    num_pages = voter_pages_needed(num_voters)
+    benchmark = {
+        "box_a_": {
+            "mbr": num_voters * BOX_A_FEE,
+            "opcode_cost": num_voters * (box_register_cost + box_vote_cost),
+            "box_refs": num_voters * 4,  # request (a_), vote (a_ + t_), purge (a_)
+        },
+        "voter_pages": {
+            "mbr": num_pages * BOX_P_FEE,
+            "opcode_cost": int(num_voters * (paged_register_cost + paged_vote_cost)),
+            # register (p_ per page), vote (p_ + t_), purge (p_ per page)
+            "box_refs": num_pages * 2 + num_voters * 2,
+        },
+    }
+
+    # Log
+    logger.info(
+        f"Voter storage benchmark per {num_voters} voters: {json.dumps(benchmark)}"
+    )
+
+    assert (
+        benchmark["voter_pages"]["mbr"] < benchmark["box_a_"]["mbr"]
+    ), "Voter pages must need less box storage MBR than box a_ per voter."
+    assert (
+        benchmark["voter_pages"]["box_refs"] < benchmark["box_a_"]["box_refs"]
+    ), "Voter pages must need fewer box references than box a_ per voter."
+
+
+# Test case: Creator purges every voter page and deletes the app
+def test_purge_voter_pages_and_terminate(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    app_client: OpenBallotClient,
+) -> None:
+
+    num_pages = app_client.get_global_state().poll_voter_pages
+    app_client.purge_voter_pages(
+        num_pages=num_pages,
+        transaction_parameters=TransactionParameters(
+            boxes=[(0, voter_page_box_name(page)) for page in range(num_pages)]
+        ),
+    )
+
+    global_state = app_client.get_global_state()
+    assert global_state.poll_voter_pages == 0, "Every voter page must be purged."
+    assert (
+        global_state.total_paged_voters == 0
+    ), "No voter slot must be left once every page is purged."
+
+    delete_txn = app_client.delete_terminate(
+        transaction_parameters=TransactionParameters(
+            boxes=[
+                (0, voter_box_name(creator.address)),
+                (0, TALLY_BOX_KEY),
+                (0, choices_box_name(0)),
+            ]
+        )
+    )
+    assert (
+        delete_txn.confirmed_round
+    ), "delete_txn transaction round needs confirmation."
@@ -0,0 +1,296 @@
+# tests/open_ballot_registry_test.py
+import base64
+import time
+
+import pytest
+from algokit_utils import TransactionParameters
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient
+from algosdk.abi import ABIType
+from algosdk.encoding import decode_address
+
+from smart_contracts.artifacts.open_ballot_registry.open_ballot_registry_client import (
+    OpenBallotRegistryClient,
+)
+from smart_contracts.open_ballot.boxes import decode_tallies
+from smart_contracts.open_ballot.events import decode_logs
+
+from ._helpers.test_utils import setup_logger, setup_stxn
+
+# Setup the logging.Logger
+logger = setup_logger()
+
+# ARC-4 type of the PollData struct stored in box p_
+poll_data_type = ABIType.from_string("(address,uint64,uint64,byte[],byte[][])")
+
+# Poll data used by every poll created in this test module
+poll_title = b"MyTitle"
+poll_choices = [b"MyChoice1", b"MyChoice2", b"MyChoice3"]
+poll_start_date_unix = 1739871607
+poll_end_date_unix = 1740735607
+
+
+# Helper function: Return the box name of a registry poll box with given key prefix and poll id
+def poll_box_name(key_prefix: bytes, poll_id: int) -> bytes:
+    return key_prefix + poll_id.to_bytes(8, "big")
+
+
+# Helper function: Return the box name of a registry voter data box for given poll id and address
+def voter_box_name(poll_id: int, address: str) -> bytes:
+    return poll_box_name(b"v_", poll_id) + decode_address(address)
+
+
+# Helper function: Read the poll state box and return (live voter boxes, purged voter boxes, choice tallies)
+def read_poll_state(
+    algorand: AlgorandClient, app_id: int, poll_id: int
+) -> tuple[int, int, list[int]]:
+    box = algorand.client.algod.application_box_by_name(
+        app_id, poll_box_name(b"t_", poll_id)
+    )
+    poll_state = decode_tallies(base64.b64decode(box["value"]))
+    return poll_state[0], poll_state[1], poll_state[2:]
+
+
+# Generate a creator account for testing and fund it with some ALGO via the dispenser account
+@pytest.fixture(scope="module")
+def creator(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AddressAndSigner:
+    creator = algorand.account.random()
+    algorand.send.payment(setup_stxn(algorand, dispenser, creator.address, 50_000_000))
+    return creator
+
+
+# Create a list of funded voter accounts
+@pytest.fixture(scope="module")
+def voters(
+    algorand: AlgorandClient, dispenser: AddressAndSigner
+) -> list[AddressAndSigner]:
+    voters = [algorand.account.random() for _ in range(4)]
+    for voter in voters:
+        algorand.send.payment(
+            setup_stxn(algorand, dispenser, voter.address, 10_000_000)
+        )
+
+    return voters
+
+
+# Create the registry app with the creator account and return an app client for the creator and every voter
+@pytest.fixture(scope="module")
+def registry_clients(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    voters: list[AddressAndSigner],
+) -> dict[str, OpenBallotRegistryClient]:
+    template_values = {"DELETABLE": 1, "TELEMETRY": 0, "VERSION_UNIX": int(time.time())}
+    registry_clients = {
+        creator.address: OpenBallotRegistryClient(
+            algod_client=algorand.client.algod,
+            sender=creator.address,
+            signer=creator.signer,
+            template_values=template_values,
+        )
+    }
+
+    # Create the app and fund its Global minimum balance
+    create_txn = registry_clients[creator.address].create_generate()
+    assert (
+        create_txn.confirmed_round
+    ), "create_txn transaction round needs confirmation."
+
+    registry_clients[creator.address].fund_app_mbr(
+        mbr_pay=setup_stxn(
+            algorand, creator, registry_clients[creator.address].app_address, 100_000
+        )
+    )
+
+    # Every voter interacts with the same app through their own client
+    for voter in voters:
+        registry_clients[voter.address] = OpenBallotRegistryClient(
+            algod_client=algorand.client.algod,
+            sender=voter.address,
+            signer=voter.signer,
+            app_id=registry_clients[creator.address].app_id,
+            template_values=template_values,
+        )
+
+    return registry_clients
+
+
+# Test case: Creator launches two polls on the same app, each with a single 'create_poll' call
+def test_create_poll(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    registry_clients: dict[str, OpenBallotRegistryClient],
+) -> None:
+
+    app_client = registry_clients[creator.address]
+    poll_data_size = len(
+        poll_data_type.encode(
+            [
+                creator.address,
+                poll_start_date_unix,
+                poll_end_date_unix,
+                poll_title,
+                poll_choices,
+            ]
+        )
+    )
+    poll_mbr = (2_500 + 400 * (10 + poll_data_size)) + (
+        2_500 + 400 * (10 + 16 + 8 * len(poll_choices))
+    )  # Box p_ fee + Box t_ fee
+
+    for expected_poll_id in (1, 2):
+        create_poll_txn = app_client.create_poll(
+            title=poll_title,
+            choices=poll_choices,
+            start_date_unix=poll_start_date_unix,
+            end_date_unix=poll_end_date_unix,
+            mbr_pay=setup_stxn(algorand, creator, app_client.app_address, poll_mbr),
+            transaction_parameters=TransactionParameters(
+                boxes=[
+                    (0, poll_box_name(b"p_", expected_poll_id)),
+                    (0, poll_box_name(b"t_", expected_poll_id)),
+                ],
+                note="abi:create_poll",
+            ),
+        )
+        assert (
+            create_poll_txn.return_value == expected_poll_id
+        ), "create_poll must return the next poll id."
+        assert read_poll_state(algorand, app_client.app_id, expected_poll_id) == (
+            0,
+            0,
+            [0, 0, 0],
+        ), "Poll state must start zeroed."
+
+    # Log
+    logger.info(f"Registry Global State: {vars(app_client.get_global_state())}")
+
+
+# Test case: Voters request box storage and vote in both polls hosted by the same app
+def test_register_and_vote(
+    algorand: AlgorandClient,
+    voters: list[AddressAndSigner],
+    registry_clients: dict[str, OpenBallotRegistryClient],
+) -> None:
+
+    votes = [(1, voters[0], 1), (1, voters[1], 3), (1, voters[2], 3), (2, voters[0], 2)]
+    for poll_id, voter, choice in votes:
+        app_client = registry_clients[voter.address]
+        boxes = [
+            (0, poll_box_name(b"p_", poll_id)),
+            (0, poll_box_name(b"t_", poll_id)),
+            (0, voter_box_name(poll_id, voter.address)),
+        ]
+
+        req_box_txn = app_client.request_box_storage(
+            poll_id=poll_id,
+            # Box v_ fee
+            mbr_pay=setup_stxn(algorand, voter, app_client.app_address, 19_700),
+            transaction_parameters=TransactionParameters(boxes=boxes),
+        )
+        assert (
+            req_box_txn.confirmed_round
+        ), "req_box_txn transaction round needs confirmation."
+
+        submit_vote_txn = app_client.submit_vote(
+            poll_id=poll_id,
+            choice=choice,
+            transaction_parameters=TransactionParameters(boxes=boxes[1:]),
+        )
+        assert (
+            submit_vote_txn.confirmed_round
+        ), "submit_vote_txn transaction round needs confirmation."
+
+        # Voter registered and vote cast events carry the poll id
+        txn_events = [
+            event
+            for tx_id in (req_box_txn.tx_id, submit_vote_txn.tx_id)
+            for event in decode_logs(
+                algorand.client.algod.pending_transaction_info(tx_id)["logs"]
+            )
+        ]
+        assert [(event.name, event.args) for event in txn_events] == [
+            ("PollVoterRegistered", {"poll_id": poll_id, "voter": voter.address}),
+            (
+                "PollVoteCast",
+                {"poll_id": poll_id, "voter": voter.address, "choice": choice},
+            ),
+        ], "request_box_storage and submit_vote must emit PollVoterRegistered and PollVoteCast events."
+        assert (
+            txn_events[1].seq == txn_events[0].seq + 1
+        ), "Event sequence numbers must increase by one."
+
+    app_id = registry_clients[voters[0].address].app_id
+    assert read_poll_state(algorand, app_id, 1) == (
+        3,
+        0,
+        [1, 0, 2],
+    ), "Poll 1 state must match its votes."
+    assert read_poll_state(algorand, app_id, 2) == (
+        1,
+        0,
+        [0, 1, 0],
+    ), "Poll 2 state must match its votes."
+
+
+# Test case: One voter deletes their box, poll creator purges the rest and closes both polls, then app is deleted
+def test_purge_close_and_terminate(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    voters: list[AddressAndSigner],
+    registry_clients: dict[str, OpenBallotRegistryClient],
+) -> None:
+
+    app_client = registry_clients[creator.address]
+
+    # Voter deletes their poll 1 box and gets their MBR refunded
+    registry_clients[voters[0].address].delete_box_storage(
+        poll_id=1,
+        transaction_parameters=TransactionParameters(
+            boxes=[
+                (0, poll_box_name(b"t_", 1)),
+                (0, voter_box_name(1, voters[0].address)),
+            ]
+        ),
+    )
+
+    # Poll creator purges the remaining voter boxes of each poll and closes it
+    for poll_id, poll_voters in ((1, voters[1:3]), (2, voters[:1])):
+        app_client.purge_box_storage(
+            poll_id=poll_id,
+            box_keys=[voter.address for voter in poll_voters],
+            transaction_parameters=TransactionParameters(
+                boxes=[
+                    (0, poll_box_name(b"p_", poll_id)),
+                    (0, poll_box_name(b"t_", poll_id)),
+                    *[
+                        (0, voter_box_name(poll_id, voter.address))
+                        for voter in poll_voters
+                    ],
+                ]
+            ),
+        )
+        assert read_poll_state(algorand, app_client.app_id, poll_id)[:2] == (
+            0,
+            len(poll_voters),
+        ), "Purged voter boxes must move from the live to the purged total."
+
+        app_client.close_poll(
+            poll_id=poll_id,
+            transaction_parameters=TransactionParameters(
+                boxes=[
+                    (0, poll_box_name(b"p_", poll_id)),
+                    (0, poll_box_name(b"t_", poll_id)),
+                ]
+            ),
+        )
+
+    assert (
+        algorand.client.algod.application_boxes(app_client.app_id)["boxes"] == []
+    ), "No box must be left once every poll is closed."
+
+    # Delete the app, the remainder of the app balance is closed to the creator
+    delete_txn = app_client.delete_terminate()
+    assert (
+        delete_txn.confirmed_round
+    ), "delete_txn transaction round needs confirmation."
@@ -0,0 +1,343 @@
+# tests/open_ballot_submitter_test.py
+import asyncio
+import threading
+import time
+
+import pytest
+from algokit_utils import TransactionParameters
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient
+from algosdk.error import AlgodHTTPError, ConfirmationTimeoutError
+from algosdk.transaction import SuggestedParams
+
+from smart_contracts.artifacts.open_ballot.open_ballot_client import OpenBallotClient
+from smart_contracts.open_ballot import confirmations
+from smart_contracts.open_ballot.boxes import (
+    TALLY_BOX_KEY,
+    choices_box_name,
+    encode_choices_page,
+    get_choice_tallies,
+    voter_box_name,
+)
+from smart_contracts.open_ballot.confirmations import ConfirmationWatcher
+from smart_contracts.open_ballot.params import SuggestedParamsCache
+from smart_contracts.open_ballot.submitter import VoteReceipt, VoteSubmitter
+
+from ._helpers.test_utils import setup_logger, setup_stxn
+
+# Setup the logging.Logger
+logger = setup_logger()
+
+# Number of voters voting through the submitter (several full groups plus a partial one)
+NUM_VOTERS = 72
+
+# Poll choices used by the submitter poll
+poll_choices = [b"MyChoice1", b"MyChoice2", b"MyChoice3"]
+
+# Box storage MBR figures in micro Algos
+BOX_A_FEE = 16_100  # 2_500 + 400 * (33 + 1)
+BOX_A_SPONSORED_FEE = 16_500  # 2_500 + 400 * (33 + 2), creator sponsored voters (VoterData + sponsor byte)
+BOX_C_FEE = 2_500 + 400 * (3 + len(encode_choices_page(poll_choices)))
+BOX_T_FEE = 12_900  # 2_500 + 400 * (2 + 8 * 3)
+
+
+# Generate a creator account and fund it with some ALGO via the dispenser account
+@pytest.fixture(scope="module")
+def creator(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AddressAndSigner:
+    creator = algorand.account.random()
+    algorand.send.payment(setup_stxn(algorand, dispenser, creator.address, 50_000_000))
+    return creator
+
+
+# Create a list of funded voter accounts
+@pytest.fixture(scope="module")
+def voters(
+    algorand: AlgorandClient, dispenser: AddressAndSigner
+) -> list[AddressAndSigner]:
+    voters = [algorand.account.random() for _ in range(NUM_VOTERS)]
+    for voter in voters:
+        algorand.send.payment(setup_stxn(algorand, dispenser, voter.address, 200_000))
+
+    return voters
+
+
+# Create an app with a set up poll and register every voter box through the creator sponsored 'register_voters'
+@pytest.fixture(scope="module")
+def app_client(
+    algorand: AlgorandClient, creator: AddressAndSigner, voters: list[AddressAndSigner]
+) -> OpenBallotClient:
+    app_client = OpenBallotClient(
+        algod_client=algorand.client.algod,
+        sender=creator.address,
+        signer=creator.signer,
+        template_values={
+            "DELETABLE": 1,
+            "TELEMETRY": 0,
+            "VERSION_UNIX": int(time.time()),
+        },
+    )
+    app_client.create_generate()
+    app_client.set_poll(
+        title=b"MyTitle",
+        num_choices=len(poll_choices),
+        eligibility_root=b"",
+        start_date_unix=1739871607,
+        end_date_unix=int(time.time()) + 24 * 60 * 60,
+    )
+    app_client.fund_app_mbr(
+        mbr_pay=setup_stxn(
+            algorand, creator, app_client.app_address, 100_000 + BOX_A_FEE + BOX_T_FEE
+        ),
+        transaction_parameters=TransactionParameters(
+            boxes=[(0, voter_box_name(creator.address)), (0, TALLY_BOX_KEY)]
+        ),
+    )
+    app_client.add_poll_choices(
+        choices=poll_choices,
+        mbr_pay=setup_stxn(algorand, creator, app_client.app_address, BOX_C_FEE),
+        transaction_parameters=TransactionParameters(boxes=[(0, choices_box_name(0))]),
+    )
+
+    # Register 8 voters per call (one box reference per voter)
+    for i in range(0, len(voters), 8):
+        batch = [voter.address for voter in voters[i : i + 8]]
+        app_client.register_voters(
+            voters=batch,
+            mbr_pay=setup_stxn(
+                algorand,
+                creator,
+                app_client.app_address,
+                len(batch) * BOX_A_SPONSORED_FEE,
+            ),
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_box_name(address)) for address in batch]
+            ),
+        )
+
+    return app_client
+
+
+# Test case: Votes submitted through the pipelined submitter are packed into groups and all of them get counted
+def test_pipelined_votes(
+    app_client: OpenBallotClient, voters: list[AddressAndSigner]
+) -> None:
+
+    async def submit_votes() -> list[VoteReceipt]:
+        async with VoteSubmitter(
+            app_client, group_size=16, max_in_flight=4
+        ) as submitter:
+            futures = [
+                submitter.submit(voter.address, voter.signer, i % len(poll_choices) + 1)
+                for i, voter in enumerate(voters[:-1])
+            ]
+            return await asyncio.gather(*futures)
+
+    start = time.perf_counter()
+    receipts = asyncio.run(submit_votes())
+    elapsed = time.perf_counter() - start
+
+    # Log
+    rounds = {receipt.confirmed_round for receipt in receipts}
+    logger.info(f"{len(receipts)} votes in {elapsed:.2f}s over {len(rounds)} rounds")
+
+    assert (
+        len({receipt.tx_id for receipt in receipts}) == len(voters) - 1
+    ), "Every vote must have its own receipt."
+    assert len(rounds) <= -(
+        -(len(voters) - 1) // 16
+    ), "Votes must be confirmed in groups of up to 16."
+    assert get_choice_tallies(app_client) == [
+        len(voters[:-1][choice :: len(poll_choices)])
+        for choice in range(len(poll_choices))
+    ], "Packed vote tally must count every pipelined vote."
+
+
+# Test case: A rejected group fails the future of every vote packed into it, other groups are unaffected
+def test_pipelined_rejected_group(
+    app_client: OpenBallotClient, voters: list[AddressAndSigner]
+) -> None:
+
+    async def submit_votes() -> list[VoteReceipt | BaseException]:
+        async with VoteSubmitter(app_client, group_size=1) as submitter:
+            futures = [
+                # Already voted
+                submitter.submit(voters[0].address, voters[0].signer, 1),
+                submitter.submit(voters[-1].address, voters[-1].signer, 2),
+            ]
+            return await asyncio.gather(*futures, return_exceptions=True)
+
+    double_vote, last_vote = asyncio.run(submit_votes())
+    assert isinstance(double_vote, Exception), "Double vote must fail its future."
+    assert isinstance(
+        last_vote, VoteReceipt
+    ), "Vote in a separate group must still be confirmed."
+
+
+# Test case: The shared watcher confirms many outstanding transactions from the blocks it follows
+def test_confirmation_watcher(
+    algorand: AlgorandClient, dispenser: AddressAndSigner, creator: AddressAndSigner
+) -> None:
+    watcher = ConfirmationWatcher.for_client(algorand.client.algod)
+    assert watcher is ConfirmationWatcher.for_client(
+        algorand.client.algod
+    ), "Watcher must be shared per algod client."
+
+    # Watch every payment before sending it (and a transaction that is never sent), then wait for all of them at once
+    payments = [
+        setup_stxn(algorand, dispenser, creator.address, 1_000 + i) for i in range(20)
+    ]
+    signed = [
+        payment.signer.sign_transactions([payment.txn], [0])[0] for payment in payments
+    ]
+    futures = [watcher.watch(payment.txn.get_txid()) for payment in payments]
+    never_sent = ConfirmationWatcher(algorand.client.algod, wait_rounds=2).watch(
+        "A" * 52
+    )
+    for stxn in signed:
+        algorand.client.algod.send_transaction(stxn)
+
+    confirmed_rounds = [future.result(timeout=60) for future in futures]
+    assert all(confirmed_rounds), "Every watched payment must be confirmed."
+
+    # An already scanned transaction resolves at once, the never sent one times out after its wait window
+    assert (
+        asyncio.run(watcher.confirmed(payments[0].txn.get_txid()))
+        == confirmed_rounds[0]
+    ), "Receipt must be cached."
+    with pytest.raises(ConfirmationTimeoutError):
+        never_sent.result(timeout=60)
+
+
+# Algod stand-in that commits a block per round and fails the first block requests with transient errors
+class FlakyAlgod:
+    def __init__(self, blocks: dict[int, list[str]], errors: list[Exception]) -> None:
+        self.blocks = blocks
+        self.errors = errors
+
+    def status(self) -> dict[str, int]:
+        return {"last-round": 1}
+
+    def status_after_block(self, round_num: int) -> dict[str, int]:
+        return {"last-round": round_num + 1}
+
+    def get_block_txids(self, round_num: int) -> dict[str, list[str]]:
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"blockTxids": self.blocks.get(round_num, [])}
+
+
+# Test case: Transient algod errors are retried, only futures past their last valid round fail
+def test_confirmation_watcher_transient_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(confirmations, "RETRY_BACKOFF", 0.0)
+    algod = FlakyAlgod(
+        blocks={2: ["TX2"], 4: ["TX4"]},
+        errors=[
+            AlgodHTTPError("round not available", 404),
+            TimeoutError("timed out"),
+            AlgodHTTPError("busy", 503),
+        ],
+    )
+    watcher = ConfirmationWatcher(algod)  # type: ignore[arg-type]
+
+    confirmed_late = watcher.watch("TX4", last_valid=6)
+    expired = watcher.watch("TX9", last_valid=3)
+    confirmed = watcher.watch("TX2", last_valid=3)
+
+    assert (
+        confirmed.result(timeout=10) == 2
+    ), "Transaction must be confirmed after the transient errors."
+    assert (
+        confirmed_late.result(timeout=10) == 4
+    ), "Transaction with a later last valid round must not fail early."
+    with pytest.raises(ConfirmationTimeoutError):
+        expired.result(timeout=10)
+
+
+# Test case: Transient algod errors lasting longer than the retry deadline fail pending futures with the last error,
+# the next watch follows blocks again
+def test_confirmation_watcher_retry_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(confirmations, "RETRY_BACKOFF", 0.001)
+    algod = FlakyAlgod(blocks={2: ["TX2"]}, errors=[AlgodHTTPError("busy", 503)] * 100)
+    watcher = ConfirmationWatcher(algod, retry_deadline=0.05)  # type: ignore[arg-type]
+
+    down = watcher.watch("TX1", last_valid=100)
+    with pytest.raises(AlgodHTTPError, match="busy"):
+        down.result(timeout=10)
+
+    algod.errors.clear()
+    assert (
+        watcher.watch("TX2", last_valid=100).result(timeout=10) == 2
+    ), "Watcher must follow blocks again once algod recovers."
+
+
+# Algod stand-in whose next round is committed by the test (a long poll returns once a round is committed)
+class SteppedAlgod:
+    def __init__(self, round_num: int) -> None:
+        self.round_num = round_num
+        self.committed = threading.Event()
+
+    def suggested_params(self) -> SuggestedParams:
+        return SuggestedParams(
+            fee=0,
+            first=self.round_num,
+            last=self.round_num + 1_000,
+            gh="",
+            flat_fee=False,
+        )
+
+    def status_after_block(self, round_num: int) -> dict[str, int]:
+        self.committed.wait()
+        self.committed.clear()
+        return {"last-round": self.round_num}
+
+    def commit_round(self) -> None:
+        self.round_num += 1
+        self.committed.set()
+
+
+# Test case: Suggested params are fetched again only once the last round moved past the cached round
+def test_suggested_params_cache_rounds() -> None:
+    algod = SteppedAlgod(10)
+    cache = SuggestedParamsCache(algod)  # type: ignore[arg-type]
+
+    assert {cache.suggested_params().first for _ in range(100)} == {
+        10
+    }, "Params must be served for the cached round."
+    assert (
+        cache.fetches == 1
+    ), "Params must be fetched once while the round does not move."
+
+    algod.commit_round()
+    deadline = time.monotonic() + 10
+    while cache.suggested_params().first != 11 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert (
+        cache.suggested_params().first == 11
+    ), "Params must be fetched again once a new round is committed."
+    assert cache.fetches == 2, "Params must be fetched at most once per round."
+
+
+# Test case: Building many payments takes their validity rounds from a handful of cached suggested params fetches
+def test_suggested_params_cache(
+    algorand: AlgorandClient, dispenser: AddressAndSigner, creator: AddressAndSigner
+) -> None:
+    cache = SuggestedParamsCache.for_client(algorand.client.algod)
+    fetches = cache.fetches
+
+    payments = [
+        setup_stxn(algorand, dispenser, creator.address, 1_000 + i)
+        for i in range(1_000)
+    ]
+    assert (
+        cache.fetches - fetches <= 5
+    ), "Building 1000 payments must only fetch suggested params a handful of times."
+    assert (
+        payments[0].txn.last_valid_round > algorand.client.algod.status()["last-round"]
+    ), "Payments built from cached params must still be valid."
+
+    # Every caller gets its own copy of the params
+    sp = cache.suggested_params()
+    sp.fee = 123_456
+    assert (
+        cache.suggested_params().fee != 123_456
+    ), "Changing a returned copy must not change the cached params."
@@ -0,0 +1,252 @@
+# tests/open_ballot_telemetry_test.py
+import base64
+import time
+
+import pytest
+from algokit_utils import TransactionParameters
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient
+
+from smart_contracts.artifacts.open_ballot.open_ballot_client import (
+    OpenBallotClient,
+    SimulateOptions,
+)
+from smart_contracts.open_ballot.boxes import (
+    TALLY_BOX_KEY,
+    choices_box_name,
+    encode_choices_page,
+    voter_box_name,
+)
+from smart_contracts.open_ballot.telemetry import (
+    collect_block_samples,
+    decode_telemetry,
+    group_samples,
+    method_names,
+    summarize,
+)
+
+from ._helpers.test_utils import setup_logger, setup_stxn
+
+# Setup the logging.Logger
+logger = setup_logger()
+
+# Poll choices used by every telemetry poll
+poll_choices = [b"MyChoice1", b"MyChoice2", b"MyChoice3"]
+
+
+# Helper function: Create an OpenBallot app with given telemetry template value and return its client
+def create_app(
+    algorand: AlgorandClient, creator: AddressAndSigner, telemetry: int
+) -> OpenBallotClient:
+
+    app_client = OpenBallotClient(
+        algod_client=algorand.client.algod,
+        sender=creator.address,
+        signer=creator.signer,
+        template_values={
+            "DELETABLE": 1,
+            "TELEMETRY": telemetry,
+            "VERSION_UNIX": int(time.time()),
+        },
+    )
+    app_client.create_generate()
+
+    return app_client
+
+
+# Helper function: Return a client of an existing app for given voter
+def voter_client(
+    algorand: AlgorandClient, app_client: OpenBallotClient, voter: AddressAndSigner
+) -> OpenBallotClient:
+    return OpenBallotClient(
+        algod_client=algorand.client.algod,
+        sender=voter.address,
+        signer=voter.signer,
+        app_id=app_client.app_id,
+    )
+
+
+# Helper function: Return the telemetry samples of a confirmed transaction group from its pending transaction info
+def txn_group_samples(algorand: AlgorandClient, tx_ids: list[str], app_id: int) -> list:
+    txn_infos = [
+        algorand.client.algod.pending_transaction_info(tx_id) for tx_id in tx_ids
+    ]
+    return group_samples(txn_infos, method_names(), tx_ids, app_id)
+
+
+# Generate a creator account for testing and fund it with some ALGO via the dispenser account
+@pytest.fixture(scope="module")
+def creator(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AddressAndSigner:
+    creator = algorand.account.random()
+    algorand.send.payment(setup_stxn(algorand, dispenser, creator.address, 50_000_000))
+    return creator
+
+
+# Generate two funded voter accounts
+@pytest.fixture(scope="module")
+def voters(
+    algorand: AlgorandClient, dispenser: AddressAndSigner
+) -> list[AddressAndSigner]:
+    voters = [algorand.account.random() for _ in range(2)]
+    for voter in voters:
+        algorand.send.payment(setup_stxn(algorand, dispenser, voter.address, 1_000_000))
+    return voters
+
+
+# Test case: Telemetry build logs the opcode budget left and boxes touched of every method, collected into histograms
+def test_telemetry_samples(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    voters: list[AddressAndSigner],
+) -> None:
+
+    app_client = create_app(algorand, creator, telemetry=1)
+
+    # Set up poll, fund app MBR and add poll choices in a single Atomic Transaction
+    setup_res = (
+        app_client.compose()
+        .set_poll(
+            title=b"MyTitle",
+            num_choices=len(poll_choices),
+            eligibility_root=b"",
+            start_date_unix=1739871607,
+            end_date_unix=1740735607,
+        )
+        .fund_app_mbr(
+            # 100_000 (Global.min_balance) + 16_100 (Box a_ fee) + 12_900 (Box t_ fee)
+            mbr_pay=setup_stxn(algorand, creator, app_client.app_address, 129_000),
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_box_name(creator.address)), (0, TALLY_BOX_KEY)]
+            ),
+        )
+        .add_poll_choices(
+            choices=poll_choices,
+            # Box c_ fee
+            mbr_pay=setup_stxn(
+                algorand,
+                creator,
+                app_client.app_address,
+                2_500 + 400 * (3 + len(encode_choices_page(poll_choices))),
+            ),
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, choices_box_name(0))]
+            ),
+        )
+        .execute()
+    )
+
+    setup_samples = txn_group_samples(algorand, setup_res.tx_ids, app_client.app_id)
+    assert [(sample.method, sample.boxes_touched) for sample in setup_samples] == [
+        ("set_poll", 0),
+        ("fund_app_mbr", 2),
+        ("add_poll_choices", 1),
+    ], "Every setup method must log telemetry and the boxes it touched."
+
+    # First voter registers and votes in one call, second voter requests box storage and then votes
+    first_client = voter_client(algorand, app_client, voters[0])
+    register_and_vote_txn = first_client.register_and_vote(
+        mbr_pay=setup_stxn(algorand, voters[0], app_client.app_address, 16_100),
+        choice=2,
+        transaction_parameters=TransactionParameters(
+            boxes=[(0, voter_box_name(voters[0].address)), (0, TALLY_BOX_KEY)]
+        ),
+    )
+
+    second_client = voter_client(algorand, app_client, voters[1])
+    second_client.request_box_storage(
+        mbr_pay=setup_stxn(algorand, voters[1], app_client.app_address, 16_100),
+        transaction_parameters=TransactionParameters(
+            boxes=[(0, voter_box_name(voters[1].address))]
+        ),
+    )
+    submit_vote_txn = second_client.submit_vote(
+        choice=3,
+        transaction_parameters=TransactionParameters(
+            boxes=[(0, voter_box_name(voters[1].address)), (0, TALLY_BOX_KEY)]
+        ),
+    )
+
+    # Telemetry is read straight from committed blocks filtered by app id, the same way the collector CLI does
+    block_samples = []
+    for round_num in range(
+        register_and_vote_txn.confirmed_round, submit_vote_txn.confirmed_round + 1
+    ):
+        block_samples.extend(
+            collect_block_samples(
+                algorand.client.algod.block_info(round_num),
+                method_names(),
+                app_id=app_client.app_id,
+            )
+        )
+
+    assert [(sample.method, sample.boxes_touched) for sample in block_samples] == [
+        ("register_and_vote", 2),
+        ("request_box_storage", 1),
+        ("submit_vote", 2),
+    ], "Every voter method must log telemetry and the boxes it touched."
+
+    # Samples of another app id are filtered out
+    assert not collect_block_samples(
+        algorand.client.algod.block_info(submit_vote_txn.confirmed_round),
+        method_names(),
+        app_id=app_client.app_id + 1,
+    ), "Telemetry of other apps must not be collected."
+
+    # Read-only calls are only simulated, budget is read before the telemetry log so the sample is just below the cost
+    simulate_res = (
+        first_client.compose()
+        .get_poll()
+        .simulate(SimulateOptions(allow_empty_signatures=True))
+    )
+    txn_results = simulate_res.simulate_response["txn-groups"][0]["txn-results"]
+    poll_samples = group_samples(
+        [txn_res["txn-result"] for txn_res in txn_results],
+        method_names(),
+        app_id=app_client.app_id,
+    )
+    assert (
+        0 < txn_results[0]["app-budget-consumed"] - poll_samples[0].opcode_cost < 50
+    ), "Sampled cost must track the simulated opcode cost."
+
+    # Log
+    summary = summarize(setup_samples + block_samples + poll_samples)
+    logger.info(f"Telemetry summary: {summary}")
+
+    assert set(summary) == {
+        "set_poll",
+        "fund_app_mbr",
+        "add_poll_choices",
+        "register_and_vote",
+        "request_box_storage",
+        "submit_vote",
+        "get_poll",
+    }, "Summary must hold every sampled method."
+    assert all(
+        sum(method_summary["histogram"].values()) == method_summary["calls"]
+        for method_summary in summary.values()
+    ), "Histogram must count every sampled call."
+    assert (
+        summary["submit_vote"]["max_boxes_touched"] == 2
+    ), "Summary must report the most boxes touched by a method call."
+
+
+# Test case: Regular builds (template variable 'TELEMETRY' set to 0) log no telemetry
+def test_telemetry_disabled(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+) -> None:
+
+    app_client = create_app(algorand, creator, telemetry=0)
+    simulate_res = (
+        app_client.compose()
+        .get_poll()
+        .simulate(SimulateOptions(allow_empty_signatures=True))
+    )
+
+    logs = simulate_res.simulate_response["txn-groups"][0]["txn-results"][0][
+        "txn-result"
+    ].get("logs", [])
+    assert logs, "Read-only call must log its return value."
+    assert all(
+        decode_telemetry(base64.b64decode(log)) is None for log in logs
+    ), "Regular builds must not log telemetry."
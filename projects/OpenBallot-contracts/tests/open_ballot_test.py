@@ -10,27 +10,58 @@ from algokit_utils.beta.account_manager import AddressAndSigner
 from algokit_utils.beta.algorand_client import AlgorandClient, SuggestedParams
 from algosdk.abi import Contract
 from algosdk.atomic_transaction_composer import AtomicTransactionComposer
-from algosdk.encoding import decode_address, encode_address
-from algosdk.transaction import wait_for_confirmation
-
-from smart_contracts.artifacts.open_ballot.open_ballot_client import OpenBallotClient
-
-from ._helpers.test_utils import read_box_data, setup_logger, setup_stxn
+from algosdk.encoding import decode_address
+from algosdk.v2client import models
+
+from smart_contracts.artifacts.open_ballot.open_ballot_client import (
+    OpenBallotClient,
+    SimulateOptions,
+)
+from smart_contracts.open_ballot.box_reader import iter_voter_addresses, read_voter_boxes
+from smart_contracts.open_ballot.boxes import (
+    TALLY_BOX_KEY,
+    VOTER_BOX_KEY_PREFIX,
+    choices_box_name,
+    decode_voter_box,
+    encode_choices_page,
+    get_choice_tallies,
+    get_poll_choices,
+    voter_box_name,
+)
+from smart_contracts.open_ballot.events import decode_block_events, decode_logs
+from smart_contracts.open_ballot.params import SuggestedParamsCache
+from smart_contracts.open_ballot.profiler import (
+    APPROVAL_MAP_PATH,
+    APPROVAL_TEAL_PATH,
+    approval_traces,
+    count_constant_blocks,
+    format_line_table,
+    format_subroutine_table,
+    profile_traces,
+)
+
+from ._helpers.tally_layouts import (
+    MAX_GLOBAL_KEYS,
+    branch_chain_teal,
+    deploy_tally_app,
+    packed_tally_teal,
+    simulate_tally_cost,
+)
+from ._helpers.test_utils import (
+    read_box_data,
+    setup_logger,
+    setup_stxn,
+    simulate_opcode_cost,
+)
 
 # Setup the logging.Logger
 logger = setup_logger()
 
+# Opcode budget of a single app call (no pooled budget from other app calls of the group)
+APP_CALL_OPCODE_BUDGET = 700
 
-# Return an instance of the Algorand client from the default localnet config
-@pytest.fixture(scope="session")
-def algorand() -> AlgorandClient:
-    return AlgorandClient.default_local_net()
-
-
-# Create a dispenser account as AddreessAndSigner object that will fund other accounts
-@pytest.fixture(scope="session")
-def dispenser(algorand: AlgorandClient) -> AddressAndSigner:
-    return algorand.account.dispenser()
+# Poll choice counts the tally layouts are compared at (the branch chain layout is capped at 64 global uint keys)
+TALLY_LAYOUT_CHOICE_COUNTS = (2, 3, 16, MAX_GLOBAL_KEYS)
 
 
 # Generate a creator account for testing and fund it with some ALGO via the dispenser account
@@ -91,15 +122,14 @@ def app_factory(
             algod_client=algorand.client.algod,
             sender=creator.address,
             signer=creator.signer,
-            template_values={"DELETABLE": 1, "VERSION_UNIX": int(time.time())},
+            template_values={"DELETABLE": 1, "TELEMETRY": 0, "VERSION_UNIX": int(time.time())},
         )
     }
 
     # Use app_client_1 to send a transaction that generates a new smart contract using the 'Create' on-complete method
     creator_gen_app_client_1_txn = app_clients["app_client_1"].create_generate()
 
-    # Verify transaction was confirmed by the network
-    wait_for_confirmation(algorand.client.algod, creator_gen_app_client_1_txn.tx_id, 10)
+    # Verify transaction was confirmed by the network (app client calls return once confirmed)
     assert (
         creator_gen_app_client_1_txn.confirmed_round
     ), "creator_gen_app_client_1_txn transaction round needs confirmation."
@@ -119,7 +149,8 @@ def app_factory(
     #     delete_args=delete_args,
     #     on_update="append",  # Handle updates by appending new changes
     #     on_schema_break="fail",  # Fail if schema incompatibility occurs
-    #     template_values={"DELETABLE": 1, "VERSION_UNIX": int(time.time())},,  # Deployment-time dynamic parameters
+    #     # Deployment-time dynamic parameters
+    #     template_values={"DELETABLE": 1, "TELEMETRY": 0, "VERSION_UNIX": int(time.time())},
     #     allow_update=None,
     #     allow_delete=True,
     # )
@@ -134,7 +165,7 @@ def app_factory(
             sender=randy.address,
             signer=randy.signer,
             app_id=app_clients["app_client_1"].app_id,
-            template_values={"DELETABLE": 1, "VERSION_UNIX": int(time.time())},
+            template_values={"DELETABLE": 1, "TELEMETRY": 0, "VERSION_UNIX": int(time.time())},
         )
 
     # Log
@@ -153,16 +184,16 @@ def sc() -> Contract:
     return Contract.from_json(json.dumps(js["contract"]))
 
 
-# Update the suggested parameters for Algorand transactions.
+# Update the suggested parameters for Algorand transactions (copy of the shared cached params, refreshed per round)
 @pytest.fixture()
 def sp(algorand: AlgorandClient) -> SuggestedParams:
-    sp = algorand.get_suggested_params()
+    sp = SuggestedParamsCache.for_client(algorand.client.algod).suggested_params()
     # sp.first = algorand.client.algod.status().get("last-round")
     # sp.last = sp.first + 1000
     return sp
 
 
-# Test case: Add 'set_poll' & 'fund_app_mbr' into an Atomic Transaction group and send it
+# Test case: Add 'set_poll', 'fund_app_mbr' & 'add_poll_choices' into an Atomic Transaction group and send it
 def test_atxn_1(
     algorand: AlgorandClient,
     creator: AddressAndSigner,
@@ -178,8 +209,8 @@ def test_atxn_1(
     app_factory["app_client_1"].app_client.add_method_call(
         atxn,
         sc.get_method_by_name("set_poll"),
-        abi_args={"title": b"MyTitle", "choice1": b"MyChoice1", "choice2": b"MyChoice2",
-         "choice3": b"MyChoice3", "start_date_unix": 1739871607, "end_date_unix": 1740735607},
+        abi_args={"title": b"MyTitle", "num_choices": 3, "eligibility_root": b"",
+         "start_date_unix": 1739871607, "end_date_unix": 1740735607},
         app_id=app_factory["app_client_1"].app_id,
         parameters=TransactionParameters(
             suggested_params=sp,
@@ -192,23 +223,35 @@ def test_atxn_1(
         atxn,
         sc.get_method_by_name("fund_app_mbr"),
         abi_args={"mbr_pay": setup_stxn(algorand, creator, app_factory[
-        "app_client_1"].app_address, 116_900)},  # 100_000 (Global.min_balance) + 16_900 (Box fee)
+        "app_client_1"].app_address, 129_000)},  # 100_000 (Global.min_balance) + 16_100 (Box fee) + 12_900 (Box t_ fee)
         app_id=app_factory["app_client_1"].app_id,
         parameters=TransactionParameters(
             suggested_params=sp,
-            boxes=[(0, b"a_" + decode_address(creator.address))],
+            boxes=[(0, voter_box_name(creator.address)), (0, TALLY_BOX_KEY)],
             note="abi:fund_app_mbr"
         ),
     )
 
+    # Add 'add_poll_choices' method via add_method_call to the Atomic Transaction (stores poll choices page 0)
+    poll_choices = [b"MyChoice1", b"MyChoice2", b"MyChoice3"]
+    app_factory["app_client_1"].app_client.add_method_call(
+        atxn,
+        sc.get_method_by_name("add_poll_choices"),
+        abi_args={"choices": poll_choices, "mbr_pay": setup_stxn(algorand, creator, app_factory[
+        "app_client_1"].app_address, 2_500 + 400 * (3 + len(encode_choices_page(poll_choices))))},  # Box c_ fee
+        app_id=app_factory["app_client_1"].app_id,
+        parameters=TransactionParameters(
+            suggested_params=sp,
+            boxes=[(0, choices_box_name(0))],
+            note="abi:add_poll_choices"
+        ),
+    )
+
     # Execute the Atomic Transaction
     atxn_res = atxn.execute(algorand.client.algod, 2)
     logger.info(f" Atomic TXN IDS: f{atxn_res.tx_ids}")
 
-    # Verify transactions were confirmed by the network
-    for i in range(len(atxn_res.tx_ids)):
-        wait_for_confirmation(algorand.client.algod, atxn_res.tx_ids[i], 10)
-
+    # Verify transactions were confirmed by the network (group members are confirmed together in one round)
     assert (
         atxn_res.confirmed_round
     ), "atxn_res atomic transaction round needs confirmation."
@@ -217,10 +260,14 @@ def test_atxn_1(
     read_box_data(
         algorand,
         app_factory["app_client_1"].app_id,
-        b"a_" + decode_address(creator.address),
+        voter_box_name(creator.address),
         logger,
     )
 
+    # Verify poll choices and zero filled choice tallies were stored in box storage
+    assert get_poll_choices(app_factory["app_client_1"]) == poll_choices, "Poll choices must match the added choices."
+    assert get_choice_tallies(app_factory["app_client_1"]) == [0, 0, 0], "Choice tallies must start at zero."
+
     # Log
     logger.info(
         f"APP CLIENT 1 ID: {app_factory["app_client_1"].app_id}"
@@ -249,26 +296,25 @@ def test_request_box_storage(
         # Send transaction that calls the request_box_storage abimethod
         req_box_txn = app_client.request_box_storage(
             mbr_pay=setup_stxn(
-                algorand, randy, app_client.app_address, 16_900
-            ),  # Box fee of 16,900 micro Algos
+                algorand, randy, app_client.app_address, 16_100
+            ),  # Box fee of 16,100 micro Algos
             transaction_parameters=TransactionParameters(
                 suggested_params=sp,
                 boxes=[
-                    (0, b"a_" + decode_address(randy.address))
+                    (0, voter_box_name(randy.address))
                 ],  # List referencing App ID and Box name
                 note="abi:request_box_storage",
             ),
         )
 
         # Verify transaction was confirmed by the network
-        wait_for_confirmation(algorand.client.algod, req_box_txn.tx_id, 10)
         assert (
             req_box_txn.confirmed_round
         ), "req_box_txn transaction round needs confirmation."
 
         # Log
         read_box_data(
-            algorand, app_client.app_id, b"a_" + decode_address(randy.address), logger
+            algorand, app_client.app_id, voter_box_name(randy.address), logger
         )
 
     # Log
@@ -286,6 +332,71 @@ def test_request_box_storage(
     )
 
 
+# Test case: Creator registers a batch of voters in a single call, paying all their box storage MBR at once
+def test_register_voters(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    app_factory: dict[str, OpenBallotClient],
+    sp: SuggestedParams,
+    sc: Contract,
+) -> None:
+
+    # Generate voter accounts sponsored by the creator (voters do not need any funds of their own)
+    sponsored_voters = [algorand.account.random().address for _ in range(12)]
+    box_refs = [(0, voter_box_name(address)) for address in sponsored_voters]
+
+    # Construct new Atomic Transaction from the ATC object
+    atxn = AtomicTransactionComposer()
+
+    # Add 'register_voters' method call carrying the first 8 box references and the aggregated MBR payment
+    app_factory["app_client_1"].app_client.add_method_call(
+        atxn,
+        sc.get_method_by_name("register_voters"),
+        abi_args={
+            "voters": sponsored_voters,
+            "mbr_pay": setup_stxn(
+                algorand,
+                creator,
+                app_factory["app_client_1"].app_address,
+                len(sponsored_voters) * 16_500,  # Box fee of 16,500 micro Algos per sponsored voter
+            ),
+        },
+        app_id=app_factory["app_client_1"].app_id,
+        parameters=TransactionParameters(
+            suggested_params=sp,
+            boxes=box_refs[:8],
+            note="abi:register_voters",
+        ),
+    )
+
+    # Add 'get_version_unix' method call that only carries the remaining box references (group resource sharing)
+    app_factory["app_client_1"].app_client.add_method_call(
+        atxn,
+        sc.get_method_by_name("get_version_unix"),
+        app_id=app_factory["app_client_1"].app_id,
+        parameters=TransactionParameters(
+            suggested_params=sp,
+            boxes=box_refs[8:],
+            note="abi:get_version_unix",
+        ),
+    )
+
+    # Execute the Atomic Transaction
+    atxn_res = atxn.execute(algorand.client.algod, 2)
+    assert (
+        atxn_res.confirmed_round
+    ), "atxn_res atomic transaction round needs confirmation."
+
+    # Verify every sponsored voter got a voter data box
+    for address in sponsored_voters:
+        read_box_data(
+            algorand,
+            app_factory["app_client_1"].app_id,
+            voter_box_name(address),
+            logger,
+        )
+
+
 # Test case: Multiple randy accounts submit vote (via default ["NoOp"] using the 'submit_vote' abimethod)
 def test_submit_vote(
     algorand: AlgorandClient,
@@ -303,11 +414,10 @@ def test_submit_vote(
             choice=choice,
             transaction_parameters=TransactionParameters(
                 suggested_params=sp,
-                boxes=[(0, b"a_" + decode_address(voter.address))],
+                boxes=[(0, voter_box_name(voter.address)), (0, TALLY_BOX_KEY)],
                 note="abi:submit_vote"
             ),
         )
-        wait_for_confirmation(algorand.client.algod, submit_vote_txn.tx_id, 10)
         assert (
             submit_vote_txn.confirmed_round
         ), f"{voter.address} submit_vote_txn transaction round needs confirmation."
@@ -326,27 +436,374 @@ def test_submit_vote(
     for app_client, voter, choice in votes:
         submit_and_verify_vote(app_client, voter, choice)
 
-    # Read box data for creator and all randies
+    # Bulk read box data for creator and all randies
     logger.info(f"Reading Box Storage values for {app_factory['app_client_1']}")
-    read_box_data(
-        algorand,
+    columns = read_voter_boxes(
+        algorand.client.algod,
         app_factory["app_client_1"].app_id,
-        b"a_" + decode_address(creator.address),
-        logger,
+        [creator.address, *(randy.address for randy in randy_factory.values())],
     )
-    for randy in randy_factory.values():
-        read_box_data(
-            algorand,
-            app_factory["app_client_1"].app_id,
-            b"a_" + decode_address(randy.address),
-            logger,
-        )
+    for address, voted, choice in zip(columns.addresses, columns.voted, columns.choices, strict=True):
+        logger.info(f"Address: {address} - VoterData voted: {voted} - VoterData.choice: {choice}")
 
     # Log Global State
     logger.info(
         f"Global State attributes: {vars(app_factory['app_client_1'].get_global_state())}"
     )
 
+    # Verify packed vote tally matches the submitted votes (choice 1: 4 votes, choice 2: 1 vote, choice 3: 2 votes)
+    tallies = get_choice_tallies(app_factory["app_client_1"])
+    logger.info(f"Vote tallies: {tallies}")
+    assert tallies == [4, 1, 2], "Packed vote tally must match the submitted votes."
+
+
+# Test case: Profile the 'submit_vote' tally step opcode cost of the packed tally for every choice
+def test_submit_vote_opcode_cost(
+    sp: SuggestedParams,
+    app_factory: dict[str, OpenBallotClient],
+    randy_factory: dict[str, AddressAndSigner],
+) -> None:
+
+    # Simulate a vote for every choice from a voter that has box storage but has not voted yet (nothing is committed)
+    # and profile the tally step ('tally_vote' subroutine) back from the execution trace
+    voter = randy_factory["randy_7"]
+    packed_costs = {}
+    for choice in range(1, 4):
+        simulate_res = app_factory["app_client_8"].compose().submit_vote(
+            choice=choice,
+            transaction_parameters=TransactionParameters(
+                suggested_params=sp,
+                boxes=[(0, voter_box_name(voter.address)), (0, TALLY_BOX_KEY)],
+            ),
+        ).simulate(
+            SimulateOptions(
+                allow_empty_signatures=True,
+                exec_trace_config=models.SimulateTraceConfig(enable=True),
+            )
+        )
+        profile = profile_traces(
+            approval_traces([simulate_res.simulate_response]),
+            json.loads(APPROVAL_MAP_PATH.read_text()),
+            count_constant_blocks(APPROVAL_TEAL_PATH.read_text()),
+        )
+        packed_costs[choice] = profile.total_costs["tally_vote"]
+
+    # Log
+    logger.info(f"submit_vote packed tally cost per choice: {packed_costs}")
+
+    # Packed tally update is a single extract/replace, so its cost must not depend on the selected choice
+    assert all(cost > 0 for cost in packed_costs.values()), "Tally step must be profiled for every choice."
+    assert (
+        len(set(packed_costs.values())) == 1
+    ), "Packed tally 'submit_vote' opcode cost must be the same for every choice."
+
+
+# Test case: Measure the tally update opcode cost of the packed tally box and of the former global key branch chain
+def test_tally_layout_opcode_cost(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+) -> None:
+
+    # Deploy both reference tally programs for every compared choice count and simulate a vote for a spread of choices
+    algod = algorand.client.algod
+    packed_costs: dict[int, dict[int, int]] = {}
+    chain_costs: dict[int, dict[int, int]] = {}
+    for num_choices in TALLY_LAYOUT_CHOICE_COUNTS:
+        packed_app_id = deploy_tally_app(algod, creator, packed_tally_teal(num_choices), 0)
+        chain_app_id = deploy_tally_app(algod, creator, branch_chain_teal(num_choices), num_choices)
+        choices = sorted({1, 2, 3, 4, num_choices // 2, num_choices - 1, num_choices} & set(range(1, num_choices + 1)))
+        packed_costs[num_choices] = {
+            choice: simulate_tally_cost(algod, creator, packed_app_id, choice) for choice in choices
+        }
+        chain_costs[num_choices] = {
+            choice: simulate_tally_cost(algod, creator, chain_app_id, choice) for choice in choices
+        }
+
+    # Log
+    for num_choices in TALLY_LAYOUT_CHOICE_COUNTS:
+        logger.info(
+            f"{num_choices} choices: packed tally cost {packed_costs[num_choices]},"
+            f" branch chain cost {chain_costs[num_choices]}"
+        )
+
+    # Packed tally update cost must not depend on the selected choice nor on the number of poll choices
+    assert (
+        len({cost for costs in packed_costs.values() for cost in costs.values()}) == 1
+    ), "Packed tally opcode cost must be the same for every choice and choice count."
+
+    # The branch chain walks one more branch for every later choice (the last choice is the else branch)
+    for num_choices, costs in chain_costs.items():
+        chained = [cost for choice, cost in costs.items() if choice < num_choices]
+        assert chained == sorted(set(chained)), f"Branch chain cost must grow with the choice ({num_choices} choices)."
+
+    # The branch chain is cheaper for the first choices only, the packed tally is cheaper from the fourth choice on
+    packed_cost = packed_costs[TALLY_LAYOUT_CHOICE_COUNTS[0]][1]
+    for num_choices, costs in chain_costs.items():
+        for choice, cost in costs.items():
+            if choice >= 4:
+                assert packed_cost < cost, (
+                    f"Packed tally cost {packed_cost} must be lower than the branch chain cost {cost}"
+                    f" of choice {choice} ({num_choices} choices)."
+                )
+
+
+# Test case: Report the opcode cost of every voter data box method (one box operation per voter data record)
+def test_opcode_cost_report(
+    algorand: AlgorandClient,
+    dispenser: AddressAndSigner,
+    creator: AddressAndSigner,
+    app_factory: dict[str, OpenBallotClient],
+    randy_factory: dict[str, AddressAndSigner],
+) -> None:
+
+    # Simulated calls are never committed, randy_7 has box storage but has not voted yet
+    voter = randy_factory["randy_7"]
+    voter_client = app_factory["app_client_8"]
+    new_voter = algorand.account.random()
+    algorand.send.payment(setup_stxn(algorand, dispenser, new_voter.address, 1_000_000))
+    new_voter_client = OpenBallotClient(
+        algod_client=algorand.client.algod,
+        sender=new_voter.address,
+        signer=new_voter.signer,
+        app_id=app_factory["app_client_1"].app_id,
+    )
+
+    # Outer transaction fee covers the inner refund payment of 'delete_box_storage'
+    refund_sp = algorand.get_suggested_params()
+    refund_sp.flat_fee = True
+    refund_sp.fee = 2_000
+
+    voter_box_ref = [(0, voter_box_name(voter.address))]
+    opcode_costs = {
+        "request_box_storage": new_voter_client.compose().request_box_storage(
+            mbr_pay=setup_stxn(algorand, new_voter, new_voter_client.app_address, 16_100),
+            transaction_parameters=TransactionParameters(
+                boxes=[(0, voter_box_name(new_voter.address))]
+            ),
+        ),
+        "submit_vote": voter_client.compose().submit_vote(
+            choice=1,
+            transaction_parameters=TransactionParameters(
+                boxes=[*voter_box_ref, (0, TALLY_BOX_KEY)]
+            ),
+        ),
+        "delete_box_storage": voter_client.compose().delete_box_storage(
+            transaction_parameters=TransactionParameters(
+                suggested_params=refund_sp, boxes=voter_box_ref
+            ),
+        ),
+        "purge_box_storage": app_factory["app_client_1"].compose().purge_box_storage(
+            box_keys=[voter.address],
+            transaction_parameters=TransactionParameters(boxes=voter_box_ref),
+        ),
+        "try_purge_box_storage": app_factory["app_client_1"].compose().try_purge_box_storage(
+            box_keys=[voter.address],
+            transaction_parameters=TransactionParameters(boxes=voter_box_ref),
+        ),
+    }
+    opcode_costs = {
+        method: simulate_opcode_cost(composer)[-1]  # App call is the last transaction of the group
+        for method, composer in opcode_costs.items()
+    }
+
+    # Log
+    logger.info(f"Opcode cost report: {json.dumps(opcode_costs)}")
+
+    # Every voter data box method reads or writes its voter data box once, so it must fit a single app call budget
+    for method, cost in opcode_costs.items():
+        assert (
+            0 < cost <= APP_CALL_OPCODE_BUDGET
+        ), f"{method} opcode cost {cost} must fit the {APP_CALL_OPCODE_BUDGET} opcode budget of a single app call."
+
+
+# Test case: Profile a simulated 'submit_vote' back to contract source lines and subroutines via the puya source map
+def test_profile_submit_vote(
+    sp: SuggestedParams,
+    app_factory: dict[str, OpenBallotClient],
+    randy_factory: dict[str, AddressAndSigner],
+) -> None:
+
+    # Simulate a vote from a voter that has box storage but has not voted yet (nothing is committed)
+    voter = randy_factory["randy_7"]
+    simulate_res = app_factory["app_client_8"].compose().submit_vote(
+        choice=2,
+        transaction_parameters=TransactionParameters(
+            suggested_params=sp,
+            boxes=[(0, voter_box_name(voter.address)), (0, TALLY_BOX_KEY)],
+        ),
+    ).simulate(
+        SimulateOptions(
+            allow_empty_signatures=True,
+            exec_trace_config=models.SimulateTraceConfig(enable=True),
+        )
+    )
+
+    profile = profile_traces(
+        approval_traces([simulate_res.simulate_response]),
+        json.loads(APPROVAL_MAP_PATH.read_text()),
+        count_constant_blocks(APPROVAL_TEAL_PATH.read_text()),
+    )
+
+    # Log
+    logger.info(f"submit_vote line costs:\n{format_line_table(profile)}")
+    logger.info(f"submit_vote subroutine costs:\n{format_subroutine_table(profile)}")
+
+    app_budget_consumed = simulate_res.simulate_response["txn-groups"][0]["txn-results"][0]["app-budget-consumed"]
+    assert profile.total == app_budget_consumed, "Profiled opcode cost must add up to the app budget consumed."
+    assert (
+        0 < profile.total_costs["submit_vote"] < profile.total
+    ), "Method cost must be attributed to the 'submit_vote' subroutine called by the router."
+
+
+# Test case: A new account requests box storage and votes in a single round trip (via 'register_and_vote' abimethod)
+def test_register_and_vote(
+    algorand: AlgorandClient,
+    dispenser: AddressAndSigner,
+    sp: SuggestedParams,
+    app_factory: dict[str, OpenBallotClient],
+) -> None:
+
+    # Create and fund a voter account that has no box storage yet
+    voter = algorand.account.random()
+    algorand.send.payment(setup_stxn(algorand, dispenser, voter.address, 1_000_000))
+
+    app_client = OpenBallotClient(
+        algod_client=algorand.client.algod,
+        sender=voter.address,
+        signer=voter.signer,
+        app_id=app_factory["app_client_1"].app_id,
+    )
+
+    # MBR payment and vote are sent together as one Atomic Transaction, so only one confirmation is waited on
+    register_and_vote_txn = app_client.register_and_vote(
+        mbr_pay=setup_stxn(
+            algorand, voter, app_client.app_address, 16_100
+        ),  # Box fee of 16,100 micro Algos
+        choice=2,
+        transaction_parameters=TransactionParameters(
+            suggested_params=sp,
+            boxes=[(0, voter_box_name(voter.address)), (0, TALLY_BOX_KEY)],
+            note="abi:register_and_vote",
+        ),
+    )
+    assert (
+        register_and_vote_txn.confirmed_round
+    ), "register_and_vote_txn transaction round needs confirmation."
+
+    # Voter data box is created already marked as voted and the vote is counted
+    box = algorand.client.algod.application_box_by_name(
+        app_client.app_id, voter_box_name(voter.address)
+    )
+    assert decode_voter_box(
+        base64.b64decode(box["name"]), base64.b64decode(box["value"])
+    ) == (voter.address, True, 2), "Voter data must be marked as voted for choice 2."
+    assert get_choice_tallies(app_client) == [4, 2, 2], "Packed vote tally must count the registered vote."
+
+    # Voter registered and vote cast events are emitted in sequence, the block decoder yields the same events
+    txn_events = decode_logs(
+        algorand.client.algod.pending_transaction_info(register_and_vote_txn.tx_id)["logs"]
+    )
+    assert [(event.name, event.args) for event in txn_events] == [
+        ("VoterRegistered", {"voter": voter.address}),
+        ("VoteCast", {"voter": voter.address, "choice": 2}),
+    ], "register_and_vote must emit VoterRegistered and VoteCast events."
+    assert txn_events[1].seq == txn_events[0].seq + 1, "Event sequence numbers must increase by one."
+
+    block_events = decode_block_events(
+        algorand.client.algod.block_info(register_and_vote_txn.confirmed_round), app_client.app_id
+    )
+    assert [event.seq for event in block_events][-2:] == [
+        event.seq for event in txn_events
+    ], "Block events must include the register_and_vote events."
+
+
+# Test case: Read poll metadata and vote tallies through the read-only 'get_poll' & 'get_results' abimethods
+def test_get_results(
+    app_factory: dict[str, OpenBallotClient],
+) -> None:
+
+    # Read-only calls are simulated, no transaction is sent
+    get_poll_res = app_factory["app_client_1"].get_poll()
+    get_results_res = app_factory["app_client_1"].get_results(
+        transaction_parameters=TransactionParameters(boxes=[(0, TALLY_BOX_KEY)])
+    )
+
+    # Log
+    logger.info(f"get_poll: {get_poll_res.return_value}")
+    logger.info(f"get_results: {get_results_res.return_value}")
+
+    poll_info, tallies = get_results_res.return_value
+    title, eligibility_root, start_date_unix, end_date_unix, finalized, num_choices = poll_info
+    assert bytes(title) == b"MyTitle", "Poll title must match 'set_poll' title."
+    assert bytes(eligibility_root) == b"", "Box storage voting poll must not have an eligibility root."
+    assert (start_date_unix, end_date_unix) == (1739871607, 1740735607), "Poll dates must match 'set_poll' dates."
+    assert (finalized, num_choices) == (1, 3), "Poll must be set up with 3 choices."
+    assert tallies == get_choice_tallies(app_factory["app_client_1"]), "Tallies must match the tallies box."
+
+
+# Test case: Read the voter data of a batch of addresses through the read-only 'get_voters_data' abimethod
+def test_get_voters_data(
+    algorand: AlgorandClient,
+    app_factory: dict[str, OpenBallotClient],
+    randy_factory: dict[str, AddressAndSigner],
+) -> None:
+
+    # Look up six voters that voted, one that only requested box storage and one address without box storage
+    voters = [randy.address for randy in islice(randy_factory.values(), 7)]
+    voters.append(algorand.account.random().address)
+
+    # Read-only call is simulated, a single request answers the whole batch
+    get_voters_data_res = app_factory["app_client_1"].get_voters_data(
+        voters=voters,
+        transaction_parameters=TransactionParameters(
+            boxes=[(0, voter_box_name(address)) for address in voters]
+        ),
+    )
+
+    # Log
+    logger.info(f"get_voters_data: {get_voters_data_res.return_value}")
+
+    assert get_voters_data_res.return_value == [
+        [1, [2]],
+        [1, [1]],
+        [1, [3]],
+        [1, [1]],
+        [1, [1]],
+        [1, [1]],
+        [1, [0]],
+        [0, [0]],
+    ], "Voter statuses must match the submitted votes and mark absent addresses."
+
+
+# Test case: Bulk read the voter data boxes of the app concurrently and decode them into columns
+def test_read_voter_boxes(
+    algorand: AlgorandClient,
+    app_factory: dict[str, OpenBallotClient],
+    randy_factory: dict[str, AddressAndSigner],
+) -> None:
+    app_id = app_factory["app_client_1"].app_id
+
+    # Same batch as 'test_get_voters_data': six voters that voted, one that did not and an address without a box
+    voters = [randy.address for randy in islice(randy_factory.values(), 7)]
+    voters.append(algorand.account.random().address)
+    columns = read_voter_boxes(algorand.client.algod, app_id, voters)
+
+    # Log
+    logger.info(f"read_voter_boxes: {len(columns)} voter boxes, missing: {columns.missing}")
+
+    assert columns.addresses == voters[:-1], "Columns must keep the order of the requested addresses."
+    assert list(columns.voted) == [1, 1, 1, 1, 1, 1, 0], "Voted column must match the submitted votes."
+    assert list(columns.choices) == [2, 1, 3, 1, 1, 1, 0], "Choices column must match the submitted votes."
+    assert columns.missing == voters[-1:], "Address without box storage must be reported missing."
+
+    # Without addresses every voter data box of the app is read, its choices add up to the packed vote tally
+    all_columns = read_voter_boxes(algorand.client.algod, app_id)
+    assert set(voters[:-1]) <= set(all_columns.addresses), "Every voter data box of the app must be read."
+    tallies = get_choice_tallies(app_factory["app_client_1"])
+    assert (
+        all_columns.choice_counts(len(tallies)) == tallies
+    ), "Choices of every voter data box must add up to the packed vote tally."
+
 
 # # Test case: Multiple randy accounts each delete their box storage each and get their paid MBR refunded
 # def test_delete_box_storage(
@@ -370,7 +827,7 @@ def test_submit_vote(
 #             transaction_parameters=TransactionParameters(
 #                 suggested_params=sp,
 #                 boxes=[
-#                     (0, b"a_" + decode_address(randy.address))
+#                     (0, voter_box_name(randy.address))
 #                 ],  # List referencing App ID and Box name
 #             ),  note = "abi:delete_box_storage",
 #         )
@@ -396,8 +853,8 @@ def test_submit_vote(
 #     )
 
 
-# Test case: Add 'purge_box_storage()' into Atomic Transaction groups and send them
-def test_purge_box_stroage_atxns(
+# Test case: Overlapping 'try_purge_box_storage()' calls skip absent box keys and only count real deletions
+def test_try_purge_box_storage_overlap(
     algorand: AlgorandClient,
     creator: AddressAndSigner,
     app_factory: dict[str, OpenBallotClient],
@@ -405,75 +862,122 @@ def test_purge_box_stroage_atxns(
     sc: Contract,
 ) -> None:
 
-    # Get an array of all boxes in application with given ID
-    app_boxes = algorand.client.algod.application_boxes(
-        app_factory["app_client_1"].app_id
-    )
+    # Pick three voter data box keys (creator box key excluded)
+    box_keys = [
+        decode_address(address)
+        for address in islice(
+            (
+                address
+                for address in iter_voter_addresses(algorand.client.algod, app_factory["app_client_1"].app_id)
+                if address != creator.address
+            ),
+            3,
+        )
+    ]
+    total_purged_before = app_factory["app_client_1"].get_global_state().total_purged_box_a_
+
+    # Two purge workers overlap on the first two box keys within the same Atomic Transaction
+    purge_sp = algorand.get_suggested_params()
+    purge_sp.flat_fee = True
+    purge_sp.fee = 2_000  # Outer transaction fee + one opcode budget top up inner transaction
+
+    atxn = AtomicTransactionComposer()
+    for worker, worker_keys in enumerate((box_keys[:2], box_keys)):
+        app_factory["app_client_1"].app_client.add_method_call(
+            atxn,
+            sc.get_method_by_name("try_purge_box_storage"),
+            abi_args={"box_keys": worker_keys},
+            app_id=app_factory["app_client_1"].app_id,
+            parameters=TransactionParameters(
+                suggested_params=purge_sp,
+                boxes=[(0, VOTER_BOX_KEY_PREFIX + box_key) for box_key in worker_keys],
+                note=f"abi:try_purge_box_storage:{worker}",
+            ),
+        )
+
+    atxn_res = atxn.execute(algorand.client.algod, 2)
+    assert atxn_res.confirmed_round, "atxn_res atomic transaction round needs confirmation."
 
-    # Iterate through all boxes in application and extract the address value from box name field
-    box_addresses = []  # Define a list to store extracted addresses
-    for box in app_boxes["boxes"]:
-        box_key = base64.b64decode(box["name"])  # Decode the base64 encoded box name value to get box key
-        address = encode_address(box_key[-32:])  # Last 32 bytes of box key value is address (rest is key prefix)
+    # Second worker only deletes the box key the first worker did not get to
+    assert [result.return_value for result in atxn_res.abi_results] == [
+        2,
+        1,
+    ], "try_purge_box_storage must return the number of boxes actually deleted."
+    assert (
+        app_factory["app_client_1"].get_global_state().total_purged_box_a_
+        == total_purged_before + len(box_keys)
+    ), "Purged total must only count real deletions."
+
+
+# Test case: Add 'purge_box_storage()' into Atomic Transaction groups and send them
+def test_purge_box_stroage_atxns(
+    algorand: AlgorandClient,
+    creator: AddressAndSigner,
+    app_factory: dict[str, OpenBallotClient],
+    sp: SuggestedParams,
+    sc: Contract,
+) -> None:
 
-        # If address from box key matches creator address, do NOT append it
-        if address != creator.address:
-            box_addresses.append(address)
+    # Page through the voter data boxes of the app (small pages to exercise the next tokens) and extract the address
+    # value from each box name, the creator address is NOT appended
+    box_addresses = [
+        address
+        for address in iter_voter_addresses(algorand.client.algod, app_factory["app_client_1"].app_id, page_size=4)
+        if address != creator.address
+    ]
 
     # Define list that will store other lists, each representing a batch of box keys in byte format
+    # A batch fills one purge call (63 addresses fit in the 2KB application args limit)
     bk_batches = [
-        [
-            # This represents a batch list // Output: [addr1, addr2, addr3, addr4, addr5, addr6, addr7, addr8]
-            decode_address(address)  # Decode the address
-            for address in islice(box_addresses, i, i + 8)  # Slice first 8 incidies of box addresses
-        ]
-        # Iterate through box addresses indicies in steps of 8
-        for i in range(0, len(box_addresses), 8)  # Output: 0, 8, 16,
+        [decode_address(address) for address in islice(box_addresses, i, i + 63)]
+        for i in range(0, len(box_addresses), 63)
     ]
 
-    # Create a new ATC object for every two batches of box keys and store it in a dict
-    atxn_factory = {f"atxn_{i + 1}": AtomicTransactionComposer() for i in range((len(bk_batches) + 1) // 2)}
-    batch_counter = 0  # Initialize batch count
-
-    # Loop until no more batches of box keys in bk_batches
-    while bk_batches:
-        # Pop first element of bk_batches (list[bytes]), this represents current batch of box keys
-        bk_batch = bk_batches.pop(0)
+    # Send every batch of box keys as a single purge call in its own Atomic Transaction
+    for bk_batch in bk_batches:
+        atxn = AtomicTransactionComposer()
+        box_refs = [(0, VOTER_BOX_KEY_PREFIX + box_key) for box_key in bk_batch]  # Ref each box name in batch
 
-        # Define atxn ID for the key of the app_factory dict in order to shift to new AtomicTransactionComposer() object
-        atxn_id = (batch_counter // 2) + 1  # Every two batches, atxn_id increases by 1
+        # Pay the outer transaction fee plus the inner opcode budget top up fees (~40 opcode budget per box key)
+        purge_sp = algorand.get_suggested_params()
+        purge_sp.flat_fee = True
+        purge_sp.fee = 1_000 * (2 + (100 + 40 * len(bk_batch)) // 700)
 
-        logger.info(f"bk_batch: {bk_batch}")
-        logger.info(f"atxn_id: {atxn_id}")
-
-        # Add method call to the atxn in app_factory under the key specific tied to atxn_id
+        # Add 'purge_box_storage' method call carrying the first 8 box references
         app_factory["app_client_1"].app_client.add_method_call(
-            atxn_factory[f"atxn_{atxn_id}"],  # Access atxn under app_factory key
-            sc.get_method_by_name("purge_box_storage"), # Get (ABI)Method by name
+            atxn,
+            sc.get_method_by_name("purge_box_storage"),  # Get (ABI)Method by name
             abi_args={"box_keys": bk_batch},  # Pass current individual batch of box keys as arg
             app_id=app_factory["app_client_1"].app_id,  # Reference client by App ID
             parameters=TransactionParameters(
-                suggested_params=sp,  # Pass fresh suggested params
-                boxes=[(0, b"a_" + box_key) for box_key in bk_batch],  # Ref each box name in batch
+                suggested_params=purge_sp,
+                boxes=box_refs[:8],
                 note="abi:purge_box_storage",
             ),
         )
 
-        # Execute Atomic transactions
-        # If batch counter is odd or bk_batch is empty (meaning last array is being proccessed)
-        if batch_counter % 2 == 1 or len(bk_batches) == 0:
-            logger.info(f"Executing atxn {atxn_id}")
-            atxn_res = atxn_factory[f"atxn_{atxn_id}"].execute(algorand.client.algod, 2)
+        # Add 'get_version_unix' method calls that only carry the remaining box references (group resource sharing)
+        for i in range(8, len(box_refs), 8):
+            app_factory["app_client_1"].app_client.add_method_call(
+                atxn,
+                sc.get_method_by_name("get_version_unix"),
+                app_id=app_factory["app_client_1"].app_id,
+                parameters=TransactionParameters(
+                    suggested_params=sp,
+                    boxes=box_refs[i : i + 8],
+                    note=f"abi:get_version_unix:{i}",
+                ),
+            )
 
-            # Wait for confirmations (confirm for every txn id in atxn)
-            for tx_id in atxn_res.tx_ids:
-                wait_for_confirmation(algorand.client.algod, tx_id, 10)
-
-            # Ensure the atxn response atomic transaction was confirmed by network
-            assert atxn_res.confirmed_round, "atxn_res atomic transaction round needs confirmation."
+        # Execute Atomic transactions
+        logger.info(f"Executing purge of {len(bk_batch)} box keys")
+        atxn_res = atxn.execute(algorand.client.algod, 2)
 
-        # Increment batch counter by 1 (signals next batch is being processed)
-        batch_counter += 1
+        # Ensure the atxn response atomic transaction was confirmed by network
+        assert atxn_res.confirmed_round, "atxn_res atomic transaction round needs confirmation."
+        assert atxn_res.abi_results[0].return_value == len(
+            bk_batch
+        ), "purge_box_storage must return the number of purged boxes."
 
     # Log
     logger.info(
@@ -513,11 +1017,15 @@ def test_delete_app(
     # Use App client to send a transaction that executes the 'terminate' delete application abimethod
     delete_app_client_1_txn = app_factory["app_client_1"].delete_terminate(
         transaction_parameters=TransactionParameters(
-            suggested_params=sp, boxes=[(0, b"a_" + decode_address(creator.address))]
+            suggested_params=sp,
+            boxes=[
+                (0, voter_box_name(creator.address)),
+                (0, TALLY_BOX_KEY),
+                (0, choices_box_name(0)),
+            ],
         )
     )
 
-    wait_for_confirmation(algorand.client.algod, delete_app_client_1_txn.tx_id, 10)
     assert (
         delete_app_client_1_txn.confirmed_round
     ), "delete_app_client_1_txn transaction round needs confirmation."
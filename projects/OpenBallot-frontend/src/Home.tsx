@@ -10,7 +10,7 @@ import ConnectWallet from './components/ConnectWallet'
 import DeleteAppModal from './components/DeleteApp'
 import JoinAppModal from './components/JoinApp'
 import * as iInterface from './interfaces/index'
-import { OpenBallotMethodManager } from './methods'
+import { OpenBallotMethodManager, decodePollChoices, getChoicesBoxName, isVoterBoxName } from './methods'
 import { UISectionState } from './types'
 import * as button from './utils/buttons'
 import * as date from './utils/dates'
@@ -217,9 +217,7 @@ const Home: React.FC = () => {
 
       // Extract App Global State key-value pairs
       const pollTitle = appGlobalState['poll_title']?.value || ''
-      const pollChoice1 = appGlobalState['poll_choice1']?.value || ''
-      const pollChoice2 = appGlobalState['poll_choice2']?.value || ''
-      const pollChoice3 = appGlobalState['poll_choice3']?.value || ''
+      const pollChoicePages = Number(appGlobalState['poll_choice_pages']?.value ?? 0)
       // const totalPurgedBoxA_ = BigInt(appGlobalState['total_purged_box_a_']?.value ?? 0)
       const pollStartDateUnix = BigInt(appGlobalState['poll_start_date_unix']?.value ?? 0)
       const pollEndDateUnix = BigInt(appGlobalState['poll_end_date_unix']?.value ?? 0)
@@ -232,9 +230,18 @@ const Home: React.FC = () => {
       const currentVotingPeriod = date.checkVotingPeriod(pollStartDateUnix, pollEndDateUnix)
       setVotingPeriod(currentVotingPeriod) // Set 'votingPeriod'
 
-      // Fetch box addresses and check if the active address has voted
+      // Read every poll choices page box, poll choices are stored in choice order (choice 1 first)
+      const pollChoices: string[] = []
+      for (let page = 0; page < pollChoicePages; page++) {
+        pollChoices.push(...decodePollChoices(await algorand.app.getBoxValue(currentAppId, getChoicesBoxName(page))))
+      }
+
+      // Fetch voter data box addresses and check if the active address has voted
       const appBoxes = await algorand.app.getBoxNames(currentAppId)
-      const boxAddresses = appBoxes.map((box) => encodeAddress(new Uint8Array(Buffer.from(box.nameBase64, 'base64')).slice(-32)))
+      const boxAddresses = appBoxes
+        .map((box) => new Uint8Array(Buffer.from(box.nameBase64, 'base64')))
+        .filter(isVoterBoxName)
+        .map((boxName) => encodeAddress(boxName.slice(-32)))
 
       const hasBoxStorage = boxAddresses.includes(activeAddress)
       let hasVoted = null
@@ -243,13 +250,13 @@ const Home: React.FC = () => {
       if (boxAddresses.includes(activeAddress)) {
         try {
           const boxName = new Uint8Array([
-            ...Buffer.from('a_'), // Prefix
+            ...Buffer.from('a'), // Prefix
             ...decodeAddress(activeAddress).publicKey, // Address in Uint8Array format
           ])
           const boxVal = await algorand.app.getBoxValue(currentAppId, boxName)
           if (boxVal) {
-            hasVoted = Number(boxVal[0]) // First index: hasVoted
-            votedFor = Number(boxVal[1]) // Second index: votedFor
+            hasVoted = boxVal[0] !== 0 ? 1 : 0 // First index: VoterData choice ('0' = not voted)
+            votedFor = Number(boxVal[0]) || null
           }
         } catch (error) {
           consoleLogger.error('Error fetching box value:', error)
@@ -258,7 +265,7 @@ const Home: React.FC = () => {
 
       // Set choice display based on votedFor
       if (votedFor) {
-        const choiceText = [pollChoice1, pollChoice2, pollChoice3][votedFor - 1] || ''
+        const choiceText = pollChoices[votedFor - 1] || ''
         setChoiceDisplay({ index: votedFor, text: String(choiceText) })
       }
 
@@ -277,9 +284,7 @@ const Home: React.FC = () => {
         appAddress: app.appAddress,
         creatorAddress: app.creator,
         pollTitle: String(pollTitle),
-        pollChoice1: String(pollChoice1),
-        pollChoice2: String(pollChoice2),
-        pollChoice3: String(pollChoice3),
+        pollChoices,
         pollStartDate: pollStartDateStr,
         pollEndDate: pollEndDateStr,
         pollStartDateUnix: pollStartDateUnix,
@@ -335,9 +340,7 @@ const Home: React.FC = () => {
         activeAddress,
         appClient.appId,
         currentPollInputs.title,
-        currentPollInputs.choices[0],
-        currentPollInputs.choices[1],
-        currentPollInputs.choices[2],
+        currentPollInputs.choices,
         BigInt(date.convertDateToUnix(currentPollInputs.startDate)),
         BigInt(date.convertDateToUnix(currentPollInputs.endDate)),
       )
@@ -926,7 +929,7 @@ const Home: React.FC = () => {
                 <div>
                   <p className="text-[20px] text-left font-semibold underline mb-4">Choices:</p>
                   <ul className="space-y-2">
-                    {[currentAppClient?.pollChoice1, currentAppClient?.pollChoice2, currentAppClient?.pollChoice3].map(
+                    {(currentAppClient?.pollChoices ?? []).map(
                       (choice, index) =>
                         choice && (
                           <li key={index} className="flex items-center space-x-3">
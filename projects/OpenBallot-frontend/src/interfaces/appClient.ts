@@ -6,9 +6,7 @@ export interface AppClientProps {
   appAddress: string
   creatorAddress: string
   pollTitle: string
-  pollChoice1: string
-  pollChoice2: string
-  pollChoice3: string
+  pollChoices: string[]
   pollStartDate: string
   pollEndDate: string
   pollStartDateUnix: bigint
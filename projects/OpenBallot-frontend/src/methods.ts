@@ -1,9 +1,53 @@
 //src/methods.ts
 
 import { AlgorandClient } from '@algorandfoundation/algokit-utils'
-import { AtomicTransactionComposer, decodeAddress, encodeAddress, ABIMethod } from 'algosdk'
+import { AtomicTransactionComposer, decodeAddress, encodeAddress, ABIMethod, ABIType } from 'algosdk'
 import { OpenBallotClient, OpenBallotFactory } from './contracts/OpenBallot'
 
+// Box storage MBR of the OpenBallot smart contract in micro Algos (2_500 + 400 * (len(key) + len(value)))
+const BOX_A_MBR = 16_100 // Voter data box: 'a' + address (33 bytes) + VoterData (1 byte)
+const calcTallyBoxMbr = (numChoices: number) => 2_500 + 400 * (2 + 8 * numChoices) // 't_' + uint64 per choice
+const calcChoicesBoxMbr = (pageSize: number) => 2_500 + 400 * (3 + pageSize) // 'c_' + page index + ARC-4 byte[][]
+
+// Box names and ARC-4 type of a poll choices page box (box value)
+const VOTER_BOX_PREFIX = 'a'
+const TALLY_BOX_NAME = new Uint8Array(Buffer.from('t_'))
+const POLL_CHOICES_PAGE_TYPE = ABIType.from('byte[][]')
+
+/**
+ * Returns the box name of the poll choices page box with the given page index ('c_' + 1 byte page index).
+ *
+ * @param page - The poll choices page index.
+ *
+ * @returns The poll choices page box name as a Uint8Array.
+ */
+export function getChoicesBoxName(page: number): Uint8Array {
+  return new Uint8Array([...Buffer.from('c_'), page])
+}
+
+/**
+ * Returns whether a box name is a voter data box name ('a' + 32 byte address).
+ *
+ * @param boxName - The box name as a Uint8Array.
+ *
+ * @returns True for voter data box names, false for the tallies and poll choices boxes.
+ */
+export function isVoterBoxName(boxName: Uint8Array): boolean {
+  return boxName.length === 33 && boxName[0] === VOTER_BOX_PREFIX.charCodeAt(0)
+}
+
+/**
+ * Decodes a poll choices page box value (ARC-4 encoded byte[][]) into UTF-8 poll choices.
+ *
+ * @param pageValue - The poll choices page box value.
+ *
+ * @returns The poll choices of the page in choice order.
+ */
+export function decodePollChoices(pageValue: Uint8Array): string[] {
+  const choices = POLL_CHOICES_PAGE_TYPE.decode(pageValue) as Uint8Array[]
+  return choices.map((choice) => new TextDecoder().decode(new Uint8Array(choice)))
+}
+
 /**
  * Class that acts as a wrapper for the OpenBallot smart contract methods, providing an interface
  * to interact with the contract and manage its functions.
@@ -116,11 +160,11 @@ export class OpenBallotMethodManager {
    *
    * Steps:
    * 1. Decode the sender's address to get the public key.
-   * 2. Concatenate the prefix 'a_' with the decoded public key.
+   * 2. Concatenate the prefix 'a' with the decoded public key.
    * 3. Return the resulting Uint8Array as the box name.
    */
   private getBoxName(sender: string): Uint8Array {
-    return new Uint8Array([...Buffer.from('a_'), ...decodeAddress(sender).publicKey])
+    return new Uint8Array([...Buffer.from(VOTER_BOX_PREFIX), ...decodeAddress(sender).publicKey])
   }
 
   /**
@@ -198,20 +242,22 @@ export class OpenBallotMethodManager {
    *   - `onUpdate`: Determines the behavior when an update is detected (default is `append`).
    *   - `onSchemaBreak`: Determines the behavior when schema changes (default is `fail`).
    * - The application is deletable and initialized with a `TMPL_VERSION_UNIX` parameter representing the current UNIX timestamp.
+   * - `TMPL_TELEMETRY` is set to 0, so the deployed approval program does not log opcode budget telemetry.
    *
    * @param creator - The address of the account deploying the application.
    *
    * @returns appClient - An application client instance for interacting with the deployed application.
    *
    * Steps:
-   * 1. Prepare `templateParams` with deployment-time parameters, including the current UNIX timestamp.
+   * 1. Prepare `templateParams` with deployment-time parameters, including the current UNIX timestamp and the
+   *    telemetry build flag (off).
    * 2. Call the factory client's `deploy` method with the following configurations:
    *    - `appName`: The name of the application (e.g., 'Open Ballot').
    *    - `createParams`: Parameters for the creation transaction, including sender, signer, and `generate` method.
    *    - `deleteParams`: Parameters for the deletion transaction, including sender, signer, and `terminate` method.
    *    - `onUpdate`: Specifies behavior for updates (e.g., `append` new data).
    *    - `onSchemaBreak`: Specifies behavior for schema changes (e.g., `fail` to reject incompatible updates).
-   *    - `deployTimeParams`: Dynamic parameters, such as `TMPL_VERSION_UNIX`.
+   *    - `deployTimeParams`: Dynamic parameters, such as `TMPL_VERSION_UNIX` and `TMPL_TELEMETRY`.
    *    - `updatable`: Undefined, meaning the app is not explicitly set to be updatable or non-updatable.
    *    - `deletable`: True, allowing the app to be deleted if necessary.
    * 3. Return the `appClient` instance for interacting with the deployed application.
@@ -220,6 +266,7 @@ export class OpenBallotMethodManager {
     // Define deployment-time parameters, including the current UNIX timestamp.
     const templateParams = {
       TMPL_VERSION_UNIX: this.getUTCUnixTimestamp(),
+      TMPL_TELEMETRY: 0, // Telemetry build mode off (no opcode budget log per method call)
     } // Ensures a unique approval program, enforcing a fresh app instance on deployment
 
     // Deploy the application using the factory client with specified parameters.
@@ -239,7 +286,7 @@ export class OpenBallotMethodManager {
       },
       onUpdate: 'append', // Behavior for updates (e.g., append new data if updates occur).
       onSchemaBreak: 'fail', // Behavior for schema changes (e.g., fail if incompatible changes occur).
-      deployTimeParams: templateParams, // Dynamic parameters for deployment (e.g., `TMPL_VERSION_UNIX`).
+      deployTimeParams: templateParams, // Dynamic parameters for deployment (e.g., `TMPL_VERSION_UNIX`, `TMPL_TELEMETRY`).
       updatable: undefined, // No explicit setting for app updatability.
       deletable: true, // Allows the app to be deleted by the authorized account.
     })
@@ -286,28 +333,28 @@ export class OpenBallotMethodManager {
   }
 
   /**
-   * Executes a composite atomic transaction that sets up a new poll and funds the application account.
+   * Executes a composite atomic transaction that sets up a new poll, funds the application account and adds the poll choices.
    *
-   * This method bundles two separate ABI method calls into a single atomic transaction:
-   * 1. `set_poll` - Initializes a new poll by setting its title, choices, and voting period (start and end dates).
+   * This method bundles three separate ABI method calls into a single atomic transaction:
+   * 1. `set_poll` - Initializes a new poll by setting its title, number of choices, and voting period (start and end dates).
    * 2. `fund_app_mbr` - Sends a minimum balance funding payment to the application account, which is used
-   *    to ensure sufficient funds to cover Global minimum balance and creator box storage allocation.
+   *    to ensure sufficient funds to cover Global minimum balance, creator box storage and the choice tallies box.
+   * 3. `add_poll_choices` - Stores the poll choices as a single poll choices page box and pays its box storage MBR.
    *
    * Important Notes:
-   * - Both method calls are executed atomically. This means that either both calls succeed or neither
+   * - All method calls are executed atomically. This means that either every call succeeds or none
    *   does, ensuring consistent application state.
-   * - The `set_poll` method encodes textual inputs (poll title and choices) using UTF-8 encoding.
-   * - The `fund_app_mbr` method wraps a payment transaction (mbrPay) in a TransactionWithSigner format.
-   * - The application creator's account is used to sign both transactions.
-   * - The method relies on the `AtomicTransactionComposer` to bundle the two ABI calls and execute them
+   * - The poll title and choices are encoded using UTF-8 encoding, the poll is set up without an eligibility
+   *   Merkle root (box storage voting).
+   * - The `fund_app_mbr` and `add_poll_choices` methods wrap a payment transaction in a TransactionWithSigner format.
+   * - The application creator's account is used to sign every transaction.
+   * - The method relies on the `AtomicTransactionComposer` to bundle the ABI calls and execute them
    *   together. Confirmation of the atomic transaction round is required; otherwise, an error is thrown.
    *
    * @param creator - The address of the application creator and sender of the transactions.
    * @param appId - The unique ID of the deployed application.
    * @param title - The title of the poll.
-   * @param choice1 - The first poll choice.
-   * @param choice2 - The second poll choice.
-   * @param choice3 - The third poll choice.
+   * @param choices - The poll choices in choice order (choice 1 first).
    * @param startDateUnix - The UNIX timestamp for the start of the voting period.
    * @param endDateUnix - The UNIX timestamp for the end of the voting period.
    *
@@ -316,46 +363,46 @@ export class OpenBallotMethodManager {
    * Steps:
    * 1. Retrieve the application client for the given appId.
    * 2. Create an AtomicTransactionComposer instance.
-   * 3. Construct a payment transaction (`mbrPay`) for funding the application account.
-   * 4. Add a method call for `set_poll` with UTF-8 encoded poll title and choices, and the specified voting period.
-   * 5. Add a method call for `fund_app_mbr` using the payment transaction wrapped in a TransactionWithSigner object.
-   * 6. Execute the atomic transaction.
-   * 7. Await transaction confirmation and throw an error if confirmation is not received.
+   * 3. Construct the payment transactions funding the application account and the poll choices box storage.
+   * 4. Add a method call for `set_poll` with the UTF-8 encoded poll title, the number of choices and the voting period.
+   * 5. Add a method call for `fund_app_mbr` referencing the creator box and the choice tallies box.
+   * 6. Add a method call for `add_poll_choices` with the UTF-8 encoded poll choices, referencing the poll choices box.
+   * 7. Execute the atomic transaction.
+   * 8. Await transaction confirmation and throw an error if confirmation is not received.
    */
   async setPollFundAppMbrAtxn(
     creator: string,
     appId: bigint,
     title: string,
-    choice1: string,
-    choice2: string,
-    choice3: string,
+    choices: string[],
     startDateUnix: bigint,
     endDateUnix: bigint,
   ) {
     const client = this.getAppClient(appId)
     const appID = Number(appId)
+    const encodedChoices = choices.map((choice) => new TextEncoder().encode(choice))
 
     const atxn = new AtomicTransactionComposer()
 
-    // Define the MBR payment transaction
+    // Define the MBR payment transactions
     const mbrPay = await this.algorand.createTransaction.payment({
       sender: creator,
       signer: this.getSigner(creator),
       receiver: client.appAddress,
-      amount: (116_900).microAlgos(), // App Global.minBalance + BoxStorageMBR
+      amount: (100_000 + BOX_A_MBR + calcTallyBoxMbr(choices.length)).microAlgos(), // App Global.minBalance + BoxStorageMBR
+    })
+
+    const choicesMbrPay = await this.algorand.createTransaction.payment({
+      sender: creator,
+      signer: this.getSigner(creator),
+      receiver: client.appAddress,
+      amount: calcChoicesBoxMbr(POLL_CHOICES_PAGE_TYPE.encode(encodedChoices).length).microAlgos(),
     })
 
     atxn.addMethodCall({
       appID: appID,
       method: ABIMethod.fromSignature(client.appClient.getABIMethod('set_poll').getSignature()),
-      methodArgs: [
-        new TextEncoder().encode(title),
-        new TextEncoder().encode(choice1),
-        new TextEncoder().encode(choice2),
-        new TextEncoder().encode(choice3),
-        startDateUnix,
-        endDateUnix,
-      ],
+      methodArgs: [new TextEncoder().encode(title), BigInt(choices.length), new Uint8Array(), startDateUnix, endDateUnix],
       sender: creator,
       suggestedParams: await this.algorand.getSuggestedParams(),
       signer: this.getSigner(creator),
@@ -367,7 +414,20 @@ export class OpenBallotMethodManager {
       methodArgs: [{ txn: mbrPay, signer: this.getSigner(creator) }],
       sender: creator,
       suggestedParams: await this.algorand.getSuggestedParams(),
-      boxes: [{ appIndex: appID, name: this.getBoxName(creator) }],
+      boxes: [
+        { appIndex: appID, name: this.getBoxName(creator) },
+        { appIndex: appID, name: TALLY_BOX_NAME },
+      ],
+      signer: this.getSigner(creator),
+    })
+
+    atxn.addMethodCall({
+      appID: appID,
+      method: ABIMethod.fromSignature(client.appClient.getABIMethod('add_poll_choices').getSignature()),
+      methodArgs: [encodedChoices, { txn: choicesMbrPay, signer: this.getSigner(creator) }],
+      sender: creator,
+      suggestedParams: await this.algorand.getSuggestedParams(),
+      boxes: [{ appIndex: appID, name: getChoicesBoxName(0) }],
       signer: this.getSigner(creator),
     })
 
@@ -400,9 +460,9 @@ export class OpenBallotMethodManager {
    * 1. Retrieve the application client for the specified appId using `getAppClient`.
    * 2. Create a payment transaction to cover the MBR for box storage:
    *    - The payment is sent from the sender's account to the application's address.
-   *    - The amount is set to 16,900 microAlgos (0.0169 Algos), which is the MBR for box storage.
+   *    - The amount is set to 16,100 microAlgos (0.0161 Algos), which is the MBR for box storage.
    * 3. Define the box name:
-   *    - The box name is derived from the sender's address by concatenating a prefix (`a_`) with the sender's address.
+   *    - The box name is derived from the sender's address by concatenating a prefix (`a`) with the sender's address.
    *    - This ensures that the box name is unique for each user.
    * 4. Send the `requestBoxStorage` transaction using the sender's account, which:
    *    - Includes the MBR payment transaction.
@@ -418,7 +478,7 @@ export class OpenBallotMethodManager {
       sender,
       signer: this.getSigner(sender),
       receiver: client.appAddress,
-      amount: (16_900).microAlgos(),
+      amount: BOX_A_MBR.microAlgos(),
     })
 
     // Send the requestBoxStorage transaction using the sender's address.
@@ -460,7 +520,10 @@ export class OpenBallotMethodManager {
     await client.send.submitVote({
       sender, // The address of the account submitting the vote.
       signer: this.getSigner(sender), // The signer for the sender's transactions.
-      boxReferences: [{ appId, name: this.getBoxName(sender) }],
+      boxReferences: [
+        { appId, name: this.getBoxName(sender) },
+        { appId, name: TALLY_BOX_NAME }, // Vote tally of the choice is updated in the choice tallies box
+      ],
       args: {
         choice, // The sender's selected choice for the vote.
       },
@@ -510,13 +573,13 @@ export class OpenBallotMethodManager {
    * application, and this method purges these entries in batches (up to max 8 boxes per batch).
    *
    * Important Notes:
-   * - Only non-creator boxes are purged. The method filters out boxes whose keys correspond
-   *   to the creator’s address.
+   * - Only non-creator voter data boxes are purged. The method filters out the choice tallies and poll
+   *   choices boxes, and the voter data box whose key corresponds to the creator’s address.
    * - The method groups the box keys into batches of 8, and then processes these batches using
    *   multiple AtomicTransactionComposer instances. The composers are used to bundle and execute
    *   the purge calls atomically.
    * - The `purge_box_storage` ABI method is called with a dynamic array of box keys (addresses)
-   *   to be purged. Box names are constructed by prefixing the decoded box key with "a_".
+   *   to be purged. Box names are constructed by prefixing the decoded box key with "a".
    * - The method executes every two batches (or the final batch if there is an odd number) and
    *   confirms the transaction round. An error is thrown if confirmation fails.
    *
@@ -527,13 +590,13 @@ export class OpenBallotMethodManager {
    *
    * Steps:
    * 1. Retrieve the application client and application boxes for the given appId.
-   * 2. Iterate over the retrieved boxes to filter out those that belong to the creator and decode
+   * 2. Iterate over the retrieved voter data boxes to filter out the one that belongs to the creator and decode
    *    the box keys into addresses.
    * 3. Split the resulting box key addresses into batches of up to 8 keys each.
    * 4. Initialize a set of AtomicTransactionComposer instances, one for every two batches.
    * 5. For each batch:
    *    a. Determine the corresponding composer ID.
-   *    b. Construct the box name by concatenating the prefix "a_" with the decoded box key.
+   *    b. Construct the box name by concatenating the prefix "a" with the decoded box key.
    *    c. Add a method call to the composer for the `purge_box_storage` ABI method using the batch.
    *    d. Execute the composer when two batches have been processed (or at the end if there's an odd number).
    *    e. Check for transaction confirmation and throw an error if confirmation is not received.
@@ -545,10 +608,10 @@ export class OpenBallotMethodManager {
     // Fetch application boxes
     const appBoxes = await this.algorand.client.algod.getApplicationBoxes(appID).do()
 
-    // Filter and decode box keys
+    // Filter and decode voter data box keys
     const boxKeysAddresses: string[] = []
     for (const box of appBoxes.boxes) {
-      if (box.name) {
+      if (box.name && isVoterBoxName(box.name)) {
         const address = encodeAddress(box.name.slice(-32))
         if (address !== creator) {
           boxKeysAddresses.push(address)
@@ -577,7 +640,7 @@ export class OpenBallotMethodManager {
     let batchCounter = 0
     for (const batch of boxKeyBatches) {
       const atxnId = Math.floor(batchCounter / 2) + 1
-      const boxNames = batch.map((boxKey) => new Uint8Array([...Buffer.from('a_'), ...boxKey]))
+      const boxNames = batch.map((boxKey) => new Uint8Array([...Buffer.from(VOTER_BOX_PREFIX), ...boxKey]))
 
       // Add method call to AtomicTransactionComposer
       atxnFactory[`atxn_${atxnId}`].addMethodCall({
@@ -610,6 +673,8 @@ export class OpenBallotMethodManager {
    *
    * Important Notes:
    * - Deleting an application reclaims the Minimum Balance Requirement (MBR) for the application's global state schema.
+   * - The `terminate` method deletes the creator box, the choice tallies box and every poll choices page box,
+   *   so each of them is passed as a box reference.
    * - The application is removed from the blockchain's **current state** and becomes non-functional.
    * - Historical records of the application (e.g., creation and interaction transactions) are pruned after a certain number
    *   of rounds unless retained by archival nodes.
@@ -619,7 +684,8 @@ export class OpenBallotMethodManager {
    *
    * Steps:
    * 1. Retrieve the application client for the specified appId using `getAppClient`.
-   * 2. Send a `delete` transaction using the creator's account, which:
+   * 2. Read the number of poll choices pages from the application Global State.
+   * 3. Send a `delete` transaction using the creator's account, which:
    *    - Deactivates the application.
    *    - Deletes its global state and reclaims the associated MBR.
    *    - Removes the application from the blockchain's current state.
@@ -629,11 +695,16 @@ export class OpenBallotMethodManager {
     // Retrieve the application client for the specified application ID.
     const client = this.getAppClient(appId)
 
+    // Every poll choices page box is deleted along with the creator and choice tallies boxes
+    const app = await this.algorand.app.getById(appId)
+    const pollChoicePages = Number(app.globalState['poll_choice_pages']?.value ?? 0)
+    const choicesBoxReferences = Array.from({ length: pollChoicePages }, (_, page) => ({ appId, name: getChoicesBoxName(page) }))
+
     // Send the delete transaction using the creator's address.
     await client.appClient.send.delete({
       sender: creator, // Only the app creator can send this delete transaction.
       signer: this.getSigner(creator), // The signer for the creator's transactions.
-      boxReferences: [{ appId, name: this.getBoxName(creator) }],
+      boxReferences: [{ appId, name: this.getBoxName(creator) }, { appId, name: TALLY_BOX_NAME }, ...choicesBoxReferences],
       method: 'terminate', // The ABI method name for creating the application.
     })
   }